@@ -0,0 +1,19 @@
+def act_cx(alter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
+    """
+    Returns v_Cx(alter, ...)[alter] like the VBA function Act_Cx.
+    In VBA, v_Cx(Alter) only fills the ages before Alter, so the result is always 0;
+    a cache would not help here.
+
+    Parameters:
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - float: Cx as computed by VBA.
+    """
+    return float(v_cx(alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)[alter])
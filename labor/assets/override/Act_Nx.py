@@ -0,0 +1,19 @@
+def act_nx(alter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
+    """
+    Returns the commutation value Nx at age 'alter'.
+    Der ganze Vektor liegt im Vektor-Cache, siehe commutation_vector.
+    Ein Array alter liefert die Werte als Array, siehe xl_macro.xl_batch.
+
+    Parameters:
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - float: Nx at age 'alter'.
+    """
+    return commutation_vector("Nx", sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)[alter]
@@ -0,0 +1,18 @@
+def act_lx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
+    """
+    Returns the commutation value lx at age 'alter'.
+    Der ganze Vektor liegt im Vektor-Cache, siehe commutation_vector.
+    Ein Array alter liefert die Werte als Array, siehe xl_macro.xl_batch.
+
+    Parameters:
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - float: lx at age 'alter'.
+    """
+    return commutation_vector("lx", sex, tafel, None, gebjahr, rentenbeginnalter, schicht)[alter]
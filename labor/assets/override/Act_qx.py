@@ -0,0 +1,56 @@
+import numpy as np
+
+def load_qx_tables() -> dict:
+    """
+    Liest die Sterbetafeln des Blatts 'Tafeln' in NumPy-Spalten, Zeile i von m_Tafeln ist das Alter i.
+    Liefert (TAFEL, Sex) -> qx mit dem Alter als Index.
+    """
+    header = get_excel_range('v_Tafeln')[0]
+    matrix = np.array(get_excel_range('m_Tafeln'), dtype=float)
+    tables = {}
+    for col, vektor in enumerate(header):
+        tafel, sex = str(vektor).upper().rsplit("_", 1)
+        tables[(tafel, sex)] = np.ascontiguousarray(matrix[:, col])
+    return tables
+
+
+def qx_tables() -> dict:
+    """
+    Die Sterbetafeln des aktuellen Rechenkontexts, einmal je Kontext gelesen.
+    """
+    return context_cache("qx_tables", load_qx_tables)
+
+
+def qx_table(sex: str, tafel: str) -> np.ndarray:
+    """
+    Spalte der qx für Tafel und Geschlecht, wie sTafelvektor in der VBA-Funktion Act_qx.
+    """
+    sex = "M" if sex.upper() == "M" else "F"
+    tafel = tafel.upper()
+    if tafel not in ("DAV1994_T", "DAV2008_T"):
+        raise ValueError(f"Unsupported mortality table: {tafel}")
+    table = qx_tables().get((tafel, sex))
+    if table is None:
+        raise ValueError(f"Table vector {tafel}_{sex} not found in v_Tafeln")
+    return table
+
+
+def act_qx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
+    """
+    Calculates the actuarial mortality probability (qx) for a given age, sex, and mortality table.
+
+    Parameters:
+    - alter (int): The age of the individual.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): The mortality table identifier ("DAV1994_T" or "DAV2008_T").
+    - gebjahr (int, optional): Year of birth (unused in current implementation).
+    - rentenbeginnalter (int, optional): Age at pension start (unused in current implementation).
+    - schicht (int, optional): Pension layer (default 1, unused in current implementation).
+
+    Returns:
+    - float: The mortality probability qx (0 to 1).
+
+    Raises:
+    - ValueError: If the specified tafel is not recognized.
+    """
+    return float(qx_table(sex, tafel)[alter])
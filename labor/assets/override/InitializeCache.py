@@ -0,0 +1,166 @@
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+VECTOR_CACHE_SIZE = 1024
+
+
+class VectorCache:
+    """
+    LRU-Cache für ganze Kommutationsvektoren, Schlüssel ist
+    (kind, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht).
+    Vektoren aus attach_commutation_tables liegen daneben ohne Größengrenze und werden nie verdrängt.
+    Ein Cache aus fork() liest zusätzlich die Vektoren des Caches, von dem er stammt.
+    """
+
+    def __init__(self, maxsize: int = VECTOR_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.vectors = OrderedDict()
+        self.attached = {}
+        self.shared = None  # Cache des Elternkontexts, nur gelesen
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple):
+        vek = self.attached.get(key)
+        if vek is None:
+            vek = self.vectors.get(key)
+            if vek is not None:
+                self.vectors.move_to_end(key)
+            elif self.shared is not None:
+                vek = self.shared.peek(key)
+        if vek is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return vek
+
+    def peek(self, key: tuple):
+        """
+        Wie get, aber ohne Zähler und ohne die LRU-Reihenfolge zu ändern.
+        """
+        vek = self.attached.get(key)
+        if vek is None:
+            vek = self.vectors.get(key)
+        if vek is None and self.shared is not None:
+            vek = self.shared.peek(key)
+        return vek
+
+    def put(self, key: tuple, vek):
+        self.vectors[key] = vek
+        self.vectors.move_to_end(key)
+        while len(self.vectors) > self.maxsize:
+            self.vectors.popitem(last=False)
+            self.evictions += 1
+
+    def attach(self, key: tuple, vek):
+        self.attached[key] = vek
+
+    def fork(self) -> "VectorCache":
+        """
+        Leerer Cache für einen geforkten Rechenkontext, der die Vektoren dieses Caches mitliest.
+        """
+        cache = VectorCache(self.maxsize)
+        cache.shared = self
+        return cache
+
+    def clear(self):
+        self.vectors.clear()
+        self.attached.clear()
+        self.shared = None
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self.vectors), "attached": len(self.attached)}
+
+
+def vector_cache() -> VectorCache:
+    """
+    Der Vektor-Cache des aktuellen Rechenkontexts.
+    """
+    return context_cache("vectors", VectorCache)
+
+
+def initialize_cache():
+    # Leert den Vektor-Cache, wie in VBA das neue Dictionary.
+    vector_cache().clear()
+
+
+def vector_key(kind: str, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None,
+               schicht: int = 1) -> tuple:
+    """
+    Schlüssel im Vektor-Cache: Geschlecht M/F, Tafel groß geschrieben, lx ohne Zins.
+    """
+    sex = "M" if sex.upper() == "M" else "F"
+    return kind, sex, tafel.upper(), None if kind == "lx" else zins, gebjahr, rentenbeginnalter, schicht
+
+
+def commutation_vector(kind: str, sex: str, tafel: str, zins: float, gebjahr: int = None,
+                       rentenbeginnalter: int = None, schicht: int = 1):
+    """
+    Liefert den Vektor kind ('lx', 'Dx', 'Nx', 'Mx', 'Rx') bis max_Alter aus dem Cache oder berechnet ihn.
+    lx hängt nicht vom Zins ab und wird für alle Zinsen geteilt.
+    """
+    cache = vector_cache()
+    key = vector_key(kind, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    sex, tafel = key[1], key[2]
+    vek = cache.get(key)
+    if vek is None:
+        if kind == "lx":
+            vek = v_lx(-1, sex, tafel, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Dx":
+            vek = v_dx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Nx":
+            vek = v_nx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Mx":
+            vek = v_mx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Rx":
+            vek = v_rx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        else:
+            raise ValueError(f"Unknown commutation vector: {kind}")
+        vek.flags.writeable = False
+        cache.put(key, vek)
+    return vek
+
+
+COMMUTATION_KINDS = ("lx", "Dx", "Nx", "Mx", "Rx")
+
+
+def export_commutation_tables(path: str, combinations, kinds=COMMUTATION_KINDS) -> int:
+    """
+    Rechnet die Vektoren kinds für alle (sex, tafel, zins) aus combinations und schreibt sie als
+    eine Matrix nach path ohne Endung + '.npy', die Schlüssel nach path ohne Endung + '.json'.
+    Liefert die Anzahl der Vektoren.
+    """
+    base = os.path.splitext(path)[0]
+    tables = {}
+    for sex, tafel, zins in combinations:
+        for kind in kinds:
+            tables[vector_key(kind, sex, tafel, zins)] = commutation_vector(kind, sex, tafel, zins)
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(base + ".npy", np.array(list(tables.values()), dtype=np.float64).reshape(len(tables), max_Alter + 1))
+    with open(base + ".json", "w", encoding="utf-8") as file:
+        json.dump({"max_Alter": max_Alter, "keys": [list(key) for key in tables]}, file)
+    return len(tables)
+
+
+def attach_commutation_tables(path: str) -> int:
+    """
+    Hängt die Vektoren von export_commutation_tables schreibgeschützt in den Vektor-Cache des
+    aktuellen Kontexts. Die Datei wird per mmap gelesen, alle Worker-Prozesse teilen sich ihre Seiten.
+    Liefert die Anzahl der Vektoren.
+    """
+    base = os.path.splitext(path)[0]
+    with open(base + ".json", encoding="utf-8") as file:
+        index = json.load(file)
+    if index["max_Alter"] != max_Alter:
+        raise ValueError(f"Commutation tables in '{path}' end at age {index['max_Alter']}, expected {max_Alter}")
+    data = np.asarray(np.load(base + ".npy", mmap_mode="r"))
+    cache = vector_cache()
+    for row, key in enumerate(index["keys"]):
+        cache.attach(tuple(key), data[row])
+    return len(index["keys"])
@@ -0,0 +1,25 @@
+import numpy as np
+
+
+def v_cx(endalter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Cx' vector, the discounted number of deaths: Cx[i] = tx[i] * v ** (i + 1).
+    As in VBA the last element (age 'endalter') stays 0.
+
+    Parameters:
+    - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - np.ndarray: The 'Cx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
+    """
+    grenze = max_Alter if endalter == -1 else endalter
+    v_temp_tx = v_tx(grenze, sex, tafel, gebjahr, rentenbeginnalter, schicht)
+    vek = np.zeros(grenze + 1)
+    vek[:grenze] = v_temp_tx[:grenze] * discount_vector(zins, grenze - 1, start=1)
+    return round_vector(vek, rund_Cx)
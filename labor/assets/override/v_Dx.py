@@ -0,0 +1,22 @@
+import numpy as np
+
+
+def v_dx(endalter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Dx' vector, the discounted number of survivors: Dx[i] = lx[i] * v ** i.
+
+    Parameters:
+    - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - np.ndarray: The 'Dx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
+    """
+    grenze = max_Alter if endalter == -1 else endalter
+    v_temp_lx = v_lx(grenze, sex, tafel, gebjahr, rentenbeginnalter, schicht)
+    return round_vector(v_temp_lx * discount_vector(zins, grenze), rund_Dx)
@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def v_mx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Mx' vector up to max_Alter: Mx[i] = Cx[i] + Cx[i + 1] + ... + Cx[max_Alter].
+
+    Parameters:
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - np.ndarray: The 'Mx' values for each age from 0 to max_Alter.
+    """
+    v_temp = v_cx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    vek = np.array(v_temp[max_Alter::-1], dtype=float)
+    return np.ascontiguousarray(accumulate_rounded(vek, np.add, rund_Mx)[::-1])
@@ -0,0 +1,22 @@
+import numpy as np
+
+
+def v_nx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Nx' vector up to max_Alter: Nx[i] = Dx[i] + Dx[i + 1] + ... + Dx[max_Alter].
+
+    Parameters:
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - np.ndarray: The 'Nx' values for each age from 0 to max_Alter.
+    """
+    v_temp = v_dx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    vek = np.array(v_temp[max_Alter::-1], dtype=float)
+    # wie in VBA mit rund_Dx
+    return np.ascontiguousarray(accumulate_rounded(vek, np.add, rund_Dx)[::-1])
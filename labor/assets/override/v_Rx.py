@@ -0,0 +1,21 @@
+import numpy as np
+
+
+def v_rx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Rx' vector up to max_Alter: Rx[i] = Mx[i] + Mx[i + 1] + ... + Mx[max_Alter].
+
+    Parameters:
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - np.ndarray: The 'Rx' values for each age from 0 to max_Alter.
+    """
+    v_temp = v_mx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    vek = np.array(v_temp[max_Alter::-1], dtype=float)
+    return np.ascontiguousarray(accumulate_rounded(vek, np.add, rund_Rx)[::-1])
@@ -0,0 +1,68 @@
+import numpy as np
+
+
+def round_vector(vek: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Rundet wie round(x, digits) je Element. Ab 2**53 / 10**digits hat ein double keine Stellen
+    mehr hinter der digits-ten Nachkommastelle, dort ist Runden die Identität.
+    """
+    limit = 2.0 ** 53 / 10.0 ** digits
+    for i in np.flatnonzero(np.abs(vek) < limit):
+        vek[i] = round(float(vek[i]), digits)
+    return vek
+
+
+def accumulate_rounded(vek: np.ndarray, ufunc, digits: int) -> np.ndarray:
+    """
+    vek[i] = round(ufunc(vek[i - 1], vek[i]), digits) für i >= 1, in derselben Reihenfolge wie
+    die VBA-Schleifen. Solange das Runden nichts ändert, rechnet ufunc.accumulate am Stück.
+    """
+    limit = 2.0 ** 53 / 10.0 ** digits
+    i = 1
+    while i < len(vek):
+        segment = ufunc.accumulate(vek[i - 1:])
+        small = np.flatnonzero(np.abs(segment[1:]) < limit)
+        if not small.size:
+            vek[i:] = segment[1:]
+            break
+        j = i + small[0]
+        vek[i:j] = segment[1:small[0] + 1]
+        i = j
+        while i < len(vek):
+            value = float(ufunc(vek[i - 1], vek[i]))
+            if abs(value) >= limit:
+                break
+            vek[i] = round(value, digits)
+            i += 1
+    return vek
+
+
+def discount_vector(zins: float, grenze: int, start: int = 0) -> np.ndarray:
+    """
+    v ** i für i = start .. start + grenze, mit v = 1 / (1 + zins).
+    Die Potenzen kommen aus pow() wie in der Schleife, np.power weicht im letzten Bit ab.
+    """
+    v = 1 / (1 + zins)
+    return np.array([v ** i for i in range(start, start + grenze + 1)])
+
+
+def v_lx(endalter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'lx' vector, the number of survivors of 1,000,000 newborns at each age.
+
+    Parameters:
+    - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - np.ndarray: The 'lx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
+    """
+    grenze = max_Alter if endalter == -1 else endalter
+    vek = np.empty(grenze + 1)
+    vek[0] = 1000000
+    vek[1:] = 1 - qx_table(sex, tafel)[:grenze]
+    return accumulate_rounded(vek, np.multiply, rund_lx)
@@ -0,0 +1,24 @@
+import numpy as np
+
+
+def v_tx(endalter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'tx' vector, the number of deaths at each age: tx[i] = lx[i] - lx[i + 1].
+    As in VBA the last element (age 'endalter') stays 0.
+
+    Parameters:
+    - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
+
+    Returns:
+    - np.ndarray: The 'tx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
+    """
+    grenze = max_Alter if endalter == -1 else endalter
+    v_temp_lx = v_lx(grenze, sex, tafel, gebjahr, rentenbeginnalter, schicht)
+    vek = np.zeros(grenze + 1)
+    vek[:grenze] = v_temp_lx[:-1] - v_temp_lx[1:]
+    return round_vector(vek, rund_tx)
@@ -1,14 +1,23 @@
 
 
-import math
+import json
+import os
+from collections import OrderedDict
+import numpy as np
+import numpy as np
+import numpy as np
 
-import math
+import numpy as np
 
-import math
+import numpy as np
 
+import numpy as np
 
+import numpy as np
 
+import numpy as np
 
+import numpy as np
 
 
 
@@ -57,59 +66,528 @@ import math
 
 
 
-from openpyxl import Workbook
-from openpyxl.utils import range_boundaries
 
-xl_workbook: Workbook # The Excel workbook object
-xl_names: dict [str, str] # The dictionary of named ranges
 
-def get_excel_global(key: str):
+
+
+# Laufzeit des erzeugten Rechners: Step05 kopiert den Quelltext ab hier in xl_recombined.py.
+# Schnittstelle wie in CELL_NAME_VALUE und CELL_VALUE, die das Modell in den Prompts sieht.
+
+import json
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # mit einem Snapshot rechnet der Rechner ohne openpyxl
+    Workbook = object
+
+CELL_POSITION_REGEX = re.compile(r"([A-Z]+)([0-9]+)")
+
+class WorkbookSnapshot:
     """
-    Retrieves the value from the Excel workbook based on a named range key.
-    
-    Parameters:
-    - key (str): The name of the range to look up.
-    
-    Returns:
-    - The value of the cell referenced by the named range, or None if not found.
+    Wertzellen und benannte Bereiche einer Arbeitsmappe, geschrieben von xl_macro.xl_snapshot.
+    Einzelzellen stehen im JSON-Index, Zahlenbereiche in einer .npy-Datei, die per mmap gelesen wird.
+    Zugriffe auf Zellen außerhalb des Snapshots lösen KeyError aus.
+    """
+
+    def __init__(self, sheetnames: list[str], cells: dict, ranges: dict, data: np.ndarray):
+        self.sheetnames = sheetnames
+        self.cells = cells
+        self.ranges = ranges
+        self.data = data
+
+    def cell_value(self, sheet_name: str, cell_ref: str):
+        ref = sheet_name + "!" + cell_ref.replace("$", "").upper()
+        try:
+            return self.cells[ref]
+        except KeyError:
+            raise KeyError(f"Cell '{ref}' is not part of the workbook snapshot.") from None
+
+    def range_values(self, sheet_name: str, range_ref: str):
+        """
+        Zahlenbereiche als schreibgeschütztes 2D-Array, andere Bereiche als Liste von Zeilen.
+        """
+        ref = sheet_name + "!" + range_ref.replace("$", "").upper()
+        entry = self.ranges.get(ref)
+        if entry is None:
+            raise KeyError(f"Range '{ref}' is not part of the workbook snapshot.")
+        if "values" in entry:
+            return entry["values"]
+        rows, cols = entry["shape"]
+        return self.data[entry["offset"]:entry["offset"] + rows * cols].reshape(rows, cols)
+
+def load_snapshot(path: str) -> tuple[WorkbookSnapshot, dict[str, str]]:
+    """
+    Lädt einen Snapshot (JSON-Index von write_snapshot), für init_workbook(*load_snapshot(path)).
+    """
+    with open(path, encoding="utf-8") as file:
+        index = json.load(file)
+    data = np.load(os.path.join(os.path.dirname(path), index["data"]), mmap_mode="r")
+    return WorkbookSnapshot(index["sheetnames"], index["cells"], index["ranges"], data), index["names"]
+
+def read_cell(workbook, sheet_name: str, cell_ref: str):
+    if isinstance(workbook, WorkbookSnapshot):
+        return workbook.cell_value(sheet_name, cell_ref)
+    return workbook[sheet_name][cell_ref].value
+
+def cell_position(cell_ref: str) -> tuple[int, int]:
+    """
+    'B4' -> (4, 2)
+    """
+    letters, digits = CELL_POSITION_REGEX.fullmatch(cell_ref).groups()
+    col = 0
+    for char in letters:
+        col = col * 26 + ord(char) - 64
+    return int(digits), col
+
+class CalcContext:
+    """
+    Alles, was eine Rechnung braucht: Arbeitsmappe, Namen, geschriebene Eingaben, gemerkte Zellwerte
+    und die aus der Arbeitsmappe abgeleiteten Tabellen (Sterbetafeln, Kommutationsvektoren).
+    Die Arbeitsmappe wird nur gelesen, so können mehrere Kontexte gleichzeitig auf ihr rechnen.
+    """
+
+    def __init__(self, workbook: Workbook = None, names: dict[str, str] = None):
+        self.workbook = workbook
+        self.names = names if names is not None else {}
+        self.name_refs = {}  # Name -> 'Sheet!Cell', einmal aufgelöst, siehe resolve_name
+        self.inputs = {}  # geschriebene Eingaben 'Sheet!Cell' -> Wert
+        self.values = {}  # gemerkte Zellwerte einer Auswertung
+        self.caches = {}  # abgeleitete Tabellen, siehe context_cache
+        self.shared = {}  # Tabellen des Elternkontexts, nur gelesen, siehe fork
+        self.table_inputs = False  # eine Eingabe liegt in einem benannten Bereich, siehe set_cell_value
+        self.evaluations = 0
+        self.hits = 0
+
+    def invalidate(self, tables: bool = True):
+        """
+        Verwirft die gemerkten Zellwerte und mit tables auch die abgeleiteten Tabellen.
+        """
+        self.values.clear()
+        if tables:
+            self.caches.clear()
+            self.shared = {}
+
+    def stats(self) -> dict:
+        return {"cells": len(self.values), "evaluations": self.evaluations, "saved": self.hits}
+
+    def fork(self) -> "CalcContext":
+        """
+        Neuer Kontext auf derselben Arbeitsmappe mit den aufgelösten Namen, aber eigenen
+        Eingaben und Zellwerten. Für eine Anfrage in einem Thread oder Task.
+        Die schon gebauten Tabellen liest der neue Kontext mit, solange sie nur aus der Arbeitsmappe
+        stammen, d.h. dieser Kontext keine Zelle eines benannten Bereichs geschrieben hat.
+        """
+        context = CalcContext(self.workbook, self.names)
+        context.name_refs = dict(self.name_refs)
+        if not self.table_inputs:
+            context.shared = {**self.shared, **self.caches}
+        return context
+
+_MISSING = object()
+_EVALUATING = object()  # steht im Speicher, während die Zelle gerechnet wird
+
+# Der Kontext der laufenden Anfrage. Ohne calc_context rechnen alle im Standardkontext.
+CURRENT_CONTEXT: ContextVar = ContextVar("xl_calc_context", default=CalcContext())
+
+# 'Sheet!Cell' -> fkt_*-Funktion, wird von Step05 am Ende des Rechners gefüllt.
+CELL_DISPATCH: dict = {}
+
+# Formelzellen in topologischer Reihenfolge, von Step05 aus den Formeln bestimmt, siehe evaluate_all.
+CELL_ORDER: tuple = ()
+
+# Formelzelle -> gelesene Zellen (auch über Namen), von Step05 emittiert, siehe update_inputs.
+CELL_PRECEDENTS: dict = {}
+
+# Eingaben, die Step05 als Literale in den Rechner geschrieben hat: 'Sheet!Cell' -> Name.
+FROZEN_REFS: dict = {}
+
+# Zelle -> Formelzellen, die sie direkt lesen, von Step05 neben CELL_PRECEDENTS emittiert.
+CELL_DEPENDENTS: dict = {}
+
+# Aus CELL_PRECEDENTS gebildet, wenn der Rechner kein CELL_DEPENDENTS hat.
+_DEPENDENTS: dict | None = None
+
+def current_context() -> CalcContext:
+    return CURRENT_CONTEXT.get()
+
+@contextmanager
+def calc_context(context: CalcContext):
+    """
+    Rechnet im with-Block im Kontext context, z.B. je Anfrage: with calc_context(base.fork()): ...
+    """
+    token = CURRENT_CONTEXT.set(context)
+    try:
+        yield context
+    finally:
+        CURRENT_CONTEXT.reset(token)
+
+def new_context(workbook: Workbook, names: dict[str, str]) -> CalcContext:
+    """
+    Erzeugt einen Kontext für Arbeitsmappe und Namen, siehe init_workbook.
+    """
+    context = CalcContext()
+    with calc_context(context):
+        init_workbook(workbook, names)
+    return context
+
+def init_workbook(workbook: Workbook, names: dict[str, str]):
+    """
+    Setzt Arbeitsmappe und Namen des aktuellen Kontexts, löst die Namen auf und verwirft
+    Eingaben, gemerkte Werte und abgeleitete Tabellen.
+    """
+    context = current_context()
+    context.workbook = workbook
+    context.names = names
+    context.name_refs = {}
+    context.inputs.clear()
+    context.table_inputs = False
+    context.invalidate()
+    for key in names:
+        try:
+            resolve_name(key)
+        except ValueError:
+            pass  # Bereiche und externe Bezüge fallen erst beim Lesen auf
+
+def context_cache(key: str, factory):
+    """
+    Aus der Arbeitsmappe abgeleitete Tabelle key des aktuellen Kontexts, beim ersten Zugriff von factory() erzeugt.
+    Eine Tabelle des Elternkontexts wird übernommen statt neu gebaut; hat sie fork(), bekommt der Kontext
+    davon eine eigene Schicht, die die Tabelle des Elternkontexts nur liest.
+    """
+    context = current_context()
+    value = context.caches.get(key)
+    if value is None:
+        shared = context.shared.get(key)
+        if shared is None:
+            value = factory()
+        elif hasattr(shared, "fork"):
+            value = shared.fork()
+        else:
+            value = shared
+        context.caches[key] = value
+    return value
+
+def invalidate_names():
+    """
+    Verwirft die aufgelösten Namen, nötig wenn die Namen oder die Blätter geändert wurden.
+    """
+    current_context().name_refs.clear()
+
+def invalidate(tables: bool = True):
+    """
+    Verwirft alle gemerkten Zellwerte, nötig nach direktem Schreiben in die Arbeitsmappe.
+    Mit tables=False bleiben die abgeleiteten Tabellen (Sterbetafeln, Kommutationsvektoren) erhalten,
+    z.B. nach assume_inputs, das keine Zelle der Arbeitsmappe überdeckt.
+    """
+    current_context().invalidate(tables)
+
+def resolve_name(key: str) -> str:
+    """
+    Löst einen Namen in den Bezug 'Sheet!Cell' auf, so wie ihn CELL_DISPATCH verwendet.
     """
-    if key not in xl_names:
+    context = current_context()
+    if key not in context.names:
         raise KeyError(f"Key '{key}' not found in xl_names.")
 
-    ref = xl_names[key]  # e.g., 'Kalkulation!$E$6'
+    ref = context.names[key]  # e.g., 'Kalkulation!$E$6'
     if '!' not in ref:
         raise ValueError(f"Invalid reference format: '{ref}'")
 
     sheet_name, cell_ref = ref.split('!')
-    sheet_name = sheet_name.strip("'")  # remove quotes if present
-    cell_ref = cell_ref.replace('$', '')  # remove dollar signs
+    sheet_name = sheet_name_of(sheet_name.strip("'"))  # remove quotes if present
+    cell_ref = cell_ref.replace('$', '').upper()  # remove dollar signs
+    if ':' in cell_ref:
+        raise ValueError(f"Named range '{key}' is not a single cell: '{ref}'")
 
-    if sheet_name not in xl_workbook.sheetnames:
+    if sheet_name not in context.workbook.sheetnames:
         raise ValueError(f"Worksheet '{sheet_name}' not found in workbook.")
 
-    sheet = xl_workbook[sheet_name]
-    cell = sheet[cell_ref]
-    return cell.value
+    context.name_refs[key] = sheet_name + "!" + cell_ref
+    return context.name_refs[key]
 
-def get_cell_value(ref: str):
+def sheet_name_of(sheet_name: str) -> str:
+    """
+    Blattname in der Schreibweise der Arbeitsmappe (oder von CELL_DISPATCH), z.B. 'kalkulation' -> 'Kalkulation'.
+    """
+    workbook = current_context().workbook
+    sheetnames = workbook.sheetnames if workbook is not None else ()
+    if sheet_name in sheetnames:
+        return sheet_name
+    lower = sheet_name.lower()
+    for name in sheetnames:
+        if name.lower() == lower:
+            return name
+    for ref in CELL_DISPATCH:
+        name = ref.split("!", 1)[0]
+        if name.lower() == lower:
+            return name
+    return sheet_name
+
+def normalize_ref(ref: str) -> str:
+    """
+    Bezug in der Form von CELL_DISPATCH: "'kalkulation'!$k$6" -> 'Kalkulation!K6'.
+    """
     try:
         sheet_name, cell_ref = ref.split("!", 1)
-        return get_cell_value2(sheet_name, cell_ref)
     except ValueError:
         raise ValueError(f"Ungültiges Format: {ref}. Erwartet 'Sheet!Cell'.")
+    return sheet_name_of(sheet_name.strip("'")) + "!" + cell_ref.replace("$", "").upper()
 
-def get_cell_value2(sheet_name: str, cell_ref: str):
-    # Funktionsname nach deinem Schema konstruieren
-    func_name = f"fkt_{sheet_name.lower()}_{cell_ref.lower()}"
+def get_excel_global(key: str):
+    """
+    Retrieves the value from the Excel workbook based on a named range key.
+
+    Parameters:
+    - key (str): The name of the range to look up.
+
+    Returns:
+    - The value of the cell referenced by the named range. Zeigt der Name auf eine Formelzelle,
+      wird deren fkt_*-Funktion ausgewertet.
+    """
+    ref = current_context().name_refs.get(key)
+    if ref is None:
+        ref = resolve_name(key)
+    return get_cell_value(ref)
 
-    # Prüfen, ob die Funktion existiert
-    if func_name in globals():
-        return globals()[func_name]()
+def get_excel_range(key: str) -> list[list]:
+    """
+    Liefert die Werte eines benannten Bereichs wie 'Tafeln!$B$4:$E$127' zeilenweise,
+    aus einem Snapshot als 2D-Array. Geschriebene Eingaben des Kontexts überdecken die Werte der Arbeitsmappe.
+    """
+    context = current_context()
+    if key not in context.names:
+        raise KeyError(f"Key '{key}' not found in xl_names.")
+    sheet_name, range_ref = context.names[key].split('!')
+    sheet_name = sheet_name.strip("'")
+    range_ref = range_ref.replace('$', '').upper()
+    workbook = context.workbook
+    if isinstance(workbook, WorkbookSnapshot):
+        values = workbook.range_values(sheet_name, range_ref)
+        origin = cell_position(range_ref.split(":")[0])
+        overlay = {}
+        for ref, value in context.inputs.items():
+            if ref.startswith(sheet_name + "!"):
+                row, col = cell_position(ref.split("!", 1)[1])
+                row, col = row - origin[0], col - origin[1]
+                if 0 <= row < len(values) and 0 <= col < len(values[0]):
+                    overlay[(row, col)] = value
+        if not overlay:
+            return values
+        values = [list(row) for row in values]
+        for (row, col), value in overlay.items():
+            values[row][col] = value
+        return values
+
+    cells = workbook[sheet_name][range_ref]
+    if not isinstance(cells, tuple):
+        cells = ((cells,),)
+    elif not isinstance(cells[0], tuple):
+        cells = (cells,)
+    inputs = context.inputs
+    return [[inputs.get(sheet_name + "!" + cell.coordinate, cell.value) if inputs else cell.value
+             for cell in row] for row in cells]
+
+def set_excel_global(key: str, value):
+    """
+    Schreibt eine Eingabe über ihren Namen, siehe set_cell_value.
+    """
+    ref = current_context().name_refs.get(key)
+    set_cell_value(ref if ref is not None else resolve_name(key), value)
+
+def set_cell_value(ref: str, value):
+    """
+    Schreibt eine Eingabezelle 'Sheet!Cell' in den aktuellen Kontext und verwirft die gemerkten Werte
+    der Zellen, die von ihr abhängen. Liegt die Zelle in einem benannten Bereich, werden alle Werte
+    und die abgeleiteten Tabellen verworfen. Die Arbeitsmappe selbst bleibt unverändert.
+    """
+    ref = normalize_ref(ref)
+    if ref in FROZEN_REFS:
+        raise ValueError(f"Input '{FROZEN_REFS[ref]}' is frozen in this calculator.")
+    context = current_context()
+    context.inputs[ref] = value
+    if in_named_range(ref):
+        # Auch Werte aus VBA-Funktionen wie act_qx hängen an den Tabellen, nicht nur die Formelzellen.
+        context.table_inputs = True
+        context.invalidate()
+        return
+    dirty = dirty_cells([ref])
+    if dirty is None:
+        context.invalidate()
+        return
+    context.values.pop(ref, None)
+    for dirty_ref in dirty:
+        context.values.pop(dirty_ref, None)
+
+def in_named_range(ref: str) -> bool:
+    """
+    Liegt die Zelle 'Sheet!Cell' in einem benannten Bereich wie m_Tafeln, aus dem get_excel_range liest?
+    """
+    sheet_name, cell_ref = ref.split("!", 1)
+    row, col = cell_position(cell_ref)
+    for range_ref in current_context().names.values():
+        if ":" not in range_ref or "!" not in range_ref:
+            continue
+        range_sheet, cells = range_ref.split("!", 1)
+        if range_sheet.strip("'").lower() != sheet_name.lower():
+            continue
+        first, last = cells.replace("$", "").upper().split(":", 1)
+        if not (CELL_POSITION_REGEX.fullmatch(first) and CELL_POSITION_REGEX.fullmatch(last)):
+            continue  # ganze Spalten oder Zeilen liest get_excel_range nicht
+        (row1, col1), (row2, col2) = cell_position(first), cell_position(last)
+        if row1 <= row <= row2 and col1 <= col <= col2:
+            return True
+    return False
+
+def cell_dependents() -> dict:
+    """
+    Zelle -> Formelzellen, die sie direkt lesen. Leer, wenn der Rechner kein CELL_PRECEDENTS hat.
+    Ohne CELL_DEPENDENTS wird die Tabelle lokal gebaut und erst fertig veröffentlicht,
+    damit parallele Anfragen nie eine halbe Tabelle sehen.
+    """
+    global _DEPENDENTS
+    if CELL_DEPENDENTS:
+        return CELL_DEPENDENTS
+    if _DEPENDENTS is None:
+        dependents = {}
+        for cell, precedents in CELL_PRECEDENTS.items():
+            for ref in precedents:
+                dependents.setdefault(ref, []).append(cell)
+        _DEPENDENTS = dependents
+    return _DEPENDENTS
+
+def dirty_cells(refs) -> set | None:
+    """
+    Alle Formelzellen, die direkt oder über andere Zellen von refs abhängen.
+    None, wenn eine Zelle in keiner Formel vorkommt (z.B. Tafeln, die VBA-Funktionen lesen):
+    dann ist der ganze Stand zu verwerfen.
+    """
+    dependents = cell_dependents()
+    dirty = set()
+    todo = []
+    for ref in refs:
+        if ref not in dependents:
+            return None
+        todo.append(ref)
+    while todo:
+        for cell in dependents.get(todo.pop(), ()):
+            if cell not in dirty:
+                dirty.add(cell)
+                todo.append(cell)
+    return dirty
+
+def update_inputs(values: dict) -> dict:
+    """
+    Schreibt Eingaben (Namen oder 'Sheet!Cell') und rechnet nur die abhängigen Formelzellen neu,
+    in der Reihenfolge CELL_ORDER. Alle anderen gemerkten Werte bleiben.
+    Liefert 'Sheet!Cell' -> neuer Wert für jede neu gerechnete Zelle, deren Wert sich geändert hat
+    oder vorher noch nicht gerechnet war.
+    """
+    context = current_context()
+    refs = {}
+    for key, value in values.items():
+        ref = context.name_refs.get(key)
+        if ref is None:
+            ref = resolve_name(key) if key in context.names else key
+        refs[normalize_ref(ref)] = value
+    dirty = dirty_cells(refs)
+    if dirty is None or any(in_named_range(ref) for ref in refs):
+        dirty = set(CELL_ORDER)
+    before = {ref: context.values.get(ref, _MISSING) for ref in dirty}
+    for ref, value in refs.items():
+        set_cell_value(ref, value)
+
+    changed = {}
+    for ref in CELL_ORDER:
+        if ref in dirty:
+            value = get_cell_value(ref)
+            if not _same_value(before[ref], value):
+                changed[ref] = value
+    return changed
+
+def _same_value(before, after) -> bool:
+    try:
+        return bool(before == after)
+    except (TypeError, ValueError):  # z.B. Arrays aus assume_inputs
+        return False
+
+def assume_inputs(values: dict):
+    """
+    Verwirft die gemerkten Zellwerte und setzt Eingaben nur bis zum nächsten invalidate().
+    Schlüssel sind Namen oder Bezüge 'Sheet!Cell'. Ein NumPy-Array als Wert rechnet die Formeln für
+    viele Verträge auf einmal, siehe xl_macro.xl_batch.
+    """
+    context = current_context()
+    context.invalidate(tables=False)
+    for key, value in values.items():
+        ref = context.name_refs.get(key)
+        if ref is None:
+            ref = resolve_name(key) if key in context.names else key
+        ref = normalize_ref(ref)
+        if ref in FROZEN_REFS:
+            raise ValueError(f"Input '{FROZEN_REFS[ref]}' is frozen in this calculator.")
+        context.values[ref] = value
+
+def get_cell_value(ref: str):
+    context = CURRENT_CONTEXT.get()
+    value = context.values.get(ref, _MISSING)
+    if value is not _MISSING:
+        if value is _EVALUATING:
+            raise ValueError(f"Circular reference: cell '{ref}' depends on itself.")
+        context.hits += 1
+        return value
+
+    fkt = CELL_DISPATCH.get(ref)
+    if fkt is not None:
+        context.evaluations += 1
+        context.values[ref] = _EVALUATING
+        try:
+            value = fkt()
+        except BaseException:
+            context.values.pop(ref, None)
+            raise
     else:
-        # Wert direkt aus Excel lesen
-        sheet = xl_workbook[sheet_name]
-        return sheet[cell_ref].value
-        
+        key = normalize_ref(ref)
+        if key != ref:
+            return get_cell_value(key)
+        sheet_name, cell_ref = ref.split("!", 1)
+        value = context.inputs.get(ref, _MISSING)
+        if value is _MISSING:
+            # Wert direkt aus Excel (oder dem Snapshot) lesen
+            value = read_cell(context.workbook, sheet_name, cell_ref)
+    context.values[ref] = value
+    return value
+
+def evaluate_all() -> list:
+    """
+    Rechnet jede Formelzelle genau einmal in der Reihenfolge CELL_ORDER. Jede Zelle findet ihre
+    Vorgänger schon im Speicher, es gibt keine tiefe Rekursion über get_cell_value.
+    Liefert die Werte als flache Liste in der Reihenfolge von CELL_ORDER.
+    """
+    context = current_context()
+    values = context.values
+    result = []
+    for ref in CELL_ORDER:
+        value = values.get(ref, _MISSING)
+        if value is _MISSING:
+            context.evaluations += 1
+            value = values[ref] = CELL_DISPATCH[ref]()
+        result.append(value)
+    return result
+
+def get_cell_value2(sheet_name: str, cell_ref: str):
+    return get_cell_value(f"{sheet_name}!{cell_ref}")
+
+def recalc_stats() -> dict:
+    """
+    Zellen im Speicher, ausgeführte fkt_*-Funktionen und gesparte Auswertungen des aktuellen Kontexts.
+    """
+    return current_context().stats()
 
 cache = None
 
@@ -175,10 +653,190 @@ rund_Rx = 16
 # Value: 123
 max_Alter = 123
 
+VECTOR_CACHE_SIZE = 1024
+
+class VectorCache:
+    """
+    LRU-Cache für ganze Kommutationsvektoren, Schlüssel ist
+    (kind, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht).
+    Vektoren aus attach_commutation_tables liegen daneben ohne Größengrenze und werden nie verdrängt.
+    Ein Cache aus fork() liest zusätzlich die Vektoren des Caches, von dem er stammt.
+    """
+
+    def __init__(self, maxsize: int = VECTOR_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.vectors = OrderedDict()
+        self.attached = {}
+        self.shared = None  # Cache des Elternkontexts, nur gelesen
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple):
+        vek = self.attached.get(key)
+        if vek is None:
+            vek = self.vectors.get(key)
+            if vek is not None:
+                self.vectors.move_to_end(key)
+            elif self.shared is not None:
+                vek = self.shared.peek(key)
+        if vek is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return vek
+
+    def peek(self, key: tuple):
+        """
+        Wie get, aber ohne Zähler und ohne die LRU-Reihenfolge zu ändern.
+        """
+        vek = self.attached.get(key)
+        if vek is None:
+            vek = self.vectors.get(key)
+        if vek is None and self.shared is not None:
+            vek = self.shared.peek(key)
+        return vek
+
+    def put(self, key: tuple, vek):
+        self.vectors[key] = vek
+        self.vectors.move_to_end(key)
+        while len(self.vectors) > self.maxsize:
+            self.vectors.popitem(last=False)
+            self.evictions += 1
+
+    def attach(self, key: tuple, vek):
+        self.attached[key] = vek
+
+    def fork(self) -> "VectorCache":
+        """
+        Leerer Cache für einen geforkten Rechenkontext, der die Vektoren dieses Caches mitliest.
+        """
+        cache = VectorCache(self.maxsize)
+        cache.shared = self
+        return cache
+
+    def clear(self):
+        self.vectors.clear()
+        self.attached.clear()
+        self.shared = None
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "entries": len(self.vectors), "attached": len(self.attached)}
+
+def vector_cache() -> VectorCache:
+    """
+    Der Vektor-Cache des aktuellen Rechenkontexts.
+    """
+    return context_cache("vectors", VectorCache)
+
 def initialize_cache():
-    # Create a new dictionary object
-    global cache
-    cache = {}
+    # Leert den Vektor-Cache, wie in VBA das neue Dictionary.
+    vector_cache().clear()
+
+def vector_key(kind: str, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None,
+               schicht: int = 1) -> tuple:
+    """
+    Schlüssel im Vektor-Cache: Geschlecht M/F, Tafel groß geschrieben, lx ohne Zins.
+    """
+    sex = "M" if sex.upper() == "M" else "F"
+    return kind, sex, tafel.upper(), None if kind == "lx" else zins, gebjahr, rentenbeginnalter, schicht
+
+def commutation_vector(kind: str, sex: str, tafel: str, zins: float, gebjahr: int = None,
+                       rentenbeginnalter: int = None, schicht: int = 1):
+    """
+    Liefert den Vektor kind ('lx', 'Dx', 'Nx', 'Mx', 'Rx') bis max_Alter aus dem Cache oder berechnet ihn.
+    lx hängt nicht vom Zins ab und wird für alle Zinsen geteilt.
+    """
+    cache = vector_cache()
+    key = vector_key(kind, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    sex, tafel = key[1], key[2]
+    vek = cache.get(key)
+    if vek is None:
+        if kind == "lx":
+            vek = v_lx(-1, sex, tafel, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Dx":
+            vek = v_dx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Nx":
+            vek = v_nx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Mx":
+            vek = v_mx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        elif kind == "Rx":
+            vek = v_rx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+        else:
+            raise ValueError(f"Unknown commutation vector: {kind}")
+        vek.flags.writeable = False
+        cache.put(key, vek)
+    return vek
+
+COMMUTATION_KINDS = ("lx", "Dx", "Nx", "Mx", "Rx")
+
+def export_commutation_tables(path: str, combinations, kinds=COMMUTATION_KINDS) -> int:
+    """
+    Rechnet die Vektoren kinds für alle (sex, tafel, zins) aus combinations und schreibt sie als
+    eine Matrix nach path ohne Endung + '.npy', die Schlüssel nach path ohne Endung + '.json'.
+    Liefert die Anzahl der Vektoren.
+    """
+    base = os.path.splitext(path)[0]
+    tables = {}
+    for sex, tafel, zins in combinations:
+        for kind in kinds:
+            tables[vector_key(kind, sex, tafel, zins)] = commutation_vector(kind, sex, tafel, zins)
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(base + ".npy", np.array(list(tables.values()), dtype=np.float64).reshape(len(tables), max_Alter + 1))
+    with open(base + ".json", "w", encoding="utf-8") as file:
+        json.dump({"max_Alter": max_Alter, "keys": [list(key) for key in tables]}, file)
+    return len(tables)
+
+def attach_commutation_tables(path: str) -> int:
+    """
+    Hängt die Vektoren von export_commutation_tables schreibgeschützt in den Vektor-Cache des
+    aktuellen Kontexts. Die Datei wird per mmap gelesen, alle Worker-Prozesse teilen sich ihre Seiten.
+    Liefert die Anzahl der Vektoren.
+    """
+    base = os.path.splitext(path)[0]
+    with open(base + ".json", encoding="utf-8") as file:
+        index = json.load(file)
+    if index["max_Alter"] != max_Alter:
+        raise ValueError(f"Commutation tables in '{path}' end at age {index['max_Alter']}, expected {max_Alter}")
+    data = np.asarray(np.load(base + ".npy", mmap_mode="r"))
+    cache = vector_cache()
+    for row, key in enumerate(index["keys"]):
+        cache.attach(tuple(key), data[row])
+    return len(index["keys"])
+
+def load_qx_tables() -> dict:
+    """
+    Liest die Sterbetafeln des Blatts 'Tafeln' in NumPy-Spalten, Zeile i von m_Tafeln ist das Alter i.
+    Liefert (TAFEL, Sex) -> qx mit dem Alter als Index.
+    """
+    header = get_excel_range('v_Tafeln')[0]
+    matrix = np.array(get_excel_range('m_Tafeln'), dtype=float)
+    tables = {}
+    for col, vektor in enumerate(header):
+        tafel, sex = str(vektor).upper().rsplit("_", 1)
+        tables[(tafel, sex)] = np.ascontiguousarray(matrix[:, col])
+    return tables
+
+def qx_tables() -> dict:
+    """
+    Die Sterbetafeln des aktuellen Rechenkontexts, einmal je Kontext gelesen.
+    """
+    return context_cache("qx_tables", load_qx_tables)
+
+def qx_table(sex: str, tafel: str) -> np.ndarray:
+    """
+    Spalte der qx für Tafel und Geschlecht, wie sTafelvektor in der VBA-Funktion Act_qx.
+    """
+    sex = "M" if sex.upper() == "M" else "F"
+    tafel = tafel.upper()
+    if tafel not in ("DAV1994_T", "DAV2008_T"):
+        raise ValueError(f"Unsupported mortality table: {tafel}")
+    table = qx_tables().get((tafel, sex))
+    if table is None:
+        raise ValueError(f"Table vector {tafel}_{sex} not found in v_Tafeln")
+    return table
 
 def act_qx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
     """
@@ -186,7 +844,7 @@ def act_qx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnal
 
     Parameters:
     - alter (int): The age of the individual.
-    - sex (str): The sex of the individual ("M" or "F").
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
     - tafel (str): The mortality table identifier ("DAV1994_T" or "DAV2008_T").
     - gebjahr (int, optional): Year of birth (unused in current implementation).
     - rentenbeginnalter (int, optional): Age at pension start (unused in current implementation).
@@ -197,144 +855,112 @@ def act_qx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnal
 
     Raises:
     - ValueError: If the specified tafel is not recognized.
-    - KeyError: If required named ranges are not found.
     """
-    # Normalize sex to "F" if not "M"
-    sex = "F" if sex.upper() != "M" else "M"
-
-    # Get the Tafeln worksheet
-    ws = xl_workbook["Tafeln"]
-
-    # Construct the table vector string
-    sTafelvektor = tafel.upper() + "_" + sex
-
-    # Check if the table is supported
-    if tafel.upper() not in ["DAV1994_T", "DAV2008_T"]:
-        raise ValueError(f"Unsupported mortality table: {tafel}")
+    return float(qx_table(sex, tafel)[alter])
 
-    # Get the named ranges
-    v_tafeln_range = xl_names["v_Tafeln"]
-    m_tafeln_range = xl_names["m_Tafeln"]
-
-    # Split the range references to get sheet and cell references
-    v_sheet, v_ref = v_tafeln_range.split('!')
-    m_sheet, m_ref = m_tafeln_range.split('!')
-
-    # Remove quotes and dollar signs
-    v_sheet = v_sheet.strip("'")
-    v_ref = v_ref.replace('$', '')
-    m_sheet = m_sheet.strip("'")
-    m_ref = m_ref.replace('$', '')
-
-    # Get the worksheets
-    v_ws = xl_workbook[v_sheet]
-    m_ws = xl_workbook[m_sheet]
-
-    # Find the row index for the table vector
-    v_range = v_ws[v_ref]
-    v_values = [cell.value for cell in v_range]
-    try:
-        row_index = v_values.index(sTafelvektor)
-    except ValueError:
-        raise ValueError(f"Table vector {sTafelvektor} not found in v_Tafeln")
+def round_vector(vek: np.ndarray, digits: int) -> np.ndarray:
+    """
+    Rundet wie round(x, digits) je Element. Ab 2**53 / 10**digits hat ein double keine Stellen
+    mehr hinter der digits-ten Nachkommastelle, dort ist Runden die Identität.
+    """
+    limit = 2.0 ** 53 / 10.0 ** digits
+    for i in np.flatnonzero(np.abs(vek) < limit):
+        vek[i] = round(float(vek[i]), digits)
+    return vek
 
-    # Get the mortality probability from m_Tafeln
-    m_range = m_ws[m_ref]
-    # Assuming m_Tafeln is a 2D range where rows are table vectors and columns are ages
-    # We need to find the column that matches the alter
-    # This is a simplified approach - in practice you might need to adjust based on actual data structure
-    for col_idx, cell in enumerate(m_range[0], 1):  # Assuming first row is header with ages
-        if cell.value == alter:
-            # Get the value from the correct row and column
-            return m_range[row_index][col_idx - 1].value
+def accumulate_rounded(vek: np.ndarray, ufunc, digits: int) -> np.ndarray:
+    """
+    vek[i] = round(ufunc(vek[i - 1], vek[i]), digits) für i >= 1, in derselben Reihenfolge wie
+    die VBA-Schleifen. Solange das Runden nichts ändert, rechnet ufunc.accumulate am Stück.
+    """
+    limit = 2.0 ** 53 / 10.0 ** digits
+    i = 1
+    while i < len(vek):
+        segment = ufunc.accumulate(vek[i - 1:])
+        small = np.flatnonzero(np.abs(segment[1:]) < limit)
+        if not small.size:
+            vek[i:] = segment[1:]
+            break
+        j = i + small[0]
+        vek[i:j] = segment[1:small[0] + 1]
+        i = j
+        while i < len(vek):
+            value = float(ufunc(vek[i - 1], vek[i]))
+            if abs(value) >= limit:
+                break
+            vek[i] = round(value, digits)
+            i += 1
+    return vek
 
-    raise ValueError(f"Age {alter} not found in m_Tafeln")
+def discount_vector(zins: float, grenze: int, start: int = 0) -> np.ndarray:
+    """
+    v ** i für i = start .. start + grenze, mit v = 1 / (1 + zins).
+    Die Potenzen kommen aus pow() wie in der Schleife, np.power weicht im letzten Bit ab.
+    """
+    v = 1 / (1 + zins)
+    return np.array([v ** i for i in range(start, start + grenze + 1)])
 
-def v_lx(endalter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> list:
+def v_lx(endalter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
     """
-    Calculates the 'lx' vector, representing the number of survivors at each age.
+    Calculates the 'lx' vector, the number of survivors of 1,000,000 newborns at each age.
 
     Parameters:
     - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
-    - sex (str): Gender. String value, likely "m" for male or "w" for female.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
     - tafel (str): Mortality table identifier.
     - gebjahr (int, optional): Year of birth. Defaults to None.
     - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
     - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - list: A list containing the 'lx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
+    - np.ndarray: The 'lx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
     """
-    global rund_lx, max_Alter
-
-    # Get global constants
-    rund_lx = get_excel_global('rund_lx')
-    max_Alter = get_excel_global('max_Alter')
-
-    # Determine the boundary
     grenze = max_Alter if endalter == -1 else endalter
-
-    # Initialize the vector
-    vek = [0] * (grenze + 1)
+    vek = np.empty(grenze + 1)
     vek[0] = 1000000
-
-    # Calculate lx values
-    for i in range(1, grenze + 1):
-        vek[i] = vek[i - 1] * (1 - act_qx(i - 1, sex, tafel, gebjahr, rentenbeginnalter, schicht))
-        vek[i] = round(vek[i], rund_lx)
-
-    return vek
+    vek[1:] = 1 - qx_table(sex, tafel)[:grenze]
+    return accumulate_rounded(vek, np.multiply, rund_lx)
 
 def act_lx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
     """
-    Calculates the actuarial present value factor (lx) for a given age, sex, and mortality table.
+    Returns the commutation value lx at age 'alter'.
+    Der ganze Vektor liegt im Vektor-Cache, siehe commutation_vector.
+    Ein Array alter liefert die Werte als Array, siehe xl_macro.xl_batch.
 
     Parameters:
-    - alter (int): The current age for which the actuarial present value factor is calculated.
-    - sex (str): Indicates the sex of the individual ("m" for male, "w" for female).
-    - tafel (str): Specifies the mortality table to be used for calculations.
-    - gebjahr (int, optional): The year of birth of the individual. Defaults to None.
-    - rentenbeginnalter (int, optional): The age at which pension payments are expected to begin. Defaults to None.
-    - schicht (int, optional): Indicates the layer of the German pension system (1, 2, or 3). Defaults to 1.
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - float: The actuarial present value factor lx for the specified age.
+    - float: lx at age 'alter'.
     """
-    vek = v_lx(alter, sex, tafel, gebjahr, rentenbeginnalter, schicht)
-    return vek[alter]
+    return commutation_vector("lx", sex, tafel, None, gebjahr, rentenbeginnalter, schicht)[alter]
 
-def v_tx(endalter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1):
+def v_tx(endalter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
     """
-    Calculates the 'tx' vector, representing the number of deaths at each age.
-    This is a crucial component in actuarial calculations for pension and life insurance,
-    specifically for determining the probability of death within a given age range.
+    Calculates the 'tx' vector, the number of deaths at each age: tx[i] = lx[i] - lx[i + 1].
+    As in VBA the last element (age 'endalter') stays 0.
 
     Parameters:
-    - endalter (int): The upper age limit for the calculation. A value of -1 indicates that the calculation should extend to the maximum defined age ('max_Alter').
-    - sex (str): The sex of the individual ('M' for male, 'F' for female). This influences the mortality rates used.
-    - tafel (str): The mortality table to use for calculations. Different tables represent different population demographics and historical data.
-    - gebjahr (int, optional): The year of birth. Used in conjunction with the mortality table to accurately reflect mortality rates for a specific cohort.
-    - rentenbeginnalter (int, optional): The age at which pension payments begin. May affect the calculation depending on the specific actuarial model.
-    - schicht (int, optional): An integer representing the 'Schicht' (layer) of the German three-layer pension system (1, 2, or 3). Defaults to 1 (the statutory pension layer).
+    - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - list: A list containing the 'tx' values for each age from 0 up to 'endalter' (or 'max_Alter' if 'endalter' is -1). Each element represents the number of deaths at that age.
+    - np.ndarray: The 'tx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
     """
-    global rund_tx, max_Alter
-
-    # Determine the boundary age
     grenze = max_Alter if endalter == -1 else endalter
-
-    # Get the lx vector
     v_temp_lx = v_lx(grenze, sex, tafel, gebjahr, rentenbeginnalter, schicht)
-
-    # Calculate tx values (number of deaths at each age)
-    vek = []
-    for i in range(grenze):
-        tx_value = v_temp_lx[i] - v_temp_lx[i + 1]
-        vek.append(round(tx_value, rund_tx))
-
-    return vek
+    vek = np.zeros(grenze + 1)
+    vek[:grenze] = v_temp_lx[:-1] - v_temp_lx[1:]
+    return round_vector(vek, rund_tx)
 
 def act_tx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
     """
@@ -354,299 +980,206 @@ def act_tx(alter: int, sex: str, tafel: str, gebjahr: int = None, rentenbeginnal
     vek = v_tx(alter, sex, tafel, gebjahr, rentenbeginnalter, schicht)
     return vek[alter]
 
-def v_dx(endalter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1):
+def v_dx(endalter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
     """
-    Calculates the vector 'Dx', representing the present value of a life annuity-due, for each age up to a specified end age.
+    Calculates the 'Dx' vector, the discounted number of survivors: Dx[i] = lx[i] * v ** i.
 
     Parameters:
-    - endalter (int): The maximum age to calculate 'Dx' for. A value of -1 indicates calculating up to the maximum supported age ('max_Alter').
-    - sex (str): The sex of the individual ("M" for male, "F" for female).
-    - tafel (str): The mortality table to use for calculations.
+    - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
     - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
-    - gebjahr (int, optional): The year of birth.
-    - rentenbeginnalter (int, optional): The age at which the annuity begins.
-    - schicht (int, optional): The pension scheme layer (1, 2, or 3). Defaults to 1.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - list: A list containing the 'Dx' values for each age from 0 up to 'endalter'.
+    - np.ndarray: The 'Dx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
     """
-    global rund_Dx, max_Alter
-
-    # Determine the boundary age
     grenze = max_Alter if endalter == -1 else endalter
-
-    # Initialize the discount factor
-    v = 1 / (1 + zins)
-
-    # Get the lx values
     v_temp_lx = v_lx(grenze, sex, tafel, gebjahr, rentenbeginnalter, schicht)
-
-    # Calculate Dx values
-    vek = []
-    for i in range(grenze + 1):
-        dx_value = v_temp_lx[i] * (v ** i)
-        vek.append(round(dx_value, rund_Dx))
-
-    return vek
-
-cache = None
+    return round_vector(v_temp_lx * discount_vector(zins, grenze), rund_Dx)
 
 def act_dx(alter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
-    global cache
-
-    # Check if the dictionary is initialized
-    if cache is None:
-        initialize_cache()
-
-    s_key = create_cache_key("Dx", alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-
-    # Check if the value is already in the cache
-    if s_key in cache:
-        return cache[s_key]
-    else:
-        vek = v_dx(alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-        result = vek[alter]
-
-        # Store the result in the cache
-        cache[s_key] = result
-        return result
-
-def v_cx(endalter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1):
     """
-    Calculates the vector of 'Cx' values, representing the present value of a life annuity due.
+    Returns the commutation value Dx at age 'alter'.
+    Der ganze Vektor liegt im Vektor-Cache, siehe commutation_vector.
+    Ein Array alter liefert die Werte als Array, siehe xl_macro.xl_batch.
 
     Parameters:
-    - endalter (int): The final age to which the annuity is paid. A value of -1 indicates using the global maximum age ('max_Alter').
-    - sex (str): The sex of the annuitant ("M" for male, "F" for female).
-    - tafel (str): The mortality table to use for calculations.
-    - zins (float): The interest rate used for discounting future payments.
-    - gebjahr (int, optional): The birth year of the annuitant.
-    - rentenbeginnalter (int, optional): The age at which the annuity payments begin.
-    - schicht (int, optional): The layer/pillar of the German pension system (default is 1).
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - list[float]: A list containing the calculated 'Cx' values.
+    - float: Dx at age 'alter'.
     """
-    global rund_Cx, max_Alter
-    rund_Cx = get_excel_global('rund_Cx')
-    max_Alter = get_excel_global('max_Alter')
+    return commutation_vector("Dx", sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)[alter]
 
-    Grenze = max_Alter if endalter == -1 else endalter
-    vek = [0.0] * Grenze
-    v = 1 / (1 + zins)
-
-    v_temp_tx = v_tx(Grenze, sex, tafel, gebjahr, rentenbeginnalter, schicht)
-
-    for i in range(Grenze):
-        vek[i] = v_temp_tx[i] * (v ** (i + 1))
-        vek[i] = round(vek[i], rund_Cx)
+def v_cx(endalter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Cx' vector, the discounted number of deaths: Cx[i] = tx[i] * v ** (i + 1).
+    As in VBA the last element (age 'endalter') stays 0.
 
-    return vek
+    Parameters:
+    - endalter (int): The upper age limit for the calculation. If -1, the calculation extends to max_Alter.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
-cache = None
+    Returns:
+    - np.ndarray: The 'Cx' values for each age from 0 to 'endalter' (or to max_Alter if endalter is -1).
+    """
+    grenze = max_Alter if endalter == -1 else endalter
+    v_temp_tx = v_tx(grenze, sex, tafel, gebjahr, rentenbeginnalter, schicht)
+    vek = np.zeros(grenze + 1)
+    vek[:grenze] = v_temp_tx[:grenze] * discount_vector(zins, grenze - 1, start=1)
+    return round_vector(vek, rund_Cx)
 
 def act_cx(alter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
-    global cache
-
-    # Check if cache is initialized
-    if cache is None:
-        initialize_cache()
-
-    s_key = create_cache_key("Cx", alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-
-    # Check if value exists in cache
-    if s_key in cache:
-        return cache[s_key]
-    else:
-        vek = v_cx(alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-        result = vek[alter]
-
-        # Store result in cache
-        cache[s_key] = result
-        return result
-
-def v_nx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> list:
     """
-    Calculates the vector of 'Nx' values, representing the present value of a life annuity due,
-    contingent on surviving to age x.
+    Returns v_Cx(alter, ...)[alter] like the VBA function Act_Cx.
+    In VBA, v_Cx(Alter) only fills the ages before Alter, so the result is always 0;
+    a cache would not help here.
 
     Parameters:
-    - sex (str): The sex of the annuitant ("m" for male, "w" for female).
-    - tafel (str): The mortality table to use (e.g., "DAV2018", "GUT2018").
-    - zins (float): The interest rate (as a decimal, e.g., 0.05 for 5%) used for discounting.
-    - gebjahr (int, optional): The year of birth of the annuitant.
-    - rentenbeginnalter (int, optional): The age at which the annuity payments begin.
-    - schicht (int, optional): The layer of the German pension system (1, 2, or 3). Defaults to 1.
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - list: A list representing the vector 'Nx'. Each element corresponds to the present value of a life annuity due contingent on surviving to that age.
+    - float: Cx as computed by VBA.
     """
-    global max_Alter, rund_Dx
-
-    # Initialize the vector
-    vek = [0.0] * (max_Alter + 1)  # +1 because we're using 0-based indexing
+    return float(v_cx(alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)[alter])
 
-    # Get the v_Dx values
-    v_temp_dx = v_dx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-
-    # Set the value for max_Alter
-    vek[max_Alter] = v_temp_dx[max_Alter]
+def v_nx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Nx' vector up to max_Alter: Nx[i] = Dx[i] + Dx[i + 1] + ... + Dx[max_Alter].
 
-    # Calculate the Nx values backwards
-    for i in range(max_Alter - 1, -1, -1):
-        vek[i] = vek[i + 1] + v_temp_dx[i]
-        vek[i] = round(vek[i], rund_Dx)
+    Parameters:
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
-    return vek
+    Returns:
+    - np.ndarray: The 'Nx' values for each age from 0 to max_Alter.
+    """
+    v_temp = v_dx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    vek = np.array(v_temp[max_Alter::-1], dtype=float)
+    # wie in VBA mit rund_Dx
+    return np.ascontiguousarray(accumulate_rounded(vek, np.add, rund_Dx)[::-1])
 
 def act_nx(alter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
-    global cache
-
-    # Check if the dictionary is initialized
-    if cache is None:
-        initialize_cache()
-
-    s_key = create_cache_key("Nx", alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-
-    # Check if the value is already in cache
-    if s_key in cache:
-        return cache[s_key]
-    else:
-        vek = v_nx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-        result = vek[alter]
-
-        # Store result in cache
-        cache[s_key] = result
-        return result
-
-def v_mx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1):
     """
-    Calculates and returns a vector (array) representing the Mx values, which are crucial in actuarial calculations
-    related to German pension provisions. Mx represents the present value of a lifetime annuity, payable at the
-    beginning of each period, given a certain age.
+    Returns the commutation value Nx at age 'alter'.
+    Der ganze Vektor liegt im Vektor-Cache, siehe commutation_vector.
+    Ein Array alter liefert die Werte als Array, siehe xl_macro.xl_batch.
 
     Parameters:
-    - sex (str): Indicates the sex of the individual ("M" for Male or "F" for Female)
-    - tafel (str): Specifies the mortality table to be used in the calculation
-    - zins (float): The interest rate used for discounting future cash flows
-    - gebjahr (int, optional): The year of birth of the individual
-    - rentenbeginnalter (int, optional): The age at which pension payments begin
-    - schicht (int, optional): Specifies the Schicht (layer) of the German pension system (default: 1)
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - list[float]: An array of Mx values for each age up to max_Alter
+    - float: Nx at age 'alter'.
     """
-    global max_Alter, rund_Mx
+    return commutation_vector("Nx", sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)[alter]
 
-    vek = [0.0] * max_Alter
-    v_temp_cx = v_cx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+def v_mx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Mx' vector up to max_Alter: Mx[i] = Cx[i] + Cx[i + 1] + ... + Cx[max_Alter].
 
-    vek[max_Alter - 1] = v_temp_cx[max_Alter - 1]
-    for i in range(max_Alter - 2, -1, -1):
-        vek[i] = vek[i + 1] + v_temp_cx[i]
-        vek[i] = round(vek[i], rund_Mx)
+    Parameters:
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
-    return vek
+    Returns:
+    - np.ndarray: The 'Mx' values for each age from 0 to max_Alter.
+    """
+    v_temp = v_cx(-1, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    vek = np.array(v_temp[max_Alter::-1], dtype=float)
+    return np.ascontiguousarray(accumulate_rounded(vek, np.add, rund_Mx)[::-1])
 
 def act_mx(alter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
-    global cache
-
-    # Check if cache is initialized
-    if cache is None:
-        initialize_cache()
-
-    s_key = create_cache_key("Mx", alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-
-    # Check if value is already in cache
-    if s_key in cache:
-        return cache[s_key]
-    else:
-        vek = v_mx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-        result = vek[alter]
-
-        # Store result in cache
-        cache[s_key] = result
-        return result
-
-def v_rx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1):
     """
-    Calculates and returns a vector representing the accumulated values of Rx (present value of pension stream at each age).
+    Returns the commutation value Mx at age 'alter'.
+    Der ganze Vektor liegt im Vektor-Cache, siehe commutation_vector.
+    Ein Array alter liefert die Werte als Array, siehe xl_macro.xl_batch.
 
     Parameters:
-    - sex (str): Gender of the insured individual
-    - tafel (str): Mortality table to be used
-    - zins (float): Discount rate for present value calculations
-    - gebjahr (int, optional): Year of birth
-    - rentenbeginnalter (int, optional): Age at which pension payments begin
-    - schicht (int, optional): Pension pillar (default 1)
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - list: Array containing accumulated Rx values at each age
+    - float: Mx at age 'alter'.
     """
-    global max_Alter, rund_Rx
-
-    # Initialize the vector with size max_Alter + 1
-    vek = [0.0] * (max_Alter + 1)
+    return commutation_vector("Mx", sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)[alter]
 
-    # Get the v_Mx values
-    v_temp_mx = v_mx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-
-    # Set the value at max_Alter
-    vek[max_Alter] = v_temp_mx[max_Alter]
+def v_rx(sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> np.ndarray:
+    """
+    Calculates the 'Rx' vector up to max_Alter: Rx[i] = Mx[i] + Mx[i + 1] + ... + Mx[max_Alter].
 
-    # Backward accumulation
-    for i in range(max_Alter - 1, -1, -1):
-        vek[i] = vek[i + 1] + v_temp_mx[i]
-        vek[i] = round(vek[i], rund_Rx)
+    Parameters:
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting (e.g., 0.05 for 5%).
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
-    return vek
+    Returns:
+    - np.ndarray: The 'Rx' values for each age from 0 to max_Alter.
+    """
+    v_temp = v_mx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
+    vek = np.array(v_temp[max_Alter::-1], dtype=float)
+    return np.ascontiguousarray(accumulate_rounded(vek, np.add, rund_Rx)[::-1])
 
 def act_rx(alter: int, sex: str, tafel: str, zins: float, gebjahr: int = None, rentenbeginnalter: int = None, schicht: int = 1) -> float:
     """
-    Calculates the actuarial present value factor 'Rx' for a given age, sex, mortality table, interest rate, and pension scheme layer.
+    Returns the commutation value Rx at age 'alter'.
+    Der ganze Vektor liegt im Vektor-Cache, siehe commutation_vector.
+    Ein Array alter liefert die Werte als Array, siehe xl_macro.xl_batch.
 
     Parameters:
-    - alter (int): The age for which to calculate the present value factor.
-    - sex (str): The sex of the annuitant ("M" for male, "F" for female).
-    - tafel (str): The name of the mortality table to use. This defines the probabilities of survival.
-    - zins (float): The annual interest rate, expressed as a decimal.
-    - gebjahr (int, optional): The year of birth. May be used in conjunction with the mortality table.
-    - rentenbeginnalter (int, optional): The age at which the pension begins.
-    - schicht (int, optional): The layer of the German pension system (1, 2, or 3). Defaults to 1.
+    - alter (int): The age.
+    - sex (str): The sex of the individual ("M", everything else counts as "F").
+    - tafel (str): Mortality table identifier.
+    - zins (float): The interest rate used for discounting.
+    - gebjahr (int, optional): Year of birth. Defaults to None.
+    - rentenbeginnalter (int, optional): Age at which pension benefits begin. Defaults to None.
+    - schicht (int, optional): Pension layer/pillar. Defaults to 1.
 
     Returns:
-    - float: The actuarial present value factor 'Rx'. This factor represents the present value of a payment of 1 at a future date, considering mortality and discounting.
-
-    Remarks:
-    This function calculates the 'Rx' factor, a crucial component in actuarial calculations for pensions.
-    It utilizes a caching mechanism to improve performance. The 'v_rx' function, which performs the core calculation,
-    is called only if the result is not already present in the 'cache'.
-
-    The 'schicht' parameter refers to the 3-layer model of German retirement provision (3-Schichten-Modell):
-    - Schicht 1: Statutory pension insurance, professional pension schemes, agricultural pension funds, civil servant pensions.
-    - Schicht 2: State-subsidized supplementary pensions, company pensions, Riester pensions.
-    - Schicht 3: Private pension contracts without state subsidies.
-
-    The function uses a dictionary ('cache') to store previously calculated values to avoid redundant calculations.
+    - float: Rx at age 'alter'.
     """
-    global cache
-
-    # Check if the dictionary is initialized
-    if cache is None:
-        initialize_cache()
-
-    s_key = create_cache_key("Rx", alter, sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-
-    # Check if the value is already in the cache
-    if s_key in cache:
-        return cache[s_key]
-    else:
-        vek = v_rx(sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)
-        result = vek[alter]
-
-        # Store result in cache
-        cache[s_key] = result
-        return result
+    return commutation_vector("Rx", sex, tafel, zins, gebjahr, rentenbeginnalter, schicht)[alter]
 
 def act_altersberechnung(geb_dat, ber_dat, methode):
     """
@@ -809,109 +1342,68 @@ def act_abzugsglied(k: int, zins: float) -> float:
     return abzugsglied
 
 def fkt_kalkulation_k5():
-    alpha = get_excel_global('alpha')
-    beta1 = get_excel_global('beta1')
-    gamma1 = get_excel_global('gamma1')
-    gamma2 = get_excel_global('gamma2')
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    result = (
-        act_ngr_ax(x, n, Sex, Tafel, Zins) +
-        act_dx(x + n, Sex, Tafel, Zins) / act_dx(x, Sex, Tafel, Zins) +
-        gamma1 * act_axn_k(x, t, Sex, Tafel, Zins, 1) +
-        gamma2 * (act_axn_k(x, n, Sex, Tafel, Zins, 1) - act_axn_k(x, t, Sex, Tafel, Zins, 1))
-    ) / (
-        (1 - beta1) * act_axn_k(x, t, Sex, Tafel, Zins, 1) - alpha * t
-    )
-    return result
+    gamma1 = get_excel_global('gamma1')
+    t = get_excel_global('t')
+    gamma2 = get_excel_global('gamma2')
+    beta1 = get_excel_global('beta1')
+    alpha = get_excel_global('alpha')
+    return (act_ngr_ax(x, n, Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x, Sex, Tafel, Zins) + gamma1 * act_axn_k(x, t, Sex, Tafel, Zins, 1) + gamma2 * (act_axn_k(x, n, Sex, Tafel, Zins, 1) - act_axn_k(x, t, Sex, Tafel, Zins, 1))) / ((1 - beta1) * act_axn_k(x, t, Sex, Tafel, Zins, 1) - alpha * t)
 
 def fkt_kalkulation_k6():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!K5")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!K5")
 
 def fkt_kalkulation_k7():
-    k = get_excel_global('k')
     ratzu = get_excel_global('ratzu')
-    t = get_excel_global('t')
     zw = get_excel_global('zw')
+    k = get_excel_global('k')
     return (1 + ratzu) / zw * (get_cell_value("Kalkulation!K6") + k)
 
 def fkt_kalkulation_k9():
-    alpha = get_excel_global('alpha')
-    B_xt = get_excel_global('B_xt')
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    return (act_ngr_ax(x, n, Sex, Tafel, Zins) +
-            act_dx(x + n, Sex, Tafel, Zins) / act_dx(x, Sex, Tafel, Zins) +
-            t * alpha * B_xt) / act_axn_k(x, t, Sex, Tafel, Zins, 1)
+    t = get_excel_global('t')
+    alpha = get_excel_global('alpha')
+    B_xt = get_excel_global('B_xt')
+    return (act_ngr_ax(x, n, Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x, Sex, Tafel, Zins) + t * alpha * B_xt) / act_axn_k(x, t, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e12():
     zw = get_excel_global('zw')
-    if zw == 2:
-        return 0.02
-    elif zw == 4:
-        return 0.03
-    elif zw == 12:
-        return 0.05
-    else:
-        return 0
+    return 0.02 if zw == 2 else 0.03 if zw == 4 else 0.05 if zw == 12 else 0
 
 def fkt_kalkulation_b16():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A16 = get_cell_value("Kalkulation!A16")
-
-    if A16 <= n:
-        return act_ngr_ax(x + A16, max(0, n - A16), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A16, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A16"), max(0, n - get_cell_value("Kalkulation!A16")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A16"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A16") <= n else 0
 
 def fkt_kalkulation_c16():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A16 = get_cell_value("Kalkulation!A16")
-    return act_axn_k(x + A16, max(0, n - A16), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A16"), max(0, n - get_cell_value("Kalkulation!A16")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d16():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A16_value = get_cell_value("Kalkulation!A16")
-    return act_axn_k(x + A16_value, max(0, t - A16_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A16"), max(0, t - get_cell_value("Kalkulation!A16")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e16():
-    B16 = get_cell_value("Kalkulation!B16")
-    D16 = get_cell_value("Kalkulation!D16")
-    C16 = get_cell_value("Kalkulation!C16")
     P_xt = get_excel_global('P_xt')
     gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
@@ -920,480 +1412,288 @@ def fkt_kalkulation_e16():
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B16 - P_xt * D16 + gamma2 * (C16 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D16)
-    return result
+    return get_cell_value("Kalkulation!B16") - P_xt * get_cell_value("Kalkulation!D16") + gamma2 * (get_cell_value("Kalkulation!C16") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D16"))
 
 def fkt_kalkulation_f16():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E16")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E16")
 
 def fkt_kalkulation_g16():
     gamma3 = get_excel_global('gamma3')
-    B16 = get_cell_value("Kalkulation!B16")
-    C16 = get_cell_value("Kalkulation!C16")
-    return B16 + gamma3 * C16
+    return get_cell_value("Kalkulation!B16") + gamma3 * get_cell_value("Kalkulation!C16")
 
 def fkt_kalkulation_h16():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F16 = get_cell_value("Kalkulation!F16")
-    A16 = get_cell_value("Kalkulation!A16")
-
-    return F16 + alpha * t * BJB * act_axn_k(x + A16, max(5 - A16, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F16") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A16"), max(5 - get_cell_value("Kalkulation!A16"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i16():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A16 = get_cell_value("Kalkulation!A16")
-    return 1 if (x + A16 >= MinAlterFlex and A16 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A16") >= MinAlterFlex, get_cell_value("Kalkulation!A16") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j16():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A16 = get_cell_value("Kalkulation!A16")
-    I16 = get_cell_value("Kalkulation!I16")
-    F16 = get_cell_value("Kalkulation!F16")
-    return 0 if (A16 > n) or I16 else min(150, max(50, 0.01 * (VS - F16)))
+    return 0 if any((get_cell_value("Kalkulation!A16") > n, get_cell_value("Kalkulation!I16"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F16"))))
 
 def fkt_kalkulation_k16():
-    h16 = get_cell_value("Kalkulation!H16")
-    j16 = get_cell_value("Kalkulation!J16")
-    return max(0, h16 - j16)
+    return max(0, get_cell_value("Kalkulation!H16") - get_cell_value("Kalkulation!J16"))
 
 def fkt_kalkulation_l16():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A16 = get_cell_value("Kalkulation!A16")
-    H16 = get_cell_value("Kalkulation!H16")
-    G16 = get_cell_value("Kalkulation!G16")
-
     try:
-        if A16 > n:
-            return 0
-        elif A16 < t:
-            return H16 / G16
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A16") > n else get_cell_value("Kalkulation!H16") / get_cell_value("Kalkulation!G16") if get_cell_value("Kalkulation!A16") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b17():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A17 = get_cell_value("Kalkulation!A17")
-
-    if A17 <= n:
-        return act_ngr_ax(x + A17, max(0, n - A17), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A17, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A17"), max(0, n - get_cell_value("Kalkulation!A17")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A17"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A17") <= n else 0
 
 def fkt_kalkulation_c17():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A17_value = get_cell_value("Kalkulation!A17")
-    return act_axn_k(x + A17_value, max(0, n - A17_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A17"), max(0, n - get_cell_value("Kalkulation!A17")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d17():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A17")
-    t_value = t - get_cell_value("Kalkulation!A17")
-    max_value = max(0, t_value)
-
-    return act_axn_k(alter=x_value, n=max_value, sex=Sex, tafel=Tafel, zins=Zins, k=1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A17"), max(0, t - get_cell_value("Kalkulation!A17")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e17():
-    B17 = get_cell_value("Kalkulation!B17")
     P_xt = get_excel_global('P_xt')
-    D17 = get_cell_value("Kalkulation!D17")
     gamma2 = get_excel_global('gamma2')
-    C17 = get_cell_value("Kalkulation!C17")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B17 - P_xt * D17 + gamma2 * (C17 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D17)
+    return get_cell_value("Kalkulation!B17") - P_xt * get_cell_value("Kalkulation!D17") + gamma2 * (get_cell_value("Kalkulation!C17") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D17"))
 
 def fkt_kalkulation_f17():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E17")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E17")
 
 def fkt_kalkulation_g17():
     gamma3 = get_excel_global('gamma3')
-    B17 = get_cell_value("Kalkulation!B17")
-    C17 = get_cell_value("Kalkulation!C17")
-    return B17 + gamma3 * C17
+    return get_cell_value("Kalkulation!B17") + gamma3 * get_cell_value("Kalkulation!C17")
 
 def fkt_kalkulation_h17():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F17 = get_cell_value("Kalkulation!F17")
-    A17 = get_cell_value("Kalkulation!A17")
-
-    return F17 + alpha * t * BJB * act_axn_k(x + A17, max(5 - A17, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F17") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A17"), max(5 - get_cell_value("Kalkulation!A17"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i17():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A17 = get_cell_value("Kalkulation!A17")
-    return 1 if (x + A17 >= MinAlterFlex and A17 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A17") >= MinAlterFlex, get_cell_value("Kalkulation!A17") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j17():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A17 = get_cell_value("Kalkulation!A17")
-    I17 = get_cell_value("Kalkulation!I17")
-    F17 = get_cell_value("Kalkulation!F17")
-
-    if A17 > n or I17:
-        return 0
-    else:
-        inner_value = VS - F17
-        result = 1 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A17") > n, get_cell_value("Kalkulation!I17"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F17"))))
 
 def fkt_kalkulation_k17():
-    value = get_cell_value("Kalkulation!H17")
-    value2 = get_cell_value("Kalkulation!J17")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H17") - get_cell_value("Kalkulation!J17"))
 
 def fkt_kalkulation_l17():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A17 = get_cell_value("Kalkulation!A17")
-    H17 = get_cell_value("Kalkulation!H17")
-    G17 = get_cell_value("Kalkulation!G17")
     try:
-        if A17 > n:
-            result = 0
-        elif A17 < t:
-            result = H17 / G17
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A17") > n else get_cell_value("Kalkulation!H17") / get_cell_value("Kalkulation!G17") if get_cell_value("Kalkulation!A17") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b18():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A18 = get_cell_value("Kalkulation!A18")
-
-    if A18 <= n:
-        return act_ngr_ax(x + A18, max(0, n - A18), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A18, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A18"), max(0, n - get_cell_value("Kalkulation!A18")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A18"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A18") <= n else 0
 
 def fkt_kalkulation_c18():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A18 = get_cell_value("Kalkulation!A18")
-    return act_axn_k(x + A18, max(0, n - A18), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A18"), max(0, n - get_cell_value("Kalkulation!A18")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d18():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!$A18")
-    t_value = t - get_cell_value("Kalkulation!$A18")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A18"), max(0, t - get_cell_value("Kalkulation!A18")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e18():
-    B18 = get_cell_value("Kalkulation!B18")
     P_xt = get_excel_global('P_xt')
-    D18 = get_cell_value("Kalkulation!D18")
     gamma2 = get_excel_global('gamma2')
-    C18 = get_cell_value("Kalkulation!C18")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B18 - P_xt * D18 + gamma2 * (C18 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D18)
+    return get_cell_value("Kalkulation!B18") - P_xt * get_cell_value("Kalkulation!D18") + gamma2 * (get_cell_value("Kalkulation!C18") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D18"))
 
 def fkt_kalkulation_f18():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E18")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E18")
 
 def fkt_kalkulation_g18():
     gamma3 = get_excel_global('gamma3')
-    B18 = get_cell_value("Kalkulation!B18")
-    C18 = get_cell_value("Kalkulation!C18")
-    return B18 + gamma3 * C18
+    return get_cell_value("Kalkulation!B18") + gamma3 * get_cell_value("Kalkulation!C18")
 
 def fkt_kalkulation_h18():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F18 = get_cell_value("Kalkulation!F18")
-    A18 = get_cell_value("Kalkulation!A18")
-
-    return F18 + alpha * t * BJB * act_axn_k(x + A18, max(5 - A18, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F18") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A18"), max(5 - get_cell_value("Kalkulation!A18"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i18():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A18 = get_cell_value("Kalkulation!A18")
-    return 1 if (x + A18 >= MinAlterFlex and A18 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A18") >= MinAlterFlex, get_cell_value("Kalkulation!A18") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j18():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A18 = get_cell_value("Kalkulation!A18")
-    I18 = get_cell_value("Kalkulation!I18")
-    F18 = get_cell_value("Kalkulation!F18")
-
-    if A18 > n or I18:
-        return 0
-    else:
-        inner_value = VS - F18
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A18") > n, get_cell_value("Kalkulation!I18"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F18"))))
 
 def fkt_kalkulation_k18():
-    H18 = get_cell_value("Kalkulation!H18")
-    J18 = get_cell_value("Kalkulation!J18")
-    return max(0, H18 - J18)
+    return max(0, get_cell_value("Kalkulation!H18") - get_cell_value("Kalkulation!J18"))
 
 def fkt_kalkulation_l18():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A18 = get_cell_value("Kalkulation!A18")
-    H18 = get_cell_value("Kalkulation!H18")
-    G18 = get_cell_value("Kalkulation!G18")
     try:
-        if A18 > n:
-            return 0
-        elif A18 < t:
-            return H18 / G18
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A18") > n else get_cell_value("Kalkulation!H18") / get_cell_value("Kalkulation!G18") if get_cell_value("Kalkulation!A18") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b19():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A19 = get_cell_value("Kalkulation!A19")
-
-    if A19 <= n:
-        return act_ngr_ax(x + A19, max(0, n - A19), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A19, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A19"), max(0, n - get_cell_value("Kalkulation!A19")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A19"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A19") <= n else 0
 
 def fkt_kalkulation_c19():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A19_value = get_cell_value("Kalkulation!A19")
-    return act_axn_k(x + A19_value, max(0, n - A19_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A19"), max(0, n - get_cell_value("Kalkulation!A19")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d19():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A19")
-    t_value = t - get_cell_value("Kalkulation!A19")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A19"), max(0, t - get_cell_value("Kalkulation!A19")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e19():
-    B19 = get_cell_value("Kalkulation!B19")
     P_xt = get_excel_global('P_xt')
-    D19 = get_cell_value("Kalkulation!D19")
     gamma2 = get_excel_global('gamma2')
-    C19 = get_cell_value("Kalkulation!C19")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B19 - P_xt * D19 + gamma2 * (C19 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D19)
+    return get_cell_value("Kalkulation!B19") - P_xt * get_cell_value("Kalkulation!D19") + gamma2 * (get_cell_value("Kalkulation!C19") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D19"))
 
 def fkt_kalkulation_f19():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E19")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E19")
 
 def fkt_kalkulation_g19():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B19") + gamma3 * get_cell_value("Kalkulation!C19")
-    return value
+    return get_cell_value("Kalkulation!B19") + gamma3 * get_cell_value("Kalkulation!C19")
 
 def fkt_kalkulation_h19():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F19 = get_cell_value("Kalkulation!F19")
-    A19 = get_cell_value("Kalkulation!A19")
-
-    return F19 + alpha * t * BJB * act_axn_k(x + A19, max(5 - A19, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F19") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A19"), max(5 - get_cell_value("Kalkulation!A19"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i19():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A19 = get_cell_value("Kalkulation!A19")
-    return 1 if (x + A19 >= MinAlterFlex and A19 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A19") >= MinAlterFlex, get_cell_value("Kalkulation!A19") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j19():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A19 = get_cell_value("Kalkulation!A19")
-    I19 = get_cell_value("Kalkulation!I19")
-    F19 = get_cell_value("Kalkulation!F19")
-
-    if A19 > n or I19:
-        return 0
-    else:
-        inner_value = VS - F19
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A19") > n, get_cell_value("Kalkulation!I19"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F19"))))
 
 def fkt_kalkulation_k19():
-    h19 = get_cell_value("Kalkulation!H19")
-    j19 = get_cell_value("Kalkulation!J19")
-    return max(0, h19 - j19)
+    return max(0, get_cell_value("Kalkulation!H19") - get_cell_value("Kalkulation!J19"))
 
 def fkt_kalkulation_l19():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A19 = get_cell_value("Kalkulation!A19")
-    H19 = get_cell_value("Kalkulation!H19")
-    G19 = get_cell_value("Kalkulation!G19")
     try:
-        if A19 > n:
-            return 0
-        elif A19 < t:
-            return H19 / G19
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A19") > n else get_cell_value("Kalkulation!H19") / get_cell_value("Kalkulation!G19") if get_cell_value("Kalkulation!A19") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b20():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
-    Zins = get_excel_global('Zins')
-
-    A20 = get_cell_value("Kalkulation!A20")
-
-    if A20 <= n:
-        return act_ngr_ax(x + A20, max(0, n - A20), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A20, Sex, Tafel, Zins)
-    else:
-        return 0
+    Zins = get_excel_global('Zins')
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A20"), max(0, n - get_cell_value("Kalkulation!A20")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A20"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A20") <= n else 0
 
 def fkt_kalkulation_c20():
     x = get_excel_global('x')
@@ -1401,82 +1701,56 @@ def fkt_kalkulation_c20():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-    A20 = get_cell_value("Kalkulation!A20")
-    return act_axn_k(x + A20, max(0, n - A20), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A20"), max(0, n - get_cell_value("Kalkulation!A20")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d20():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A20")
-    t_value = t - get_cell_value("Kalkulation!A20")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A20"), max(0, t - get_cell_value("Kalkulation!A20")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e20():
-    B20 = get_cell_value("Kalkulation!B20")
     P_xt = get_excel_global('P_xt')
-    D20 = get_cell_value("Kalkulation!D20")
     gamma2 = get_excel_global('gamma2')
-    C20 = get_cell_value("Kalkulation!C20")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B20 - P_xt * D20 + gamma2 * (C20 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D20)
+    return get_cell_value("Kalkulation!B20") - P_xt * get_cell_value("Kalkulation!D20") + gamma2 * (get_cell_value("Kalkulation!C20") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D20"))
 
 def fkt_kalkulation_f20():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E20")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E20")
 
 def fkt_kalkulation_g20():
     gamma3 = get_excel_global('gamma3')
-    B20 = get_cell_value("Kalkulation!B20")
-    C20 = get_cell_value("Kalkulation!C20")
-    return B20 + gamma3 * C20
+    return get_cell_value("Kalkulation!B20") + gamma3 * get_cell_value("Kalkulation!C20")
 
 def fkt_kalkulation_h20():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F20 = get_cell_value("Kalkulation!F20")
-    A20 = get_cell_value("Kalkulation!A20")
-
-    return F20 + alpha * t * BJB * act_axn_k(x + A20, max(5 - A20, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F20") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A20"), max(5 - get_cell_value("Kalkulation!A20"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i20():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A20 = get_cell_value("Kalkulation!A20")
-    return 1 if (x + A20 >= MinAlterFlex and A20 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A20") >= MinAlterFlex, get_cell_value("Kalkulation!A20") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j20():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A20 = get_cell_value("Kalkulation!A20")
-    I20 = get_cell_value("Kalkulation!I20")
-    F20 = get_cell_value("Kalkulation!F20")
-    return 0 if (A20 > n) or I20 else min(150, max(50, 0.01 * (VS - F20)))
+    return 0 if any((get_cell_value("Kalkulation!A20") > n, get_cell_value("Kalkulation!I20"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F20"))))
 
 def fkt_kalkulation_k20():
     return max(0, get_cell_value("Kalkulation!H20") - get_cell_value("Kalkulation!J20"))
@@ -1485,156 +1759,95 @@ def fkt_kalkulation_l20():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A20 = get_cell_value("Kalkulation!A20")
-    H20 = get_cell_value("Kalkulation!H20")
-    G20 = get_cell_value("Kalkulation!G20")
     try:
-        if A20 > n:
-            result = 0
-        elif A20 < t:
-            result = H20 / G20
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A20") > n else get_cell_value("Kalkulation!H20") / get_cell_value("Kalkulation!G20") if get_cell_value("Kalkulation!A20") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b21():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A21 = get_cell_value("Kalkulation!A21")
-
-    if A21 <= n:
-        return act_ngr_ax(x + A21, max(0, n - A21), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A21, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A21"), max(0, n - get_cell_value("Kalkulation!A21")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A21"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A21") <= n else 0
 
 def fkt_kalkulation_c21():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!C21")
-    a21_val = get_cell_value("Kalkulation!A21")
-    return act_axn_k(x_val + a21_val, max(0, n - a21_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A21"), max(0, n - get_cell_value("Kalkulation!A21")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d21():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D21")
-    a21_val = get_cell_value("Kalkulation!A21")
-    t_val = get_cell_value("Kalkulation!A21")
-
-    return act_axn_k(x_val + a21_val, max(0, t_val - a21_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A21"), max(0, t - get_cell_value("Kalkulation!A21")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e21():
-    B21 = get_cell_value("Kalkulation!B21")
-    D21 = get_cell_value("Kalkulation!D21")
-    C21 = get_cell_value("Kalkulation!C21")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B21 - P_xt * D21 + gamma2 * (C21 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D21)
-    return result
+    return get_cell_value("Kalkulation!B21") - P_xt * get_cell_value("Kalkulation!D21") + gamma2 * (get_cell_value("Kalkulation!C21") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D21"))
 
 def fkt_kalkulation_f21():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E21")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E21")
 
 def fkt_kalkulation_g21():
     gamma3 = get_excel_global('gamma3')
-    B21 = get_cell_value("Kalkulation!B21")
-    C21 = get_cell_value("Kalkulation!C21")
-    return B21 + gamma3 * C21
+    return get_cell_value("Kalkulation!B21") + gamma3 * get_cell_value("Kalkulation!C21")
 
 def fkt_kalkulation_h21():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F21 = get_cell_value("Kalkulation!F21")
-    A21 = get_cell_value("Kalkulation!A21")
-
-    return F21 + alpha * t * BJB * act_axn_k(x + A21, max(5 - A21, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F21") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A21"), max(5 - get_cell_value("Kalkulation!A21"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i21():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A21 = get_cell_value("Kalkulation!A21")
-    return 1 if (x + A21 >= MinAlterFlex and A21 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A21") >= MinAlterFlex, get_cell_value("Kalkulation!A21") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j21():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A21 = get_cell_value("Kalkulation!A21")
-    I21 = get_cell_value("Kalkulation!I21")
-    F21 = get_cell_value("Kalkulation!F21")
-    return 0 if (A21 > n) or I21 else min(150, max(50, 0.01 * (VS - F21)))
+    return 0 if any((get_cell_value("Kalkulation!A21") > n, get_cell_value("Kalkulation!I21"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F21"))))
 
 def fkt_kalkulation_k21():
-    h21 = get_cell_value("Kalkulation!H21")
-    j21 = get_cell_value("Kalkulation!J21")
-    return max(0, h21 - j21)
+    return max(0, get_cell_value("Kalkulation!H21") - get_cell_value("Kalkulation!J21"))
 
 def fkt_kalkulation_l21():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A21 = get_cell_value("Kalkulation!A21")
-    H21 = get_cell_value("Kalkulation!H21")
-    G21 = get_cell_value("Kalkulation!G21")
     try:
-        if A21 > n:
-            result = 0
-        elif A21 < t:
-            result = H21 / G21
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A21") > n else get_cell_value("Kalkulation!H21") / get_cell_value("Kalkulation!G21") if get_cell_value("Kalkulation!A21") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b22():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A22 = get_cell_value("Kalkulation!A22")
-    return act_ngr_ax(x + A22, max(0, n - A22), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A22, Sex, Tafel, Zins) if A22 <= n else 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A22"), max(0, n - get_cell_value("Kalkulation!A22")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A22"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A22") <= n else 0
 
 def fkt_kalkulation_c22():
     x = get_excel_global('x')
@@ -1642,254 +1855,153 @@ def fkt_kalkulation_c22():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A22_value = get_cell_value("Kalkulation!A22")
-    return act_axn_k(x + A22_value, max(0, n - A22_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A22"), max(0, n - get_cell_value("Kalkulation!A22")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d22():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A22 = get_cell_value("Kalkulation!A22")
-    return act_axn_k(x + A22, max(0, t - A22), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A22"), max(0, t - get_cell_value("Kalkulation!A22")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e22():
-    B22 = get_cell_value("Kalkulation!B22")
-    D22 = get_cell_value("Kalkulation!D22")
-    C22 = get_cell_value("Kalkulation!C22")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B22 - P_xt * D22 + gamma2 * (C22 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D22)
-    return result
+    return get_cell_value("Kalkulation!B22") - P_xt * get_cell_value("Kalkulation!D22") + gamma2 * (get_cell_value("Kalkulation!C22") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D22"))
 
 def fkt_kalkulation_f22():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E22")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E22")
 
 def fkt_kalkulation_g22():
     gamma3 = get_excel_global('gamma3')
-    b22 = get_cell_value("Kalkulation!B22")
-    c22 = get_cell_value("Kalkulation!C22")
-    return b22 + gamma3 * c22
+    return get_cell_value("Kalkulation!B22") + gamma3 * get_cell_value("Kalkulation!C22")
 
 def fkt_kalkulation_h22():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F22 = get_cell_value("Kalkulation!F22")
-    A22 = get_cell_value("Kalkulation!A22")
-
-    result = F22 + alpha * t * BJB * act_axn_k(x + A22, max(5 - A22, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
-    return result
+    return get_cell_value("Kalkulation!F22") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A22"), max(5 - get_cell_value("Kalkulation!A22"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i22():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A22 = get_cell_value("Kalkulation!A22")
-    return 1 if (x + A22 >= MinAlterFlex and A22 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A22") >= MinAlterFlex, get_cell_value("Kalkulation!A22") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j22():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A22 = get_cell_value("Kalkulation!A22")
-    I22 = get_cell_value("Kalkulation!I22")
-    F22 = get_cell_value("Kalkulation!F22")
-
-    if A22 > n or I22:
-        return 0
-    else:
-        result = VS - F22
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A22") > n, get_cell_value("Kalkulation!I22"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F22"))))
 
 def fkt_kalkulation_k22():
-    H22 = get_cell_value("Kalkulation!H22")
-    J22 = get_cell_value("Kalkulation!J22")
-    return max(0, H22 - J22)
+    return max(0, get_cell_value("Kalkulation!H22") - get_cell_value("Kalkulation!J22"))
 
 def fkt_kalkulation_l22():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A22 = get_cell_value("Kalkulation!A22")
-    H22 = get_cell_value("Kalkulation!H22")
-    G22 = get_cell_value("Kalkulation!G22")
     try:
-        if A22 > n:
-            result = 0
-        else:
-            if A22 < t:
-                result = H22 / G22
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A22") > n else get_cell_value("Kalkulation!H22") / get_cell_value("Kalkulation!G22") if get_cell_value("Kalkulation!A22") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b23():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A23 = get_cell_value("Kalkulation!A23")
-    return act_ngr_ax(x + A23, max(0, n - A23), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A23, Sex, Tafel, Zins) if A23 <= n else 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A23"), max(0, n - get_cell_value("Kalkulation!A23")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A23"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A23") <= n else 0
 
 def fkt_kalkulation_c23():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A23_value = get_cell_value("Kalkulation!A23")
-    return act_axn_k(x + A23_value, max(0, n - A23_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A23"), max(0, n - get_cell_value("Kalkulation!A23")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d23():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A23")
-    t_value = t - get_cell_value("Kalkulation!A23")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A23"), max(0, t - get_cell_value("Kalkulation!A23")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e23():
-    B23 = get_cell_value("Kalkulation!B23")
-    D23 = get_cell_value("Kalkulation!D23")
-    C23 = get_cell_value("Kalkulation!C23")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B23 - P_xt * D23 + gamma2 * (C23 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D23)
+    return get_cell_value("Kalkulation!B23") - P_xt * get_cell_value("Kalkulation!D23") + gamma2 * (get_cell_value("Kalkulation!C23") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D23"))
 
 def fkt_kalkulation_f23():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E23")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E23")
 
 def fkt_kalkulation_g23():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B23") + gamma3 * get_cell_value("Kalkulation!C23")
-    return value
+    return get_cell_value("Kalkulation!B23") + gamma3 * get_cell_value("Kalkulation!C23")
 
 def fkt_kalkulation_h23():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F23 = get_cell_value("Kalkulation!F23")
-    A23 = get_cell_value("Kalkulation!A23")
-
-    return F23 + alpha * t * BJB * act_axn_k(x + A23, max(5 - A23, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F23") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A23"), max(5 - get_cell_value("Kalkulation!A23"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i23():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A23 = get_cell_value("Kalkulation!A23")
-    return 1 if (x + A23 >= MinAlterFlex and A23 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A23") >= MinAlterFlex, get_cell_value("Kalkulation!A23") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j23():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A23 = get_cell_value("Kalkulation!A23")
-    I23 = get_cell_value("Kalkulation!I23")
-    F23 = get_cell_value("Kalkulation!F23")
-
-    if A23 > n or I23:
-        return 0
-    else:
-        inner_value = VS - F23
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A23") > n, get_cell_value("Kalkulation!I23"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F23"))))
 
 def fkt_kalkulation_k23():
-    H23 = get_cell_value("Kalkulation!H23")
-    J23 = get_cell_value("Kalkulation!J23")
-    return max(0, H23 - J23)
+    return max(0, get_cell_value("Kalkulation!H23") - get_cell_value("Kalkulation!J23"))
 
 def fkt_kalkulation_l23():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A23 = get_cell_value("Kalkulation!A23")
-    H23 = get_cell_value("Kalkulation!H23")
-    G23 = get_cell_value("Kalkulation!G23")
     try:
-        if A23 > n:
-            result = 0
-        elif A23 < t:
-            result = H23 / G23
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A23") > n else get_cell_value("Kalkulation!H23") / get_cell_value("Kalkulation!G23") if get_cell_value("Kalkulation!A23") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b24():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A24 = get_cell_value("Kalkulation!A24")
-
-    if A24 <= n:
-        return act_ngr_ax(x + A24, max(0, n - A24), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A24, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A24"), max(0, n - get_cell_value("Kalkulation!A24")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A24"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A24") <= n else 0
 
 def fkt_kalkulation_c24():
     x = get_excel_global('x')
@@ -1897,1024 +2009,615 @@ def fkt_kalkulation_c24():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A24_value = get_cell_value("Kalkulation!A24")
-    return act_axn_k(x + A24_value, max(0, n - A24_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A24"), max(0, n - get_cell_value("Kalkulation!A24")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d24():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A24")
-    t_value = t - get_cell_value("Kalkulation!A24")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A24"), max(0, t - get_cell_value("Kalkulation!A24")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e24():
-    B24 = get_cell_value("Kalkulation!B24")
-    D24 = get_cell_value("Kalkulation!D24")
-    C24 = get_cell_value("Kalkulation!C24")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B24 - P_xt * D24 + gamma2 * (C24 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D24)
-    return result
+    return get_cell_value("Kalkulation!B24") - P_xt * get_cell_value("Kalkulation!D24") + gamma2 * (get_cell_value("Kalkulation!C24") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D24"))
 
 def fkt_kalkulation_f24():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E24")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E24")
 
 def fkt_kalkulation_g24():
     gamma3 = get_excel_global('gamma3')
-    B24 = get_cell_value("Kalkulation!B24")
-    C24 = get_cell_value("Kalkulation!C24")
-    return B24 + gamma3 * C24
+    return get_cell_value("Kalkulation!B24") + gamma3 * get_cell_value("Kalkulation!C24")
 
 def fkt_kalkulation_h24():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F24 = get_cell_value("Kalkulation!F24")
-    A24 = get_cell_value("Kalkulation!A24")
-
-    return F24 + alpha * t * BJB * act_axn_k(x + A24, max(5 - A24, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F24") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A24"), max(5 - get_cell_value("Kalkulation!A24"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i24():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A24 = get_cell_value("Kalkulation!A24")
-    return 1 if (x + A24 >= MinAlterFlex and A24 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A24") >= MinAlterFlex, get_cell_value("Kalkulation!A24") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j24():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A24 = get_cell_value("Kalkulation!A24")
-    I24 = get_cell_value("Kalkulation!I24")
-    F24 = get_cell_value("Kalkulation!F24")
-
-    if A24 > n or I24:
-        return 0
-    else:
-        result = VS - F24
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A24") > n, get_cell_value("Kalkulation!I24"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F24"))))
 
 def fkt_kalkulation_k24():
-    h24 = get_cell_value("Kalkulation!H24")
-    j24 = get_cell_value("Kalkulation!J24")
-    return max(0, h24 - j24)
+    return max(0, get_cell_value("Kalkulation!H24") - get_cell_value("Kalkulation!J24"))
 
 def fkt_kalkulation_l24():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A24 = get_cell_value("Kalkulation!A24")
-    H24 = get_cell_value("Kalkulation!H24")
-    G24 = get_cell_value("Kalkulation!G24")
     try:
-        if A24 > n:
-            result = 0
-        elif A24 < t:
-            result = H24 / G24
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A24") > n else get_cell_value("Kalkulation!H24") / get_cell_value("Kalkulation!G24") if get_cell_value("Kalkulation!A24") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b25():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A25 = get_cell_value("Kalkulation!A25")
-
-    if A25 <= n:
-        return act_ngr_ax(x + A25, max(0, n - A25), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A25, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A25"), max(0, n - get_cell_value("Kalkulation!A25")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A25"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A25") <= n else 0
 
 def fkt_kalkulation_c25():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A25_value = get_cell_value("Kalkulation!A25")
-    return act_axn_k(x + A25_value, max(0, n - A25_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A25"), max(0, n - get_cell_value("Kalkulation!A25")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d25():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A25")
-    t_value = t - get_cell_value("Kalkulation!A25")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A25"), max(0, t - get_cell_value("Kalkulation!A25")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e25():
-    B25 = get_cell_value("Kalkulation!B25")
-    D25 = get_cell_value("Kalkulation!D25")
-    C25 = get_cell_value("Kalkulation!C25")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B25 - P_xt * D25 + gamma2 * (C25 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D25)
-    return result
+    return get_cell_value("Kalkulation!B25") - P_xt * get_cell_value("Kalkulation!D25") + gamma2 * (get_cell_value("Kalkulation!C25") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D25"))
 
 def fkt_kalkulation_f25():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E25")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E25")
 
 def fkt_kalkulation_g25():
     gamma3 = get_excel_global('gamma3')
-    B25 = get_cell_value("Kalkulation!B25")
-    C25 = get_cell_value("Kalkulation!C25")
-    return B25 + gamma3 * C25
+    return get_cell_value("Kalkulation!B25") + gamma3 * get_cell_value("Kalkulation!C25")
 
 def fkt_kalkulation_h25():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F25 = get_cell_value("Kalkulation!F25")
-    A25 = get_cell_value("Kalkulation!A25")
-
-    return F25 + alpha * t * BJB * act_axn_k(x + A25, max(5 - A25, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F25") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A25"), max(5 - get_cell_value("Kalkulation!A25"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i25():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A25 = get_cell_value("Kalkulation!A25")
-    return 1 if (x + A25 >= MinAlterFlex and A25 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A25") >= MinAlterFlex, get_cell_value("Kalkulation!A25") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j25():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A25 = get_cell_value("Kalkulation!A25")
-    I25 = get_cell_value("Kalkulation!I25")
-    F25 = get_cell_value("Kalkulation!F25")
-
-    if A25 > n or I25:
-        return 0
-    else:
-        result = VS - F25
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A25") > n, get_cell_value("Kalkulation!I25"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F25"))))
 
 def fkt_kalkulation_k25():
-    h25 = get_cell_value("Kalkulation!H25")
-    j25 = get_cell_value("Kalkulation!J25")
-    return max(0, h25 - j25)
+    return max(0, get_cell_value("Kalkulation!H25") - get_cell_value("Kalkulation!J25"))
 
 def fkt_kalkulation_l25():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A25 = get_cell_value("Kalkulation!A25")
-    H25 = get_cell_value("Kalkulation!H25")
-    G25 = get_cell_value("Kalkulation!G25")
     try:
-        if A25 > n:
-            return 0
-        elif A25 < t:
-            return H25 / G25
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A25") > n else get_cell_value("Kalkulation!H25") / get_cell_value("Kalkulation!G25") if get_cell_value("Kalkulation!A25") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b26():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A26 = get_cell_value("Kalkulation!A26")
-
-    if A26 <= n:
-        return act_ngr_ax(x + A26, max(0, n - A26), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A26, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A26"), max(0, n - get_cell_value("Kalkulation!A26")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A26"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A26") <= n else 0
 
 def fkt_kalkulation_c26():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A26 = get_cell_value("Kalkulation!A26")
-    return act_axn_k(x + A26, max(0, n - A26), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A26"), max(0, n - get_cell_value("Kalkulation!A26")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d26():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = get_cell_value("Kalkulation!D26")
-    a26_value = get_cell_value("Kalkulation!A26")
-    return act_axn_k(x + a26_value, max(0, t - a26_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A26"), max(0, t - get_cell_value("Kalkulation!A26")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e26():
-    B26 = get_cell_value("Kalkulation!B26")
     P_xt = get_excel_global('P_xt')
-    D26 = get_cell_value("Kalkulation!D26")
     gamma2 = get_excel_global('gamma2')
-    C26 = get_cell_value("Kalkulation!C26")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B26 - P_xt * D26 + gamma2 * (C26 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D26)
+    return get_cell_value("Kalkulation!B26") - P_xt * get_cell_value("Kalkulation!D26") + gamma2 * (get_cell_value("Kalkulation!C26") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D26"))
 
 def fkt_kalkulation_f26():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E26")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E26")
 
 def fkt_kalkulation_g26():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B26") + gamma3 * get_cell_value("Kalkulation!C26")
-    return value
+    return get_cell_value("Kalkulation!B26") + gamma3 * get_cell_value("Kalkulation!C26")
 
 def fkt_kalkulation_h26():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F26 = get_cell_value("Kalkulation!F26")
-    A26 = get_cell_value("Kalkulation!A26")
-
-    return F26 + alpha * t * BJB * act_axn_k(x + A26, max(5 - A26, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F26") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A26"), max(5 - get_cell_value("Kalkulation!A26"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i26():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A26 = get_cell_value("Kalkulation!A26")
-    return 1 if (x + A26 >= MinAlterFlex and A26 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A26") >= MinAlterFlex, get_cell_value("Kalkulation!A26") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j26():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A26 = get_cell_value("Kalkulation!A26")
-    I26 = get_cell_value("Kalkulation!I26")
-    F26 = get_cell_value("Kalkulation!F26")
-
-    if A26 > n or I26:
-        return 0
-    else:
-        result = VS - F26
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A26") > n, get_cell_value("Kalkulation!I26"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F26"))))
 
 def fkt_kalkulation_k26():
-    value = get_cell_value("Kalkulation!H26")
-    value2 = get_cell_value("Kalkulation!J26")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H26") - get_cell_value("Kalkulation!J26"))
 
 def fkt_kalkulation_l26():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A26 = get_cell_value("Kalkulation!A26")
-    H26 = get_cell_value("Kalkulation!H26")
-    G26 = get_cell_value("Kalkulation!G26")
     try:
-        if A26 > n:
-            return 0
-        elif A26 < t:
-            return H26 / G26
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A26") > n else get_cell_value("Kalkulation!H26") / get_cell_value("Kalkulation!G26") if get_cell_value("Kalkulation!A26") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b27():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A27 = get_cell_value("Kalkulation!A27")
-
-    if A27 <= n:
-        return act_ngr_ax(x + A27, max(0, n - A27), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A27, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A27"), max(0, n - get_cell_value("Kalkulation!A27")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A27"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A27") <= n else 0
 
 def fkt_kalkulation_c27():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A27 = get_cell_value("Kalkulation!A27")
-    return act_axn_k(x + A27, max(0, n - A27), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A27"), max(0, n - get_cell_value("Kalkulation!A27")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d27():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A27_value = get_cell_value("Kalkulation!A27")
-    return act_axn_k(x + A27_value, max(0, t - A27_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A27"), max(0, t - get_cell_value("Kalkulation!A27")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e27():
-    B27 = get_cell_value("Kalkulation!B27")
-    D27 = get_cell_value("Kalkulation!D27")
-    C27 = get_cell_value("Kalkulation!C27")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B27 - P_xt * D27 + gamma2 * (C27 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D27)
-    return result
+    return get_cell_value("Kalkulation!B27") - P_xt * get_cell_value("Kalkulation!D27") + gamma2 * (get_cell_value("Kalkulation!C27") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D27"))
 
 def fkt_kalkulation_f27():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E27")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E27")
 
 def fkt_kalkulation_g27():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B27") + gamma3 * get_cell_value("Kalkulation!C27")
-    return value
+    return get_cell_value("Kalkulation!B27") + gamma3 * get_cell_value("Kalkulation!C27")
 
 def fkt_kalkulation_h27():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F27 = get_cell_value("Kalkulation!F27")
-    A27 = get_cell_value("Kalkulation!A27")
-
-    return F27 + alpha * t * BJB * act_axn_k(x + A27, max(5 - A27, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F27") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A27"), max(5 - get_cell_value("Kalkulation!A27"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i27():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A27 = get_cell_value("Kalkulation!A27")
-    return 1 if (x + A27 >= MinAlterFlex and A27 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A27") >= MinAlterFlex, get_cell_value("Kalkulation!A27") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j27():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A27 = get_cell_value("Kalkulation!A27")
-    I27 = get_cell_value("Kalkulation!I27")
-    F27 = get_cell_value("Kalkulation!F27")
-
-    if A27 > n or I27:
-        return 0
-    else:
-        inner_value = VS - F27
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A27") > n, get_cell_value("Kalkulation!I27"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F27"))))
 
 def fkt_kalkulation_k27():
-    h27 = get_cell_value("Kalkulation!H27")
-    j27 = get_cell_value("Kalkulation!J27")
-    return max(0, h27 - j27)
+    return max(0, get_cell_value("Kalkulation!H27") - get_cell_value("Kalkulation!J27"))
 
 def fkt_kalkulation_l27():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A27 = get_cell_value("Kalkulation!A27")
-    H27 = get_cell_value("Kalkulation!H27")
-    G27 = get_cell_value("Kalkulation!G27")
     try:
-        if A27 > n:
-            result = 0
-        elif A27 < t:
-            result = H27 / G27
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A27") > n else get_cell_value("Kalkulation!H27") / get_cell_value("Kalkulation!G27") if get_cell_value("Kalkulation!A27") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b28():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A28 = get_cell_value("Kalkulation!A28")
-
-    if A28 <= n:
-        return act_ngr_ax(x + A28, max(0, n - A28), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A28, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A28"), max(0, n - get_cell_value("Kalkulation!A28")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A28"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A28") <= n else 0
 
 def fkt_kalkulation_c28():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A28_value = get_cell_value("Kalkulation!A28")
-    return act_axn_k(x + A28_value, max(0, n - A28_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A28"), max(0, n - get_cell_value("Kalkulation!A28")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d28():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D28")
-    a28_val = get_cell_value("Kalkulation!A28")
-    t_val = get_cell_value("Kalkulation!A28")
-
-    return act_axn_k(x_val + a28_val, max(0, t_val - a28_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A28"), max(0, t - get_cell_value("Kalkulation!A28")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e28():
-    B28 = get_cell_value("Kalkulation!B28")
-    D28 = get_cell_value("Kalkulation!D28")
-    C28 = get_cell_value("Kalkulation!C28")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B28 - P_xt * D28 + gamma2 * (C28 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D28)
+    return get_cell_value("Kalkulation!B28") - P_xt * get_cell_value("Kalkulation!D28") + gamma2 * (get_cell_value("Kalkulation!C28") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D28"))
 
 def fkt_kalkulation_f28():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E28")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E28")
 
 def fkt_kalkulation_g28():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B28") + gamma3 * get_cell_value("Kalkulation!C28")
-    return value
+    return get_cell_value("Kalkulation!B28") + gamma3 * get_cell_value("Kalkulation!C28")
 
 def fkt_kalkulation_h28():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F28 = get_cell_value("Kalkulation!F28")
-    A28 = get_cell_value("Kalkulation!A28")
-
-    result = F28 + alpha * t * BJB * act_axn_k(x + A28, max(5 - A28, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
-    return result
+    return get_cell_value("Kalkulation!F28") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A28"), max(5 - get_cell_value("Kalkulation!A28"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i28():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A28 = get_cell_value("Kalkulation!A28")
-    return 1 if (x + A28 >= MinAlterFlex and A28 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A28") >= MinAlterFlex, get_cell_value("Kalkulation!A28") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j28():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A28 = get_cell_value("Kalkulation!A28")
-    I28 = get_cell_value("Kalkulation!I28")
-    F28 = get_cell_value("Kalkulation!F28")
-    return 0 if (A28 > n) or I28 else min(150, max(50, 0.01 * (VS - F28)))
+    return 0 if any((get_cell_value("Kalkulation!A28") > n, get_cell_value("Kalkulation!I28"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F28"))))
 
 def fkt_kalkulation_k28():
-    h28 = get_cell_value("Kalkulation!H28")
-    j28 = get_cell_value("Kalkulation!J28")
-    return max(0, h28 - j28)
+    return max(0, get_cell_value("Kalkulation!H28") - get_cell_value("Kalkulation!J28"))
 
 def fkt_kalkulation_l28():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A28 = get_cell_value("Kalkulation!A28")
-    H28 = get_cell_value("Kalkulation!H28")
-    G28 = get_cell_value("Kalkulation!G28")
     try:
-        if A28 > n:
-            result = 0
-        else:
-            if A28 < t:
-                result = H28 / G28
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A28") > n else get_cell_value("Kalkulation!H28") / get_cell_value("Kalkulation!G28") if get_cell_value("Kalkulation!A28") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b29():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A29 = get_cell_value("Kalkulation!A29")
-
-    if A29 <= n:
-        return act_ngr_ax(x + A29, max(0, n - A29), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A29, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A29"), max(0, n - get_cell_value("Kalkulation!A29")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A29"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A29") <= n else 0
 
 def fkt_kalkulation_c29():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A29_value = get_cell_value("Kalkulation!A29")
-    return act_axn_k(x + A29_value, max(0, n - A29_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A29"), max(0, n - get_cell_value("Kalkulation!A29")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d29():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A29_value = get_cell_value("Kalkulation!A29")
-    return act_axn_k(x + A29_value, max(0, t - A29_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A29"), max(0, t - get_cell_value("Kalkulation!A29")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e29():
-    B29 = get_cell_value("Kalkulation!B29")
     P_xt = get_excel_global('P_xt')
-    D29 = get_cell_value("Kalkulation!D29")
     gamma2 = get_excel_global('gamma2')
-    C29 = get_cell_value("Kalkulation!C29")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B29 - P_xt * D29 + gamma2 * (C29 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D29)
+    return get_cell_value("Kalkulation!B29") - P_xt * get_cell_value("Kalkulation!D29") + gamma2 * (get_cell_value("Kalkulation!C29") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D29"))
 
 def fkt_kalkulation_f29():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E29")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E29")
 
 def fkt_kalkulation_g29():
     gamma3 = get_excel_global('gamma3')
-    B29 = get_cell_value("Kalkulation!B29")
-    C29 = get_cell_value("Kalkulation!C29")
-    return B29 + gamma3 * C29
+    return get_cell_value("Kalkulation!B29") + gamma3 * get_cell_value("Kalkulation!C29")
 
 def fkt_kalkulation_h29():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F29 = get_cell_value("Kalkulation!F29")
-    A29 = get_cell_value("Kalkulation!A29")
-
-    return F29 + alpha * t * BJB * act_axn_k(x + A29, max(5 - A29, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F29") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A29"), max(5 - get_cell_value("Kalkulation!A29"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i29():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A29 = get_cell_value("Kalkulation!A29")
-    return 1 if (x + A29 >= MinAlterFlex and A29 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A29") >= MinAlterFlex, get_cell_value("Kalkulation!A29") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j29():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A29 = get_cell_value("Kalkulation!A29")
-    I29 = get_cell_value("Kalkulation!I29")
-    F29 = get_cell_value("Kalkulation!F29")
-
-    if A29 > n or I29:
-        return 0
-    else:
-        result = VS - F29
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A29") > n, get_cell_value("Kalkulation!I29"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F29"))))
 
 def fkt_kalkulation_k29():
-    H29 = get_cell_value("Kalkulation!H29")
-    J29 = get_cell_value("Kalkulation!J29")
-    return max(0, H29 - J29)
+    return max(0, get_cell_value("Kalkulation!H29") - get_cell_value("Kalkulation!J29"))
 
 def fkt_kalkulation_l29():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A29 = get_cell_value("Kalkulation!A29")
-    H29 = get_cell_value("Kalkulation!H29")
-    G29 = get_cell_value("Kalkulation!G29")
     try:
-        if A29 > n:
-            result = 0
-        elif A29 < t:
-            result = H29 / G29
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A29") > n else get_cell_value("Kalkulation!H29") / get_cell_value("Kalkulation!G29") if get_cell_value("Kalkulation!A29") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b30():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A30 = get_cell_value("Kalkulation!A30")
-
-    if A30 <= n:
-        return act_ngr_ax(x + A30, max(0, n - A30), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A30, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A30"), max(0, n - get_cell_value("Kalkulation!A30")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A30"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A30") <= n else 0
 
 def fkt_kalkulation_c30():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A30_value = get_cell_value("Kalkulation!A30")
-    return act_axn_k(x + A30_value, max(0, n - A30_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A30"), max(0, n - get_cell_value("Kalkulation!A30")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d30():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D30")
-    a30_val = get_cell_value("Kalkulation!A30")
-    t_val = get_cell_value("Kalkulation!A30")
-
-    return act_axn_k(x_val + a30_val, max(0, t_val - a30_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A30"), max(0, t - get_cell_value("Kalkulation!A30")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e30():
-    B30 = get_cell_value("Kalkulation!B30")
-    D30 = get_cell_value("Kalkulation!D30")
-    C30 = get_cell_value("Kalkulation!C30")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B30 - P_xt * D30 + gamma2 * (C30 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D30)
+    return get_cell_value("Kalkulation!B30") - P_xt * get_cell_value("Kalkulation!D30") + gamma2 * (get_cell_value("Kalkulation!C30") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D30"))
 
 def fkt_kalkulation_f30():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E30")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E30")
 
 def fkt_kalkulation_g30():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B30") + gamma3 * get_cell_value("Kalkulation!C30")
-    return value
+    return get_cell_value("Kalkulation!B30") + gamma3 * get_cell_value("Kalkulation!C30")
 
 def fkt_kalkulation_h30():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F30 = get_cell_value("Kalkulation!F30")
-    A30 = get_cell_value("Kalkulation!A30")
-
-    return F30 + alpha * t * BJB * act_axn_k(x + A30, max(5 - A30, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F30") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A30"), max(5 - get_cell_value("Kalkulation!A30"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i30():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A30 = get_cell_value("Kalkulation!A30")
-    return 1 if (x + A30 >= MinAlterFlex and A30 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A30") >= MinAlterFlex, get_cell_value("Kalkulation!A30") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j30():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A30 = get_cell_value("Kalkulation!A30")
-    I30 = get_cell_value("Kalkulation!I30")
-    F30 = get_cell_value("Kalkulation!F30")
-    return 0 if (A30 > n) or I30 else min(150, max(50, 0.01 * (VS - F30)))
+    return 0 if any((get_cell_value("Kalkulation!A30") > n, get_cell_value("Kalkulation!I30"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F30"))))
 
 def fkt_kalkulation_k30():
-    H30 = get_cell_value("Kalkulation!H30")
-    J30 = get_cell_value("Kalkulation!J30")
-    return max(0, H30 - J30)
+    return max(0, get_cell_value("Kalkulation!H30") - get_cell_value("Kalkulation!J30"))
 
 def fkt_kalkulation_l30():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A30 = get_cell_value("Kalkulation!A30")
-    H30 = get_cell_value("Kalkulation!H30")
-    G30 = get_cell_value("Kalkulation!G30")
     try:
-        if A30 > n:
-            result = 0
-        elif A30 < t:
-            result = H30 / G30
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A30") > n else get_cell_value("Kalkulation!H30") / get_cell_value("Kalkulation!G30") if get_cell_value("Kalkulation!A30") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b31():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A31 = get_cell_value("Kalkulation!A31")
-    result = 0
-    if A31 <= n:
-        term1 = act_ngr_ax(x + A31, max(0, n - A31), Sex, Tafel, Zins)
-        term2 = act_dx(x + n, Sex, Tafel, Zins)
-        term3 = act_dx(x + A31, Sex, Tafel, Zins)
-        result = term1 + (term2 / term3)
-    return result
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A31"), max(0, n - get_cell_value("Kalkulation!A31")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A31"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A31") <= n else 0
 
 def fkt_kalkulation_c31():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!C31")
-    a31_val = get_cell_value("Kalkulation!A31")
-    return act_axn_k(x_val + a31_val, max(0, n - a31_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A31"), max(0, n - get_cell_value("Kalkulation!A31")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d31():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A31")
-    t_value = t - get_cell_value("Kalkulation!A31")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A31"), max(0, t - get_cell_value("Kalkulation!A31")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e31():
-    B31 = get_cell_value("Kalkulation!B31")
     P_xt = get_excel_global('P_xt')
-    D31 = get_cell_value("Kalkulation!D31")
     gamma2 = get_excel_global('gamma2')
-    C31 = get_cell_value("Kalkulation!C31")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B31 - P_xt * D31 + gamma2 * (C31 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D31)
+    return get_cell_value("Kalkulation!B31") - P_xt * get_cell_value("Kalkulation!D31") + gamma2 * (get_cell_value("Kalkulation!C31") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D31"))
 
 def fkt_kalkulation_f31():
     VS = get_excel_global('VS')
-    E31 = get_cell_value("Kalkulation!E31")
-    return VS * E31
+    return VS * get_cell_value("Kalkulation!E31")
 
 def fkt_kalkulation_g31():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B31") + gamma3 * get_cell_value("Kalkulation!C31")
-    return value
+    return get_cell_value("Kalkulation!B31") + gamma3 * get_cell_value("Kalkulation!C31")
 
 def fkt_kalkulation_h31():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F31 = get_cell_value("Kalkulation!F31")
-    A31 = get_cell_value("Kalkulation!A31")
-
-    return F31 + alpha * t * BJB * act_axn_k(x + A31, max(5 - A31, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F31") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A31"), max(5 - get_cell_value("Kalkulation!A31"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i31():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A31 = get_cell_value("Kalkulation!A31")
-    return 1 if (x + A31 >= MinAlterFlex and A31 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A31") >= MinAlterFlex, get_cell_value("Kalkulation!A31") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j31():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A31 = get_cell_value("Kalkulation!A31")
-    I31 = get_cell_value("Kalkulation!I31")
-    F31 = get_cell_value("Kalkulation!F31")
-
-    if A31 > n or I31:
-        return 0
-    else:
-        inner_value = VS - F31
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A31") > n, get_cell_value("Kalkulation!I31"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F31"))))
 
 def fkt_kalkulation_k31():
-    value = get_cell_value("Kalkulation!H31")
-    value2 = get_cell_value("Kalkulation!J31")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H31") - get_cell_value("Kalkulation!J31"))
 
 def fkt_kalkulation_l31():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A31 = get_cell_value("Kalkulation!A31")
-    H31 = get_cell_value("Kalkulation!H31")
-    G31 = get_cell_value("Kalkulation!G31")
     try:
-        if A31 > n:
-            return 0
-        elif A31 < t:
-            return H31 / G31
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A31") > n else get_cell_value("Kalkulation!H31") / get_cell_value("Kalkulation!G31") if get_cell_value("Kalkulation!A31") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b32():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A32 = get_cell_value("Kalkulation!A32")
-
-    if A32 <= n:
-        return act_ngr_ax(x + A32, max(0, n - A32), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A32, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A32"), max(0, n - get_cell_value("Kalkulation!A32")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A32"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A32") <= n else 0
 
 def fkt_kalkulation_c32():
     x = get_excel_global('x')
@@ -2922,129 +2625,76 @@ def fkt_kalkulation_c32():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A32_value = get_cell_value("Kalkulation!A32")
-    return act_axn_k(x + A32_value, max(0, n - A32_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A32"), max(0, n - get_cell_value("Kalkulation!A32")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d32():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D32")
-    a32_val = get_cell_value("Kalkulation!A32")
-    t_val = get_cell_value("Kalkulation!A32")
-
-    return act_axn_k(x_val + a32_val, max(0, t_val - a32_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A32"), max(0, t - get_cell_value("Kalkulation!A32")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e32():
-    B32 = get_cell_value("Kalkulation!B32")
-    D32 = get_cell_value("Kalkulation!D32")
-    C32 = get_cell_value("Kalkulation!C32")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B32 - P_xt * D32 + gamma2 * (C32 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D32)
-    return result
+    return get_cell_value("Kalkulation!B32") - P_xt * get_cell_value("Kalkulation!D32") + gamma2 * (get_cell_value("Kalkulation!C32") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D32"))
 
 def fkt_kalkulation_f32():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E32")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E32")
 
 def fkt_kalkulation_g32():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B32") + gamma3 * get_cell_value("Kalkulation!C32")
-    return value
+    return get_cell_value("Kalkulation!B32") + gamma3 * get_cell_value("Kalkulation!C32")
 
 def fkt_kalkulation_h32():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F32 = get_cell_value("Kalkulation!F32")
-    A32 = get_cell_value("Kalkulation!A32")
-
-    return F32 + alpha * t * BJB * act_axn_k(x + A32, max(5 - A32, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F32") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A32"), max(5 - get_cell_value("Kalkulation!A32"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i32():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A32 = get_cell_value("Kalkulation!A32")
-    return 1 if (x + A32 >= MinAlterFlex and A32 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A32") >= MinAlterFlex, get_cell_value("Kalkulation!A32") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j32():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A32_value = get_cell_value("Kalkulation!A32")
-    I32_value = get_cell_value("Kalkulation!I32")
-    F32_value = get_cell_value("Kalkulation!F32")
-
-    if A32_value > n or I32_value:
-        return 0
-    else:
-        result = VS - F32_value
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A32") > n, get_cell_value("Kalkulation!I32"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F32"))))
 
 def fkt_kalkulation_k32():
-    H32 = get_cell_value("Kalkulation!H32")
-    J32 = get_cell_value("Kalkulation!J32")
-    return max(0, H32 - J32)
+    return max(0, get_cell_value("Kalkulation!H32") - get_cell_value("Kalkulation!J32"))
 
 def fkt_kalkulation_l32():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A32 = get_cell_value("Kalkulation!A32")
-    H32 = get_cell_value("Kalkulation!H32")
-    G32 = get_cell_value("Kalkulation!G32")
     try:
-        if A32 > n:
-            result = 0
-        elif A32 < t:
-            result = H32 / G32
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A32") > n else get_cell_value("Kalkulation!H32") / get_cell_value("Kalkulation!G32") if get_cell_value("Kalkulation!A32") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b33():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A33 = get_cell_value("Kalkulation!A33")
-
-    if A33 <= n:
-        return act_ngr_ax(x + A33, max(0, n - A33), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A33, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A33"), max(0, n - get_cell_value("Kalkulation!A33")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A33"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A33") <= n else 0
 
 def fkt_kalkulation_c33():
     x = get_excel_global('x')
@@ -3052,129 +2702,76 @@ def fkt_kalkulation_c33():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A33_value = get_cell_value("Kalkulation!A33")
-    return act_axn_k(x + A33_value, max(0, n - A33_value), Sex, Tafel, Zins, 1)
-
-def fkt_kalkulation_d33():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    return act_axn_k(x + get_cell_value("Kalkulation!A33"), max(0, n - get_cell_value("Kalkulation!A33")), Sex, Tafel, Zins, 1)
+
+def fkt_kalkulation_d33():
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D33")
-    a33_val = get_cell_value("Kalkulation!A33")
-    t_val = get_cell_value("Kalkulation!A33")
-
-    return act_axn_k(x_val + a33_val, max(0, t_val - a33_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A33"), max(0, t - get_cell_value("Kalkulation!A33")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e33():
-    B33 = get_cell_value("Kalkulation!B33")
     P_xt = get_excel_global('P_xt')
-    D33 = get_cell_value("Kalkulation!D33")
     gamma2 = get_excel_global('gamma2')
-    C33 = get_cell_value("Kalkulation!C33")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B33 - P_xt * D33 + gamma2 * (C33 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D33)
-    return result
+    return get_cell_value("Kalkulation!B33") - P_xt * get_cell_value("Kalkulation!D33") + gamma2 * (get_cell_value("Kalkulation!C33") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D33"))
 
 def fkt_kalkulation_f33():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E33")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E33")
 
 def fkt_kalkulation_g33():
     gamma3 = get_excel_global('gamma3')
-    B33 = get_cell_value("Kalkulation!B33")
-    C33 = get_cell_value("Kalkulation!C33")
-    return B33 + gamma3 * C33
+    return get_cell_value("Kalkulation!B33") + gamma3 * get_cell_value("Kalkulation!C33")
 
 def fkt_kalkulation_h33():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F33 = get_cell_value("Kalkulation!F33")
-    A33 = get_cell_value("Kalkulation!A33")
-
-    return F33 + alpha * t * BJB * act_axn_k(x + A33, max(5 - A33, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F33") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A33"), max(5 - get_cell_value("Kalkulation!A33"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i33():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A33 = get_cell_value("Kalkulation!A33")
-    return 1 if (x + A33 >= MinAlterFlex and A33 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A33") >= MinAlterFlex, get_cell_value("Kalkulation!A33") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j33():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A33 = get_cell_value("Kalkulation!A33")
-    I33 = get_cell_value("Kalkulation!I33")
-    F33 = get_cell_value("Kalkulation!F33")
-
-    if A33 > n or I33:
-        return 0
-    else:
-        result = VS - F33
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A33") > n, get_cell_value("Kalkulation!I33"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F33"))))
 
 def fkt_kalkulation_k33():
-    h33 = get_cell_value("Kalkulation!H33")
-    j33 = get_cell_value("Kalkulation!J33")
-    return max(0, h33 - j33)
+    return max(0, get_cell_value("Kalkulation!H33") - get_cell_value("Kalkulation!J33"))
 
 def fkt_kalkulation_l33():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A33 = get_cell_value("Kalkulation!A33")
-    H33 = get_cell_value("Kalkulation!H33")
-    G33 = get_cell_value("Kalkulation!G33")
     try:
-        if A33 > n:
-            return 0
-        elif A33 < t:
-            return H33 / G33
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A33") > n else get_cell_value("Kalkulation!H33") / get_cell_value("Kalkulation!G33") if get_cell_value("Kalkulation!A33") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b34():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A34 = get_cell_value("Kalkulation!A34")
-
-    if A34 <= n:
-        return act_ngr_ax(x + A34, max(0, n - A34), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A34, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A34"), max(0, n - get_cell_value("Kalkulation!A34")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A34"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A34") <= n else 0
 
 def fkt_kalkulation_c34():
     x = get_excel_global('x')
@@ -3182,374 +2779,230 @@ def fkt_kalkulation_c34():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A34_value = get_cell_value("Kalkulation!A34")
-    return act_axn_k(x + A34_value, max(0, n - A34_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A34"), max(0, n - get_cell_value("Kalkulation!A34")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d34():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A34")
-    t_value = t - get_cell_value("Kalkulation!A34")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A34"), max(0, t - get_cell_value("Kalkulation!A34")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e34():
-    B34 = get_cell_value("Kalkulation!B34")
-    D34 = get_cell_value("Kalkulation!D34")
-    C34 = get_cell_value("Kalkulation!C34")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B34 - P_xt * D34 + gamma2 * (C34 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D34)
+    return get_cell_value("Kalkulation!B34") - P_xt * get_cell_value("Kalkulation!D34") + gamma2 * (get_cell_value("Kalkulation!C34") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D34"))
 
 def fkt_kalkulation_f34():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E34")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E34")
 
 def fkt_kalkulation_g34():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B34") + gamma3 * get_cell_value("Kalkulation!C34")
-    return value
+    return get_cell_value("Kalkulation!B34") + gamma3 * get_cell_value("Kalkulation!C34")
 
 def fkt_kalkulation_h34():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F34 = get_cell_value("Kalkulation!F34")
-    A34 = get_cell_value("Kalkulation!A34")
-
-    return F34 + alpha * t * BJB * act_axn_k(x + A34, max(5 - A34, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F34") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A34"), max(5 - get_cell_value("Kalkulation!A34"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i34():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A34 = get_cell_value("Kalkulation!A34")
-    return 1 if (x + A34 >= MinAlterFlex and A34 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A34") >= MinAlterFlex, get_cell_value("Kalkulation!A34") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j34():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A34 = get_cell_value("Kalkulation!A34")
-    I34 = get_cell_value("Kalkulation!I34")
-    F34 = get_cell_value("Kalkulation!F34")
-
-    if A34 > n or I34:
-        return 0
-    else:
-        inner_value = VS - F34
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A34") > n, get_cell_value("Kalkulation!I34"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F34"))))
 
 def fkt_kalkulation_k34():
-    value = get_cell_value("Kalkulation!H34")
-    value2 = get_cell_value("Kalkulation!J34")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H34") - get_cell_value("Kalkulation!J34"))
 
 def fkt_kalkulation_l34():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A34 = get_cell_value("Kalkulation!A34")
-    H34 = get_cell_value("Kalkulation!H34")
-    G34 = get_cell_value("Kalkulation!G34")
     try:
-        if A34 > n:
-            return 0
-        elif A34 < t:
-            return H34 / G34
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A34") > n else get_cell_value("Kalkulation!H34") / get_cell_value("Kalkulation!G34") if get_cell_value("Kalkulation!A34") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b35():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A35 = get_cell_value("Kalkulation!A35")
-    result = act_ngr_ax(x + A35, max(0, n - A35), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A35, Sex, Tafel, Zins) if A35 <= n else 0
-    return result
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A35"), max(0, n - get_cell_value("Kalkulation!A35")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A35"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A35") <= n else 0
 
 def fkt_kalkulation_c35():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!C35")
-    a35_val = get_cell_value("Kalkulation!A35")
-    return act_axn_k(x_val + a35_val, max(0, n - a35_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A35"), max(0, n - get_cell_value("Kalkulation!A35")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d35():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D35")
-    a35_val = get_cell_value("Kalkulation!A35")
-    t_val = get_cell_value("Kalkulation!A35")
-
-    return act_axn_k(x_val + a35_val, max(0, t_val - a35_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A35"), max(0, t - get_cell_value("Kalkulation!A35")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e35():
-    B35 = get_cell_value("Kalkulation!B35")
-    D35 = get_cell_value("Kalkulation!D35")
-    C35 = get_cell_value("Kalkulation!C35")
+    P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-    P_xt = get_excel_global('P_xt')
-    gamma2 = get_excel_global('gamma2')
-
-    return B35 - P_xt * D35 + gamma2 * (C35 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D35)
+    return get_cell_value("Kalkulation!B35") - P_xt * get_cell_value("Kalkulation!D35") + gamma2 * (get_cell_value("Kalkulation!C35") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D35"))
 
 def fkt_kalkulation_f35():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E35")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E35")
 
 def fkt_kalkulation_g35():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B35") + gamma3 * get_cell_value("Kalkulation!C35")
-    return value
+    return get_cell_value("Kalkulation!B35") + gamma3 * get_cell_value("Kalkulation!C35")
 
 def fkt_kalkulation_h35():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F35 = get_cell_value("Kalkulation!F35")
-    A35 = get_cell_value("Kalkulation!A35")
-
-    return F35 + alpha * t * BJB * act_axn_k(x + A35, max(5 - A35, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F35") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A35"), max(5 - get_cell_value("Kalkulation!A35"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i35():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A35 = get_cell_value("Kalkulation!A35")
-    return 1 if (x + A35 >= MinAlterFlex and A35 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A35") >= MinAlterFlex, get_cell_value("Kalkulation!A35") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j35():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A35 = get_cell_value("Kalkulation!A35")
-    I35 = get_cell_value("Kalkulation!I35")
-    F35 = get_cell_value("Kalkulation!F35")
-
-    if A35 > n or I35:
-        return 0
-    else:
-        result = VS - F35
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A35") > n, get_cell_value("Kalkulation!I35"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F35"))))
 
 def fkt_kalkulation_k35():
-    H35 = get_cell_value("Kalkulation!H35")
-    J35 = get_cell_value("Kalkulation!J35")
-    return max(0, H35 - J35)
+    return max(0, get_cell_value("Kalkulation!H35") - get_cell_value("Kalkulation!J35"))
 
 def fkt_kalkulation_l35():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A35 = get_cell_value("Kalkulation!A35")
-    H35 = get_cell_value("Kalkulation!H35")
-    G35 = get_cell_value("Kalkulation!G35")
     try:
-        if A35 > n:
-            return 0
-        elif A35 < t:
-            return H35 / G35
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A35") > n else get_cell_value("Kalkulation!H35") / get_cell_value("Kalkulation!G35") if get_cell_value("Kalkulation!A35") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b36():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A36 = get_cell_value("Kalkulation!A36")
-    return act_ngr_ax(x + A36, max(0, n - A36), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A36, Sex, Tafel, Zins) if A36 <= n else 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A36"), max(0, n - get_cell_value("Kalkulation!A36")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A36"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A36") <= n else 0
 
 def fkt_kalkulation_c36():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A36_value = get_cell_value("Kalkulation!A36")
-    return act_axn_k(x + A36_value, max(0, n - A36_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A36"), max(0, n - get_cell_value("Kalkulation!A36")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d36():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A36")
-    t_value = t - get_cell_value("Kalkulation!A36")
-    max_value = max(0, t_value)
-
-    return act_axn_k(alter=x_value, n=max_value, sex=Sex, tafel=Tafel, zins=Zins, k=1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A36"), max(0, t - get_cell_value("Kalkulation!A36")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e36():
-    B36 = get_cell_value("Kalkulation!B36")
-    D36 = get_cell_value("Kalkulation!D36")
-    C36 = get_cell_value("Kalkulation!C36")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B36 - P_xt * D36 + gamma2 * (C36 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D36)
+    return get_cell_value("Kalkulation!B36") - P_xt * get_cell_value("Kalkulation!D36") + gamma2 * (get_cell_value("Kalkulation!C36") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D36"))
 
 def fkt_kalkulation_f36():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E36")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E36")
 
 def fkt_kalkulation_g36():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B36") + gamma3 * get_cell_value("Kalkulation!C36")
-    return value
+    return get_cell_value("Kalkulation!B36") + gamma3 * get_cell_value("Kalkulation!C36")
 
 def fkt_kalkulation_h36():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F36 = get_cell_value("Kalkulation!F36")
-    A36 = get_cell_value("Kalkulation!A36")
-
-    return F36 + alpha * t * BJB * act_axn_k(x + A36, max(5 - A36, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F36") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A36"), max(5 - get_cell_value("Kalkulation!A36"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i36():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A36 = get_cell_value("Kalkulation!A36")
-    return 1 if (x + A36 >= MinAlterFlex and A36 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A36") >= MinAlterFlex, get_cell_value("Kalkulation!A36") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j36():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A36 = get_cell_value("Kalkulation!A36")
-    I36 = get_cell_value("Kalkulation!I36")
-    F36 = get_cell_value("Kalkulation!F36")
-    if A36 > n or I36:
-        return 0
-    else:
-        inner_value = VS - F36
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A36") > n, get_cell_value("Kalkulation!I36"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F36"))))
 
 def fkt_kalkulation_k36():
-    H36 = get_cell_value("Kalkulation!H36")
-    J36 = get_cell_value("Kalkulation!J36")
-    return max(0, H36 - J36)
+    return max(0, get_cell_value("Kalkulation!H36") - get_cell_value("Kalkulation!J36"))
 
 def fkt_kalkulation_l36():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A36 = get_cell_value("Kalkulation!A36")
-    H36 = get_cell_value("Kalkulation!H36")
-    G36 = get_cell_value("Kalkulation!G36")
     try:
-        if A36 > n:
-            result = 0
-        else:
-            if A36 < t:
-                result = H36 / G36
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A36") > n else get_cell_value("Kalkulation!H36") / get_cell_value("Kalkulation!G36") if get_cell_value("Kalkulation!A36") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b37():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A37 = get_cell_value("Kalkulation!A37")
-    if A37 <= n:
-        return act_ngr_ax(x + A37, max(0, n - A37), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A37, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A37"), max(0, n - get_cell_value("Kalkulation!A37")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A37"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A37") <= n else 0
 
 def fkt_kalkulation_c37():
     x = get_excel_global('x')
@@ -3557,125 +3010,76 @@ def fkt_kalkulation_c37():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A37_value = get_cell_value("Kalkulation!A37")
-    return act_axn_k(x + A37_value, max(0, n - A37_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A37"), max(0, n - get_cell_value("Kalkulation!A37")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d37():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A37_value = get_cell_value("Kalkulation!A37")
-    return act_axn_k(x + A37_value, max(0, t - A37_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A37"), max(0, t - get_cell_value("Kalkulation!A37")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e37():
-    B37 = get_cell_value("Kalkulation!B37")
     P_xt = get_excel_global('P_xt')
-    D37 = get_cell_value("Kalkulation!D37")
     gamma2 = get_excel_global('gamma2')
-    C37 = get_cell_value("Kalkulation!C37")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B37 - P_xt * D37 + gamma2 * (C37 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D37)
+    return get_cell_value("Kalkulation!B37") - P_xt * get_cell_value("Kalkulation!D37") + gamma2 * (get_cell_value("Kalkulation!C37") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D37"))
 
 def fkt_kalkulation_f37():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E37")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E37")
 
 def fkt_kalkulation_g37():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B37") + gamma3 * get_cell_value("Kalkulation!C37")
-    return value
+    return get_cell_value("Kalkulation!B37") + gamma3 * get_cell_value("Kalkulation!C37")
 
 def fkt_kalkulation_h37():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F37 = get_cell_value("Kalkulation!F37")
-    A37 = get_cell_value("Kalkulation!A37")
-
-    result = F37 + alpha * t * BJB * act_axn_k(x + A37, max(5 - A37, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
-    return result
+    return get_cell_value("Kalkulation!F37") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A37"), max(5 - get_cell_value("Kalkulation!A37"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i37():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A37 = get_cell_value("Kalkulation!A37")
-    return 1 if (x + A37 >= MinAlterFlex and A37 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A37") >= MinAlterFlex, get_cell_value("Kalkulation!A37") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j37():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A37 = get_cell_value("Kalkulation!A37")
-    I37 = get_cell_value("Kalkulation!I37")
-    F37 = get_cell_value("Kalkulation!F37")
-
-    if A37 > n or I37:
-        return 0
-    else:
-        inner_value = VS - F37
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A37") > n, get_cell_value("Kalkulation!I37"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F37"))))
 
 def fkt_kalkulation_k37():
-    H37 = get_cell_value("Kalkulation!H37")
-    J37 = get_cell_value("Kalkulation!J37")
-    return max(0, H37 - J37)
+    return max(0, get_cell_value("Kalkulation!H37") - get_cell_value("Kalkulation!J37"))
 
 def fkt_kalkulation_l37():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A37 = get_cell_value("Kalkulation!A37")
-    H37 = get_cell_value("Kalkulation!H37")
-    G37 = get_cell_value("Kalkulation!G37")
     try:
-        if A37 > n:
-            result = 0
-        else:
-            if A37 < t:
-                result = H37 / G37
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A37") > n else get_cell_value("Kalkulation!H37") / get_cell_value("Kalkulation!G37") if get_cell_value("Kalkulation!A37") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b38():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A38 = get_cell_value("Kalkulation!A38")
-
-    if A38 <= n:
-        return act_ngr_ax(x + A38, max(0, n - A38), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A38, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A38"), max(0, n - get_cell_value("Kalkulation!A38")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A38"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A38") <= n else 0
 
 def fkt_kalkulation_c38():
     x = get_excel_global('x')
@@ -3683,9 +3087,7 @@ def fkt_kalkulation_c38():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A38_value = get_cell_value("Kalkulation!A38")
-    return act_axn_k(x + A38_value, max(0, n - A38_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A38"), max(0, n - get_cell_value("Kalkulation!A38")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d38():
     x = get_excel_global('x')
@@ -3693,108 +3095,68 @@ def fkt_kalkulation_d38():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A38_value = get_cell_value("Kalkulation!A38")
-    return act_axn_k(x + A38_value, max(0, t - A38_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A38"), max(0, t - get_cell_value("Kalkulation!A38")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e38():
-    B38 = get_cell_value("Kalkulation!B38")
-    D38 = get_cell_value("Kalkulation!D38")
-    C38 = get_cell_value("Kalkulation!C38")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    term1 = B38 - P_xt * D38
-    term2 = gamma2 * (C38 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D38)
-    return term1 + term2
+    return get_cell_value("Kalkulation!B38") - P_xt * get_cell_value("Kalkulation!D38") + gamma2 * (get_cell_value("Kalkulation!C38") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D38"))
 
 def fkt_kalkulation_f38():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E38")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E38")
 
 def fkt_kalkulation_g38():
     gamma3 = get_excel_global('gamma3')
-    b38 = get_cell_value("Kalkulation!B38")
-    c38 = get_cell_value("Kalkulation!C38")
-    return b38 + gamma3 * c38
+    return get_cell_value("Kalkulation!B38") + gamma3 * get_cell_value("Kalkulation!C38")
 
 def fkt_kalkulation_h38():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F38 = get_cell_value("Kalkulation!F38")
-    A38 = get_cell_value("Kalkulation!A38")
-
-    return F38 + alpha * t * BJB * act_axn_k(x + A38, max(5 - A38, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F38") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A38"), max(5 - get_cell_value("Kalkulation!A38"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i38():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A38 = get_cell_value("Kalkulation!A38")
-    return 1 if (x + A38 >= MinAlterFlex and A38 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A38") >= MinAlterFlex, get_cell_value("Kalkulation!A38") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j38():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A38 = get_cell_value("Kalkulation!A38")
-    I38 = get_cell_value("Kalkulation!I38")
-    F38 = get_cell_value("Kalkulation!F38")
-
-    if A38 > n or I38:
-        return 0
-    else:
-        inner_value = VS - F38
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A38") > n, get_cell_value("Kalkulation!I38"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F38"))))
 
 def fkt_kalkulation_k38():
-    H38 = get_cell_value("Kalkulation!H38")
-    J38 = get_cell_value("Kalkulation!J38")
-    return max(0, H38 - J38)
+    return max(0, get_cell_value("Kalkulation!H38") - get_cell_value("Kalkulation!J38"))
 
 def fkt_kalkulation_l38():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A38 = get_cell_value("Kalkulation!A38")
-    H38 = get_cell_value("Kalkulation!H38")
-    G38 = get_cell_value("Kalkulation!G38")
     try:
-        if A38 > n:
-            return 0
-        elif A38 < t:
-            return H38 / G38
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A38") > n else get_cell_value("Kalkulation!H38") / get_cell_value("Kalkulation!G38") if get_cell_value("Kalkulation!A38") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b39():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A39 = get_cell_value("Kalkulation!A39")
-    return act_ngr_ax(x + A39, max(0, n - A39), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A39, Sex, Tafel, Zins) if A39 <= n else 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A39"), max(0, n - get_cell_value("Kalkulation!A39")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A39"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A39") <= n else 0
 
 def fkt_kalkulation_c39():
     x = get_excel_global('x')
@@ -3802,9 +3164,7 @@ def fkt_kalkulation_c39():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A39_value = get_cell_value("Kalkulation!A39")
-    return act_axn_k(x + A39_value, max(0, n - A39_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A39"), max(0, n - get_cell_value("Kalkulation!A39")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d39():
     x = get_excel_global('x')
@@ -3812,242 +3172,145 @@ def fkt_kalkulation_d39():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A39_value = get_cell_value("Kalkulation!A39")
-    return act_axn_k(x + A39_value, max(0, t - A39_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A39"), max(0, t - get_cell_value("Kalkulation!A39")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e39():
+    P_xt = get_excel_global('P_xt')
     gamma2 = get_excel_global('gamma2')
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
-    P_xt = get_excel_global('P_xt')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    B39 = get_cell_value("Kalkulation!B39")
-    D39 = get_cell_value("Kalkulation!D39")
-    C39 = get_cell_value("Kalkulation!C39")
-
-    result = B39 - P_xt * D39 + gamma2 * (C39 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D39)
-    return result
+    t = get_excel_global('t')
+    return get_cell_value("Kalkulation!B39") - P_xt * get_cell_value("Kalkulation!D39") + gamma2 * (get_cell_value("Kalkulation!C39") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D39"))
 
 def fkt_kalkulation_f39():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E39")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E39")
 
 def fkt_kalkulation_g39():
     gamma3 = get_excel_global('gamma3')
-    b39 = get_cell_value("Kalkulation!B39")
-    c39 = get_cell_value("Kalkulation!C39")
-    return b39 + gamma3 * c39
+    return get_cell_value("Kalkulation!B39") + gamma3 * get_cell_value("Kalkulation!C39")
 
 def fkt_kalkulation_h39():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F39 = get_cell_value("Kalkulation!F39")
-    A39 = get_cell_value("Kalkulation!A39")
-
-    return F39 + alpha * t * BJB * act_axn_k(x + A39, max(5 - A39, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F39") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A39"), max(5 - get_cell_value("Kalkulation!A39"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i39():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A39 = get_cell_value("Kalkulation!A39")
-    return 1 if (x + A39 >= MinAlterFlex and A39 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A39") >= MinAlterFlex, get_cell_value("Kalkulation!A39") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j39():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A39 = get_cell_value("Kalkulation!A39")
-    I39 = get_cell_value("Kalkulation!I39")
-    F39 = get_cell_value("Kalkulation!F39")
-
-    if A39 > n or I39:
-        return 0
-    else:
-        inner_value = VS - F39
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A39") > n, get_cell_value("Kalkulation!I39"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F39"))))
 
 def fkt_kalkulation_k39():
-    H39 = get_cell_value("Kalkulation!H39")
-    J39 = get_cell_value("Kalkulation!J39")
-    return max(0, H39 - J39)
+    return max(0, get_cell_value("Kalkulation!H39") - get_cell_value("Kalkulation!J39"))
 
 def fkt_kalkulation_l39():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A39 = get_cell_value("Kalkulation!A39")
-    H39 = get_cell_value("Kalkulation!H39")
-    G39 = get_cell_value("Kalkulation!G39")
     try:
-        if A39 > n:
-            result = 0
-        else:
-            if A39 < t:
-                result = H39 / G39
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A39") > n else get_cell_value("Kalkulation!H39") / get_cell_value("Kalkulation!G39") if get_cell_value("Kalkulation!A39") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b40():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A40 = get_cell_value("Kalkulation!A40")
-    return act_ngr_ax(x + A40, max(0, n - A40), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A40, Sex, Tafel, Zins) if A40 <= n else 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A40"), max(0, n - get_cell_value("Kalkulation!A40")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A40"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A40") <= n else 0
 
 def fkt_kalkulation_c40():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A40_value = get_cell_value("Kalkulation!A40")
-    return act_axn_k(x + A40_value, max(0, n - A40_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A40"), max(0, n - get_cell_value("Kalkulation!A40")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d40():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
-    Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A40")
-    t_value = t - get_cell_value("Kalkulation!A40")
-    max_value = max(0, t_value)
-
-    return act_axn_k(alter=x_value, n=max_value, sex=Sex, tafel=Tafel, zins=Zins, k=1)
+    Zins = get_excel_global('Zins')
+    return act_axn_k(x + get_cell_value("Kalkulation!A40"), max(0, t - get_cell_value("Kalkulation!A40")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e40():
+    P_xt = get_excel_global('P_xt')
     gamma2 = get_excel_global('gamma2')
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
-    P_xt = get_excel_global('P_xt')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    B40 = get_cell_value("Kalkulation!B40")
-    D40 = get_cell_value("Kalkulation!D40")
-    C40 = get_cell_value("Kalkulation!C40")
-
-    return B40 - P_xt * D40 + gamma2 * (C40 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D40)
+    t = get_excel_global('t')
+    return get_cell_value("Kalkulation!B40") - P_xt * get_cell_value("Kalkulation!D40") + gamma2 * (get_cell_value("Kalkulation!C40") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D40"))
 
 def fkt_kalkulation_f40():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E40")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E40")
 
 def fkt_kalkulation_g40():
     gamma3 = get_excel_global('gamma3')
-    B40 = get_cell_value("Kalkulation!B40")
-    C40 = get_cell_value("Kalkulation!C40")
-    return B40 + gamma3 * C40
+    return get_cell_value("Kalkulation!B40") + gamma3 * get_cell_value("Kalkulation!C40")
 
 def fkt_kalkulation_h40():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F40 = get_cell_value("Kalkulation!F40")
-    A40 = get_cell_value("Kalkulation!A40")
-
-    return F40 + alpha * t * BJB * act_axn_k(x + A40, max(5 - A40, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F40") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A40"), max(5 - get_cell_value("Kalkulation!A40"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i40():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A40 = get_cell_value("Kalkulation!A40")
-    return 1 if (x + A40 >= MinAlterFlex and A40 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A40") >= MinAlterFlex, get_cell_value("Kalkulation!A40") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j40():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A40 = get_cell_value("Kalkulation!A40")
-    I40 = get_cell_value("Kalkulation!I40")
-    F40 = get_cell_value("Kalkulation!F40")
-
-    if A40 > n or I40:
-        return 0
-    else:
-        inner_value = VS - F40
-        result = inner_value * 0.01
-        return min(150, max(50, result))
+    return 0 if any((get_cell_value("Kalkulation!A40") > n, get_cell_value("Kalkulation!I40"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F40"))))
 
 def fkt_kalkulation_k40():
-    value = get_cell_value("Kalkulation!H40")
-    value2 = get_cell_value("Kalkulation!J40")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H40") - get_cell_value("Kalkulation!J40"))
 
 def fkt_kalkulation_l40():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A40 = get_cell_value("Kalkulation!A40")
-    H40 = get_cell_value("Kalkulation!H40")
-    G40 = get_cell_value("Kalkulation!G40")
     try:
-        if A40 > n:
-            result = 0
-        elif A40 < t:
-            result = H40 / G40
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A40") > n else get_cell_value("Kalkulation!H40") / get_cell_value("Kalkulation!G40") if get_cell_value("Kalkulation!A40") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b41():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A41 = get_cell_value("Kalkulation!A41")
-
-    if A41 <= n:
-        return act_ngr_ax(x + A41, max(0, n - A41), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A41, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A41"), max(0, n - get_cell_value("Kalkulation!A41")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A41"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A41") <= n else 0
 
 def fkt_kalkulation_c41():
     x = get_excel_global('x')
@@ -4055,9 +3318,7 @@ def fkt_kalkulation_c41():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A41_value = get_cell_value("Kalkulation!A41")
-    return act_axn_k(x + A41_value, max(0, n - A41_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A41"), max(0, n - get_cell_value("Kalkulation!A41")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d41():
     x = get_excel_global('x')
@@ -4065,114 +3326,68 @@ def fkt_kalkulation_d41():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A41 = get_cell_value("Kalkulation!A41")
-    return act_axn_k(x + A41, max(0, t - A41), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A41"), max(0, t - get_cell_value("Kalkulation!A41")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e41():
+    P_xt = get_excel_global('P_xt')
     gamma2 = get_excel_global('gamma2')
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
-    P_xt = get_excel_global('P_xt')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    B41 = get_cell_value("Kalkulation!B41")
-    D41 = get_cell_value("Kalkulation!D41")
-    C41 = get_cell_value("Kalkulation!C41")
-
-    return B41 - P_xt * D41 + gamma2 * (C41 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D41)
+    t = get_excel_global('t')
+    return get_cell_value("Kalkulation!B41") - P_xt * get_cell_value("Kalkulation!D41") + gamma2 * (get_cell_value("Kalkulation!C41") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D41"))
 
 def fkt_kalkulation_f41():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E41")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E41")
 
 def fkt_kalkulation_g41():
     gamma3 = get_excel_global('gamma3')
     return get_cell_value("Kalkulation!B41") + gamma3 * get_cell_value("Kalkulation!C41")
 
-def fkt_kalkulation_h41() -> float:
+def fkt_kalkulation_h41():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F41 = get_cell_value("Kalkulation!F41")
-    A41 = get_cell_value("Kalkulation!A41")
-
-    return F41 + alpha * t * BJB * act_axn_k(x + A41, max(5 - A41, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F41") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A41"), max(5 - get_cell_value("Kalkulation!A41"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i41():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A41 = get_cell_value("Kalkulation!A41")
-    return 1 if (x + A41 >= MinAlterFlex and A41 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A41") >= MinAlterFlex, get_cell_value("Kalkulation!A41") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j41():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A41 = get_cell_value("Kalkulation!A41")
-    I41 = get_cell_value("Kalkulation!I41")
-    F41 = get_cell_value("Kalkulation!F41")
-
-    if A41 > n or I41:
-        return 0
-    else:
-        inner_value = VS - F41
-        result = 1 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A41") > n, get_cell_value("Kalkulation!I41"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F41"))))
 
 def fkt_kalkulation_k41():
-    h41 = get_cell_value("Kalkulation!H41")
-    j41 = get_cell_value("Kalkulation!J41")
-    return max(0, h41 - j41)
+    return max(0, get_cell_value("Kalkulation!H41") - get_cell_value("Kalkulation!J41"))
 
 def fkt_kalkulation_l41():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A41 = get_cell_value("Kalkulation!A41")
-    H41 = get_cell_value("Kalkulation!H41")
-    G41 = get_cell_value("Kalkulation!G41")
     try:
-        if A41 > n:
-            result = 0
-        else:
-            if A41 < t:
-                result = H41 / G41
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A41") > n else get_cell_value("Kalkulation!H41") / get_cell_value("Kalkulation!G41") if get_cell_value("Kalkulation!A41") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b42():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A42 = get_cell_value("Kalkulation!A42")
-
-    if A42 <= n:
-        return act_ngr_ax(x + A42, max(0, n - A42), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A42, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A42"), max(0, n - get_cell_value("Kalkulation!A42")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A42"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A42") <= n else 0
 
 def fkt_kalkulation_c42():
     x = get_excel_global('x')
@@ -4180,130 +3395,76 @@ def fkt_kalkulation_c42():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A42_value = get_cell_value("Kalkulation!A42")
-    return act_axn_k(x + A42_value, max(0, n - A42_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A42"), max(0, n - get_cell_value("Kalkulation!A42")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d42():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D42")
-    A42_val = get_cell_value("Kalkulation!A42")
-    t_val = get_cell_value("Kalkulation!A42")
-
-    return act_axn_k(x_val + A42_val, max(0, t_val - A42_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A42"), max(0, t - get_cell_value("Kalkulation!A42")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e42():
-    B42 = get_cell_value("Kalkulation!B42")
-    D42 = get_cell_value("Kalkulation!D42")
-    C42 = get_cell_value("Kalkulation!C42")
+    P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-    P_xt = get_excel_global('P_xt')
-    gamma2 = get_excel_global('gamma2')
-
-    return B42 - P_xt * D42 + gamma2 * (C42 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D42)
+    return get_cell_value("Kalkulation!B42") - P_xt * get_cell_value("Kalkulation!D42") + gamma2 * (get_cell_value("Kalkulation!C42") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D42"))
 
 def fkt_kalkulation_f42():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E42")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E42")
 
 def fkt_kalkulation_g42():
     gamma3 = get_excel_global('gamma3')
-    B42 = get_cell_value("Kalkulation!B42")
-    C42 = get_cell_value("Kalkulation!C42")
-    return B42 + gamma3 * C42
+    return get_cell_value("Kalkulation!B42") + gamma3 * get_cell_value("Kalkulation!C42")
 
 def fkt_kalkulation_h42():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F42 = get_cell_value("Kalkulation!F42")
-    A42 = get_cell_value("Kalkulation!A42")
-
-    return F42 + alpha * t * BJB * act_axn_k(x + A42, max(5 - A42, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F42") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A42"), max(5 - get_cell_value("Kalkulation!A42"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i42():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A42 = get_cell_value("Kalkulation!A42")
-    return 1 if (x + A42 >= MinAlterFlex and A42 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A42") >= MinAlterFlex, get_cell_value("Kalkulation!A42") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j42():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A42 = get_cell_value("Kalkulation!A42")
-    I42 = get_cell_value("Kalkulation!I42")
-    F42 = get_cell_value("Kalkulation!F42")
-
-    if A42 > n or I42:
-        return 0
-    else:
-        inner_value = VS - F42
-        result = inner_value * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A42") > n, get_cell_value("Kalkulation!I42"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F42"))))
 
 def fkt_kalkulation_k42():
-    value = get_cell_value("Kalkulation!H42")
-    value2 = get_cell_value("Kalkulation!J42")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H42") - get_cell_value("Kalkulation!J42"))
 
 def fkt_kalkulation_l42():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A42 = get_cell_value("Kalkulation!A42")
-    H42 = get_cell_value("Kalkulation!H42")
-    G42 = get_cell_value("Kalkulation!G42")
     try:
-        if A42 > n:
-            result = 0
-        else:
-            if A42 < t:
-                result = H42 / G42
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A42") > n else get_cell_value("Kalkulation!H42") / get_cell_value("Kalkulation!G42") if get_cell_value("Kalkulation!A42") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b43():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A43 = get_cell_value("Kalkulation!A43")
-
-    if A43 <= n:
-        return act_ngr_ax(x + A43, max(0, n - A43), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A43, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A43"), max(0, n - get_cell_value("Kalkulation!A43")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A43"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A43") <= n else 0
 
 def fkt_kalkulation_c43():
     x = get_excel_global('x')
@@ -4311,135 +3472,84 @@ def fkt_kalkulation_c43():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A43_value = get_cell_value("Kalkulation!A43")
-    return act_axn_k(x + A43_value, max(0, n - A43_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A43"), max(0, n - get_cell_value("Kalkulation!A43")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d43():
     x = get_excel_global('x')
     t = get_excel_global('t')
-    A43 = get_cell_value("Kalkulation!A43")
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    return act_axn_k(x + A43, max(0, t - A43), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A43"), max(0, t - get_cell_value("Kalkulation!A43")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e43():
-    B43 = get_cell_value("Kalkulation!B43")
-    D43 = get_cell_value("Kalkulation!D43")
-    C43 = get_cell_value("Kalkulation!C43")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B43 - P_xt * D43 + gamma2 * (C43 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D43)
+    return get_cell_value("Kalkulation!B43") - P_xt * get_cell_value("Kalkulation!D43") + gamma2 * (get_cell_value("Kalkulation!C43") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D43"))
 
 def fkt_kalkulation_f43():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E43")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E43")
 
 def fkt_kalkulation_g43():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B43") + gamma3 * get_cell_value("Kalkulation!C43")
-    return value
+    return get_cell_value("Kalkulation!B43") + gamma3 * get_cell_value("Kalkulation!C43")
 
 def fkt_kalkulation_h43():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F43 = get_cell_value("Kalkulation!F43")
-    A43 = get_cell_value("Kalkulation!A43")
-
-    return F43 + alpha * t * BJB * act_axn_k(x + A43, max(5 - A43, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F43") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A43"), max(5 - get_cell_value("Kalkulation!A43"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i43():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A43 = get_cell_value("Kalkulation!A43")
-    return 1 if (x + A43 >= MinAlterFlex and A43 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A43") >= MinAlterFlex, get_cell_value("Kalkulation!A43") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j43():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A43_value = get_cell_value("Kalkulation!A43")
-    I43_value = get_cell_value("Kalkulation!I43")
-    F43_value = get_cell_value("Kalkulation!F43")
-
-    if A43_value > n or I43_value:
-        return 0
-    else:
-        inner_value = VS - F43_value
-        result = inner_value * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A43") > n, get_cell_value("Kalkulation!I43"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F43"))))
 
 def fkt_kalkulation_k43():
-    h43 = get_cell_value("Kalkulation!H43")
-    j43 = get_cell_value("Kalkulation!J43")
-    return max(0, h43 - j43)
+    return max(0, get_cell_value("Kalkulation!H43") - get_cell_value("Kalkulation!J43"))
 
 def fkt_kalkulation_l43():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A43 = get_cell_value("Kalkulation!A43")
-    H43 = get_cell_value("Kalkulation!H43")
-    G43 = get_cell_value("Kalkulation!G43")
     try:
-        if A43 > n:
-            return 0
-        elif A43 < t:
-            return H43 / G43
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A43") > n else get_cell_value("Kalkulation!H43") / get_cell_value("Kalkulation!G43") if get_cell_value("Kalkulation!A43") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b44():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A44 = get_cell_value("Kalkulation!A44")
-
-    if A44 <= n:
-        return act_ngr_ax(x + A44, max(0, n - A44), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A44, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A44"), max(0, n - get_cell_value("Kalkulation!A44")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A44"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A44") <= n else 0
 
 def fkt_kalkulation_c44():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!C44")
-    a44_val = get_cell_value("Kalkulation!A44")
-    return act_axn_k(x_val + a44_val, max(0, n - a44_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A44"), max(0, n - get_cell_value("Kalkulation!A44")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d44():
     x = get_excel_global('x')
@@ -4447,113 +3557,68 @@ def fkt_kalkulation_d44():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A44_value = get_cell_value("Kalkulation!A44")
-    return act_axn_k(x + A44_value, max(0, t - A44_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A44"), max(0, t - get_cell_value("Kalkulation!A44")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e44():
-    B44 = get_cell_value("Kalkulation!B44")
     P_xt = get_excel_global('P_xt')
-    D44 = get_cell_value("Kalkulation!D44")
     gamma2 = get_excel_global('gamma2')
-    C44 = get_cell_value("Kalkulation!C44")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B44 - P_xt * D44 + gamma2 * (C44 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D44)
+    return get_cell_value("Kalkulation!B44") - P_xt * get_cell_value("Kalkulation!D44") + gamma2 * (get_cell_value("Kalkulation!C44") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D44"))
 
 def fkt_kalkulation_f44():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E44")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E44")
 
 def fkt_kalkulation_g44():
     gamma3 = get_excel_global('gamma3')
-    b44 = get_cell_value("Kalkulation!B44")
-    c44 = get_cell_value("Kalkulation!C44")
-    return b44 + gamma3 * c44
+    return get_cell_value("Kalkulation!B44") + gamma3 * get_cell_value("Kalkulation!C44")
 
 def fkt_kalkulation_h44():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F44 = get_cell_value("Kalkulation!F44")
-    A44 = get_cell_value("Kalkulation!A44")
-
-    return F44 + alpha * t * BJB * act_axn_k(x + A44, max(5 - A44, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F44") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A44"), max(5 - get_cell_value("Kalkulation!A44"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i44():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A44 = get_cell_value("Kalkulation!A44")
-    return 1 if (x + A44 >= MinAlterFlex and A44 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A44") >= MinAlterFlex, get_cell_value("Kalkulation!A44") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j44():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A44 = get_cell_value("Kalkulation!A44")
-    I44 = get_cell_value("Kalkulation!I44")
-    F44 = get_cell_value("Kalkulation!F44")
-
-    if A44 > n or I44:
-        return 0
-    else:
-        inner_value = VS - F44
-        result = 1 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A44") > n, get_cell_value("Kalkulation!I44"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F44"))))
 
 def fkt_kalkulation_k44():
-    h44 = get_cell_value("Kalkulation!H44")
-    j44 = get_cell_value("Kalkulation!J44")
-    return max(0, h44 - j44)
+    return max(0, get_cell_value("Kalkulation!H44") - get_cell_value("Kalkulation!J44"))
 
 def fkt_kalkulation_l44():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A44 = get_cell_value("Kalkulation!A44")
-    H44 = get_cell_value("Kalkulation!H44")
-    G44 = get_cell_value("Kalkulation!G44")
     try:
-        if A44 > n:
-            return 0
-        elif A44 < t:
-            return H44 / G44
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A44") > n else get_cell_value("Kalkulation!H44") / get_cell_value("Kalkulation!G44") if get_cell_value("Kalkulation!A44") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b45():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A45 = get_cell_value("Kalkulation!A45")
-
-    if A45 <= n:
-        return act_ngr_ax(x + A45, max(0, n - A45), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A45, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A45"), max(0, n - get_cell_value("Kalkulation!A45")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A45"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A45") <= n else 0
 
 def fkt_kalkulation_c45():
     x = get_excel_global('x')
@@ -4561,256 +3626,153 @@ def fkt_kalkulation_c45():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A45_value = get_cell_value("Kalkulation!A45")
-    return act_axn_k(x + A45_value, max(0, n - A45_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A45"), max(0, n - get_cell_value("Kalkulation!A45")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d45():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A45_value = get_cell_value("Kalkulation!A45")
-    return act_axn_k(x + A45_value, max(0, t - A45_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A45"), max(0, t - get_cell_value("Kalkulation!A45")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e45():
-    B45 = get_cell_value("Kalkulation!B45")
-    D45 = get_cell_value("Kalkulation!D45")
-    C45 = get_cell_value("Kalkulation!C45")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B45 - P_xt * D45 + gamma2 * (C45 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D45)
-    return result
+    return get_cell_value("Kalkulation!B45") - P_xt * get_cell_value("Kalkulation!D45") + gamma2 * (get_cell_value("Kalkulation!C45") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D45"))
 
 def fkt_kalkulation_f45():
     VS = get_excel_global('VS')
-    E45 = get_cell_value("Kalkulation!E45")
-    return VS * E45
+    return VS * get_cell_value("Kalkulation!E45")
 
 def fkt_kalkulation_g45():
     gamma3 = get_excel_global('gamma3')
-    B45 = get_cell_value("Kalkulation!B45")
-    C45 = get_cell_value("Kalkulation!C45")
-    return B45 + gamma3 * C45
+    return get_cell_value("Kalkulation!B45") + gamma3 * get_cell_value("Kalkulation!C45")
 
 def fkt_kalkulation_h45():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F45 = get_cell_value("Kalkulation!F45")
-    A45 = get_cell_value("Kalkulation!A45")
-
-    return F45 + alpha * t * BJB * act_axn_k(x + A45, max(5 - A45, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F45") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A45"), max(5 - get_cell_value("Kalkulation!A45"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i45():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A45 = get_cell_value("Kalkulation!A45")
-    return 1 if (x + A45 >= MinAlterFlex and A45 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A45") >= MinAlterFlex, get_cell_value("Kalkulation!A45") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j45():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A45 = get_cell_value("Kalkulation!A45")
-    I45 = get_cell_value("Kalkulation!I45")
-    F45 = get_cell_value("Kalkulation!F45")
-
-    if A45 > n or I45:
-        return 0
-    else:
-        result = VS - F45
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A45") > n, get_cell_value("Kalkulation!I45"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F45"))))
 
 def fkt_kalkulation_k45():
-    H45 = get_cell_value("Kalkulation!H45")
-    J45 = get_cell_value("Kalkulation!J45")
-    return max(0, H45 - J45)
+    return max(0, get_cell_value("Kalkulation!H45") - get_cell_value("Kalkulation!J45"))
 
 def fkt_kalkulation_l45():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A45 = get_cell_value("Kalkulation!A45")
-    H45 = get_cell_value("Kalkulation!H45")
-    G45 = get_cell_value("Kalkulation!G45")
     try:
-        if A45 > n:
-            result = 0
-        else:
-            if A45 < t:
-                result = H45 / G45
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A45") > n else get_cell_value("Kalkulation!H45") / get_cell_value("Kalkulation!G45") if get_cell_value("Kalkulation!A45") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b46():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A46 = get_cell_value("Kalkulation!A46")
-    result = act_ngr_ax(x + A46, max(0, n - A46), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A46, Sex, Tafel, Zins) if A46 <= n else 0
-    return result
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A46"), max(0, n - get_cell_value("Kalkulation!A46")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A46"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A46") <= n else 0
 
 def fkt_kalkulation_c46():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A46 = get_cell_value("Kalkulation!A46")
-    return act_axn_k(x + A46, max(0, n - A46), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A46"), max(0, n - get_cell_value("Kalkulation!A46")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d46():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A46")
-    t_value = t - get_cell_value("Kalkulation!A46")
-    max_value = max(0, t_value)
-
-    return act_axn_k(x_value, max_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A46"), max(0, t - get_cell_value("Kalkulation!A46")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e46():
-    B46 = get_cell_value("Kalkulation!B46")
-    D46 = get_cell_value("Kalkulation!D46")
-    C46 = get_cell_value("Kalkulation!C46")
+    P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-    P_xt = get_excel_global('P_xt')
-    gamma2 = get_excel_global('gamma2')
-
-    return B46 - P_xt * D46 + gamma2 * (C46 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D46)
+    return get_cell_value("Kalkulation!B46") - P_xt * get_cell_value("Kalkulation!D46") + gamma2 * (get_cell_value("Kalkulation!C46") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D46"))
 
 def fkt_kalkulation_f46():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E46")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E46")
 
 def fkt_kalkulation_g46():
     gamma3 = get_excel_global('gamma3')
-    B46 = get_cell_value("Kalkulation!B46")
-    C46 = get_cell_value("Kalkulation!C46")
-    return B46 + gamma3 * C46
+    return get_cell_value("Kalkulation!B46") + gamma3 * get_cell_value("Kalkulation!C46")
 
 def fkt_kalkulation_h46():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F46 = get_cell_value("Kalkulation!F46")
-    A46 = get_cell_value("Kalkulation!A46")
-
-    return F46 + alpha * t * BJB * act_axn_k(x + A46, max(5 - A46, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F46") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A46"), max(5 - get_cell_value("Kalkulation!A46"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i46():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A46 = get_cell_value("Kalkulation!A46")
-    return 1 if (x + A46 >= MinAlterFlex and A46 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A46") >= MinAlterFlex, get_cell_value("Kalkulation!A46") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j46():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A46 = get_cell_value("Kalkulation!A46")
-    I46 = get_cell_value("Kalkulation!I46")
-    F46 = get_cell_value("Kalkulation!F46")
-
-    if A46 > n or I46:
-        return 0
-    else:
-        inner_value = VS - F46
-        result = 1 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A46") > n, get_cell_value("Kalkulation!I46"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F46"))))
 
 def fkt_kalkulation_k46():
-    value = get_cell_value("Kalkulation!H46")
-    value2 = get_cell_value("Kalkulation!J46")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H46") - get_cell_value("Kalkulation!J46"))
 
 def fkt_kalkulation_l46():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A46 = get_cell_value("Kalkulation!A46")
-    H46 = get_cell_value("Kalkulation!H46")
-    G46 = get_cell_value("Kalkulation!G46")
     try:
-        if A46 > n:
-            result = 0
-        elif A46 < t:
-            result = H46 / G46
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A46") > n else get_cell_value("Kalkulation!H46") / get_cell_value("Kalkulation!G46") if get_cell_value("Kalkulation!A46") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b47():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A47 = get_cell_value("Kalkulation!A47")
-
-    if A47 <= n:
-        return act_ngr_ax(x + A47, max(0, n - A47), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A47, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A47"), max(0, n - get_cell_value("Kalkulation!A47")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A47"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A47") <= n else 0
 
 def fkt_kalkulation_c47():
     x = get_excel_global('x')
@@ -4818,254 +3780,153 @@ def fkt_kalkulation_c47():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A47_value = get_cell_value("Kalkulation!A47")
-    return act_axn_k(x + A47_value, max(0, n - A47_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A47"), max(0, n - get_cell_value("Kalkulation!A47")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d47():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A47_value = get_cell_value("Kalkulation!A47")
-    return act_axn_k(x + A47_value, max(0, t - A47_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A47"), max(0, t - get_cell_value("Kalkulation!A47")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e47():
-    B47 = get_cell_value("Kalkulation!B47")
-    D47 = get_cell_value("Kalkulation!D47")
-    C47 = get_cell_value("Kalkulation!C47")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B47 - P_xt * D47 + gamma2 * (C47 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D47)
+    return get_cell_value("Kalkulation!B47") - P_xt * get_cell_value("Kalkulation!D47") + gamma2 * (get_cell_value("Kalkulation!C47") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D47"))
 
 def fkt_kalkulation_f47():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E47")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E47")
 
 def fkt_kalkulation_g47():
     gamma3 = get_excel_global('gamma3')
-    B47 = get_cell_value("Kalkulation!B47")
-    C47 = get_cell_value("Kalkulation!C47")
-    return B47 + gamma3 * C47
+    return get_cell_value("Kalkulation!B47") + gamma3 * get_cell_value("Kalkulation!C47")
 
 def fkt_kalkulation_h47():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F47 = get_cell_value("Kalkulation!F47")
-    A47 = get_cell_value("Kalkulation!A47")
-
-    return F47 + alpha * t * BJB * act_axn_k(x + A47, max(5 - A47, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F47") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A47"), max(5 - get_cell_value("Kalkulation!A47"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i47():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A47 = get_cell_value("Kalkulation!A47")
-    return 1 if (x + A47 >= MinAlterFlex and A47 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A47") >= MinAlterFlex, get_cell_value("Kalkulation!A47") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j47():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A47 = get_cell_value("Kalkulation!A47")
-    I47 = get_cell_value("Kalkulation!I47")
-    F47 = get_cell_value("Kalkulation!F47")
-
-    if A47 > n or I47:
-        return 0
-    else:
-        inner_value = VS - F47
-        result = 1 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A47") > n, get_cell_value("Kalkulation!I47"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F47"))))
 
 def fkt_kalkulation_k47():
-    H47 = get_cell_value("Kalkulation!H47")
-    J47 = get_cell_value("Kalkulation!J47")
-    return max(0, H47 - J47)
+    return max(0, get_cell_value("Kalkulation!H47") - get_cell_value("Kalkulation!J47"))
 
 def fkt_kalkulation_l47():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A47 = get_cell_value("Kalkulation!A47")
-    H47 = get_cell_value("Kalkulation!H47")
-    G47 = get_cell_value("Kalkulation!G47")
     try:
-        if A47 > n:
-            result = 0
-        elif A47 < t:
-            result = H47 / G47
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A47") > n else get_cell_value("Kalkulation!H47") / get_cell_value("Kalkulation!G47") if get_cell_value("Kalkulation!A47") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b48():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A48 = get_cell_value("Kalkulation!A48")
-    if A48 <= n:
-        return act_ngr_ax(x + A48, max(0, n - A48), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A48, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A48"), max(0, n - get_cell_value("Kalkulation!A48")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A48"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A48") <= n else 0
 
 def fkt_kalkulation_c48():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A48 = get_cell_value("Kalkulation!A48")
-    return act_axn_k(x + A48, max(0, n - A48), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A48"), max(0, n - get_cell_value("Kalkulation!A48")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d48():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D48")
-    A48_val = get_cell_value("Kalkulation!A48")
-    t_val = get_cell_value("Kalkulation!A48")
-
-    return act_axn_k(x_val + A48_val, max(0, t_val - A48_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A48"), max(0, t - get_cell_value("Kalkulation!A48")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e48():
+    P_xt = get_excel_global('P_xt')
     gamma2 = get_excel_global('gamma2')
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
-    P_xt = get_excel_global('P_xt')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    B48 = get_cell_value("Kalkulation!B48")
-    D48 = get_cell_value("Kalkulation!D48")
-    C48 = get_cell_value("Kalkulation!C48")
-
-    result = B48 - P_xt * D48 + gamma2 * (C48 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D48)
-    return result
+    t = get_excel_global('t')
+    return get_cell_value("Kalkulation!B48") - P_xt * get_cell_value("Kalkulation!D48") + gamma2 * (get_cell_value("Kalkulation!C48") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D48"))
 
 def fkt_kalkulation_f48():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E48")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E48")
 
 def fkt_kalkulation_g48():
     gamma3 = get_excel_global('gamma3')
-    B48 = get_cell_value("Kalkulation!B48")
-    C48 = get_cell_value("Kalkulation!C48")
-    return B48 + gamma3 * C48
+    return get_cell_value("Kalkulation!B48") + gamma3 * get_cell_value("Kalkulation!C48")
 
 def fkt_kalkulation_h48():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F48 = get_cell_value("Kalkulation!F48")
-    A48 = get_cell_value("Kalkulation!A48")
-
-    return F48 + alpha * t * BJB * act_axn_k(x + A48, max(5 - A48, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F48") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A48"), max(5 - get_cell_value("Kalkulation!A48"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i48():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A48 = get_cell_value("Kalkulation!A48")
-    return 1 if (x + A48 >= MinAlterFlex and A48 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A48") >= MinAlterFlex, get_cell_value("Kalkulation!A48") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j48():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A48 = get_cell_value("Kalkulation!A48")
-    I48 = get_cell_value("Kalkulation!I48")
-    F48 = get_cell_value("Kalkulation!F48")
-
-    if A48 > n or I48:
-        return 0
-    else:
-        inner_value = VS - F48
-        result = 1 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A48") > n, get_cell_value("Kalkulation!I48"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F48"))))
 
 def fkt_kalkulation_k48():
-    H48 = get_cell_value("Kalkulation!H48")
-    J48 = get_cell_value("Kalkulation!J48")
-    return max(0, H48 - J48)
+    return max(0, get_cell_value("Kalkulation!H48") - get_cell_value("Kalkulation!J48"))
 
 def fkt_kalkulation_l48():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A48 = get_cell_value("Kalkulation!A48")
-    H48 = get_cell_value("Kalkulation!H48")
-    G48 = get_cell_value("Kalkulation!G48")
     try:
-        if A48 > n:
-            result = 0
-        elif A48 < t:
-            result = H48 / G48
-        else:
-            result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A48") > n else get_cell_value("Kalkulation!H48") / get_cell_value("Kalkulation!G48") if get_cell_value("Kalkulation!A48") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b49():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A49 = get_cell_value("Kalkulation!A49")
-    return act_ngr_ax(x + A49, max(0, n - A49), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A49, Sex, Tafel, Zins) if A49 <= n else 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A49"), max(0, n - get_cell_value("Kalkulation!A49")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A49"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A49") <= n else 0
 
 def fkt_kalkulation_c49():
     x = get_excel_global('x')
@@ -5073,8 +3934,7 @@ def fkt_kalkulation_c49():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-    A49 = get_cell_value("Kalkulation!A49")
-    return act_axn_k(x + A49, max(0, n - A49), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A49"), max(0, n - get_cell_value("Kalkulation!A49")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d49():
     x = get_excel_global('x')
@@ -5082,114 +3942,68 @@ def fkt_kalkulation_d49():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-    A49 = get_cell_value("Kalkulation!A49")
-    return act_axn_k(x + A49, max(0, t - A49), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A49"), max(0, t - get_cell_value("Kalkulation!A49")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e49():
-    B49 = get_cell_value("Kalkulation!B49")
-    D49 = get_cell_value("Kalkulation!D49")
-    C49 = get_cell_value("Kalkulation!C49")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B49 - P_xt * D49 + gamma2 * (C49 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D49)
+    return get_cell_value("Kalkulation!B49") - P_xt * get_cell_value("Kalkulation!D49") + gamma2 * (get_cell_value("Kalkulation!C49") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D49"))
 
 def fkt_kalkulation_f49():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E49")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E49")
 
 def fkt_kalkulation_g49():
     gamma3 = get_excel_global('gamma3')
-    b49 = get_cell_value("Kalkulation!B49")
-    c49 = get_cell_value("Kalkulation!C49")
-    return b49 + gamma3 * c49
+    return get_cell_value("Kalkulation!B49") + gamma3 * get_cell_value("Kalkulation!C49")
 
 def fkt_kalkulation_h49():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F49 = get_cell_value("Kalkulation!F49")
-    A49 = get_cell_value("Kalkulation!A49")
-
-    return F49 + alpha * t * BJB * act_axn_k(x + A49, max(5 - A49, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F49") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A49"), max(5 - get_cell_value("Kalkulation!A49"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i49():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A49 = get_cell_value("Kalkulation!A49")
-    return 1 if (x + A49 >= MinAlterFlex and A49 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A49") >= MinAlterFlex, get_cell_value("Kalkulation!A49") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j49():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A49 = get_cell_value("Kalkulation!A49")
-    I49 = get_cell_value("Kalkulation!I49")
-    F49 = get_cell_value("Kalkulation!F49")
-
-    if A49 > n or I49:
-        return 0
-    else:
-        inner_value = VS - F49
-        result = 1 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A49") > n, get_cell_value("Kalkulation!I49"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F49"))))
 
 def fkt_kalkulation_k49():
-    H49 = get_cell_value("Kalkulation!H49")
-    J49 = get_cell_value("Kalkulation!J49")
-    return max(0, H49 - J49)
+    return max(0, get_cell_value("Kalkulation!H49") - get_cell_value("Kalkulation!J49"))
 
 def fkt_kalkulation_l49():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A49 = get_cell_value("Kalkulation!A49")
-    H49 = get_cell_value("Kalkulation!H49")
-    G49 = get_cell_value("Kalkulation!G49")
     try:
-        if A49 > n:
-            result = 0
-        else:
-            if A49 < t:
-                result = H49 / G49
-            else:
-                result = VS
-    except:
-        result = 0
-    return result
+        return 0 if get_cell_value("Kalkulation!A49") > n else get_cell_value("Kalkulation!H49") / get_cell_value("Kalkulation!G49") if get_cell_value("Kalkulation!A49") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b50():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A50 = get_cell_value("Kalkulation!A50")
-
-    if A50 <= n:
-        return act_ngr_ax(x + A50, max(0, n - A50), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A50, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A50"), max(0, n - get_cell_value("Kalkulation!A50")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A50"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A50") <= n else 0
 
 def fkt_kalkulation_c50():
     x = get_excel_global('x')
@@ -5197,120 +4011,76 @@ def fkt_kalkulation_c50():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A50_value = get_cell_value("Kalkulation!A50")
-    return act_axn_k(x + A50_value, max(0, n - A50_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A50"), max(0, n - get_cell_value("Kalkulation!A50")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d50():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D50")
-    a50_val = get_cell_value("Kalkulation!A50")
-    t_val = get_cell_value("Kalkulation!A50")
-
-    return act_axn_k(x_val + a50_val, max(0, t_val - a50_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A50"), max(0, t - get_cell_value("Kalkulation!A50")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e50():
-    B50 = get_cell_value("Kalkulation!B50")
-    D50 = get_cell_value("Kalkulation!D50")
-    C50 = get_cell_value("Kalkulation!C50")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B50 - P_xt * D50 + gamma2 * (C50 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D50)
+    return get_cell_value("Kalkulation!B50") - P_xt * get_cell_value("Kalkulation!D50") + gamma2 * (get_cell_value("Kalkulation!C50") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D50"))
 
 def fkt_kalkulation_f50():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E50")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E50")
 
 def fkt_kalkulation_g50():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B50") + gamma3 * get_cell_value("Kalkulation!C50")
-    return value
+    return get_cell_value("Kalkulation!B50") + gamma3 * get_cell_value("Kalkulation!C50")
 
 def fkt_kalkulation_h50():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F50 = get_cell_value("Kalkulation!F50")
-    A50 = get_cell_value("Kalkulation!A50")
-
-    return F50 + alpha * t * BJB * act_axn_k(x + A50, max(5 - A50, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F50") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A50"), max(5 - get_cell_value("Kalkulation!A50"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i50():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A50_value = get_cell_value("Kalkulation!A50")
-    return 1 if (x + A50_value >= MinAlterFlex and A50_value >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A50") >= MinAlterFlex, get_cell_value("Kalkulation!A50") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j50():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A50 = get_cell_value("Kalkulation!A50")
-    I50 = get_cell_value("Kalkulation!I50")
-    F50 = get_cell_value("Kalkulation!F50")
-    return 0 if (A50 > n) or I50 else min(150, max(50, 0.01 * (VS - F50)))
+    return 0 if any((get_cell_value("Kalkulation!A50") > n, get_cell_value("Kalkulation!I50"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F50"))))
 
 def fkt_kalkulation_k50():
-    h50 = get_cell_value("Kalkulation!H50")
-    j50 = get_cell_value("Kalkulation!J50")
-    return max(0, h50 - j50)
+    return max(0, get_cell_value("Kalkulation!H50") - get_cell_value("Kalkulation!J50"))
 
 def fkt_kalkulation_l50():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A50 = get_cell_value("Kalkulation!A50")
-    H50 = get_cell_value("Kalkulation!H50")
-    G50 = get_cell_value("Kalkulation!G50")
-
     try:
-        if A50 > n:
-            return 0
-        elif A50 < t:
-            return H50 / G50
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A50") > n else get_cell_value("Kalkulation!H50") / get_cell_value("Kalkulation!G50") if get_cell_value("Kalkulation!A50") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b51():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A51 = get_cell_value("Kalkulation!A51")
-
-    if A51 <= n:
-        return act_ngr_ax(x + A51, max(0, n - A51), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A51, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A51"), max(0, n - get_cell_value("Kalkulation!A51")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A51"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A51") <= n else 0
 
 def fkt_kalkulation_c51():
     x = get_excel_global('x')
@@ -5318,9 +4088,7 @@ def fkt_kalkulation_c51():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A51_value = get_cell_value("Kalkulation!A51")
-    return act_axn_k(x + A51_value, max(0, n - A51_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A51"), max(0, n - get_cell_value("Kalkulation!A51")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d51():
     x = get_excel_global('x')
@@ -5328,29 +4096,22 @@ def fkt_kalkulation_d51():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A51_value = get_cell_value("Kalkulation!A51")
-    return act_axn_k(x + A51_value, max(0, t - A51_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A51"), max(0, t - get_cell_value("Kalkulation!A51")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e51():
-    B51 = get_cell_value("Kalkulation!B51")
     P_xt = get_excel_global('P_xt')
-    D51 = get_cell_value("Kalkulation!D51")
     gamma2 = get_excel_global('gamma2')
-    C51 = get_cell_value("Kalkulation!C51")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B51 - P_xt * D51 + gamma2 * (C51 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D51)
+    return get_cell_value("Kalkulation!B51") - P_xt * get_cell_value("Kalkulation!D51") + gamma2 * (get_cell_value("Kalkulation!C51") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D51"))
 
 def fkt_kalkulation_f51():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E51")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E51")
 
 def fkt_kalkulation_g51():
     gamma3 = get_excel_global('gamma3')
@@ -5358,208 +4119,122 @@ def fkt_kalkulation_g51():
 
 def fkt_kalkulation_h51():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F51 = get_cell_value("Kalkulation!F51")
-    A51 = get_cell_value("Kalkulation!A51")
-
-    return F51 + alpha * t * BJB * act_axn_k(x + A51, max(5 - A51, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F51") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A51"), max(5 - get_cell_value("Kalkulation!A51"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i51():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A51 = get_cell_value("Kalkulation!A51")
-    return 1 if (x + A51 >= MinAlterFlex and A51 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A51") >= MinAlterFlex, get_cell_value("Kalkulation!A51") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j51():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A51 = get_cell_value("Kalkulation!A51")
-    I51 = get_cell_value("Kalkulation!I51")
-    F51 = get_cell_value("Kalkulation!F51")
-
-    if A51 > n or I51:
-        return 0
-    else:
-        inner_value = VS - F51
-        result = inner_value * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A51") > n, get_cell_value("Kalkulation!I51"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F51"))))
 
 def fkt_kalkulation_k51():
-    h51 = get_cell_value("Kalkulation!H51")
-    j51 = get_cell_value("Kalkulation!J51")
-    return max(0, h51 - j51)
+    return max(0, get_cell_value("Kalkulation!H51") - get_cell_value("Kalkulation!J51"))
 
 def fkt_kalkulation_l51():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A51 = get_cell_value("Kalkulation!A51")
-    H51 = get_cell_value("Kalkulation!H51")
-    G51 = get_cell_value("Kalkulation!G51")
     try:
-        if A51 > n:
-            return 0
-        elif A51 < t:
-            return H51 / G51
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A51") > n else get_cell_value("Kalkulation!H51") / get_cell_value("Kalkulation!G51") if get_cell_value("Kalkulation!A51") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b52():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A52 = get_cell_value("Kalkulation!A52")
-
-    if A52 <= n:
-        return act_ngr_ax(x + A52, max(0, n - A52), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A52, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A52"), max(0, n - get_cell_value("Kalkulation!A52")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A52"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A52") <= n else 0
 
 def fkt_kalkulation_c52():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A52 = get_cell_value("Kalkulation!A52")
-    return act_axn_k(x + A52, max(0, n - A52), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A52"), max(0, n - get_cell_value("Kalkulation!A52")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d52():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A52_value = get_cell_value("Kalkulation!A52")
-    return act_axn_k(x + A52_value, max(0, t - A52_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A52"), max(0, t - get_cell_value("Kalkulation!A52")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e52():
-    B52 = get_cell_value("Kalkulation!B52")
-    D52 = get_cell_value("Kalkulation!D52")
-    C52 = get_cell_value("Kalkulation!C52")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B52 - P_xt * D52 + gamma2 * (C52 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D52)
+    return get_cell_value("Kalkulation!B52") - P_xt * get_cell_value("Kalkulation!D52") + gamma2 * (get_cell_value("Kalkulation!C52") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D52"))
 
 def fkt_kalkulation_f52():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E52")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E52")
 
 def fkt_kalkulation_g52():
     gamma3 = get_excel_global('gamma3')
-    B52 = get_cell_value("Kalkulation!B52")
-    C52 = get_cell_value("Kalkulation!C52")
-    return B52 + gamma3 * C52
+    return get_cell_value("Kalkulation!B52") + gamma3 * get_cell_value("Kalkulation!C52")
 
 def fkt_kalkulation_h52():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F52 = get_cell_value("Kalkulation!F52")
-    A52 = get_cell_value("Kalkulation!A52")
-
-    return F52 + alpha * t * BJB * act_axn_k(x + A52, max(5 - A52, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F52") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A52"), max(5 - get_cell_value("Kalkulation!A52"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i52():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A52 = get_cell_value("Kalkulation!A52")
-    return 1 if (x + A52 >= MinAlterFlex and A52 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A52") >= MinAlterFlex, get_cell_value("Kalkulation!A52") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j52():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A52 = get_cell_value("Kalkulation!A52")
-    I52 = get_cell_value("Kalkulation!I52")
-    F52 = get_cell_value("Kalkulation!F52")
-    if A52 > n or I52:
-        return 0
-    else:
-        inner_value = VS - F52
-        result = 0.01 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A52") > n, get_cell_value("Kalkulation!I52"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F52"))))
 
 def fkt_kalkulation_k52():
-    h52 = get_cell_value("Kalkulation!H52")
-    j52 = get_cell_value("Kalkulation!J52")
-    return max(0, h52 - j52)
+    return max(0, get_cell_value("Kalkulation!H52") - get_cell_value("Kalkulation!J52"))
 
 def fkt_kalkulation_l52():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A52 = get_cell_value("Kalkulation!A52")
-    H52 = get_cell_value("Kalkulation!H52")
-    G52 = get_cell_value("Kalkulation!G52")
     try:
-        if A52 > n:
-            return 0
-        elif A52 < t:
-            return H52 / G52
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A52") > n else get_cell_value("Kalkulation!H52") / get_cell_value("Kalkulation!G52") if get_cell_value("Kalkulation!A52") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b53():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A53 = get_cell_value("Kalkulation!A53")
-
-    if A53 <= n:
-        return act_ngr_ax(x + A53, max(0, n - A53), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A53, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A53"), max(0, n - get_cell_value("Kalkulation!A53")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A53"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A53") <= n else 0
 
 def fkt_kalkulation_c53():
     x = get_excel_global('x')
@@ -5567,126 +4242,76 @@ def fkt_kalkulation_c53():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A53_value = get_cell_value("Kalkulation!A53")
-    return act_axn_k(x + A53_value, max(0, n - A53_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A53"), max(0, n - get_cell_value("Kalkulation!A53")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d53():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A53 = get_cell_value("Kalkulation!A53")
-    return act_axn_k(x + A53, max(0, t - A53), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A53"), max(0, t - get_cell_value("Kalkulation!A53")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e53():
-    B53 = get_cell_value("Kalkulation!B53")
-    D53 = get_cell_value("Kalkulation!D53")
-    C53 = get_cell_value("Kalkulation!C53")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B53 - P_xt * D53 + gamma2 * (C53 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D53)
-    return result
+    return get_cell_value("Kalkulation!B53") - P_xt * get_cell_value("Kalkulation!D53") + gamma2 * (get_cell_value("Kalkulation!C53") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D53"))
 
 def fkt_kalkulation_f53():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E53")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E53")
 
 def fkt_kalkulation_g53():
     gamma3 = get_excel_global('gamma3')
-    B53 = get_cell_value("Kalkulation!B53")
-    C53 = get_cell_value("Kalkulation!C53")
-    return B53 + gamma3 * C53
+    return get_cell_value("Kalkulation!B53") + gamma3 * get_cell_value("Kalkulation!C53")
 
 def fkt_kalkulation_h53():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F53 = get_cell_value("Kalkulation!F53")
-    A53 = get_cell_value("Kalkulation!A53")
-
-    result = F53 + alpha * t * BJB * act_axn_k(x + A53, max(5 - A53, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
-    return result
+    return get_cell_value("Kalkulation!F53") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A53"), max(5 - get_cell_value("Kalkulation!A53"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i53():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A53 = get_cell_value("Kalkulation!A53")
-    return 1 if (x + A53 >= MinAlterFlex and A53 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A53") >= MinAlterFlex, get_cell_value("Kalkulation!A53") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j53():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A53 = get_cell_value("Kalkulation!A53")
-    F53 = get_cell_value("Kalkulation!F53")
-    I53 = get_cell_value("Kalkulation!I53")
-    if A53 > n or I53:
-        return 0
-    else:
-        inner_value = VS - F53
-        result = 0.01 * inner_value
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A53") > n, get_cell_value("Kalkulation!I53"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F53"))))
 
 def fkt_kalkulation_k53():
-    H53 = get_cell_value("Kalkulation!H53")
-    J53 = get_cell_value("Kalkulation!J53")
-    return max(0, H53 - J53)
+    return max(0, get_cell_value("Kalkulation!H53") - get_cell_value("Kalkulation!J53"))
 
 def fkt_kalkulation_l53():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A53 = get_cell_value("Kalkulation!A53")
-    H53 = get_cell_value("Kalkulation!H53")
-    G53 = get_cell_value("Kalkulation!G53")
     try:
-        if A53 > n:
-            return 0
-        elif A53 < t:
-            return H53 / G53
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A53") > n else get_cell_value("Kalkulation!H53") / get_cell_value("Kalkulation!G53") if get_cell_value("Kalkulation!A53") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b54():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A54 = get_cell_value("Kalkulation!A54")
-
-    if A54 <= n:
-        return act_ngr_ax(x + A54, max(0, n - A54), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A54, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A54"), max(0, n - get_cell_value("Kalkulation!A54")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A54"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A54") <= n else 0
 
 def fkt_kalkulation_c54():
     x = get_excel_global('x')
@@ -5694,293 +4319,184 @@ def fkt_kalkulation_c54():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A54_value = get_cell_value("Kalkulation!A54")
-    return act_axn_k(x + A54_value, max(0, n - A54_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A54"), max(0, n - get_cell_value("Kalkulation!A54")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d54():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A54")
-    t_value = t - get_cell_value("Kalkulation!A54")
-    max_value = max(0, t_value)
-
-    return act_axn_k(alter=x_value, n=max_value, sex=Sex, tafel=Tafel, zins=Zins, k=1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A54"), max(0, t - get_cell_value("Kalkulation!A54")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e54():
-    B54 = get_cell_value("Kalkulation!B54")
-    D54 = get_cell_value("Kalkulation!D54")
-    C54 = get_cell_value("Kalkulation!C54")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B54 - P_xt * D54 + gamma2 * (C54 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D54)
+    return get_cell_value("Kalkulation!B54") - P_xt * get_cell_value("Kalkulation!D54") + gamma2 * (get_cell_value("Kalkulation!C54") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D54"))
 
 def fkt_kalkulation_f54():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E54")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E54")
 
 def fkt_kalkulation_g54():
     gamma3 = get_excel_global('gamma3')
-    B54 = get_cell_value("Kalkulation!B54")
-    C54 = get_cell_value("Kalkulation!C54")
-    return B54 + gamma3 * C54
+    return get_cell_value("Kalkulation!B54") + gamma3 * get_cell_value("Kalkulation!C54")
 
 def fkt_kalkulation_h54():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F54 = get_cell_value("Kalkulation!F54")
-    A54 = get_cell_value("Kalkulation!A54")
-
-    return F54 + alpha * t * BJB * act_axn_k(x + A54, max(5 - A54, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F54") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A54"), max(5 - get_cell_value("Kalkulation!A54"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i54():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A54 = get_cell_value("Kalkulation!A54")
-    return 1 if (x + A54 >= MinAlterFlex and A54 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A54") >= MinAlterFlex, get_cell_value("Kalkulation!A54") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j54():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A54 = get_cell_value("Kalkulation!A54")
-    I54 = get_cell_value("Kalkulation!I54")
-    F54 = get_cell_value("Kalkulation!F54")
-
-    if A54 > n or I54:
-        return 0
-    else:
-        inner_value = VS - F54
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A54") > n, get_cell_value("Kalkulation!I54"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F54"))))
 
 def fkt_kalkulation_k54():
-    h54 = get_cell_value("Kalkulation!H54")
-    j54 = get_cell_value("Kalkulation!J54")
-    return max(0, h54 - j54)
+    return max(0, get_cell_value("Kalkulation!H54") - get_cell_value("Kalkulation!J54"))
 
 def fkt_kalkulation_l54():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A54 = get_cell_value("Kalkulation!A54")
-    H54 = get_cell_value("Kalkulation!H54")
-    G54 = get_cell_value("Kalkulation!G54")
     try:
-        if A54 > n:
-            return 0
-        elif A54 < t:
-            return H54 / G54
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A54") > n else get_cell_value("Kalkulation!H54") / get_cell_value("Kalkulation!G54") if get_cell_value("Kalkulation!A54") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b55():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A55 = get_cell_value("Kalkulation!A55")
-
-    if A55 <= n:
-        return act_ngr_ax(x + A55, max(0, n - A55), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A55, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A55"), max(0, n - get_cell_value("Kalkulation!A55")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A55"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A55") <= n else 0
 
 def fkt_kalkulation_c55():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A55_value = get_cell_value("Kalkulation!A55")
-    return act_axn_k(x + A55_value, max(0, n - A55_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A55"), max(0, n - get_cell_value("Kalkulation!A55")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d55():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A55_value = get_cell_value("Kalkulation!A55")
-    return act_axn_k(x + A55_value, max(0, t - A55_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A55"), max(0, t - get_cell_value("Kalkulation!A55")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e55():
-    B55 = get_cell_value("Kalkulation!B55")
-    D55 = get_cell_value("Kalkulation!D55")
-    C55 = get_cell_value("Kalkulation!C55")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B55 - P_xt * D55 + gamma2 * (C55 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D55)
+    return get_cell_value("Kalkulation!B55") - P_xt * get_cell_value("Kalkulation!D55") + gamma2 * (get_cell_value("Kalkulation!C55") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D55"))
 
 def fkt_kalkulation_f55():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E55")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E55")
 
 def fkt_kalkulation_g55():
     gamma3 = get_excel_global('gamma3')
-    B55 = get_cell_value("Kalkulation!B55")
-    C55 = get_cell_value("Kalkulation!C55")
-    return B55 + gamma3 * C55
+    return get_cell_value("Kalkulation!B55") + gamma3 * get_cell_value("Kalkulation!C55")
 
 def fkt_kalkulation_h55():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F55 = get_cell_value("Kalkulation!F55")
-    A55 = get_cell_value("Kalkulation!A55")
-
-    return F55 + alpha * t * BJB * act_axn_k(x + A55, max(5 - A55, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F55") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A55"), max(5 - get_cell_value("Kalkulation!A55"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i55():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A55 = get_cell_value("Kalkulation!A55")
-    return 1 if (x + A55 >= MinAlterFlex and A55 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A55") >= MinAlterFlex, get_cell_value("Kalkulation!A55") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j55():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A55 = get_cell_value("Kalkulation!A55")
-    I55 = get_cell_value("Kalkulation!I55")
-    F55 = get_cell_value("Kalkulation!F55")
-    return 0 if (A55 > n) or I55 else min(150, max(50, 0.01 * (VS - F55)))
+    return 0 if any((get_cell_value("Kalkulation!A55") > n, get_cell_value("Kalkulation!I55"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F55"))))
 
 def fkt_kalkulation_k55():
-    h55 = get_cell_value("Kalkulation!H55")
-    j55 = get_cell_value("Kalkulation!J55")
-    return max(0, h55 - j55)
+    return max(0, get_cell_value("Kalkulation!H55") - get_cell_value("Kalkulation!J55"))
 
 def fkt_kalkulation_l55():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A55 = get_cell_value("Kalkulation!A55")
-    H55 = get_cell_value("Kalkulation!H55")
-    G55 = get_cell_value("Kalkulation!G55")
-
     try:
-        if A55 > n:
-            result = 0
-        elif A55 < t:
-            result = H55 / G55
-        else:
-            result = VS
-    except:
-        result = 0
-
-    return result
+        return 0 if get_cell_value("Kalkulation!A55") > n else get_cell_value("Kalkulation!H55") / get_cell_value("Kalkulation!G55") if get_cell_value("Kalkulation!A55") < t else VS
+    except Exception:
+        return 0
 
 def fkt_kalkulation_b56():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A56 = get_cell_value("Kalkulation!A56")
-
-    if A56 <= n:
-        return act_ngr_ax(x + A56, max(0, n - A56), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A56, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A56"), max(0, n - get_cell_value("Kalkulation!A56")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A56"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A56") <= n else 0
 
 def fkt_kalkulation_c56():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A56_value = get_cell_value("Kalkulation!A56")
-    return act_axn_k(x + A56_value, max(0, n - A56_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A56"), max(0, n - get_cell_value("Kalkulation!A56")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d56():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
+    return act_axn_k(x + get_cell_value("Kalkulation!A56"), max(0, t - get_cell_value("Kalkulation!A56")), Sex, Tafel, Zins, 1)
 
-    A56 = get_cell_value("Kalkulation!A56")
-    return act_axn_k(x + A56, max(0, t - A56), Sex, Tafel, Zins, 1)
-
-def fkt_kalkulation_e56() -> float:
-    B56 = get_cell_value("Kalkulation!B56")
-    D56 = get_cell_value("Kalkulation!D56")
-    C56 = get_cell_value("Kalkulation!C56")
-    gamma2 = get_excel_global('gamma2')
+def fkt_kalkulation_e56():
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B56 - P_xt * D56 + gamma2 * (C56 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D56)
+    return get_cell_value("Kalkulation!B56") - P_xt * get_cell_value("Kalkulation!D56") + gamma2 * (get_cell_value("Kalkulation!C56") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D56"))
 
 def fkt_kalkulation_f56():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E56")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E56")
 
 def fkt_kalkulation_g56():
     gamma3 = get_excel_global('gamma3')
@@ -5988,206 +4504,122 @@ def fkt_kalkulation_g56():
 
 def fkt_kalkulation_h56():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F56 = get_cell_value("Kalkulation!F56")
-    A56 = get_cell_value("Kalkulation!A56")
-
-    return F56 + alpha * t * BJB * act_axn_k(x + A56, max(5 - A56, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F56") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A56"), max(5 - get_cell_value("Kalkulation!A56"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i56():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A56 = get_cell_value("Kalkulation!A56")
-    return 1 if (x + A56 >= MinAlterFlex and A56 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A56") >= MinAlterFlex, get_cell_value("Kalkulation!A56") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j56():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A56 = get_cell_value("Kalkulation!A56")
-    I56 = get_cell_value("Kalkulation!I56")
-    F56 = get_cell_value("Kalkulation!F56")
-
-    if A56 > n or I56:
-        return 0
-    else:
-        inner_value = VS - F56
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A56") > n, get_cell_value("Kalkulation!I56"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F56"))))
 
 def fkt_kalkulation_k56():
-    h56 = get_cell_value("Kalkulation!H56")
-    j56 = get_cell_value("Kalkulation!J56")
-    return max(0, h56 - j56)
+    return max(0, get_cell_value("Kalkulation!H56") - get_cell_value("Kalkulation!J56"))
 
 def fkt_kalkulation_l56():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A56 = get_cell_value("Kalkulation!A56")
-    H56 = get_cell_value("Kalkulation!H56")
-    G56 = get_cell_value("Kalkulation!G56")
     try:
-        if A56 > n:
-            return 0
-        elif A56 < t:
-            return H56 / G56
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A56") > n else get_cell_value("Kalkulation!H56") / get_cell_value("Kalkulation!G56") if get_cell_value("Kalkulation!A56") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b57():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A57 = get_cell_value("Kalkulation!A57")
-
-    if A57 <= n:
-        return act_ngr_ax(x + A57, max(0, n - A57), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A57, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A57"), max(0, n - get_cell_value("Kalkulation!A57")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A57"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A57") <= n else 0
 
 def fkt_kalkulation_c57():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A57 = get_cell_value("Kalkulation!A57")
-    return act_axn_k(x + A57, max(0, n - A57), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A57"), max(0, n - get_cell_value("Kalkulation!A57")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d57():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A57_value = get_cell_value("Kalkulation!A57")
-    return act_axn_k(x + A57_value, max(0, t - A57_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A57"), max(0, t - get_cell_value("Kalkulation!A57")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e57():
-    B57 = get_cell_value("Kalkulation!B57")
-    D57 = get_cell_value("Kalkulation!D57")
-    C57 = get_cell_value("Kalkulation!C57")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B57 - P_xt * D57 + gamma2 * (C57 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D57)
-    return result
+    return get_cell_value("Kalkulation!B57") - P_xt * get_cell_value("Kalkulation!D57") + gamma2 * (get_cell_value("Kalkulation!C57") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D57"))
 
 def fkt_kalkulation_f57():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E57")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E57")
 
 def fkt_kalkulation_g57():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B57") + gamma3 * get_cell_value("Kalkulation!C57")
-    return value
+    return get_cell_value("Kalkulation!B57") + gamma3 * get_cell_value("Kalkulation!C57")
 
-def fkt_kalkulation_h57() -> float:
+def fkt_kalkulation_h57():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F57 = get_cell_value("Kalkulation!F57")
-    A57 = get_cell_value("Kalkulation!A57")
-
-    return F57 + alpha * t * BJB * act_axn_k(x + A57, max(5 - A57, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F57") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A57"), max(5 - get_cell_value("Kalkulation!A57"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i57():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A57 = get_cell_value("Kalkulation!A57")
-    return 1 if (x + A57 >= MinAlterFlex and A57 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A57") >= MinAlterFlex, get_cell_value("Kalkulation!A57") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j57():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A57 = get_cell_value("Kalkulation!A57")
-    I57 = get_cell_value("Kalkulation!I57")
-    F57 = get_cell_value("Kalkulation!F57")
-    if A57 > n or I57:
-        return 0
-    else:
-        inner_value = VS - F57
-        result = inner_value * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A57") > n, get_cell_value("Kalkulation!I57"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F57"))))
 
 def fkt_kalkulation_k57():
-    value = get_cell_value("Kalkulation!H57")
-    value2 = get_cell_value("Kalkulation!J57")
-    return max(0, value - value2)
+    return max(0, get_cell_value("Kalkulation!H57") - get_cell_value("Kalkulation!J57"))
 
 def fkt_kalkulation_l57():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A57 = get_cell_value("Kalkulation!A57")
-    H57 = get_cell_value("Kalkulation!H57")
-    G57 = get_cell_value("Kalkulation!G57")
     try:
-        if A57 > n:
-            return 0
-        elif A57 < t:
-            return H57 / G57
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A57") > n else get_cell_value("Kalkulation!H57") / get_cell_value("Kalkulation!G57") if get_cell_value("Kalkulation!A57") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b58():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A58 = get_cell_value("Kalkulation!A58")
-
-    if A58 <= n:
-        return act_ngr_ax(x + A58, max(0, n - A58), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A58, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A58"), max(0, n - get_cell_value("Kalkulation!A58")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A58"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A58") <= n else 0
 
 def fkt_kalkulation_c58():
     x = get_excel_global('x')
@@ -6195,123 +4627,76 @@ def fkt_kalkulation_c58():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A58_value = get_cell_value("Kalkulation!A58")
-    return act_axn_k(x + A58_value, max(0, n - A58_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A58"), max(0, n - get_cell_value("Kalkulation!A58")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d58():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A58_value = get_cell_value("Kalkulation!A58")
-    return act_axn_k(x + A58_value, max(0, t - A58_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A58"), max(0, t - get_cell_value("Kalkulation!A58")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e58():
-    B58 = get_cell_value("Kalkulation!B58")
-    D58 = get_cell_value("Kalkulation!D58")
-    C58 = get_cell_value("Kalkulation!C58")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B58 - P_xt * D58 + gamma2 * (C58 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D58)
+    return get_cell_value("Kalkulation!B58") - P_xt * get_cell_value("Kalkulation!D58") + gamma2 * (get_cell_value("Kalkulation!C58") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D58"))
 
 def fkt_kalkulation_f58():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E58")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E58")
 
 def fkt_kalkulation_g58():
     gamma3 = get_excel_global('gamma3')
-    B58 = get_cell_value("Kalkulation!B58")
-    C58 = get_cell_value("Kalkulation!C58")
-    return B58 + gamma3 * C58
+    return get_cell_value("Kalkulation!B58") + gamma3 * get_cell_value("Kalkulation!C58")
 
 def fkt_kalkulation_h58():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F58 = get_cell_value("Kalkulation!F58")
-    A58 = get_cell_value("Kalkulation!A58")
-
-    return F58 + alpha * t * BJB * act_axn_k(x + A58, max(5 - A58, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F58") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A58"), max(5 - get_cell_value("Kalkulation!A58"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i58():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A58 = get_cell_value("Kalkulation!A58")
-    return 1 if (x + A58 >= MinAlterFlex and A58 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A58") >= MinAlterFlex, get_cell_value("Kalkulation!A58") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j58():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A58 = get_cell_value("Kalkulation!A58")
-    I58 = get_cell_value("Kalkulation!I58")
-    F58 = get_cell_value("Kalkulation!F58")
-
-    if A58 > n or I58:
-        return 0
-    else:
-        inner_value = VS - F58
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A58") > n, get_cell_value("Kalkulation!I58"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F58"))))
 
 def fkt_kalkulation_k58():
-    H58 = get_cell_value("Kalkulation!H58")
-    J58 = get_cell_value("Kalkulation!J58")
-    return max(0, H58 - J58)
+    return max(0, get_cell_value("Kalkulation!H58") - get_cell_value("Kalkulation!J58"))
 
 def fkt_kalkulation_l58():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A58 = get_cell_value("Kalkulation!A58")
-    H58 = get_cell_value("Kalkulation!H58")
-    G58 = get_cell_value("Kalkulation!G58")
     try:
-        if A58 > n:
-            return 0
-        elif A58 < t:
-            return H58 / G58
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A58") > n else get_cell_value("Kalkulation!H58") / get_cell_value("Kalkulation!G58") if get_cell_value("Kalkulation!A58") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b59():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A59 = get_cell_value("Kalkulation!A59")
-
-    if A59 <= n:
-        return act_ngr_ax(x + A59, max(0, n - A59), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A59, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A59"), max(0, n - get_cell_value("Kalkulation!A59")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A59"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A59") <= n else 0
 
 def fkt_kalkulation_c59():
     x = get_excel_global('x')
@@ -6319,120 +4704,76 @@ def fkt_kalkulation_c59():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A59_value = get_cell_value("Kalkulation!A59")
-    return act_axn_k(x + A59_value, max(0, n - A59_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A59"), max(0, n - get_cell_value("Kalkulation!A59")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d59():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A59_value = get_cell_value("Kalkulation!A59")
-    return act_axn_k(x + A59_value, max(0, t - A59_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A59"), max(0, t - get_cell_value("Kalkulation!A59")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e59():
-    B59 = get_cell_value("Kalkulation!B59")
-    D59 = get_cell_value("Kalkulation!D59")
-    C59 = get_cell_value("Kalkulation!C59")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B59 - P_xt * D59 + gamma2 * (C59 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D59)
-    return result
+    return get_cell_value("Kalkulation!B59") - P_xt * get_cell_value("Kalkulation!D59") + gamma2 * (get_cell_value("Kalkulation!C59") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D59"))
 
 def fkt_kalkulation_f59():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E59")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E59")
 
 def fkt_kalkulation_g59():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B59") + gamma3 * get_cell_value("Kalkulation!C59")
-    return value
+    return get_cell_value("Kalkulation!B59") + gamma3 * get_cell_value("Kalkulation!C59")
 
 def fkt_kalkulation_h59():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F59 = get_cell_value("Kalkulation!F59")
-    A59 = get_cell_value("Kalkulation!A59")
-
-    return F59 + alpha * t * BJB * act_axn_k(x + A59, max(5 - A59, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F59") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A59"), max(5 - get_cell_value("Kalkulation!A59"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i59():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A59 = get_cell_value("Kalkulation!A59")
-    return 1 if (x + A59 >= MinAlterFlex and A59 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A59") >= MinAlterFlex, get_cell_value("Kalkulation!A59") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j59():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A59 = get_cell_value("Kalkulation!A59")
-    I59 = get_cell_value("Kalkulation!I59")
-    F59 = get_cell_value("Kalkulation!F59")
-    if A59 > n or I59:
-        return 0
-    else:
-        return min(150, max(50, 0.01 * (VS - F59)))
+    return 0 if any((get_cell_value("Kalkulation!A59") > n, get_cell_value("Kalkulation!I59"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F59"))))
 
 def fkt_kalkulation_k59():
-    h59 = get_cell_value("Kalkulation!H59")
-    j59 = get_cell_value("Kalkulation!J59")
-    return max(0, h59 - j59)
+    return max(0, get_cell_value("Kalkulation!H59") - get_cell_value("Kalkulation!J59"))
 
 def fkt_kalkulation_l59():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A59 = get_cell_value("Kalkulation!A59")
-    H59 = get_cell_value("Kalkulation!H59")
-    G59 = get_cell_value("Kalkulation!G59")
     try:
-        if A59 > n:
-            return 0
-        elif A59 < t:
-            return H59 / G59
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A59") > n else get_cell_value("Kalkulation!H59") / get_cell_value("Kalkulation!G59") if get_cell_value("Kalkulation!A59") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b60():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A60 = get_cell_value("Kalkulation!A60")
-
-    if A60 <= n:
-        return act_ngr_ax(x + A60, max(0, n - A60), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A60, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A60"), max(0, n - get_cell_value("Kalkulation!A60")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A60"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A60") <= n else 0
 
 def fkt_kalkulation_c60():
     x = get_excel_global('x')
@@ -6440,239 +4781,153 @@ def fkt_kalkulation_c60():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A60_value = get_cell_value("Kalkulation!A60")
-    alter = x + A60_value
-    n_value = max(0, n - A60_value)
-
-    return act_axn_k(alter, n_value, Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A60"), max(0, n - get_cell_value("Kalkulation!A60")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d60():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A60_value = get_cell_value("Kalkulation!A60")
-    return act_axn_k(x + A60_value, max(0, t - A60_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A60"), max(0, t - get_cell_value("Kalkulation!A60")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e60():
-    B60 = get_cell_value("Kalkulation!B60")
-    D60 = get_cell_value("Kalkulation!D60")
-    C60 = get_cell_value("Kalkulation!C60")
+    P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-    P_xt = get_excel_global('P_xt')
-    gamma2 = get_excel_global('gamma2')
-
-    return B60 - P_xt * D60 + gamma2 * (C60 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D60)
+    return get_cell_value("Kalkulation!B60") - P_xt * get_cell_value("Kalkulation!D60") + gamma2 * (get_cell_value("Kalkulation!C60") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D60"))
 
 def fkt_kalkulation_f60():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E60")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E60")
 
 def fkt_kalkulation_g60():
     gamma3 = get_excel_global('gamma3')
-    B60 = get_cell_value("Kalkulation!B60")
-    C60 = get_cell_value("Kalkulation!C60")
-    return B60 + gamma3 * C60
+    return get_cell_value("Kalkulation!B60") + gamma3 * get_cell_value("Kalkulation!C60")
 
 def fkt_kalkulation_h60():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F60 = get_cell_value("Kalkulation!F60")
-    A60 = get_cell_value("Kalkulation!A60")
-
-    return F60 + alpha * t * BJB * act_axn_k(x + A60, max(5 - A60, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F60") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A60"), max(5 - get_cell_value("Kalkulation!A60"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i60():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A60 = get_cell_value("Kalkulation!A60")
-    return 1 if (x + A60 >= MinAlterFlex and A60 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A60") >= MinAlterFlex, get_cell_value("Kalkulation!A60") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j60():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A60 = get_cell_value("Kalkulation!A60")
-    I60 = get_cell_value("Kalkulation!I60")
-    F60 = get_cell_value("Kalkulation!F60")
-    return 0 if (A60 > n) or I60 else min(150, max(50, 0.01 * (VS - F60)))
+    return 0 if any((get_cell_value("Kalkulation!A60") > n, get_cell_value("Kalkulation!I60"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F60"))))
 
 def fkt_kalkulation_k60():
-    h60 = get_cell_value("Kalkulation!H60")
-    j60 = get_cell_value("Kalkulation!J60")
-    return max(0, h60 - j60)
+    return max(0, get_cell_value("Kalkulation!H60") - get_cell_value("Kalkulation!J60"))
 
 def fkt_kalkulation_l60():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A60 = get_cell_value("Kalkulation!A60")
-    H60 = get_cell_value("Kalkulation!H60")
-    G60 = get_cell_value("Kalkulation!G60")
     try:
-        if A60 > n:
-            return 0
-        elif A60 < t:
-            return H60 / G60
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A60") > n else get_cell_value("Kalkulation!H60") / get_cell_value("Kalkulation!G60") if get_cell_value("Kalkulation!A60") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b61():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A61 = get_cell_value("Kalkulation!A61")
-
-    if A61 <= n:
-        return act_ngr_ax(x + A61, max(0, n - A61), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A61, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A61"), max(0, n - get_cell_value("Kalkulation!A61")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A61"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A61") <= n else 0
 
 def fkt_kalkulation_c61():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!C61")
-    a61_val = get_cell_value("Kalkulation!A61")
-    return act_axn_k(x_val + a61_val, max(0, n - a61_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A61"), max(0, n - get_cell_value("Kalkulation!A61")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d61():
     x = get_excel_global('x')
     t = get_excel_global('t')
-    A61 = get_cell_value("Kalkulation!A61")
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    return act_axn_k(x + A61, max(0, t - A61), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A61"), max(0, t - get_cell_value("Kalkulation!A61")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e61():
-    B61 = get_cell_value("Kalkulation!B61")
     P_xt = get_excel_global('P_xt')
-    D61 = get_cell_value("Kalkulation!D61")
     gamma2 = get_excel_global('gamma2')
-    C61 = get_cell_value("Kalkulation!C61")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B61 - P_xt * D61 + gamma2 * (C61 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D61)
+    return get_cell_value("Kalkulation!B61") - P_xt * get_cell_value("Kalkulation!D61") + gamma2 * (get_cell_value("Kalkulation!C61") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D61"))
 
 def fkt_kalkulation_f61():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E61")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E61")
 
 def fkt_kalkulation_g61():
     gamma3 = get_excel_global('gamma3')
-    B61 = get_cell_value("Kalkulation!B61")
-    C61 = get_cell_value("Kalkulation!C61")
-    return B61 + gamma3 * C61
+    return get_cell_value("Kalkulation!B61") + gamma3 * get_cell_value("Kalkulation!C61")
 
 def fkt_kalkulation_h61():
     alpha = get_excel_global('alpha')
-    BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
     t = get_excel_global('t')
-    Tafel = get_excel_global('Tafel')
+    BJB = get_excel_global('BJB')
     x = get_excel_global('x')
+    Sex = get_excel_global('Sex')
+    Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    F61 = get_cell_value("Kalkulation!F61")
-    A61 = get_cell_value("Kalkulation!A61")
-
-    return F61 + alpha * t * BJB * act_axn_k(x + A61, max(5 - A61, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F61") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A61"), max(5 - get_cell_value("Kalkulation!A61"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i61():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A61 = get_cell_value("Kalkulation!A61")
-    return 1 if (x + A61 >= MinAlterFlex and A61 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A61") >= MinAlterFlex, get_cell_value("Kalkulation!A61") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j61():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A61 = get_cell_value("Kalkulation!A61")
-    I61 = get_cell_value("Kalkulation!I61")
-    F61 = get_cell_value("Kalkulation!F61")
-    return 0 if (A61 > n) or I61 else min(150, max(50, 0.01 * (VS - F61)))
+    return 0 if any((get_cell_value("Kalkulation!A61") > n, get_cell_value("Kalkulation!I61"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F61"))))
 
 def fkt_kalkulation_k61():
-    h61 = get_cell_value("Kalkulation!H61")
-    j61 = get_cell_value("Kalkulation!J61")
-    return max(0, h61 - j61)
+    return max(0, get_cell_value("Kalkulation!H61") - get_cell_value("Kalkulation!J61"))
 
 def fkt_kalkulation_l61():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A61 = get_cell_value("Kalkulation!A61")
-    H61 = get_cell_value("Kalkulation!H61")
-    G61 = get_cell_value("Kalkulation!G61")
     try:
-        if A61 > n:
-            return 0
-        elif A61 < t:
-            return H61 / G61
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A61") > n else get_cell_value("Kalkulation!H61") / get_cell_value("Kalkulation!G61") if get_cell_value("Kalkulation!A61") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b62():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A62 = get_cell_value("Kalkulation!A62")
-
-    if A62 <= n:
-        return act_ngr_ax(x + A62, max(0, n - A62), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A62, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A62"), max(0, n - get_cell_value("Kalkulation!A62")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A62"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A62") <= n else 0
 
 def fkt_kalkulation_c62():
     x = get_excel_global('x')
@@ -6680,133 +4935,84 @@ def fkt_kalkulation_c62():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A62_value = get_cell_value("Kalkulation!A62")
-    return act_axn_k(x + A62_value, max(0, n - A62_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A62"), max(0, n - get_cell_value("Kalkulation!A62")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d62():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_val = get_cell_value("Kalkulation!D62")
-    a62_val = get_cell_value("Kalkulation!A62")
-    return act_axn_k(x_val + a62_val, max(0, t - a62_val), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A62"), max(0, t - get_cell_value("Kalkulation!A62")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e62():
-    B62 = get_cell_value("Kalkulation!B62")
     P_xt = get_excel_global('P_xt')
-    D62 = get_cell_value("Kalkulation!D62")
     gamma2 = get_excel_global('gamma2')
-    C62 = get_cell_value("Kalkulation!C62")
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B62 - P_xt * D62 + gamma2 * (C62 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D62)
+    return get_cell_value("Kalkulation!B62") - P_xt * get_cell_value("Kalkulation!D62") + gamma2 * (get_cell_value("Kalkulation!C62") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D62"))
 
 def fkt_kalkulation_f62():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E62")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E62")
 
 def fkt_kalkulation_g62():
     gamma3 = get_excel_global('gamma3')
-    B62 = get_cell_value("Kalkulation!B62")
-    C62 = get_cell_value("Kalkulation!C62")
-    return B62 + gamma3 * C62
+    return get_cell_value("Kalkulation!B62") + gamma3 * get_cell_value("Kalkulation!C62")
 
 def fkt_kalkulation_h62():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F62 = get_cell_value("Kalkulation!F62")
-    A62 = get_cell_value("Kalkulation!A62")
-
-    return F62 + alpha * t * BJB * act_axn_k(x + A62, max(5 - A62, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F62") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A62"), max(5 - get_cell_value("Kalkulation!A62"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i62():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A62 = get_cell_value("Kalkulation!A62")
-    return 1 if (x + A62 >= MinAlterFlex and A62 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A62") >= MinAlterFlex, get_cell_value("Kalkulation!A62") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j62():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A62 = get_cell_value("Kalkulation!A62")
-    F62 = get_cell_value("Kalkulation!F62")
-    I62 = get_cell_value("Kalkulation!I62")
-    if A62 > n or I62:
-        return 0
-    else:
-        inner_value = VS - F62
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A62") > n, get_cell_value("Kalkulation!I62"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F62"))))
 
 def fkt_kalkulation_k62():
-    H62 = get_cell_value("Kalkulation!H62")
-    J62 = get_cell_value("Kalkulation!J62")
-    return max(0, H62 - J62)
+    return max(0, get_cell_value("Kalkulation!H62") - get_cell_value("Kalkulation!J62"))
 
 def fkt_kalkulation_l62():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A62 = get_cell_value("Kalkulation!A62")
-    H62 = get_cell_value("Kalkulation!H62")
-    G62 = get_cell_value("Kalkulation!G62")
     try:
-        if A62 > n:
-            return 0
-        elif A62 < t:
-            return H62 / G62
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A62") > n else get_cell_value("Kalkulation!H62") / get_cell_value("Kalkulation!G62") if get_cell_value("Kalkulation!A62") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b63():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-    A63 = get_cell_value("Kalkulation!A63")
-    if A63 <= n:
-        return act_ngr_ax(x + A63, max(0, n - A63), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A63, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A63"), max(0, n - get_cell_value("Kalkulation!A63")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A63"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A63") <= n else 0
 
 def fkt_kalkulation_c63():
-    k = get_excel_global('k')
+    x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A63_value = get_cell_value("Kalkulation!A63")
-    return act_axn_k(x + A63_value, max(0, n - A63_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A63"), max(0, n - get_cell_value("Kalkulation!A63")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d63():
     x = get_excel_global('x')
@@ -6814,111 +5020,68 @@ def fkt_kalkulation_d63():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A63_value = get_cell_value("Kalkulation!A63")
-    return act_axn_k(x + A63_value, max(0, t - A63_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A63"), max(0, t - get_cell_value("Kalkulation!A63")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e63():
-    B63 = get_cell_value("Kalkulation!B63")
-    D63 = get_cell_value("Kalkulation!D63")
-    C63 = get_cell_value("Kalkulation!C63")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    result = B63 - P_xt * D63 + gamma2 * (C63 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D63)
-    return result
+    return get_cell_value("Kalkulation!B63") - P_xt * get_cell_value("Kalkulation!D63") + gamma2 * (get_cell_value("Kalkulation!C63") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D63"))
 
 def fkt_kalkulation_f63():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E63")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E63")
 
 def fkt_kalkulation_g63():
     gamma3 = get_excel_global('gamma3')
-    B63 = get_cell_value("Kalkulation!B63")
-    C63 = get_cell_value("Kalkulation!C63")
-    return B63 + gamma3 * C63
+    return get_cell_value("Kalkulation!B63") + gamma3 * get_cell_value("Kalkulation!C63")
 
 def fkt_kalkulation_h63():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F63 = get_cell_value("Kalkulation!F63")
-    A63 = get_cell_value("Kalkulation!A63")
-
-    return F63 + alpha * t * BJB * act_axn_k(x + A63, max(5 - A63, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F63") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A63"), max(5 - get_cell_value("Kalkulation!A63"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i63():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A63 = get_cell_value("Kalkulation!A63")
-    return 1 if (x + A63 >= MinAlterFlex and A63 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A63") >= MinAlterFlex, get_cell_value("Kalkulation!A63") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j63():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A63 = get_cell_value("Kalkulation!A63")
-    F63 = get_cell_value("Kalkulation!F63")
-    I63 = get_cell_value("Kalkulation!I63")
-    if A63 > n or I63:
-        return 0
-    else:
-        inner_value = VS - F63
-        result = min(150, max(50, 0.01 * inner_value))
-        return result
+    return 0 if any((get_cell_value("Kalkulation!A63") > n, get_cell_value("Kalkulation!I63"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F63"))))
 
 def fkt_kalkulation_k63():
-    H63 = get_cell_value("Kalkulation!H63")
-    J63 = get_cell_value("Kalkulation!J63")
-    return max(0, H63 - J63)
+    return max(0, get_cell_value("Kalkulation!H63") - get_cell_value("Kalkulation!J63"))
 
 def fkt_kalkulation_l63():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A63 = get_cell_value("Kalkulation!A63")
-    H63 = get_cell_value("Kalkulation!H63")
-    G63 = get_cell_value("Kalkulation!G63")
     try:
-        if A63 > n:
-            return 0
-        elif A63 < t:
-            return H63 / G63
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A63") > n else get_cell_value("Kalkulation!H63") / get_cell_value("Kalkulation!G63") if get_cell_value("Kalkulation!A63") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b64():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A64 = get_cell_value("Kalkulation!A64")
-
-    if A64 <= n:
-        return act_ngr_ax(x + A64, max(0, n - A64), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A64, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A64"), max(0, n - get_cell_value("Kalkulation!A64")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A64"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A64") <= n else 0
 
 def fkt_kalkulation_c64():
     x = get_excel_global('x')
@@ -6926,9 +5089,7 @@ def fkt_kalkulation_c64():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A64_value = get_cell_value("Kalkulation!A64")
-    return act_axn_k(x + A64_value, max(0, n - A64_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A64"), max(0, n - get_cell_value("Kalkulation!A64")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d64():
     x = get_excel_global('x')
@@ -6936,106 +5097,68 @@ def fkt_kalkulation_d64():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A64_value = get_cell_value("Kalkulation!A64")
-    return act_axn_k(x + A64_value, max(0, t - A64_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A64"), max(0, t - get_cell_value("Kalkulation!A64")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e64():
-    B64 = get_cell_value("Kalkulation!B64")
-    D64 = get_cell_value("Kalkulation!D64")
-    C64 = get_cell_value("Kalkulation!C64")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B64 - P_xt * D64 + gamma2 * (C64 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D64)
+    return get_cell_value("Kalkulation!B64") - P_xt * get_cell_value("Kalkulation!D64") + gamma2 * (get_cell_value("Kalkulation!C64") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D64"))
 
 def fkt_kalkulation_f64():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E64")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E64")
 
 def fkt_kalkulation_g64():
     gamma3 = get_excel_global('gamma3')
-    B64 = get_cell_value("Kalkulation!B64")
-    C64 = get_cell_value("Kalkulation!C64")
-    return B64 + gamma3 * C64
+    return get_cell_value("Kalkulation!B64") + gamma3 * get_cell_value("Kalkulation!C64")
 
 def fkt_kalkulation_h64():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F64 = get_cell_value("Kalkulation!F64")
-    A64 = get_cell_value("Kalkulation!A64")
-
-    result = F64 + alpha * t * BJB * act_axn_k(x + A64, max(5 - A64, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
-    return result
+    return get_cell_value("Kalkulation!F64") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A64"), max(5 - get_cell_value("Kalkulation!A64"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i64():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A64 = get_cell_value("Kalkulation!A64")
-    return 1 if (x + A64 >= MinAlterFlex and A64 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A64") >= MinAlterFlex, get_cell_value("Kalkulation!A64") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j64():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A64 = get_cell_value("Kalkulation!A64")
-    I64 = get_cell_value("Kalkulation!I64")
-    F64 = get_cell_value("Kalkulation!F64")
-    return 0 if (A64 > n) or I64 else min(150, max(50, 0.01 * (VS - F64)))
+    return 0 if any((get_cell_value("Kalkulation!A64") > n, get_cell_value("Kalkulation!I64"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F64"))))
 
 def fkt_kalkulation_k64():
-    H64 = get_cell_value("Kalkulation!H64")
-    J64 = get_cell_value("Kalkulation!J64")
-    return max(0, H64 - J64)
+    return max(0, get_cell_value("Kalkulation!H64") - get_cell_value("Kalkulation!J64"))
 
 def fkt_kalkulation_l64():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A64 = get_cell_value("Kalkulation!A64")
-    H64 = get_cell_value("Kalkulation!H64")
-    G64 = get_cell_value("Kalkulation!G64")
     try:
-        if A64 > n:
-            return 0
-        elif A64 < t:
-            return H64 / G64
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A64") > n else get_cell_value("Kalkulation!H64") / get_cell_value("Kalkulation!G64") if get_cell_value("Kalkulation!A64") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b65():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A65 = get_cell_value("Kalkulation!A65")
-
-    if A65 <= n:
-        return act_ngr_ax(x + A65, max(0, n - A65), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A65, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A65"), max(0, n - get_cell_value("Kalkulation!A65")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A65"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A65") <= n else 0
 
 def fkt_kalkulation_c65():
     x = get_excel_global('x')
@@ -7043,119 +5166,76 @@ def fkt_kalkulation_c65():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A65_value = get_cell_value("Kalkulation!A65")
-    return act_axn_k(x + A65_value, max(0, n - A65_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A65"), max(0, n - get_cell_value("Kalkulation!A65")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d65():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    x_value = x + get_cell_value("Kalkulation!A65")
-    t_value = t - get_cell_value("Kalkulation!A65")
-    max_value = max(0, t_value)
-
-    return act_axn_k(alter=x_value, n=max_value, sex=Sex, tafel=Tafel, zins=Zins, k=1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A65"), max(0, t - get_cell_value("Kalkulation!A65")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e65():
-    B65 = get_cell_value("Kalkulation!B65")
-    D65 = get_cell_value("Kalkulation!D65")
-    C65 = get_cell_value("Kalkulation!C65")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B65 - P_xt * D65 + gamma2 * (C65 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D65)
+    return get_cell_value("Kalkulation!B65") - P_xt * get_cell_value("Kalkulation!D65") + gamma2 * (get_cell_value("Kalkulation!C65") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D65"))
 
 def fkt_kalkulation_f65():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E65")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E65")
 
 def fkt_kalkulation_g65():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B65") + gamma3 * get_cell_value("Kalkulation!C65")
-    return value
+    return get_cell_value("Kalkulation!B65") + gamma3 * get_cell_value("Kalkulation!C65")
 
 def fkt_kalkulation_h65():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F65 = get_cell_value("Kalkulation!F65")
-    A65 = get_cell_value("Kalkulation!A65")
-
-    return F65 + alpha * t * BJB * act_axn_k(x + A65, max(5 - A65, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F65") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A65"), max(5 - get_cell_value("Kalkulation!A65"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i65():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
-    MinRLZFlex = get_excel_global('MinRLZFlex')
     n = get_excel_global('n')
-    t = get_excel_global('t')
-    x = get_excel_global('x')
-    A65 = get_cell_value("Kalkulation!A65")
-    return 1 if (x + A65 >= MinAlterFlex and A65 >= n - MinRLZFlex) else 0
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A65") >= MinAlterFlex, get_cell_value("Kalkulation!A65") >= n - MinRLZFlex)) else 0
 
 def fkt_kalkulation_j65():
     n = get_excel_global('n')
     VS = get_excel_global('VS')
-    A65 = get_cell_value("Kalkulation!A65")
-    I65 = get_cell_value("Kalkulation!I65")
-    F65 = get_cell_value("Kalkulation!F65")
-    return 0 if (A65 > n) or I65 else min(150, max(50, 0.01 * (VS - F65)))
+    return 0 if any((get_cell_value("Kalkulation!A65") > n, get_cell_value("Kalkulation!I65"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F65"))))
 
 def fkt_kalkulation_k65():
-    h65 = get_cell_value("Kalkulation!H65")
-    j65 = get_cell_value("Kalkulation!J65")
-    return max(0, h65 - j65)
+    return max(0, get_cell_value("Kalkulation!H65") - get_cell_value("Kalkulation!J65"))
 
 def fkt_kalkulation_l65():
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A65 = get_cell_value("Kalkulation!A65")
-    H65 = get_cell_value("Kalkulation!H65")
-    G65 = get_cell_value("Kalkulation!G65")
     try:
-        if A65 > n:
-            return 0
-        elif A65 < t:
-            return H65 / G65
-        else:
-            return VS
-    except:
+        return 0 if get_cell_value("Kalkulation!A65") > n else get_cell_value("Kalkulation!H65") / get_cell_value("Kalkulation!G65") if get_cell_value("Kalkulation!A65") < t else VS
+    except Exception:
         return 0
 
 def fkt_kalkulation_b66():
     n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A66 = get_cell_value("Kalkulation!A66")
-
-    if A66 <= n:
-        return act_ngr_ax(x + A66, max(0, n - A66), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + A66, Sex, Tafel, Zins)
-    else:
-        return 0
+    return act_ngr_ax(x + get_cell_value("Kalkulation!A66"), max(0, n - get_cell_value("Kalkulation!A66")), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + get_cell_value("Kalkulation!A66"), Sex, Tafel, Zins) if get_cell_value("Kalkulation!A66") <= n else 0
 
 def fkt_kalkulation_c66():
     x = get_excel_global('x')
@@ -7163,106 +5243,3272 @@ def fkt_kalkulation_c66():
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
-
-    A66_value = get_cell_value("Kalkulation!A66")
-    return act_axn_k(x + A66_value, max(0, n - A66_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A66"), max(0, n - get_cell_value("Kalkulation!A66")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_d66():
-    k = get_excel_global('k')
-    n = get_excel_global('n')
-    Sex = get_excel_global('Sex')
+    x = get_excel_global('x')
     t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    A66_value = get_cell_value("Kalkulation!A66")
-    return act_axn_k(x + A66_value, max(0, t - A66_value), Sex, Tafel, Zins, 1)
+    return act_axn_k(x + get_cell_value("Kalkulation!A66"), max(0, t - get_cell_value("Kalkulation!A66")), Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_e66():
-    B66 = get_cell_value("Kalkulation!B66")
-    D66 = get_cell_value("Kalkulation!D66")
-    C66 = get_cell_value("Kalkulation!C66")
-    gamma2 = get_excel_global('gamma2')
     P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
     x = get_excel_global('x')
     n = get_excel_global('n')
     Sex = get_excel_global('Sex')
     Tafel = get_excel_global('Tafel')
     Zins = get_excel_global('Zins')
     t = get_excel_global('t')
-
-    return B66 - P_xt * D66 + gamma2 * (C66 - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * D66)
+    return get_cell_value("Kalkulation!B66") - P_xt * get_cell_value("Kalkulation!D66") + gamma2 * (get_cell_value("Kalkulation!C66") - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * get_cell_value("Kalkulation!D66"))
 
 def fkt_kalkulation_f66():
     VS = get_excel_global('VS')
-    value = get_cell_value("Kalkulation!E66")
-    return VS * value
+    return VS * get_cell_value("Kalkulation!E66")
 
 def fkt_kalkulation_g66():
     gamma3 = get_excel_global('gamma3')
-    value = get_cell_value("Kalkulation!B66") + gamma3 * get_cell_value("Kalkulation!C66")
-    return value
+    return get_cell_value("Kalkulation!B66") + gamma3 * get_cell_value("Kalkulation!C66")
 
 def fkt_kalkulation_h66():
     alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
     BJB = get_excel_global('BJB')
-    k = get_excel_global('k')
-    n = get_excel_global('n')
+    x = get_excel_global('x')
     Sex = get_excel_global('Sex')
-    t = get_excel_global('t')
     Tafel = get_excel_global('Tafel')
-    x = get_excel_global('x')
     Zins = get_excel_global('Zins')
-
-    F66 = get_cell_value("Kalkulation!F66")
-    A66 = get_cell_value("Kalkulation!A66")
-
-    return F66 + alpha * t * BJB * act_axn_k(x + A66, max(5 - A66, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
+    return get_cell_value("Kalkulation!F66") + alpha * t * BJB * act_axn_k(x + get_cell_value("Kalkulation!A66"), max(5 - get_cell_value("Kalkulation!A66"), 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1)
 
 def fkt_kalkulation_i66():
+    x = get_excel_global('x')
     MinAlterFlex = get_excel_global('MinAlterFlex')
+    n = get_excel_global('n')
     MinRLZFlex = get_excel_global('MinRLZFlex')
+    return 1 if all((x + get_cell_value("Kalkulation!A66") >= MinAlterFlex, get_cell_value("Kalkulation!A66") >= n - MinRLZFlex)) else 0
+
+def fkt_kalkulation_j66():
+    n = get_excel_global('n')
+    VS = get_excel_global('VS')
+    return 0 if any((get_cell_value("Kalkulation!A66") > n, get_cell_value("Kalkulation!I66"))) else min(150, max(50, 0.01 * (VS - get_cell_value("Kalkulation!F66"))))
+
+def fkt_kalkulation_k66():
+    return max(0, get_cell_value("Kalkulation!H66") - get_cell_value("Kalkulation!J66"))
+
+def fkt_kalkulation_l66():
     n = get_excel_global('n')
     t = get_excel_global('t')
+    VS = get_excel_global('VS')
+    try:
+        return 0 if get_cell_value("Kalkulation!A66") > n else get_cell_value("Kalkulation!H66") / get_cell_value("Kalkulation!G66") if get_cell_value("Kalkulation!A66") < t else VS
+    except Exception:
+        return 0
+
+def rows_kalkulation_b16_b66(col_a):
+    """
+    Kalkulation!B16 ... Kalkulation!B66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    n = get_excel_global('n')
     x = get_excel_global('x')
-    A66 = get_cell_value("Kalkulation!A66")
-    return 1 if (x + A66 >= MinAlterFlex and A66 >= n - MinRLZFlex) else 0
+    Sex = get_excel_global('Sex')
+    Tafel = get_excel_global('Tafel')
+    Zins = get_excel_global('Zins')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(np.where(col_a <= n, act_ngr_ax(x + col_a, np.maximum(0, n - col_a), Sex, Tafel, Zins) + act_dx(x + n, Sex, Tafel, Zins) / act_dx(x + col_a, Sex, Tafel, Zins), 0))
 
-def fkt_kalkulation_j66():
+def rows_kalkulation_c16_c66(col_a):
+    """
+    Kalkulation!C16 ... Kalkulation!C66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    x = get_excel_global('x')
+    n = get_excel_global('n')
+    Sex = get_excel_global('Sex')
+    Tafel = get_excel_global('Tafel')
+    Zins = get_excel_global('Zins')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(act_axn_k(x + col_a, np.maximum(0, n - col_a), Sex, Tafel, Zins, 1))
+
+def rows_kalkulation_d16_d66(col_a):
+    """
+    Kalkulation!D16 ... Kalkulation!D66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    x = get_excel_global('x')
+    t = get_excel_global('t')
+    Sex = get_excel_global('Sex')
+    Tafel = get_excel_global('Tafel')
+    Zins = get_excel_global('Zins')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(act_axn_k(x + col_a, np.maximum(0, t - col_a), Sex, Tafel, Zins, 1))
+
+def rows_kalkulation_e16_e66(col_b, col_d, col_c):
+    """
+    Kalkulation!E16 ... Kalkulation!E66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    P_xt = get_excel_global('P_xt')
+    gamma2 = get_excel_global('gamma2')
+    x = get_excel_global('x')
     n = get_excel_global('n')
+    Sex = get_excel_global('Sex')
+    Tafel = get_excel_global('Tafel')
+    Zins = get_excel_global('Zins')
+    t = get_excel_global('t')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(col_b - P_xt * col_d + gamma2 * (col_c - act_axn_k(x, n, Sex, Tafel, Zins, 1) / act_axn_k(x, t, Sex, Tafel, Zins, 1) * col_d))
+
+def rows_kalkulation_f16_f66(col_e):
+    """
+    Kalkulation!F16 ... Kalkulation!F66 als Array, siehe xl_macro.xl_row_vector.
+    """
     VS = get_excel_global('VS')
-    A66 = get_cell_value("Kalkulation!A66")
-    I66 = get_cell_value("Kalkulation!I66")
-    F66 = get_cell_value("Kalkulation!F66")
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(VS * col_e)
 
-    if A66 > n or I66:
-        return 0
-    else:
-        result = VS - F66
-        result = result * 0.01
-        result = max(50, result)
-        result = min(150, result)
-        return result
+def rows_kalkulation_g16_g66(col_b, col_c):
+    """
+    Kalkulation!G16 ... Kalkulation!G66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    gamma3 = get_excel_global('gamma3')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(col_b + gamma3 * col_c)
 
-def fkt_kalkulation_k66():
-    h66 = get_cell_value("Kalkulation!H66")
-    j66 = get_cell_value("Kalkulation!J66")
-    return max(0, h66 - j66)
+def rows_kalkulation_h16_h66(col_f, col_a):
+    """
+    Kalkulation!H16 ... Kalkulation!H66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    alpha = get_excel_global('alpha')
+    t = get_excel_global('t')
+    BJB = get_excel_global('BJB')
+    x = get_excel_global('x')
+    Sex = get_excel_global('Sex')
+    Tafel = get_excel_global('Tafel')
+    Zins = get_excel_global('Zins')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(col_f + alpha * t * BJB * act_axn_k(x + col_a, np.maximum(5 - col_a, 0), Sex, Tafel, Zins, 1) / act_axn_k(x, 5, Sex, Tafel, Zins, 1))
 
-def fkt_kalkulation_l66():
+def rows_kalkulation_i16_i66(col_a):
+    """
+    Kalkulation!I16 ... Kalkulation!I66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    x = get_excel_global('x')
+    MinAlterFlex = get_excel_global('MinAlterFlex')
+    n = get_excel_global('n')
+    MinRLZFlex = get_excel_global('MinRLZFlex')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(np.where(np.logical_and(x + col_a >= MinAlterFlex, col_a >= n - MinRLZFlex), 1, 0))
+
+def rows_kalkulation_j16_j66(col_a, col_i, col_f):
+    """
+    Kalkulation!J16 ... Kalkulation!J66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    n = get_excel_global('n')
+    VS = get_excel_global('VS')
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(np.where(np.logical_or(col_a > n, col_i), 0, np.minimum(150, np.maximum(50, 0.01 * (VS - col_f)))))
+
+def rows_kalkulation_k16_k66(col_h, col_j):
+    """
+    Kalkulation!K16 ... Kalkulation!K66 als Array, siehe xl_macro.xl_row_vector.
+    """
+    with np.errstate(divide='raise', invalid='raise'):
+        return np.asarray(np.maximum(0, col_h - col_j))
+
+def rows_kalkulation_l16_l66(col_a, col_h, col_g):
+    """
+    Kalkulation!L16 ... Kalkulation!L66 als Array, siehe xl_macro.xl_row_vector.
+    """
     n = get_excel_global('n')
     t = get_excel_global('t')
     VS = get_excel_global('VS')
-    A66 = get_cell_value("Kalkulation!A66")
-    H66 = get_cell_value("Kalkulation!H66")
-    G66 = get_cell_value("Kalkulation!G66")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = np.asarray(np.where(col_a > n, 0, np.where(col_a < t, col_h / col_g, VS)), dtype=float)
+    return np.where(np.isfinite(result), result, 0)
+
+CELL_DISPATCH = {
+    'Kalkulation!K5': fkt_kalkulation_k5,
+    'Kalkulation!K6': fkt_kalkulation_k6,
+    'Kalkulation!K7': fkt_kalkulation_k7,
+    'Kalkulation!K9': fkt_kalkulation_k9,
+    'Kalkulation!E12': fkt_kalkulation_e12,
+    'Kalkulation!B16': fkt_kalkulation_b16,
+    'Kalkulation!C16': fkt_kalkulation_c16,
+    'Kalkulation!D16': fkt_kalkulation_d16,
+    'Kalkulation!E16': fkt_kalkulation_e16,
+    'Kalkulation!F16': fkt_kalkulation_f16,
+    'Kalkulation!G16': fkt_kalkulation_g16,
+    'Kalkulation!H16': fkt_kalkulation_h16,
+    'Kalkulation!I16': fkt_kalkulation_i16,
+    'Kalkulation!J16': fkt_kalkulation_j16,
+    'Kalkulation!K16': fkt_kalkulation_k16,
+    'Kalkulation!L16': fkt_kalkulation_l16,
+    'Kalkulation!B17': fkt_kalkulation_b17,
+    'Kalkulation!C17': fkt_kalkulation_c17,
+    'Kalkulation!D17': fkt_kalkulation_d17,
+    'Kalkulation!E17': fkt_kalkulation_e17,
+    'Kalkulation!F17': fkt_kalkulation_f17,
+    'Kalkulation!G17': fkt_kalkulation_g17,
+    'Kalkulation!H17': fkt_kalkulation_h17,
+    'Kalkulation!I17': fkt_kalkulation_i17,
+    'Kalkulation!J17': fkt_kalkulation_j17,
+    'Kalkulation!K17': fkt_kalkulation_k17,
+    'Kalkulation!L17': fkt_kalkulation_l17,
+    'Kalkulation!B18': fkt_kalkulation_b18,
+    'Kalkulation!C18': fkt_kalkulation_c18,
+    'Kalkulation!D18': fkt_kalkulation_d18,
+    'Kalkulation!E18': fkt_kalkulation_e18,
+    'Kalkulation!F18': fkt_kalkulation_f18,
+    'Kalkulation!G18': fkt_kalkulation_g18,
+    'Kalkulation!H18': fkt_kalkulation_h18,
+    'Kalkulation!I18': fkt_kalkulation_i18,
+    'Kalkulation!J18': fkt_kalkulation_j18,
+    'Kalkulation!K18': fkt_kalkulation_k18,
+    'Kalkulation!L18': fkt_kalkulation_l18,
+    'Kalkulation!B19': fkt_kalkulation_b19,
+    'Kalkulation!C19': fkt_kalkulation_c19,
+    'Kalkulation!D19': fkt_kalkulation_d19,
+    'Kalkulation!E19': fkt_kalkulation_e19,
+    'Kalkulation!F19': fkt_kalkulation_f19,
+    'Kalkulation!G19': fkt_kalkulation_g19,
+    'Kalkulation!H19': fkt_kalkulation_h19,
+    'Kalkulation!I19': fkt_kalkulation_i19,
+    'Kalkulation!J19': fkt_kalkulation_j19,
+    'Kalkulation!K19': fkt_kalkulation_k19,
+    'Kalkulation!L19': fkt_kalkulation_l19,
+    'Kalkulation!B20': fkt_kalkulation_b20,
+    'Kalkulation!C20': fkt_kalkulation_c20,
+    'Kalkulation!D20': fkt_kalkulation_d20,
+    'Kalkulation!E20': fkt_kalkulation_e20,
+    'Kalkulation!F20': fkt_kalkulation_f20,
+    'Kalkulation!G20': fkt_kalkulation_g20,
+    'Kalkulation!H20': fkt_kalkulation_h20,
+    'Kalkulation!I20': fkt_kalkulation_i20,
+    'Kalkulation!J20': fkt_kalkulation_j20,
+    'Kalkulation!K20': fkt_kalkulation_k20,
+    'Kalkulation!L20': fkt_kalkulation_l20,
+    'Kalkulation!B21': fkt_kalkulation_b21,
+    'Kalkulation!C21': fkt_kalkulation_c21,
+    'Kalkulation!D21': fkt_kalkulation_d21,
+    'Kalkulation!E21': fkt_kalkulation_e21,
+    'Kalkulation!F21': fkt_kalkulation_f21,
+    'Kalkulation!G21': fkt_kalkulation_g21,
+    'Kalkulation!H21': fkt_kalkulation_h21,
+    'Kalkulation!I21': fkt_kalkulation_i21,
+    'Kalkulation!J21': fkt_kalkulation_j21,
+    'Kalkulation!K21': fkt_kalkulation_k21,
+    'Kalkulation!L21': fkt_kalkulation_l21,
+    'Kalkulation!B22': fkt_kalkulation_b22,
+    'Kalkulation!C22': fkt_kalkulation_c22,
+    'Kalkulation!D22': fkt_kalkulation_d22,
+    'Kalkulation!E22': fkt_kalkulation_e22,
+    'Kalkulation!F22': fkt_kalkulation_f22,
+    'Kalkulation!G22': fkt_kalkulation_g22,
+    'Kalkulation!H22': fkt_kalkulation_h22,
+    'Kalkulation!I22': fkt_kalkulation_i22,
+    'Kalkulation!J22': fkt_kalkulation_j22,
+    'Kalkulation!K22': fkt_kalkulation_k22,
+    'Kalkulation!L22': fkt_kalkulation_l22,
+    'Kalkulation!B23': fkt_kalkulation_b23,
+    'Kalkulation!C23': fkt_kalkulation_c23,
+    'Kalkulation!D23': fkt_kalkulation_d23,
+    'Kalkulation!E23': fkt_kalkulation_e23,
+    'Kalkulation!F23': fkt_kalkulation_f23,
+    'Kalkulation!G23': fkt_kalkulation_g23,
+    'Kalkulation!H23': fkt_kalkulation_h23,
+    'Kalkulation!I23': fkt_kalkulation_i23,
+    'Kalkulation!J23': fkt_kalkulation_j23,
+    'Kalkulation!K23': fkt_kalkulation_k23,
+    'Kalkulation!L23': fkt_kalkulation_l23,
+    'Kalkulation!B24': fkt_kalkulation_b24,
+    'Kalkulation!C24': fkt_kalkulation_c24,
+    'Kalkulation!D24': fkt_kalkulation_d24,
+    'Kalkulation!E24': fkt_kalkulation_e24,
+    'Kalkulation!F24': fkt_kalkulation_f24,
+    'Kalkulation!G24': fkt_kalkulation_g24,
+    'Kalkulation!H24': fkt_kalkulation_h24,
+    'Kalkulation!I24': fkt_kalkulation_i24,
+    'Kalkulation!J24': fkt_kalkulation_j24,
+    'Kalkulation!K24': fkt_kalkulation_k24,
+    'Kalkulation!L24': fkt_kalkulation_l24,
+    'Kalkulation!B25': fkt_kalkulation_b25,
+    'Kalkulation!C25': fkt_kalkulation_c25,
+    'Kalkulation!D25': fkt_kalkulation_d25,
+    'Kalkulation!E25': fkt_kalkulation_e25,
+    'Kalkulation!F25': fkt_kalkulation_f25,
+    'Kalkulation!G25': fkt_kalkulation_g25,
+    'Kalkulation!H25': fkt_kalkulation_h25,
+    'Kalkulation!I25': fkt_kalkulation_i25,
+    'Kalkulation!J25': fkt_kalkulation_j25,
+    'Kalkulation!K25': fkt_kalkulation_k25,
+    'Kalkulation!L25': fkt_kalkulation_l25,
+    'Kalkulation!B26': fkt_kalkulation_b26,
+    'Kalkulation!C26': fkt_kalkulation_c26,
+    'Kalkulation!D26': fkt_kalkulation_d26,
+    'Kalkulation!E26': fkt_kalkulation_e26,
+    'Kalkulation!F26': fkt_kalkulation_f26,
+    'Kalkulation!G26': fkt_kalkulation_g26,
+    'Kalkulation!H26': fkt_kalkulation_h26,
+    'Kalkulation!I26': fkt_kalkulation_i26,
+    'Kalkulation!J26': fkt_kalkulation_j26,
+    'Kalkulation!K26': fkt_kalkulation_k26,
+    'Kalkulation!L26': fkt_kalkulation_l26,
+    'Kalkulation!B27': fkt_kalkulation_b27,
+    'Kalkulation!C27': fkt_kalkulation_c27,
+    'Kalkulation!D27': fkt_kalkulation_d27,
+    'Kalkulation!E27': fkt_kalkulation_e27,
+    'Kalkulation!F27': fkt_kalkulation_f27,
+    'Kalkulation!G27': fkt_kalkulation_g27,
+    'Kalkulation!H27': fkt_kalkulation_h27,
+    'Kalkulation!I27': fkt_kalkulation_i27,
+    'Kalkulation!J27': fkt_kalkulation_j27,
+    'Kalkulation!K27': fkt_kalkulation_k27,
+    'Kalkulation!L27': fkt_kalkulation_l27,
+    'Kalkulation!B28': fkt_kalkulation_b28,
+    'Kalkulation!C28': fkt_kalkulation_c28,
+    'Kalkulation!D28': fkt_kalkulation_d28,
+    'Kalkulation!E28': fkt_kalkulation_e28,
+    'Kalkulation!F28': fkt_kalkulation_f28,
+    'Kalkulation!G28': fkt_kalkulation_g28,
+    'Kalkulation!H28': fkt_kalkulation_h28,
+    'Kalkulation!I28': fkt_kalkulation_i28,
+    'Kalkulation!J28': fkt_kalkulation_j28,
+    'Kalkulation!K28': fkt_kalkulation_k28,
+    'Kalkulation!L28': fkt_kalkulation_l28,
+    'Kalkulation!B29': fkt_kalkulation_b29,
+    'Kalkulation!C29': fkt_kalkulation_c29,
+    'Kalkulation!D29': fkt_kalkulation_d29,
+    'Kalkulation!E29': fkt_kalkulation_e29,
+    'Kalkulation!F29': fkt_kalkulation_f29,
+    'Kalkulation!G29': fkt_kalkulation_g29,
+    'Kalkulation!H29': fkt_kalkulation_h29,
+    'Kalkulation!I29': fkt_kalkulation_i29,
+    'Kalkulation!J29': fkt_kalkulation_j29,
+    'Kalkulation!K29': fkt_kalkulation_k29,
+    'Kalkulation!L29': fkt_kalkulation_l29,
+    'Kalkulation!B30': fkt_kalkulation_b30,
+    'Kalkulation!C30': fkt_kalkulation_c30,
+    'Kalkulation!D30': fkt_kalkulation_d30,
+    'Kalkulation!E30': fkt_kalkulation_e30,
+    'Kalkulation!F30': fkt_kalkulation_f30,
+    'Kalkulation!G30': fkt_kalkulation_g30,
+    'Kalkulation!H30': fkt_kalkulation_h30,
+    'Kalkulation!I30': fkt_kalkulation_i30,
+    'Kalkulation!J30': fkt_kalkulation_j30,
+    'Kalkulation!K30': fkt_kalkulation_k30,
+    'Kalkulation!L30': fkt_kalkulation_l30,
+    'Kalkulation!B31': fkt_kalkulation_b31,
+    'Kalkulation!C31': fkt_kalkulation_c31,
+    'Kalkulation!D31': fkt_kalkulation_d31,
+    'Kalkulation!E31': fkt_kalkulation_e31,
+    'Kalkulation!F31': fkt_kalkulation_f31,
+    'Kalkulation!G31': fkt_kalkulation_g31,
+    'Kalkulation!H31': fkt_kalkulation_h31,
+    'Kalkulation!I31': fkt_kalkulation_i31,
+    'Kalkulation!J31': fkt_kalkulation_j31,
+    'Kalkulation!K31': fkt_kalkulation_k31,
+    'Kalkulation!L31': fkt_kalkulation_l31,
+    'Kalkulation!B32': fkt_kalkulation_b32,
+    'Kalkulation!C32': fkt_kalkulation_c32,
+    'Kalkulation!D32': fkt_kalkulation_d32,
+    'Kalkulation!E32': fkt_kalkulation_e32,
+    'Kalkulation!F32': fkt_kalkulation_f32,
+    'Kalkulation!G32': fkt_kalkulation_g32,
+    'Kalkulation!H32': fkt_kalkulation_h32,
+    'Kalkulation!I32': fkt_kalkulation_i32,
+    'Kalkulation!J32': fkt_kalkulation_j32,
+    'Kalkulation!K32': fkt_kalkulation_k32,
+    'Kalkulation!L32': fkt_kalkulation_l32,
+    'Kalkulation!B33': fkt_kalkulation_b33,
+    'Kalkulation!C33': fkt_kalkulation_c33,
+    'Kalkulation!D33': fkt_kalkulation_d33,
+    'Kalkulation!E33': fkt_kalkulation_e33,
+    'Kalkulation!F33': fkt_kalkulation_f33,
+    'Kalkulation!G33': fkt_kalkulation_g33,
+    'Kalkulation!H33': fkt_kalkulation_h33,
+    'Kalkulation!I33': fkt_kalkulation_i33,
+    'Kalkulation!J33': fkt_kalkulation_j33,
+    'Kalkulation!K33': fkt_kalkulation_k33,
+    'Kalkulation!L33': fkt_kalkulation_l33,
+    'Kalkulation!B34': fkt_kalkulation_b34,
+    'Kalkulation!C34': fkt_kalkulation_c34,
+    'Kalkulation!D34': fkt_kalkulation_d34,
+    'Kalkulation!E34': fkt_kalkulation_e34,
+    'Kalkulation!F34': fkt_kalkulation_f34,
+    'Kalkulation!G34': fkt_kalkulation_g34,
+    'Kalkulation!H34': fkt_kalkulation_h34,
+    'Kalkulation!I34': fkt_kalkulation_i34,
+    'Kalkulation!J34': fkt_kalkulation_j34,
+    'Kalkulation!K34': fkt_kalkulation_k34,
+    'Kalkulation!L34': fkt_kalkulation_l34,
+    'Kalkulation!B35': fkt_kalkulation_b35,
+    'Kalkulation!C35': fkt_kalkulation_c35,
+    'Kalkulation!D35': fkt_kalkulation_d35,
+    'Kalkulation!E35': fkt_kalkulation_e35,
+    'Kalkulation!F35': fkt_kalkulation_f35,
+    'Kalkulation!G35': fkt_kalkulation_g35,
+    'Kalkulation!H35': fkt_kalkulation_h35,
+    'Kalkulation!I35': fkt_kalkulation_i35,
+    'Kalkulation!J35': fkt_kalkulation_j35,
+    'Kalkulation!K35': fkt_kalkulation_k35,
+    'Kalkulation!L35': fkt_kalkulation_l35,
+    'Kalkulation!B36': fkt_kalkulation_b36,
+    'Kalkulation!C36': fkt_kalkulation_c36,
+    'Kalkulation!D36': fkt_kalkulation_d36,
+    'Kalkulation!E36': fkt_kalkulation_e36,
+    'Kalkulation!F36': fkt_kalkulation_f36,
+    'Kalkulation!G36': fkt_kalkulation_g36,
+    'Kalkulation!H36': fkt_kalkulation_h36,
+    'Kalkulation!I36': fkt_kalkulation_i36,
+    'Kalkulation!J36': fkt_kalkulation_j36,
+    'Kalkulation!K36': fkt_kalkulation_k36,
+    'Kalkulation!L36': fkt_kalkulation_l36,
+    'Kalkulation!B37': fkt_kalkulation_b37,
+    'Kalkulation!C37': fkt_kalkulation_c37,
+    'Kalkulation!D37': fkt_kalkulation_d37,
+    'Kalkulation!E37': fkt_kalkulation_e37,
+    'Kalkulation!F37': fkt_kalkulation_f37,
+    'Kalkulation!G37': fkt_kalkulation_g37,
+    'Kalkulation!H37': fkt_kalkulation_h37,
+    'Kalkulation!I37': fkt_kalkulation_i37,
+    'Kalkulation!J37': fkt_kalkulation_j37,
+    'Kalkulation!K37': fkt_kalkulation_k37,
+    'Kalkulation!L37': fkt_kalkulation_l37,
+    'Kalkulation!B38': fkt_kalkulation_b38,
+    'Kalkulation!C38': fkt_kalkulation_c38,
+    'Kalkulation!D38': fkt_kalkulation_d38,
+    'Kalkulation!E38': fkt_kalkulation_e38,
+    'Kalkulation!F38': fkt_kalkulation_f38,
+    'Kalkulation!G38': fkt_kalkulation_g38,
+    'Kalkulation!H38': fkt_kalkulation_h38,
+    'Kalkulation!I38': fkt_kalkulation_i38,
+    'Kalkulation!J38': fkt_kalkulation_j38,
+    'Kalkulation!K38': fkt_kalkulation_k38,
+    'Kalkulation!L38': fkt_kalkulation_l38,
+    'Kalkulation!B39': fkt_kalkulation_b39,
+    'Kalkulation!C39': fkt_kalkulation_c39,
+    'Kalkulation!D39': fkt_kalkulation_d39,
+    'Kalkulation!E39': fkt_kalkulation_e39,
+    'Kalkulation!F39': fkt_kalkulation_f39,
+    'Kalkulation!G39': fkt_kalkulation_g39,
+    'Kalkulation!H39': fkt_kalkulation_h39,
+    'Kalkulation!I39': fkt_kalkulation_i39,
+    'Kalkulation!J39': fkt_kalkulation_j39,
+    'Kalkulation!K39': fkt_kalkulation_k39,
+    'Kalkulation!L39': fkt_kalkulation_l39,
+    'Kalkulation!B40': fkt_kalkulation_b40,
+    'Kalkulation!C40': fkt_kalkulation_c40,
+    'Kalkulation!D40': fkt_kalkulation_d40,
+    'Kalkulation!E40': fkt_kalkulation_e40,
+    'Kalkulation!F40': fkt_kalkulation_f40,
+    'Kalkulation!G40': fkt_kalkulation_g40,
+    'Kalkulation!H40': fkt_kalkulation_h40,
+    'Kalkulation!I40': fkt_kalkulation_i40,
+    'Kalkulation!J40': fkt_kalkulation_j40,
+    'Kalkulation!K40': fkt_kalkulation_k40,
+    'Kalkulation!L40': fkt_kalkulation_l40,
+    'Kalkulation!B41': fkt_kalkulation_b41,
+    'Kalkulation!C41': fkt_kalkulation_c41,
+    'Kalkulation!D41': fkt_kalkulation_d41,
+    'Kalkulation!E41': fkt_kalkulation_e41,
+    'Kalkulation!F41': fkt_kalkulation_f41,
+    'Kalkulation!G41': fkt_kalkulation_g41,
+    'Kalkulation!H41': fkt_kalkulation_h41,
+    'Kalkulation!I41': fkt_kalkulation_i41,
+    'Kalkulation!J41': fkt_kalkulation_j41,
+    'Kalkulation!K41': fkt_kalkulation_k41,
+    'Kalkulation!L41': fkt_kalkulation_l41,
+    'Kalkulation!B42': fkt_kalkulation_b42,
+    'Kalkulation!C42': fkt_kalkulation_c42,
+    'Kalkulation!D42': fkt_kalkulation_d42,
+    'Kalkulation!E42': fkt_kalkulation_e42,
+    'Kalkulation!F42': fkt_kalkulation_f42,
+    'Kalkulation!G42': fkt_kalkulation_g42,
+    'Kalkulation!H42': fkt_kalkulation_h42,
+    'Kalkulation!I42': fkt_kalkulation_i42,
+    'Kalkulation!J42': fkt_kalkulation_j42,
+    'Kalkulation!K42': fkt_kalkulation_k42,
+    'Kalkulation!L42': fkt_kalkulation_l42,
+    'Kalkulation!B43': fkt_kalkulation_b43,
+    'Kalkulation!C43': fkt_kalkulation_c43,
+    'Kalkulation!D43': fkt_kalkulation_d43,
+    'Kalkulation!E43': fkt_kalkulation_e43,
+    'Kalkulation!F43': fkt_kalkulation_f43,
+    'Kalkulation!G43': fkt_kalkulation_g43,
+    'Kalkulation!H43': fkt_kalkulation_h43,
+    'Kalkulation!I43': fkt_kalkulation_i43,
+    'Kalkulation!J43': fkt_kalkulation_j43,
+    'Kalkulation!K43': fkt_kalkulation_k43,
+    'Kalkulation!L43': fkt_kalkulation_l43,
+    'Kalkulation!B44': fkt_kalkulation_b44,
+    'Kalkulation!C44': fkt_kalkulation_c44,
+    'Kalkulation!D44': fkt_kalkulation_d44,
+    'Kalkulation!E44': fkt_kalkulation_e44,
+    'Kalkulation!F44': fkt_kalkulation_f44,
+    'Kalkulation!G44': fkt_kalkulation_g44,
+    'Kalkulation!H44': fkt_kalkulation_h44,
+    'Kalkulation!I44': fkt_kalkulation_i44,
+    'Kalkulation!J44': fkt_kalkulation_j44,
+    'Kalkulation!K44': fkt_kalkulation_k44,
+    'Kalkulation!L44': fkt_kalkulation_l44,
+    'Kalkulation!B45': fkt_kalkulation_b45,
+    'Kalkulation!C45': fkt_kalkulation_c45,
+    'Kalkulation!D45': fkt_kalkulation_d45,
+    'Kalkulation!E45': fkt_kalkulation_e45,
+    'Kalkulation!F45': fkt_kalkulation_f45,
+    'Kalkulation!G45': fkt_kalkulation_g45,
+    'Kalkulation!H45': fkt_kalkulation_h45,
+    'Kalkulation!I45': fkt_kalkulation_i45,
+    'Kalkulation!J45': fkt_kalkulation_j45,
+    'Kalkulation!K45': fkt_kalkulation_k45,
+    'Kalkulation!L45': fkt_kalkulation_l45,
+    'Kalkulation!B46': fkt_kalkulation_b46,
+    'Kalkulation!C46': fkt_kalkulation_c46,
+    'Kalkulation!D46': fkt_kalkulation_d46,
+    'Kalkulation!E46': fkt_kalkulation_e46,
+    'Kalkulation!F46': fkt_kalkulation_f46,
+    'Kalkulation!G46': fkt_kalkulation_g46,
+    'Kalkulation!H46': fkt_kalkulation_h46,
+    'Kalkulation!I46': fkt_kalkulation_i46,
+    'Kalkulation!J46': fkt_kalkulation_j46,
+    'Kalkulation!K46': fkt_kalkulation_k46,
+    'Kalkulation!L46': fkt_kalkulation_l46,
+    'Kalkulation!B47': fkt_kalkulation_b47,
+    'Kalkulation!C47': fkt_kalkulation_c47,
+    'Kalkulation!D47': fkt_kalkulation_d47,
+    'Kalkulation!E47': fkt_kalkulation_e47,
+    'Kalkulation!F47': fkt_kalkulation_f47,
+    'Kalkulation!G47': fkt_kalkulation_g47,
+    'Kalkulation!H47': fkt_kalkulation_h47,
+    'Kalkulation!I47': fkt_kalkulation_i47,
+    'Kalkulation!J47': fkt_kalkulation_j47,
+    'Kalkulation!K47': fkt_kalkulation_k47,
+    'Kalkulation!L47': fkt_kalkulation_l47,
+    'Kalkulation!B48': fkt_kalkulation_b48,
+    'Kalkulation!C48': fkt_kalkulation_c48,
+    'Kalkulation!D48': fkt_kalkulation_d48,
+    'Kalkulation!E48': fkt_kalkulation_e48,
+    'Kalkulation!F48': fkt_kalkulation_f48,
+    'Kalkulation!G48': fkt_kalkulation_g48,
+    'Kalkulation!H48': fkt_kalkulation_h48,
+    'Kalkulation!I48': fkt_kalkulation_i48,
+    'Kalkulation!J48': fkt_kalkulation_j48,
+    'Kalkulation!K48': fkt_kalkulation_k48,
+    'Kalkulation!L48': fkt_kalkulation_l48,
+    'Kalkulation!B49': fkt_kalkulation_b49,
+    'Kalkulation!C49': fkt_kalkulation_c49,
+    'Kalkulation!D49': fkt_kalkulation_d49,
+    'Kalkulation!E49': fkt_kalkulation_e49,
+    'Kalkulation!F49': fkt_kalkulation_f49,
+    'Kalkulation!G49': fkt_kalkulation_g49,
+    'Kalkulation!H49': fkt_kalkulation_h49,
+    'Kalkulation!I49': fkt_kalkulation_i49,
+    'Kalkulation!J49': fkt_kalkulation_j49,
+    'Kalkulation!K49': fkt_kalkulation_k49,
+    'Kalkulation!L49': fkt_kalkulation_l49,
+    'Kalkulation!B50': fkt_kalkulation_b50,
+    'Kalkulation!C50': fkt_kalkulation_c50,
+    'Kalkulation!D50': fkt_kalkulation_d50,
+    'Kalkulation!E50': fkt_kalkulation_e50,
+    'Kalkulation!F50': fkt_kalkulation_f50,
+    'Kalkulation!G50': fkt_kalkulation_g50,
+    'Kalkulation!H50': fkt_kalkulation_h50,
+    'Kalkulation!I50': fkt_kalkulation_i50,
+    'Kalkulation!J50': fkt_kalkulation_j50,
+    'Kalkulation!K50': fkt_kalkulation_k50,
+    'Kalkulation!L50': fkt_kalkulation_l50,
+    'Kalkulation!B51': fkt_kalkulation_b51,
+    'Kalkulation!C51': fkt_kalkulation_c51,
+    'Kalkulation!D51': fkt_kalkulation_d51,
+    'Kalkulation!E51': fkt_kalkulation_e51,
+    'Kalkulation!F51': fkt_kalkulation_f51,
+    'Kalkulation!G51': fkt_kalkulation_g51,
+    'Kalkulation!H51': fkt_kalkulation_h51,
+    'Kalkulation!I51': fkt_kalkulation_i51,
+    'Kalkulation!J51': fkt_kalkulation_j51,
+    'Kalkulation!K51': fkt_kalkulation_k51,
+    'Kalkulation!L51': fkt_kalkulation_l51,
+    'Kalkulation!B52': fkt_kalkulation_b52,
+    'Kalkulation!C52': fkt_kalkulation_c52,
+    'Kalkulation!D52': fkt_kalkulation_d52,
+    'Kalkulation!E52': fkt_kalkulation_e52,
+    'Kalkulation!F52': fkt_kalkulation_f52,
+    'Kalkulation!G52': fkt_kalkulation_g52,
+    'Kalkulation!H52': fkt_kalkulation_h52,
+    'Kalkulation!I52': fkt_kalkulation_i52,
+    'Kalkulation!J52': fkt_kalkulation_j52,
+    'Kalkulation!K52': fkt_kalkulation_k52,
+    'Kalkulation!L52': fkt_kalkulation_l52,
+    'Kalkulation!B53': fkt_kalkulation_b53,
+    'Kalkulation!C53': fkt_kalkulation_c53,
+    'Kalkulation!D53': fkt_kalkulation_d53,
+    'Kalkulation!E53': fkt_kalkulation_e53,
+    'Kalkulation!F53': fkt_kalkulation_f53,
+    'Kalkulation!G53': fkt_kalkulation_g53,
+    'Kalkulation!H53': fkt_kalkulation_h53,
+    'Kalkulation!I53': fkt_kalkulation_i53,
+    'Kalkulation!J53': fkt_kalkulation_j53,
+    'Kalkulation!K53': fkt_kalkulation_k53,
+    'Kalkulation!L53': fkt_kalkulation_l53,
+    'Kalkulation!B54': fkt_kalkulation_b54,
+    'Kalkulation!C54': fkt_kalkulation_c54,
+    'Kalkulation!D54': fkt_kalkulation_d54,
+    'Kalkulation!E54': fkt_kalkulation_e54,
+    'Kalkulation!F54': fkt_kalkulation_f54,
+    'Kalkulation!G54': fkt_kalkulation_g54,
+    'Kalkulation!H54': fkt_kalkulation_h54,
+    'Kalkulation!I54': fkt_kalkulation_i54,
+    'Kalkulation!J54': fkt_kalkulation_j54,
+    'Kalkulation!K54': fkt_kalkulation_k54,
+    'Kalkulation!L54': fkt_kalkulation_l54,
+    'Kalkulation!B55': fkt_kalkulation_b55,
+    'Kalkulation!C55': fkt_kalkulation_c55,
+    'Kalkulation!D55': fkt_kalkulation_d55,
+    'Kalkulation!E55': fkt_kalkulation_e55,
+    'Kalkulation!F55': fkt_kalkulation_f55,
+    'Kalkulation!G55': fkt_kalkulation_g55,
+    'Kalkulation!H55': fkt_kalkulation_h55,
+    'Kalkulation!I55': fkt_kalkulation_i55,
+    'Kalkulation!J55': fkt_kalkulation_j55,
+    'Kalkulation!K55': fkt_kalkulation_k55,
+    'Kalkulation!L55': fkt_kalkulation_l55,
+    'Kalkulation!B56': fkt_kalkulation_b56,
+    'Kalkulation!C56': fkt_kalkulation_c56,
+    'Kalkulation!D56': fkt_kalkulation_d56,
+    'Kalkulation!E56': fkt_kalkulation_e56,
+    'Kalkulation!F56': fkt_kalkulation_f56,
+    'Kalkulation!G56': fkt_kalkulation_g56,
+    'Kalkulation!H56': fkt_kalkulation_h56,
+    'Kalkulation!I56': fkt_kalkulation_i56,
+    'Kalkulation!J56': fkt_kalkulation_j56,
+    'Kalkulation!K56': fkt_kalkulation_k56,
+    'Kalkulation!L56': fkt_kalkulation_l56,
+    'Kalkulation!B57': fkt_kalkulation_b57,
+    'Kalkulation!C57': fkt_kalkulation_c57,
+    'Kalkulation!D57': fkt_kalkulation_d57,
+    'Kalkulation!E57': fkt_kalkulation_e57,
+    'Kalkulation!F57': fkt_kalkulation_f57,
+    'Kalkulation!G57': fkt_kalkulation_g57,
+    'Kalkulation!H57': fkt_kalkulation_h57,
+    'Kalkulation!I57': fkt_kalkulation_i57,
+    'Kalkulation!J57': fkt_kalkulation_j57,
+    'Kalkulation!K57': fkt_kalkulation_k57,
+    'Kalkulation!L57': fkt_kalkulation_l57,
+    'Kalkulation!B58': fkt_kalkulation_b58,
+    'Kalkulation!C58': fkt_kalkulation_c58,
+    'Kalkulation!D58': fkt_kalkulation_d58,
+    'Kalkulation!E58': fkt_kalkulation_e58,
+    'Kalkulation!F58': fkt_kalkulation_f58,
+    'Kalkulation!G58': fkt_kalkulation_g58,
+    'Kalkulation!H58': fkt_kalkulation_h58,
+    'Kalkulation!I58': fkt_kalkulation_i58,
+    'Kalkulation!J58': fkt_kalkulation_j58,
+    'Kalkulation!K58': fkt_kalkulation_k58,
+    'Kalkulation!L58': fkt_kalkulation_l58,
+    'Kalkulation!B59': fkt_kalkulation_b59,
+    'Kalkulation!C59': fkt_kalkulation_c59,
+    'Kalkulation!D59': fkt_kalkulation_d59,
+    'Kalkulation!E59': fkt_kalkulation_e59,
+    'Kalkulation!F59': fkt_kalkulation_f59,
+    'Kalkulation!G59': fkt_kalkulation_g59,
+    'Kalkulation!H59': fkt_kalkulation_h59,
+    'Kalkulation!I59': fkt_kalkulation_i59,
+    'Kalkulation!J59': fkt_kalkulation_j59,
+    'Kalkulation!K59': fkt_kalkulation_k59,
+    'Kalkulation!L59': fkt_kalkulation_l59,
+    'Kalkulation!B60': fkt_kalkulation_b60,
+    'Kalkulation!C60': fkt_kalkulation_c60,
+    'Kalkulation!D60': fkt_kalkulation_d60,
+    'Kalkulation!E60': fkt_kalkulation_e60,
+    'Kalkulation!F60': fkt_kalkulation_f60,
+    'Kalkulation!G60': fkt_kalkulation_g60,
+    'Kalkulation!H60': fkt_kalkulation_h60,
+    'Kalkulation!I60': fkt_kalkulation_i60,
+    'Kalkulation!J60': fkt_kalkulation_j60,
+    'Kalkulation!K60': fkt_kalkulation_k60,
+    'Kalkulation!L60': fkt_kalkulation_l60,
+    'Kalkulation!B61': fkt_kalkulation_b61,
+    'Kalkulation!C61': fkt_kalkulation_c61,
+    'Kalkulation!D61': fkt_kalkulation_d61,
+    'Kalkulation!E61': fkt_kalkulation_e61,
+    'Kalkulation!F61': fkt_kalkulation_f61,
+    'Kalkulation!G61': fkt_kalkulation_g61,
+    'Kalkulation!H61': fkt_kalkulation_h61,
+    'Kalkulation!I61': fkt_kalkulation_i61,
+    'Kalkulation!J61': fkt_kalkulation_j61,
+    'Kalkulation!K61': fkt_kalkulation_k61,
+    'Kalkulation!L61': fkt_kalkulation_l61,
+    'Kalkulation!B62': fkt_kalkulation_b62,
+    'Kalkulation!C62': fkt_kalkulation_c62,
+    'Kalkulation!D62': fkt_kalkulation_d62,
+    'Kalkulation!E62': fkt_kalkulation_e62,
+    'Kalkulation!F62': fkt_kalkulation_f62,
+    'Kalkulation!G62': fkt_kalkulation_g62,
+    'Kalkulation!H62': fkt_kalkulation_h62,
+    'Kalkulation!I62': fkt_kalkulation_i62,
+    'Kalkulation!J62': fkt_kalkulation_j62,
+    'Kalkulation!K62': fkt_kalkulation_k62,
+    'Kalkulation!L62': fkt_kalkulation_l62,
+    'Kalkulation!B63': fkt_kalkulation_b63,
+    'Kalkulation!C63': fkt_kalkulation_c63,
+    'Kalkulation!D63': fkt_kalkulation_d63,
+    'Kalkulation!E63': fkt_kalkulation_e63,
+    'Kalkulation!F63': fkt_kalkulation_f63,
+    'Kalkulation!G63': fkt_kalkulation_g63,
+    'Kalkulation!H63': fkt_kalkulation_h63,
+    'Kalkulation!I63': fkt_kalkulation_i63,
+    'Kalkulation!J63': fkt_kalkulation_j63,
+    'Kalkulation!K63': fkt_kalkulation_k63,
+    'Kalkulation!L63': fkt_kalkulation_l63,
+    'Kalkulation!B64': fkt_kalkulation_b64,
+    'Kalkulation!C64': fkt_kalkulation_c64,
+    'Kalkulation!D64': fkt_kalkulation_d64,
+    'Kalkulation!E64': fkt_kalkulation_e64,
+    'Kalkulation!F64': fkt_kalkulation_f64,
+    'Kalkulation!G64': fkt_kalkulation_g64,
+    'Kalkulation!H64': fkt_kalkulation_h64,
+    'Kalkulation!I64': fkt_kalkulation_i64,
+    'Kalkulation!J64': fkt_kalkulation_j64,
+    'Kalkulation!K64': fkt_kalkulation_k64,
+    'Kalkulation!L64': fkt_kalkulation_l64,
+    'Kalkulation!B65': fkt_kalkulation_b65,
+    'Kalkulation!C65': fkt_kalkulation_c65,
+    'Kalkulation!D65': fkt_kalkulation_d65,
+    'Kalkulation!E65': fkt_kalkulation_e65,
+    'Kalkulation!F65': fkt_kalkulation_f65,
+    'Kalkulation!G65': fkt_kalkulation_g65,
+    'Kalkulation!H65': fkt_kalkulation_h65,
+    'Kalkulation!I65': fkt_kalkulation_i65,
+    'Kalkulation!J65': fkt_kalkulation_j65,
+    'Kalkulation!K65': fkt_kalkulation_k65,
+    'Kalkulation!L65': fkt_kalkulation_l65,
+    'Kalkulation!B66': fkt_kalkulation_b66,
+    'Kalkulation!C66': fkt_kalkulation_c66,
+    'Kalkulation!D66': fkt_kalkulation_d66,
+    'Kalkulation!E66': fkt_kalkulation_e66,
+    'Kalkulation!F66': fkt_kalkulation_f66,
+    'Kalkulation!G66': fkt_kalkulation_g66,
+    'Kalkulation!H66': fkt_kalkulation_h66,
+    'Kalkulation!I66': fkt_kalkulation_i66,
+    'Kalkulation!J66': fkt_kalkulation_j66,
+    'Kalkulation!K66': fkt_kalkulation_k66,
+    'Kalkulation!L66': fkt_kalkulation_l66,
+}
+
+CELL_ORDER = (
+    'Kalkulation!K5',
+    'Kalkulation!K6',
+    'Kalkulation!K9',
+    'Kalkulation!E12',
+    'Kalkulation!K7',
+    'Kalkulation!B16',
+    'Kalkulation!C16',
+    'Kalkulation!D16',
+    'Kalkulation!E16',
+    'Kalkulation!F16',
+    'Kalkulation!G16',
+    'Kalkulation!H16',
+    'Kalkulation!I16',
+    'Kalkulation!J16',
+    'Kalkulation!K16',
+    'Kalkulation!L16',
+    'Kalkulation!B17',
+    'Kalkulation!C17',
+    'Kalkulation!D17',
+    'Kalkulation!E17',
+    'Kalkulation!F17',
+    'Kalkulation!G17',
+    'Kalkulation!H17',
+    'Kalkulation!I17',
+    'Kalkulation!J17',
+    'Kalkulation!K17',
+    'Kalkulation!L17',
+    'Kalkulation!B18',
+    'Kalkulation!C18',
+    'Kalkulation!D18',
+    'Kalkulation!E18',
+    'Kalkulation!F18',
+    'Kalkulation!G18',
+    'Kalkulation!H18',
+    'Kalkulation!I18',
+    'Kalkulation!J18',
+    'Kalkulation!K18',
+    'Kalkulation!L18',
+    'Kalkulation!B19',
+    'Kalkulation!C19',
+    'Kalkulation!D19',
+    'Kalkulation!E19',
+    'Kalkulation!F19',
+    'Kalkulation!G19',
+    'Kalkulation!H19',
+    'Kalkulation!I19',
+    'Kalkulation!J19',
+    'Kalkulation!K19',
+    'Kalkulation!L19',
+    'Kalkulation!B20',
+    'Kalkulation!C20',
+    'Kalkulation!D20',
+    'Kalkulation!E20',
+    'Kalkulation!F20',
+    'Kalkulation!G20',
+    'Kalkulation!H20',
+    'Kalkulation!I20',
+    'Kalkulation!J20',
+    'Kalkulation!K20',
+    'Kalkulation!L20',
+    'Kalkulation!B21',
+    'Kalkulation!C21',
+    'Kalkulation!D21',
+    'Kalkulation!E21',
+    'Kalkulation!F21',
+    'Kalkulation!G21',
+    'Kalkulation!H21',
+    'Kalkulation!I21',
+    'Kalkulation!J21',
+    'Kalkulation!K21',
+    'Kalkulation!L21',
+    'Kalkulation!B22',
+    'Kalkulation!C22',
+    'Kalkulation!D22',
+    'Kalkulation!E22',
+    'Kalkulation!F22',
+    'Kalkulation!G22',
+    'Kalkulation!H22',
+    'Kalkulation!I22',
+    'Kalkulation!J22',
+    'Kalkulation!K22',
+    'Kalkulation!L22',
+    'Kalkulation!B23',
+    'Kalkulation!C23',
+    'Kalkulation!D23',
+    'Kalkulation!E23',
+    'Kalkulation!F23',
+    'Kalkulation!G23',
+    'Kalkulation!H23',
+    'Kalkulation!I23',
+    'Kalkulation!J23',
+    'Kalkulation!K23',
+    'Kalkulation!L23',
+    'Kalkulation!B24',
+    'Kalkulation!C24',
+    'Kalkulation!D24',
+    'Kalkulation!E24',
+    'Kalkulation!F24',
+    'Kalkulation!G24',
+    'Kalkulation!H24',
+    'Kalkulation!I24',
+    'Kalkulation!J24',
+    'Kalkulation!K24',
+    'Kalkulation!L24',
+    'Kalkulation!B25',
+    'Kalkulation!C25',
+    'Kalkulation!D25',
+    'Kalkulation!E25',
+    'Kalkulation!F25',
+    'Kalkulation!G25',
+    'Kalkulation!H25',
+    'Kalkulation!I25',
+    'Kalkulation!J25',
+    'Kalkulation!K25',
+    'Kalkulation!L25',
+    'Kalkulation!B26',
+    'Kalkulation!C26',
+    'Kalkulation!D26',
+    'Kalkulation!E26',
+    'Kalkulation!F26',
+    'Kalkulation!G26',
+    'Kalkulation!H26',
+    'Kalkulation!I26',
+    'Kalkulation!J26',
+    'Kalkulation!K26',
+    'Kalkulation!L26',
+    'Kalkulation!B27',
+    'Kalkulation!C27',
+    'Kalkulation!D27',
+    'Kalkulation!E27',
+    'Kalkulation!F27',
+    'Kalkulation!G27',
+    'Kalkulation!H27',
+    'Kalkulation!I27',
+    'Kalkulation!J27',
+    'Kalkulation!K27',
+    'Kalkulation!L27',
+    'Kalkulation!B28',
+    'Kalkulation!C28',
+    'Kalkulation!D28',
+    'Kalkulation!E28',
+    'Kalkulation!F28',
+    'Kalkulation!G28',
+    'Kalkulation!H28',
+    'Kalkulation!I28',
+    'Kalkulation!J28',
+    'Kalkulation!K28',
+    'Kalkulation!L28',
+    'Kalkulation!B29',
+    'Kalkulation!C29',
+    'Kalkulation!D29',
+    'Kalkulation!E29',
+    'Kalkulation!F29',
+    'Kalkulation!G29',
+    'Kalkulation!H29',
+    'Kalkulation!I29',
+    'Kalkulation!J29',
+    'Kalkulation!K29',
+    'Kalkulation!L29',
+    'Kalkulation!B30',
+    'Kalkulation!C30',
+    'Kalkulation!D30',
+    'Kalkulation!E30',
+    'Kalkulation!F30',
+    'Kalkulation!G30',
+    'Kalkulation!H30',
+    'Kalkulation!I30',
+    'Kalkulation!J30',
+    'Kalkulation!K30',
+    'Kalkulation!L30',
+    'Kalkulation!B31',
+    'Kalkulation!C31',
+    'Kalkulation!D31',
+    'Kalkulation!E31',
+    'Kalkulation!F31',
+    'Kalkulation!G31',
+    'Kalkulation!H31',
+    'Kalkulation!I31',
+    'Kalkulation!J31',
+    'Kalkulation!K31',
+    'Kalkulation!L31',
+    'Kalkulation!B32',
+    'Kalkulation!C32',
+    'Kalkulation!D32',
+    'Kalkulation!E32',
+    'Kalkulation!F32',
+    'Kalkulation!G32',
+    'Kalkulation!H32',
+    'Kalkulation!I32',
+    'Kalkulation!J32',
+    'Kalkulation!K32',
+    'Kalkulation!L32',
+    'Kalkulation!B33',
+    'Kalkulation!C33',
+    'Kalkulation!D33',
+    'Kalkulation!E33',
+    'Kalkulation!F33',
+    'Kalkulation!G33',
+    'Kalkulation!H33',
+    'Kalkulation!I33',
+    'Kalkulation!J33',
+    'Kalkulation!K33',
+    'Kalkulation!L33',
+    'Kalkulation!B34',
+    'Kalkulation!C34',
+    'Kalkulation!D34',
+    'Kalkulation!E34',
+    'Kalkulation!F34',
+    'Kalkulation!G34',
+    'Kalkulation!H34',
+    'Kalkulation!I34',
+    'Kalkulation!J34',
+    'Kalkulation!K34',
+    'Kalkulation!L34',
+    'Kalkulation!B35',
+    'Kalkulation!C35',
+    'Kalkulation!D35',
+    'Kalkulation!E35',
+    'Kalkulation!F35',
+    'Kalkulation!G35',
+    'Kalkulation!H35',
+    'Kalkulation!I35',
+    'Kalkulation!J35',
+    'Kalkulation!K35',
+    'Kalkulation!L35',
+    'Kalkulation!B36',
+    'Kalkulation!C36',
+    'Kalkulation!D36',
+    'Kalkulation!E36',
+    'Kalkulation!F36',
+    'Kalkulation!G36',
+    'Kalkulation!H36',
+    'Kalkulation!I36',
+    'Kalkulation!J36',
+    'Kalkulation!K36',
+    'Kalkulation!L36',
+    'Kalkulation!B37',
+    'Kalkulation!C37',
+    'Kalkulation!D37',
+    'Kalkulation!E37',
+    'Kalkulation!F37',
+    'Kalkulation!G37',
+    'Kalkulation!H37',
+    'Kalkulation!I37',
+    'Kalkulation!J37',
+    'Kalkulation!K37',
+    'Kalkulation!L37',
+    'Kalkulation!B38',
+    'Kalkulation!C38',
+    'Kalkulation!D38',
+    'Kalkulation!E38',
+    'Kalkulation!F38',
+    'Kalkulation!G38',
+    'Kalkulation!H38',
+    'Kalkulation!I38',
+    'Kalkulation!J38',
+    'Kalkulation!K38',
+    'Kalkulation!L38',
+    'Kalkulation!B39',
+    'Kalkulation!C39',
+    'Kalkulation!D39',
+    'Kalkulation!E39',
+    'Kalkulation!F39',
+    'Kalkulation!G39',
+    'Kalkulation!H39',
+    'Kalkulation!I39',
+    'Kalkulation!J39',
+    'Kalkulation!K39',
+    'Kalkulation!L39',
+    'Kalkulation!B40',
+    'Kalkulation!C40',
+    'Kalkulation!D40',
+    'Kalkulation!E40',
+    'Kalkulation!F40',
+    'Kalkulation!G40',
+    'Kalkulation!H40',
+    'Kalkulation!I40',
+    'Kalkulation!J40',
+    'Kalkulation!K40',
+    'Kalkulation!L40',
+    'Kalkulation!B41',
+    'Kalkulation!C41',
+    'Kalkulation!D41',
+    'Kalkulation!E41',
+    'Kalkulation!F41',
+    'Kalkulation!G41',
+    'Kalkulation!H41',
+    'Kalkulation!I41',
+    'Kalkulation!J41',
+    'Kalkulation!K41',
+    'Kalkulation!L41',
+    'Kalkulation!B42',
+    'Kalkulation!C42',
+    'Kalkulation!D42',
+    'Kalkulation!E42',
+    'Kalkulation!F42',
+    'Kalkulation!G42',
+    'Kalkulation!H42',
+    'Kalkulation!I42',
+    'Kalkulation!J42',
+    'Kalkulation!K42',
+    'Kalkulation!L42',
+    'Kalkulation!B43',
+    'Kalkulation!C43',
+    'Kalkulation!D43',
+    'Kalkulation!E43',
+    'Kalkulation!F43',
+    'Kalkulation!G43',
+    'Kalkulation!H43',
+    'Kalkulation!I43',
+    'Kalkulation!J43',
+    'Kalkulation!K43',
+    'Kalkulation!L43',
+    'Kalkulation!B44',
+    'Kalkulation!C44',
+    'Kalkulation!D44',
+    'Kalkulation!E44',
+    'Kalkulation!F44',
+    'Kalkulation!G44',
+    'Kalkulation!H44',
+    'Kalkulation!I44',
+    'Kalkulation!J44',
+    'Kalkulation!K44',
+    'Kalkulation!L44',
+    'Kalkulation!B45',
+    'Kalkulation!C45',
+    'Kalkulation!D45',
+    'Kalkulation!E45',
+    'Kalkulation!F45',
+    'Kalkulation!G45',
+    'Kalkulation!H45',
+    'Kalkulation!I45',
+    'Kalkulation!J45',
+    'Kalkulation!K45',
+    'Kalkulation!L45',
+    'Kalkulation!B46',
+    'Kalkulation!C46',
+    'Kalkulation!D46',
+    'Kalkulation!E46',
+    'Kalkulation!F46',
+    'Kalkulation!G46',
+    'Kalkulation!H46',
+    'Kalkulation!I46',
+    'Kalkulation!J46',
+    'Kalkulation!K46',
+    'Kalkulation!L46',
+    'Kalkulation!B47',
+    'Kalkulation!C47',
+    'Kalkulation!D47',
+    'Kalkulation!E47',
+    'Kalkulation!F47',
+    'Kalkulation!G47',
+    'Kalkulation!H47',
+    'Kalkulation!I47',
+    'Kalkulation!J47',
+    'Kalkulation!K47',
+    'Kalkulation!L47',
+    'Kalkulation!B48',
+    'Kalkulation!C48',
+    'Kalkulation!D48',
+    'Kalkulation!E48',
+    'Kalkulation!F48',
+    'Kalkulation!G48',
+    'Kalkulation!H48',
+    'Kalkulation!I48',
+    'Kalkulation!J48',
+    'Kalkulation!K48',
+    'Kalkulation!L48',
+    'Kalkulation!B49',
+    'Kalkulation!C49',
+    'Kalkulation!D49',
+    'Kalkulation!E49',
+    'Kalkulation!F49',
+    'Kalkulation!G49',
+    'Kalkulation!H49',
+    'Kalkulation!I49',
+    'Kalkulation!J49',
+    'Kalkulation!K49',
+    'Kalkulation!L49',
+    'Kalkulation!B50',
+    'Kalkulation!C50',
+    'Kalkulation!D50',
+    'Kalkulation!E50',
+    'Kalkulation!F50',
+    'Kalkulation!G50',
+    'Kalkulation!H50',
+    'Kalkulation!I50',
+    'Kalkulation!J50',
+    'Kalkulation!K50',
+    'Kalkulation!L50',
+    'Kalkulation!B51',
+    'Kalkulation!C51',
+    'Kalkulation!D51',
+    'Kalkulation!E51',
+    'Kalkulation!F51',
+    'Kalkulation!G51',
+    'Kalkulation!H51',
+    'Kalkulation!I51',
+    'Kalkulation!J51',
+    'Kalkulation!K51',
+    'Kalkulation!L51',
+    'Kalkulation!B52',
+    'Kalkulation!C52',
+    'Kalkulation!D52',
+    'Kalkulation!E52',
+    'Kalkulation!F52',
+    'Kalkulation!G52',
+    'Kalkulation!H52',
+    'Kalkulation!I52',
+    'Kalkulation!J52',
+    'Kalkulation!K52',
+    'Kalkulation!L52',
+    'Kalkulation!B53',
+    'Kalkulation!C53',
+    'Kalkulation!D53',
+    'Kalkulation!E53',
+    'Kalkulation!F53',
+    'Kalkulation!G53',
+    'Kalkulation!H53',
+    'Kalkulation!I53',
+    'Kalkulation!J53',
+    'Kalkulation!K53',
+    'Kalkulation!L53',
+    'Kalkulation!B54',
+    'Kalkulation!C54',
+    'Kalkulation!D54',
+    'Kalkulation!E54',
+    'Kalkulation!F54',
+    'Kalkulation!G54',
+    'Kalkulation!H54',
+    'Kalkulation!I54',
+    'Kalkulation!J54',
+    'Kalkulation!K54',
+    'Kalkulation!L54',
+    'Kalkulation!B55',
+    'Kalkulation!C55',
+    'Kalkulation!D55',
+    'Kalkulation!E55',
+    'Kalkulation!F55',
+    'Kalkulation!G55',
+    'Kalkulation!H55',
+    'Kalkulation!I55',
+    'Kalkulation!J55',
+    'Kalkulation!K55',
+    'Kalkulation!L55',
+    'Kalkulation!B56',
+    'Kalkulation!C56',
+    'Kalkulation!D56',
+    'Kalkulation!E56',
+    'Kalkulation!F56',
+    'Kalkulation!G56',
+    'Kalkulation!H56',
+    'Kalkulation!I56',
+    'Kalkulation!J56',
+    'Kalkulation!K56',
+    'Kalkulation!L56',
+    'Kalkulation!B57',
+    'Kalkulation!C57',
+    'Kalkulation!D57',
+    'Kalkulation!E57',
+    'Kalkulation!F57',
+    'Kalkulation!G57',
+    'Kalkulation!H57',
+    'Kalkulation!I57',
+    'Kalkulation!J57',
+    'Kalkulation!K57',
+    'Kalkulation!L57',
+    'Kalkulation!B58',
+    'Kalkulation!C58',
+    'Kalkulation!D58',
+    'Kalkulation!E58',
+    'Kalkulation!F58',
+    'Kalkulation!G58',
+    'Kalkulation!H58',
+    'Kalkulation!I58',
+    'Kalkulation!J58',
+    'Kalkulation!K58',
+    'Kalkulation!L58',
+    'Kalkulation!B59',
+    'Kalkulation!C59',
+    'Kalkulation!D59',
+    'Kalkulation!E59',
+    'Kalkulation!F59',
+    'Kalkulation!G59',
+    'Kalkulation!H59',
+    'Kalkulation!I59',
+    'Kalkulation!J59',
+    'Kalkulation!K59',
+    'Kalkulation!L59',
+    'Kalkulation!B60',
+    'Kalkulation!C60',
+    'Kalkulation!D60',
+    'Kalkulation!E60',
+    'Kalkulation!F60',
+    'Kalkulation!G60',
+    'Kalkulation!H60',
+    'Kalkulation!I60',
+    'Kalkulation!J60',
+    'Kalkulation!K60',
+    'Kalkulation!L60',
+    'Kalkulation!B61',
+    'Kalkulation!C61',
+    'Kalkulation!D61',
+    'Kalkulation!E61',
+    'Kalkulation!F61',
+    'Kalkulation!G61',
+    'Kalkulation!H61',
+    'Kalkulation!I61',
+    'Kalkulation!J61',
+    'Kalkulation!K61',
+    'Kalkulation!L61',
+    'Kalkulation!B62',
+    'Kalkulation!C62',
+    'Kalkulation!D62',
+    'Kalkulation!E62',
+    'Kalkulation!F62',
+    'Kalkulation!G62',
+    'Kalkulation!H62',
+    'Kalkulation!I62',
+    'Kalkulation!J62',
+    'Kalkulation!K62',
+    'Kalkulation!L62',
+    'Kalkulation!B63',
+    'Kalkulation!C63',
+    'Kalkulation!D63',
+    'Kalkulation!E63',
+    'Kalkulation!F63',
+    'Kalkulation!G63',
+    'Kalkulation!H63',
+    'Kalkulation!I63',
+    'Kalkulation!J63',
+    'Kalkulation!K63',
+    'Kalkulation!L63',
+    'Kalkulation!B64',
+    'Kalkulation!C64',
+    'Kalkulation!D64',
+    'Kalkulation!E64',
+    'Kalkulation!F64',
+    'Kalkulation!G64',
+    'Kalkulation!H64',
+    'Kalkulation!I64',
+    'Kalkulation!J64',
+    'Kalkulation!K64',
+    'Kalkulation!L64',
+    'Kalkulation!B65',
+    'Kalkulation!C65',
+    'Kalkulation!D65',
+    'Kalkulation!E65',
+    'Kalkulation!F65',
+    'Kalkulation!G65',
+    'Kalkulation!H65',
+    'Kalkulation!I65',
+    'Kalkulation!J65',
+    'Kalkulation!K65',
+    'Kalkulation!L65',
+    'Kalkulation!B66',
+    'Kalkulation!C66',
+    'Kalkulation!D66',
+    'Kalkulation!E66',
+    'Kalkulation!F66',
+    'Kalkulation!G66',
+    'Kalkulation!H66',
+    'Kalkulation!I66',
+    'Kalkulation!J66',
+    'Kalkulation!K66',
+    'Kalkulation!L66',
+)
+
+CELL_PRECEDENTS = {
+    'Kalkulation!K5': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!E7', 'Kalkulation!E8', 'Kalkulation!E9'),
+    'Kalkulation!K6': ('Kalkulation!B8', 'Kalkulation!K5'),
+    'Kalkulation!K7': ('Kalkulation!B9', 'Kalkulation!E11', 'Kalkulation!E12', 'Kalkulation!K6'),
+    'Kalkulation!K9': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!K5'),
+    'Kalkulation!E12': ('Kalkulation!B9',),
+    'Kalkulation!B16': ('Kalkulation!A16', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C16': ('Kalkulation!A16', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D16': ('Kalkulation!A16', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E16': ('Kalkulation!B16', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C16', 'Kalkulation!D16', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F16': ('Kalkulation!B8', 'Kalkulation!E16'),
+    'Kalkulation!G16': ('Kalkulation!B16', 'Kalkulation!C16', 'Kalkulation!E10'),
+    'Kalkulation!H16': ('Kalkulation!A16', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F16', 'Kalkulation!K6'),
+    'Kalkulation!I16': ('Kalkulation!A16', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J16': ('Kalkulation!A16', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F16', 'Kalkulation!I16'),
+    'Kalkulation!K16': ('Kalkulation!H16', 'Kalkulation!J16'),
+    'Kalkulation!L16': ('Kalkulation!A16', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G16', 'Kalkulation!H16'),
+    'Kalkulation!B17': ('Kalkulation!A17', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C17': ('Kalkulation!A17', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D17': ('Kalkulation!A17', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E17': ('Kalkulation!B17', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C17', 'Kalkulation!D17', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F17': ('Kalkulation!B8', 'Kalkulation!E17'),
+    'Kalkulation!G17': ('Kalkulation!B17', 'Kalkulation!C17', 'Kalkulation!E10'),
+    'Kalkulation!H17': ('Kalkulation!A17', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F17', 'Kalkulation!K6'),
+    'Kalkulation!I17': ('Kalkulation!A17', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J17': ('Kalkulation!A17', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F17', 'Kalkulation!I17'),
+    'Kalkulation!K17': ('Kalkulation!H17', 'Kalkulation!J17'),
+    'Kalkulation!L17': ('Kalkulation!A17', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G17', 'Kalkulation!H17'),
+    'Kalkulation!B18': ('Kalkulation!A18', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C18': ('Kalkulation!A18', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D18': ('Kalkulation!A18', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E18': ('Kalkulation!B18', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C18', 'Kalkulation!D18', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F18': ('Kalkulation!B8', 'Kalkulation!E18'),
+    'Kalkulation!G18': ('Kalkulation!B18', 'Kalkulation!C18', 'Kalkulation!E10'),
+    'Kalkulation!H18': ('Kalkulation!A18', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F18', 'Kalkulation!K6'),
+    'Kalkulation!I18': ('Kalkulation!A18', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J18': ('Kalkulation!A18', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F18', 'Kalkulation!I18'),
+    'Kalkulation!K18': ('Kalkulation!H18', 'Kalkulation!J18'),
+    'Kalkulation!L18': ('Kalkulation!A18', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G18', 'Kalkulation!H18'),
+    'Kalkulation!B19': ('Kalkulation!A19', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C19': ('Kalkulation!A19', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D19': ('Kalkulation!A19', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E19': ('Kalkulation!B19', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C19', 'Kalkulation!D19', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F19': ('Kalkulation!B8', 'Kalkulation!E19'),
+    'Kalkulation!G19': ('Kalkulation!B19', 'Kalkulation!C19', 'Kalkulation!E10'),
+    'Kalkulation!H19': ('Kalkulation!A19', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F19', 'Kalkulation!K6'),
+    'Kalkulation!I19': ('Kalkulation!A19', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J19': ('Kalkulation!A19', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F19', 'Kalkulation!I19'),
+    'Kalkulation!K19': ('Kalkulation!H19', 'Kalkulation!J19'),
+    'Kalkulation!L19': ('Kalkulation!A19', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G19', 'Kalkulation!H19'),
+    'Kalkulation!B20': ('Kalkulation!A20', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C20': ('Kalkulation!A20', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D20': ('Kalkulation!A20', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E20': ('Kalkulation!B20', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C20', 'Kalkulation!D20', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F20': ('Kalkulation!B8', 'Kalkulation!E20'),
+    'Kalkulation!G20': ('Kalkulation!B20', 'Kalkulation!C20', 'Kalkulation!E10'),
+    'Kalkulation!H20': ('Kalkulation!A20', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F20', 'Kalkulation!K6'),
+    'Kalkulation!I20': ('Kalkulation!A20', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J20': ('Kalkulation!A20', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F20', 'Kalkulation!I20'),
+    'Kalkulation!K20': ('Kalkulation!H20', 'Kalkulation!J20'),
+    'Kalkulation!L20': ('Kalkulation!A20', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G20', 'Kalkulation!H20'),
+    'Kalkulation!B21': ('Kalkulation!A21', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C21': ('Kalkulation!A21', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D21': ('Kalkulation!A21', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E21': ('Kalkulation!B21', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C21', 'Kalkulation!D21', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F21': ('Kalkulation!B8', 'Kalkulation!E21'),
+    'Kalkulation!G21': ('Kalkulation!B21', 'Kalkulation!C21', 'Kalkulation!E10'),
+    'Kalkulation!H21': ('Kalkulation!A21', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F21', 'Kalkulation!K6'),
+    'Kalkulation!I21': ('Kalkulation!A21', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J21': ('Kalkulation!A21', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F21', 'Kalkulation!I21'),
+    'Kalkulation!K21': ('Kalkulation!H21', 'Kalkulation!J21'),
+    'Kalkulation!L21': ('Kalkulation!A21', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G21', 'Kalkulation!H21'),
+    'Kalkulation!B22': ('Kalkulation!A22', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C22': ('Kalkulation!A22', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D22': ('Kalkulation!A22', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E22': ('Kalkulation!B22', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C22', 'Kalkulation!D22', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F22': ('Kalkulation!B8', 'Kalkulation!E22'),
+    'Kalkulation!G22': ('Kalkulation!B22', 'Kalkulation!C22', 'Kalkulation!E10'),
+    'Kalkulation!H22': ('Kalkulation!A22', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F22', 'Kalkulation!K6'),
+    'Kalkulation!I22': ('Kalkulation!A22', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J22': ('Kalkulation!A22', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F22', 'Kalkulation!I22'),
+    'Kalkulation!K22': ('Kalkulation!H22', 'Kalkulation!J22'),
+    'Kalkulation!L22': ('Kalkulation!A22', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G22', 'Kalkulation!H22'),
+    'Kalkulation!B23': ('Kalkulation!A23', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C23': ('Kalkulation!A23', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D23': ('Kalkulation!A23', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E23': ('Kalkulation!B23', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C23', 'Kalkulation!D23', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F23': ('Kalkulation!B8', 'Kalkulation!E23'),
+    'Kalkulation!G23': ('Kalkulation!B23', 'Kalkulation!C23', 'Kalkulation!E10'),
+    'Kalkulation!H23': ('Kalkulation!A23', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F23', 'Kalkulation!K6'),
+    'Kalkulation!I23': ('Kalkulation!A23', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J23': ('Kalkulation!A23', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F23', 'Kalkulation!I23'),
+    'Kalkulation!K23': ('Kalkulation!H23', 'Kalkulation!J23'),
+    'Kalkulation!L23': ('Kalkulation!A23', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G23', 'Kalkulation!H23'),
+    'Kalkulation!B24': ('Kalkulation!A24', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C24': ('Kalkulation!A24', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D24': ('Kalkulation!A24', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E24': ('Kalkulation!B24', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C24', 'Kalkulation!D24', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F24': ('Kalkulation!B8', 'Kalkulation!E24'),
+    'Kalkulation!G24': ('Kalkulation!B24', 'Kalkulation!C24', 'Kalkulation!E10'),
+    'Kalkulation!H24': ('Kalkulation!A24', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F24', 'Kalkulation!K6'),
+    'Kalkulation!I24': ('Kalkulation!A24', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J24': ('Kalkulation!A24', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F24', 'Kalkulation!I24'),
+    'Kalkulation!K24': ('Kalkulation!H24', 'Kalkulation!J24'),
+    'Kalkulation!L24': ('Kalkulation!A24', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G24', 'Kalkulation!H24'),
+    'Kalkulation!B25': ('Kalkulation!A25', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C25': ('Kalkulation!A25', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D25': ('Kalkulation!A25', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E25': ('Kalkulation!B25', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C25', 'Kalkulation!D25', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F25': ('Kalkulation!B8', 'Kalkulation!E25'),
+    'Kalkulation!G25': ('Kalkulation!B25', 'Kalkulation!C25', 'Kalkulation!E10'),
+    'Kalkulation!H25': ('Kalkulation!A25', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F25', 'Kalkulation!K6'),
+    'Kalkulation!I25': ('Kalkulation!A25', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J25': ('Kalkulation!A25', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F25', 'Kalkulation!I25'),
+    'Kalkulation!K25': ('Kalkulation!H25', 'Kalkulation!J25'),
+    'Kalkulation!L25': ('Kalkulation!A25', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G25', 'Kalkulation!H25'),
+    'Kalkulation!B26': ('Kalkulation!A26', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C26': ('Kalkulation!A26', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D26': ('Kalkulation!A26', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E26': ('Kalkulation!B26', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C26', 'Kalkulation!D26', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F26': ('Kalkulation!B8', 'Kalkulation!E26'),
+    'Kalkulation!G26': ('Kalkulation!B26', 'Kalkulation!C26', 'Kalkulation!E10'),
+    'Kalkulation!H26': ('Kalkulation!A26', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F26', 'Kalkulation!K6'),
+    'Kalkulation!I26': ('Kalkulation!A26', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J26': ('Kalkulation!A26', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F26', 'Kalkulation!I26'),
+    'Kalkulation!K26': ('Kalkulation!H26', 'Kalkulation!J26'),
+    'Kalkulation!L26': ('Kalkulation!A26', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G26', 'Kalkulation!H26'),
+    'Kalkulation!B27': ('Kalkulation!A27', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C27': ('Kalkulation!A27', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D27': ('Kalkulation!A27', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E27': ('Kalkulation!B27', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C27', 'Kalkulation!D27', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F27': ('Kalkulation!B8', 'Kalkulation!E27'),
+    'Kalkulation!G27': ('Kalkulation!B27', 'Kalkulation!C27', 'Kalkulation!E10'),
+    'Kalkulation!H27': ('Kalkulation!A27', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F27', 'Kalkulation!K6'),
+    'Kalkulation!I27': ('Kalkulation!A27', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J27': ('Kalkulation!A27', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F27', 'Kalkulation!I27'),
+    'Kalkulation!K27': ('Kalkulation!H27', 'Kalkulation!J27'),
+    'Kalkulation!L27': ('Kalkulation!A27', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G27', 'Kalkulation!H27'),
+    'Kalkulation!B28': ('Kalkulation!A28', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C28': ('Kalkulation!A28', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D28': ('Kalkulation!A28', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E28': ('Kalkulation!B28', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C28', 'Kalkulation!D28', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F28': ('Kalkulation!B8', 'Kalkulation!E28'),
+    'Kalkulation!G28': ('Kalkulation!B28', 'Kalkulation!C28', 'Kalkulation!E10'),
+    'Kalkulation!H28': ('Kalkulation!A28', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F28', 'Kalkulation!K6'),
+    'Kalkulation!I28': ('Kalkulation!A28', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J28': ('Kalkulation!A28', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F28', 'Kalkulation!I28'),
+    'Kalkulation!K28': ('Kalkulation!H28', 'Kalkulation!J28'),
+    'Kalkulation!L28': ('Kalkulation!A28', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G28', 'Kalkulation!H28'),
+    'Kalkulation!B29': ('Kalkulation!A29', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C29': ('Kalkulation!A29', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D29': ('Kalkulation!A29', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E29': ('Kalkulation!B29', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C29', 'Kalkulation!D29', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F29': ('Kalkulation!B8', 'Kalkulation!E29'),
+    'Kalkulation!G29': ('Kalkulation!B29', 'Kalkulation!C29', 'Kalkulation!E10'),
+    'Kalkulation!H29': ('Kalkulation!A29', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F29', 'Kalkulation!K6'),
+    'Kalkulation!I29': ('Kalkulation!A29', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J29': ('Kalkulation!A29', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F29', 'Kalkulation!I29'),
+    'Kalkulation!K29': ('Kalkulation!H29', 'Kalkulation!J29'),
+    'Kalkulation!L29': ('Kalkulation!A29', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G29', 'Kalkulation!H29'),
+    'Kalkulation!B30': ('Kalkulation!A30', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C30': ('Kalkulation!A30', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D30': ('Kalkulation!A30', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E30': ('Kalkulation!B30', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C30', 'Kalkulation!D30', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F30': ('Kalkulation!B8', 'Kalkulation!E30'),
+    'Kalkulation!G30': ('Kalkulation!B30', 'Kalkulation!C30', 'Kalkulation!E10'),
+    'Kalkulation!H30': ('Kalkulation!A30', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F30', 'Kalkulation!K6'),
+    'Kalkulation!I30': ('Kalkulation!A30', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J30': ('Kalkulation!A30', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F30', 'Kalkulation!I30'),
+    'Kalkulation!K30': ('Kalkulation!H30', 'Kalkulation!J30'),
+    'Kalkulation!L30': ('Kalkulation!A30', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G30', 'Kalkulation!H30'),
+    'Kalkulation!B31': ('Kalkulation!A31', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C31': ('Kalkulation!A31', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D31': ('Kalkulation!A31', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E31': ('Kalkulation!B31', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C31', 'Kalkulation!D31', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F31': ('Kalkulation!B8', 'Kalkulation!E31'),
+    'Kalkulation!G31': ('Kalkulation!B31', 'Kalkulation!C31', 'Kalkulation!E10'),
+    'Kalkulation!H31': ('Kalkulation!A31', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F31', 'Kalkulation!K6'),
+    'Kalkulation!I31': ('Kalkulation!A31', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J31': ('Kalkulation!A31', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F31', 'Kalkulation!I31'),
+    'Kalkulation!K31': ('Kalkulation!H31', 'Kalkulation!J31'),
+    'Kalkulation!L31': ('Kalkulation!A31', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G31', 'Kalkulation!H31'),
+    'Kalkulation!B32': ('Kalkulation!A32', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C32': ('Kalkulation!A32', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D32': ('Kalkulation!A32', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E32': ('Kalkulation!B32', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C32', 'Kalkulation!D32', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F32': ('Kalkulation!B8', 'Kalkulation!E32'),
+    'Kalkulation!G32': ('Kalkulation!B32', 'Kalkulation!C32', 'Kalkulation!E10'),
+    'Kalkulation!H32': ('Kalkulation!A32', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F32', 'Kalkulation!K6'),
+    'Kalkulation!I32': ('Kalkulation!A32', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J32': ('Kalkulation!A32', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F32', 'Kalkulation!I32'),
+    'Kalkulation!K32': ('Kalkulation!H32', 'Kalkulation!J32'),
+    'Kalkulation!L32': ('Kalkulation!A32', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G32', 'Kalkulation!H32'),
+    'Kalkulation!B33': ('Kalkulation!A33', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C33': ('Kalkulation!A33', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D33': ('Kalkulation!A33', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E33': ('Kalkulation!B33', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C33', 'Kalkulation!D33', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F33': ('Kalkulation!B8', 'Kalkulation!E33'),
+    'Kalkulation!G33': ('Kalkulation!B33', 'Kalkulation!C33', 'Kalkulation!E10'),
+    'Kalkulation!H33': ('Kalkulation!A33', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F33', 'Kalkulation!K6'),
+    'Kalkulation!I33': ('Kalkulation!A33', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J33': ('Kalkulation!A33', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F33', 'Kalkulation!I33'),
+    'Kalkulation!K33': ('Kalkulation!H33', 'Kalkulation!J33'),
+    'Kalkulation!L33': ('Kalkulation!A33', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G33', 'Kalkulation!H33'),
+    'Kalkulation!B34': ('Kalkulation!A34', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C34': ('Kalkulation!A34', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D34': ('Kalkulation!A34', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E34': ('Kalkulation!B34', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C34', 'Kalkulation!D34', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F34': ('Kalkulation!B8', 'Kalkulation!E34'),
+    'Kalkulation!G34': ('Kalkulation!B34', 'Kalkulation!C34', 'Kalkulation!E10'),
+    'Kalkulation!H34': ('Kalkulation!A34', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F34', 'Kalkulation!K6'),
+    'Kalkulation!I34': ('Kalkulation!A34', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J34': ('Kalkulation!A34', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F34', 'Kalkulation!I34'),
+    'Kalkulation!K34': ('Kalkulation!H34', 'Kalkulation!J34'),
+    'Kalkulation!L34': ('Kalkulation!A34', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G34', 'Kalkulation!H34'),
+    'Kalkulation!B35': ('Kalkulation!A35', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C35': ('Kalkulation!A35', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D35': ('Kalkulation!A35', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E35': ('Kalkulation!B35', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C35', 'Kalkulation!D35', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F35': ('Kalkulation!B8', 'Kalkulation!E35'),
+    'Kalkulation!G35': ('Kalkulation!B35', 'Kalkulation!C35', 'Kalkulation!E10'),
+    'Kalkulation!H35': ('Kalkulation!A35', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F35', 'Kalkulation!K6'),
+    'Kalkulation!I35': ('Kalkulation!A35', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J35': ('Kalkulation!A35', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F35', 'Kalkulation!I35'),
+    'Kalkulation!K35': ('Kalkulation!H35', 'Kalkulation!J35'),
+    'Kalkulation!L35': ('Kalkulation!A35', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G35', 'Kalkulation!H35'),
+    'Kalkulation!B36': ('Kalkulation!A36', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C36': ('Kalkulation!A36', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D36': ('Kalkulation!A36', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E36': ('Kalkulation!B36', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C36', 'Kalkulation!D36', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F36': ('Kalkulation!B8', 'Kalkulation!E36'),
+    'Kalkulation!G36': ('Kalkulation!B36', 'Kalkulation!C36', 'Kalkulation!E10'),
+    'Kalkulation!H36': ('Kalkulation!A36', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F36', 'Kalkulation!K6'),
+    'Kalkulation!I36': ('Kalkulation!A36', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J36': ('Kalkulation!A36', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F36', 'Kalkulation!I36'),
+    'Kalkulation!K36': ('Kalkulation!H36', 'Kalkulation!J36'),
+    'Kalkulation!L36': ('Kalkulation!A36', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G36', 'Kalkulation!H36'),
+    'Kalkulation!B37': ('Kalkulation!A37', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C37': ('Kalkulation!A37', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D37': ('Kalkulation!A37', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E37': ('Kalkulation!B37', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C37', 'Kalkulation!D37', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F37': ('Kalkulation!B8', 'Kalkulation!E37'),
+    'Kalkulation!G37': ('Kalkulation!B37', 'Kalkulation!C37', 'Kalkulation!E10'),
+    'Kalkulation!H37': ('Kalkulation!A37', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F37', 'Kalkulation!K6'),
+    'Kalkulation!I37': ('Kalkulation!A37', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J37': ('Kalkulation!A37', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F37', 'Kalkulation!I37'),
+    'Kalkulation!K37': ('Kalkulation!H37', 'Kalkulation!J37'),
+    'Kalkulation!L37': ('Kalkulation!A37', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G37', 'Kalkulation!H37'),
+    'Kalkulation!B38': ('Kalkulation!A38', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C38': ('Kalkulation!A38', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D38': ('Kalkulation!A38', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E38': ('Kalkulation!B38', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C38', 'Kalkulation!D38', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F38': ('Kalkulation!B8', 'Kalkulation!E38'),
+    'Kalkulation!G38': ('Kalkulation!B38', 'Kalkulation!C38', 'Kalkulation!E10'),
+    'Kalkulation!H38': ('Kalkulation!A38', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F38', 'Kalkulation!K6'),
+    'Kalkulation!I38': ('Kalkulation!A38', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J38': ('Kalkulation!A38', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F38', 'Kalkulation!I38'),
+    'Kalkulation!K38': ('Kalkulation!H38', 'Kalkulation!J38'),
+    'Kalkulation!L38': ('Kalkulation!A38', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G38', 'Kalkulation!H38'),
+    'Kalkulation!B39': ('Kalkulation!A39', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C39': ('Kalkulation!A39', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D39': ('Kalkulation!A39', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E39': ('Kalkulation!B39', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C39', 'Kalkulation!D39', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F39': ('Kalkulation!B8', 'Kalkulation!E39'),
+    'Kalkulation!G39': ('Kalkulation!B39', 'Kalkulation!C39', 'Kalkulation!E10'),
+    'Kalkulation!H39': ('Kalkulation!A39', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F39', 'Kalkulation!K6'),
+    'Kalkulation!I39': ('Kalkulation!A39', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J39': ('Kalkulation!A39', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F39', 'Kalkulation!I39'),
+    'Kalkulation!K39': ('Kalkulation!H39', 'Kalkulation!J39'),
+    'Kalkulation!L39': ('Kalkulation!A39', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G39', 'Kalkulation!H39'),
+    'Kalkulation!B40': ('Kalkulation!A40', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C40': ('Kalkulation!A40', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D40': ('Kalkulation!A40', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E40': ('Kalkulation!B4', 'Kalkulation!B40', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C40', 'Kalkulation!D40', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F40': ('Kalkulation!B8', 'Kalkulation!E40'),
+    'Kalkulation!G40': ('Kalkulation!B40', 'Kalkulation!C40', 'Kalkulation!E10'),
+    'Kalkulation!H40': ('Kalkulation!A40', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F40', 'Kalkulation!K6'),
+    'Kalkulation!I40': ('Kalkulation!A40', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J40': ('Kalkulation!A40', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F40', 'Kalkulation!I40'),
+    'Kalkulation!K40': ('Kalkulation!H40', 'Kalkulation!J40'),
+    'Kalkulation!L40': ('Kalkulation!A40', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G40', 'Kalkulation!H40'),
+    'Kalkulation!B41': ('Kalkulation!A41', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C41': ('Kalkulation!A41', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D41': ('Kalkulation!A41', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E41': ('Kalkulation!B4', 'Kalkulation!B41', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C41', 'Kalkulation!D41', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F41': ('Kalkulation!B8', 'Kalkulation!E41'),
+    'Kalkulation!G41': ('Kalkulation!B41', 'Kalkulation!C41', 'Kalkulation!E10'),
+    'Kalkulation!H41': ('Kalkulation!A41', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F41', 'Kalkulation!K6'),
+    'Kalkulation!I41': ('Kalkulation!A41', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J41': ('Kalkulation!A41', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F41', 'Kalkulation!I41'),
+    'Kalkulation!K41': ('Kalkulation!H41', 'Kalkulation!J41'),
+    'Kalkulation!L41': ('Kalkulation!A41', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G41', 'Kalkulation!H41'),
+    'Kalkulation!B42': ('Kalkulation!A42', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C42': ('Kalkulation!A42', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D42': ('Kalkulation!A42', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E42': ('Kalkulation!B4', 'Kalkulation!B42', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C42', 'Kalkulation!D42', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F42': ('Kalkulation!B8', 'Kalkulation!E42'),
+    'Kalkulation!G42': ('Kalkulation!B42', 'Kalkulation!C42', 'Kalkulation!E10'),
+    'Kalkulation!H42': ('Kalkulation!A42', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F42', 'Kalkulation!K6'),
+    'Kalkulation!I42': ('Kalkulation!A42', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J42': ('Kalkulation!A42', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F42', 'Kalkulation!I42'),
+    'Kalkulation!K42': ('Kalkulation!H42', 'Kalkulation!J42'),
+    'Kalkulation!L42': ('Kalkulation!A42', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G42', 'Kalkulation!H42'),
+    'Kalkulation!B43': ('Kalkulation!A43', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C43': ('Kalkulation!A43', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D43': ('Kalkulation!A43', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E43': ('Kalkulation!B4', 'Kalkulation!B43', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C43', 'Kalkulation!D43', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F43': ('Kalkulation!B8', 'Kalkulation!E43'),
+    'Kalkulation!G43': ('Kalkulation!B43', 'Kalkulation!C43', 'Kalkulation!E10'),
+    'Kalkulation!H43': ('Kalkulation!A43', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F43', 'Kalkulation!K6'),
+    'Kalkulation!I43': ('Kalkulation!A43', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J43': ('Kalkulation!A43', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F43', 'Kalkulation!I43'),
+    'Kalkulation!K43': ('Kalkulation!H43', 'Kalkulation!J43'),
+    'Kalkulation!L43': ('Kalkulation!A43', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G43', 'Kalkulation!H43'),
+    'Kalkulation!B44': ('Kalkulation!A44', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C44': ('Kalkulation!A44', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D44': ('Kalkulation!A44', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E44': ('Kalkulation!B4', 'Kalkulation!B44', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C44', 'Kalkulation!D44', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F44': ('Kalkulation!B8', 'Kalkulation!E44'),
+    'Kalkulation!G44': ('Kalkulation!B44', 'Kalkulation!C44', 'Kalkulation!E10'),
+    'Kalkulation!H44': ('Kalkulation!A44', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F44', 'Kalkulation!K6'),
+    'Kalkulation!I44': ('Kalkulation!A44', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J44': ('Kalkulation!A44', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F44', 'Kalkulation!I44'),
+    'Kalkulation!K44': ('Kalkulation!H44', 'Kalkulation!J44'),
+    'Kalkulation!L44': ('Kalkulation!A44', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G44', 'Kalkulation!H44'),
+    'Kalkulation!B45': ('Kalkulation!A45', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C45': ('Kalkulation!A45', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D45': ('Kalkulation!A45', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E45': ('Kalkulation!B4', 'Kalkulation!B45', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C45', 'Kalkulation!D45', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F45': ('Kalkulation!B8', 'Kalkulation!E45'),
+    'Kalkulation!G45': ('Kalkulation!B45', 'Kalkulation!C45', 'Kalkulation!E10'),
+    'Kalkulation!H45': ('Kalkulation!A45', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F45', 'Kalkulation!K6'),
+    'Kalkulation!I45': ('Kalkulation!A45', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J45': ('Kalkulation!A45', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F45', 'Kalkulation!I45'),
+    'Kalkulation!K45': ('Kalkulation!H45', 'Kalkulation!J45'),
+    'Kalkulation!L45': ('Kalkulation!A45', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G45', 'Kalkulation!H45'),
+    'Kalkulation!B46': ('Kalkulation!A46', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C46': ('Kalkulation!A46', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D46': ('Kalkulation!A46', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E46': ('Kalkulation!B4', 'Kalkulation!B46', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C46', 'Kalkulation!D46', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F46': ('Kalkulation!B8', 'Kalkulation!E46'),
+    'Kalkulation!G46': ('Kalkulation!B46', 'Kalkulation!C46', 'Kalkulation!E10'),
+    'Kalkulation!H46': ('Kalkulation!A46', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F46', 'Kalkulation!K6'),
+    'Kalkulation!I46': ('Kalkulation!A46', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J46': ('Kalkulation!A46', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F46', 'Kalkulation!I46'),
+    'Kalkulation!K46': ('Kalkulation!H46', 'Kalkulation!J46'),
+    'Kalkulation!L46': ('Kalkulation!A46', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G46', 'Kalkulation!H46'),
+    'Kalkulation!B47': ('Kalkulation!A47', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C47': ('Kalkulation!A47', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D47': ('Kalkulation!A47', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E47': ('Kalkulation!B4', 'Kalkulation!B47', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C47', 'Kalkulation!D47', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F47': ('Kalkulation!B8', 'Kalkulation!E47'),
+    'Kalkulation!G47': ('Kalkulation!B47', 'Kalkulation!C47', 'Kalkulation!E10'),
+    'Kalkulation!H47': ('Kalkulation!A47', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F47', 'Kalkulation!K6'),
+    'Kalkulation!I47': ('Kalkulation!A47', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J47': ('Kalkulation!A47', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F47', 'Kalkulation!I47'),
+    'Kalkulation!K47': ('Kalkulation!H47', 'Kalkulation!J47'),
+    'Kalkulation!L47': ('Kalkulation!A47', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G47', 'Kalkulation!H47'),
+    'Kalkulation!B48': ('Kalkulation!A48', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C48': ('Kalkulation!A48', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D48': ('Kalkulation!A48', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E48': ('Kalkulation!B4', 'Kalkulation!B48', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C48', 'Kalkulation!D48', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F48': ('Kalkulation!B8', 'Kalkulation!E48'),
+    'Kalkulation!G48': ('Kalkulation!B48', 'Kalkulation!C48', 'Kalkulation!E10'),
+    'Kalkulation!H48': ('Kalkulation!A48', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F48', 'Kalkulation!K6'),
+    'Kalkulation!I48': ('Kalkulation!A48', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J48': ('Kalkulation!A48', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F48', 'Kalkulation!I48'),
+    'Kalkulation!K48': ('Kalkulation!H48', 'Kalkulation!J48'),
+    'Kalkulation!L48': ('Kalkulation!A48', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G48', 'Kalkulation!H48'),
+    'Kalkulation!B49': ('Kalkulation!A49', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C49': ('Kalkulation!A49', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D49': ('Kalkulation!A49', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E49': ('Kalkulation!B4', 'Kalkulation!B49', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C49', 'Kalkulation!D49', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F49': ('Kalkulation!B8', 'Kalkulation!E49'),
+    'Kalkulation!G49': ('Kalkulation!B49', 'Kalkulation!C49', 'Kalkulation!E10'),
+    'Kalkulation!H49': ('Kalkulation!A49', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F49', 'Kalkulation!K6'),
+    'Kalkulation!I49': ('Kalkulation!A49', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J49': ('Kalkulation!A49', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F49', 'Kalkulation!I49'),
+    'Kalkulation!K49': ('Kalkulation!H49', 'Kalkulation!J49'),
+    'Kalkulation!L49': ('Kalkulation!A49', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G49', 'Kalkulation!H49'),
+    'Kalkulation!B50': ('Kalkulation!A50', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C50': ('Kalkulation!A50', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D50': ('Kalkulation!A50', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E50': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B50', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C50', 'Kalkulation!D50', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F50': ('Kalkulation!B8', 'Kalkulation!E50'),
+    'Kalkulation!G50': ('Kalkulation!B50', 'Kalkulation!C50', 'Kalkulation!E10'),
+    'Kalkulation!H50': ('Kalkulation!A50', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F50', 'Kalkulation!K6'),
+    'Kalkulation!I50': ('Kalkulation!A50', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J50': ('Kalkulation!A50', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F50', 'Kalkulation!I50'),
+    'Kalkulation!K50': ('Kalkulation!H50', 'Kalkulation!J50'),
+    'Kalkulation!L50': ('Kalkulation!A50', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G50', 'Kalkulation!H50'),
+    'Kalkulation!B51': ('Kalkulation!A51', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C51': ('Kalkulation!A51', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D51': ('Kalkulation!A51', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E51': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B51', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C51', 'Kalkulation!D51', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F51': ('Kalkulation!B8', 'Kalkulation!E51'),
+    'Kalkulation!G51': ('Kalkulation!B51', 'Kalkulation!C51', 'Kalkulation!E10'),
+    'Kalkulation!H51': ('Kalkulation!A51', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F51', 'Kalkulation!K6'),
+    'Kalkulation!I51': ('Kalkulation!A51', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J51': ('Kalkulation!A51', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F51', 'Kalkulation!I51'),
+    'Kalkulation!K51': ('Kalkulation!H51', 'Kalkulation!J51'),
+    'Kalkulation!L51': ('Kalkulation!A51', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G51', 'Kalkulation!H51'),
+    'Kalkulation!B52': ('Kalkulation!A52', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C52': ('Kalkulation!A52', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D52': ('Kalkulation!A52', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E52': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B52', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C52', 'Kalkulation!D52', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F52': ('Kalkulation!B8', 'Kalkulation!E52'),
+    'Kalkulation!G52': ('Kalkulation!B52', 'Kalkulation!C52', 'Kalkulation!E10'),
+    'Kalkulation!H52': ('Kalkulation!A52', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F52', 'Kalkulation!K6'),
+    'Kalkulation!I52': ('Kalkulation!A52', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J52': ('Kalkulation!A52', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F52', 'Kalkulation!I52'),
+    'Kalkulation!K52': ('Kalkulation!H52', 'Kalkulation!J52'),
+    'Kalkulation!L52': ('Kalkulation!A52', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G52', 'Kalkulation!H52'),
+    'Kalkulation!B53': ('Kalkulation!A53', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C53': ('Kalkulation!A53', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D53': ('Kalkulation!A53', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E53': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B53', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C53', 'Kalkulation!D53', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F53': ('Kalkulation!B8', 'Kalkulation!E53'),
+    'Kalkulation!G53': ('Kalkulation!B53', 'Kalkulation!C53', 'Kalkulation!E10'),
+    'Kalkulation!H53': ('Kalkulation!A53', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F53', 'Kalkulation!K6'),
+    'Kalkulation!I53': ('Kalkulation!A53', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J53': ('Kalkulation!A53', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F53', 'Kalkulation!I53'),
+    'Kalkulation!K53': ('Kalkulation!H53', 'Kalkulation!J53'),
+    'Kalkulation!L53': ('Kalkulation!A53', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G53', 'Kalkulation!H53'),
+    'Kalkulation!B54': ('Kalkulation!A54', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C54': ('Kalkulation!A54', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D54': ('Kalkulation!A54', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E54': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B54', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C54', 'Kalkulation!D54', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F54': ('Kalkulation!B8', 'Kalkulation!E54'),
+    'Kalkulation!G54': ('Kalkulation!B54', 'Kalkulation!C54', 'Kalkulation!E10'),
+    'Kalkulation!H54': ('Kalkulation!A54', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F54', 'Kalkulation!K6'),
+    'Kalkulation!I54': ('Kalkulation!A54', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J54': ('Kalkulation!A54', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F54', 'Kalkulation!I54'),
+    'Kalkulation!K54': ('Kalkulation!H54', 'Kalkulation!J54'),
+    'Kalkulation!L54': ('Kalkulation!A54', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G54', 'Kalkulation!H54'),
+    'Kalkulation!B55': ('Kalkulation!A55', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C55': ('Kalkulation!A55', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D55': ('Kalkulation!A55', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E55': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B55', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C55', 'Kalkulation!D55', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F55': ('Kalkulation!B8', 'Kalkulation!E55'),
+    'Kalkulation!G55': ('Kalkulation!B55', 'Kalkulation!C55', 'Kalkulation!E10'),
+    'Kalkulation!H55': ('Kalkulation!A55', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F55', 'Kalkulation!K6'),
+    'Kalkulation!I55': ('Kalkulation!A55', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J55': ('Kalkulation!A55', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F55', 'Kalkulation!I55'),
+    'Kalkulation!K55': ('Kalkulation!H55', 'Kalkulation!J55'),
+    'Kalkulation!L55': ('Kalkulation!A55', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G55', 'Kalkulation!H55'),
+    'Kalkulation!B56': ('Kalkulation!A56', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C56': ('Kalkulation!A56', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D56': ('Kalkulation!A56', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E56': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B56', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C56', 'Kalkulation!D56', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F56': ('Kalkulation!B8', 'Kalkulation!E56'),
+    'Kalkulation!G56': ('Kalkulation!B56', 'Kalkulation!C56', 'Kalkulation!E10'),
+    'Kalkulation!H56': ('Kalkulation!A56', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F56', 'Kalkulation!K6'),
+    'Kalkulation!I56': ('Kalkulation!A56', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J56': ('Kalkulation!A56', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F56', 'Kalkulation!I56'),
+    'Kalkulation!K56': ('Kalkulation!H56', 'Kalkulation!J56'),
+    'Kalkulation!L56': ('Kalkulation!A56', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G56', 'Kalkulation!H56'),
+    'Kalkulation!B57': ('Kalkulation!A57', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C57': ('Kalkulation!A57', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D57': ('Kalkulation!A57', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E57': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B57', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C57', 'Kalkulation!D57', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F57': ('Kalkulation!B8', 'Kalkulation!E57'),
+    'Kalkulation!G57': ('Kalkulation!B57', 'Kalkulation!C57', 'Kalkulation!E10'),
+    'Kalkulation!H57': ('Kalkulation!A57', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F57', 'Kalkulation!K6'),
+    'Kalkulation!I57': ('Kalkulation!A57', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J57': ('Kalkulation!A57', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F57', 'Kalkulation!I57'),
+    'Kalkulation!K57': ('Kalkulation!H57', 'Kalkulation!J57'),
+    'Kalkulation!L57': ('Kalkulation!A57', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G57', 'Kalkulation!H57'),
+    'Kalkulation!B58': ('Kalkulation!A58', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C58': ('Kalkulation!A58', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D58': ('Kalkulation!A58', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E58': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B58', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C58', 'Kalkulation!D58', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F58': ('Kalkulation!B8', 'Kalkulation!E58'),
+    'Kalkulation!G58': ('Kalkulation!B58', 'Kalkulation!C58', 'Kalkulation!E10'),
+    'Kalkulation!H58': ('Kalkulation!A58', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F58', 'Kalkulation!K6'),
+    'Kalkulation!I58': ('Kalkulation!A58', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J58': ('Kalkulation!A58', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F58', 'Kalkulation!I58'),
+    'Kalkulation!K58': ('Kalkulation!H58', 'Kalkulation!J58'),
+    'Kalkulation!L58': ('Kalkulation!A58', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G58', 'Kalkulation!H58'),
+    'Kalkulation!B59': ('Kalkulation!A59', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C59': ('Kalkulation!A59', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D59': ('Kalkulation!A59', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E59': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B59', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!C59', 'Kalkulation!D59', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F59': ('Kalkulation!B8', 'Kalkulation!E59'),
+    'Kalkulation!G59': ('Kalkulation!B59', 'Kalkulation!C59', 'Kalkulation!E10'),
+    'Kalkulation!H59': ('Kalkulation!A59', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F59', 'Kalkulation!K6'),
+    'Kalkulation!I59': ('Kalkulation!A59', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J59': ('Kalkulation!A59', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F59', 'Kalkulation!I59'),
+    'Kalkulation!K59': ('Kalkulation!H59', 'Kalkulation!J59'),
+    'Kalkulation!L59': ('Kalkulation!A59', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G59', 'Kalkulation!H59'),
+    'Kalkulation!B60': ('Kalkulation!A60', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C60': ('Kalkulation!A60', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D60': ('Kalkulation!A60', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E60': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B60', 'Kalkulation!B7', 'Kalkulation!C60', 'Kalkulation!D60', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F60': ('Kalkulation!B8', 'Kalkulation!E60'),
+    'Kalkulation!G60': ('Kalkulation!B60', 'Kalkulation!C60', 'Kalkulation!E10'),
+    'Kalkulation!H60': ('Kalkulation!A60', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F60', 'Kalkulation!K6'),
+    'Kalkulation!I60': ('Kalkulation!A60', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J60': ('Kalkulation!A60', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F60', 'Kalkulation!I60'),
+    'Kalkulation!K60': ('Kalkulation!H60', 'Kalkulation!J60'),
+    'Kalkulation!L60': ('Kalkulation!A60', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G60', 'Kalkulation!H60'),
+    'Kalkulation!B61': ('Kalkulation!A61', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C61': ('Kalkulation!A61', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D61': ('Kalkulation!A61', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E61': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B61', 'Kalkulation!B7', 'Kalkulation!C61', 'Kalkulation!D61', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F61': ('Kalkulation!B8', 'Kalkulation!E61'),
+    'Kalkulation!G61': ('Kalkulation!B61', 'Kalkulation!C61', 'Kalkulation!E10'),
+    'Kalkulation!H61': ('Kalkulation!A61', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F61', 'Kalkulation!K6'),
+    'Kalkulation!I61': ('Kalkulation!A61', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J61': ('Kalkulation!A61', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F61', 'Kalkulation!I61'),
+    'Kalkulation!K61': ('Kalkulation!H61', 'Kalkulation!J61'),
+    'Kalkulation!L61': ('Kalkulation!A61', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G61', 'Kalkulation!H61'),
+    'Kalkulation!B62': ('Kalkulation!A62', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C62': ('Kalkulation!A62', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D62': ('Kalkulation!A62', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E62': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B62', 'Kalkulation!B7', 'Kalkulation!C62', 'Kalkulation!D62', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F62': ('Kalkulation!B8', 'Kalkulation!E62'),
+    'Kalkulation!G62': ('Kalkulation!B62', 'Kalkulation!C62', 'Kalkulation!E10'),
+    'Kalkulation!H62': ('Kalkulation!A62', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F62', 'Kalkulation!K6'),
+    'Kalkulation!I62': ('Kalkulation!A62', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J62': ('Kalkulation!A62', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F62', 'Kalkulation!I62'),
+    'Kalkulation!K62': ('Kalkulation!H62', 'Kalkulation!J62'),
+    'Kalkulation!L62': ('Kalkulation!A62', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G62', 'Kalkulation!H62'),
+    'Kalkulation!B63': ('Kalkulation!A63', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C63': ('Kalkulation!A63', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D63': ('Kalkulation!A63', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E63': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B63', 'Kalkulation!B7', 'Kalkulation!C63', 'Kalkulation!D63', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F63': ('Kalkulation!B8', 'Kalkulation!E63'),
+    'Kalkulation!G63': ('Kalkulation!B63', 'Kalkulation!C63', 'Kalkulation!E10'),
+    'Kalkulation!H63': ('Kalkulation!A63', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F63', 'Kalkulation!K6'),
+    'Kalkulation!I63': ('Kalkulation!A63', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J63': ('Kalkulation!A63', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F63', 'Kalkulation!I63'),
+    'Kalkulation!K63': ('Kalkulation!H63', 'Kalkulation!J63'),
+    'Kalkulation!L63': ('Kalkulation!A63', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G63', 'Kalkulation!H63'),
+    'Kalkulation!B64': ('Kalkulation!A64', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C64': ('Kalkulation!A64', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D64': ('Kalkulation!A64', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E64': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B64', 'Kalkulation!B7', 'Kalkulation!C64', 'Kalkulation!D64', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F64': ('Kalkulation!B8', 'Kalkulation!E64'),
+    'Kalkulation!G64': ('Kalkulation!B64', 'Kalkulation!C64', 'Kalkulation!E10'),
+    'Kalkulation!H64': ('Kalkulation!A64', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F64', 'Kalkulation!K6'),
+    'Kalkulation!I64': ('Kalkulation!A64', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J64': ('Kalkulation!A64', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F64', 'Kalkulation!I64'),
+    'Kalkulation!K64': ('Kalkulation!H64', 'Kalkulation!J64'),
+    'Kalkulation!L64': ('Kalkulation!A64', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G64', 'Kalkulation!H64'),
+    'Kalkulation!B65': ('Kalkulation!A65', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C65': ('Kalkulation!A65', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D65': ('Kalkulation!A65', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E65': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B65', 'Kalkulation!B7', 'Kalkulation!C65', 'Kalkulation!D65', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F65': ('Kalkulation!B8', 'Kalkulation!E65'),
+    'Kalkulation!G65': ('Kalkulation!B65', 'Kalkulation!C65', 'Kalkulation!E10'),
+    'Kalkulation!H65': ('Kalkulation!A65', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F65', 'Kalkulation!K6'),
+    'Kalkulation!I65': ('Kalkulation!A65', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J65': ('Kalkulation!A65', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F65', 'Kalkulation!I65'),
+    'Kalkulation!K65': ('Kalkulation!H65', 'Kalkulation!J65'),
+    'Kalkulation!L65': ('Kalkulation!A65', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G65', 'Kalkulation!H65'),
+    'Kalkulation!B66': ('Kalkulation!A66', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!C66': ('Kalkulation!A66', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!D66': ('Kalkulation!A66', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5'),
+    'Kalkulation!E66': ('Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B6', 'Kalkulation!B66', 'Kalkulation!B7', 'Kalkulation!C66', 'Kalkulation!D66', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E9', 'Kalkulation!K9'),
+    'Kalkulation!F66': ('Kalkulation!B8', 'Kalkulation!E66'),
+    'Kalkulation!G66': ('Kalkulation!B66', 'Kalkulation!C66', 'Kalkulation!E10'),
+    'Kalkulation!H66': ('Kalkulation!A66', 'Kalkulation!B4', 'Kalkulation!B5', 'Kalkulation!B7', 'Kalkulation!E4', 'Kalkulation!E5', 'Kalkulation!E6', 'Kalkulation!F66', 'Kalkulation!K6'),
+    'Kalkulation!I66': ('Kalkulation!A66', 'Kalkulation!B4', 'Kalkulation!B6', 'Kalkulation!H4', 'Kalkulation!H5'),
+    'Kalkulation!J66': ('Kalkulation!A66', 'Kalkulation!B6', 'Kalkulation!B8', 'Kalkulation!F66', 'Kalkulation!I66'),
+    'Kalkulation!K66': ('Kalkulation!H66', 'Kalkulation!J66'),
+    'Kalkulation!L66': ('Kalkulation!A66', 'Kalkulation!B6', 'Kalkulation!B7', 'Kalkulation!B8', 'Kalkulation!G66', 'Kalkulation!H66'),
+}
+
+CELL_DEPENDENTS = {
+    'Kalkulation!A16': ('Kalkulation!B16', 'Kalkulation!C16', 'Kalkulation!D16', 'Kalkulation!H16', 'Kalkulation!I16', 'Kalkulation!J16', 'Kalkulation!L16'),
+    'Kalkulation!A17': ('Kalkulation!B17', 'Kalkulation!C17', 'Kalkulation!D17', 'Kalkulation!H17', 'Kalkulation!I17', 'Kalkulation!J17', 'Kalkulation!L17'),
+    'Kalkulation!A18': ('Kalkulation!B18', 'Kalkulation!C18', 'Kalkulation!D18', 'Kalkulation!H18', 'Kalkulation!I18', 'Kalkulation!J18', 'Kalkulation!L18'),
+    'Kalkulation!A19': ('Kalkulation!B19', 'Kalkulation!C19', 'Kalkulation!D19', 'Kalkulation!H19', 'Kalkulation!I19', 'Kalkulation!J19', 'Kalkulation!L19'),
+    'Kalkulation!A20': ('Kalkulation!B20', 'Kalkulation!C20', 'Kalkulation!D20', 'Kalkulation!H20', 'Kalkulation!I20', 'Kalkulation!J20', 'Kalkulation!L20'),
+    'Kalkulation!A21': ('Kalkulation!B21', 'Kalkulation!C21', 'Kalkulation!D21', 'Kalkulation!H21', 'Kalkulation!I21', 'Kalkulation!J21', 'Kalkulation!L21'),
+    'Kalkulation!A22': ('Kalkulation!B22', 'Kalkulation!C22', 'Kalkulation!D22', 'Kalkulation!H22', 'Kalkulation!I22', 'Kalkulation!J22', 'Kalkulation!L22'),
+    'Kalkulation!A23': ('Kalkulation!B23', 'Kalkulation!C23', 'Kalkulation!D23', 'Kalkulation!H23', 'Kalkulation!I23', 'Kalkulation!J23', 'Kalkulation!L23'),
+    'Kalkulation!A24': ('Kalkulation!B24', 'Kalkulation!C24', 'Kalkulation!D24', 'Kalkulation!H24', 'Kalkulation!I24', 'Kalkulation!J24', 'Kalkulation!L24'),
+    'Kalkulation!A25': ('Kalkulation!B25', 'Kalkulation!C25', 'Kalkulation!D25', 'Kalkulation!H25', 'Kalkulation!I25', 'Kalkulation!J25', 'Kalkulation!L25'),
+    'Kalkulation!A26': ('Kalkulation!B26', 'Kalkulation!C26', 'Kalkulation!D26', 'Kalkulation!H26', 'Kalkulation!I26', 'Kalkulation!J26', 'Kalkulation!L26'),
+    'Kalkulation!A27': ('Kalkulation!B27', 'Kalkulation!C27', 'Kalkulation!D27', 'Kalkulation!H27', 'Kalkulation!I27', 'Kalkulation!J27', 'Kalkulation!L27'),
+    'Kalkulation!A28': ('Kalkulation!B28', 'Kalkulation!C28', 'Kalkulation!D28', 'Kalkulation!H28', 'Kalkulation!I28', 'Kalkulation!J28', 'Kalkulation!L28'),
+    'Kalkulation!A29': ('Kalkulation!B29', 'Kalkulation!C29', 'Kalkulation!D29', 'Kalkulation!H29', 'Kalkulation!I29', 'Kalkulation!J29', 'Kalkulation!L29'),
+    'Kalkulation!A30': ('Kalkulation!B30', 'Kalkulation!C30', 'Kalkulation!D30', 'Kalkulation!H30', 'Kalkulation!I30', 'Kalkulation!J30', 'Kalkulation!L30'),
+    'Kalkulation!A31': ('Kalkulation!B31', 'Kalkulation!C31', 'Kalkulation!D31', 'Kalkulation!H31', 'Kalkulation!I31', 'Kalkulation!J31', 'Kalkulation!L31'),
+    'Kalkulation!A32': ('Kalkulation!B32', 'Kalkulation!C32', 'Kalkulation!D32', 'Kalkulation!H32', 'Kalkulation!I32', 'Kalkulation!J32', 'Kalkulation!L32'),
+    'Kalkulation!A33': ('Kalkulation!B33', 'Kalkulation!C33', 'Kalkulation!D33', 'Kalkulation!H33', 'Kalkulation!I33', 'Kalkulation!J33', 'Kalkulation!L33'),
+    'Kalkulation!A34': ('Kalkulation!B34', 'Kalkulation!C34', 'Kalkulation!D34', 'Kalkulation!H34', 'Kalkulation!I34', 'Kalkulation!J34', 'Kalkulation!L34'),
+    'Kalkulation!A35': ('Kalkulation!B35', 'Kalkulation!C35', 'Kalkulation!D35', 'Kalkulation!H35', 'Kalkulation!I35', 'Kalkulation!J35', 'Kalkulation!L35'),
+    'Kalkulation!A36': ('Kalkulation!B36', 'Kalkulation!C36', 'Kalkulation!D36', 'Kalkulation!H36', 'Kalkulation!I36', 'Kalkulation!J36', 'Kalkulation!L36'),
+    'Kalkulation!A37': ('Kalkulation!B37', 'Kalkulation!C37', 'Kalkulation!D37', 'Kalkulation!H37', 'Kalkulation!I37', 'Kalkulation!J37', 'Kalkulation!L37'),
+    'Kalkulation!A38': ('Kalkulation!B38', 'Kalkulation!C38', 'Kalkulation!D38', 'Kalkulation!H38', 'Kalkulation!I38', 'Kalkulation!J38', 'Kalkulation!L38'),
+    'Kalkulation!A39': ('Kalkulation!B39', 'Kalkulation!C39', 'Kalkulation!D39', 'Kalkulation!H39', 'Kalkulation!I39', 'Kalkulation!J39', 'Kalkulation!L39'),
+    'Kalkulation!A40': ('Kalkulation!B40', 'Kalkulation!C40', 'Kalkulation!D40', 'Kalkulation!H40', 'Kalkulation!I40', 'Kalkulation!J40', 'Kalkulation!L40'),
+    'Kalkulation!A41': ('Kalkulation!B41', 'Kalkulation!C41', 'Kalkulation!D41', 'Kalkulation!H41', 'Kalkulation!I41', 'Kalkulation!J41', 'Kalkulation!L41'),
+    'Kalkulation!A42': ('Kalkulation!B42', 'Kalkulation!C42', 'Kalkulation!D42', 'Kalkulation!H42', 'Kalkulation!I42', 'Kalkulation!J42', 'Kalkulation!L42'),
+    'Kalkulation!A43': ('Kalkulation!B43', 'Kalkulation!C43', 'Kalkulation!D43', 'Kalkulation!H43', 'Kalkulation!I43', 'Kalkulation!J43', 'Kalkulation!L43'),
+    'Kalkulation!A44': ('Kalkulation!B44', 'Kalkulation!C44', 'Kalkulation!D44', 'Kalkulation!H44', 'Kalkulation!I44', 'Kalkulation!J44', 'Kalkulation!L44'),
+    'Kalkulation!A45': ('Kalkulation!B45', 'Kalkulation!C45', 'Kalkulation!D45', 'Kalkulation!H45', 'Kalkulation!I45', 'Kalkulation!J45', 'Kalkulation!L45'),
+    'Kalkulation!A46': ('Kalkulation!B46', 'Kalkulation!C46', 'Kalkulation!D46', 'Kalkulation!H46', 'Kalkulation!I46', 'Kalkulation!J46', 'Kalkulation!L46'),
+    'Kalkulation!A47': ('Kalkulation!B47', 'Kalkulation!C47', 'Kalkulation!D47', 'Kalkulation!H47', 'Kalkulation!I47', 'Kalkulation!J47', 'Kalkulation!L47'),
+    'Kalkulation!A48': ('Kalkulation!B48', 'Kalkulation!C48', 'Kalkulation!D48', 'Kalkulation!H48', 'Kalkulation!I48', 'Kalkulation!J48', 'Kalkulation!L48'),
+    'Kalkulation!A49': ('Kalkulation!B49', 'Kalkulation!C49', 'Kalkulation!D49', 'Kalkulation!H49', 'Kalkulation!I49', 'Kalkulation!J49', 'Kalkulation!L49'),
+    'Kalkulation!A50': ('Kalkulation!B50', 'Kalkulation!C50', 'Kalkulation!D50', 'Kalkulation!H50', 'Kalkulation!I50', 'Kalkulation!J50', 'Kalkulation!L50'),
+    'Kalkulation!A51': ('Kalkulation!B51', 'Kalkulation!C51', 'Kalkulation!D51', 'Kalkulation!H51', 'Kalkulation!I51', 'Kalkulation!J51', 'Kalkulation!L51'),
+    'Kalkulation!A52': ('Kalkulation!B52', 'Kalkulation!C52', 'Kalkulation!D52', 'Kalkulation!H52', 'Kalkulation!I52', 'Kalkulation!J52', 'Kalkulation!L52'),
+    'Kalkulation!A53': ('Kalkulation!B53', 'Kalkulation!C53', 'Kalkulation!D53', 'Kalkulation!H53', 'Kalkulation!I53', 'Kalkulation!J53', 'Kalkulation!L53'),
+    'Kalkulation!A54': ('Kalkulation!B54', 'Kalkulation!C54', 'Kalkulation!D54', 'Kalkulation!H54', 'Kalkulation!I54', 'Kalkulation!J54', 'Kalkulation!L54'),
+    'Kalkulation!A55': ('Kalkulation!B55', 'Kalkulation!C55', 'Kalkulation!D55', 'Kalkulation!H55', 'Kalkulation!I55', 'Kalkulation!J55', 'Kalkulation!L55'),
+    'Kalkulation!A56': ('Kalkulation!B56', 'Kalkulation!C56', 'Kalkulation!D56', 'Kalkulation!H56', 'Kalkulation!I56', 'Kalkulation!J56', 'Kalkulation!L56'),
+    'Kalkulation!A57': ('Kalkulation!B57', 'Kalkulation!C57', 'Kalkulation!D57', 'Kalkulation!H57', 'Kalkulation!I57', 'Kalkulation!J57', 'Kalkulation!L57'),
+    'Kalkulation!A58': ('Kalkulation!B58', 'Kalkulation!C58', 'Kalkulation!D58', 'Kalkulation!H58', 'Kalkulation!I58', 'Kalkulation!J58', 'Kalkulation!L58'),
+    'Kalkulation!A59': ('Kalkulation!B59', 'Kalkulation!C59', 'Kalkulation!D59', 'Kalkulation!H59', 'Kalkulation!I59', 'Kalkulation!J59', 'Kalkulation!L59'),
+    'Kalkulation!A60': ('Kalkulation!B60', 'Kalkulation!C60', 'Kalkulation!D60', 'Kalkulation!H60', 'Kalkulation!I60', 'Kalkulation!J60', 'Kalkulation!L60'),
+    'Kalkulation!A61': ('Kalkulation!B61', 'Kalkulation!C61', 'Kalkulation!D61', 'Kalkulation!H61', 'Kalkulation!I61', 'Kalkulation!J61', 'Kalkulation!L61'),
+    'Kalkulation!A62': ('Kalkulation!B62', 'Kalkulation!C62', 'Kalkulation!D62', 'Kalkulation!H62', 'Kalkulation!I62', 'Kalkulation!J62', 'Kalkulation!L62'),
+    'Kalkulation!A63': ('Kalkulation!B63', 'Kalkulation!C63', 'Kalkulation!D63', 'Kalkulation!H63', 'Kalkulation!I63', 'Kalkulation!J63', 'Kalkulation!L63'),
+    'Kalkulation!A64': ('Kalkulation!B64', 'Kalkulation!C64', 'Kalkulation!D64', 'Kalkulation!H64', 'Kalkulation!I64', 'Kalkulation!J64', 'Kalkulation!L64'),
+    'Kalkulation!A65': ('Kalkulation!B65', 'Kalkulation!C65', 'Kalkulation!D65', 'Kalkulation!H65', 'Kalkulation!I65', 'Kalkulation!J65', 'Kalkulation!L65'),
+    'Kalkulation!A66': ('Kalkulation!B66', 'Kalkulation!C66', 'Kalkulation!D66', 'Kalkulation!H66', 'Kalkulation!I66', 'Kalkulation!J66', 'Kalkulation!L66'),
+    'Kalkulation!B16': ('Kalkulation!E16', 'Kalkulation!G16'),
+    'Kalkulation!B17': ('Kalkulation!E17', 'Kalkulation!G17'),
+    'Kalkulation!B18': ('Kalkulation!E18', 'Kalkulation!G18'),
+    'Kalkulation!B19': ('Kalkulation!E19', 'Kalkulation!G19'),
+    'Kalkulation!B20': ('Kalkulation!E20', 'Kalkulation!G20'),
+    'Kalkulation!B21': ('Kalkulation!E21', 'Kalkulation!G21'),
+    'Kalkulation!B22': ('Kalkulation!E22', 'Kalkulation!G22'),
+    'Kalkulation!B23': ('Kalkulation!E23', 'Kalkulation!G23'),
+    'Kalkulation!B24': ('Kalkulation!E24', 'Kalkulation!G24'),
+    'Kalkulation!B25': ('Kalkulation!E25', 'Kalkulation!G25'),
+    'Kalkulation!B26': ('Kalkulation!E26', 'Kalkulation!G26'),
+    'Kalkulation!B27': ('Kalkulation!E27', 'Kalkulation!G27'),
+    'Kalkulation!B28': ('Kalkulation!E28', 'Kalkulation!G28'),
+    'Kalkulation!B29': ('Kalkulation!E29', 'Kalkulation!G29'),
+    'Kalkulation!B30': ('Kalkulation!E30', 'Kalkulation!G30'),
+    'Kalkulation!B31': ('Kalkulation!E31', 'Kalkulation!G31'),
+    'Kalkulation!B32': ('Kalkulation!E32', 'Kalkulation!G32'),
+    'Kalkulation!B33': ('Kalkulation!E33', 'Kalkulation!G33'),
+    'Kalkulation!B34': ('Kalkulation!E34', 'Kalkulation!G34'),
+    'Kalkulation!B35': ('Kalkulation!E35', 'Kalkulation!G35'),
+    'Kalkulation!B36': ('Kalkulation!E36', 'Kalkulation!G36'),
+    'Kalkulation!B37': ('Kalkulation!E37', 'Kalkulation!G37'),
+    'Kalkulation!B38': ('Kalkulation!E38', 'Kalkulation!G38'),
+    'Kalkulation!B39': ('Kalkulation!E39', 'Kalkulation!G39'),
+    'Kalkulation!B4': ('Kalkulation!K5', 'Kalkulation!K9', 'Kalkulation!B16', 'Kalkulation!C16', 'Kalkulation!D16', 'Kalkulation!E16', 'Kalkulation!H16', 'Kalkulation!I16', 'Kalkulation!B17', 'Kalkulation!C17', 'Kalkulation!D17', 'Kalkulation!E17', 'Kalkulation!H17', 'Kalkulation!I17', 'Kalkulation!B18', 'Kalkulation!C18', 'Kalkulation!D18', 'Kalkulation!E18', 'Kalkulation!H18', 'Kalkulation!I18', 'Kalkulation!B19', 'Kalkulation!C19', 'Kalkulation!D19', 'Kalkulation!E19', 'Kalkulation!H19', 'Kalkulation!I19', 'Kalkulation!B20', 'Kalkulation!C20', 'Kalkulation!D20', 'Kalkulation!E20', 'Kalkulation!H20', 'Kalkulation!I20', 'Kalkulation!B21', 'Kalkulation!C21', 'Kalkulation!D21', 'Kalkulation!E21', 'Kalkulation!H21', 'Kalkulation!I21', 'Kalkulation!B22', 'Kalkulation!C22', 'Kalkulation!D22', 'Kalkulation!E22', 'Kalkulation!H22', 'Kalkulation!I22', 'Kalkulation!B23', 'Kalkulation!C23', 'Kalkulation!D23', 'Kalkulation!E23', 'Kalkulation!H23', 'Kalkulation!I23', 'Kalkulation!B24', 'Kalkulation!C24', 'Kalkulation!D24', 'Kalkulation!E24', 'Kalkulation!H24', 'Kalkulation!I24', 'Kalkulation!B25', 'Kalkulation!C25', 'Kalkulation!D25', 'Kalkulation!E25', 'Kalkulation!H25', 'Kalkulation!I25', 'Kalkulation!B26', 'Kalkulation!C26', 'Kalkulation!D26', 'Kalkulation!E26', 'Kalkulation!H26', 'Kalkulation!I26', 'Kalkulation!B27', 'Kalkulation!C27', 'Kalkulation!D27', 'Kalkulation!E27', 'Kalkulation!H27', 'Kalkulation!I27', 'Kalkulation!B28', 'Kalkulation!C28', 'Kalkulation!D28', 'Kalkulation!E28', 'Kalkulation!H28', 'Kalkulation!I28', 'Kalkulation!B29', 'Kalkulation!C29', 'Kalkulation!D29', 'Kalkulation!E29', 'Kalkulation!H29', 'Kalkulation!I29', 'Kalkulation!B30', 'Kalkulation!C30', 'Kalkulation!D30', 'Kalkulation!E30', 'Kalkulation!H30', 'Kalkulation!I30', 'Kalkulation!B31', 'Kalkulation!C31', 'Kalkulation!D31', 'Kalkulation!E31', 'Kalkulation!H31', 'Kalkulation!I31', 'Kalkulation!B32', 'Kalkulation!C32', 'Kalkulation!D32', 'Kalkulation!E32', 'Kalkulation!H32', 'Kalkulation!I32', 'Kalkulation!B33', 'Kalkulation!C33', 'Kalkulation!D33', 'Kalkulation!E33', 'Kalkulation!H33', 'Kalkulation!I33', 'Kalkulation!B34', 'Kalkulation!C34', 'Kalkulation!D34', 'Kalkulation!E34', 'Kalkulation!H34', 'Kalkulation!I34', 'Kalkulation!B35', 'Kalkulation!C35', 'Kalkulation!D35', 'Kalkulation!E35', 'Kalkulation!H35', 'Kalkulation!I35', 'Kalkulation!B36', 'Kalkulation!C36', 'Kalkulation!D36', 'Kalkulation!E36', 'Kalkulation!H36', 'Kalkulation!I36', 'Kalkulation!B37', 'Kalkulation!C37', 'Kalkulation!D37', 'Kalkulation!E37', 'Kalkulation!H37', 'Kalkulation!I37', 'Kalkulation!B38', 'Kalkulation!C38', 'Kalkulation!D38', 'Kalkulation!E38', 'Kalkulation!H38', 'Kalkulation!I38', 'Kalkulation!B39', 'Kalkulation!C39', 'Kalkulation!D39', 'Kalkulation!E39', 'Kalkulation!H39', 'Kalkulation!I39', 'Kalkulation!B40', 'Kalkulation!C40', 'Kalkulation!D40', 'Kalkulation!E40', 'Kalkulation!H40', 'Kalkulation!I40', 'Kalkulation!B41', 'Kalkulation!C41', 'Kalkulation!D41', 'Kalkulation!E41', 'Kalkulation!H41', 'Kalkulation!I41', 'Kalkulation!B42', 'Kalkulation!C42', 'Kalkulation!D42', 'Kalkulation!E42', 'Kalkulation!H42', 'Kalkulation!I42', 'Kalkulation!B43', 'Kalkulation!C43', 'Kalkulation!D43', 'Kalkulation!E43', 'Kalkulation!H43', 'Kalkulation!I43', 'Kalkulation!B44', 'Kalkulation!C44', 'Kalkulation!D44', 'Kalkulation!E44', 'Kalkulation!H44', 'Kalkulation!I44', 'Kalkulation!B45', 'Kalkulation!C45', 'Kalkulation!D45', 'Kalkulation!E45', 'Kalkulation!H45', 'Kalkulation!I45', 'Kalkulation!B46', 'Kalkulation!C46', 'Kalkulation!D46', 'Kalkulation!E46', 'Kalkulation!H46', 'Kalkulation!I46', 'Kalkulation!B47', 'Kalkulation!C47', 'Kalkulation!D47', 'Kalkulation!E47', 'Kalkulation!H47', 'Kalkulation!I47', 'Kalkulation!B48', 'Kalkulation!C48', 'Kalkulation!D48', 'Kalkulation!E48', 'Kalkulation!H48', 'Kalkulation!I48', 'Kalkulation!B49', 'Kalkulation!C49', 'Kalkulation!D49', 'Kalkulation!E49', 'Kalkulation!H49', 'Kalkulation!I49', 'Kalkulation!B50', 'Kalkulation!C50', 'Kalkulation!D50', 'Kalkulation!E50', 'Kalkulation!H50', 'Kalkulation!I50', 'Kalkulation!B51', 'Kalkulation!C51', 'Kalkulation!D51', 'Kalkulation!E51', 'Kalkulation!H51', 'Kalkulation!I51', 'Kalkulation!B52', 'Kalkulation!C52', 'Kalkulation!D52', 'Kalkulation!E52', 'Kalkulation!H52', 'Kalkulation!I52', 'Kalkulation!B53', 'Kalkulation!C53', 'Kalkulation!D53', 'Kalkulation!E53', 'Kalkulation!H53', 'Kalkulation!I53', 'Kalkulation!B54', 'Kalkulation!C54', 'Kalkulation!D54', 'Kalkulation!E54', 'Kalkulation!H54', 'Kalkulation!I54', 'Kalkulation!B55', 'Kalkulation!C55', 'Kalkulation!D55', 'Kalkulation!E55', 'Kalkulation!H55', 'Kalkulation!I55', 'Kalkulation!B56', 'Kalkulation!C56', 'Kalkulation!D56', 'Kalkulation!E56', 'Kalkulation!H56', 'Kalkulation!I56', 'Kalkulation!B57', 'Kalkulation!C57', 'Kalkulation!D57', 'Kalkulation!E57', 'Kalkulation!H57', 'Kalkulation!I57', 'Kalkulation!B58', 'Kalkulation!C58', 'Kalkulation!D58', 'Kalkulation!E58', 'Kalkulation!H58', 'Kalkulation!I58', 'Kalkulation!B59', 'Kalkulation!C59', 'Kalkulation!D59', 'Kalkulation!E59', 'Kalkulation!H59', 'Kalkulation!I59', 'Kalkulation!B60', 'Kalkulation!C60', 'Kalkulation!D60', 'Kalkulation!E60', 'Kalkulation!H60', 'Kalkulation!I60', 'Kalkulation!B61', 'Kalkulation!C61', 'Kalkulation!D61', 'Kalkulation!E61', 'Kalkulation!H61', 'Kalkulation!I61', 'Kalkulation!B62', 'Kalkulation!C62', 'Kalkulation!D62', 'Kalkulation!E62', 'Kalkulation!H62', 'Kalkulation!I62', 'Kalkulation!B63', 'Kalkulation!C63', 'Kalkulation!D63', 'Kalkulation!E63', 'Kalkulation!H63', 'Kalkulation!I63', 'Kalkulation!B64', 'Kalkulation!C64', 'Kalkulation!D64', 'Kalkulation!E64', 'Kalkulation!H64', 'Kalkulation!I64', 'Kalkulation!B65', 'Kalkulation!C65', 'Kalkulation!D65', 'Kalkulation!E65', 'Kalkulation!H65', 'Kalkulation!I65', 'Kalkulation!B66', 'Kalkulation!C66', 'Kalkulation!D66', 'Kalkulation!E66', 'Kalkulation!H66', 'Kalkulation!I66'),
+    'Kalkulation!B40': ('Kalkulation!E40', 'Kalkulation!G40'),
+    'Kalkulation!B41': ('Kalkulation!E41', 'Kalkulation!G41'),
+    'Kalkulation!B42': ('Kalkulation!E42', 'Kalkulation!G42'),
+    'Kalkulation!B43': ('Kalkulation!E43', 'Kalkulation!G43'),
+    'Kalkulation!B44': ('Kalkulation!E44', 'Kalkulation!G44'),
+    'Kalkulation!B45': ('Kalkulation!E45', 'Kalkulation!G45'),
+    'Kalkulation!B46': ('Kalkulation!E46', 'Kalkulation!G46'),
+    'Kalkulation!B47': ('Kalkulation!E47', 'Kalkulation!G47'),
+    'Kalkulation!B48': ('Kalkulation!E48', 'Kalkulation!G48'),
+    'Kalkulation!B49': ('Kalkulation!E49', 'Kalkulation!G49'),
+    'Kalkulation!B5': ('Kalkulation!K5', 'Kalkulation!K9', 'Kalkulation!B16', 'Kalkulation!C16', 'Kalkulation!D16', 'Kalkulation!E16', 'Kalkulation!H16', 'Kalkulation!B17', 'Kalkulation!C17', 'Kalkulation!D17', 'Kalkulation!E17', 'Kalkulation!H17', 'Kalkulation!B18', 'Kalkulation!C18', 'Kalkulation!D18', 'Kalkulation!E18', 'Kalkulation!H18', 'Kalkulation!B19', 'Kalkulation!C19', 'Kalkulation!D19', 'Kalkulation!E19', 'Kalkulation!H19', 'Kalkulation!B20', 'Kalkulation!C20', 'Kalkulation!D20', 'Kalkulation!E20', 'Kalkulation!H20', 'Kalkulation!B21', 'Kalkulation!C21', 'Kalkulation!D21', 'Kalkulation!E21', 'Kalkulation!H21', 'Kalkulation!B22', 'Kalkulation!C22', 'Kalkulation!D22', 'Kalkulation!E22', 'Kalkulation!H22', 'Kalkulation!B23', 'Kalkulation!C23', 'Kalkulation!D23', 'Kalkulation!E23', 'Kalkulation!H23', 'Kalkulation!B24', 'Kalkulation!C24', 'Kalkulation!D24', 'Kalkulation!E24', 'Kalkulation!H24', 'Kalkulation!B25', 'Kalkulation!C25', 'Kalkulation!D25', 'Kalkulation!E25', 'Kalkulation!H25', 'Kalkulation!B26', 'Kalkulation!C26', 'Kalkulation!D26', 'Kalkulation!E26', 'Kalkulation!H26', 'Kalkulation!B27', 'Kalkulation!C27', 'Kalkulation!D27', 'Kalkulation!E27', 'Kalkulation!H27', 'Kalkulation!B28', 'Kalkulation!C28', 'Kalkulation!D28', 'Kalkulation!E28', 'Kalkulation!H28', 'Kalkulation!B29', 'Kalkulation!C29', 'Kalkulation!D29', 'Kalkulation!E29', 'Kalkulation!H29', 'Kalkulation!B30', 'Kalkulation!C30', 'Kalkulation!D30', 'Kalkulation!E30', 'Kalkulation!H30', 'Kalkulation!B31', 'Kalkulation!C31', 'Kalkulation!D31', 'Kalkulation!E31', 'Kalkulation!H31', 'Kalkulation!B32', 'Kalkulation!C32', 'Kalkulation!D32', 'Kalkulation!E32', 'Kalkulation!H32', 'Kalkulation!B33', 'Kalkulation!C33', 'Kalkulation!D33', 'Kalkulation!E33', 'Kalkulation!H33', 'Kalkulation!B34', 'Kalkulation!C34', 'Kalkulation!D34', 'Kalkulation!E34', 'Kalkulation!H34', 'Kalkulation!B35', 'Kalkulation!C35', 'Kalkulation!D35', 'Kalkulation!E35', 'Kalkulation!H35', 'Kalkulation!B36', 'Kalkulation!C36', 'Kalkulation!D36', 'Kalkulation!E36', 'Kalkulation!H36', 'Kalkulation!B37', 'Kalkulation!C37', 'Kalkulation!D37', 'Kalkulation!E37', 'Kalkulation!H37', 'Kalkulation!B38', 'Kalkulation!C38', 'Kalkulation!D38', 'Kalkulation!E38', 'Kalkulation!H38', 'Kalkulation!B39', 'Kalkulation!C39', 'Kalkulation!D39', 'Kalkulation!E39', 'Kalkulation!H39', 'Kalkulation!B40', 'Kalkulation!C40', 'Kalkulation!D40', 'Kalkulation!E40', 'Kalkulation!H40', 'Kalkulation!B41', 'Kalkulation!C41', 'Kalkulation!D41', 'Kalkulation!E41', 'Kalkulation!H41', 'Kalkulation!B42', 'Kalkulation!C42', 'Kalkulation!D42', 'Kalkulation!E42', 'Kalkulation!H42', 'Kalkulation!B43', 'Kalkulation!C43', 'Kalkulation!D43', 'Kalkulation!E43', 'Kalkulation!H43', 'Kalkulation!B44', 'Kalkulation!C44', 'Kalkulation!D44', 'Kalkulation!E44', 'Kalkulation!H44', 'Kalkulation!B45', 'Kalkulation!C45', 'Kalkulation!D45', 'Kalkulation!E45', 'Kalkulation!H45', 'Kalkulation!B46', 'Kalkulation!C46', 'Kalkulation!D46', 'Kalkulation!E46', 'Kalkulation!H46', 'Kalkulation!B47', 'Kalkulation!C47', 'Kalkulation!D47', 'Kalkulation!E47', 'Kalkulation!H47', 'Kalkulation!B48', 'Kalkulation!C48', 'Kalkulation!D48', 'Kalkulation!E48', 'Kalkulation!H48', 'Kalkulation!B49', 'Kalkulation!C49', 'Kalkulation!D49', 'Kalkulation!E49', 'Kalkulation!H49', 'Kalkulation!B50', 'Kalkulation!C50', 'Kalkulation!D50', 'Kalkulation!E50', 'Kalkulation!H50', 'Kalkulation!B51', 'Kalkulation!C51', 'Kalkulation!D51', 'Kalkulation!E51', 'Kalkulation!H51', 'Kalkulation!B52', 'Kalkulation!C52', 'Kalkulation!D52', 'Kalkulation!E52', 'Kalkulation!H52', 'Kalkulation!B53', 'Kalkulation!C53', 'Kalkulation!D53', 'Kalkulation!E53', 'Kalkulation!H53', 'Kalkulation!B54', 'Kalkulation!C54', 'Kalkulation!D54', 'Kalkulation!E54', 'Kalkulation!H54', 'Kalkulation!B55', 'Kalkulation!C55', 'Kalkulation!D55', 'Kalkulation!E55', 'Kalkulation!H55', 'Kalkulation!B56', 'Kalkulation!C56', 'Kalkulation!D56', 'Kalkulation!E56', 'Kalkulation!H56', 'Kalkulation!B57', 'Kalkulation!C57', 'Kalkulation!D57', 'Kalkulation!E57', 'Kalkulation!H57', 'Kalkulation!B58', 'Kalkulation!C58', 'Kalkulation!D58', 'Kalkulation!E58', 'Kalkulation!H58', 'Kalkulation!B59', 'Kalkulation!C59', 'Kalkulation!D59', 'Kalkulation!E59', 'Kalkulation!H59', 'Kalkulation!B60', 'Kalkulation!C60', 'Kalkulation!D60', 'Kalkulation!E60', 'Kalkulation!H60', 'Kalkulation!B61', 'Kalkulation!C61', 'Kalkulation!D61', 'Kalkulation!E61', 'Kalkulation!H61', 'Kalkulation!B62', 'Kalkulation!C62', 'Kalkulation!D62', 'Kalkulation!E62', 'Kalkulation!H62', 'Kalkulation!B63', 'Kalkulation!C63', 'Kalkulation!D63', 'Kalkulation!E63', 'Kalkulation!H63', 'Kalkulation!B64', 'Kalkulation!C64', 'Kalkulation!D64', 'Kalkulation!E64', 'Kalkulation!H64', 'Kalkulation!B65', 'Kalkulation!C65', 'Kalkulation!D65', 'Kalkulation!E65', 'Kalkulation!H65', 'Kalkulation!B66', 'Kalkulation!C66', 'Kalkulation!D66', 'Kalkulation!E66', 'Kalkulation!H66'),
+    'Kalkulation!B50': ('Kalkulation!E50', 'Kalkulation!G50'),
+    'Kalkulation!B51': ('Kalkulation!E51', 'Kalkulation!G51'),
+    'Kalkulation!B52': ('Kalkulation!E52', 'Kalkulation!G52'),
+    'Kalkulation!B53': ('Kalkulation!E53', 'Kalkulation!G53'),
+    'Kalkulation!B54': ('Kalkulation!E54', 'Kalkulation!G54'),
+    'Kalkulation!B55': ('Kalkulation!E55', 'Kalkulation!G55'),
+    'Kalkulation!B56': ('Kalkulation!E56', 'Kalkulation!G56'),
+    'Kalkulation!B57': ('Kalkulation!E57', 'Kalkulation!G57'),
+    'Kalkulation!B58': ('Kalkulation!E58', 'Kalkulation!G58'),
+    'Kalkulation!B59': ('Kalkulation!E59', 'Kalkulation!G59'),
+    'Kalkulation!B6': ('Kalkulation!K5', 'Kalkulation!K9', 'Kalkulation!B16', 'Kalkulation!C16', 'Kalkulation!E16', 'Kalkulation!I16', 'Kalkulation!J16', 'Kalkulation!L16', 'Kalkulation!B17', 'Kalkulation!C17', 'Kalkulation!E17', 'Kalkulation!I17', 'Kalkulation!J17', 'Kalkulation!L17', 'Kalkulation!B18', 'Kalkulation!C18', 'Kalkulation!E18', 'Kalkulation!I18', 'Kalkulation!J18', 'Kalkulation!L18', 'Kalkulation!B19', 'Kalkulation!C19', 'Kalkulation!E19', 'Kalkulation!I19', 'Kalkulation!J19', 'Kalkulation!L19', 'Kalkulation!B20', 'Kalkulation!C20', 'Kalkulation!E20', 'Kalkulation!I20', 'Kalkulation!J20', 'Kalkulation!L20', 'Kalkulation!B21', 'Kalkulation!C21', 'Kalkulation!E21', 'Kalkulation!I21', 'Kalkulation!J21', 'Kalkulation!L21', 'Kalkulation!B22', 'Kalkulation!C22', 'Kalkulation!E22', 'Kalkulation!I22', 'Kalkulation!J22', 'Kalkulation!L22', 'Kalkulation!B23', 'Kalkulation!C23', 'Kalkulation!E23', 'Kalkulation!I23', 'Kalkulation!J23', 'Kalkulation!L23', 'Kalkulation!B24', 'Kalkulation!C24', 'Kalkulation!E24', 'Kalkulation!I24', 'Kalkulation!J24', 'Kalkulation!L24', 'Kalkulation!B25', 'Kalkulation!C25', 'Kalkulation!E25', 'Kalkulation!I25', 'Kalkulation!J25', 'Kalkulation!L25', 'Kalkulation!B26', 'Kalkulation!C26', 'Kalkulation!E26', 'Kalkulation!I26', 'Kalkulation!J26', 'Kalkulation!L26', 'Kalkulation!B27', 'Kalkulation!C27', 'Kalkulation!E27', 'Kalkulation!I27', 'Kalkulation!J27', 'Kalkulation!L27', 'Kalkulation!B28', 'Kalkulation!C28', 'Kalkulation!E28', 'Kalkulation!I28', 'Kalkulation!J28', 'Kalkulation!L28', 'Kalkulation!B29', 'Kalkulation!C29', 'Kalkulation!E29', 'Kalkulation!I29', 'Kalkulation!J29', 'Kalkulation!L29', 'Kalkulation!B30', 'Kalkulation!C30', 'Kalkulation!E30', 'Kalkulation!I30', 'Kalkulation!J30', 'Kalkulation!L30', 'Kalkulation!B31', 'Kalkulation!C31', 'Kalkulation!E31', 'Kalkulation!I31', 'Kalkulation!J31', 'Kalkulation!L31', 'Kalkulation!B32', 'Kalkulation!C32', 'Kalkulation!E32', 'Kalkulation!I32', 'Kalkulation!J32', 'Kalkulation!L32', 'Kalkulation!B33', 'Kalkulation!C33', 'Kalkulation!E33', 'Kalkulation!I33', 'Kalkulation!J33', 'Kalkulation!L33', 'Kalkulation!B34', 'Kalkulation!C34', 'Kalkulation!E34', 'Kalkulation!I34', 'Kalkulation!J34', 'Kalkulation!L34', 'Kalkulation!B35', 'Kalkulation!C35', 'Kalkulation!E35', 'Kalkulation!I35', 'Kalkulation!J35', 'Kalkulation!L35', 'Kalkulation!B36', 'Kalkulation!C36', 'Kalkulation!E36', 'Kalkulation!I36', 'Kalkulation!J36', 'Kalkulation!L36', 'Kalkulation!B37', 'Kalkulation!C37', 'Kalkulation!E37', 'Kalkulation!I37', 'Kalkulation!J37', 'Kalkulation!L37', 'Kalkulation!B38', 'Kalkulation!C38', 'Kalkulation!E38', 'Kalkulation!I38', 'Kalkulation!J38', 'Kalkulation!L38', 'Kalkulation!B39', 'Kalkulation!C39', 'Kalkulation!E39', 'Kalkulation!I39', 'Kalkulation!J39', 'Kalkulation!L39', 'Kalkulation!B40', 'Kalkulation!C40', 'Kalkulation!E40', 'Kalkulation!I40', 'Kalkulation!J40', 'Kalkulation!L40', 'Kalkulation!B41', 'Kalkulation!C41', 'Kalkulation!E41', 'Kalkulation!I41', 'Kalkulation!J41', 'Kalkulation!L41', 'Kalkulation!B42', 'Kalkulation!C42', 'Kalkulation!E42', 'Kalkulation!I42', 'Kalkulation!J42', 'Kalkulation!L42', 'Kalkulation!B43', 'Kalkulation!C43', 'Kalkulation!E43', 'Kalkulation!I43', 'Kalkulation!J43', 'Kalkulation!L43', 'Kalkulation!B44', 'Kalkulation!C44', 'Kalkulation!E44', 'Kalkulation!I44', 'Kalkulation!J44', 'Kalkulation!L44', 'Kalkulation!B45', 'Kalkulation!C45', 'Kalkulation!E45', 'Kalkulation!I45', 'Kalkulation!J45', 'Kalkulation!L45', 'Kalkulation!B46', 'Kalkulation!C46', 'Kalkulation!E46', 'Kalkulation!I46', 'Kalkulation!J46', 'Kalkulation!L46', 'Kalkulation!B47', 'Kalkulation!C47', 'Kalkulation!E47', 'Kalkulation!I47', 'Kalkulation!J47', 'Kalkulation!L47', 'Kalkulation!B48', 'Kalkulation!C48', 'Kalkulation!E48', 'Kalkulation!I48', 'Kalkulation!J48', 'Kalkulation!L48', 'Kalkulation!B49', 'Kalkulation!C49', 'Kalkulation!E49', 'Kalkulation!I49', 'Kalkulation!J49', 'Kalkulation!L49', 'Kalkulation!B50', 'Kalkulation!C50', 'Kalkulation!E50', 'Kalkulation!I50', 'Kalkulation!J50', 'Kalkulation!L50', 'Kalkulation!B51', 'Kalkulation!C51', 'Kalkulation!E51', 'Kalkulation!I51', 'Kalkulation!J51', 'Kalkulation!L51', 'Kalkulation!B52', 'Kalkulation!C52', 'Kalkulation!E52', 'Kalkulation!I52', 'Kalkulation!J52', 'Kalkulation!L52', 'Kalkulation!B53', 'Kalkulation!C53', 'Kalkulation!E53', 'Kalkulation!I53', 'Kalkulation!J53', 'Kalkulation!L53', 'Kalkulation!B54', 'Kalkulation!C54', 'Kalkulation!E54', 'Kalkulation!I54', 'Kalkulation!J54', 'Kalkulation!L54', 'Kalkulation!B55', 'Kalkulation!C55', 'Kalkulation!E55', 'Kalkulation!I55', 'Kalkulation!J55', 'Kalkulation!L55', 'Kalkulation!B56', 'Kalkulation!C56', 'Kalkulation!E56', 'Kalkulation!I56', 'Kalkulation!J56', 'Kalkulation!L56', 'Kalkulation!B57', 'Kalkulation!C57', 'Kalkulation!E57', 'Kalkulation!I57', 'Kalkulation!J57', 'Kalkulation!L57', 'Kalkulation!B58', 'Kalkulation!C58', 'Kalkulation!E58', 'Kalkulation!I58', 'Kalkulation!J58', 'Kalkulation!L58', 'Kalkulation!B59', 'Kalkulation!C59', 'Kalkulation!E59', 'Kalkulation!I59', 'Kalkulation!J59', 'Kalkulation!L59', 'Kalkulation!B60', 'Kalkulation!C60', 'Kalkulation!E60', 'Kalkulation!I60', 'Kalkulation!J60', 'Kalkulation!L60', 'Kalkulation!B61', 'Kalkulation!C61', 'Kalkulation!E61', 'Kalkulation!I61', 'Kalkulation!J61', 'Kalkulation!L61', 'Kalkulation!B62', 'Kalkulation!C62', 'Kalkulation!E62', 'Kalkulation!I62', 'Kalkulation!J62', 'Kalkulation!L62', 'Kalkulation!B63', 'Kalkulation!C63', 'Kalkulation!E63', 'Kalkulation!I63', 'Kalkulation!J63', 'Kalkulation!L63', 'Kalkulation!B64', 'Kalkulation!C64', 'Kalkulation!E64', 'Kalkulation!I64', 'Kalkulation!J64', 'Kalkulation!L64', 'Kalkulation!B65', 'Kalkulation!C65', 'Kalkulation!E65', 'Kalkulation!I65', 'Kalkulation!J65', 'Kalkulation!L65', 'Kalkulation!B66', 'Kalkulation!C66', 'Kalkulation!E66', 'Kalkulation!I66', 'Kalkulation!J66', 'Kalkulation!L66'),
+    'Kalkulation!B60': ('Kalkulation!E60', 'Kalkulation!G60'),
+    'Kalkulation!B61': ('Kalkulation!E61', 'Kalkulation!G61'),
+    'Kalkulation!B62': ('Kalkulation!E62', 'Kalkulation!G62'),
+    'Kalkulation!B63': ('Kalkulation!E63', 'Kalkulation!G63'),
+    'Kalkulation!B64': ('Kalkulation!E64', 'Kalkulation!G64'),
+    'Kalkulation!B65': ('Kalkulation!E65', 'Kalkulation!G65'),
+    'Kalkulation!B66': ('Kalkulation!E66', 'Kalkulation!G66'),
+    'Kalkulation!B7': ('Kalkulation!K5', 'Kalkulation!K9', 'Kalkulation!D16', 'Kalkulation!E16', 'Kalkulation!H16', 'Kalkulation!L16', 'Kalkulation!D17', 'Kalkulation!E17', 'Kalkulation!H17', 'Kalkulation!L17', 'Kalkulation!D18', 'Kalkulation!E18', 'Kalkulation!H18', 'Kalkulation!L18', 'Kalkulation!D19', 'Kalkulation!E19', 'Kalkulation!H19', 'Kalkulation!L19', 'Kalkulation!D20', 'Kalkulation!E20', 'Kalkulation!H20', 'Kalkulation!L20', 'Kalkulation!D21', 'Kalkulation!E21', 'Kalkulation!H21', 'Kalkulation!L21', 'Kalkulation!D22', 'Kalkulation!E22', 'Kalkulation!H22', 'Kalkulation!L22', 'Kalkulation!D23', 'Kalkulation!E23', 'Kalkulation!H23', 'Kalkulation!L23', 'Kalkulation!D24', 'Kalkulation!E24', 'Kalkulation!H24', 'Kalkulation!L24', 'Kalkulation!D25', 'Kalkulation!E25', 'Kalkulation!H25', 'Kalkulation!L25', 'Kalkulation!D26', 'Kalkulation!E26', 'Kalkulation!H26', 'Kalkulation!L26', 'Kalkulation!D27', 'Kalkulation!E27', 'Kalkulation!H27', 'Kalkulation!L27', 'Kalkulation!D28', 'Kalkulation!E28', 'Kalkulation!H28', 'Kalkulation!L28', 'Kalkulation!D29', 'Kalkulation!E29', 'Kalkulation!H29', 'Kalkulation!L29', 'Kalkulation!D30', 'Kalkulation!E30', 'Kalkulation!H30', 'Kalkulation!L30', 'Kalkulation!D31', 'Kalkulation!E31', 'Kalkulation!H31', 'Kalkulation!L31', 'Kalkulation!D32', 'Kalkulation!E32', 'Kalkulation!H32', 'Kalkulation!L32', 'Kalkulation!D33', 'Kalkulation!E33', 'Kalkulation!H33', 'Kalkulation!L33', 'Kalkulation!D34', 'Kalkulation!E34', 'Kalkulation!H34', 'Kalkulation!L34', 'Kalkulation!D35', 'Kalkulation!E35', 'Kalkulation!H35', 'Kalkulation!L35', 'Kalkulation!D36', 'Kalkulation!E36', 'Kalkulation!H36', 'Kalkulation!L36', 'Kalkulation!D37', 'Kalkulation!E37', 'Kalkulation!H37', 'Kalkulation!L37', 'Kalkulation!D38', 'Kalkulation!E38', 'Kalkulation!H38', 'Kalkulation!L38', 'Kalkulation!D39', 'Kalkulation!E39', 'Kalkulation!H39', 'Kalkulation!L39', 'Kalkulation!D40', 'Kalkulation!E40', 'Kalkulation!H40', 'Kalkulation!L40', 'Kalkulation!D41', 'Kalkulation!E41', 'Kalkulation!H41', 'Kalkulation!L41', 'Kalkulation!D42', 'Kalkulation!E42', 'Kalkulation!H42', 'Kalkulation!L42', 'Kalkulation!D43', 'Kalkulation!E43', 'Kalkulation!H43', 'Kalkulation!L43', 'Kalkulation!D44', 'Kalkulation!E44', 'Kalkulation!H44', 'Kalkulation!L44', 'Kalkulation!D45', 'Kalkulation!E45', 'Kalkulation!H45', 'Kalkulation!L45', 'Kalkulation!D46', 'Kalkulation!E46', 'Kalkulation!H46', 'Kalkulation!L46', 'Kalkulation!D47', 'Kalkulation!E47', 'Kalkulation!H47', 'Kalkulation!L47', 'Kalkulation!D48', 'Kalkulation!E48', 'Kalkulation!H48', 'Kalkulation!L48', 'Kalkulation!D49', 'Kalkulation!E49', 'Kalkulation!H49', 'Kalkulation!L49', 'Kalkulation!D50', 'Kalkulation!E50', 'Kalkulation!H50', 'Kalkulation!L50', 'Kalkulation!D51', 'Kalkulation!E51', 'Kalkulation!H51', 'Kalkulation!L51', 'Kalkulation!D52', 'Kalkulation!E52', 'Kalkulation!H52', 'Kalkulation!L52', 'Kalkulation!D53', 'Kalkulation!E53', 'Kalkulation!H53', 'Kalkulation!L53', 'Kalkulation!D54', 'Kalkulation!E54', 'Kalkulation!H54', 'Kalkulation!L54', 'Kalkulation!D55', 'Kalkulation!E55', 'Kalkulation!H55', 'Kalkulation!L55', 'Kalkulation!D56', 'Kalkulation!E56', 'Kalkulation!H56', 'Kalkulation!L56', 'Kalkulation!D57', 'Kalkulation!E57', 'Kalkulation!H57', 'Kalkulation!L57', 'Kalkulation!D58', 'Kalkulation!E58', 'Kalkulation!H58', 'Kalkulation!L58', 'Kalkulation!D59', 'Kalkulation!E59', 'Kalkulation!H59', 'Kalkulation!L59', 'Kalkulation!D60', 'Kalkulation!E60', 'Kalkulation!H60', 'Kalkulation!L60', 'Kalkulation!D61', 'Kalkulation!E61', 'Kalkulation!H61', 'Kalkulation!L61', 'Kalkulation!D62', 'Kalkulation!E62', 'Kalkulation!H62', 'Kalkulation!L62', 'Kalkulation!D63', 'Kalkulation!E63', 'Kalkulation!H63', 'Kalkulation!L63', 'Kalkulation!D64', 'Kalkulation!E64', 'Kalkulation!H64', 'Kalkulation!L64', 'Kalkulation!D65', 'Kalkulation!E65', 'Kalkulation!H65', 'Kalkulation!L65', 'Kalkulation!D66', 'Kalkulation!E66', 'Kalkulation!H66', 'Kalkulation!L66'),
+    'Kalkulation!B8': ('Kalkulation!K6', 'Kalkulation!F16', 'Kalkulation!J16', 'Kalkulation!L16', 'Kalkulation!F17', 'Kalkulation!J17', 'Kalkulation!L17', 'Kalkulation!F18', 'Kalkulation!J18', 'Kalkulation!L18', 'Kalkulation!F19', 'Kalkulation!J19', 'Kalkulation!L19', 'Kalkulation!F20', 'Kalkulation!J20', 'Kalkulation!L20', 'Kalkulation!F21', 'Kalkulation!J21', 'Kalkulation!L21', 'Kalkulation!F22', 'Kalkulation!J22', 'Kalkulation!L22', 'Kalkulation!F23', 'Kalkulation!J23', 'Kalkulation!L23', 'Kalkulation!F24', 'Kalkulation!J24', 'Kalkulation!L24', 'Kalkulation!F25', 'Kalkulation!J25', 'Kalkulation!L25', 'Kalkulation!F26', 'Kalkulation!J26', 'Kalkulation!L26', 'Kalkulation!F27', 'Kalkulation!J27', 'Kalkulation!L27', 'Kalkulation!F28', 'Kalkulation!J28', 'Kalkulation!L28', 'Kalkulation!F29', 'Kalkulation!J29', 'Kalkulation!L29', 'Kalkulation!F30', 'Kalkulation!J30', 'Kalkulation!L30', 'Kalkulation!F31', 'Kalkulation!J31', 'Kalkulation!L31', 'Kalkulation!F32', 'Kalkulation!J32', 'Kalkulation!L32', 'Kalkulation!F33', 'Kalkulation!J33', 'Kalkulation!L33', 'Kalkulation!F34', 'Kalkulation!J34', 'Kalkulation!L34', 'Kalkulation!F35', 'Kalkulation!J35', 'Kalkulation!L35', 'Kalkulation!F36', 'Kalkulation!J36', 'Kalkulation!L36', 'Kalkulation!F37', 'Kalkulation!J37', 'Kalkulation!L37', 'Kalkulation!F38', 'Kalkulation!J38', 'Kalkulation!L38', 'Kalkulation!F39', 'Kalkulation!J39', 'Kalkulation!L39', 'Kalkulation!F40', 'Kalkulation!J40', 'Kalkulation!L40', 'Kalkulation!F41', 'Kalkulation!J41', 'Kalkulation!L41', 'Kalkulation!F42', 'Kalkulation!J42', 'Kalkulation!L42', 'Kalkulation!F43', 'Kalkulation!J43', 'Kalkulation!L43', 'Kalkulation!F44', 'Kalkulation!J44', 'Kalkulation!L44', 'Kalkulation!F45', 'Kalkulation!J45', 'Kalkulation!L45', 'Kalkulation!F46', 'Kalkulation!J46', 'Kalkulation!L46', 'Kalkulation!F47', 'Kalkulation!J47', 'Kalkulation!L47', 'Kalkulation!F48', 'Kalkulation!J48', 'Kalkulation!L48', 'Kalkulation!F49', 'Kalkulation!J49', 'Kalkulation!L49', 'Kalkulation!F50', 'Kalkulation!J50', 'Kalkulation!L50', 'Kalkulation!F51', 'Kalkulation!J51', 'Kalkulation!L51', 'Kalkulation!F52', 'Kalkulation!J52', 'Kalkulation!L52', 'Kalkulation!F53', 'Kalkulation!J53', 'Kalkulation!L53', 'Kalkulation!F54', 'Kalkulation!J54', 'Kalkulation!L54', 'Kalkulation!F55', 'Kalkulation!J55', 'Kalkulation!L55', 'Kalkulation!F56', 'Kalkulation!J56', 'Kalkulation!L56', 'Kalkulation!F57', 'Kalkulation!J57', 'Kalkulation!L57', 'Kalkulation!F58', 'Kalkulation!J58', 'Kalkulation!L58', 'Kalkulation!F59', 'Kalkulation!J59', 'Kalkulation!L59', 'Kalkulation!F60', 'Kalkulation!J60', 'Kalkulation!L60', 'Kalkulation!F61', 'Kalkulation!J61', 'Kalkulation!L61', 'Kalkulation!F62', 'Kalkulation!J62', 'Kalkulation!L62', 'Kalkulation!F63', 'Kalkulation!J63', 'Kalkulation!L63', 'Kalkulation!F64', 'Kalkulation!J64', 'Kalkulation!L64', 'Kalkulation!F65', 'Kalkulation!J65', 'Kalkulation!L65', 'Kalkulation!F66', 'Kalkulation!J66', 'Kalkulation!L66'),
+    'Kalkulation!B9': ('Kalkulation!K7', 'Kalkulation!E12'),
+    'Kalkulation!C16': ('Kalkulation!E16', 'Kalkulation!G16'),
+    'Kalkulation!C17': ('Kalkulation!E17', 'Kalkulation!G17'),
+    'Kalkulation!C18': ('Kalkulation!E18', 'Kalkulation!G18'),
+    'Kalkulation!C19': ('Kalkulation!E19', 'Kalkulation!G19'),
+    'Kalkulation!C20': ('Kalkulation!E20', 'Kalkulation!G20'),
+    'Kalkulation!C21': ('Kalkulation!E21', 'Kalkulation!G21'),
+    'Kalkulation!C22': ('Kalkulation!E22', 'Kalkulation!G22'),
+    'Kalkulation!C23': ('Kalkulation!E23', 'Kalkulation!G23'),
+    'Kalkulation!C24': ('Kalkulation!E24', 'Kalkulation!G24'),
+    'Kalkulation!C25': ('Kalkulation!E25', 'Kalkulation!G25'),
+    'Kalkulation!C26': ('Kalkulation!E26', 'Kalkulation!G26'),
+    'Kalkulation!C27': ('Kalkulation!E27', 'Kalkulation!G27'),
+    'Kalkulation!C28': ('Kalkulation!E28', 'Kalkulation!G28'),
+    'Kalkulation!C29': ('Kalkulation!E29', 'Kalkulation!G29'),
+    'Kalkulation!C30': ('Kalkulation!E30', 'Kalkulation!G30'),
+    'Kalkulation!C31': ('Kalkulation!E31', 'Kalkulation!G31'),
+    'Kalkulation!C32': ('Kalkulation!E32', 'Kalkulation!G32'),
+    'Kalkulation!C33': ('Kalkulation!E33', 'Kalkulation!G33'),
+    'Kalkulation!C34': ('Kalkulation!E34', 'Kalkulation!G34'),
+    'Kalkulation!C35': ('Kalkulation!E35', 'Kalkulation!G35'),
+    'Kalkulation!C36': ('Kalkulation!E36', 'Kalkulation!G36'),
+    'Kalkulation!C37': ('Kalkulation!E37', 'Kalkulation!G37'),
+    'Kalkulation!C38': ('Kalkulation!E38', 'Kalkulation!G38'),
+    'Kalkulation!C39': ('Kalkulation!E39', 'Kalkulation!G39'),
+    'Kalkulation!C40': ('Kalkulation!E40', 'Kalkulation!G40'),
+    'Kalkulation!C41': ('Kalkulation!E41', 'Kalkulation!G41'),
+    'Kalkulation!C42': ('Kalkulation!E42', 'Kalkulation!G42'),
+    'Kalkulation!C43': ('Kalkulation!E43', 'Kalkulation!G43'),
+    'Kalkulation!C44': ('Kalkulation!E44', 'Kalkulation!G44'),
+    'Kalkulation!C45': ('Kalkulation!E45', 'Kalkulation!G45'),
+    'Kalkulation!C46': ('Kalkulation!E46', 'Kalkulation!G46'),
+    'Kalkulation!C47': ('Kalkulation!E47', 'Kalkulation!G47'),
+    'Kalkulation!C48': ('Kalkulation!E48', 'Kalkulation!G48'),
+    'Kalkulation!C49': ('Kalkulation!E49', 'Kalkulation!G49'),
+    'Kalkulation!C50': ('Kalkulation!E50', 'Kalkulation!G50'),
+    'Kalkulation!C51': ('Kalkulation!E51', 'Kalkulation!G51'),
+    'Kalkulation!C52': ('Kalkulation!E52', 'Kalkulation!G52'),
+    'Kalkulation!C53': ('Kalkulation!E53', 'Kalkulation!G53'),
+    'Kalkulation!C54': ('Kalkulation!E54', 'Kalkulation!G54'),
+    'Kalkulation!C55': ('Kalkulation!E55', 'Kalkulation!G55'),
+    'Kalkulation!C56': ('Kalkulation!E56', 'Kalkulation!G56'),
+    'Kalkulation!C57': ('Kalkulation!E57', 'Kalkulation!G57'),
+    'Kalkulation!C58': ('Kalkulation!E58', 'Kalkulation!G58'),
+    'Kalkulation!C59': ('Kalkulation!E59', 'Kalkulation!G59'),
+    'Kalkulation!C60': ('Kalkulation!E60', 'Kalkulation!G60'),
+    'Kalkulation!C61': ('Kalkulation!E61', 'Kalkulation!G61'),
+    'Kalkulation!C62': ('Kalkulation!E62', 'Kalkulation!G62'),
+    'Kalkulation!C63': ('Kalkulation!E63', 'Kalkulation!G63'),
+    'Kalkulation!C64': ('Kalkulation!E64', 'Kalkulation!G64'),
+    'Kalkulation!C65': ('Kalkulation!E65', 'Kalkulation!G65'),
+    'Kalkulation!C66': ('Kalkulation!E66', 'Kalkulation!G66'),
+    'Kalkulation!D16': ('Kalkulation!E16',),
+    'Kalkulation!D17': ('Kalkulation!E17',),
+    'Kalkulation!D18': ('Kalkulation!E18',),
+    'Kalkulation!D19': ('Kalkulation!E19',),
+    'Kalkulation!D20': ('Kalkulation!E20',),
+    'Kalkulation!D21': ('Kalkulation!E21',),
+    'Kalkulation!D22': ('Kalkulation!E22',),
+    'Kalkulation!D23': ('Kalkulation!E23',),
+    'Kalkulation!D24': ('Kalkulation!E24',),
+    'Kalkulation!D25': ('Kalkulation!E25',),
+    'Kalkulation!D26': ('Kalkulation!E26',),
+    'Kalkulation!D27': ('Kalkulation!E27',),
+    'Kalkulation!D28': ('Kalkulation!E28',),
+    'Kalkulation!D29': ('Kalkulation!E29',),
+    'Kalkulation!D30': ('Kalkulation!E30',),
+    'Kalkulation!D31': ('Kalkulation!E31',),
+    'Kalkulation!D32': ('Kalkulation!E32',),
+    'Kalkulation!D33': ('Kalkulation!E33',),
+    'Kalkulation!D34': ('Kalkulation!E34',),
+    'Kalkulation!D35': ('Kalkulation!E35',),
+    'Kalkulation!D36': ('Kalkulation!E36',),
+    'Kalkulation!D37': ('Kalkulation!E37',),
+    'Kalkulation!D38': ('Kalkulation!E38',),
+    'Kalkulation!D39': ('Kalkulation!E39',),
+    'Kalkulation!D40': ('Kalkulation!E40',),
+    'Kalkulation!D41': ('Kalkulation!E41',),
+    'Kalkulation!D42': ('Kalkulation!E42',),
+    'Kalkulation!D43': ('Kalkulation!E43',),
+    'Kalkulation!D44': ('Kalkulation!E44',),
+    'Kalkulation!D45': ('Kalkulation!E45',),
+    'Kalkulation!D46': ('Kalkulation!E46',),
+    'Kalkulation!D47': ('Kalkulation!E47',),
+    'Kalkulation!D48': ('Kalkulation!E48',),
+    'Kalkulation!D49': ('Kalkulation!E49',),
+    'Kalkulation!D50': ('Kalkulation!E50',),
+    'Kalkulation!D51': ('Kalkulation!E51',),
+    'Kalkulation!D52': ('Kalkulation!E52',),
+    'Kalkulation!D53': ('Kalkulation!E53',),
+    'Kalkulation!D54': ('Kalkulation!E54',),
+    'Kalkulation!D55': ('Kalkulation!E55',),
+    'Kalkulation!D56': ('Kalkulation!E56',),
+    'Kalkulation!D57': ('Kalkulation!E57',),
+    'Kalkulation!D58': ('Kalkulation!E58',),
+    'Kalkulation!D59': ('Kalkulation!E59',),
+    'Kalkulation!D60': ('Kalkulation!E60',),
+    'Kalkulation!D61': ('Kalkulation!E61',),
+    'Kalkulation!D62': ('Kalkulation!E62',),
+    'Kalkulation!D63': ('Kalkulation!E63',),
+    'Kalkulation!D64': ('Kalkulation!E64',),
+    'Kalkulation!D65': ('Kalkulation!E65',),
+    'Kalkulation!D66': ('Kalkulation!E66',),
+    'Kalkulation!E10': ('Kalkulation!G16', 'Kalkulation!G17', 'Kalkulation!G18', 'Kalkulation!G19', 'Kalkulation!G20', 'Kalkulation!G21', 'Kalkulation!G22', 'Kalkulation!G23', 'Kalkulation!G24', 'Kalkulation!G25', 'Kalkulation!G26', 'Kalkulation!G27', 'Kalkulation!G28', 'Kalkulation!G29', 'Kalkulation!G30', 'Kalkulation!G31', 'Kalkulation!G32', 'Kalkulation!G33', 'Kalkulation!G34', 'Kalkulation!G35', 'Kalkulation!G36', 'Kalkulation!G37', 'Kalkulation!G38', 'Kalkulation!G39', 'Kalkulation!G40', 'Kalkulation!G41', 'Kalkulation!G42', 'Kalkulation!G43', 'Kalkulation!G44', 'Kalkulation!G45', 'Kalkulation!G46', 'Kalkulation!G47', 'Kalkulation!G48', 'Kalkulation!G49', 'Kalkulation!G50', 'Kalkulation!G51', 'Kalkulation!G52', 'Kalkulation!G53', 'Kalkulation!G54', 'Kalkulation!G55', 'Kalkulation!G56', 'Kalkulation!G57', 'Kalkulation!G58', 'Kalkulation!G59', 'Kalkulation!G60', 'Kalkulation!G61', 'Kalkulation!G62', 'Kalkulation!G63', 'Kalkulation!G64', 'Kalkulation!G65', 'Kalkulation!G66'),
+    'Kalkulation!E11': ('Kalkulation!K7',),
+    'Kalkulation!E12': ('Kalkulation!K7',),
+    'Kalkulation!E16': ('Kalkulation!F16',),
+    'Kalkulation!E17': ('Kalkulation!F17',),
+    'Kalkulation!E18': ('Kalkulation!F18',),
+    'Kalkulation!E19': ('Kalkulation!F19',),
+    'Kalkulation!E20': ('Kalkulation!F20',),
+    'Kalkulation!E21': ('Kalkulation!F21',),
+    'Kalkulation!E22': ('Kalkulation!F22',),
+    'Kalkulation!E23': ('Kalkulation!F23',),
+    'Kalkulation!E24': ('Kalkulation!F24',),
+    'Kalkulation!E25': ('Kalkulation!F25',),
+    'Kalkulation!E26': ('Kalkulation!F26',),
+    'Kalkulation!E27': ('Kalkulation!F27',),
+    'Kalkulation!E28': ('Kalkulation!F28',),
+    'Kalkulation!E29': ('Kalkulation!F29',),
+    'Kalkulation!E30': ('Kalkulation!F30',),
+    'Kalkulation!E31': ('Kalkulation!F31',),
+    'Kalkulation!E32': ('Kalkulation!F32',),
+    'Kalkulation!E33': ('Kalkulation!F33',),
+    'Kalkulation!E34': ('Kalkulation!F34',),
+    'Kalkulation!E35': ('Kalkulation!F35',),
+    'Kalkulation!E36': ('Kalkulation!F36',),
+    'Kalkulation!E37': ('Kalkulation!F37',),
+    'Kalkulation!E38': ('Kalkulation!F38',),
+    'Kalkulation!E39': ('Kalkulation!F39',),
+    'Kalkulation!E4': ('Kalkulation!K5', 'Kalkulation!K9', 'Kalkulation!B16', 'Kalkulation!C16', 'Kalkulation!D16', 'Kalkulation!E16', 'Kalkulation!H16', 'Kalkulation!B17', 'Kalkulation!C17', 'Kalkulation!D17', 'Kalkulation!E17', 'Kalkulation!H17', 'Kalkulation!B18', 'Kalkulation!C18', 'Kalkulation!D18', 'Kalkulation!E18', 'Kalkulation!H18', 'Kalkulation!B19', 'Kalkulation!C19', 'Kalkulation!D19', 'Kalkulation!E19', 'Kalkulation!H19', 'Kalkulation!B20', 'Kalkulation!C20', 'Kalkulation!D20', 'Kalkulation!E20', 'Kalkulation!H20', 'Kalkulation!B21', 'Kalkulation!C21', 'Kalkulation!D21', 'Kalkulation!E21', 'Kalkulation!H21', 'Kalkulation!B22', 'Kalkulation!C22', 'Kalkulation!D22', 'Kalkulation!E22', 'Kalkulation!H22', 'Kalkulation!B23', 'Kalkulation!C23', 'Kalkulation!D23', 'Kalkulation!E23', 'Kalkulation!H23', 'Kalkulation!B24', 'Kalkulation!C24', 'Kalkulation!D24', 'Kalkulation!E24', 'Kalkulation!H24', 'Kalkulation!B25', 'Kalkulation!C25', 'Kalkulation!D25', 'Kalkulation!E25', 'Kalkulation!H25', 'Kalkulation!B26', 'Kalkulation!C26', 'Kalkulation!D26', 'Kalkulation!E26', 'Kalkulation!H26', 'Kalkulation!B27', 'Kalkulation!C27', 'Kalkulation!D27', 'Kalkulation!E27', 'Kalkulation!H27', 'Kalkulation!B28', 'Kalkulation!C28', 'Kalkulation!D28', 'Kalkulation!E28', 'Kalkulation!H28', 'Kalkulation!B29', 'Kalkulation!C29', 'Kalkulation!D29', 'Kalkulation!E29', 'Kalkulation!H29', 'Kalkulation!B30', 'Kalkulation!C30', 'Kalkulation!D30', 'Kalkulation!E30', 'Kalkulation!H30', 'Kalkulation!B31', 'Kalkulation!C31', 'Kalkulation!D31', 'Kalkulation!E31', 'Kalkulation!H31', 'Kalkulation!B32', 'Kalkulation!C32', 'Kalkulation!D32', 'Kalkulation!E32', 'Kalkulation!H32', 'Kalkulation!B33', 'Kalkulation!C33', 'Kalkulation!D33', 'Kalkulation!E33', 'Kalkulation!H33', 'Kalkulation!B34', 'Kalkulation!C34', 'Kalkulation!D34', 'Kalkulation!E34', 'Kalkulation!H34', 'Kalkulation!B35', 'Kalkulation!C35', 'Kalkulation!D35', 'Kalkulation!E35', 'Kalkulation!H35', 'Kalkulation!B36', 'Kalkulation!C36', 'Kalkulation!D36', 'Kalkulation!E36', 'Kalkulation!H36', 'Kalkulation!B37', 'Kalkulation!C37', 'Kalkulation!D37', 'Kalkulation!E37', 'Kalkulation!H37', 'Kalkulation!B38', 'Kalkulation!C38', 'Kalkulation!D38', 'Kalkulation!E38', 'Kalkulation!H38', 'Kalkulation!B39', 'Kalkulation!C39', 'Kalkulation!D39', 'Kalkulation!E39', 'Kalkulation!H39', 'Kalkulation!B40', 'Kalkulation!C40', 'Kalkulation!D40', 'Kalkulation!E40', 'Kalkulation!H40', 'Kalkulation!B41', 'Kalkulation!C41', 'Kalkulation!D41', 'Kalkulation!E41', 'Kalkulation!H41', 'Kalkulation!B42', 'Kalkulation!C42', 'Kalkulation!D42', 'Kalkulation!E42', 'Kalkulation!H42', 'Kalkulation!B43', 'Kalkulation!C43', 'Kalkulation!D43', 'Kalkulation!E43', 'Kalkulation!H43', 'Kalkulation!B44', 'Kalkulation!C44', 'Kalkulation!D44', 'Kalkulation!E44', 'Kalkulation!H44', 'Kalkulation!B45', 'Kalkulation!C45', 'Kalkulation!D45', 'Kalkulation!E45', 'Kalkulation!H45', 'Kalkulation!B46', 'Kalkulation!C46', 'Kalkulation!D46', 'Kalkulation!E46', 'Kalkulation!H46', 'Kalkulation!B47', 'Kalkulation!C47', 'Kalkulation!D47', 'Kalkulation!E47', 'Kalkulation!H47', 'Kalkulation!B48', 'Kalkulation!C48', 'Kalkulation!D48', 'Kalkulation!E48', 'Kalkulation!H48', 'Kalkulation!B49', 'Kalkulation!C49', 'Kalkulation!D49', 'Kalkulation!E49', 'Kalkulation!H49', 'Kalkulation!B50', 'Kalkulation!C50', 'Kalkulation!D50', 'Kalkulation!E50', 'Kalkulation!H50', 'Kalkulation!B51', 'Kalkulation!C51', 'Kalkulation!D51', 'Kalkulation!E51', 'Kalkulation!H51', 'Kalkulation!B52', 'Kalkulation!C52', 'Kalkulation!D52', 'Kalkulation!E52', 'Kalkulation!H52', 'Kalkulation!B53', 'Kalkulation!C53', 'Kalkulation!D53', 'Kalkulation!E53', 'Kalkulation!H53', 'Kalkulation!B54', 'Kalkulation!C54', 'Kalkulation!D54', 'Kalkulation!E54', 'Kalkulation!H54', 'Kalkulation!B55', 'Kalkulation!C55', 'Kalkulation!D55', 'Kalkulation!E55', 'Kalkulation!H55', 'Kalkulation!B56', 'Kalkulation!C56', 'Kalkulation!D56', 'Kalkulation!E56', 'Kalkulation!H56', 'Kalkulation!B57', 'Kalkulation!C57', 'Kalkulation!D57', 'Kalkulation!E57', 'Kalkulation!H57', 'Kalkulation!B58', 'Kalkulation!C58', 'Kalkulation!D58', 'Kalkulation!E58', 'Kalkulation!H58', 'Kalkulation!B59', 'Kalkulation!C59', 'Kalkulation!D59', 'Kalkulation!E59', 'Kalkulation!H59', 'Kalkulation!B60', 'Kalkulation!C60', 'Kalkulation!D60', 'Kalkulation!E60', 'Kalkulation!H60', 'Kalkulation!B61', 'Kalkulation!C61', 'Kalkulation!D61', 'Kalkulation!E61', 'Kalkulation!H61', 'Kalkulation!B62', 'Kalkulation!C62', 'Kalkulation!D62', 'Kalkulation!E62', 'Kalkulation!H62', 'Kalkulation!B63', 'Kalkulation!C63', 'Kalkulation!D63', 'Kalkulation!E63', 'Kalkulation!H63', 'Kalkulation!B64', 'Kalkulation!C64', 'Kalkulation!D64', 'Kalkulation!E64', 'Kalkulation!H64', 'Kalkulation!B65', 'Kalkulation!C65', 'Kalkulation!D65', 'Kalkulation!E65', 'Kalkulation!H65', 'Kalkulation!B66', 'Kalkulation!C66', 'Kalkulation!D66', 'Kalkulation!E66', 'Kalkulation!H66'),
+    'Kalkulation!E40': ('Kalkulation!F40',),
+    'Kalkulation!E41': ('Kalkulation!F41',),
+    'Kalkulation!E42': ('Kalkulation!F42',),
+    'Kalkulation!E43': ('Kalkulation!F43',),
+    'Kalkulation!E44': ('Kalkulation!F44',),
+    'Kalkulation!E45': ('Kalkulation!F45',),
+    'Kalkulation!E46': ('Kalkulation!F46',),
+    'Kalkulation!E47': ('Kalkulation!F47',),
+    'Kalkulation!E48': ('Kalkulation!F48',),
+    'Kalkulation!E49': ('Kalkulation!F49',),
+    'Kalkulation!E5': ('Kalkulation!K5', 'Kalkulation!K9', 'Kalkulation!B16', 'Kalkulation!C16', 'Kalkulation!D16', 'Kalkulation!E16', 'Kalkulation!H16', 'Kalkulation!B17', 'Kalkulation!C17', 'Kalkulation!D17', 'Kalkulation!E17', 'Kalkulation!H17', 'Kalkulation!B18', 'Kalkulation!C18', 'Kalkulation!D18', 'Kalkulation!E18', 'Kalkulation!H18', 'Kalkulation!B19', 'Kalkulation!C19', 'Kalkulation!D19', 'Kalkulation!E19', 'Kalkulation!H19', 'Kalkulation!B20', 'Kalkulation!C20', 'Kalkulation!D20', 'Kalkulation!E20', 'Kalkulation!H20', 'Kalkulation!B21', 'Kalkulation!C21', 'Kalkulation!D21', 'Kalkulation!E21', 'Kalkulation!H21', 'Kalkulation!B22', 'Kalkulation!C22', 'Kalkulation!D22', 'Kalkulation!E22', 'Kalkulation!H22', 'Kalkulation!B23', 'Kalkulation!C23', 'Kalkulation!D23', 'Kalkulation!E23', 'Kalkulation!H23', 'Kalkulation!B24', 'Kalkulation!C24', 'Kalkulation!D24', 'Kalkulation!E24', 'Kalkulation!H24', 'Kalkulation!B25', 'Kalkulation!C25', 'Kalkulation!D25', 'Kalkulation!E25', 'Kalkulation!H25', 'Kalkulation!B26', 'Kalkulation!C26', 'Kalkulation!D26', 'Kalkulation!E26', 'Kalkulation!H26', 'Kalkulation!B27', 'Kalkulation!C27', 'Kalkulation!D27', 'Kalkulation!E27', 'Kalkulation!H27', 'Kalkulation!B28', 'Kalkulation!C28', 'Kalkulation!D28', 'Kalkulation!E28', 'Kalkulation!H28', 'Kalkulation!B29', 'Kalkulation!C29', 'Kalkulation!D29', 'Kalkulation!E29', 'Kalkulation!H29', 'Kalkulation!B30', 'Kalkulation!C30', 'Kalkulation!D30', 'Kalkulation!E30', 'Kalkulation!H30', 'Kalkulation!B31', 'Kalkulation!C31', 'Kalkulation!D31', 'Kalkulation!E31', 'Kalkulation!H31', 'Kalkulation!B32', 'Kalkulation!C32', 'Kalkulation!D32', 'Kalkulation!E32', 'Kalkulation!H32', 'Kalkulation!B33', 'Kalkulation!C33', 'Kalkulation!D33', 'Kalkulation!E33', 'Kalkulation!H33', 'Kalkulation!B34', 'Kalkulation!C34', 'Kalkulation!D34', 'Kalkulation!E34', 'Kalkulation!H34', 'Kalkulation!B35', 'Kalkulation!C35', 'Kalkulation!D35', 'Kalkulation!E35', 'Kalkulation!H35', 'Kalkulation!B36', 'Kalkulation!C36', 'Kalkulation!D36', 'Kalkulation!E36', 'Kalkulation!H36', 'Kalkulation!B37', 'Kalkulation!C37', 'Kalkulation!D37', 'Kalkulation!E37', 'Kalkulation!H37', 'Kalkulation!B38', 'Kalkulation!C38', 'Kalkulation!D38', 'Kalkulation!E38', 'Kalkulation!H38', 'Kalkulation!B39', 'Kalkulation!C39', 'Kalkulation!D39', 'Kalkulation!E39', 'Kalkulation!H39', 'Kalkulation!B40', 'Kalkulation!C40', 'Kalkulation!D40', 'Kalkulation!E40', 'Kalkulation!H40', 'Kalkulation!B41', 'Kalkulation!C41', 'Kalkulation!D41', 'Kalkulation!E41', 'Kalkulation!H41', 'Kalkulation!B42', 'Kalkulation!C42', 'Kalkulation!D42', 'Kalkulation!E42', 'Kalkulation!H42', 'Kalkulation!B43', 'Kalkulation!C43', 'Kalkulation!D43', 'Kalkulation!E43', 'Kalkulation!H43', 'Kalkulation!B44', 'Kalkulation!C44', 'Kalkulation!D44', 'Kalkulation!E44', 'Kalkulation!H44', 'Kalkulation!B45', 'Kalkulation!C45', 'Kalkulation!D45', 'Kalkulation!E45', 'Kalkulation!H45', 'Kalkulation!B46', 'Kalkulation!C46', 'Kalkulation!D46', 'Kalkulation!E46', 'Kalkulation!H46', 'Kalkulation!B47', 'Kalkulation!C47', 'Kalkulation!D47', 'Kalkulation!E47', 'Kalkulation!H47', 'Kalkulation!B48', 'Kalkulation!C48', 'Kalkulation!D48', 'Kalkulation!E48', 'Kalkulation!H48', 'Kalkulation!B49', 'Kalkulation!C49', 'Kalkulation!D49', 'Kalkulation!E49', 'Kalkulation!H49', 'Kalkulation!B50', 'Kalkulation!C50', 'Kalkulation!D50', 'Kalkulation!E50', 'Kalkulation!H50', 'Kalkulation!B51', 'Kalkulation!C51', 'Kalkulation!D51', 'Kalkulation!E51', 'Kalkulation!H51', 'Kalkulation!B52', 'Kalkulation!C52', 'Kalkulation!D52', 'Kalkulation!E52', 'Kalkulation!H52', 'Kalkulation!B53', 'Kalkulation!C53', 'Kalkulation!D53', 'Kalkulation!E53', 'Kalkulation!H53', 'Kalkulation!B54', 'Kalkulation!C54', 'Kalkulation!D54', 'Kalkulation!E54', 'Kalkulation!H54', 'Kalkulation!B55', 'Kalkulation!C55', 'Kalkulation!D55', 'Kalkulation!E55', 'Kalkulation!H55', 'Kalkulation!B56', 'Kalkulation!C56', 'Kalkulation!D56', 'Kalkulation!E56', 'Kalkulation!H56', 'Kalkulation!B57', 'Kalkulation!C57', 'Kalkulation!D57', 'Kalkulation!E57', 'Kalkulation!H57', 'Kalkulation!B58', 'Kalkulation!C58', 'Kalkulation!D58', 'Kalkulation!E58', 'Kalkulation!H58', 'Kalkulation!B59', 'Kalkulation!C59', 'Kalkulation!D59', 'Kalkulation!E59', 'Kalkulation!H59', 'Kalkulation!B60', 'Kalkulation!C60', 'Kalkulation!D60', 'Kalkulation!E60', 'Kalkulation!H60', 'Kalkulation!B61', 'Kalkulation!C61', 'Kalkulation!D61', 'Kalkulation!E61', 'Kalkulation!H61', 'Kalkulation!B62', 'Kalkulation!C62', 'Kalkulation!D62', 'Kalkulation!E62', 'Kalkulation!H62', 'Kalkulation!B63', 'Kalkulation!C63', 'Kalkulation!D63', 'Kalkulation!E63', 'Kalkulation!H63', 'Kalkulation!B64', 'Kalkulation!C64', 'Kalkulation!D64', 'Kalkulation!E64', 'Kalkulation!H64', 'Kalkulation!B65', 'Kalkulation!C65', 'Kalkulation!D65', 'Kalkulation!E65', 'Kalkulation!H65', 'Kalkulation!B66', 'Kalkulation!C66', 'Kalkulation!D66', 'Kalkulation!E66', 'Kalkulation!H66'),
+    'Kalkulation!E50': ('Kalkulation!F50',),
+    'Kalkulation!E51': ('Kalkulation!F51',),
+    'Kalkulation!E52': ('Kalkulation!F52',),
+    'Kalkulation!E53': ('Kalkulation!F53',),
+    'Kalkulation!E54': ('Kalkulation!F54',),
+    'Kalkulation!E55': ('Kalkulation!F55',),
+    'Kalkulation!E56': ('Kalkulation!F56',),
+    'Kalkulation!E57': ('Kalkulation!F57',),
+    'Kalkulation!E58': ('Kalkulation!F58',),
+    'Kalkulation!E59': ('Kalkulation!F59',),
+    'Kalkulation!E6': ('Kalkulation!K5', 'Kalkulation!K9', 'Kalkulation!H16', 'Kalkulation!H17', 'Kalkulation!H18', 'Kalkulation!H19', 'Kalkulation!H20', 'Kalkulation!H21', 'Kalkulation!H22', 'Kalkulation!H23', 'Kalkulation!H24', 'Kalkulation!H25', 'Kalkulation!H26', 'Kalkulation!H27', 'Kalkulation!H28', 'Kalkulation!H29', 'Kalkulation!H30', 'Kalkulation!H31', 'Kalkulation!H32', 'Kalkulation!H33', 'Kalkulation!H34', 'Kalkulation!H35', 'Kalkulation!H36', 'Kalkulation!H37', 'Kalkulation!H38', 'Kalkulation!H39', 'Kalkulation!H40', 'Kalkulation!H41', 'Kalkulation!H42', 'Kalkulation!H43', 'Kalkulation!H44', 'Kalkulation!H45', 'Kalkulation!H46', 'Kalkulation!H47', 'Kalkulation!H48', 'Kalkulation!H49', 'Kalkulation!H50', 'Kalkulation!H51', 'Kalkulation!H52', 'Kalkulation!H53', 'Kalkulation!H54', 'Kalkulation!H55', 'Kalkulation!H56', 'Kalkulation!H57', 'Kalkulation!H58', 'Kalkulation!H59', 'Kalkulation!H60', 'Kalkulation!H61', 'Kalkulation!H62', 'Kalkulation!H63', 'Kalkulation!H64', 'Kalkulation!H65', 'Kalkulation!H66'),
+    'Kalkulation!E60': ('Kalkulation!F60',),
+    'Kalkulation!E61': ('Kalkulation!F61',),
+    'Kalkulation!E62': ('Kalkulation!F62',),
+    'Kalkulation!E63': ('Kalkulation!F63',),
+    'Kalkulation!E64': ('Kalkulation!F64',),
+    'Kalkulation!E65': ('Kalkulation!F65',),
+    'Kalkulation!E66': ('Kalkulation!F66',),
+    'Kalkulation!E7': ('Kalkulation!K5',),
+    'Kalkulation!E8': ('Kalkulation!K5',),
+    'Kalkulation!E9': ('Kalkulation!K5', 'Kalkulation!E16', 'Kalkulation!E17', 'Kalkulation!E18', 'Kalkulation!E19', 'Kalkulation!E20', 'Kalkulation!E21', 'Kalkulation!E22', 'Kalkulation!E23', 'Kalkulation!E24', 'Kalkulation!E25', 'Kalkulation!E26', 'Kalkulation!E27', 'Kalkulation!E28', 'Kalkulation!E29', 'Kalkulation!E30', 'Kalkulation!E31', 'Kalkulation!E32', 'Kalkulation!E33', 'Kalkulation!E34', 'Kalkulation!E35', 'Kalkulation!E36', 'Kalkulation!E37', 'Kalkulation!E38', 'Kalkulation!E39', 'Kalkulation!E40', 'Kalkulation!E41', 'Kalkulation!E42', 'Kalkulation!E43', 'Kalkulation!E44', 'Kalkulation!E45', 'Kalkulation!E46', 'Kalkulation!E47', 'Kalkulation!E48', 'Kalkulation!E49', 'Kalkulation!E50', 'Kalkulation!E51', 'Kalkulation!E52', 'Kalkulation!E53', 'Kalkulation!E54', 'Kalkulation!E55', 'Kalkulation!E56', 'Kalkulation!E57', 'Kalkulation!E58', 'Kalkulation!E59', 'Kalkulation!E60', 'Kalkulation!E61', 'Kalkulation!E62', 'Kalkulation!E63', 'Kalkulation!E64', 'Kalkulation!E65', 'Kalkulation!E66'),
+    'Kalkulation!F16': ('Kalkulation!H16', 'Kalkulation!J16'),
+    'Kalkulation!F17': ('Kalkulation!H17', 'Kalkulation!J17'),
+    'Kalkulation!F18': ('Kalkulation!H18', 'Kalkulation!J18'),
+    'Kalkulation!F19': ('Kalkulation!H19', 'Kalkulation!J19'),
+    'Kalkulation!F20': ('Kalkulation!H20', 'Kalkulation!J20'),
+    'Kalkulation!F21': ('Kalkulation!H21', 'Kalkulation!J21'),
+    'Kalkulation!F22': ('Kalkulation!H22', 'Kalkulation!J22'),
+    'Kalkulation!F23': ('Kalkulation!H23', 'Kalkulation!J23'),
+    'Kalkulation!F24': ('Kalkulation!H24', 'Kalkulation!J24'),
+    'Kalkulation!F25': ('Kalkulation!H25', 'Kalkulation!J25'),
+    'Kalkulation!F26': ('Kalkulation!H26', 'Kalkulation!J26'),
+    'Kalkulation!F27': ('Kalkulation!H27', 'Kalkulation!J27'),
+    'Kalkulation!F28': ('Kalkulation!H28', 'Kalkulation!J28'),
+    'Kalkulation!F29': ('Kalkulation!H29', 'Kalkulation!J29'),
+    'Kalkulation!F30': ('Kalkulation!H30', 'Kalkulation!J30'),
+    'Kalkulation!F31': ('Kalkulation!H31', 'Kalkulation!J31'),
+    'Kalkulation!F32': ('Kalkulation!H32', 'Kalkulation!J32'),
+    'Kalkulation!F33': ('Kalkulation!H33', 'Kalkulation!J33'),
+    'Kalkulation!F34': ('Kalkulation!H34', 'Kalkulation!J34'),
+    'Kalkulation!F35': ('Kalkulation!H35', 'Kalkulation!J35'),
+    'Kalkulation!F36': ('Kalkulation!H36', 'Kalkulation!J36'),
+    'Kalkulation!F37': ('Kalkulation!H37', 'Kalkulation!J37'),
+    'Kalkulation!F38': ('Kalkulation!H38', 'Kalkulation!J38'),
+    'Kalkulation!F39': ('Kalkulation!H39', 'Kalkulation!J39'),
+    'Kalkulation!F40': ('Kalkulation!H40', 'Kalkulation!J40'),
+    'Kalkulation!F41': ('Kalkulation!H41', 'Kalkulation!J41'),
+    'Kalkulation!F42': ('Kalkulation!H42', 'Kalkulation!J42'),
+    'Kalkulation!F43': ('Kalkulation!H43', 'Kalkulation!J43'),
+    'Kalkulation!F44': ('Kalkulation!H44', 'Kalkulation!J44'),
+    'Kalkulation!F45': ('Kalkulation!H45', 'Kalkulation!J45'),
+    'Kalkulation!F46': ('Kalkulation!H46', 'Kalkulation!J46'),
+    'Kalkulation!F47': ('Kalkulation!H47', 'Kalkulation!J47'),
+    'Kalkulation!F48': ('Kalkulation!H48', 'Kalkulation!J48'),
+    'Kalkulation!F49': ('Kalkulation!H49', 'Kalkulation!J49'),
+    'Kalkulation!F50': ('Kalkulation!H50', 'Kalkulation!J50'),
+    'Kalkulation!F51': ('Kalkulation!H51', 'Kalkulation!J51'),
+    'Kalkulation!F52': ('Kalkulation!H52', 'Kalkulation!J52'),
+    'Kalkulation!F53': ('Kalkulation!H53', 'Kalkulation!J53'),
+    'Kalkulation!F54': ('Kalkulation!H54', 'Kalkulation!J54'),
+    'Kalkulation!F55': ('Kalkulation!H55', 'Kalkulation!J55'),
+    'Kalkulation!F56': ('Kalkulation!H56', 'Kalkulation!J56'),
+    'Kalkulation!F57': ('Kalkulation!H57', 'Kalkulation!J57'),
+    'Kalkulation!F58': ('Kalkulation!H58', 'Kalkulation!J58'),
+    'Kalkulation!F59': ('Kalkulation!H59', 'Kalkulation!J59'),
+    'Kalkulation!F60': ('Kalkulation!H60', 'Kalkulation!J60'),
+    'Kalkulation!F61': ('Kalkulation!H61', 'Kalkulation!J61'),
+    'Kalkulation!F62': ('Kalkulation!H62', 'Kalkulation!J62'),
+    'Kalkulation!F63': ('Kalkulation!H63', 'Kalkulation!J63'),
+    'Kalkulation!F64': ('Kalkulation!H64', 'Kalkulation!J64'),
+    'Kalkulation!F65': ('Kalkulation!H65', 'Kalkulation!J65'),
+    'Kalkulation!F66': ('Kalkulation!H66', 'Kalkulation!J66'),
+    'Kalkulation!G16': ('Kalkulation!L16',),
+    'Kalkulation!G17': ('Kalkulation!L17',),
+    'Kalkulation!G18': ('Kalkulation!L18',),
+    'Kalkulation!G19': ('Kalkulation!L19',),
+    'Kalkulation!G20': ('Kalkulation!L20',),
+    'Kalkulation!G21': ('Kalkulation!L21',),
+    'Kalkulation!G22': ('Kalkulation!L22',),
+    'Kalkulation!G23': ('Kalkulation!L23',),
+    'Kalkulation!G24': ('Kalkulation!L24',),
+    'Kalkulation!G25': ('Kalkulation!L25',),
+    'Kalkulation!G26': ('Kalkulation!L26',),
+    'Kalkulation!G27': ('Kalkulation!L27',),
+    'Kalkulation!G28': ('Kalkulation!L28',),
+    'Kalkulation!G29': ('Kalkulation!L29',),
+    'Kalkulation!G30': ('Kalkulation!L30',),
+    'Kalkulation!G31': ('Kalkulation!L31',),
+    'Kalkulation!G32': ('Kalkulation!L32',),
+    'Kalkulation!G33': ('Kalkulation!L33',),
+    'Kalkulation!G34': ('Kalkulation!L34',),
+    'Kalkulation!G35': ('Kalkulation!L35',),
+    'Kalkulation!G36': ('Kalkulation!L36',),
+    'Kalkulation!G37': ('Kalkulation!L37',),
+    'Kalkulation!G38': ('Kalkulation!L38',),
+    'Kalkulation!G39': ('Kalkulation!L39',),
+    'Kalkulation!G40': ('Kalkulation!L40',),
+    'Kalkulation!G41': ('Kalkulation!L41',),
+    'Kalkulation!G42': ('Kalkulation!L42',),
+    'Kalkulation!G43': ('Kalkulation!L43',),
+    'Kalkulation!G44': ('Kalkulation!L44',),
+    'Kalkulation!G45': ('Kalkulation!L45',),
+    'Kalkulation!G46': ('Kalkulation!L46',),
+    'Kalkulation!G47': ('Kalkulation!L47',),
+    'Kalkulation!G48': ('Kalkulation!L48',),
+    'Kalkulation!G49': ('Kalkulation!L49',),
+    'Kalkulation!G50': ('Kalkulation!L50',),
+    'Kalkulation!G51': ('Kalkulation!L51',),
+    'Kalkulation!G52': ('Kalkulation!L52',),
+    'Kalkulation!G53': ('Kalkulation!L53',),
+    'Kalkulation!G54': ('Kalkulation!L54',),
+    'Kalkulation!G55': ('Kalkulation!L55',),
+    'Kalkulation!G56': ('Kalkulation!L56',),
+    'Kalkulation!G57': ('Kalkulation!L57',),
+    'Kalkulation!G58': ('Kalkulation!L58',),
+    'Kalkulation!G59': ('Kalkulation!L59',),
+    'Kalkulation!G60': ('Kalkulation!L60',),
+    'Kalkulation!G61': ('Kalkulation!L61',),
+    'Kalkulation!G62': ('Kalkulation!L62',),
+    'Kalkulation!G63': ('Kalkulation!L63',),
+    'Kalkulation!G64': ('Kalkulation!L64',),
+    'Kalkulation!G65': ('Kalkulation!L65',),
+    'Kalkulation!G66': ('Kalkulation!L66',),
+    'Kalkulation!H16': ('Kalkulation!K16', 'Kalkulation!L16'),
+    'Kalkulation!H17': ('Kalkulation!K17', 'Kalkulation!L17'),
+    'Kalkulation!H18': ('Kalkulation!K18', 'Kalkulation!L18'),
+    'Kalkulation!H19': ('Kalkulation!K19', 'Kalkulation!L19'),
+    'Kalkulation!H20': ('Kalkulation!K20', 'Kalkulation!L20'),
+    'Kalkulation!H21': ('Kalkulation!K21', 'Kalkulation!L21'),
+    'Kalkulation!H22': ('Kalkulation!K22', 'Kalkulation!L22'),
+    'Kalkulation!H23': ('Kalkulation!K23', 'Kalkulation!L23'),
+    'Kalkulation!H24': ('Kalkulation!K24', 'Kalkulation!L24'),
+    'Kalkulation!H25': ('Kalkulation!K25', 'Kalkulation!L25'),
+    'Kalkulation!H26': ('Kalkulation!K26', 'Kalkulation!L26'),
+    'Kalkulation!H27': ('Kalkulation!K27', 'Kalkulation!L27'),
+    'Kalkulation!H28': ('Kalkulation!K28', 'Kalkulation!L28'),
+    'Kalkulation!H29': ('Kalkulation!K29', 'Kalkulation!L29'),
+    'Kalkulation!H30': ('Kalkulation!K30', 'Kalkulation!L30'),
+    'Kalkulation!H31': ('Kalkulation!K31', 'Kalkulation!L31'),
+    'Kalkulation!H32': ('Kalkulation!K32', 'Kalkulation!L32'),
+    'Kalkulation!H33': ('Kalkulation!K33', 'Kalkulation!L33'),
+    'Kalkulation!H34': ('Kalkulation!K34', 'Kalkulation!L34'),
+    'Kalkulation!H35': ('Kalkulation!K35', 'Kalkulation!L35'),
+    'Kalkulation!H36': ('Kalkulation!K36', 'Kalkulation!L36'),
+    'Kalkulation!H37': ('Kalkulation!K37', 'Kalkulation!L37'),
+    'Kalkulation!H38': ('Kalkulation!K38', 'Kalkulation!L38'),
+    'Kalkulation!H39': ('Kalkulation!K39', 'Kalkulation!L39'),
+    'Kalkulation!H4': ('Kalkulation!I16', 'Kalkulation!I17', 'Kalkulation!I18', 'Kalkulation!I19', 'Kalkulation!I20', 'Kalkulation!I21', 'Kalkulation!I22', 'Kalkulation!I23', 'Kalkulation!I24', 'Kalkulation!I25', 'Kalkulation!I26', 'Kalkulation!I27', 'Kalkulation!I28', 'Kalkulation!I29', 'Kalkulation!I30', 'Kalkulation!I31', 'Kalkulation!I32', 'Kalkulation!I33', 'Kalkulation!I34', 'Kalkulation!I35', 'Kalkulation!I36', 'Kalkulation!I37', 'Kalkulation!I38', 'Kalkulation!I39', 'Kalkulation!I40', 'Kalkulation!I41', 'Kalkulation!I42', 'Kalkulation!I43', 'Kalkulation!I44', 'Kalkulation!I45', 'Kalkulation!I46', 'Kalkulation!I47', 'Kalkulation!I48', 'Kalkulation!I49', 'Kalkulation!I50', 'Kalkulation!I51', 'Kalkulation!I52', 'Kalkulation!I53', 'Kalkulation!I54', 'Kalkulation!I55', 'Kalkulation!I56', 'Kalkulation!I57', 'Kalkulation!I58', 'Kalkulation!I59', 'Kalkulation!I60', 'Kalkulation!I61', 'Kalkulation!I62', 'Kalkulation!I63', 'Kalkulation!I64', 'Kalkulation!I65', 'Kalkulation!I66'),
+    'Kalkulation!H40': ('Kalkulation!K40', 'Kalkulation!L40'),
+    'Kalkulation!H41': ('Kalkulation!K41', 'Kalkulation!L41'),
+    'Kalkulation!H42': ('Kalkulation!K42', 'Kalkulation!L42'),
+    'Kalkulation!H43': ('Kalkulation!K43', 'Kalkulation!L43'),
+    'Kalkulation!H44': ('Kalkulation!K44', 'Kalkulation!L44'),
+    'Kalkulation!H45': ('Kalkulation!K45', 'Kalkulation!L45'),
+    'Kalkulation!H46': ('Kalkulation!K46', 'Kalkulation!L46'),
+    'Kalkulation!H47': ('Kalkulation!K47', 'Kalkulation!L47'),
+    'Kalkulation!H48': ('Kalkulation!K48', 'Kalkulation!L48'),
+    'Kalkulation!H49': ('Kalkulation!K49', 'Kalkulation!L49'),
+    'Kalkulation!H5': ('Kalkulation!I16', 'Kalkulation!I17', 'Kalkulation!I18', 'Kalkulation!I19', 'Kalkulation!I20', 'Kalkulation!I21', 'Kalkulation!I22', 'Kalkulation!I23', 'Kalkulation!I24', 'Kalkulation!I25', 'Kalkulation!I26', 'Kalkulation!I27', 'Kalkulation!I28', 'Kalkulation!I29', 'Kalkulation!I30', 'Kalkulation!I31', 'Kalkulation!I32', 'Kalkulation!I33', 'Kalkulation!I34', 'Kalkulation!I35', 'Kalkulation!I36', 'Kalkulation!I37', 'Kalkulation!I38', 'Kalkulation!I39', 'Kalkulation!I40', 'Kalkulation!I41', 'Kalkulation!I42', 'Kalkulation!I43', 'Kalkulation!I44', 'Kalkulation!I45', 'Kalkulation!I46', 'Kalkulation!I47', 'Kalkulation!I48', 'Kalkulation!I49', 'Kalkulation!I50', 'Kalkulation!I51', 'Kalkulation!I52', 'Kalkulation!I53', 'Kalkulation!I54', 'Kalkulation!I55', 'Kalkulation!I56', 'Kalkulation!I57', 'Kalkulation!I58', 'Kalkulation!I59', 'Kalkulation!I60', 'Kalkulation!I61', 'Kalkulation!I62', 'Kalkulation!I63', 'Kalkulation!I64', 'Kalkulation!I65', 'Kalkulation!I66'),
+    'Kalkulation!H50': ('Kalkulation!K50', 'Kalkulation!L50'),
+    'Kalkulation!H51': ('Kalkulation!K51', 'Kalkulation!L51'),
+    'Kalkulation!H52': ('Kalkulation!K52', 'Kalkulation!L52'),
+    'Kalkulation!H53': ('Kalkulation!K53', 'Kalkulation!L53'),
+    'Kalkulation!H54': ('Kalkulation!K54', 'Kalkulation!L54'),
+    'Kalkulation!H55': ('Kalkulation!K55', 'Kalkulation!L55'),
+    'Kalkulation!H56': ('Kalkulation!K56', 'Kalkulation!L56'),
+    'Kalkulation!H57': ('Kalkulation!K57', 'Kalkulation!L57'),
+    'Kalkulation!H58': ('Kalkulation!K58', 'Kalkulation!L58'),
+    'Kalkulation!H59': ('Kalkulation!K59', 'Kalkulation!L59'),
+    'Kalkulation!H60': ('Kalkulation!K60', 'Kalkulation!L60'),
+    'Kalkulation!H61': ('Kalkulation!K61', 'Kalkulation!L61'),
+    'Kalkulation!H62': ('Kalkulation!K62', 'Kalkulation!L62'),
+    'Kalkulation!H63': ('Kalkulation!K63', 'Kalkulation!L63'),
+    'Kalkulation!H64': ('Kalkulation!K64', 'Kalkulation!L64'),
+    'Kalkulation!H65': ('Kalkulation!K65', 'Kalkulation!L65'),
+    'Kalkulation!H66': ('Kalkulation!K66', 'Kalkulation!L66'),
+    'Kalkulation!I16': ('Kalkulation!J16',),
+    'Kalkulation!I17': ('Kalkulation!J17',),
+    'Kalkulation!I18': ('Kalkulation!J18',),
+    'Kalkulation!I19': ('Kalkulation!J19',),
+    'Kalkulation!I20': ('Kalkulation!J20',),
+    'Kalkulation!I21': ('Kalkulation!J21',),
+    'Kalkulation!I22': ('Kalkulation!J22',),
+    'Kalkulation!I23': ('Kalkulation!J23',),
+    'Kalkulation!I24': ('Kalkulation!J24',),
+    'Kalkulation!I25': ('Kalkulation!J25',),
+    'Kalkulation!I26': ('Kalkulation!J26',),
+    'Kalkulation!I27': ('Kalkulation!J27',),
+    'Kalkulation!I28': ('Kalkulation!J28',),
+    'Kalkulation!I29': ('Kalkulation!J29',),
+    'Kalkulation!I30': ('Kalkulation!J30',),
+    'Kalkulation!I31': ('Kalkulation!J31',),
+    'Kalkulation!I32': ('Kalkulation!J32',),
+    'Kalkulation!I33': ('Kalkulation!J33',),
+    'Kalkulation!I34': ('Kalkulation!J34',),
+    'Kalkulation!I35': ('Kalkulation!J35',),
+    'Kalkulation!I36': ('Kalkulation!J36',),
+    'Kalkulation!I37': ('Kalkulation!J37',),
+    'Kalkulation!I38': ('Kalkulation!J38',),
+    'Kalkulation!I39': ('Kalkulation!J39',),
+    'Kalkulation!I40': ('Kalkulation!J40',),
+    'Kalkulation!I41': ('Kalkulation!J41',),
+    'Kalkulation!I42': ('Kalkulation!J42',),
+    'Kalkulation!I43': ('Kalkulation!J43',),
+    'Kalkulation!I44': ('Kalkulation!J44',),
+    'Kalkulation!I45': ('Kalkulation!J45',),
+    'Kalkulation!I46': ('Kalkulation!J46',),
+    'Kalkulation!I47': ('Kalkulation!J47',),
+    'Kalkulation!I48': ('Kalkulation!J48',),
+    'Kalkulation!I49': ('Kalkulation!J49',),
+    'Kalkulation!I50': ('Kalkulation!J50',),
+    'Kalkulation!I51': ('Kalkulation!J51',),
+    'Kalkulation!I52': ('Kalkulation!J52',),
+    'Kalkulation!I53': ('Kalkulation!J53',),
+    'Kalkulation!I54': ('Kalkulation!J54',),
+    'Kalkulation!I55': ('Kalkulation!J55',),
+    'Kalkulation!I56': ('Kalkulation!J56',),
+    'Kalkulation!I57': ('Kalkulation!J57',),
+    'Kalkulation!I58': ('Kalkulation!J58',),
+    'Kalkulation!I59': ('Kalkulation!J59',),
+    'Kalkulation!I60': ('Kalkulation!J60',),
+    'Kalkulation!I61': ('Kalkulation!J61',),
+    'Kalkulation!I62': ('Kalkulation!J62',),
+    'Kalkulation!I63': ('Kalkulation!J63',),
+    'Kalkulation!I64': ('Kalkulation!J64',),
+    'Kalkulation!I65': ('Kalkulation!J65',),
+    'Kalkulation!I66': ('Kalkulation!J66',),
+    'Kalkulation!J16': ('Kalkulation!K16',),
+    'Kalkulation!J17': ('Kalkulation!K17',),
+    'Kalkulation!J18': ('Kalkulation!K18',),
+    'Kalkulation!J19': ('Kalkulation!K19',),
+    'Kalkulation!J20': ('Kalkulation!K20',),
+    'Kalkulation!J21': ('Kalkulation!K21',),
+    'Kalkulation!J22': ('Kalkulation!K22',),
+    'Kalkulation!J23': ('Kalkulation!K23',),
+    'Kalkulation!J24': ('Kalkulation!K24',),
+    'Kalkulation!J25': ('Kalkulation!K25',),
+    'Kalkulation!J26': ('Kalkulation!K26',),
+    'Kalkulation!J27': ('Kalkulation!K27',),
+    'Kalkulation!J28': ('Kalkulation!K28',),
+    'Kalkulation!J29': ('Kalkulation!K29',),
+    'Kalkulation!J30': ('Kalkulation!K30',),
+    'Kalkulation!J31': ('Kalkulation!K31',),
+    'Kalkulation!J32': ('Kalkulation!K32',),
+    'Kalkulation!J33': ('Kalkulation!K33',),
+    'Kalkulation!J34': ('Kalkulation!K34',),
+    'Kalkulation!J35': ('Kalkulation!K35',),
+    'Kalkulation!J36': ('Kalkulation!K36',),
+    'Kalkulation!J37': ('Kalkulation!K37',),
+    'Kalkulation!J38': ('Kalkulation!K38',),
+    'Kalkulation!J39': ('Kalkulation!K39',),
+    'Kalkulation!J40': ('Kalkulation!K40',),
+    'Kalkulation!J41': ('Kalkulation!K41',),
+    'Kalkulation!J42': ('Kalkulation!K42',),
+    'Kalkulation!J43': ('Kalkulation!K43',),
+    'Kalkulation!J44': ('Kalkulation!K44',),
+    'Kalkulation!J45': ('Kalkulation!K45',),
+    'Kalkulation!J46': ('Kalkulation!K46',),
+    'Kalkulation!J47': ('Kalkulation!K47',),
+    'Kalkulation!J48': ('Kalkulation!K48',),
+    'Kalkulation!J49': ('Kalkulation!K49',),
+    'Kalkulation!J50': ('Kalkulation!K50',),
+    'Kalkulation!J51': ('Kalkulation!K51',),
+    'Kalkulation!J52': ('Kalkulation!K52',),
+    'Kalkulation!J53': ('Kalkulation!K53',),
+    'Kalkulation!J54': ('Kalkulation!K54',),
+    'Kalkulation!J55': ('Kalkulation!K55',),
+    'Kalkulation!J56': ('Kalkulation!K56',),
+    'Kalkulation!J57': ('Kalkulation!K57',),
+    'Kalkulation!J58': ('Kalkulation!K58',),
+    'Kalkulation!J59': ('Kalkulation!K59',),
+    'Kalkulation!J60': ('Kalkulation!K60',),
+    'Kalkulation!J61': ('Kalkulation!K61',),
+    'Kalkulation!J62': ('Kalkulation!K62',),
+    'Kalkulation!J63': ('Kalkulation!K63',),
+    'Kalkulation!J64': ('Kalkulation!K64',),
+    'Kalkulation!J65': ('Kalkulation!K65',),
+    'Kalkulation!J66': ('Kalkulation!K66',),
+    'Kalkulation!K5': ('Kalkulation!K6', 'Kalkulation!K9'),
+    'Kalkulation!K6': ('Kalkulation!K7', 'Kalkulation!H16', 'Kalkulation!H17', 'Kalkulation!H18', 'Kalkulation!H19', 'Kalkulation!H20', 'Kalkulation!H21', 'Kalkulation!H22', 'Kalkulation!H23', 'Kalkulation!H24', 'Kalkulation!H25', 'Kalkulation!H26', 'Kalkulation!H27', 'Kalkulation!H28', 'Kalkulation!H29', 'Kalkulation!H30', 'Kalkulation!H31', 'Kalkulation!H32', 'Kalkulation!H33', 'Kalkulation!H34', 'Kalkulation!H35', 'Kalkulation!H36', 'Kalkulation!H37', 'Kalkulation!H38', 'Kalkulation!H39', 'Kalkulation!H40', 'Kalkulation!H41', 'Kalkulation!H42', 'Kalkulation!H43', 'Kalkulation!H44', 'Kalkulation!H45', 'Kalkulation!H46', 'Kalkulation!H47', 'Kalkulation!H48', 'Kalkulation!H49', 'Kalkulation!H50', 'Kalkulation!H51', 'Kalkulation!H52', 'Kalkulation!H53', 'Kalkulation!H54', 'Kalkulation!H55', 'Kalkulation!H56', 'Kalkulation!H57', 'Kalkulation!H58', 'Kalkulation!H59', 'Kalkulation!H60', 'Kalkulation!H61', 'Kalkulation!H62', 'Kalkulation!H63', 'Kalkulation!H64', 'Kalkulation!H65', 'Kalkulation!H66'),
+    'Kalkulation!K9': ('Kalkulation!E16', 'Kalkulation!E17', 'Kalkulation!E18', 'Kalkulation!E19', 'Kalkulation!E20', 'Kalkulation!E21', 'Kalkulation!E22', 'Kalkulation!E23', 'Kalkulation!E24', 'Kalkulation!E25', 'Kalkulation!E26', 'Kalkulation!E27', 'Kalkulation!E28', 'Kalkulation!E29', 'Kalkulation!E30', 'Kalkulation!E31', 'Kalkulation!E32', 'Kalkulation!E33', 'Kalkulation!E34', 'Kalkulation!E35', 'Kalkulation!E36', 'Kalkulation!E37', 'Kalkulation!E38', 'Kalkulation!E39', 'Kalkulation!E40', 'Kalkulation!E41', 'Kalkulation!E42', 'Kalkulation!E43', 'Kalkulation!E44', 'Kalkulation!E45', 'Kalkulation!E46', 'Kalkulation!E47', 'Kalkulation!E48', 'Kalkulation!E49', 'Kalkulation!E50', 'Kalkulation!E51', 'Kalkulation!E52', 'Kalkulation!E53', 'Kalkulation!E54', 'Kalkulation!E55', 'Kalkulation!E56', 'Kalkulation!E57', 'Kalkulation!E58', 'Kalkulation!E59', 'Kalkulation!E60', 'Kalkulation!E61', 'Kalkulation!E62', 'Kalkulation!E63', 'Kalkulation!E64', 'Kalkulation!E65', 'Kalkulation!E66'),
+}
+
+def calculate_all() -> list:
+    """Rechnet alle Formelzellen in einem Rumpf, in der Reihenfolge CELL_ORDER, und liefert ihre Werte in dieser Reihenfolge. Erzeugt von Step05 aus den fkt_*-Funktionen."""
+    values = current_context().values
+    g_x = get_excel_global('x')
+    g_n = get_excel_global('n')
+    g_sex = get_excel_global('Sex')
+    g_tafel = get_excel_global('Tafel')
+    g_zins = get_excel_global('Zins')
+    g_gamma1 = get_excel_global('gamma1')
+    g_t = get_excel_global('t')
+    g_gamma2 = get_excel_global('gamma2')
+    g_beta1 = get_excel_global('beta1')
+    g_alpha = get_excel_global('alpha')
+    g_vs = get_excel_global('VS')
+    g_zw = get_excel_global('zw')
+    g_k = get_excel_global('k')
+    v_kalkulation_a16 = get_cell_value('Kalkulation!A16')
+    g_gamma3 = get_excel_global('gamma3')
+    g_minalterflex = get_excel_global('MinAlterFlex')
+    g_minrlzflex = get_excel_global('MinRLZFlex')
+    v_kalkulation_a17 = get_cell_value('Kalkulation!A17')
+    v_kalkulation_a18 = get_cell_value('Kalkulation!A18')
+    v_kalkulation_a19 = get_cell_value('Kalkulation!A19')
+    v_kalkulation_a20 = get_cell_value('Kalkulation!A20')
+    v_kalkulation_a21 = get_cell_value('Kalkulation!A21')
+    v_kalkulation_a22 = get_cell_value('Kalkulation!A22')
+    v_kalkulation_a23 = get_cell_value('Kalkulation!A23')
+    v_kalkulation_a24 = get_cell_value('Kalkulation!A24')
+    v_kalkulation_a25 = get_cell_value('Kalkulation!A25')
+    v_kalkulation_a26 = get_cell_value('Kalkulation!A26')
+    v_kalkulation_a27 = get_cell_value('Kalkulation!A27')
+    v_kalkulation_a28 = get_cell_value('Kalkulation!A28')
+    v_kalkulation_a29 = get_cell_value('Kalkulation!A29')
+    v_kalkulation_a30 = get_cell_value('Kalkulation!A30')
+    v_kalkulation_a31 = get_cell_value('Kalkulation!A31')
+    v_kalkulation_a32 = get_cell_value('Kalkulation!A32')
+    v_kalkulation_a33 = get_cell_value('Kalkulation!A33')
+    v_kalkulation_a34 = get_cell_value('Kalkulation!A34')
+    v_kalkulation_a35 = get_cell_value('Kalkulation!A35')
+    v_kalkulation_a36 = get_cell_value('Kalkulation!A36')
+    v_kalkulation_a37 = get_cell_value('Kalkulation!A37')
+    v_kalkulation_a38 = get_cell_value('Kalkulation!A38')
+    v_kalkulation_a39 = get_cell_value('Kalkulation!A39')
+    v_kalkulation_a40 = get_cell_value('Kalkulation!A40')
+    v_kalkulation_a41 = get_cell_value('Kalkulation!A41')
+    v_kalkulation_a42 = get_cell_value('Kalkulation!A42')
+    v_kalkulation_a43 = get_cell_value('Kalkulation!A43')
+    v_kalkulation_a44 = get_cell_value('Kalkulation!A44')
+    v_kalkulation_a45 = get_cell_value('Kalkulation!A45')
+    v_kalkulation_a46 = get_cell_value('Kalkulation!A46')
+    v_kalkulation_a47 = get_cell_value('Kalkulation!A47')
+    v_kalkulation_a48 = get_cell_value('Kalkulation!A48')
+    v_kalkulation_a49 = get_cell_value('Kalkulation!A49')
+    v_kalkulation_a50 = get_cell_value('Kalkulation!A50')
+    v_kalkulation_a51 = get_cell_value('Kalkulation!A51')
+    v_kalkulation_a52 = get_cell_value('Kalkulation!A52')
+    v_kalkulation_a53 = get_cell_value('Kalkulation!A53')
+    v_kalkulation_a54 = get_cell_value('Kalkulation!A54')
+    v_kalkulation_a55 = get_cell_value('Kalkulation!A55')
+    v_kalkulation_a56 = get_cell_value('Kalkulation!A56')
+    v_kalkulation_a57 = get_cell_value('Kalkulation!A57')
+    v_kalkulation_a58 = get_cell_value('Kalkulation!A58')
+    v_kalkulation_a59 = get_cell_value('Kalkulation!A59')
+    v_kalkulation_a60 = get_cell_value('Kalkulation!A60')
+    v_kalkulation_a61 = get_cell_value('Kalkulation!A61')
+    v_kalkulation_a62 = get_cell_value('Kalkulation!A62')
+    v_kalkulation_a63 = get_cell_value('Kalkulation!A63')
+    v_kalkulation_a64 = get_cell_value('Kalkulation!A64')
+    v_kalkulation_a65 = get_cell_value('Kalkulation!A65')
+    v_kalkulation_a66 = get_cell_value('Kalkulation!A66')
+    c_kalkulation_k5 = (act_ngr_ax(g_x, g_n, g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x, g_sex, g_tafel, g_zins) + g_gamma1 * act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) + g_gamma2 * (act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) - act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1))) / ((1 - g_beta1) * act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) - g_alpha * g_t)
+    c_kalkulation_k6 = g_vs * c_kalkulation_k5
+    values['Kalkulation!K6'] = c_kalkulation_k6
+    c_kalkulation_k9 = (act_ngr_ax(g_x, g_n, g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x, g_sex, g_tafel, g_zins) + g_t * g_alpha * c_kalkulation_k5) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1)
+    values['Kalkulation!K9'] = c_kalkulation_k9
+    c_kalkulation_e12 = 0.02 if g_zw == 2 else 0.03 if g_zw == 4 else 0.05 if g_zw == 12 else 0
+    c_kalkulation_k7 = (1 + c_kalkulation_e12) / g_zw * (c_kalkulation_k6 + g_k)
     try:
-        if A66 > n:
-            return 0
-        elif A66 < t:
-            return H66 / G66
-        else:
-            return VS
-    except:
-        return 0
\ No newline at end of file
+        col_kalkulation_b16_b66 = rows_kalkulation_b16_b66(np.array([v_kalkulation_a16, v_kalkulation_a17, v_kalkulation_a18, v_kalkulation_a19, v_kalkulation_a20, v_kalkulation_a21, v_kalkulation_a22, v_kalkulation_a23, v_kalkulation_a24, v_kalkulation_a25, v_kalkulation_a26, v_kalkulation_a27, v_kalkulation_a28, v_kalkulation_a29, v_kalkulation_a30, v_kalkulation_a31, v_kalkulation_a32, v_kalkulation_a33, v_kalkulation_a34, v_kalkulation_a35, v_kalkulation_a36, v_kalkulation_a37, v_kalkulation_a38, v_kalkulation_a39, v_kalkulation_a40, v_kalkulation_a41, v_kalkulation_a42, v_kalkulation_a43, v_kalkulation_a44, v_kalkulation_a45, v_kalkulation_a46, v_kalkulation_a47, v_kalkulation_a48, v_kalkulation_a49, v_kalkulation_a50, v_kalkulation_a51, v_kalkulation_a52, v_kalkulation_a53, v_kalkulation_a54, v_kalkulation_a55, v_kalkulation_a56, v_kalkulation_a57, v_kalkulation_a58, v_kalkulation_a59, v_kalkulation_a60, v_kalkulation_a61, v_kalkulation_a62, v_kalkulation_a63, v_kalkulation_a64, v_kalkulation_a65, v_kalkulation_a66]))
+        c_kalkulation_b16, c_kalkulation_b17, c_kalkulation_b18, c_kalkulation_b19, c_kalkulation_b20, c_kalkulation_b21, c_kalkulation_b22, c_kalkulation_b23, c_kalkulation_b24, c_kalkulation_b25, c_kalkulation_b26, c_kalkulation_b27, c_kalkulation_b28, c_kalkulation_b29, c_kalkulation_b30, c_kalkulation_b31, c_kalkulation_b32, c_kalkulation_b33, c_kalkulation_b34, c_kalkulation_b35, c_kalkulation_b36, c_kalkulation_b37, c_kalkulation_b38, c_kalkulation_b39, c_kalkulation_b40, c_kalkulation_b41, c_kalkulation_b42, c_kalkulation_b43, c_kalkulation_b44, c_kalkulation_b45, c_kalkulation_b46, c_kalkulation_b47, c_kalkulation_b48, c_kalkulation_b49, c_kalkulation_b50, c_kalkulation_b51, c_kalkulation_b52, c_kalkulation_b53, c_kalkulation_b54, c_kalkulation_b55, c_kalkulation_b56, c_kalkulation_b57, c_kalkulation_b58, c_kalkulation_b59, c_kalkulation_b60, c_kalkulation_b61, c_kalkulation_b62, c_kalkulation_b63, c_kalkulation_b64, c_kalkulation_b65, c_kalkulation_b66 = col_kalkulation_b16_b66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_b16 = act_ngr_ax(g_x + v_kalkulation_a16, max(0, g_n - v_kalkulation_a16), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a16, g_sex, g_tafel, g_zins) if v_kalkulation_a16 <= g_n else 0
+        c_kalkulation_b17 = act_ngr_ax(g_x + v_kalkulation_a17, max(0, g_n - v_kalkulation_a17), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a17, g_sex, g_tafel, g_zins) if v_kalkulation_a17 <= g_n else 0
+        c_kalkulation_b18 = act_ngr_ax(g_x + v_kalkulation_a18, max(0, g_n - v_kalkulation_a18), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a18, g_sex, g_tafel, g_zins) if v_kalkulation_a18 <= g_n else 0
+        c_kalkulation_b19 = act_ngr_ax(g_x + v_kalkulation_a19, max(0, g_n - v_kalkulation_a19), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a19, g_sex, g_tafel, g_zins) if v_kalkulation_a19 <= g_n else 0
+        c_kalkulation_b20 = act_ngr_ax(g_x + v_kalkulation_a20, max(0, g_n - v_kalkulation_a20), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a20, g_sex, g_tafel, g_zins) if v_kalkulation_a20 <= g_n else 0
+        c_kalkulation_b21 = act_ngr_ax(g_x + v_kalkulation_a21, max(0, g_n - v_kalkulation_a21), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a21, g_sex, g_tafel, g_zins) if v_kalkulation_a21 <= g_n else 0
+        c_kalkulation_b22 = act_ngr_ax(g_x + v_kalkulation_a22, max(0, g_n - v_kalkulation_a22), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a22, g_sex, g_tafel, g_zins) if v_kalkulation_a22 <= g_n else 0
+        c_kalkulation_b23 = act_ngr_ax(g_x + v_kalkulation_a23, max(0, g_n - v_kalkulation_a23), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a23, g_sex, g_tafel, g_zins) if v_kalkulation_a23 <= g_n else 0
+        c_kalkulation_b24 = act_ngr_ax(g_x + v_kalkulation_a24, max(0, g_n - v_kalkulation_a24), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a24, g_sex, g_tafel, g_zins) if v_kalkulation_a24 <= g_n else 0
+        c_kalkulation_b25 = act_ngr_ax(g_x + v_kalkulation_a25, max(0, g_n - v_kalkulation_a25), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a25, g_sex, g_tafel, g_zins) if v_kalkulation_a25 <= g_n else 0
+        c_kalkulation_b26 = act_ngr_ax(g_x + v_kalkulation_a26, max(0, g_n - v_kalkulation_a26), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a26, g_sex, g_tafel, g_zins) if v_kalkulation_a26 <= g_n else 0
+        c_kalkulation_b27 = act_ngr_ax(g_x + v_kalkulation_a27, max(0, g_n - v_kalkulation_a27), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a27, g_sex, g_tafel, g_zins) if v_kalkulation_a27 <= g_n else 0
+        c_kalkulation_b28 = act_ngr_ax(g_x + v_kalkulation_a28, max(0, g_n - v_kalkulation_a28), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a28, g_sex, g_tafel, g_zins) if v_kalkulation_a28 <= g_n else 0
+        c_kalkulation_b29 = act_ngr_ax(g_x + v_kalkulation_a29, max(0, g_n - v_kalkulation_a29), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a29, g_sex, g_tafel, g_zins) if v_kalkulation_a29 <= g_n else 0
+        c_kalkulation_b30 = act_ngr_ax(g_x + v_kalkulation_a30, max(0, g_n - v_kalkulation_a30), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a30, g_sex, g_tafel, g_zins) if v_kalkulation_a30 <= g_n else 0
+        c_kalkulation_b31 = act_ngr_ax(g_x + v_kalkulation_a31, max(0, g_n - v_kalkulation_a31), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a31, g_sex, g_tafel, g_zins) if v_kalkulation_a31 <= g_n else 0
+        c_kalkulation_b32 = act_ngr_ax(g_x + v_kalkulation_a32, max(0, g_n - v_kalkulation_a32), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a32, g_sex, g_tafel, g_zins) if v_kalkulation_a32 <= g_n else 0
+        c_kalkulation_b33 = act_ngr_ax(g_x + v_kalkulation_a33, max(0, g_n - v_kalkulation_a33), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a33, g_sex, g_tafel, g_zins) if v_kalkulation_a33 <= g_n else 0
+        c_kalkulation_b34 = act_ngr_ax(g_x + v_kalkulation_a34, max(0, g_n - v_kalkulation_a34), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a34, g_sex, g_tafel, g_zins) if v_kalkulation_a34 <= g_n else 0
+        c_kalkulation_b35 = act_ngr_ax(g_x + v_kalkulation_a35, max(0, g_n - v_kalkulation_a35), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a35, g_sex, g_tafel, g_zins) if v_kalkulation_a35 <= g_n else 0
+        c_kalkulation_b36 = act_ngr_ax(g_x + v_kalkulation_a36, max(0, g_n - v_kalkulation_a36), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a36, g_sex, g_tafel, g_zins) if v_kalkulation_a36 <= g_n else 0
+        c_kalkulation_b37 = act_ngr_ax(g_x + v_kalkulation_a37, max(0, g_n - v_kalkulation_a37), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a37, g_sex, g_tafel, g_zins) if v_kalkulation_a37 <= g_n else 0
+        c_kalkulation_b38 = act_ngr_ax(g_x + v_kalkulation_a38, max(0, g_n - v_kalkulation_a38), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a38, g_sex, g_tafel, g_zins) if v_kalkulation_a38 <= g_n else 0
+        c_kalkulation_b39 = act_ngr_ax(g_x + v_kalkulation_a39, max(0, g_n - v_kalkulation_a39), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a39, g_sex, g_tafel, g_zins) if v_kalkulation_a39 <= g_n else 0
+        c_kalkulation_b40 = act_ngr_ax(g_x + v_kalkulation_a40, max(0, g_n - v_kalkulation_a40), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a40, g_sex, g_tafel, g_zins) if v_kalkulation_a40 <= g_n else 0
+        c_kalkulation_b41 = act_ngr_ax(g_x + v_kalkulation_a41, max(0, g_n - v_kalkulation_a41), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a41, g_sex, g_tafel, g_zins) if v_kalkulation_a41 <= g_n else 0
+        c_kalkulation_b42 = act_ngr_ax(g_x + v_kalkulation_a42, max(0, g_n - v_kalkulation_a42), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a42, g_sex, g_tafel, g_zins) if v_kalkulation_a42 <= g_n else 0
+        c_kalkulation_b43 = act_ngr_ax(g_x + v_kalkulation_a43, max(0, g_n - v_kalkulation_a43), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a43, g_sex, g_tafel, g_zins) if v_kalkulation_a43 <= g_n else 0
+        c_kalkulation_b44 = act_ngr_ax(g_x + v_kalkulation_a44, max(0, g_n - v_kalkulation_a44), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a44, g_sex, g_tafel, g_zins) if v_kalkulation_a44 <= g_n else 0
+        c_kalkulation_b45 = act_ngr_ax(g_x + v_kalkulation_a45, max(0, g_n - v_kalkulation_a45), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a45, g_sex, g_tafel, g_zins) if v_kalkulation_a45 <= g_n else 0
+        c_kalkulation_b46 = act_ngr_ax(g_x + v_kalkulation_a46, max(0, g_n - v_kalkulation_a46), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a46, g_sex, g_tafel, g_zins) if v_kalkulation_a46 <= g_n else 0
+        c_kalkulation_b47 = act_ngr_ax(g_x + v_kalkulation_a47, max(0, g_n - v_kalkulation_a47), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a47, g_sex, g_tafel, g_zins) if v_kalkulation_a47 <= g_n else 0
+        c_kalkulation_b48 = act_ngr_ax(g_x + v_kalkulation_a48, max(0, g_n - v_kalkulation_a48), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a48, g_sex, g_tafel, g_zins) if v_kalkulation_a48 <= g_n else 0
+        c_kalkulation_b49 = act_ngr_ax(g_x + v_kalkulation_a49, max(0, g_n - v_kalkulation_a49), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a49, g_sex, g_tafel, g_zins) if v_kalkulation_a49 <= g_n else 0
+        c_kalkulation_b50 = act_ngr_ax(g_x + v_kalkulation_a50, max(0, g_n - v_kalkulation_a50), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a50, g_sex, g_tafel, g_zins) if v_kalkulation_a50 <= g_n else 0
+        c_kalkulation_b51 = act_ngr_ax(g_x + v_kalkulation_a51, max(0, g_n - v_kalkulation_a51), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a51, g_sex, g_tafel, g_zins) if v_kalkulation_a51 <= g_n else 0
+        c_kalkulation_b52 = act_ngr_ax(g_x + v_kalkulation_a52, max(0, g_n - v_kalkulation_a52), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a52, g_sex, g_tafel, g_zins) if v_kalkulation_a52 <= g_n else 0
+        c_kalkulation_b53 = act_ngr_ax(g_x + v_kalkulation_a53, max(0, g_n - v_kalkulation_a53), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a53, g_sex, g_tafel, g_zins) if v_kalkulation_a53 <= g_n else 0
+        c_kalkulation_b54 = act_ngr_ax(g_x + v_kalkulation_a54, max(0, g_n - v_kalkulation_a54), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a54, g_sex, g_tafel, g_zins) if v_kalkulation_a54 <= g_n else 0
+        c_kalkulation_b55 = act_ngr_ax(g_x + v_kalkulation_a55, max(0, g_n - v_kalkulation_a55), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a55, g_sex, g_tafel, g_zins) if v_kalkulation_a55 <= g_n else 0
+        c_kalkulation_b56 = act_ngr_ax(g_x + v_kalkulation_a56, max(0, g_n - v_kalkulation_a56), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a56, g_sex, g_tafel, g_zins) if v_kalkulation_a56 <= g_n else 0
+        c_kalkulation_b57 = act_ngr_ax(g_x + v_kalkulation_a57, max(0, g_n - v_kalkulation_a57), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a57, g_sex, g_tafel, g_zins) if v_kalkulation_a57 <= g_n else 0
+        c_kalkulation_b58 = act_ngr_ax(g_x + v_kalkulation_a58, max(0, g_n - v_kalkulation_a58), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a58, g_sex, g_tafel, g_zins) if v_kalkulation_a58 <= g_n else 0
+        c_kalkulation_b59 = act_ngr_ax(g_x + v_kalkulation_a59, max(0, g_n - v_kalkulation_a59), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a59, g_sex, g_tafel, g_zins) if v_kalkulation_a59 <= g_n else 0
+        c_kalkulation_b60 = act_ngr_ax(g_x + v_kalkulation_a60, max(0, g_n - v_kalkulation_a60), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a60, g_sex, g_tafel, g_zins) if v_kalkulation_a60 <= g_n else 0
+        c_kalkulation_b61 = act_ngr_ax(g_x + v_kalkulation_a61, max(0, g_n - v_kalkulation_a61), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a61, g_sex, g_tafel, g_zins) if v_kalkulation_a61 <= g_n else 0
+        c_kalkulation_b62 = act_ngr_ax(g_x + v_kalkulation_a62, max(0, g_n - v_kalkulation_a62), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a62, g_sex, g_tafel, g_zins) if v_kalkulation_a62 <= g_n else 0
+        c_kalkulation_b63 = act_ngr_ax(g_x + v_kalkulation_a63, max(0, g_n - v_kalkulation_a63), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a63, g_sex, g_tafel, g_zins) if v_kalkulation_a63 <= g_n else 0
+        c_kalkulation_b64 = act_ngr_ax(g_x + v_kalkulation_a64, max(0, g_n - v_kalkulation_a64), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a64, g_sex, g_tafel, g_zins) if v_kalkulation_a64 <= g_n else 0
+        c_kalkulation_b65 = act_ngr_ax(g_x + v_kalkulation_a65, max(0, g_n - v_kalkulation_a65), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a65, g_sex, g_tafel, g_zins) if v_kalkulation_a65 <= g_n else 0
+        c_kalkulation_b66 = act_ngr_ax(g_x + v_kalkulation_a66, max(0, g_n - v_kalkulation_a66), g_sex, g_tafel, g_zins) + act_dx(g_x + g_n, g_sex, g_tafel, g_zins) / act_dx(g_x + v_kalkulation_a66, g_sex, g_tafel, g_zins) if v_kalkulation_a66 <= g_n else 0
+        col_kalkulation_b16_b66 = np.array([c_kalkulation_b16, c_kalkulation_b17, c_kalkulation_b18, c_kalkulation_b19, c_kalkulation_b20, c_kalkulation_b21, c_kalkulation_b22, c_kalkulation_b23, c_kalkulation_b24, c_kalkulation_b25, c_kalkulation_b26, c_kalkulation_b27, c_kalkulation_b28, c_kalkulation_b29, c_kalkulation_b30, c_kalkulation_b31, c_kalkulation_b32, c_kalkulation_b33, c_kalkulation_b34, c_kalkulation_b35, c_kalkulation_b36, c_kalkulation_b37, c_kalkulation_b38, c_kalkulation_b39, c_kalkulation_b40, c_kalkulation_b41, c_kalkulation_b42, c_kalkulation_b43, c_kalkulation_b44, c_kalkulation_b45, c_kalkulation_b46, c_kalkulation_b47, c_kalkulation_b48, c_kalkulation_b49, c_kalkulation_b50, c_kalkulation_b51, c_kalkulation_b52, c_kalkulation_b53, c_kalkulation_b54, c_kalkulation_b55, c_kalkulation_b56, c_kalkulation_b57, c_kalkulation_b58, c_kalkulation_b59, c_kalkulation_b60, c_kalkulation_b61, c_kalkulation_b62, c_kalkulation_b63, c_kalkulation_b64, c_kalkulation_b65, c_kalkulation_b66])
+    try:
+        col_kalkulation_c16_c66 = rows_kalkulation_c16_c66(np.array([v_kalkulation_a16, v_kalkulation_a17, v_kalkulation_a18, v_kalkulation_a19, v_kalkulation_a20, v_kalkulation_a21, v_kalkulation_a22, v_kalkulation_a23, v_kalkulation_a24, v_kalkulation_a25, v_kalkulation_a26, v_kalkulation_a27, v_kalkulation_a28, v_kalkulation_a29, v_kalkulation_a30, v_kalkulation_a31, v_kalkulation_a32, v_kalkulation_a33, v_kalkulation_a34, v_kalkulation_a35, v_kalkulation_a36, v_kalkulation_a37, v_kalkulation_a38, v_kalkulation_a39, v_kalkulation_a40, v_kalkulation_a41, v_kalkulation_a42, v_kalkulation_a43, v_kalkulation_a44, v_kalkulation_a45, v_kalkulation_a46, v_kalkulation_a47, v_kalkulation_a48, v_kalkulation_a49, v_kalkulation_a50, v_kalkulation_a51, v_kalkulation_a52, v_kalkulation_a53, v_kalkulation_a54, v_kalkulation_a55, v_kalkulation_a56, v_kalkulation_a57, v_kalkulation_a58, v_kalkulation_a59, v_kalkulation_a60, v_kalkulation_a61, v_kalkulation_a62, v_kalkulation_a63, v_kalkulation_a64, v_kalkulation_a65, v_kalkulation_a66]))
+        c_kalkulation_c16, c_kalkulation_c17, c_kalkulation_c18, c_kalkulation_c19, c_kalkulation_c20, c_kalkulation_c21, c_kalkulation_c22, c_kalkulation_c23, c_kalkulation_c24, c_kalkulation_c25, c_kalkulation_c26, c_kalkulation_c27, c_kalkulation_c28, c_kalkulation_c29, c_kalkulation_c30, c_kalkulation_c31, c_kalkulation_c32, c_kalkulation_c33, c_kalkulation_c34, c_kalkulation_c35, c_kalkulation_c36, c_kalkulation_c37, c_kalkulation_c38, c_kalkulation_c39, c_kalkulation_c40, c_kalkulation_c41, c_kalkulation_c42, c_kalkulation_c43, c_kalkulation_c44, c_kalkulation_c45, c_kalkulation_c46, c_kalkulation_c47, c_kalkulation_c48, c_kalkulation_c49, c_kalkulation_c50, c_kalkulation_c51, c_kalkulation_c52, c_kalkulation_c53, c_kalkulation_c54, c_kalkulation_c55, c_kalkulation_c56, c_kalkulation_c57, c_kalkulation_c58, c_kalkulation_c59, c_kalkulation_c60, c_kalkulation_c61, c_kalkulation_c62, c_kalkulation_c63, c_kalkulation_c64, c_kalkulation_c65, c_kalkulation_c66 = col_kalkulation_c16_c66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_c16 = act_axn_k(g_x + v_kalkulation_a16, max(0, g_n - v_kalkulation_a16), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c17 = act_axn_k(g_x + v_kalkulation_a17, max(0, g_n - v_kalkulation_a17), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c18 = act_axn_k(g_x + v_kalkulation_a18, max(0, g_n - v_kalkulation_a18), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c19 = act_axn_k(g_x + v_kalkulation_a19, max(0, g_n - v_kalkulation_a19), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c20 = act_axn_k(g_x + v_kalkulation_a20, max(0, g_n - v_kalkulation_a20), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c21 = act_axn_k(g_x + v_kalkulation_a21, max(0, g_n - v_kalkulation_a21), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c22 = act_axn_k(g_x + v_kalkulation_a22, max(0, g_n - v_kalkulation_a22), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c23 = act_axn_k(g_x + v_kalkulation_a23, max(0, g_n - v_kalkulation_a23), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c24 = act_axn_k(g_x + v_kalkulation_a24, max(0, g_n - v_kalkulation_a24), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c25 = act_axn_k(g_x + v_kalkulation_a25, max(0, g_n - v_kalkulation_a25), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c26 = act_axn_k(g_x + v_kalkulation_a26, max(0, g_n - v_kalkulation_a26), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c27 = act_axn_k(g_x + v_kalkulation_a27, max(0, g_n - v_kalkulation_a27), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c28 = act_axn_k(g_x + v_kalkulation_a28, max(0, g_n - v_kalkulation_a28), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c29 = act_axn_k(g_x + v_kalkulation_a29, max(0, g_n - v_kalkulation_a29), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c30 = act_axn_k(g_x + v_kalkulation_a30, max(0, g_n - v_kalkulation_a30), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c31 = act_axn_k(g_x + v_kalkulation_a31, max(0, g_n - v_kalkulation_a31), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c32 = act_axn_k(g_x + v_kalkulation_a32, max(0, g_n - v_kalkulation_a32), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c33 = act_axn_k(g_x + v_kalkulation_a33, max(0, g_n - v_kalkulation_a33), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c34 = act_axn_k(g_x + v_kalkulation_a34, max(0, g_n - v_kalkulation_a34), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c35 = act_axn_k(g_x + v_kalkulation_a35, max(0, g_n - v_kalkulation_a35), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c36 = act_axn_k(g_x + v_kalkulation_a36, max(0, g_n - v_kalkulation_a36), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c37 = act_axn_k(g_x + v_kalkulation_a37, max(0, g_n - v_kalkulation_a37), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c38 = act_axn_k(g_x + v_kalkulation_a38, max(0, g_n - v_kalkulation_a38), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c39 = act_axn_k(g_x + v_kalkulation_a39, max(0, g_n - v_kalkulation_a39), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c40 = act_axn_k(g_x + v_kalkulation_a40, max(0, g_n - v_kalkulation_a40), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c41 = act_axn_k(g_x + v_kalkulation_a41, max(0, g_n - v_kalkulation_a41), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c42 = act_axn_k(g_x + v_kalkulation_a42, max(0, g_n - v_kalkulation_a42), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c43 = act_axn_k(g_x + v_kalkulation_a43, max(0, g_n - v_kalkulation_a43), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c44 = act_axn_k(g_x + v_kalkulation_a44, max(0, g_n - v_kalkulation_a44), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c45 = act_axn_k(g_x + v_kalkulation_a45, max(0, g_n - v_kalkulation_a45), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c46 = act_axn_k(g_x + v_kalkulation_a46, max(0, g_n - v_kalkulation_a46), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c47 = act_axn_k(g_x + v_kalkulation_a47, max(0, g_n - v_kalkulation_a47), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c48 = act_axn_k(g_x + v_kalkulation_a48, max(0, g_n - v_kalkulation_a48), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c49 = act_axn_k(g_x + v_kalkulation_a49, max(0, g_n - v_kalkulation_a49), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c50 = act_axn_k(g_x + v_kalkulation_a50, max(0, g_n - v_kalkulation_a50), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c51 = act_axn_k(g_x + v_kalkulation_a51, max(0, g_n - v_kalkulation_a51), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c52 = act_axn_k(g_x + v_kalkulation_a52, max(0, g_n - v_kalkulation_a52), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c53 = act_axn_k(g_x + v_kalkulation_a53, max(0, g_n - v_kalkulation_a53), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c54 = act_axn_k(g_x + v_kalkulation_a54, max(0, g_n - v_kalkulation_a54), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c55 = act_axn_k(g_x + v_kalkulation_a55, max(0, g_n - v_kalkulation_a55), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c56 = act_axn_k(g_x + v_kalkulation_a56, max(0, g_n - v_kalkulation_a56), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c57 = act_axn_k(g_x + v_kalkulation_a57, max(0, g_n - v_kalkulation_a57), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c58 = act_axn_k(g_x + v_kalkulation_a58, max(0, g_n - v_kalkulation_a58), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c59 = act_axn_k(g_x + v_kalkulation_a59, max(0, g_n - v_kalkulation_a59), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c60 = act_axn_k(g_x + v_kalkulation_a60, max(0, g_n - v_kalkulation_a60), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c61 = act_axn_k(g_x + v_kalkulation_a61, max(0, g_n - v_kalkulation_a61), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c62 = act_axn_k(g_x + v_kalkulation_a62, max(0, g_n - v_kalkulation_a62), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c63 = act_axn_k(g_x + v_kalkulation_a63, max(0, g_n - v_kalkulation_a63), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c64 = act_axn_k(g_x + v_kalkulation_a64, max(0, g_n - v_kalkulation_a64), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c65 = act_axn_k(g_x + v_kalkulation_a65, max(0, g_n - v_kalkulation_a65), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_c66 = act_axn_k(g_x + v_kalkulation_a66, max(0, g_n - v_kalkulation_a66), g_sex, g_tafel, g_zins, 1)
+        col_kalkulation_c16_c66 = np.array([c_kalkulation_c16, c_kalkulation_c17, c_kalkulation_c18, c_kalkulation_c19, c_kalkulation_c20, c_kalkulation_c21, c_kalkulation_c22, c_kalkulation_c23, c_kalkulation_c24, c_kalkulation_c25, c_kalkulation_c26, c_kalkulation_c27, c_kalkulation_c28, c_kalkulation_c29, c_kalkulation_c30, c_kalkulation_c31, c_kalkulation_c32, c_kalkulation_c33, c_kalkulation_c34, c_kalkulation_c35, c_kalkulation_c36, c_kalkulation_c37, c_kalkulation_c38, c_kalkulation_c39, c_kalkulation_c40, c_kalkulation_c41, c_kalkulation_c42, c_kalkulation_c43, c_kalkulation_c44, c_kalkulation_c45, c_kalkulation_c46, c_kalkulation_c47, c_kalkulation_c48, c_kalkulation_c49, c_kalkulation_c50, c_kalkulation_c51, c_kalkulation_c52, c_kalkulation_c53, c_kalkulation_c54, c_kalkulation_c55, c_kalkulation_c56, c_kalkulation_c57, c_kalkulation_c58, c_kalkulation_c59, c_kalkulation_c60, c_kalkulation_c61, c_kalkulation_c62, c_kalkulation_c63, c_kalkulation_c64, c_kalkulation_c65, c_kalkulation_c66])
+    try:
+        col_kalkulation_d16_d66 = rows_kalkulation_d16_d66(np.array([v_kalkulation_a16, v_kalkulation_a17, v_kalkulation_a18, v_kalkulation_a19, v_kalkulation_a20, v_kalkulation_a21, v_kalkulation_a22, v_kalkulation_a23, v_kalkulation_a24, v_kalkulation_a25, v_kalkulation_a26, v_kalkulation_a27, v_kalkulation_a28, v_kalkulation_a29, v_kalkulation_a30, v_kalkulation_a31, v_kalkulation_a32, v_kalkulation_a33, v_kalkulation_a34, v_kalkulation_a35, v_kalkulation_a36, v_kalkulation_a37, v_kalkulation_a38, v_kalkulation_a39, v_kalkulation_a40, v_kalkulation_a41, v_kalkulation_a42, v_kalkulation_a43, v_kalkulation_a44, v_kalkulation_a45, v_kalkulation_a46, v_kalkulation_a47, v_kalkulation_a48, v_kalkulation_a49, v_kalkulation_a50, v_kalkulation_a51, v_kalkulation_a52, v_kalkulation_a53, v_kalkulation_a54, v_kalkulation_a55, v_kalkulation_a56, v_kalkulation_a57, v_kalkulation_a58, v_kalkulation_a59, v_kalkulation_a60, v_kalkulation_a61, v_kalkulation_a62, v_kalkulation_a63, v_kalkulation_a64, v_kalkulation_a65, v_kalkulation_a66]))
+        c_kalkulation_d16, c_kalkulation_d17, c_kalkulation_d18, c_kalkulation_d19, c_kalkulation_d20, c_kalkulation_d21, c_kalkulation_d22, c_kalkulation_d23, c_kalkulation_d24, c_kalkulation_d25, c_kalkulation_d26, c_kalkulation_d27, c_kalkulation_d28, c_kalkulation_d29, c_kalkulation_d30, c_kalkulation_d31, c_kalkulation_d32, c_kalkulation_d33, c_kalkulation_d34, c_kalkulation_d35, c_kalkulation_d36, c_kalkulation_d37, c_kalkulation_d38, c_kalkulation_d39, c_kalkulation_d40, c_kalkulation_d41, c_kalkulation_d42, c_kalkulation_d43, c_kalkulation_d44, c_kalkulation_d45, c_kalkulation_d46, c_kalkulation_d47, c_kalkulation_d48, c_kalkulation_d49, c_kalkulation_d50, c_kalkulation_d51, c_kalkulation_d52, c_kalkulation_d53, c_kalkulation_d54, c_kalkulation_d55, c_kalkulation_d56, c_kalkulation_d57, c_kalkulation_d58, c_kalkulation_d59, c_kalkulation_d60, c_kalkulation_d61, c_kalkulation_d62, c_kalkulation_d63, c_kalkulation_d64, c_kalkulation_d65, c_kalkulation_d66 = col_kalkulation_d16_d66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_d16 = act_axn_k(g_x + v_kalkulation_a16, max(0, g_t - v_kalkulation_a16), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d17 = act_axn_k(g_x + v_kalkulation_a17, max(0, g_t - v_kalkulation_a17), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d18 = act_axn_k(g_x + v_kalkulation_a18, max(0, g_t - v_kalkulation_a18), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d19 = act_axn_k(g_x + v_kalkulation_a19, max(0, g_t - v_kalkulation_a19), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d20 = act_axn_k(g_x + v_kalkulation_a20, max(0, g_t - v_kalkulation_a20), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d21 = act_axn_k(g_x + v_kalkulation_a21, max(0, g_t - v_kalkulation_a21), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d22 = act_axn_k(g_x + v_kalkulation_a22, max(0, g_t - v_kalkulation_a22), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d23 = act_axn_k(g_x + v_kalkulation_a23, max(0, g_t - v_kalkulation_a23), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d24 = act_axn_k(g_x + v_kalkulation_a24, max(0, g_t - v_kalkulation_a24), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d25 = act_axn_k(g_x + v_kalkulation_a25, max(0, g_t - v_kalkulation_a25), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d26 = act_axn_k(g_x + v_kalkulation_a26, max(0, g_t - v_kalkulation_a26), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d27 = act_axn_k(g_x + v_kalkulation_a27, max(0, g_t - v_kalkulation_a27), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d28 = act_axn_k(g_x + v_kalkulation_a28, max(0, g_t - v_kalkulation_a28), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d29 = act_axn_k(g_x + v_kalkulation_a29, max(0, g_t - v_kalkulation_a29), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d30 = act_axn_k(g_x + v_kalkulation_a30, max(0, g_t - v_kalkulation_a30), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d31 = act_axn_k(g_x + v_kalkulation_a31, max(0, g_t - v_kalkulation_a31), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d32 = act_axn_k(g_x + v_kalkulation_a32, max(0, g_t - v_kalkulation_a32), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d33 = act_axn_k(g_x + v_kalkulation_a33, max(0, g_t - v_kalkulation_a33), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d34 = act_axn_k(g_x + v_kalkulation_a34, max(0, g_t - v_kalkulation_a34), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d35 = act_axn_k(g_x + v_kalkulation_a35, max(0, g_t - v_kalkulation_a35), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d36 = act_axn_k(g_x + v_kalkulation_a36, max(0, g_t - v_kalkulation_a36), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d37 = act_axn_k(g_x + v_kalkulation_a37, max(0, g_t - v_kalkulation_a37), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d38 = act_axn_k(g_x + v_kalkulation_a38, max(0, g_t - v_kalkulation_a38), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d39 = act_axn_k(g_x + v_kalkulation_a39, max(0, g_t - v_kalkulation_a39), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d40 = act_axn_k(g_x + v_kalkulation_a40, max(0, g_t - v_kalkulation_a40), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d41 = act_axn_k(g_x + v_kalkulation_a41, max(0, g_t - v_kalkulation_a41), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d42 = act_axn_k(g_x + v_kalkulation_a42, max(0, g_t - v_kalkulation_a42), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d43 = act_axn_k(g_x + v_kalkulation_a43, max(0, g_t - v_kalkulation_a43), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d44 = act_axn_k(g_x + v_kalkulation_a44, max(0, g_t - v_kalkulation_a44), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d45 = act_axn_k(g_x + v_kalkulation_a45, max(0, g_t - v_kalkulation_a45), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d46 = act_axn_k(g_x + v_kalkulation_a46, max(0, g_t - v_kalkulation_a46), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d47 = act_axn_k(g_x + v_kalkulation_a47, max(0, g_t - v_kalkulation_a47), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d48 = act_axn_k(g_x + v_kalkulation_a48, max(0, g_t - v_kalkulation_a48), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d49 = act_axn_k(g_x + v_kalkulation_a49, max(0, g_t - v_kalkulation_a49), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d50 = act_axn_k(g_x + v_kalkulation_a50, max(0, g_t - v_kalkulation_a50), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d51 = act_axn_k(g_x + v_kalkulation_a51, max(0, g_t - v_kalkulation_a51), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d52 = act_axn_k(g_x + v_kalkulation_a52, max(0, g_t - v_kalkulation_a52), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d53 = act_axn_k(g_x + v_kalkulation_a53, max(0, g_t - v_kalkulation_a53), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d54 = act_axn_k(g_x + v_kalkulation_a54, max(0, g_t - v_kalkulation_a54), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d55 = act_axn_k(g_x + v_kalkulation_a55, max(0, g_t - v_kalkulation_a55), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d56 = act_axn_k(g_x + v_kalkulation_a56, max(0, g_t - v_kalkulation_a56), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d57 = act_axn_k(g_x + v_kalkulation_a57, max(0, g_t - v_kalkulation_a57), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d58 = act_axn_k(g_x + v_kalkulation_a58, max(0, g_t - v_kalkulation_a58), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d59 = act_axn_k(g_x + v_kalkulation_a59, max(0, g_t - v_kalkulation_a59), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d60 = act_axn_k(g_x + v_kalkulation_a60, max(0, g_t - v_kalkulation_a60), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d61 = act_axn_k(g_x + v_kalkulation_a61, max(0, g_t - v_kalkulation_a61), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d62 = act_axn_k(g_x + v_kalkulation_a62, max(0, g_t - v_kalkulation_a62), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d63 = act_axn_k(g_x + v_kalkulation_a63, max(0, g_t - v_kalkulation_a63), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d64 = act_axn_k(g_x + v_kalkulation_a64, max(0, g_t - v_kalkulation_a64), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d65 = act_axn_k(g_x + v_kalkulation_a65, max(0, g_t - v_kalkulation_a65), g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_d66 = act_axn_k(g_x + v_kalkulation_a66, max(0, g_t - v_kalkulation_a66), g_sex, g_tafel, g_zins, 1)
+        col_kalkulation_d16_d66 = np.array([c_kalkulation_d16, c_kalkulation_d17, c_kalkulation_d18, c_kalkulation_d19, c_kalkulation_d20, c_kalkulation_d21, c_kalkulation_d22, c_kalkulation_d23, c_kalkulation_d24, c_kalkulation_d25, c_kalkulation_d26, c_kalkulation_d27, c_kalkulation_d28, c_kalkulation_d29, c_kalkulation_d30, c_kalkulation_d31, c_kalkulation_d32, c_kalkulation_d33, c_kalkulation_d34, c_kalkulation_d35, c_kalkulation_d36, c_kalkulation_d37, c_kalkulation_d38, c_kalkulation_d39, c_kalkulation_d40, c_kalkulation_d41, c_kalkulation_d42, c_kalkulation_d43, c_kalkulation_d44, c_kalkulation_d45, c_kalkulation_d46, c_kalkulation_d47, c_kalkulation_d48, c_kalkulation_d49, c_kalkulation_d50, c_kalkulation_d51, c_kalkulation_d52, c_kalkulation_d53, c_kalkulation_d54, c_kalkulation_d55, c_kalkulation_d56, c_kalkulation_d57, c_kalkulation_d58, c_kalkulation_d59, c_kalkulation_d60, c_kalkulation_d61, c_kalkulation_d62, c_kalkulation_d63, c_kalkulation_d64, c_kalkulation_d65, c_kalkulation_d66])
+    try:
+        col_kalkulation_e16_e66 = rows_kalkulation_e16_e66(col_kalkulation_b16_b66, col_kalkulation_d16_d66, col_kalkulation_c16_c66)
+        c_kalkulation_e16, c_kalkulation_e17, c_kalkulation_e18, c_kalkulation_e19, c_kalkulation_e20, c_kalkulation_e21, c_kalkulation_e22, c_kalkulation_e23, c_kalkulation_e24, c_kalkulation_e25, c_kalkulation_e26, c_kalkulation_e27, c_kalkulation_e28, c_kalkulation_e29, c_kalkulation_e30, c_kalkulation_e31, c_kalkulation_e32, c_kalkulation_e33, c_kalkulation_e34, c_kalkulation_e35, c_kalkulation_e36, c_kalkulation_e37, c_kalkulation_e38, c_kalkulation_e39, c_kalkulation_e40, c_kalkulation_e41, c_kalkulation_e42, c_kalkulation_e43, c_kalkulation_e44, c_kalkulation_e45, c_kalkulation_e46, c_kalkulation_e47, c_kalkulation_e48, c_kalkulation_e49, c_kalkulation_e50, c_kalkulation_e51, c_kalkulation_e52, c_kalkulation_e53, c_kalkulation_e54, c_kalkulation_e55, c_kalkulation_e56, c_kalkulation_e57, c_kalkulation_e58, c_kalkulation_e59, c_kalkulation_e60, c_kalkulation_e61, c_kalkulation_e62, c_kalkulation_e63, c_kalkulation_e64, c_kalkulation_e65, c_kalkulation_e66 = col_kalkulation_e16_e66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_e16 = c_kalkulation_b16 - c_kalkulation_k9 * c_kalkulation_d16 + g_gamma2 * (c_kalkulation_c16 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d16)
+        c_kalkulation_e17 = c_kalkulation_b17 - c_kalkulation_k9 * c_kalkulation_d17 + g_gamma2 * (c_kalkulation_c17 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d17)
+        c_kalkulation_e18 = c_kalkulation_b18 - c_kalkulation_k9 * c_kalkulation_d18 + g_gamma2 * (c_kalkulation_c18 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d18)
+        c_kalkulation_e19 = c_kalkulation_b19 - c_kalkulation_k9 * c_kalkulation_d19 + g_gamma2 * (c_kalkulation_c19 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d19)
+        c_kalkulation_e20 = c_kalkulation_b20 - c_kalkulation_k9 * c_kalkulation_d20 + g_gamma2 * (c_kalkulation_c20 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d20)
+        c_kalkulation_e21 = c_kalkulation_b21 - c_kalkulation_k9 * c_kalkulation_d21 + g_gamma2 * (c_kalkulation_c21 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d21)
+        c_kalkulation_e22 = c_kalkulation_b22 - c_kalkulation_k9 * c_kalkulation_d22 + g_gamma2 * (c_kalkulation_c22 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d22)
+        c_kalkulation_e23 = c_kalkulation_b23 - c_kalkulation_k9 * c_kalkulation_d23 + g_gamma2 * (c_kalkulation_c23 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d23)
+        c_kalkulation_e24 = c_kalkulation_b24 - c_kalkulation_k9 * c_kalkulation_d24 + g_gamma2 * (c_kalkulation_c24 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d24)
+        c_kalkulation_e25 = c_kalkulation_b25 - c_kalkulation_k9 * c_kalkulation_d25 + g_gamma2 * (c_kalkulation_c25 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d25)
+        c_kalkulation_e26 = c_kalkulation_b26 - c_kalkulation_k9 * c_kalkulation_d26 + g_gamma2 * (c_kalkulation_c26 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d26)
+        c_kalkulation_e27 = c_kalkulation_b27 - c_kalkulation_k9 * c_kalkulation_d27 + g_gamma2 * (c_kalkulation_c27 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d27)
+        c_kalkulation_e28 = c_kalkulation_b28 - c_kalkulation_k9 * c_kalkulation_d28 + g_gamma2 * (c_kalkulation_c28 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d28)
+        c_kalkulation_e29 = c_kalkulation_b29 - c_kalkulation_k9 * c_kalkulation_d29 + g_gamma2 * (c_kalkulation_c29 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d29)
+        c_kalkulation_e30 = c_kalkulation_b30 - c_kalkulation_k9 * c_kalkulation_d30 + g_gamma2 * (c_kalkulation_c30 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d30)
+        c_kalkulation_e31 = c_kalkulation_b31 - c_kalkulation_k9 * c_kalkulation_d31 + g_gamma2 * (c_kalkulation_c31 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d31)
+        c_kalkulation_e32 = c_kalkulation_b32 - c_kalkulation_k9 * c_kalkulation_d32 + g_gamma2 * (c_kalkulation_c32 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d32)
+        c_kalkulation_e33 = c_kalkulation_b33 - c_kalkulation_k9 * c_kalkulation_d33 + g_gamma2 * (c_kalkulation_c33 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d33)
+        c_kalkulation_e34 = c_kalkulation_b34 - c_kalkulation_k9 * c_kalkulation_d34 + g_gamma2 * (c_kalkulation_c34 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d34)
+        c_kalkulation_e35 = c_kalkulation_b35 - c_kalkulation_k9 * c_kalkulation_d35 + g_gamma2 * (c_kalkulation_c35 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d35)
+        c_kalkulation_e36 = c_kalkulation_b36 - c_kalkulation_k9 * c_kalkulation_d36 + g_gamma2 * (c_kalkulation_c36 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d36)
+        c_kalkulation_e37 = c_kalkulation_b37 - c_kalkulation_k9 * c_kalkulation_d37 + g_gamma2 * (c_kalkulation_c37 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d37)
+        c_kalkulation_e38 = c_kalkulation_b38 - c_kalkulation_k9 * c_kalkulation_d38 + g_gamma2 * (c_kalkulation_c38 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d38)
+        c_kalkulation_e39 = c_kalkulation_b39 - c_kalkulation_k9 * c_kalkulation_d39 + g_gamma2 * (c_kalkulation_c39 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d39)
+        c_kalkulation_e40 = c_kalkulation_b40 - c_kalkulation_k9 * c_kalkulation_d40 + g_gamma2 * (c_kalkulation_c40 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d40)
+        c_kalkulation_e41 = c_kalkulation_b41 - c_kalkulation_k9 * c_kalkulation_d41 + g_gamma2 * (c_kalkulation_c41 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d41)
+        c_kalkulation_e42 = c_kalkulation_b42 - c_kalkulation_k9 * c_kalkulation_d42 + g_gamma2 * (c_kalkulation_c42 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d42)
+        c_kalkulation_e43 = c_kalkulation_b43 - c_kalkulation_k9 * c_kalkulation_d43 + g_gamma2 * (c_kalkulation_c43 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d43)
+        c_kalkulation_e44 = c_kalkulation_b44 - c_kalkulation_k9 * c_kalkulation_d44 + g_gamma2 * (c_kalkulation_c44 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d44)
+        c_kalkulation_e45 = c_kalkulation_b45 - c_kalkulation_k9 * c_kalkulation_d45 + g_gamma2 * (c_kalkulation_c45 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d45)
+        c_kalkulation_e46 = c_kalkulation_b46 - c_kalkulation_k9 * c_kalkulation_d46 + g_gamma2 * (c_kalkulation_c46 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d46)
+        c_kalkulation_e47 = c_kalkulation_b47 - c_kalkulation_k9 * c_kalkulation_d47 + g_gamma2 * (c_kalkulation_c47 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d47)
+        c_kalkulation_e48 = c_kalkulation_b48 - c_kalkulation_k9 * c_kalkulation_d48 + g_gamma2 * (c_kalkulation_c48 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d48)
+        c_kalkulation_e49 = c_kalkulation_b49 - c_kalkulation_k9 * c_kalkulation_d49 + g_gamma2 * (c_kalkulation_c49 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d49)
+        c_kalkulation_e50 = c_kalkulation_b50 - c_kalkulation_k9 * c_kalkulation_d50 + g_gamma2 * (c_kalkulation_c50 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d50)
+        c_kalkulation_e51 = c_kalkulation_b51 - c_kalkulation_k9 * c_kalkulation_d51 + g_gamma2 * (c_kalkulation_c51 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d51)
+        c_kalkulation_e52 = c_kalkulation_b52 - c_kalkulation_k9 * c_kalkulation_d52 + g_gamma2 * (c_kalkulation_c52 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d52)
+        c_kalkulation_e53 = c_kalkulation_b53 - c_kalkulation_k9 * c_kalkulation_d53 + g_gamma2 * (c_kalkulation_c53 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d53)
+        c_kalkulation_e54 = c_kalkulation_b54 - c_kalkulation_k9 * c_kalkulation_d54 + g_gamma2 * (c_kalkulation_c54 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d54)
+        c_kalkulation_e55 = c_kalkulation_b55 - c_kalkulation_k9 * c_kalkulation_d55 + g_gamma2 * (c_kalkulation_c55 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d55)
+        c_kalkulation_e56 = c_kalkulation_b56 - c_kalkulation_k9 * c_kalkulation_d56 + g_gamma2 * (c_kalkulation_c56 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d56)
+        c_kalkulation_e57 = c_kalkulation_b57 - c_kalkulation_k9 * c_kalkulation_d57 + g_gamma2 * (c_kalkulation_c57 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d57)
+        c_kalkulation_e58 = c_kalkulation_b58 - c_kalkulation_k9 * c_kalkulation_d58 + g_gamma2 * (c_kalkulation_c58 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d58)
+        c_kalkulation_e59 = c_kalkulation_b59 - c_kalkulation_k9 * c_kalkulation_d59 + g_gamma2 * (c_kalkulation_c59 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d59)
+        c_kalkulation_e60 = c_kalkulation_b60 - c_kalkulation_k9 * c_kalkulation_d60 + g_gamma2 * (c_kalkulation_c60 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d60)
+        c_kalkulation_e61 = c_kalkulation_b61 - c_kalkulation_k9 * c_kalkulation_d61 + g_gamma2 * (c_kalkulation_c61 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d61)
+        c_kalkulation_e62 = c_kalkulation_b62 - c_kalkulation_k9 * c_kalkulation_d62 + g_gamma2 * (c_kalkulation_c62 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d62)
+        c_kalkulation_e63 = c_kalkulation_b63 - c_kalkulation_k9 * c_kalkulation_d63 + g_gamma2 * (c_kalkulation_c63 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d63)
+        c_kalkulation_e64 = c_kalkulation_b64 - c_kalkulation_k9 * c_kalkulation_d64 + g_gamma2 * (c_kalkulation_c64 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d64)
+        c_kalkulation_e65 = c_kalkulation_b65 - c_kalkulation_k9 * c_kalkulation_d65 + g_gamma2 * (c_kalkulation_c65 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d65)
+        c_kalkulation_e66 = c_kalkulation_b66 - c_kalkulation_k9 * c_kalkulation_d66 + g_gamma2 * (c_kalkulation_c66 - act_axn_k(g_x, g_n, g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, g_t, g_sex, g_tafel, g_zins, 1) * c_kalkulation_d66)
+        col_kalkulation_e16_e66 = np.array([c_kalkulation_e16, c_kalkulation_e17, c_kalkulation_e18, c_kalkulation_e19, c_kalkulation_e20, c_kalkulation_e21, c_kalkulation_e22, c_kalkulation_e23, c_kalkulation_e24, c_kalkulation_e25, c_kalkulation_e26, c_kalkulation_e27, c_kalkulation_e28, c_kalkulation_e29, c_kalkulation_e30, c_kalkulation_e31, c_kalkulation_e32, c_kalkulation_e33, c_kalkulation_e34, c_kalkulation_e35, c_kalkulation_e36, c_kalkulation_e37, c_kalkulation_e38, c_kalkulation_e39, c_kalkulation_e40, c_kalkulation_e41, c_kalkulation_e42, c_kalkulation_e43, c_kalkulation_e44, c_kalkulation_e45, c_kalkulation_e46, c_kalkulation_e47, c_kalkulation_e48, c_kalkulation_e49, c_kalkulation_e50, c_kalkulation_e51, c_kalkulation_e52, c_kalkulation_e53, c_kalkulation_e54, c_kalkulation_e55, c_kalkulation_e56, c_kalkulation_e57, c_kalkulation_e58, c_kalkulation_e59, c_kalkulation_e60, c_kalkulation_e61, c_kalkulation_e62, c_kalkulation_e63, c_kalkulation_e64, c_kalkulation_e65, c_kalkulation_e66])
+    try:
+        col_kalkulation_f16_f66 = rows_kalkulation_f16_f66(col_kalkulation_e16_e66)
+        c_kalkulation_f16, c_kalkulation_f17, c_kalkulation_f18, c_kalkulation_f19, c_kalkulation_f20, c_kalkulation_f21, c_kalkulation_f22, c_kalkulation_f23, c_kalkulation_f24, c_kalkulation_f25, c_kalkulation_f26, c_kalkulation_f27, c_kalkulation_f28, c_kalkulation_f29, c_kalkulation_f30, c_kalkulation_f31, c_kalkulation_f32, c_kalkulation_f33, c_kalkulation_f34, c_kalkulation_f35, c_kalkulation_f36, c_kalkulation_f37, c_kalkulation_f38, c_kalkulation_f39, c_kalkulation_f40, c_kalkulation_f41, c_kalkulation_f42, c_kalkulation_f43, c_kalkulation_f44, c_kalkulation_f45, c_kalkulation_f46, c_kalkulation_f47, c_kalkulation_f48, c_kalkulation_f49, c_kalkulation_f50, c_kalkulation_f51, c_kalkulation_f52, c_kalkulation_f53, c_kalkulation_f54, c_kalkulation_f55, c_kalkulation_f56, c_kalkulation_f57, c_kalkulation_f58, c_kalkulation_f59, c_kalkulation_f60, c_kalkulation_f61, c_kalkulation_f62, c_kalkulation_f63, c_kalkulation_f64, c_kalkulation_f65, c_kalkulation_f66 = col_kalkulation_f16_f66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_f16 = g_vs * c_kalkulation_e16
+        c_kalkulation_f17 = g_vs * c_kalkulation_e17
+        c_kalkulation_f18 = g_vs * c_kalkulation_e18
+        c_kalkulation_f19 = g_vs * c_kalkulation_e19
+        c_kalkulation_f20 = g_vs * c_kalkulation_e20
+        c_kalkulation_f21 = g_vs * c_kalkulation_e21
+        c_kalkulation_f22 = g_vs * c_kalkulation_e22
+        c_kalkulation_f23 = g_vs * c_kalkulation_e23
+        c_kalkulation_f24 = g_vs * c_kalkulation_e24
+        c_kalkulation_f25 = g_vs * c_kalkulation_e25
+        c_kalkulation_f26 = g_vs * c_kalkulation_e26
+        c_kalkulation_f27 = g_vs * c_kalkulation_e27
+        c_kalkulation_f28 = g_vs * c_kalkulation_e28
+        c_kalkulation_f29 = g_vs * c_kalkulation_e29
+        c_kalkulation_f30 = g_vs * c_kalkulation_e30
+        c_kalkulation_f31 = g_vs * c_kalkulation_e31
+        c_kalkulation_f32 = g_vs * c_kalkulation_e32
+        c_kalkulation_f33 = g_vs * c_kalkulation_e33
+        c_kalkulation_f34 = g_vs * c_kalkulation_e34
+        c_kalkulation_f35 = g_vs * c_kalkulation_e35
+        c_kalkulation_f36 = g_vs * c_kalkulation_e36
+        c_kalkulation_f37 = g_vs * c_kalkulation_e37
+        c_kalkulation_f38 = g_vs * c_kalkulation_e38
+        c_kalkulation_f39 = g_vs * c_kalkulation_e39
+        c_kalkulation_f40 = g_vs * c_kalkulation_e40
+        c_kalkulation_f41 = g_vs * c_kalkulation_e41
+        c_kalkulation_f42 = g_vs * c_kalkulation_e42
+        c_kalkulation_f43 = g_vs * c_kalkulation_e43
+        c_kalkulation_f44 = g_vs * c_kalkulation_e44
+        c_kalkulation_f45 = g_vs * c_kalkulation_e45
+        c_kalkulation_f46 = g_vs * c_kalkulation_e46
+        c_kalkulation_f47 = g_vs * c_kalkulation_e47
+        c_kalkulation_f48 = g_vs * c_kalkulation_e48
+        c_kalkulation_f49 = g_vs * c_kalkulation_e49
+        c_kalkulation_f50 = g_vs * c_kalkulation_e50
+        c_kalkulation_f51 = g_vs * c_kalkulation_e51
+        c_kalkulation_f52 = g_vs * c_kalkulation_e52
+        c_kalkulation_f53 = g_vs * c_kalkulation_e53
+        c_kalkulation_f54 = g_vs * c_kalkulation_e54
+        c_kalkulation_f55 = g_vs * c_kalkulation_e55
+        c_kalkulation_f56 = g_vs * c_kalkulation_e56
+        c_kalkulation_f57 = g_vs * c_kalkulation_e57
+        c_kalkulation_f58 = g_vs * c_kalkulation_e58
+        c_kalkulation_f59 = g_vs * c_kalkulation_e59
+        c_kalkulation_f60 = g_vs * c_kalkulation_e60
+        c_kalkulation_f61 = g_vs * c_kalkulation_e61
+        c_kalkulation_f62 = g_vs * c_kalkulation_e62
+        c_kalkulation_f63 = g_vs * c_kalkulation_e63
+        c_kalkulation_f64 = g_vs * c_kalkulation_e64
+        c_kalkulation_f65 = g_vs * c_kalkulation_e65
+        c_kalkulation_f66 = g_vs * c_kalkulation_e66
+        col_kalkulation_f16_f66 = np.array([c_kalkulation_f16, c_kalkulation_f17, c_kalkulation_f18, c_kalkulation_f19, c_kalkulation_f20, c_kalkulation_f21, c_kalkulation_f22, c_kalkulation_f23, c_kalkulation_f24, c_kalkulation_f25, c_kalkulation_f26, c_kalkulation_f27, c_kalkulation_f28, c_kalkulation_f29, c_kalkulation_f30, c_kalkulation_f31, c_kalkulation_f32, c_kalkulation_f33, c_kalkulation_f34, c_kalkulation_f35, c_kalkulation_f36, c_kalkulation_f37, c_kalkulation_f38, c_kalkulation_f39, c_kalkulation_f40, c_kalkulation_f41, c_kalkulation_f42, c_kalkulation_f43, c_kalkulation_f44, c_kalkulation_f45, c_kalkulation_f46, c_kalkulation_f47, c_kalkulation_f48, c_kalkulation_f49, c_kalkulation_f50, c_kalkulation_f51, c_kalkulation_f52, c_kalkulation_f53, c_kalkulation_f54, c_kalkulation_f55, c_kalkulation_f56, c_kalkulation_f57, c_kalkulation_f58, c_kalkulation_f59, c_kalkulation_f60, c_kalkulation_f61, c_kalkulation_f62, c_kalkulation_f63, c_kalkulation_f64, c_kalkulation_f65, c_kalkulation_f66])
+    try:
+        col_kalkulation_g16_g66 = rows_kalkulation_g16_g66(col_kalkulation_b16_b66, col_kalkulation_c16_c66)
+        c_kalkulation_g16, c_kalkulation_g17, c_kalkulation_g18, c_kalkulation_g19, c_kalkulation_g20, c_kalkulation_g21, c_kalkulation_g22, c_kalkulation_g23, c_kalkulation_g24, c_kalkulation_g25, c_kalkulation_g26, c_kalkulation_g27, c_kalkulation_g28, c_kalkulation_g29, c_kalkulation_g30, c_kalkulation_g31, c_kalkulation_g32, c_kalkulation_g33, c_kalkulation_g34, c_kalkulation_g35, c_kalkulation_g36, c_kalkulation_g37, c_kalkulation_g38, c_kalkulation_g39, c_kalkulation_g40, c_kalkulation_g41, c_kalkulation_g42, c_kalkulation_g43, c_kalkulation_g44, c_kalkulation_g45, c_kalkulation_g46, c_kalkulation_g47, c_kalkulation_g48, c_kalkulation_g49, c_kalkulation_g50, c_kalkulation_g51, c_kalkulation_g52, c_kalkulation_g53, c_kalkulation_g54, c_kalkulation_g55, c_kalkulation_g56, c_kalkulation_g57, c_kalkulation_g58, c_kalkulation_g59, c_kalkulation_g60, c_kalkulation_g61, c_kalkulation_g62, c_kalkulation_g63, c_kalkulation_g64, c_kalkulation_g65, c_kalkulation_g66 = col_kalkulation_g16_g66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_g16 = c_kalkulation_b16 + g_gamma3 * c_kalkulation_c16
+        c_kalkulation_g17 = c_kalkulation_b17 + g_gamma3 * c_kalkulation_c17
+        c_kalkulation_g18 = c_kalkulation_b18 + g_gamma3 * c_kalkulation_c18
+        c_kalkulation_g19 = c_kalkulation_b19 + g_gamma3 * c_kalkulation_c19
+        c_kalkulation_g20 = c_kalkulation_b20 + g_gamma3 * c_kalkulation_c20
+        c_kalkulation_g21 = c_kalkulation_b21 + g_gamma3 * c_kalkulation_c21
+        c_kalkulation_g22 = c_kalkulation_b22 + g_gamma3 * c_kalkulation_c22
+        c_kalkulation_g23 = c_kalkulation_b23 + g_gamma3 * c_kalkulation_c23
+        c_kalkulation_g24 = c_kalkulation_b24 + g_gamma3 * c_kalkulation_c24
+        c_kalkulation_g25 = c_kalkulation_b25 + g_gamma3 * c_kalkulation_c25
+        c_kalkulation_g26 = c_kalkulation_b26 + g_gamma3 * c_kalkulation_c26
+        c_kalkulation_g27 = c_kalkulation_b27 + g_gamma3 * c_kalkulation_c27
+        c_kalkulation_g28 = c_kalkulation_b28 + g_gamma3 * c_kalkulation_c28
+        c_kalkulation_g29 = c_kalkulation_b29 + g_gamma3 * c_kalkulation_c29
+        c_kalkulation_g30 = c_kalkulation_b30 + g_gamma3 * c_kalkulation_c30
+        c_kalkulation_g31 = c_kalkulation_b31 + g_gamma3 * c_kalkulation_c31
+        c_kalkulation_g32 = c_kalkulation_b32 + g_gamma3 * c_kalkulation_c32
+        c_kalkulation_g33 = c_kalkulation_b33 + g_gamma3 * c_kalkulation_c33
+        c_kalkulation_g34 = c_kalkulation_b34 + g_gamma3 * c_kalkulation_c34
+        c_kalkulation_g35 = c_kalkulation_b35 + g_gamma3 * c_kalkulation_c35
+        c_kalkulation_g36 = c_kalkulation_b36 + g_gamma3 * c_kalkulation_c36
+        c_kalkulation_g37 = c_kalkulation_b37 + g_gamma3 * c_kalkulation_c37
+        c_kalkulation_g38 = c_kalkulation_b38 + g_gamma3 * c_kalkulation_c38
+        c_kalkulation_g39 = c_kalkulation_b39 + g_gamma3 * c_kalkulation_c39
+        c_kalkulation_g40 = c_kalkulation_b40 + g_gamma3 * c_kalkulation_c40
+        c_kalkulation_g41 = c_kalkulation_b41 + g_gamma3 * c_kalkulation_c41
+        c_kalkulation_g42 = c_kalkulation_b42 + g_gamma3 * c_kalkulation_c42
+        c_kalkulation_g43 = c_kalkulation_b43 + g_gamma3 * c_kalkulation_c43
+        c_kalkulation_g44 = c_kalkulation_b44 + g_gamma3 * c_kalkulation_c44
+        c_kalkulation_g45 = c_kalkulation_b45 + g_gamma3 * c_kalkulation_c45
+        c_kalkulation_g46 = c_kalkulation_b46 + g_gamma3 * c_kalkulation_c46
+        c_kalkulation_g47 = c_kalkulation_b47 + g_gamma3 * c_kalkulation_c47
+        c_kalkulation_g48 = c_kalkulation_b48 + g_gamma3 * c_kalkulation_c48
+        c_kalkulation_g49 = c_kalkulation_b49 + g_gamma3 * c_kalkulation_c49
+        c_kalkulation_g50 = c_kalkulation_b50 + g_gamma3 * c_kalkulation_c50
+        c_kalkulation_g51 = c_kalkulation_b51 + g_gamma3 * c_kalkulation_c51
+        c_kalkulation_g52 = c_kalkulation_b52 + g_gamma3 * c_kalkulation_c52
+        c_kalkulation_g53 = c_kalkulation_b53 + g_gamma3 * c_kalkulation_c53
+        c_kalkulation_g54 = c_kalkulation_b54 + g_gamma3 * c_kalkulation_c54
+        c_kalkulation_g55 = c_kalkulation_b55 + g_gamma3 * c_kalkulation_c55
+        c_kalkulation_g56 = c_kalkulation_b56 + g_gamma3 * c_kalkulation_c56
+        c_kalkulation_g57 = c_kalkulation_b57 + g_gamma3 * c_kalkulation_c57
+        c_kalkulation_g58 = c_kalkulation_b58 + g_gamma3 * c_kalkulation_c58
+        c_kalkulation_g59 = c_kalkulation_b59 + g_gamma3 * c_kalkulation_c59
+        c_kalkulation_g60 = c_kalkulation_b60 + g_gamma3 * c_kalkulation_c60
+        c_kalkulation_g61 = c_kalkulation_b61 + g_gamma3 * c_kalkulation_c61
+        c_kalkulation_g62 = c_kalkulation_b62 + g_gamma3 * c_kalkulation_c62
+        c_kalkulation_g63 = c_kalkulation_b63 + g_gamma3 * c_kalkulation_c63
+        c_kalkulation_g64 = c_kalkulation_b64 + g_gamma3 * c_kalkulation_c64
+        c_kalkulation_g65 = c_kalkulation_b65 + g_gamma3 * c_kalkulation_c65
+        c_kalkulation_g66 = c_kalkulation_b66 + g_gamma3 * c_kalkulation_c66
+        col_kalkulation_g16_g66 = np.array([c_kalkulation_g16, c_kalkulation_g17, c_kalkulation_g18, c_kalkulation_g19, c_kalkulation_g20, c_kalkulation_g21, c_kalkulation_g22, c_kalkulation_g23, c_kalkulation_g24, c_kalkulation_g25, c_kalkulation_g26, c_kalkulation_g27, c_kalkulation_g28, c_kalkulation_g29, c_kalkulation_g30, c_kalkulation_g31, c_kalkulation_g32, c_kalkulation_g33, c_kalkulation_g34, c_kalkulation_g35, c_kalkulation_g36, c_kalkulation_g37, c_kalkulation_g38, c_kalkulation_g39, c_kalkulation_g40, c_kalkulation_g41, c_kalkulation_g42, c_kalkulation_g43, c_kalkulation_g44, c_kalkulation_g45, c_kalkulation_g46, c_kalkulation_g47, c_kalkulation_g48, c_kalkulation_g49, c_kalkulation_g50, c_kalkulation_g51, c_kalkulation_g52, c_kalkulation_g53, c_kalkulation_g54, c_kalkulation_g55, c_kalkulation_g56, c_kalkulation_g57, c_kalkulation_g58, c_kalkulation_g59, c_kalkulation_g60, c_kalkulation_g61, c_kalkulation_g62, c_kalkulation_g63, c_kalkulation_g64, c_kalkulation_g65, c_kalkulation_g66])
+    try:
+        col_kalkulation_h16_h66 = rows_kalkulation_h16_h66(col_kalkulation_f16_f66, np.array([v_kalkulation_a16, v_kalkulation_a17, v_kalkulation_a18, v_kalkulation_a19, v_kalkulation_a20, v_kalkulation_a21, v_kalkulation_a22, v_kalkulation_a23, v_kalkulation_a24, v_kalkulation_a25, v_kalkulation_a26, v_kalkulation_a27, v_kalkulation_a28, v_kalkulation_a29, v_kalkulation_a30, v_kalkulation_a31, v_kalkulation_a32, v_kalkulation_a33, v_kalkulation_a34, v_kalkulation_a35, v_kalkulation_a36, v_kalkulation_a37, v_kalkulation_a38, v_kalkulation_a39, v_kalkulation_a40, v_kalkulation_a41, v_kalkulation_a42, v_kalkulation_a43, v_kalkulation_a44, v_kalkulation_a45, v_kalkulation_a46, v_kalkulation_a47, v_kalkulation_a48, v_kalkulation_a49, v_kalkulation_a50, v_kalkulation_a51, v_kalkulation_a52, v_kalkulation_a53, v_kalkulation_a54, v_kalkulation_a55, v_kalkulation_a56, v_kalkulation_a57, v_kalkulation_a58, v_kalkulation_a59, v_kalkulation_a60, v_kalkulation_a61, v_kalkulation_a62, v_kalkulation_a63, v_kalkulation_a64, v_kalkulation_a65, v_kalkulation_a66]))
+        c_kalkulation_h16, c_kalkulation_h17, c_kalkulation_h18, c_kalkulation_h19, c_kalkulation_h20, c_kalkulation_h21, c_kalkulation_h22, c_kalkulation_h23, c_kalkulation_h24, c_kalkulation_h25, c_kalkulation_h26, c_kalkulation_h27, c_kalkulation_h28, c_kalkulation_h29, c_kalkulation_h30, c_kalkulation_h31, c_kalkulation_h32, c_kalkulation_h33, c_kalkulation_h34, c_kalkulation_h35, c_kalkulation_h36, c_kalkulation_h37, c_kalkulation_h38, c_kalkulation_h39, c_kalkulation_h40, c_kalkulation_h41, c_kalkulation_h42, c_kalkulation_h43, c_kalkulation_h44, c_kalkulation_h45, c_kalkulation_h46, c_kalkulation_h47, c_kalkulation_h48, c_kalkulation_h49, c_kalkulation_h50, c_kalkulation_h51, c_kalkulation_h52, c_kalkulation_h53, c_kalkulation_h54, c_kalkulation_h55, c_kalkulation_h56, c_kalkulation_h57, c_kalkulation_h58, c_kalkulation_h59, c_kalkulation_h60, c_kalkulation_h61, c_kalkulation_h62, c_kalkulation_h63, c_kalkulation_h64, c_kalkulation_h65, c_kalkulation_h66 = col_kalkulation_h16_h66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_h16 = c_kalkulation_f16 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a16, max(5 - v_kalkulation_a16, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h17 = c_kalkulation_f17 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a17, max(5 - v_kalkulation_a17, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h18 = c_kalkulation_f18 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a18, max(5 - v_kalkulation_a18, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h19 = c_kalkulation_f19 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a19, max(5 - v_kalkulation_a19, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h20 = c_kalkulation_f20 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a20, max(5 - v_kalkulation_a20, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h21 = c_kalkulation_f21 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a21, max(5 - v_kalkulation_a21, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h22 = c_kalkulation_f22 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a22, max(5 - v_kalkulation_a22, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h23 = c_kalkulation_f23 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a23, max(5 - v_kalkulation_a23, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h24 = c_kalkulation_f24 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a24, max(5 - v_kalkulation_a24, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h25 = c_kalkulation_f25 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a25, max(5 - v_kalkulation_a25, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h26 = c_kalkulation_f26 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a26, max(5 - v_kalkulation_a26, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h27 = c_kalkulation_f27 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a27, max(5 - v_kalkulation_a27, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h28 = c_kalkulation_f28 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a28, max(5 - v_kalkulation_a28, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h29 = c_kalkulation_f29 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a29, max(5 - v_kalkulation_a29, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h30 = c_kalkulation_f30 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a30, max(5 - v_kalkulation_a30, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h31 = c_kalkulation_f31 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a31, max(5 - v_kalkulation_a31, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h32 = c_kalkulation_f32 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a32, max(5 - v_kalkulation_a32, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h33 = c_kalkulation_f33 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a33, max(5 - v_kalkulation_a33, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h34 = c_kalkulation_f34 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a34, max(5 - v_kalkulation_a34, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h35 = c_kalkulation_f35 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a35, max(5 - v_kalkulation_a35, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h36 = c_kalkulation_f36 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a36, max(5 - v_kalkulation_a36, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h37 = c_kalkulation_f37 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a37, max(5 - v_kalkulation_a37, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h38 = c_kalkulation_f38 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a38, max(5 - v_kalkulation_a38, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h39 = c_kalkulation_f39 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a39, max(5 - v_kalkulation_a39, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h40 = c_kalkulation_f40 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a40, max(5 - v_kalkulation_a40, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h41 = c_kalkulation_f41 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a41, max(5 - v_kalkulation_a41, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h42 = c_kalkulation_f42 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a42, max(5 - v_kalkulation_a42, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h43 = c_kalkulation_f43 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a43, max(5 - v_kalkulation_a43, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h44 = c_kalkulation_f44 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a44, max(5 - v_kalkulation_a44, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h45 = c_kalkulation_f45 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a45, max(5 - v_kalkulation_a45, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h46 = c_kalkulation_f46 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a46, max(5 - v_kalkulation_a46, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h47 = c_kalkulation_f47 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a47, max(5 - v_kalkulation_a47, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h48 = c_kalkulation_f48 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a48, max(5 - v_kalkulation_a48, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h49 = c_kalkulation_f49 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a49, max(5 - v_kalkulation_a49, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h50 = c_kalkulation_f50 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a50, max(5 - v_kalkulation_a50, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h51 = c_kalkulation_f51 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a51, max(5 - v_kalkulation_a51, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h52 = c_kalkulation_f52 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a52, max(5 - v_kalkulation_a52, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h53 = c_kalkulation_f53 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a53, max(5 - v_kalkulation_a53, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h54 = c_kalkulation_f54 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a54, max(5 - v_kalkulation_a54, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h55 = c_kalkulation_f55 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a55, max(5 - v_kalkulation_a55, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h56 = c_kalkulation_f56 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a56, max(5 - v_kalkulation_a56, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h57 = c_kalkulation_f57 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a57, max(5 - v_kalkulation_a57, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h58 = c_kalkulation_f58 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a58, max(5 - v_kalkulation_a58, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h59 = c_kalkulation_f59 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a59, max(5 - v_kalkulation_a59, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h60 = c_kalkulation_f60 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a60, max(5 - v_kalkulation_a60, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h61 = c_kalkulation_f61 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a61, max(5 - v_kalkulation_a61, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h62 = c_kalkulation_f62 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a62, max(5 - v_kalkulation_a62, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h63 = c_kalkulation_f63 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a63, max(5 - v_kalkulation_a63, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h64 = c_kalkulation_f64 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a64, max(5 - v_kalkulation_a64, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h65 = c_kalkulation_f65 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a65, max(5 - v_kalkulation_a65, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        c_kalkulation_h66 = c_kalkulation_f66 + g_alpha * g_t * c_kalkulation_k6 * act_axn_k(g_x + v_kalkulation_a66, max(5 - v_kalkulation_a66, 0), g_sex, g_tafel, g_zins, 1) / act_axn_k(g_x, 5, g_sex, g_tafel, g_zins, 1)
+        col_kalkulation_h16_h66 = np.array([c_kalkulation_h16, c_kalkulation_h17, c_kalkulation_h18, c_kalkulation_h19, c_kalkulation_h20, c_kalkulation_h21, c_kalkulation_h22, c_kalkulation_h23, c_kalkulation_h24, c_kalkulation_h25, c_kalkulation_h26, c_kalkulation_h27, c_kalkulation_h28, c_kalkulation_h29, c_kalkulation_h30, c_kalkulation_h31, c_kalkulation_h32, c_kalkulation_h33, c_kalkulation_h34, c_kalkulation_h35, c_kalkulation_h36, c_kalkulation_h37, c_kalkulation_h38, c_kalkulation_h39, c_kalkulation_h40, c_kalkulation_h41, c_kalkulation_h42, c_kalkulation_h43, c_kalkulation_h44, c_kalkulation_h45, c_kalkulation_h46, c_kalkulation_h47, c_kalkulation_h48, c_kalkulation_h49, c_kalkulation_h50, c_kalkulation_h51, c_kalkulation_h52, c_kalkulation_h53, c_kalkulation_h54, c_kalkulation_h55, c_kalkulation_h56, c_kalkulation_h57, c_kalkulation_h58, c_kalkulation_h59, c_kalkulation_h60, c_kalkulation_h61, c_kalkulation_h62, c_kalkulation_h63, c_kalkulation_h64, c_kalkulation_h65, c_kalkulation_h66])
+    try:
+        col_kalkulation_i16_i66 = rows_kalkulation_i16_i66(np.array([v_kalkulation_a16, v_kalkulation_a17, v_kalkulation_a18, v_kalkulation_a19, v_kalkulation_a20, v_kalkulation_a21, v_kalkulation_a22, v_kalkulation_a23, v_kalkulation_a24, v_kalkulation_a25, v_kalkulation_a26, v_kalkulation_a27, v_kalkulation_a28, v_kalkulation_a29, v_kalkulation_a30, v_kalkulation_a31, v_kalkulation_a32, v_kalkulation_a33, v_kalkulation_a34, v_kalkulation_a35, v_kalkulation_a36, v_kalkulation_a37, v_kalkulation_a38, v_kalkulation_a39, v_kalkulation_a40, v_kalkulation_a41, v_kalkulation_a42, v_kalkulation_a43, v_kalkulation_a44, v_kalkulation_a45, v_kalkulation_a46, v_kalkulation_a47, v_kalkulation_a48, v_kalkulation_a49, v_kalkulation_a50, v_kalkulation_a51, v_kalkulation_a52, v_kalkulation_a53, v_kalkulation_a54, v_kalkulation_a55, v_kalkulation_a56, v_kalkulation_a57, v_kalkulation_a58, v_kalkulation_a59, v_kalkulation_a60, v_kalkulation_a61, v_kalkulation_a62, v_kalkulation_a63, v_kalkulation_a64, v_kalkulation_a65, v_kalkulation_a66]))
+        c_kalkulation_i16, c_kalkulation_i17, c_kalkulation_i18, c_kalkulation_i19, c_kalkulation_i20, c_kalkulation_i21, c_kalkulation_i22, c_kalkulation_i23, c_kalkulation_i24, c_kalkulation_i25, c_kalkulation_i26, c_kalkulation_i27, c_kalkulation_i28, c_kalkulation_i29, c_kalkulation_i30, c_kalkulation_i31, c_kalkulation_i32, c_kalkulation_i33, c_kalkulation_i34, c_kalkulation_i35, c_kalkulation_i36, c_kalkulation_i37, c_kalkulation_i38, c_kalkulation_i39, c_kalkulation_i40, c_kalkulation_i41, c_kalkulation_i42, c_kalkulation_i43, c_kalkulation_i44, c_kalkulation_i45, c_kalkulation_i46, c_kalkulation_i47, c_kalkulation_i48, c_kalkulation_i49, c_kalkulation_i50, c_kalkulation_i51, c_kalkulation_i52, c_kalkulation_i53, c_kalkulation_i54, c_kalkulation_i55, c_kalkulation_i56, c_kalkulation_i57, c_kalkulation_i58, c_kalkulation_i59, c_kalkulation_i60, c_kalkulation_i61, c_kalkulation_i62, c_kalkulation_i63, c_kalkulation_i64, c_kalkulation_i65, c_kalkulation_i66 = col_kalkulation_i16_i66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_i16 = 1 if all((g_x + v_kalkulation_a16 >= g_minalterflex, v_kalkulation_a16 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i17 = 1 if all((g_x + v_kalkulation_a17 >= g_minalterflex, v_kalkulation_a17 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i18 = 1 if all((g_x + v_kalkulation_a18 >= g_minalterflex, v_kalkulation_a18 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i19 = 1 if all((g_x + v_kalkulation_a19 >= g_minalterflex, v_kalkulation_a19 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i20 = 1 if all((g_x + v_kalkulation_a20 >= g_minalterflex, v_kalkulation_a20 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i21 = 1 if all((g_x + v_kalkulation_a21 >= g_minalterflex, v_kalkulation_a21 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i22 = 1 if all((g_x + v_kalkulation_a22 >= g_minalterflex, v_kalkulation_a22 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i23 = 1 if all((g_x + v_kalkulation_a23 >= g_minalterflex, v_kalkulation_a23 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i24 = 1 if all((g_x + v_kalkulation_a24 >= g_minalterflex, v_kalkulation_a24 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i25 = 1 if all((g_x + v_kalkulation_a25 >= g_minalterflex, v_kalkulation_a25 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i26 = 1 if all((g_x + v_kalkulation_a26 >= g_minalterflex, v_kalkulation_a26 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i27 = 1 if all((g_x + v_kalkulation_a27 >= g_minalterflex, v_kalkulation_a27 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i28 = 1 if all((g_x + v_kalkulation_a28 >= g_minalterflex, v_kalkulation_a28 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i29 = 1 if all((g_x + v_kalkulation_a29 >= g_minalterflex, v_kalkulation_a29 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i30 = 1 if all((g_x + v_kalkulation_a30 >= g_minalterflex, v_kalkulation_a30 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i31 = 1 if all((g_x + v_kalkulation_a31 >= g_minalterflex, v_kalkulation_a31 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i32 = 1 if all((g_x + v_kalkulation_a32 >= g_minalterflex, v_kalkulation_a32 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i33 = 1 if all((g_x + v_kalkulation_a33 >= g_minalterflex, v_kalkulation_a33 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i34 = 1 if all((g_x + v_kalkulation_a34 >= g_minalterflex, v_kalkulation_a34 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i35 = 1 if all((g_x + v_kalkulation_a35 >= g_minalterflex, v_kalkulation_a35 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i36 = 1 if all((g_x + v_kalkulation_a36 >= g_minalterflex, v_kalkulation_a36 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i37 = 1 if all((g_x + v_kalkulation_a37 >= g_minalterflex, v_kalkulation_a37 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i38 = 1 if all((g_x + v_kalkulation_a38 >= g_minalterflex, v_kalkulation_a38 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i39 = 1 if all((g_x + v_kalkulation_a39 >= g_minalterflex, v_kalkulation_a39 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i40 = 1 if all((g_x + v_kalkulation_a40 >= g_minalterflex, v_kalkulation_a40 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i41 = 1 if all((g_x + v_kalkulation_a41 >= g_minalterflex, v_kalkulation_a41 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i42 = 1 if all((g_x + v_kalkulation_a42 >= g_minalterflex, v_kalkulation_a42 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i43 = 1 if all((g_x + v_kalkulation_a43 >= g_minalterflex, v_kalkulation_a43 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i44 = 1 if all((g_x + v_kalkulation_a44 >= g_minalterflex, v_kalkulation_a44 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i45 = 1 if all((g_x + v_kalkulation_a45 >= g_minalterflex, v_kalkulation_a45 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i46 = 1 if all((g_x + v_kalkulation_a46 >= g_minalterflex, v_kalkulation_a46 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i47 = 1 if all((g_x + v_kalkulation_a47 >= g_minalterflex, v_kalkulation_a47 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i48 = 1 if all((g_x + v_kalkulation_a48 >= g_minalterflex, v_kalkulation_a48 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i49 = 1 if all((g_x + v_kalkulation_a49 >= g_minalterflex, v_kalkulation_a49 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i50 = 1 if all((g_x + v_kalkulation_a50 >= g_minalterflex, v_kalkulation_a50 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i51 = 1 if all((g_x + v_kalkulation_a51 >= g_minalterflex, v_kalkulation_a51 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i52 = 1 if all((g_x + v_kalkulation_a52 >= g_minalterflex, v_kalkulation_a52 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i53 = 1 if all((g_x + v_kalkulation_a53 >= g_minalterflex, v_kalkulation_a53 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i54 = 1 if all((g_x + v_kalkulation_a54 >= g_minalterflex, v_kalkulation_a54 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i55 = 1 if all((g_x + v_kalkulation_a55 >= g_minalterflex, v_kalkulation_a55 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i56 = 1 if all((g_x + v_kalkulation_a56 >= g_minalterflex, v_kalkulation_a56 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i57 = 1 if all((g_x + v_kalkulation_a57 >= g_minalterflex, v_kalkulation_a57 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i58 = 1 if all((g_x + v_kalkulation_a58 >= g_minalterflex, v_kalkulation_a58 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i59 = 1 if all((g_x + v_kalkulation_a59 >= g_minalterflex, v_kalkulation_a59 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i60 = 1 if all((g_x + v_kalkulation_a60 >= g_minalterflex, v_kalkulation_a60 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i61 = 1 if all((g_x + v_kalkulation_a61 >= g_minalterflex, v_kalkulation_a61 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i62 = 1 if all((g_x + v_kalkulation_a62 >= g_minalterflex, v_kalkulation_a62 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i63 = 1 if all((g_x + v_kalkulation_a63 >= g_minalterflex, v_kalkulation_a63 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i64 = 1 if all((g_x + v_kalkulation_a64 >= g_minalterflex, v_kalkulation_a64 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i65 = 1 if all((g_x + v_kalkulation_a65 >= g_minalterflex, v_kalkulation_a65 >= g_n - g_minrlzflex)) else 0
+        c_kalkulation_i66 = 1 if all((g_x + v_kalkulation_a66 >= g_minalterflex, v_kalkulation_a66 >= g_n - g_minrlzflex)) else 0
+        col_kalkulation_i16_i66 = np.array([c_kalkulation_i16, c_kalkulation_i17, c_kalkulation_i18, c_kalkulation_i19, c_kalkulation_i20, c_kalkulation_i21, c_kalkulation_i22, c_kalkulation_i23, c_kalkulation_i24, c_kalkulation_i25, c_kalkulation_i26, c_kalkulation_i27, c_kalkulation_i28, c_kalkulation_i29, c_kalkulation_i30, c_kalkulation_i31, c_kalkulation_i32, c_kalkulation_i33, c_kalkulation_i34, c_kalkulation_i35, c_kalkulation_i36, c_kalkulation_i37, c_kalkulation_i38, c_kalkulation_i39, c_kalkulation_i40, c_kalkulation_i41, c_kalkulation_i42, c_kalkulation_i43, c_kalkulation_i44, c_kalkulation_i45, c_kalkulation_i46, c_kalkulation_i47, c_kalkulation_i48, c_kalkulation_i49, c_kalkulation_i50, c_kalkulation_i51, c_kalkulation_i52, c_kalkulation_i53, c_kalkulation_i54, c_kalkulation_i55, c_kalkulation_i56, c_kalkulation_i57, c_kalkulation_i58, c_kalkulation_i59, c_kalkulation_i60, c_kalkulation_i61, c_kalkulation_i62, c_kalkulation_i63, c_kalkulation_i64, c_kalkulation_i65, c_kalkulation_i66])
+    try:
+        col_kalkulation_j16_j66 = rows_kalkulation_j16_j66(np.array([v_kalkulation_a16, v_kalkulation_a17, v_kalkulation_a18, v_kalkulation_a19, v_kalkulation_a20, v_kalkulation_a21, v_kalkulation_a22, v_kalkulation_a23, v_kalkulation_a24, v_kalkulation_a25, v_kalkulation_a26, v_kalkulation_a27, v_kalkulation_a28, v_kalkulation_a29, v_kalkulation_a30, v_kalkulation_a31, v_kalkulation_a32, v_kalkulation_a33, v_kalkulation_a34, v_kalkulation_a35, v_kalkulation_a36, v_kalkulation_a37, v_kalkulation_a38, v_kalkulation_a39, v_kalkulation_a40, v_kalkulation_a41, v_kalkulation_a42, v_kalkulation_a43, v_kalkulation_a44, v_kalkulation_a45, v_kalkulation_a46, v_kalkulation_a47, v_kalkulation_a48, v_kalkulation_a49, v_kalkulation_a50, v_kalkulation_a51, v_kalkulation_a52, v_kalkulation_a53, v_kalkulation_a54, v_kalkulation_a55, v_kalkulation_a56, v_kalkulation_a57, v_kalkulation_a58, v_kalkulation_a59, v_kalkulation_a60, v_kalkulation_a61, v_kalkulation_a62, v_kalkulation_a63, v_kalkulation_a64, v_kalkulation_a65, v_kalkulation_a66]), col_kalkulation_i16_i66, col_kalkulation_f16_f66)
+        c_kalkulation_j16, c_kalkulation_j17, c_kalkulation_j18, c_kalkulation_j19, c_kalkulation_j20, c_kalkulation_j21, c_kalkulation_j22, c_kalkulation_j23, c_kalkulation_j24, c_kalkulation_j25, c_kalkulation_j26, c_kalkulation_j27, c_kalkulation_j28, c_kalkulation_j29, c_kalkulation_j30, c_kalkulation_j31, c_kalkulation_j32, c_kalkulation_j33, c_kalkulation_j34, c_kalkulation_j35, c_kalkulation_j36, c_kalkulation_j37, c_kalkulation_j38, c_kalkulation_j39, c_kalkulation_j40, c_kalkulation_j41, c_kalkulation_j42, c_kalkulation_j43, c_kalkulation_j44, c_kalkulation_j45, c_kalkulation_j46, c_kalkulation_j47, c_kalkulation_j48, c_kalkulation_j49, c_kalkulation_j50, c_kalkulation_j51, c_kalkulation_j52, c_kalkulation_j53, c_kalkulation_j54, c_kalkulation_j55, c_kalkulation_j56, c_kalkulation_j57, c_kalkulation_j58, c_kalkulation_j59, c_kalkulation_j60, c_kalkulation_j61, c_kalkulation_j62, c_kalkulation_j63, c_kalkulation_j64, c_kalkulation_j65, c_kalkulation_j66 = col_kalkulation_j16_j66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_j16 = 0 if any((v_kalkulation_a16 > g_n, c_kalkulation_i16)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f16)))
+        c_kalkulation_j17 = 0 if any((v_kalkulation_a17 > g_n, c_kalkulation_i17)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f17)))
+        c_kalkulation_j18 = 0 if any((v_kalkulation_a18 > g_n, c_kalkulation_i18)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f18)))
+        c_kalkulation_j19 = 0 if any((v_kalkulation_a19 > g_n, c_kalkulation_i19)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f19)))
+        c_kalkulation_j20 = 0 if any((v_kalkulation_a20 > g_n, c_kalkulation_i20)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f20)))
+        c_kalkulation_j21 = 0 if any((v_kalkulation_a21 > g_n, c_kalkulation_i21)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f21)))
+        c_kalkulation_j22 = 0 if any((v_kalkulation_a22 > g_n, c_kalkulation_i22)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f22)))
+        c_kalkulation_j23 = 0 if any((v_kalkulation_a23 > g_n, c_kalkulation_i23)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f23)))
+        c_kalkulation_j24 = 0 if any((v_kalkulation_a24 > g_n, c_kalkulation_i24)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f24)))
+        c_kalkulation_j25 = 0 if any((v_kalkulation_a25 > g_n, c_kalkulation_i25)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f25)))
+        c_kalkulation_j26 = 0 if any((v_kalkulation_a26 > g_n, c_kalkulation_i26)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f26)))
+        c_kalkulation_j27 = 0 if any((v_kalkulation_a27 > g_n, c_kalkulation_i27)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f27)))
+        c_kalkulation_j28 = 0 if any((v_kalkulation_a28 > g_n, c_kalkulation_i28)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f28)))
+        c_kalkulation_j29 = 0 if any((v_kalkulation_a29 > g_n, c_kalkulation_i29)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f29)))
+        c_kalkulation_j30 = 0 if any((v_kalkulation_a30 > g_n, c_kalkulation_i30)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f30)))
+        c_kalkulation_j31 = 0 if any((v_kalkulation_a31 > g_n, c_kalkulation_i31)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f31)))
+        c_kalkulation_j32 = 0 if any((v_kalkulation_a32 > g_n, c_kalkulation_i32)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f32)))
+        c_kalkulation_j33 = 0 if any((v_kalkulation_a33 > g_n, c_kalkulation_i33)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f33)))
+        c_kalkulation_j34 = 0 if any((v_kalkulation_a34 > g_n, c_kalkulation_i34)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f34)))
+        c_kalkulation_j35 = 0 if any((v_kalkulation_a35 > g_n, c_kalkulation_i35)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f35)))
+        c_kalkulation_j36 = 0 if any((v_kalkulation_a36 > g_n, c_kalkulation_i36)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f36)))
+        c_kalkulation_j37 = 0 if any((v_kalkulation_a37 > g_n, c_kalkulation_i37)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f37)))
+        c_kalkulation_j38 = 0 if any((v_kalkulation_a38 > g_n, c_kalkulation_i38)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f38)))
+        c_kalkulation_j39 = 0 if any((v_kalkulation_a39 > g_n, c_kalkulation_i39)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f39)))
+        c_kalkulation_j40 = 0 if any((v_kalkulation_a40 > g_n, c_kalkulation_i40)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f40)))
+        c_kalkulation_j41 = 0 if any((v_kalkulation_a41 > g_n, c_kalkulation_i41)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f41)))
+        c_kalkulation_j42 = 0 if any((v_kalkulation_a42 > g_n, c_kalkulation_i42)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f42)))
+        c_kalkulation_j43 = 0 if any((v_kalkulation_a43 > g_n, c_kalkulation_i43)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f43)))
+        c_kalkulation_j44 = 0 if any((v_kalkulation_a44 > g_n, c_kalkulation_i44)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f44)))
+        c_kalkulation_j45 = 0 if any((v_kalkulation_a45 > g_n, c_kalkulation_i45)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f45)))
+        c_kalkulation_j46 = 0 if any((v_kalkulation_a46 > g_n, c_kalkulation_i46)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f46)))
+        c_kalkulation_j47 = 0 if any((v_kalkulation_a47 > g_n, c_kalkulation_i47)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f47)))
+        c_kalkulation_j48 = 0 if any((v_kalkulation_a48 > g_n, c_kalkulation_i48)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f48)))
+        c_kalkulation_j49 = 0 if any((v_kalkulation_a49 > g_n, c_kalkulation_i49)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f49)))
+        c_kalkulation_j50 = 0 if any((v_kalkulation_a50 > g_n, c_kalkulation_i50)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f50)))
+        c_kalkulation_j51 = 0 if any((v_kalkulation_a51 > g_n, c_kalkulation_i51)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f51)))
+        c_kalkulation_j52 = 0 if any((v_kalkulation_a52 > g_n, c_kalkulation_i52)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f52)))
+        c_kalkulation_j53 = 0 if any((v_kalkulation_a53 > g_n, c_kalkulation_i53)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f53)))
+        c_kalkulation_j54 = 0 if any((v_kalkulation_a54 > g_n, c_kalkulation_i54)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f54)))
+        c_kalkulation_j55 = 0 if any((v_kalkulation_a55 > g_n, c_kalkulation_i55)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f55)))
+        c_kalkulation_j56 = 0 if any((v_kalkulation_a56 > g_n, c_kalkulation_i56)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f56)))
+        c_kalkulation_j57 = 0 if any((v_kalkulation_a57 > g_n, c_kalkulation_i57)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f57)))
+        c_kalkulation_j58 = 0 if any((v_kalkulation_a58 > g_n, c_kalkulation_i58)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f58)))
+        c_kalkulation_j59 = 0 if any((v_kalkulation_a59 > g_n, c_kalkulation_i59)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f59)))
+        c_kalkulation_j60 = 0 if any((v_kalkulation_a60 > g_n, c_kalkulation_i60)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f60)))
+        c_kalkulation_j61 = 0 if any((v_kalkulation_a61 > g_n, c_kalkulation_i61)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f61)))
+        c_kalkulation_j62 = 0 if any((v_kalkulation_a62 > g_n, c_kalkulation_i62)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f62)))
+        c_kalkulation_j63 = 0 if any((v_kalkulation_a63 > g_n, c_kalkulation_i63)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f63)))
+        c_kalkulation_j64 = 0 if any((v_kalkulation_a64 > g_n, c_kalkulation_i64)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f64)))
+        c_kalkulation_j65 = 0 if any((v_kalkulation_a65 > g_n, c_kalkulation_i65)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f65)))
+        c_kalkulation_j66 = 0 if any((v_kalkulation_a66 > g_n, c_kalkulation_i66)) else min(150, max(50, 0.01 * (g_vs - c_kalkulation_f66)))
+        col_kalkulation_j16_j66 = np.array([c_kalkulation_j16, c_kalkulation_j17, c_kalkulation_j18, c_kalkulation_j19, c_kalkulation_j20, c_kalkulation_j21, c_kalkulation_j22, c_kalkulation_j23, c_kalkulation_j24, c_kalkulation_j25, c_kalkulation_j26, c_kalkulation_j27, c_kalkulation_j28, c_kalkulation_j29, c_kalkulation_j30, c_kalkulation_j31, c_kalkulation_j32, c_kalkulation_j33, c_kalkulation_j34, c_kalkulation_j35, c_kalkulation_j36, c_kalkulation_j37, c_kalkulation_j38, c_kalkulation_j39, c_kalkulation_j40, c_kalkulation_j41, c_kalkulation_j42, c_kalkulation_j43, c_kalkulation_j44, c_kalkulation_j45, c_kalkulation_j46, c_kalkulation_j47, c_kalkulation_j48, c_kalkulation_j49, c_kalkulation_j50, c_kalkulation_j51, c_kalkulation_j52, c_kalkulation_j53, c_kalkulation_j54, c_kalkulation_j55, c_kalkulation_j56, c_kalkulation_j57, c_kalkulation_j58, c_kalkulation_j59, c_kalkulation_j60, c_kalkulation_j61, c_kalkulation_j62, c_kalkulation_j63, c_kalkulation_j64, c_kalkulation_j65, c_kalkulation_j66])
+    try:
+        col_kalkulation_k16_k66 = rows_kalkulation_k16_k66(col_kalkulation_h16_h66, col_kalkulation_j16_j66)
+        c_kalkulation_k16, c_kalkulation_k17, c_kalkulation_k18, c_kalkulation_k19, c_kalkulation_k20, c_kalkulation_k21, c_kalkulation_k22, c_kalkulation_k23, c_kalkulation_k24, c_kalkulation_k25, c_kalkulation_k26, c_kalkulation_k27, c_kalkulation_k28, c_kalkulation_k29, c_kalkulation_k30, c_kalkulation_k31, c_kalkulation_k32, c_kalkulation_k33, c_kalkulation_k34, c_kalkulation_k35, c_kalkulation_k36, c_kalkulation_k37, c_kalkulation_k38, c_kalkulation_k39, c_kalkulation_k40, c_kalkulation_k41, c_kalkulation_k42, c_kalkulation_k43, c_kalkulation_k44, c_kalkulation_k45, c_kalkulation_k46, c_kalkulation_k47, c_kalkulation_k48, c_kalkulation_k49, c_kalkulation_k50, c_kalkulation_k51, c_kalkulation_k52, c_kalkulation_k53, c_kalkulation_k54, c_kalkulation_k55, c_kalkulation_k56, c_kalkulation_k57, c_kalkulation_k58, c_kalkulation_k59, c_kalkulation_k60, c_kalkulation_k61, c_kalkulation_k62, c_kalkulation_k63, c_kalkulation_k64, c_kalkulation_k65, c_kalkulation_k66 = col_kalkulation_k16_k66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        c_kalkulation_k16 = max(0, c_kalkulation_h16 - c_kalkulation_j16)
+        c_kalkulation_k17 = max(0, c_kalkulation_h17 - c_kalkulation_j17)
+        c_kalkulation_k18 = max(0, c_kalkulation_h18 - c_kalkulation_j18)
+        c_kalkulation_k19 = max(0, c_kalkulation_h19 - c_kalkulation_j19)
+        c_kalkulation_k20 = max(0, c_kalkulation_h20 - c_kalkulation_j20)
+        c_kalkulation_k21 = max(0, c_kalkulation_h21 - c_kalkulation_j21)
+        c_kalkulation_k22 = max(0, c_kalkulation_h22 - c_kalkulation_j22)
+        c_kalkulation_k23 = max(0, c_kalkulation_h23 - c_kalkulation_j23)
+        c_kalkulation_k24 = max(0, c_kalkulation_h24 - c_kalkulation_j24)
+        c_kalkulation_k25 = max(0, c_kalkulation_h25 - c_kalkulation_j25)
+        c_kalkulation_k26 = max(0, c_kalkulation_h26 - c_kalkulation_j26)
+        c_kalkulation_k27 = max(0, c_kalkulation_h27 - c_kalkulation_j27)
+        c_kalkulation_k28 = max(0, c_kalkulation_h28 - c_kalkulation_j28)
+        c_kalkulation_k29 = max(0, c_kalkulation_h29 - c_kalkulation_j29)
+        c_kalkulation_k30 = max(0, c_kalkulation_h30 - c_kalkulation_j30)
+        c_kalkulation_k31 = max(0, c_kalkulation_h31 - c_kalkulation_j31)
+        c_kalkulation_k32 = max(0, c_kalkulation_h32 - c_kalkulation_j32)
+        c_kalkulation_k33 = max(0, c_kalkulation_h33 - c_kalkulation_j33)
+        c_kalkulation_k34 = max(0, c_kalkulation_h34 - c_kalkulation_j34)
+        c_kalkulation_k35 = max(0, c_kalkulation_h35 - c_kalkulation_j35)
+        c_kalkulation_k36 = max(0, c_kalkulation_h36 - c_kalkulation_j36)
+        c_kalkulation_k37 = max(0, c_kalkulation_h37 - c_kalkulation_j37)
+        c_kalkulation_k38 = max(0, c_kalkulation_h38 - c_kalkulation_j38)
+        c_kalkulation_k39 = max(0, c_kalkulation_h39 - c_kalkulation_j39)
+        c_kalkulation_k40 = max(0, c_kalkulation_h40 - c_kalkulation_j40)
+        c_kalkulation_k41 = max(0, c_kalkulation_h41 - c_kalkulation_j41)
+        c_kalkulation_k42 = max(0, c_kalkulation_h42 - c_kalkulation_j42)
+        c_kalkulation_k43 = max(0, c_kalkulation_h43 - c_kalkulation_j43)
+        c_kalkulation_k44 = max(0, c_kalkulation_h44 - c_kalkulation_j44)
+        c_kalkulation_k45 = max(0, c_kalkulation_h45 - c_kalkulation_j45)
+        c_kalkulation_k46 = max(0, c_kalkulation_h46 - c_kalkulation_j46)
+        c_kalkulation_k47 = max(0, c_kalkulation_h47 - c_kalkulation_j47)
+        c_kalkulation_k48 = max(0, c_kalkulation_h48 - c_kalkulation_j48)
+        c_kalkulation_k49 = max(0, c_kalkulation_h49 - c_kalkulation_j49)
+        c_kalkulation_k50 = max(0, c_kalkulation_h50 - c_kalkulation_j50)
+        c_kalkulation_k51 = max(0, c_kalkulation_h51 - c_kalkulation_j51)
+        c_kalkulation_k52 = max(0, c_kalkulation_h52 - c_kalkulation_j52)
+        c_kalkulation_k53 = max(0, c_kalkulation_h53 - c_kalkulation_j53)
+        c_kalkulation_k54 = max(0, c_kalkulation_h54 - c_kalkulation_j54)
+        c_kalkulation_k55 = max(0, c_kalkulation_h55 - c_kalkulation_j55)
+        c_kalkulation_k56 = max(0, c_kalkulation_h56 - c_kalkulation_j56)
+        c_kalkulation_k57 = max(0, c_kalkulation_h57 - c_kalkulation_j57)
+        c_kalkulation_k58 = max(0, c_kalkulation_h58 - c_kalkulation_j58)
+        c_kalkulation_k59 = max(0, c_kalkulation_h59 - c_kalkulation_j59)
+        c_kalkulation_k60 = max(0, c_kalkulation_h60 - c_kalkulation_j60)
+        c_kalkulation_k61 = max(0, c_kalkulation_h61 - c_kalkulation_j61)
+        c_kalkulation_k62 = max(0, c_kalkulation_h62 - c_kalkulation_j62)
+        c_kalkulation_k63 = max(0, c_kalkulation_h63 - c_kalkulation_j63)
+        c_kalkulation_k64 = max(0, c_kalkulation_h64 - c_kalkulation_j64)
+        c_kalkulation_k65 = max(0, c_kalkulation_h65 - c_kalkulation_j65)
+        c_kalkulation_k66 = max(0, c_kalkulation_h66 - c_kalkulation_j66)
+        col_kalkulation_k16_k66 = np.array([c_kalkulation_k16, c_kalkulation_k17, c_kalkulation_k18, c_kalkulation_k19, c_kalkulation_k20, c_kalkulation_k21, c_kalkulation_k22, c_kalkulation_k23, c_kalkulation_k24, c_kalkulation_k25, c_kalkulation_k26, c_kalkulation_k27, c_kalkulation_k28, c_kalkulation_k29, c_kalkulation_k30, c_kalkulation_k31, c_kalkulation_k32, c_kalkulation_k33, c_kalkulation_k34, c_kalkulation_k35, c_kalkulation_k36, c_kalkulation_k37, c_kalkulation_k38, c_kalkulation_k39, c_kalkulation_k40, c_kalkulation_k41, c_kalkulation_k42, c_kalkulation_k43, c_kalkulation_k44, c_kalkulation_k45, c_kalkulation_k46, c_kalkulation_k47, c_kalkulation_k48, c_kalkulation_k49, c_kalkulation_k50, c_kalkulation_k51, c_kalkulation_k52, c_kalkulation_k53, c_kalkulation_k54, c_kalkulation_k55, c_kalkulation_k56, c_kalkulation_k57, c_kalkulation_k58, c_kalkulation_k59, c_kalkulation_k60, c_kalkulation_k61, c_kalkulation_k62, c_kalkulation_k63, c_kalkulation_k64, c_kalkulation_k65, c_kalkulation_k66])
+    try:
+        col_kalkulation_l16_l66 = rows_kalkulation_l16_l66(np.array([v_kalkulation_a16, v_kalkulation_a17, v_kalkulation_a18, v_kalkulation_a19, v_kalkulation_a20, v_kalkulation_a21, v_kalkulation_a22, v_kalkulation_a23, v_kalkulation_a24, v_kalkulation_a25, v_kalkulation_a26, v_kalkulation_a27, v_kalkulation_a28, v_kalkulation_a29, v_kalkulation_a30, v_kalkulation_a31, v_kalkulation_a32, v_kalkulation_a33, v_kalkulation_a34, v_kalkulation_a35, v_kalkulation_a36, v_kalkulation_a37, v_kalkulation_a38, v_kalkulation_a39, v_kalkulation_a40, v_kalkulation_a41, v_kalkulation_a42, v_kalkulation_a43, v_kalkulation_a44, v_kalkulation_a45, v_kalkulation_a46, v_kalkulation_a47, v_kalkulation_a48, v_kalkulation_a49, v_kalkulation_a50, v_kalkulation_a51, v_kalkulation_a52, v_kalkulation_a53, v_kalkulation_a54, v_kalkulation_a55, v_kalkulation_a56, v_kalkulation_a57, v_kalkulation_a58, v_kalkulation_a59, v_kalkulation_a60, v_kalkulation_a61, v_kalkulation_a62, v_kalkulation_a63, v_kalkulation_a64, v_kalkulation_a65, v_kalkulation_a66]), col_kalkulation_h16_h66, col_kalkulation_g16_g66)
+        c_kalkulation_l16, c_kalkulation_l17, c_kalkulation_l18, c_kalkulation_l19, c_kalkulation_l20, c_kalkulation_l21, c_kalkulation_l22, c_kalkulation_l23, c_kalkulation_l24, c_kalkulation_l25, c_kalkulation_l26, c_kalkulation_l27, c_kalkulation_l28, c_kalkulation_l29, c_kalkulation_l30, c_kalkulation_l31, c_kalkulation_l32, c_kalkulation_l33, c_kalkulation_l34, c_kalkulation_l35, c_kalkulation_l36, c_kalkulation_l37, c_kalkulation_l38, c_kalkulation_l39, c_kalkulation_l40, c_kalkulation_l41, c_kalkulation_l42, c_kalkulation_l43, c_kalkulation_l44, c_kalkulation_l45, c_kalkulation_l46, c_kalkulation_l47, c_kalkulation_l48, c_kalkulation_l49, c_kalkulation_l50, c_kalkulation_l51, c_kalkulation_l52, c_kalkulation_l53, c_kalkulation_l54, c_kalkulation_l55, c_kalkulation_l56, c_kalkulation_l57, c_kalkulation_l58, c_kalkulation_l59, c_kalkulation_l60, c_kalkulation_l61, c_kalkulation_l62, c_kalkulation_l63, c_kalkulation_l64, c_kalkulation_l65, c_kalkulation_l66 = col_kalkulation_l16_l66
+    except (ArithmeticError, IndexError, TypeError, ValueError):
+        try:
+            c_kalkulation_l16 = 0 if v_kalkulation_a16 > g_n else c_kalkulation_h16 / c_kalkulation_g16 if v_kalkulation_a16 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l16 = 0
+        try:
+            c_kalkulation_l17 = 0 if v_kalkulation_a17 > g_n else c_kalkulation_h17 / c_kalkulation_g17 if v_kalkulation_a17 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l17 = 0
+        try:
+            c_kalkulation_l18 = 0 if v_kalkulation_a18 > g_n else c_kalkulation_h18 / c_kalkulation_g18 if v_kalkulation_a18 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l18 = 0
+        try:
+            c_kalkulation_l19 = 0 if v_kalkulation_a19 > g_n else c_kalkulation_h19 / c_kalkulation_g19 if v_kalkulation_a19 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l19 = 0
+        try:
+            c_kalkulation_l20 = 0 if v_kalkulation_a20 > g_n else c_kalkulation_h20 / c_kalkulation_g20 if v_kalkulation_a20 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l20 = 0
+        try:
+            c_kalkulation_l21 = 0 if v_kalkulation_a21 > g_n else c_kalkulation_h21 / c_kalkulation_g21 if v_kalkulation_a21 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l21 = 0
+        try:
+            c_kalkulation_l22 = 0 if v_kalkulation_a22 > g_n else c_kalkulation_h22 / c_kalkulation_g22 if v_kalkulation_a22 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l22 = 0
+        try:
+            c_kalkulation_l23 = 0 if v_kalkulation_a23 > g_n else c_kalkulation_h23 / c_kalkulation_g23 if v_kalkulation_a23 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l23 = 0
+        try:
+            c_kalkulation_l24 = 0 if v_kalkulation_a24 > g_n else c_kalkulation_h24 / c_kalkulation_g24 if v_kalkulation_a24 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l24 = 0
+        try:
+            c_kalkulation_l25 = 0 if v_kalkulation_a25 > g_n else c_kalkulation_h25 / c_kalkulation_g25 if v_kalkulation_a25 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l25 = 0
+        try:
+            c_kalkulation_l26 = 0 if v_kalkulation_a26 > g_n else c_kalkulation_h26 / c_kalkulation_g26 if v_kalkulation_a26 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l26 = 0
+        try:
+            c_kalkulation_l27 = 0 if v_kalkulation_a27 > g_n else c_kalkulation_h27 / c_kalkulation_g27 if v_kalkulation_a27 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l27 = 0
+        try:
+            c_kalkulation_l28 = 0 if v_kalkulation_a28 > g_n else c_kalkulation_h28 / c_kalkulation_g28 if v_kalkulation_a28 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l28 = 0
+        try:
+            c_kalkulation_l29 = 0 if v_kalkulation_a29 > g_n else c_kalkulation_h29 / c_kalkulation_g29 if v_kalkulation_a29 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l29 = 0
+        try:
+            c_kalkulation_l30 = 0 if v_kalkulation_a30 > g_n else c_kalkulation_h30 / c_kalkulation_g30 if v_kalkulation_a30 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l30 = 0
+        try:
+            c_kalkulation_l31 = 0 if v_kalkulation_a31 > g_n else c_kalkulation_h31 / c_kalkulation_g31 if v_kalkulation_a31 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l31 = 0
+        try:
+            c_kalkulation_l32 = 0 if v_kalkulation_a32 > g_n else c_kalkulation_h32 / c_kalkulation_g32 if v_kalkulation_a32 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l32 = 0
+        try:
+            c_kalkulation_l33 = 0 if v_kalkulation_a33 > g_n else c_kalkulation_h33 / c_kalkulation_g33 if v_kalkulation_a33 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l33 = 0
+        try:
+            c_kalkulation_l34 = 0 if v_kalkulation_a34 > g_n else c_kalkulation_h34 / c_kalkulation_g34 if v_kalkulation_a34 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l34 = 0
+        try:
+            c_kalkulation_l35 = 0 if v_kalkulation_a35 > g_n else c_kalkulation_h35 / c_kalkulation_g35 if v_kalkulation_a35 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l35 = 0
+        try:
+            c_kalkulation_l36 = 0 if v_kalkulation_a36 > g_n else c_kalkulation_h36 / c_kalkulation_g36 if v_kalkulation_a36 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l36 = 0
+        try:
+            c_kalkulation_l37 = 0 if v_kalkulation_a37 > g_n else c_kalkulation_h37 / c_kalkulation_g37 if v_kalkulation_a37 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l37 = 0
+        try:
+            c_kalkulation_l38 = 0 if v_kalkulation_a38 > g_n else c_kalkulation_h38 / c_kalkulation_g38 if v_kalkulation_a38 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l38 = 0
+        try:
+            c_kalkulation_l39 = 0 if v_kalkulation_a39 > g_n else c_kalkulation_h39 / c_kalkulation_g39 if v_kalkulation_a39 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l39 = 0
+        try:
+            c_kalkulation_l40 = 0 if v_kalkulation_a40 > g_n else c_kalkulation_h40 / c_kalkulation_g40 if v_kalkulation_a40 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l40 = 0
+        try:
+            c_kalkulation_l41 = 0 if v_kalkulation_a41 > g_n else c_kalkulation_h41 / c_kalkulation_g41 if v_kalkulation_a41 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l41 = 0
+        try:
+            c_kalkulation_l42 = 0 if v_kalkulation_a42 > g_n else c_kalkulation_h42 / c_kalkulation_g42 if v_kalkulation_a42 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l42 = 0
+        try:
+            c_kalkulation_l43 = 0 if v_kalkulation_a43 > g_n else c_kalkulation_h43 / c_kalkulation_g43 if v_kalkulation_a43 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l43 = 0
+        try:
+            c_kalkulation_l44 = 0 if v_kalkulation_a44 > g_n else c_kalkulation_h44 / c_kalkulation_g44 if v_kalkulation_a44 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l44 = 0
+        try:
+            c_kalkulation_l45 = 0 if v_kalkulation_a45 > g_n else c_kalkulation_h45 / c_kalkulation_g45 if v_kalkulation_a45 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l45 = 0
+        try:
+            c_kalkulation_l46 = 0 if v_kalkulation_a46 > g_n else c_kalkulation_h46 / c_kalkulation_g46 if v_kalkulation_a46 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l46 = 0
+        try:
+            c_kalkulation_l47 = 0 if v_kalkulation_a47 > g_n else c_kalkulation_h47 / c_kalkulation_g47 if v_kalkulation_a47 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l47 = 0
+        try:
+            c_kalkulation_l48 = 0 if v_kalkulation_a48 > g_n else c_kalkulation_h48 / c_kalkulation_g48 if v_kalkulation_a48 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l48 = 0
+        try:
+            c_kalkulation_l49 = 0 if v_kalkulation_a49 > g_n else c_kalkulation_h49 / c_kalkulation_g49 if v_kalkulation_a49 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l49 = 0
+        try:
+            c_kalkulation_l50 = 0 if v_kalkulation_a50 > g_n else c_kalkulation_h50 / c_kalkulation_g50 if v_kalkulation_a50 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l50 = 0
+        try:
+            c_kalkulation_l51 = 0 if v_kalkulation_a51 > g_n else c_kalkulation_h51 / c_kalkulation_g51 if v_kalkulation_a51 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l51 = 0
+        try:
+            c_kalkulation_l52 = 0 if v_kalkulation_a52 > g_n else c_kalkulation_h52 / c_kalkulation_g52 if v_kalkulation_a52 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l52 = 0
+        try:
+            c_kalkulation_l53 = 0 if v_kalkulation_a53 > g_n else c_kalkulation_h53 / c_kalkulation_g53 if v_kalkulation_a53 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l53 = 0
+        try:
+            c_kalkulation_l54 = 0 if v_kalkulation_a54 > g_n else c_kalkulation_h54 / c_kalkulation_g54 if v_kalkulation_a54 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l54 = 0
+        try:
+            c_kalkulation_l55 = 0 if v_kalkulation_a55 > g_n else c_kalkulation_h55 / c_kalkulation_g55 if v_kalkulation_a55 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l55 = 0
+        try:
+            c_kalkulation_l56 = 0 if v_kalkulation_a56 > g_n else c_kalkulation_h56 / c_kalkulation_g56 if v_kalkulation_a56 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l56 = 0
+        try:
+            c_kalkulation_l57 = 0 if v_kalkulation_a57 > g_n else c_kalkulation_h57 / c_kalkulation_g57 if v_kalkulation_a57 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l57 = 0
+        try:
+            c_kalkulation_l58 = 0 if v_kalkulation_a58 > g_n else c_kalkulation_h58 / c_kalkulation_g58 if v_kalkulation_a58 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l58 = 0
+        try:
+            c_kalkulation_l59 = 0 if v_kalkulation_a59 > g_n else c_kalkulation_h59 / c_kalkulation_g59 if v_kalkulation_a59 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l59 = 0
+        try:
+            c_kalkulation_l60 = 0 if v_kalkulation_a60 > g_n else c_kalkulation_h60 / c_kalkulation_g60 if v_kalkulation_a60 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l60 = 0
+        try:
+            c_kalkulation_l61 = 0 if v_kalkulation_a61 > g_n else c_kalkulation_h61 / c_kalkulation_g61 if v_kalkulation_a61 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l61 = 0
+        try:
+            c_kalkulation_l62 = 0 if v_kalkulation_a62 > g_n else c_kalkulation_h62 / c_kalkulation_g62 if v_kalkulation_a62 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l62 = 0
+        try:
+            c_kalkulation_l63 = 0 if v_kalkulation_a63 > g_n else c_kalkulation_h63 / c_kalkulation_g63 if v_kalkulation_a63 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l63 = 0
+        try:
+            c_kalkulation_l64 = 0 if v_kalkulation_a64 > g_n else c_kalkulation_h64 / c_kalkulation_g64 if v_kalkulation_a64 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l64 = 0
+        try:
+            c_kalkulation_l65 = 0 if v_kalkulation_a65 > g_n else c_kalkulation_h65 / c_kalkulation_g65 if v_kalkulation_a65 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l65 = 0
+        try:
+            c_kalkulation_l66 = 0 if v_kalkulation_a66 > g_n else c_kalkulation_h66 / c_kalkulation_g66 if v_kalkulation_a66 < g_t else g_vs
+        except Exception:
+            c_kalkulation_l66 = 0
+        col_kalkulation_l16_l66 = np.array([c_kalkulation_l16, c_kalkulation_l17, c_kalkulation_l18, c_kalkulation_l19, c_kalkulation_l20, c_kalkulation_l21, c_kalkulation_l22, c_kalkulation_l23, c_kalkulation_l24, c_kalkulation_l25, c_kalkulation_l26, c_kalkulation_l27, c_kalkulation_l28, c_kalkulation_l29, c_kalkulation_l30, c_kalkulation_l31, c_kalkulation_l32, c_kalkulation_l33, c_kalkulation_l34, c_kalkulation_l35, c_kalkulation_l36, c_kalkulation_l37, c_kalkulation_l38, c_kalkulation_l39, c_kalkulation_l40, c_kalkulation_l41, c_kalkulation_l42, c_kalkulation_l43, c_kalkulation_l44, c_kalkulation_l45, c_kalkulation_l46, c_kalkulation_l47, c_kalkulation_l48, c_kalkulation_l49, c_kalkulation_l50, c_kalkulation_l51, c_kalkulation_l52, c_kalkulation_l53, c_kalkulation_l54, c_kalkulation_l55, c_kalkulation_l56, c_kalkulation_l57, c_kalkulation_l58, c_kalkulation_l59, c_kalkulation_l60, c_kalkulation_l61, c_kalkulation_l62, c_kalkulation_l63, c_kalkulation_l64, c_kalkulation_l65, c_kalkulation_l66])
+    return [c_kalkulation_k5, c_kalkulation_k6, c_kalkulation_k9, c_kalkulation_e12, c_kalkulation_k7, c_kalkulation_b16, c_kalkulation_c16, c_kalkulation_d16, c_kalkulation_e16, c_kalkulation_f16, c_kalkulation_g16, c_kalkulation_h16, c_kalkulation_i16, c_kalkulation_j16, c_kalkulation_k16, c_kalkulation_l16, c_kalkulation_b17, c_kalkulation_c17, c_kalkulation_d17, c_kalkulation_e17, c_kalkulation_f17, c_kalkulation_g17, c_kalkulation_h17, c_kalkulation_i17, c_kalkulation_j17, c_kalkulation_k17, c_kalkulation_l17, c_kalkulation_b18, c_kalkulation_c18, c_kalkulation_d18, c_kalkulation_e18, c_kalkulation_f18, c_kalkulation_g18, c_kalkulation_h18, c_kalkulation_i18, c_kalkulation_j18, c_kalkulation_k18, c_kalkulation_l18, c_kalkulation_b19, c_kalkulation_c19, c_kalkulation_d19, c_kalkulation_e19, c_kalkulation_f19, c_kalkulation_g19, c_kalkulation_h19, c_kalkulation_i19, c_kalkulation_j19, c_kalkulation_k19, c_kalkulation_l19, c_kalkulation_b20, c_kalkulation_c20, c_kalkulation_d20, c_kalkulation_e20, c_kalkulation_f20, c_kalkulation_g20, c_kalkulation_h20, c_kalkulation_i20, c_kalkulation_j20, c_kalkulation_k20, c_kalkulation_l20, c_kalkulation_b21, c_kalkulation_c21, c_kalkulation_d21, c_kalkulation_e21, c_kalkulation_f21, c_kalkulation_g21, c_kalkulation_h21, c_kalkulation_i21, c_kalkulation_j21, c_kalkulation_k21, c_kalkulation_l21, c_kalkulation_b22, c_kalkulation_c22, c_kalkulation_d22, c_kalkulation_e22, c_kalkulation_f22, c_kalkulation_g22, c_kalkulation_h22, c_kalkulation_i22, c_kalkulation_j22, c_kalkulation_k22, c_kalkulation_l22, c_kalkulation_b23, c_kalkulation_c23, c_kalkulation_d23, c_kalkulation_e23, c_kalkulation_f23, c_kalkulation_g23, c_kalkulation_h23, c_kalkulation_i23, c_kalkulation_j23, c_kalkulation_k23, c_kalkulation_l23, c_kalkulation_b24, c_kalkulation_c24, c_kalkulation_d24, c_kalkulation_e24, c_kalkulation_f24, c_kalkulation_g24, c_kalkulation_h24, c_kalkulation_i24, c_kalkulation_j24, c_kalkulation_k24, c_kalkulation_l24, c_kalkulation_b25, c_kalkulation_c25, c_kalkulation_d25, c_kalkulation_e25, c_kalkulation_f25, c_kalkulation_g25, c_kalkulation_h25, c_kalkulation_i25, c_kalkulation_j25, c_kalkulation_k25, c_kalkulation_l25, c_kalkulation_b26, c_kalkulation_c26, c_kalkulation_d26, c_kalkulation_e26, c_kalkulation_f26, c_kalkulation_g26, c_kalkulation_h26, c_kalkulation_i26, c_kalkulation_j26, c_kalkulation_k26, c_kalkulation_l26, c_kalkulation_b27, c_kalkulation_c27, c_kalkulation_d27, c_kalkulation_e27, c_kalkulation_f27, c_kalkulation_g27, c_kalkulation_h27, c_kalkulation_i27, c_kalkulation_j27, c_kalkulation_k27, c_kalkulation_l27, c_kalkulation_b28, c_kalkulation_c28, c_kalkulation_d28, c_kalkulation_e28, c_kalkulation_f28, c_kalkulation_g28, c_kalkulation_h28, c_kalkulation_i28, c_kalkulation_j28, c_kalkulation_k28, c_kalkulation_l28, c_kalkulation_b29, c_kalkulation_c29, c_kalkulation_d29, c_kalkulation_e29, c_kalkulation_f29, c_kalkulation_g29, c_kalkulation_h29, c_kalkulation_i29, c_kalkulation_j29, c_kalkulation_k29, c_kalkulation_l29, c_kalkulation_b30, c_kalkulation_c30, c_kalkulation_d30, c_kalkulation_e30, c_kalkulation_f30, c_kalkulation_g30, c_kalkulation_h30, c_kalkulation_i30, c_kalkulation_j30, c_kalkulation_k30, c_kalkulation_l30, c_kalkulation_b31, c_kalkulation_c31, c_kalkulation_d31, c_kalkulation_e31, c_kalkulation_f31, c_kalkulation_g31, c_kalkulation_h31, c_kalkulation_i31, c_kalkulation_j31, c_kalkulation_k31, c_kalkulation_l31, c_kalkulation_b32, c_kalkulation_c32, c_kalkulation_d32, c_kalkulation_e32, c_kalkulation_f32, c_kalkulation_g32, c_kalkulation_h32, c_kalkulation_i32, c_kalkulation_j32, c_kalkulation_k32, c_kalkulation_l32, c_kalkulation_b33, c_kalkulation_c33, c_kalkulation_d33, c_kalkulation_e33, c_kalkulation_f33, c_kalkulation_g33, c_kalkulation_h33, c_kalkulation_i33, c_kalkulation_j33, c_kalkulation_k33, c_kalkulation_l33, c_kalkulation_b34, c_kalkulation_c34, c_kalkulation_d34, c_kalkulation_e34, c_kalkulation_f34, c_kalkulation_g34, c_kalkulation_h34, c_kalkulation_i34, c_kalkulation_j34, c_kalkulation_k34, c_kalkulation_l34, c_kalkulation_b35, c_kalkulation_c35, c_kalkulation_d35, c_kalkulation_e35, c_kalkulation_f35, c_kalkulation_g35, c_kalkulation_h35, c_kalkulation_i35, c_kalkulation_j35, c_kalkulation_k35, c_kalkulation_l35, c_kalkulation_b36, c_kalkulation_c36, c_kalkulation_d36, c_kalkulation_e36, c_kalkulation_f36, c_kalkulation_g36, c_kalkulation_h36, c_kalkulation_i36, c_kalkulation_j36, c_kalkulation_k36, c_kalkulation_l36, c_kalkulation_b37, c_kalkulation_c37, c_kalkulation_d37, c_kalkulation_e37, c_kalkulation_f37, c_kalkulation_g37, c_kalkulation_h37, c_kalkulation_i37, c_kalkulation_j37, c_kalkulation_k37, c_kalkulation_l37, c_kalkulation_b38, c_kalkulation_c38, c_kalkulation_d38, c_kalkulation_e38, c_kalkulation_f38, c_kalkulation_g38, c_kalkulation_h38, c_kalkulation_i38, c_kalkulation_j38, c_kalkulation_k38, c_kalkulation_l38, c_kalkulation_b39, c_kalkulation_c39, c_kalkulation_d39, c_kalkulation_e39, c_kalkulation_f39, c_kalkulation_g39, c_kalkulation_h39, c_kalkulation_i39, c_kalkulation_j39, c_kalkulation_k39, c_kalkulation_l39, c_kalkulation_b40, c_kalkulation_c40, c_kalkulation_d40, c_kalkulation_e40, c_kalkulation_f40, c_kalkulation_g40, c_kalkulation_h40, c_kalkulation_i40, c_kalkulation_j40, c_kalkulation_k40, c_kalkulation_l40, c_kalkulation_b41, c_kalkulation_c41, c_kalkulation_d41, c_kalkulation_e41, c_kalkulation_f41, c_kalkulation_g41, c_kalkulation_h41, c_kalkulation_i41, c_kalkulation_j41, c_kalkulation_k41, c_kalkulation_l41, c_kalkulation_b42, c_kalkulation_c42, c_kalkulation_d42, c_kalkulation_e42, c_kalkulation_f42, c_kalkulation_g42, c_kalkulation_h42, c_kalkulation_i42, c_kalkulation_j42, c_kalkulation_k42, c_kalkulation_l42, c_kalkulation_b43, c_kalkulation_c43, c_kalkulation_d43, c_kalkulation_e43, c_kalkulation_f43, c_kalkulation_g43, c_kalkulation_h43, c_kalkulation_i43, c_kalkulation_j43, c_kalkulation_k43, c_kalkulation_l43, c_kalkulation_b44, c_kalkulation_c44, c_kalkulation_d44, c_kalkulation_e44, c_kalkulation_f44, c_kalkulation_g44, c_kalkulation_h44, c_kalkulation_i44, c_kalkulation_j44, c_kalkulation_k44, c_kalkulation_l44, c_kalkulation_b45, c_kalkulation_c45, c_kalkulation_d45, c_kalkulation_e45, c_kalkulation_f45, c_kalkulation_g45, c_kalkulation_h45, c_kalkulation_i45, c_kalkulation_j45, c_kalkulation_k45, c_kalkulation_l45, c_kalkulation_b46, c_kalkulation_c46, c_kalkulation_d46, c_kalkulation_e46, c_kalkulation_f46, c_kalkulation_g46, c_kalkulation_h46, c_kalkulation_i46, c_kalkulation_j46, c_kalkulation_k46, c_kalkulation_l46, c_kalkulation_b47, c_kalkulation_c47, c_kalkulation_d47, c_kalkulation_e47, c_kalkulation_f47, c_kalkulation_g47, c_kalkulation_h47, c_kalkulation_i47, c_kalkulation_j47, c_kalkulation_k47, c_kalkulation_l47, c_kalkulation_b48, c_kalkulation_c48, c_kalkulation_d48, c_kalkulation_e48, c_kalkulation_f48, c_kalkulation_g48, c_kalkulation_h48, c_kalkulation_i48, c_kalkulation_j48, c_kalkulation_k48, c_kalkulation_l48, c_kalkulation_b49, c_kalkulation_c49, c_kalkulation_d49, c_kalkulation_e49, c_kalkulation_f49, c_kalkulation_g49, c_kalkulation_h49, c_kalkulation_i49, c_kalkulation_j49, c_kalkulation_k49, c_kalkulation_l49, c_kalkulation_b50, c_kalkulation_c50, c_kalkulation_d50, c_kalkulation_e50, c_kalkulation_f50, c_kalkulation_g50, c_kalkulation_h50, c_kalkulation_i50, c_kalkulation_j50, c_kalkulation_k50, c_kalkulation_l50, c_kalkulation_b51, c_kalkulation_c51, c_kalkulation_d51, c_kalkulation_e51, c_kalkulation_f51, c_kalkulation_g51, c_kalkulation_h51, c_kalkulation_i51, c_kalkulation_j51, c_kalkulation_k51, c_kalkulation_l51, c_kalkulation_b52, c_kalkulation_c52, c_kalkulation_d52, c_kalkulation_e52, c_kalkulation_f52, c_kalkulation_g52, c_kalkulation_h52, c_kalkulation_i52, c_kalkulation_j52, c_kalkulation_k52, c_kalkulation_l52, c_kalkulation_b53, c_kalkulation_c53, c_kalkulation_d53, c_kalkulation_e53, c_kalkulation_f53, c_kalkulation_g53, c_kalkulation_h53, c_kalkulation_i53, c_kalkulation_j53, c_kalkulation_k53, c_kalkulation_l53, c_kalkulation_b54, c_kalkulation_c54, c_kalkulation_d54, c_kalkulation_e54, c_kalkulation_f54, c_kalkulation_g54, c_kalkulation_h54, c_kalkulation_i54, c_kalkulation_j54, c_kalkulation_k54, c_kalkulation_l54, c_kalkulation_b55, c_kalkulation_c55, c_kalkulation_d55, c_kalkulation_e55, c_kalkulation_f55, c_kalkulation_g55, c_kalkulation_h55, c_kalkulation_i55, c_kalkulation_j55, c_kalkulation_k55, c_kalkulation_l55, c_kalkulation_b56, c_kalkulation_c56, c_kalkulation_d56, c_kalkulation_e56, c_kalkulation_f56, c_kalkulation_g56, c_kalkulation_h56, c_kalkulation_i56, c_kalkulation_j56, c_kalkulation_k56, c_kalkulation_l56, c_kalkulation_b57, c_kalkulation_c57, c_kalkulation_d57, c_kalkulation_e57, c_kalkulation_f57, c_kalkulation_g57, c_kalkulation_h57, c_kalkulation_i57, c_kalkulation_j57, c_kalkulation_k57, c_kalkulation_l57, c_kalkulation_b58, c_kalkulation_c58, c_kalkulation_d58, c_kalkulation_e58, c_kalkulation_f58, c_kalkulation_g58, c_kalkulation_h58, c_kalkulation_i58, c_kalkulation_j58, c_kalkulation_k58, c_kalkulation_l58, c_kalkulation_b59, c_kalkulation_c59, c_kalkulation_d59, c_kalkulation_e59, c_kalkulation_f59, c_kalkulation_g59, c_kalkulation_h59, c_kalkulation_i59, c_kalkulation_j59, c_kalkulation_k59, c_kalkulation_l59, c_kalkulation_b60, c_kalkulation_c60, c_kalkulation_d60, c_kalkulation_e60, c_kalkulation_f60, c_kalkulation_g60, c_kalkulation_h60, c_kalkulation_i60, c_kalkulation_j60, c_kalkulation_k60, c_kalkulation_l60, c_kalkulation_b61, c_kalkulation_c61, c_kalkulation_d61, c_kalkulation_e61, c_kalkulation_f61, c_kalkulation_g61, c_kalkulation_h61, c_kalkulation_i61, c_kalkulation_j61, c_kalkulation_k61, c_kalkulation_l61, c_kalkulation_b62, c_kalkulation_c62, c_kalkulation_d62, c_kalkulation_e62, c_kalkulation_f62, c_kalkulation_g62, c_kalkulation_h62, c_kalkulation_i62, c_kalkulation_j62, c_kalkulation_k62, c_kalkulation_l62, c_kalkulation_b63, c_kalkulation_c63, c_kalkulation_d63, c_kalkulation_e63, c_kalkulation_f63, c_kalkulation_g63, c_kalkulation_h63, c_kalkulation_i63, c_kalkulation_j63, c_kalkulation_k63, c_kalkulation_l63, c_kalkulation_b64, c_kalkulation_c64, c_kalkulation_d64, c_kalkulation_e64, c_kalkulation_f64, c_kalkulation_g64, c_kalkulation_h64, c_kalkulation_i64, c_kalkulation_j64, c_kalkulation_k64, c_kalkulation_l64, c_kalkulation_b65, c_kalkulation_c65, c_kalkulation_d65, c_kalkulation_e65, c_kalkulation_f65, c_kalkulation_g65, c_kalkulation_h65, c_kalkulation_i65, c_kalkulation_j65, c_kalkulation_k65, c_kalkulation_l65, c_kalkulation_b66, c_kalkulation_c66, c_kalkulation_d66, c_kalkulation_e66, c_kalkulation_f66, c_kalkulation_g66, c_kalkulation_h66, c_kalkulation_i66, c_kalkulation_j66, c_kalkulation_k66, c_kalkulation_l66]
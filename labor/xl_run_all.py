@@ -12,21 +12,30 @@ from labor.xl_step02_sign import Step02
 from labor.xl_step03_code import Step03
 from labor.xl_step04_fkt import Step04
 from labor.xl_step05_recomb import Step05
+from xl_macro.langchain_xl_developer import set_response_cache
+from xl_macro.llm_cache import open_cache_from_args
+from xl_macro.llm_scheduler import parse_jobs
 
 if __name__ == "__main__":
     print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ run all steps:")
+    jobs = parse_jobs()
+    print("Parallel LLM requests:", jobs)
+    cache = open_cache_from_args()
+    set_response_cache(cache)
     start = time.time()
-    step = Step01()
+    step = Step01(jobs=jobs)
     step.run()
-    step = Step02()
+    step = Step02(jobs=jobs)
     step.run()
-    step = Step03()
+    step = Step03(jobs=jobs)
     step.run()
-    step = Step04()
+    step = Step04(jobs=jobs)
     step.run()
     step = Step05()
     step.run()
     end = time.time()
     print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ Ready.")
     print("Total duration (s): ", int(end - start))
+    if cache is not None:
+        print("LLM cache:", cache.stats())
 
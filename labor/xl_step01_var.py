@@ -7,20 +7,22 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 """
 
 import os
-import time
 
 import pandas as pd
 from labor import Runnable
 from xl_macro.dataframe_utils import save_dataframe_as
-from xl_macro.langchain_xl_developer import request_doc, request_dev, PROMPT_MODEL_DOC, PROMPT_MODEL_CODE
-from xl_macro.xl_macro_parser import extract_code_chunks
+from xl_macro.langchain_xl_developer import request_doc, request_dev, PROMPT_MODEL_DOC, PROMPT_MODEL_CODE, set_response_cache
+from xl_macro.llm_cache import open_cache_from_args
+from xl_macro.llm_scheduler import LlmScheduler, DEFAULT_JOBS, parse_jobs, request_timed
+from xl_macro.xl_macro_parser import SourceBuffer, iter_chunk_records
 from xl_macro.xl_macro_reader import read_vba_macros_and_cls, read_named_ranges
 
 
 class Step01(Runnable):
 
-    def __init__(self):
+    def __init__(self, jobs: int = DEFAULT_JOBS):
         super().__init__()
+        self.scheduler = LlmScheduler(jobs)
         print("Step 01: Extract VBA macros and generate Python code snippets for vars.")
 
     def run(self):
@@ -54,6 +56,8 @@ class Step01(Runnable):
 
         all_df = pd.DataFrame([], columns=ws_column_types.keys())
         all_df = all_df.astype(ws_column_types)
+        # Die Chunks verweisen nur mit Offsets in die Module, der Text entsteht erst bei Bedarf.
+        buffer = SourceBuffer()
         for key, value in macros.items():
             if not key.endswith(".bas"):
                 continue
@@ -61,8 +65,20 @@ class Step01(Runnable):
             print(key)
             print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
             print(value)
-            chunks, used = extract_code_chunks(value, named_ranges)
-            df = pd.DataFrame(chunks, columns=extract_columns)
+            module_id = buffer.add(key, value)
+            used = {}
+            chunks = list(iter_chunk_records(buffer, module_id, named_ranges, used))
+            print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ Chunks")
+            for chunk in chunks:
+                print(f">>>\n{chunk.meaning} ({chunk.params}) [{chunk.line_start}-{chunk.line_end}]=== \n{chunk.code}\n"
+                      f"=== local usage: {chunk.local_used}")
+            requested = [i for i, chunk in enumerate(chunks) if chunk.meaning != "++Attribute++"]
+            results = self.scheduler.map(
+                lambda i: request_chunk(label=chunks[i].meaning, code=chunks[i].code,
+                                        full_code=buffer.text(module_id), names=used),
+                requested)
+
+            df = pd.DataFrame([chunk.as_tuple() for chunk in chunks], columns=extract_columns)
             df["doc_block"] = ""
             df["py_block"] = ""
             df["signatur"] = ""
@@ -71,36 +87,20 @@ class Step01(Runnable):
             df["model_code"] = ""
             df["code_duration"] = -1
             df = df.astype(ws_column_types)
-            print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ Chunks")
-            for row in df.itertuples(index=True):
-                label=row.meaning
-                params=row.params
-                code=row.code
-                von=row.line_start
-                bis=row.line_number
-                local_used=row.local_used
-                start = time.time()
-                print(f">>>\n{label} ({params}) [{von}-{bis}]=== \n{code}\n=== local usage: {local_used}")
-                if label == "++Attribute++":
-                    continue
+            for i, (doc_block, doc_duration, py_block, code_duration) in zip(requested, results):
+                print(f"#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ {chunks[i].meaning}:")
                 print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ response doc:")
-                doc_block = request_doc(label=label, code=code, full_code=value, names=used)
                 print(doc_block)
-                end = time.time()
-                df.at[row.Index, "doc_block"] = doc_block
-                df.at[row.Index, "doc_duration"] = int((end - start) * 1000)
-                df.at[row.Index, "model_doc"] = PROMPT_MODEL_DOC
-                if label.startswith("++"):
-                    start = end
+                df.at[i, "doc_block"] = doc_block
+                df.at[i, "doc_duration"] = doc_duration
+                df.at[i, "model_doc"] = PROMPT_MODEL_DOC
+                if py_block is not None:
                     print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ response code:")
-                    py_block = request_dev(label=label, code=code, doc_block=doc_block, var_code_py = '',
-                                           sign_py = [], own_sign="", names=used)
                     print(py_block)
                     print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ end response")
-                    end = time.time()
-                    df.at[row.Index, "code_duration"] = int((end - start) * 1000)
-                    df.at[row.Index, "model_code"] = PROMPT_MODEL_CODE
-                    df.at[row.Index, "py_block"] = py_block
+                    df.at[i, "code_duration"] = code_duration
+                    df.at[i, "model_code"] = PROMPT_MODEL_CODE
+                    df.at[i, "py_block"] = py_block
             print("~~~~~~~~~~~~~~~~~~~~~~~~~~ macro usage:")
             for key, value in used.items():
                 print(key, "=", value)
@@ -117,6 +117,25 @@ class Step01(Runnable):
         print("Saved.")
 
 
+def request_chunk(label: str, code: str, full_code: str, names) -> tuple:
+    """
+    Dokumentiert einen Chunk und übersetzt ihn, falls es eine Deklaration ist.
+    Läuft im Worker-Pool, die Reihenfolge der Chunks bleibt unabhängig.
+
+    :return: (doc_block, doc_duration, py_block oder None, code_duration)
+    """
+    doc_block, doc_duration = request_timed(request_doc, label=label, code=code, full_code=full_code, names=names)
+    if not label.startswith("++"):
+        return doc_block, doc_duration, None, -1
+    py_block, code_duration = request_timed(request_dev, label=label, code=code, doc_block=doc_block,
+                                            var_code_py='', sign_py=[], own_sign="", names=names)
+    return doc_block, doc_duration, py_block, code_duration
+
+
 if __name__ == "__main__":
-    step = Step01()
-    step.run()
\ No newline at end of file
+    cache = open_cache_from_args()
+    set_response_cache(cache)
+    step = Step01(jobs=parse_jobs())
+    step.run()
+    if cache is not None:
+        print("LLM cache:", cache.stats())
\ No newline at end of file
@@ -6,18 +6,20 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 </copyright>
 """
 
-import time
 import pandas as pd
 from labor import Runnable
 from xl_macro.dataframe_utils import save_dataframe_as, load_dataframe
-from xl_macro.langchain_xl_developer import request_sign, PROMPT_MODEL_SIGN
+from xl_macro.langchain_xl_developer import request_sign, PROMPT_MODEL_SIGN, set_response_cache
+from xl_macro.llm_cache import open_cache_from_args
+from xl_macro.llm_scheduler import LlmScheduler, DEFAULT_JOBS, parse_jobs, request_timed
 from xl_macro.py_code_utils import code_extract
 
 
 class Step02(Runnable):
 
-    def __init__(self):
+    def __init__(self, jobs: int = DEFAULT_JOBS):
         super().__init__()
+        self.scheduler = LlmScheduler(jobs)
         print("Step 02: Generate Python code signatures for methods.")
 
     def run(self):
@@ -36,20 +38,16 @@ class Step02(Runnable):
                 if pd.notna(py_block): py_code_start  = py_code_start + code_extract(py_block)
                 if pd.notna(doc_block): py_doc_start = py_doc_start + doc_block
 
-        for idx, row in all_df.iterrows():
-            meaning = row.meaning
-            params = row.params
-            if meaning.startswith("++"):
-                continue
-            print(idx,":  ",meaning,"(",params,")")
-            code = row.code
-            used = row.local_used
-            doc_block = row.doc_block
-            start = time.time()
+        rows = [(idx, row) for idx, row in all_df.iterrows() if not row.meaning.startswith("++")]
+        results = self.scheduler.map(
+            lambda item: request_timed(request_sign, label=item[1].meaning, code=item[1].code,
+                                       doc_block=item[1].doc_block, var_code_py=py_code_start,
+                                       names=item[1].local_used),
+            rows)
+        for (idx, row), (py_block, duration) in zip(rows, results):
+            print(idx,":  ",row.meaning,"(",row.params,")")
             print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ response signatur:")
-            py_block = request_sign(label=meaning, code=code, doc_block=doc_block, var_code_py=py_code_start, names=used)
-            end = time.time()
-            all_df.at[idx, "code_duration"] = int((end - start) * 1000)
+            all_df.at[idx, "code_duration"] = duration
             all_df.at[idx, "model_code"] = PROMPT_MODEL_SIGN
             all_df.at[idx, "signatur"] = py_block
 
@@ -64,5 +62,9 @@ class Step02(Runnable):
 
 
 if __name__ == "__main__":
-    step = Step02()
-    step.run()
\ No newline at end of file
+    cache = open_cache_from_args()
+    set_response_cache(cache)
+    step = Step02(jobs=parse_jobs())
+    step.run()
+    if cache is not None:
+        print("LLM cache:", cache.stats())
\ No newline at end of file
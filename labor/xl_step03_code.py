@@ -6,18 +6,21 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 </copyright>
 """
 
-import time
 import pandas as pd
 from labor import Runnable
 from xl_macro.dataframe_utils import save_dataframe_as, load_dataframe
-from xl_macro.langchain_xl_developer import request_dev, PROMPT_MODEL_CODE
+from xl_macro.langchain_xl_developer import request_dev, PROMPT_MODEL_CODE, set_response_cache
+from xl_macro.llm_cache import open_cache_from_args
+from xl_macro.llm_scheduler import LlmScheduler, DEFAULT_JOBS, parse_jobs, request_timed
 from xl_macro.py_code_utils import code_extract
+from xl_macro.xl_macro_parser import CallIndex
 
 
 class Step03(Runnable):
 
-    def __init__(self):
+    def __init__(self, jobs: int = DEFAULT_JOBS):
         super().__init__()
+        self.scheduler = LlmScheduler(jobs)
         print("Step 03: Generate Python code snippets for methods.")
 
     def run(self):
@@ -38,23 +41,18 @@ class Step03(Runnable):
                 signatur = row.signatur
                 if pd.notna(signatur): sign_dict[meaning] = signatur
 
-        for idx, row in all_df.iterrows():
-            meaning = row.meaning
-            params = row.params
-            if meaning.startswith("++"):
-                continue
-            print(idx,":  ",meaning,"(",params,")")
-            code = row.code
-            own_sign = row.signatur
-            used = row.local_used
-            doc_block = row.doc_block
-            start = time.time()
-            calls = find_calls_in_code(meaning, code, sign_dict)
+        rows = [(idx, row) for idx, row in all_df.iterrows() if not row.meaning.startswith("++")]
+        call_index = CallIndex({row.meaning: row.code for _, row in rows})
+        results = self.scheduler.map(
+            lambda item: request_timed(request_dev, label=item[1].meaning, code=item[1].code,
+                                       doc_block=item[1].doc_block, var_code_py=py_code_start,
+                                       sign_py=find_calls_in_code(item[1].meaning, call_index, sign_dict),
+                                       own_sign=item[1].signatur, names=item[1].local_used),
+            rows)
+        for (idx, row), (py_block, duration) in zip(rows, results):
+            print(idx,":  ",row.meaning,"(",row.params,")")
             print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ response code:")
-            py_block = request_dev(label=meaning, code=code, doc_block=doc_block, var_code_py=py_code_start,
-                                   sign_py = calls, own_sign = own_sign, names=used)
-            end = time.time()
-            all_df.at[idx, "code_duration"] = int((end - start) * 1000)
+            all_df.at[idx, "code_duration"] = duration
             all_df.at[idx, "model_code"] = PROMPT_MODEL_CODE
             all_df.at[idx, "py_block"] = py_block
 
@@ -67,15 +65,16 @@ class Step03(Runnable):
         all_df.to_excel("assets/output/xl_step03_code.xlsx", index=False, engine="openpyxl")
         print("Saved.")
 
-def find_calls_in_code(omitte: str, code: str, sign_dict: dict) -> list:
-    calls = []
-    for sign in sign_dict.keys():
-        if sign == omitte:
-            continue
-        if sign in code:
-            calls.append(sign_dict[sign])
-    return calls
+def find_calls_in_code(meaning: str, call_index: CallIndex, sign_dict: dict) -> list:
+    """
+    Signaturen der Prozeduren, die meaning wirklich aufruft, nachgeschlagen im CallIndex.
+    """
+    return [sign_dict[callee] for callee in call_index.callees(meaning) if callee in sign_dict]
 
 if __name__ == "__main__":
-    step = Step03()
-    step.run()
\ No newline at end of file
+    cache = open_cache_from_args()
+    set_response_cache(cache)
+    step = Step03(jobs=parse_jobs())
+    step.run()
+    if cache is not None:
+        print("LLM cache:", cache.stats())
\ No newline at end of file
@@ -12,15 +12,20 @@ import time
 import pandas as pd
 from labor import Runnable
 from xl_macro.dataframe_utils import save_dataframe_as, load_dataframe
-from xl_macro.langchain_xl_developer import PROMPT_MODEL_CODE, request_dev_fkt
-from xl_macro.py_code_utils import extract_cell_formulas
+from xl_macro.langchain_xl_developer import PROMPT_MODEL_CODE, request_dev_fkt, set_response_cache
+from xl_macro.llm_cache import open_cache_from_args
+from xl_macro.llm_scheduler import LlmScheduler, DEFAULT_JOBS, parse_jobs, request_timed
+from xl_macro.py_code_utils import extract_cell_formulas, group_formula_classes, instantiate_translation
+from xl_macro.xl_formula_compiler import COMPILER_MODEL_CODE, FormulaCompiler, udf_names_from_signatures
+from xl_macro.xl_macro_parser import CallIndex
 from xl_macro.xl_macro_reader import read_named_ranges
 
 
 class Step04(Runnable):
 
-    def __init__(self):
+    def __init__(self, jobs: int = DEFAULT_JOBS):
         super().__init__()
+        self.scheduler = LlmScheduler(jobs)
         print("Step 05: Extract functions from the cells of the tables.")
 
     def run(self):
@@ -31,17 +36,21 @@ class Step04(Runnable):
         # Lade dein bestehendes DataFrame
         all_df = load_dataframe("assets/output/xl_step03_code")
         sign_dict_lower = {}
+        procedures = {}
         for idx, row in all_df.iterrows():
             meaning = row.meaning
             if meaning.startswith("++"):
                 continue
+            procedures[meaning] = row.code
             signatur = row.signatur
             if pd.notna(signatur): sign_dict_lower[meaning.lower()] = signatur
+        call_index = CallIndex(procedures)
 
         print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
         # Sammle Formeln
-        formulas = extract_cell_formulas(xlsm_path, named_ranges.keys(), sign_dict_lower.keys())
+        # Ganze Bezeichner statt Teilstrings: act_dx ist nicht in act_dx2 enthalten.
+        formulas = extract_cell_formulas(xlsm_path, named_ranges.keys(), call_index.names.keys())
         print(f"Gefundene Formeln: {len(formulas)}")
 
         fkt_column_types = {
@@ -52,7 +61,7 @@ class Step04(Runnable):
             "fkt_code": "string",
             "used_names": "object",
             "used_meanings": "object",
-
+            "fkt_r1c1": "string",
         }
         fkt_df = pd.DataFrame(formulas.values(), columns=fkt_column_types.keys())
         fkt_df = fkt_df.astype(fkt_column_types)
@@ -61,29 +70,87 @@ class Step04(Runnable):
         fkt_df["model_code"] = ""
         fkt_df["code_duration"] = -1
 
+        # Einfache Formeln werden ohne Modell übersetzt.
+        compiler = FormulaCompiler(named_ranges.keys(), udf_names_from_signatures(sign_dict_lower))
+        compiled = {}
+        for idx, row in fkt_df.iterrows():
+            start = time.time()
+            try:
+                code = compiler.compile(row.fkt_code, row.coord, row.fkt_name)
+            except (SyntaxError, ValueError) as e:
+                print(row.coord, ": not compiled,", e)
+                continue
+            compiled[row.coord] = int((time.time() - start) * 1000)
+            fkt_df.at[idx, "used_py"] = [sign_dict_lower[um.lower()] + "# Excel: " + um
+                                         for um in row.used_meanings if um.lower() in sign_dict_lower]
+            fkt_df.at[idx, "code_duration"] = compiled[row.coord]
+            fkt_df.at[idx, "model_code"] = COMPILER_MODEL_CODE
+            fkt_df.at[idx, "py_fkt"] = "```python\n" + code + "```"
+
+        # Nur ein Repräsentant je Formelklasse geht an das Modell, der Rest wird verschoben.
+        classes = group_formula_classes({coord: formula for coord, formula in formulas.items()
+                                         if coord not in compiled})
+        fkt_df["fkt_class"] = ""
+        for rep, members in classes.items():
+            fkt_df.loc[fkt_df["coord"].isin(members), "fkt_class"] = rep
+        print(f"Formelklassen: {len(classes)} für {len(formulas) - len(compiled)} Formeln.")
+        if formulas:
+            print(f"Lokal kompiliert: {len(compiled)} von {len(formulas)} Formeln "
+                  f"({len(compiled) / len(formulas):.0%}), an das Modell: {len(classes)} Anfragen "
+                  f"für {len(formulas) - len(compiled)} Formeln.")
+
+        rows = []
         for idx, row in fkt_df.iterrows():
-            cell_ref = row.coord
-            formel_code = row.fkt_code
-            method_name = row.fkt_name
-            names = row.used_names
-            used_meanings = row.used_meanings
+            if row.coord != row.fkt_class:
+                continue
             used_py = []
-            for um in used_meanings:
+            for um in row.used_meanings:
                 if um.lower() in sign_dict_lower:
                     used_py.append(sign_dict_lower[um.lower()] + "# Excel: "+ um)
                 else:
                     print("Warning: Missing signature for meaning ", um)
-            print(cell_ref, "->", row.value_type, ":", method_name, "using", len(used_meanings), "meanings.")
-            start = time.time()
-            print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ response function:")
-            response = request_dev_fkt(cell_ref, formel_code, method_name,names, used_py)
-            print(response)
-            print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ end response")
-            end = time.time()
-            fkt_df.at[idx, "used_py"] = used_py
-            fkt_df.at[idx, "code_duration"] = int((end - start) * 1000)
-            fkt_df.at[idx, "model_code"] = PROMPT_MODEL_CODE
-            fkt_df.at[idx, "py_fkt"] = response
+            print(row.coord, "->", row.value_type, ":", row.fkt_name, "using", len(row.used_meanings), "meanings.")
+            rows.append((idx, row, used_py))
+
+        def request_all(items):
+            results = self.scheduler.map(
+                lambda item: request_timed(request_dev_fkt, cell_ref=item[1].coord, formel_code=item[1].fkt_code,
+                                           method_name=item[1].fkt_name, names=item[1].used_names,
+                                           used_py=item[2]),
+                items)
+            for (idx, row, used_py), (response, duration) in zip(items, results):
+                print(row.coord, ":", row.fkt_name)
+                print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ response function:")
+                print(response)
+                print("#######~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~ end response")
+                fkt_df.at[idx, "used_py"] = used_py
+                fkt_df.at[idx, "code_duration"] = duration
+                fkt_df.at[idx, "model_code"] = PROMPT_MODEL_CODE
+                fkt_df.at[idx, "py_fkt"] = response
+            return results
+
+        results = request_all(rows)
+
+        by_coord = {row.coord: (idx, row) for idx, row in fkt_df.iterrows()}
+        ambiguous = []
+        for (rep_idx, rep_row, used_py), (response, _) in zip(rows, results):
+            for coord in classes[rep_row.coord]:
+                if coord == rep_row.coord:
+                    continue
+                idx, row = by_coord[coord]
+                try:
+                    py_fkt = instantiate_translation(response, rep_row.fkt_code, rep_row.coord, coord)
+                except ValueError as e:
+                    print("Warning:", e)
+                    ambiguous.append((idx, row, used_py))
+                    continue
+                fkt_df.at[idx, "used_py"] = used_py
+                fkt_df.at[idx, "code_duration"] = 0
+                fkt_df.at[idx, "model_code"] = PROMPT_MODEL_CODE
+                fkt_df.at[idx, "py_fkt"] = py_fkt
+        if ambiguous:
+            print(f"Eigene Anfragen für {len(ambiguous)} Zellen, deren Übersetzung sich nicht verschieben lässt.")
+            request_all(ambiguous)
 
         print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
@@ -93,5 +160,9 @@ class Step04(Runnable):
 
 
 if __name__ == "__main__":
-    step = Step04()
-    step.run()
\ No newline at end of file
+    cache = open_cache_from_args()
+    set_response_cache(cache)
+    step = Step04(jobs=parse_jobs())
+    step.run()
+    if cache is not None:
+        print("LLM cache:", cache.stats())
\ No newline at end of file
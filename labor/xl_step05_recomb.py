@@ -6,27 +6,46 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 </copyright>
 """
 
+import argparse
+import types
+
+import openpyxl
 import pandas as pd
 from labor import Runnable
 from xl_macro.dataframe_utils import load_dataframe
-from xl_macro.langchain_xl_developer import CELL_NAME_VALUE, CELL_VALUE
-from xl_macro.py_code_utils import code_extract, clean_import
+from xl_macro.py_code_utils import code_extract, clean_import, runtime_source, cell_dispatch_code, \
+    read_overrides, cell_order_code, cell_precedents_code
+from xl_macro.xl_cell_graph import name_refs, formula_precedents, topological_order
+from xl_macro.xl_fold import literal, fold_lookups, constant_function, constant_cells, normalize_ref, frozen_ref
+from xl_macro.xl_formula_compiler import udf_names_from_signatures
+from xl_macro.xl_macro_reader import read_named_ranges
+from xl_macro.xl_row_vector import RowVectorCompiler, row_blocks, rows_function_name
+from xl_macro.xl_straight import straight_line_code
 
 
 class Step05(Runnable):
 
-    def __init__(self):
+    def __init__(self, frozen=()):
+        """
+        frozen: Namen oder Zellen 'Sheet!Cell', deren Werte zwischen den Anfragen gleich bleiben.
+        Sie werden als Literale in den Rechner geschrieben, siehe fold_frozen.
+        """
         super().__init__()
         print("Step 04: Rcombine the code.")
+        self.frozen = tuple(frozen)
 
     def run(self):
+        xlsm_path = "assets/input/Tarifrechner_KLV.xlsm"
+        named_ranges = read_named_ranges(xlsm_path)
         all_df = load_dataframe("assets/output/xl_step03_code")
         fkt_df = load_dataframe("assets/output/xl_step04_fkt")
+        overrides = read_overrides("assets/override")
 
         print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
         py_code_import = ""
         py_code_vars = ""
         py_code_methods = ""
+        sign_dict_lower = {}
         for idx, row in all_df.iterrows():
             meaning = row.meaning
             params = row.params
@@ -34,11 +53,16 @@ class Step05(Runnable):
                 continue
 
             py_block = row.py_block
+            if meaning in overrides:
+                print("Override: ", meaning)
+                py_block = "```python\n" + overrides[meaning] + "```"
             py_extract = code_extract(py_block)
             py_imports, py_code = clean_import(py_extract)
             if meaning.startswith("++"):
                 py_code_vars = py_code_vars + "\n\n" + py_code
             else:
+                if pd.notna(row.signatur):
+                    sign_dict_lower[meaning.lower()] = row.signatur
                 print(idx,":  ",meaning,"(",params,")")
                 if py_block is None or pd.isna(py_block):
                     print("Warning: Missing code block for ", meaning, "(", params, ")")
@@ -46,6 +70,11 @@ class Step05(Runnable):
                 py_code_methods = py_code_methods + "\n\n" + py_code
             py_code_import = py_code_import + "\n" + py_imports
 
+        refs_of_names = name_refs(named_ranges)
+        cell_codes = {}
+        cell_functions = {}
+        precedents = {}
+        formulas = {}
         for idx, row in fkt_df.iterrows():
             coord = row.coord
             fkt_name = row.fkt_name
@@ -58,12 +87,53 @@ class Step05(Runnable):
                 print("Warning: Missing code block for ", coord )
                 continue
 
-            py_code_methods = py_code_methods + "\n\n" + py_code
+            if f"def {fkt_name}(" not in py_code:
+                print("Warning: Missing function ", fkt_name, " for ", coord)
+            else:
+                cell_functions[coord] = fkt_name
+                precedents[coord] = formula_precedents(row.fkt_code, coord, refs_of_names)
+                formulas[coord] = (row.fkt_code, row.fkt_r1c1)
+            cell_codes[coord] = py_code
             py_code_import = py_code_import + "\n" + py_imports
 
+        # Zirkelbezüge brechen hier mit CycleError ab, nicht erst im Rechner.
+        cell_order = topological_order(precedents)
+        print("Cell order:", len(cell_order), "formula cells")
+
         print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
-        text = py_code_import + "\n\n" + CELL_NAME_VALUE+ "\n\n" + CELL_VALUE + "\n\n" + py_code_vars + "\n\n" + py_code_methods
+        frozen_code = ""
+        if self.frozen:
+            compose = lambda codes: py_code_import + "\n\n" + runtime_source() + "\n\n" + py_code_vars + "\n\n" \
+                + py_code_methods + "\n\n" + "\n\n".join(codes.values()) + "\n\n" + cell_dispatch_code(cell_functions)
+            frozen_refs = self.fold_frozen(compose(cell_codes), xlsm_path, named_ranges, cell_codes, cell_functions,
+                                           precedents, cell_order)
+            frozen_code = "FROZEN_REFS = " + repr(frozen_refs) + "\n"
+
+        # Gleiche Formeln in aufeinanderfolgenden Zeilen (Kalkulation!B16:L66) werden als Arrays gerechnet.
+        compiler = RowVectorCompiler(named_ranges.keys(), udf_names_from_signatures(sign_dict_lower))
+        row_codes = []
+        blocks = []
+        for coords in row_blocks({coord: r1c1 for coord, (_, r1c1) in formulas.items()}):
+            fkt_name = rows_function_name(coords)
+            try:
+                code, params = compiler.compile_rows(formulas[coords[0]][0], coords, fkt_name)
+            except (SyntaxError, ValueError) as e:
+                print(coords[0], "...", coords[-1], ": not vectorized,", e)
+                continue
+            row_codes.append(code)
+            blocks.append((fkt_name, coords, params))
+        print("Row blocks:", len(blocks), "with", sum(len(coords) for _, coords, _ in blocks), "cells")
+
+        single_refs = {name.lower(): normalize_ref(ref) for name, ref in named_ranges.items()
+                       if "!" in ref and ":" not in ref}
+        straight_code = straight_line_code(cell_codes, cell_functions, cell_order, single_refs, precedents, blocks)
+
+        text = py_code_import + "\n\n" + runtime_source() + "\n\n" + py_code_vars + "\n\n" + py_code_methods \
+            + "\n\n" + "\n\n".join(cell_codes.values()) + "\n\n" + "\n\n".join(row_codes) \
+            + "\n\n" + cell_dispatch_code(cell_functions) + "\n\n" + cell_order_code(cell_order) \
+            + "\n\n" + cell_precedents_code(precedents) + ("\n\n" + frozen_code if frozen_code else "") \
+            + "\n\n" + straight_code
         text = text.replace("\n\n\n\n\n", "\n\n")
         text = text.replace("\n\n\n\n", "\n\n")
         text = text.replace("\n\n\n", "\n\n")
@@ -71,7 +141,73 @@ class Step05(Runnable):
         with open("assets/output/xl_recombined.py", "w", encoding="utf-8") as f:
             f.write(text)
 
+    def fold_frozen(self, source: str, xlsm_path: str, named_ranges: dict, cell_codes: dict, cell_functions: dict,
+                    precedents: dict, cell_order: list) -> dict:
+        """
+        Schreibt die eingefrorenen Eingaben als Literale in cell_codes und rechnet die Formelzellen,
+        die nur von ihnen abhängen, schon jetzt: deren fkt_* liefert dann nur noch ein Literal.
+        Passt precedents an und liefert die eingefrorenen Eingaben 'Sheet!Cell' -> Name (oder Zelle).
+        """
+        workbook = openpyxl.load_workbook(xlsm_path)
+        refs = {name: normalize_ref(ref) for name, ref in named_ranges.items() if "!" in ref and ":" not in ref}
+        frozen_refs = {}
+        literals = {}
+        for key in self.frozen:
+            found = frozen_ref(key, refs, workbook.sheetnames)
+            if found is None:
+                print("Warning: Frozen input", key, "is no single-cell name, ignored.")
+                continue
+            key, ref = found
+            if ref in cell_functions:
+                print("Warning: Frozen input", key, "is a formula cell, ignored.")
+                continue
+            sheet_name, cell_ref = ref.split("!", 1)
+            try:
+                value = workbook[sheet_name][cell_ref].value
+            except (KeyError, ValueError):
+                print("Warning: Frozen input", key, "is no cell of the workbook, ignored.")
+                continue
+            value_literal = literal(value)
+            if value_literal is None:
+                print("Warning: Frozen input", key, "has no literal value, ignored.")
+                continue
+            frozen_refs[ref] = key
+            literals[ref] = value_literal
+
+        calculator = types.ModuleType("xl_recombined")
+        exec(source, calculator.__dict__)
+        calculator.init_workbook(workbook, named_ranges)
+        known = set(frozen_refs)
+        for coord in constant_cells(cell_order, precedents, frozen_refs):
+            if not precedents[coord] <= known:
+                continue  # ein Vorgänger ließ sich nicht als Literal schreiben
+            value_literal = literal(calculator.get_cell_value(coord))
+            if value_literal is not None:
+                known.add(coord)
+                literals[coord] = value_literal
+                cell_codes[coord] = constant_function(cell_functions[coord], value_literal)
+                print("Constant:", coord, "=", value_literal)
+
+        for coord, code in cell_codes.items():
+            if coord not in known:
+                cell_codes[coord] = fold_lookups(code, literals, refs)
+        for coord in precedents:
+            precedents[coord] = set() if coord in known else precedents[coord] - known
+        print("Frozen:", len(frozen_refs), "inputs,", len(known) - len(frozen_refs), "constant cells")
+        return frozen_refs
+
+
+def parse_frozen(argv=None) -> list[str]:
+    """
+    Liest --freeze NAME,NAME,... aus der Kommandozeile, z.B. --freeze alpha,beta1,gamma1,gamma2,gamma3.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--freeze", default="",
+                        help="Eingaben (Namen oder 'Sheet!Cell'), die als Literale in den Rechner geschrieben werden")
+    args, _ = parser.parse_known_args(argv)
+    return [key.strip() for key in args.freeze.split(",") if key.strip()]
+
 
 if __name__ == "__main__":
-    step = Step05()
+    step = Step05(frozen=parse_frozen())
     step.run()
\ No newline at end of file
@@ -8,7 +8,12 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 
 import os
 import shutil
+
+import openpyxl
+
 from labor import Runnable
+from xl_macro.xl_macro_reader import read_named_ranges
+from xl_macro.xl_snapshot import write_snapshot
 
 
 class Step06(Runnable):
@@ -20,6 +25,8 @@ class Step06(Runnable):
     def run(self):
         py_file = "assets/output/xl_recombined.py"
         target_file = "preprod/xl_code.py"
+        xlsm_path = "assets/input/Tarifrechner_KLV.xlsm"
+        snapshot_file = "preprod/xl_snapshot.json"
 
         print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
 
@@ -35,6 +42,14 @@ class Step06(Runnable):
         except Exception as e:
             print(f"Error while copying: {e}")
 
+        # Werte und Tafeln der Arbeitsmappe für den Rechner, damit er ohne openpyxl startet
+        if os.path.exists(target_file):
+            with open(target_file, encoding="utf-8") as file:
+                source = file.read()
+            index = write_snapshot(snapshot_file, openpyxl.load_workbook(xlsm_path), read_named_ranges(xlsm_path),
+                                   source)
+            print(f"Snapshot {snapshot_file}: {len(index['cells'])} cells, {len(index['ranges'])} ranges")
+
         print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
         print("Installed.")
 
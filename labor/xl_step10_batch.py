@@ -0,0 +1,69 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import argparse
+import os
+
+from labor import Runnable
+from xl_macro.xl_batch import run_batch, DEFAULT_BATCH_CELLS, DEFAULT_SHARD_SIZE
+
+
+class Step10(Runnable):
+
+    def __init__(self, input_path: str, output_path: str, workers=(1,), cells=DEFAULT_BATCH_CELLS,
+                 shard_size: int = DEFAULT_SHARD_SIZE, tables_path: str = None):
+        super().__init__()
+        print("Step 10: Batch calculation with preprod/xl_code.py.")
+        self.input_path = input_path
+        self.output_path = output_path
+        self.workers = workers
+        self.cells = cells
+        self.shard_size = shard_size
+        self.tables_path = tables_path
+
+    def run(self):
+        xlsm_path = "assets/input/Tarifrechner_KLV.xlsm"
+        snapshot_file = "preprod/xl_snapshot.json"
+        if os.path.exists(snapshot_file):
+            xlsm_path = snapshot_file
+
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        print("Workbook:", xlsm_path)
+        results = []
+        for workers in self.workers:
+            stats = run_batch(self.input_path, self.output_path, xlsm_path, workers=workers,
+                              cells=self.cells, shard_size=self.shard_size, tables_path=self.tables_path)
+            print(f"Workers {workers:3d}: {stats['contracts']} Verträge in {stats['seconds']:.2f} s, "
+                  f"{stats['per_second']:.0f} Verträge/s")
+            results.append(stats)
+
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        print(f"Written {self.output_path}.")
+        return results
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Tarife für eine Datei von Verträgen rechnen (CSV oder Parquet).")
+    parser.add_argument("input", help="Vertragsdaten, Spalten sind Namen der Arbeitsmappe wie x, n, t, VS, Sex")
+    parser.add_argument("output", help="Ergebnisdatei, .csv oder .parquet")
+    parser.add_argument("--workers", "-w", default="1",
+                        help="Anzahl Worker-Prozesse, mehrere durch Komma für einen Durchsatzvergleich (Default: 1)")
+    parser.add_argument("--cells", default=",".join(DEFAULT_BATCH_CELLS),
+                        help="Ergebniszellen 'Sheet!Cell', durch Komma getrennt")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE,
+                        help="Verträge je Auftrag an einen Worker (Default: %(default)s)")
+    parser.add_argument("--tables", default=None,
+                        help="Kommutationsvektoren vorab in diese .npy-Datei rechnen, die Worker teilen sie per mmap")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    step = Step10(args.input, args.output, workers=[int(w) for w in args.workers.split(",")],
+                  cells=tuple(args.cells.split(",")), shard_size=args.shard_size, tables_path=args.tables)
+    step.run()
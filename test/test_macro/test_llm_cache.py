@@ -0,0 +1,63 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import os
+import tempfile
+import unittest
+
+from langchain_core.messages import SystemMessage, HumanMessage
+
+from xl_macro.llm_cache import LlmResponseCache
+
+
+class TestLlmResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "cache", "llm.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_key_depends_on_model_and_messages(self):
+        messages = [SystemMessage(content="system"), HumanMessage(content="Sub Test()")]
+        key = LlmResponseCache.make_key("gemma3:27b", messages)
+        self.assertEqual(key, LlmResponseCache.make_key("gemma3:27b", list(messages)))
+        self.assertNotEqual(key, LlmResponseCache.make_key("devstral-small-2:24b", messages))
+        self.assertNotEqual(key, LlmResponseCache.make_key(
+            "gemma3:27b", [SystemMessage(content="system"), HumanMessage(content="Sub Test2()")]))
+        # gleicher Text, anderer Rollentyp
+        self.assertNotEqual(key, LlmResponseCache.make_key(
+            "gemma3:27b", [HumanMessage(content="system"), HumanMessage(content="Sub Test()")]))
+
+    def test_hit_miss_and_persistence(self):
+        cache = LlmResponseCache(self.path)
+        key = LlmResponseCache.make_key("m", [HumanMessage(content="x")])
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "m", "```python\ndef x():\n    pass\n```")
+        self.assertEqual(cache.get(key), "```python\ndef x():\n    pass\n```")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        cache.close()
+
+        reopened = LlmResponseCache(self.path)
+        self.assertEqual(reopened.get(key), "```python\ndef x():\n    pass\n```")
+        reopened.close()
+
+    def test_size_based_eviction_drops_least_recently_used(self):
+        cache = LlmResponseCache(self.path, max_bytes=25)
+        cache.put("a", "m", "a" * 10)
+        cache.put("b", "m", "b" * 10)
+        cache.get("a")
+        cache.put("c", "m", "c" * 10)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), "a" * 10)
+        self.assertEqual(cache.get("c"), "c" * 10)
+        self.assertEqual(cache.stats()["evictions"], 1)
+        self.assertLessEqual(cache.stats()["bytes"], 25)
+        cache.close()
@@ -0,0 +1,47 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import threading
+import time
+import unittest
+
+from xl_macro.llm_scheduler import LlmScheduler, parse_jobs
+
+
+class TestLlmScheduler(unittest.TestCase):
+
+    def test_results_keep_input_order(self):
+        def slow_echo(i):
+            time.sleep(0.01 * (5 - i % 5))
+            return i * 10
+
+        scheduler = LlmScheduler(jobs=4)
+        self.assertEqual(scheduler.map(slow_echo, range(12)), [i * 10 for i in range(12)])
+
+    def test_pool_is_bounded(self):
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def request(_):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        LlmScheduler(jobs=3).map(request, range(10))
+        self.assertLessEqual(peak[0], 3)
+        self.assertGreater(peak[0], 1)
+
+    def test_jobs_argument(self):
+        self.assertEqual(parse_jobs(["--jobs", "6"]), 6)
+        self.assertEqual(parse_jobs([]), 1)
+        with self.assertRaises(ValueError):
+            LlmScheduler(jobs=0)
@@ -8,7 +8,9 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 
 import unittest
 import sys
-from xl_macro.py_code_utils import code_extract, clean_import
+from xl_macro.py_code_utils import code_extract, clean_import, group_formula_classes, instantiate_translation, \
+    identifier_index, lookup_identifiers
+from xl_macro.xl_formula_parser import formula_identifiers
 
 
 class TestExcelMacro(unittest.TestCase):
@@ -120,3 +122,66 @@ import sys"""
         self.assertEqual(imports, "import os\nimport sys")
         self.assertEqual(code, "")
         print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+
+    def test_groups_row_shifted_formulas(self):
+        formulas = {
+            "Kalkulation!K6": ("Kalkulation", "Kalkulation!K6", "str", "fkt_kalkulation_k6", "", [], [], "VS*R[-1]C[0]"),
+            "Kalkulation!F16": ("Kalkulation", "Kalkulation!F16", "str", "fkt_kalkulation_f16", "", [], [], "VS*R[0]C[-1]"),
+            "Kalkulation!F17": ("Kalkulation", "Kalkulation!F17", "str", "fkt_kalkulation_f17", "", [], [], "VS*R[0]C[-1]"),
+            "Tafeln!F17": ("Tafeln", "Tafeln!F17", "str", "fkt_tafeln_f17", "", [], [], "VS*R[0]C[-1]"),
+        }
+        classes = group_formula_classes(formulas)
+        self.assertEqual(classes, {
+            "Kalkulation!K6": ["Kalkulation!K6"],
+            "Kalkulation!F16": ["Kalkulation!F16", "Kalkulation!F17"],
+            "Tafeln!F17": ["Tafeln!F17"],
+        })
+
+    def test_looks_up_whole_identifiers(self):
+        names = identifier_index(["Zins", "t", "k", "x", "ratzu"])
+        meanings = identifier_index(["act_dx", "act_axn_k", "act_dx2"])
+        identifiers = formula_identifiers("'''=Act_axn_k(x,t,Zins)*ZINS+Act_Dx(x+1)&\"k\"'''")
+        # k steckt nur in Act_axn_k und im Text, ratzu gar nicht.
+        self.assertEqual(lookup_identifiers(identifiers, names), ["Zins", "t", "x"])
+        self.assertEqual(lookup_identifiers(identifiers, meanings), ["act_dx", "act_axn_k"])
+
+    def test_instantiates_translation_for_shifted_cell(self):
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        response = """```python
+def fkt_kalkulation_h16():
+    alpha = get_excel_global('alpha')
+    F16 = get_cell_value("Kalkulation!F16")
+    a16_value = get_cell_value("Kalkulation!A16")
+    gamma3 = get_excel_global('gamma3')
+    return F16 + alpha * act_axn_k(x + a16_value, max(5 - a16_value, 0), 16) + gamma3
+```"""
+        formula = "'''=F16+alpha*Act_axn_k(x+$A16,MAX(5-$A16,0),16)+gamma3'''"
+        result = instantiate_translation(response, formula, "Kalkulation!H16", "Kalkulation!I18")
+        print(result)
+        self.assertIn("def fkt_kalkulation_i18():", result)
+        self.assertIn('G18 = get_cell_value("Kalkulation!G18")', result)
+        # $A: Spalte fest, Zeile relativ
+        self.assertIn('a18_value = get_cell_value("Kalkulation!A18")', result)
+        self.assertIn("return G18 + alpha * act_axn_k(x + a18_value, max(5 - a18_value, 0), 16) + gamma3", result)
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+
+    def test_instantiates_references_by_sheet_and_spelling(self):
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        response = """def fkt_kalkulation_c16():
+    a16 = get_cell_value("Kalkulation!A16")
+    fest = get_cell_value("Kalkulation!$A16")
+    qx = get_cell_value("Tafeln!B16")
+    return a16 + fest + qx * get_cell_value("Kalkulation!B16")
+"""
+        formula = "'''=A16+$A16+Tafeln!B$16*B16'''"
+        result = instantiate_translation(response, formula, "Kalkulation!C16", "Kalkulation!D17")
+        print(result)
+        self.assertIn('b17 = get_cell_value("Kalkulation!B17")', result)
+        self.assertIn('fest = get_cell_value("Kalkulation!$A17")', result)
+        # Tafeln!B$16: Zeile fest, unabhängig von B16 auf dem eigenen Blatt
+        self.assertIn('qx = get_cell_value("Tafeln!C16")', result)
+        self.assertIn('qx * get_cell_value("Kalkulation!C17")', result)
+        # ohne '$' in der Antwort passt weder A$16 noch $A16
+        with self.assertRaises(ValueError):
+            instantiate_translation(response, "'''=A$16+$A16'''", "Kalkulation!C16", "Kalkulation!D17")
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
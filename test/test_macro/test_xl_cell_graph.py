@@ -0,0 +1,38 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import unittest
+
+from xl_macro.xl_cell_graph import name_refs, formula_precedents, topological_order, CycleError
+
+NAMES = {"B_xt": "Kalkulation!$K$5", "x": "Kalkulation!$B$4", "v_Tafeln": "Tafeln!$B$3:$C$3",
+         "_xleta.MAX": "#NAME?"}
+
+
+class TestXlCellGraph(unittest.TestCase):
+
+    def test_precedents_follow_cells_names_and_ranges(self):
+        refs = name_refs(NAMES)
+        self.assertEqual(refs["v_tafeln"], ["Tafeln!B3", "Tafeln!C3"])
+        self.assertNotIn("_xleta.max", refs)
+        precedents = formula_precedents("'''=IF(A16<=n,B_xt*$A$16+SUM(Tafeln!B4:B5),x)'''", "Kalkulation!C16", refs)
+        self.assertEqual(precedents, {"Kalkulation!A16", "Kalkulation!K5", "Tafeln!B4", "Tafeln!B5",
+                                      "Kalkulation!B4"})
+        # Funktionen sind keine Namen, auch wenn sie gleich heißen
+        self.assertEqual(formula_precedents("=x(1)", "Kalkulation!C16", refs), set())
+
+    def test_order_puts_precedents_first(self):
+        graph = {"S!K7": {"S!K5", "S!E12"}, "S!K5": {"S!B4"}, "S!E12": {"S!K5"}, "S!B16": set()}
+        self.assertEqual(topological_order(graph), ["S!K5", "S!E12", "S!K7", "S!B16"])
+
+    def test_cycle_is_reported(self):
+        graph = {"S!A1": {"S!B1"}, "S!B1": {"S!C1"}, "S!C1": {"S!A1"}, "S!D1": {"S!A1"}}
+        with self.assertRaises(CycleError) as context:
+            topological_order(graph)
+        self.assertEqual(context.exception.cells, ["S!A1", "S!B1", "S!C1", "S!A1"])
+        self.assertIn("S!A1 -> S!B1", str(context.exception))
@@ -0,0 +1,309 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import os
+import tempfile
+import timeit
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import openpyxl
+import pandas as pd
+
+from labor.preprod import xl_code
+from xl_macro.xl_batch import price_batch, run_batch
+from xl_macro.xl_macro_reader import read_named_ranges
+from xl_macro.xl_snapshot import write_snapshot
+
+XLSM_PATH = "test/assets/input/Tarifrechner_KLV.xlsm"
+
+
+# Schleifen wie in den VBA-Funktionen v_lx ... v_Rx, als Referenz für die NumPy-Fassungen.
+def loop_lx(grenze, sex, tafel):
+    vek = [0.0] * (grenze + 1)
+    vek[0] = 1000000
+    for i in range(1, grenze + 1):
+        vek[i] = round(vek[i - 1] * (1 - xl_code.act_qx(i - 1, sex, tafel)), xl_code.rund_lx)
+    return vek
+
+
+def loop_tx(grenze, sex, tafel):
+    lx = loop_lx(grenze, sex, tafel)
+    vek = [0.0] * (grenze + 1)
+    for i in range(grenze):
+        vek[i] = round(lx[i] - lx[i + 1], xl_code.rund_tx)
+    return vek
+
+
+def loop_dx(grenze, sex, tafel, zins):
+    lx = loop_lx(grenze, sex, tafel)
+    v = 1 / (1 + zins)
+    return [round(lx[i] * v ** i, xl_code.rund_Dx) for i in range(grenze + 1)]
+
+
+def loop_cx(grenze, sex, tafel, zins):
+    tx = loop_tx(grenze, sex, tafel)
+    v = 1 / (1 + zins)
+    vek = [0.0] * (grenze + 1)
+    for i in range(grenze):
+        vek[i] = round(tx[i] * v ** (i + 1), xl_code.rund_Cx)
+    return vek
+
+
+def loop_sum(values, digits):
+    max_alter = xl_code.max_Alter
+    vek = [0.0] * (max_alter + 1)
+    vek[max_alter] = values[max_alter]
+    for i in range(max_alter - 1, -1, -1):
+        vek[i] = round(vek[i + 1] + values[i], digits)
+    return vek
+
+
+def loop_vectors(sex, tafel, zins):
+    max_alter = xl_code.max_Alter
+    nx = loop_sum(loop_dx(max_alter, sex, tafel, zins), xl_code.rund_Dx)
+    mx = loop_sum(loop_cx(max_alter, sex, tafel, zins), xl_code.rund_Mx)
+    return {"lx": loop_lx(max_alter, sex, tafel), "tx": loop_tx(max_alter, sex, tafel),
+            "Dx": loop_dx(max_alter, sex, tafel, zins), "Cx": loop_cx(max_alter, sex, tafel, zins),
+            "Nx": nx, "Mx": mx, "Rx": loop_sum(mx, xl_code.rund_Rx)}
+
+
+def numpy_vectors(sex, tafel, zins):
+    return {"lx": xl_code.v_lx(-1, sex, tafel), "tx": xl_code.v_tx(-1, sex, tafel),
+            "Dx": xl_code.v_dx(-1, sex, tafel, zins), "Cx": xl_code.v_cx(-1, sex, tafel, zins),
+            "Nx": xl_code.v_nx(sex, tafel, zins), "Mx": xl_code.v_mx(sex, tafel, zins),
+            "Rx": xl_code.v_rx(sex, tafel, zins)}
+
+
+class TestXlCode(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.workbook = openpyxl.load_workbook(XLSM_PATH)
+        cls.names = read_named_ranges(XLSM_PATH)
+
+    def setUp(self):
+        xl_code.init_workbook(self.workbook, self.names)
+
+    def test_act_qx_reads_the_table_column(self):
+        tafeln = self.workbook["Tafeln"]
+        self.assertEqual(xl_code.act_qx(40, "M", "DAV1994_T"), tafeln["B44"].value)
+        self.assertEqual(xl_code.act_qx(0, "W", "dav2008_t"), tafeln["E4"].value)
+        self.assertEqual(xl_code.act_qx(123, "F", "DAV1994_T"), tafeln["C127"].value)
+        with self.assertRaises(ValueError):
+            xl_code.act_qx(40, "M", "DAV2018_T")
+
+    def test_commutation_vectors_match_vba_loops(self):
+        for sex, tafel, zins in (("M", "DAV1994_T", 0.0175), ("F", "DAV2008_T", 0.0), ("M", "DAV2008_T", 0.04)):
+            expected = loop_vectors(sex, tafel, zins)
+            actual = numpy_vectors(sex, tafel, zins)
+            for kind, values in expected.items():
+                self.assertTrue(np.array_equal(actual[kind], values), f"{kind} {sex} {tafel} {zins}")
+        self.assertEqual(len(xl_code.v_lx(40, "M", "DAV1994_T")), 41)
+        self.assertEqual(xl_code.v_cx(40, "M", "DAV1994_T", 0.0175)[40], 0)
+
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        loops = timeit.timeit(lambda: loop_vectors("M", "DAV1994_T", 0.0175), number=20) / 20
+        vectors = timeit.timeit(lambda: numpy_vectors("M", "DAV1994_T", 0.0175), number=20) / 20
+        print(f"Kommutationswerte: Schleifen {loops * 1000:.2f} ms, NumPy {vectors * 1000:.2f} ms")
+
+    def test_cells_match_excel(self):
+        cached = openpyxl.load_workbook(XLSM_PATH, data_only=True)["Kalkulation"]
+        for ref in ("K5", "K6", "K7", "K9", "E12", "B16", "C16", "L66"):
+            expected = cached[ref].value
+            self.assertAlmostEqual(xl_code.get_cell_value("Kalkulation!" + ref), expected,
+                                   delta=abs(expected) * 1e-9, msg=ref)
+
+    def test_vector_cache_keeps_whole_vectors(self):
+        xl_code.initialize_cache()
+        before = xl_code.vector_cache().stats()
+        dx = [xl_code.act_dx(alter, "M", "DAV1994_T", 0.0175) for alter in range(0, 100)]
+        self.assertEqual(dx, list(xl_code.v_dx(-1, "M", "DAV1994_T", 0.0175)[:100]))
+        self.assertEqual(xl_code.act_lx(40, "m", "dav1994_t"), xl_code.v_lx(40, "M", "DAV1994_T")[40])
+        stats = xl_code.vector_cache().stats()
+        self.assertEqual(stats["hits"] - before["hits"], 99)
+        self.assertEqual(stats["misses"] - before["misses"], 2)
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(xl_code.act_cx(40, "M", "DAV1994_T", 0.0175), 0.0)
+
+    def test_vector_cache_evicts_least_recently_used(self):
+        cache = xl_code.VectorCache(maxsize=2)
+        cache.put(("Dx", "M", "DAV1994_T", 0.01, None, None, 1), np.zeros(1))
+        cache.put(("Dx", "M", "DAV1994_T", 0.02, None, None, 1), np.zeros(1))
+        cache.get(("Dx", "M", "DAV1994_T", 0.01, None, None, 1))
+        cache.put(("Dx", "M", "DAV1994_T", 0.03, None, None, 1), np.zeros(1))
+        self.assertIsNone(cache.get(("Dx", "M", "DAV1994_T", 0.02, None, None, 1)))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1, "evictions": 1, "entries": 2, "attached": 0})
+
+    def test_price_batch_matches_single_contracts(self):
+        contracts = pd.DataFrame({"x": [40, 30, 55, 40], "n": [20, 35, 10, 20], "t": [20, 35, 10, 15],
+                                  "Sex": ["M", "F", "M", "M"], "Zins": [0.0175, 0.0175, 0.01, 0.0175]})
+        cells = ("Kalkulation!K5", "Kalkulation!K6", "Kalkulation!K7", "Kalkulation!B16")
+        batch = price_batch(xl_code, contracts, cells)
+        for index, row in contracts.iterrows():
+            xl_code.assume_inputs(row.to_dict())
+            for cell in cells:
+                self.assertAlmostEqual(batch.at[index, cell], xl_code.get_cell_value(cell),
+                                       delta=abs(batch.at[index, cell]) * 1e-12, msg=f"{index} {cell}")
+        xl_code.invalidate()
+
+        cached = openpyxl.load_workbook(XLSM_PATH, data_only=True)["Kalkulation"]
+        base = price_batch(xl_code, {"x": [self.workbook["Kalkulation"]["B4"].value]})
+        self.assertAlmostEqual(base.at[0, "Kalkulation!K5"], cached["K5"].value, delta=cached["K5"].value * 1e-9)
+
+    def test_requests_run_concurrently_in_own_contexts(self):
+        base = xl_code.current_context()
+        ages = list(range(20, 60, 3))
+
+        def premium(x):
+            with xl_code.calc_context(base.fork()):
+                xl_code.set_excel_global("x", x)
+                return xl_code.get_cell_value("Kalkulation!K5")
+
+        expected = [premium(x) for x in ages]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            self.assertEqual(list(pool.map(premium, ages * 3)), expected * 3)
+        self.assertEqual(xl_code.get_excel_global("x"), self.workbook["Kalkulation"]["B4"].value)
+
+    def test_run_batch_streams_shards_in_input_order(self):
+        contracts = pd.DataFrame({"x": list(range(25, 50, 2)), "n": [20] * 13, "t": [20] * 13,
+                                  "Sex": ["M", "F"] * 6 + ["M"]})
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "contracts.csv")
+            output_path = os.path.join(tmp, "out", "results.csv")
+            contracts.to_csv(input_path, index=False)
+            stats = run_batch(input_path, output_path, XLSM_PATH, workers=2, shard_size=5)
+            results = pd.read_csv(output_path, index_col=0)
+        self.assertEqual(stats["contracts"], 13)
+        expected = price_batch(xl_code, contracts)
+        self.assertEqual(list(results.index), list(range(13)))
+        self.assertTrue(np.allclose(results.to_numpy(), expected.to_numpy(), rtol=1e-12))
+
+    def test_run_batch_reports_a_failed_worker_start(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = os.path.join(tmp, "contracts.csv")
+            pd.DataFrame({"x": [30, 40]}).to_csv(input_path, index=False)
+            # die Schranke darf nicht auf einen Worker warten, der nie ankommt
+            with self.assertRaises(Exception):
+                run_batch(input_path, os.path.join(tmp, "results.csv"), os.path.join(tmp, "missing.xlsm"), workers=2)
+
+    def test_snapshot_replaces_the_workbook(self):
+        with open(xl_code.__file__, encoding="utf-8") as file:
+            source = file.read()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "xl_snapshot.json")
+            index = write_snapshot(path, self.workbook, self.names, source)
+            snapshot, names = xl_code.load_snapshot(path)
+            self.assertNotIn("Kalkulation!K5", index["cells"])  # Formelzellen rechnet der Rechner
+
+            expected = {ref: xl_code.get_cell_value("Kalkulation!" + ref) for ref in ("K5", "K6", "K7", "L66")}
+            xl_code.init_workbook(snapshot, names)
+            for ref, value in expected.items():
+                self.assertEqual(xl_code.get_cell_value("Kalkulation!" + ref), value, ref)
+            self.assertEqual(xl_code.get_excel_range("m_Tafeln")[40][0], self.workbook["Tafeln"]["B44"].value)
+            qx = xl_code.act_qx(40, "M", "DAV1994_T")
+            xl_code.set_cell_value("Tafeln!B44", 0.5)
+            self.assertEqual(xl_code.get_excel_range("m_Tafeln")[40][0], 0.5)
+            self.assertNotEqual(qx, 0.5)
+            self.assertEqual(xl_code.act_qx(40, "M", "DAV1994_T"), 0.5)
+            with self.assertRaises(KeyError):
+                xl_code.get_cell_value("Kalkulation!Z99")
+            xl_code.init_workbook(self.workbook, self.names)  # gibt die mmap-Datei frei
+
+    def test_writing_a_table_cell_rebuilds_derived_tables(self):
+        with xl_code.calc_context(xl_code.current_context().fork()):
+            k5 = xl_code.get_cell_value("Kalkulation!K5")
+            qx = xl_code.act_qx(40, "M", "DAV1994_T")
+            xl_code.set_cell_value("Tafeln!B44", 0.5)
+            self.assertEqual(xl_code.act_qx(40, "M", "DAV1994_T"), 0.5)
+            k5_changed = xl_code.get_cell_value("Kalkulation!K5")
+            self.assertNotEqual(k5_changed, k5)
+
+            changed = xl_code.update_inputs({"Tafeln!B44": 0.9})
+            self.assertEqual(xl_code.act_qx(40, "M", "DAV1994_T"), 0.9)
+            self.assertNotEqual(changed["Kalkulation!K5"], k5_changed)
+
+            xl_code.current_context().inputs["Tafeln!B44"] = qx  # direkt geschrieben, dann invalidate()
+            xl_code.invalidate()
+            self.assertEqual(xl_code.act_qx(40, "M", "DAV1994_T"), qx)
+            self.assertEqual(xl_code.get_cell_value("Kalkulation!K5"), k5)
+
+    def test_forked_requests_read_the_tables_of_the_parent(self):
+        base = xl_code.current_context()
+        expected = xl_code.get_cell_value("Kalkulation!K5")
+        qx = xl_code.act_qx(40, "M", "DAV1994_T")
+        with xl_code.calc_context(base.fork()) as request:
+            xl_code.invalidate(tables=False)
+            self.assertEqual(xl_code.get_cell_value("Kalkulation!K5"), expected)
+            self.assertIs(xl_code.qx_tables(), base.caches["qx_tables"])
+            stats = xl_code.vector_cache().stats()
+            self.assertEqual((stats["misses"], stats["entries"]), (0, 0))
+            # eigene Tafelwerte verwerfen nur die Tabellen dieser Anfrage
+            xl_code.set_cell_value("Tafeln!B44", 0.5)
+            self.assertEqual(xl_code.act_qx(40, "M", "DAV1994_T"), 0.5)
+            self.assertEqual(request.fork().shared, {})
+        self.assertEqual(xl_code.act_qx(40, "M", "DAV1994_T"), qx)
+        self.assertEqual(xl_code.get_cell_value("Kalkulation!K5"), expected)
+
+    def test_commutation_tables_are_attached_read_only(self):
+        expected = xl_code.get_cell_value("Kalkulation!K5")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tables.npy")
+            count = xl_code.export_commutation_tables(path, [("M", "DAV1994_T", 0.0175), ("F", "DAV1994_T", 0.0175)])
+            self.assertEqual(count, 10)
+            with xl_code.calc_context(xl_code.current_context().fork()):
+                self.assertEqual(xl_code.attach_commutation_tables(path), 10)
+                self.assertEqual(xl_code.get_cell_value("Kalkulation!K5"), expected)
+                stats = xl_code.vector_cache().stats()
+                self.assertEqual(stats["misses"], 0)
+                self.assertEqual((stats["entries"], stats["attached"]), (0, 10))
+                self.assertFalse(xl_code.commutation_vector("Dx", "M", "DAV1994_T", 0.0175).flags.writeable)
+                self.assertNotIn("qx_tables", xl_code.current_context().caches)  # keine Tafel gelesen
+                # ein kleiner LRU verdrängt die gemeinsamen Tabellen nicht
+                xl_code.vector_cache().maxsize = 1
+                xl_code.commutation_vector("Dx", "M", "DAV1994_T", 0.03)
+                xl_code.commutation_vector("Dx", "M", "DAV1994_T", 0.04)
+                self.assertEqual(xl_code.vector_cache().stats()["attached"], 10)
+                xl_code.vector_cache().clear()  # gibt die mmap-Datei frei
+            # ohne Endung: np.save hängt .npy an, attach muss dieselbe Datei finden
+            stem = os.path.join(tmp, "tables")
+            xl_code.export_commutation_tables(stem, [("M", "DAV1994_T", 0.0175)])
+            self.assertTrue(os.path.exists(stem + ".npy"))
+            with xl_code.calc_context(xl_code.current_context().fork()):
+                self.assertEqual(xl_code.attach_commutation_tables(stem), 5)
+                xl_code.vector_cache().clear()
+
+    def test_evaluate_all_computes_each_cell_once(self):
+        context = xl_code.current_context()
+        for ref in xl_code.CELL_ORDER:
+            evaluations = context.evaluations
+            context.values[ref] = xl_code.CELL_DISPATCH[ref]()
+            self.assertEqual(context.evaluations, evaluations, f"{ref} pulls an unevaluated cell")
+        values = dict(zip(xl_code.CELL_ORDER, xl_code.evaluate_all()))
+        xl_code.invalidate()
+        self.assertEqual(values["Kalkulation!K5"], xl_code.get_cell_value("Kalkulation!K5"))
+        self.assertEqual(len(values), len(xl_code.CELL_DISPATCH))
+
+    def test_calculate_all_matches_evaluate_all(self):
+        values = xl_code.calculate_all()
+        self.assertEqual(xl_code.recalc_stats()["evaluations"], 0)
+        self.assertEqual(values, xl_code.evaluate_all())
+
+    def test_update_inputs_recomputes_dependents_of_vs(self):
+        xl_code.evaluate_all()
+        k5 = xl_code.get_cell_value("Kalkulation!K5")
+        evaluations = xl_code.recalc_stats()["evaluations"]
+        vs = xl_code.get_excel_global("VS")
+        changed = xl_code.update_inputs({"VS": vs * 2})
+        self.assertAlmostEqual(changed["Kalkulation!K6"], 2 * vs * k5, delta=vs * k5 * 1e-12)
+        self.assertNotIn("Kalkulation!K5", changed)
+        self.assertLess(xl_code.recalc_stats()["evaluations"] - evaluations, len(xl_code.CELL_ORDER))
+        values = xl_code.evaluate_all()
+        xl_code.invalidate()
+        self.assertEqual(values, xl_code.evaluate_all())
@@ -0,0 +1,53 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import unittest
+
+import numpy as np
+
+from xl_macro.xl_fold import literal, fold_lookups, constant_cells, frozen_ref
+
+FKT_CODE = """def fkt_kalkulation_k7():
+    ratzu = get_excel_global('ratzu')
+    zw = get_excel_global('zw')
+    k = get_excel_global('k')
+    return (1 + ratzu) / zw * (get_cell_value("Kalkulation!K6") + get_cell_value("Kalkulation!$A$16"))
+"""
+
+
+class TestXlFold(unittest.TestCase):
+
+    def test_literal(self):
+        self.assertEqual(literal(0.025), "0.025")
+        self.assertEqual(literal(np.float64(0.1) * 3), repr(0.1 * 3))
+        self.assertEqual(literal("DAV1994_T"), "'DAV1994_T'")
+        self.assertIsNone(literal(float("nan")))
+        self.assertIsNone(literal(np.zeros(2)))
+
+    def test_fold_lookups_replaces_frozen_names_and_cells(self):
+        refs = {"ratzu": "Kalkulation!E12", "zw": "Kalkulation!B9", "k": "Kalkulation!E11"}
+        literals = {"Kalkulation!E12": "0.05", "Kalkulation!E11": "0", "Kalkulation!A16": "0"}
+        folded = fold_lookups(FKT_CODE, literals, refs)
+        self.assertIn("    ratzu = 0.05\n", folded)
+        self.assertIn("    zw = get_excel_global('zw')\n", folded)
+        self.assertIn("    k = 0\n", folded)
+        self.assertIn('(get_cell_value("Kalkulation!K6") + 0)', folded)
+
+    def test_constant_cells_need_only_frozen_precedents(self):
+        precedents = {"S!E12": {"S!B9"}, "S!K5": {"S!B4"}, "S!K7": {"S!E12", "S!E11"}, "S!K8": {"S!K7", "S!K5"}}
+        self.assertEqual(constant_cells(["S!E12", "S!K5", "S!K7", "S!K8"], precedents, {"S!B9", "S!E11"}),
+                         ["S!E12", "S!K7"])
+
+    def test_frozen_ref_ignores_case_and_unknown_names(self):
+        refs = {"alpha": "Kalkulation!E4", "Zins": "Kalkulation!E6"}
+        sheetnames = ["Kalkulation", "Tafeln"]
+        self.assertEqual(frozen_ref("ALPHA", refs, sheetnames), ("alpha", "Kalkulation!E4"))
+        self.assertEqual(frozen_ref("zins", refs, sheetnames), ("Zins", "Kalkulation!E6"))
+        self.assertEqual(frozen_ref("'kalkulation'!$e$5", refs, sheetnames), ("'kalkulation'!$e$5", "Kalkulation!E5"))
+        self.assertIsNone(frozen_ref("alpah", refs, sheetnames))
+        self.assertIsNone(frozen_ref("Kalkulation!XYZ", refs, sheetnames))
@@ -0,0 +1,57 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import unittest
+
+from xl_macro.xl_formula_compiler import compile_formula, udf_names_from_signatures
+
+NAMES = {"n": 30, "t": 20, "VS": 100000, "zw": 12, "x": 40}
+CELLS = {"Kalkulation!A16": 0, "Kalkulation!G16": 0, "Kalkulation!H16": 5, "Kalkulation!K5": 0.5}
+UDF_NAMES = udf_names_from_signatures({"act_dx": "```python\ndef act_dx(alter: int, zins: float) -> float:\n```"})
+
+
+def run_compiled(formula: str, coord: str = "Kalkulation!L16"):
+    code = compile_formula(formula, coord, "fkt_test", NAMES.keys(), UDF_NAMES)
+    scope = {"get_excel_global": NAMES.__getitem__, "get_cell_value": CELLS.__getitem__,
+             "act_dx": lambda alter, zins: alter * 10 + zins}
+    exec(code, scope)
+    return code, scope["fkt_test"]()
+
+
+class TestXlFormulaCompiler(unittest.TestCase):
+
+    def test_names_and_cells(self):
+        code, value = run_compiled("'''=VS*K5'''", "Kalkulation!K6")
+        self.assertIn("VS = get_excel_global('VS')", code)
+        self.assertIn('get_cell_value("Kalkulation!K5")', code)
+        self.assertEqual(value, 50000)
+
+    def test_nested_if_with_percent(self):
+        code, value = run_compiled("=IF(zw=2,2%,IF(zw=4,3%,IF(zw=12,5%,0)))")
+        self.assertEqual(value, 0.05)
+
+    def test_iferror_catches_division_by_zero(self):
+        code, value = run_compiled("=IFERROR(IF(A16>n,0,IF(A16<t,H16/G16,VS)),0)")
+        self.assertIn("except Exception:", code)
+        self.assertEqual(value, 0)
+
+    def test_excel_precedence_in_python(self):
+        self.assertEqual(run_compiled("=-2^2")[1], 4)
+        self.assertEqual(run_compiled("=2^3^2")[1], 64)
+        self.assertEqual(run_compiled("=(1+1)*3-4/2")[1], 4)
+        self.assertEqual(run_compiled("=IF(AND(x>=18,OR(n<10,t=20)),MAX(1,2,3),MIN(1,0))")[1], 3)
+
+    def test_vba_functions_use_python_names(self):
+        code, value = run_compiled("=Act_Dx(x+$A16,2)")
+        self.assertIn("act_dx(x + get_cell_value(\"Kalkulation!A16\"), 2)", code)
+        self.assertEqual(value, 402)
+
+    def test_unsupported_formulas_are_left_for_the_model(self):
+        for formula in ("=SUM(A1:A5)", "=A1&\"x\"", "=VLOOKUP(x,A1:B5,2)", "=unknown_name*2", "=#N/A"):
+            with self.assertRaises((SyntaxError, ValueError)):
+                compile_formula(formula, "Kalkulation!A1", "fkt_a1", NAMES.keys(), UDF_NAMES)
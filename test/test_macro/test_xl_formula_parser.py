@@ -0,0 +1,65 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import unittest
+
+from xl_macro.xl_formula_parser import tokenize_formula, formula_to_r1c1, shift_cell_ref, column_letter, \
+    column_index, strip_formula, parse_formula, formula_cell_refs
+
+
+class TestXlFormulaParser(unittest.TestCase):
+
+    def test_tokenize_distinguishes_cells_names_and_functions(self):
+        tokens = tokenize_formula("IF(A16<=n,beta1*$A$16,LOG10(B_xt))")
+        kinds = [(kind, value) for kind, value in tokens if kind in ("CELL", "IDENTIFIER")]
+        self.assertEqual(kinds, [("IDENTIFIER", "IF"), ("CELL", "A16"), ("IDENTIFIER", "n"),
+                                 ("IDENTIFIER", "beta1"), ("CELL", "$A$16"), ("IDENTIFIER", "LOG10"),
+                                 ("IDENTIFIER", "B_xt")])
+
+    def test_tokenize_sheet_and_string(self):
+        tokens = tokenize_formula("'Tafel 1'!B3&\"a\"\"b\"")
+        self.assertEqual(tokens, [("SHEET", "'Tafel 1'!"), ("CELL", "B3"), ("OPERATOR", "&"),
+                                  ("STRING", "\"a\"\"b\"")])
+
+    def test_row_shifted_formulas_share_r1c1(self):
+        b16 = formula_to_r1c1("'''=IF(A16<=n,Act_Dx(x+$A16,Sex,Tafel,Zins),0)'''", 16, 2)
+        b17 = formula_to_r1c1("=IF(A17<=n, Act_Dx(x+$A17,Sex,Tafel,Zins),0)", 17, 2)
+        self.assertEqual(b16, b17)
+        self.assertEqual(b16, "IF(R[0]C[-1]<=n,Act_Dx(x+R[0]C1,Sex,Tafel,Zins),0)")
+        self.assertNotEqual(b16, formula_to_r1c1("=IF(A16<=n,Act_Dx(x+$A16,Sex,Tafel,Zins),0)", 17, 2))
+
+    def test_formula_cell_refs_keep_sheet_and_spelling(self):
+        self.assertEqual(formula_cell_refs("=A16+$A16+SUM('Tafel 1'!B$3:C9)*B16"),
+                         [(None, "A16"), (None, "$A16"), ("Tafel 1", "B$3"), ("Tafel 1", "C9"), (None, "B16")])
+
+    def test_shift_keeps_absolute_parts(self):
+        self.assertEqual(shift_cell_ref("A16", 2, 1), "B18")
+        self.assertEqual(shift_cell_ref("$A16", 2, 1), "$A18")
+        self.assertEqual(shift_cell_ref("A$16", 2, 1), "B$16")
+        with self.assertRaises(ValueError):
+            shift_cell_ref("A1", -1, 0)
+
+    def test_column_letters(self):
+        for index in (1, 26, 27, 52, 703, 16384):
+            self.assertEqual(column_index(column_letter(index)), index)
+        self.assertEqual(column_letter(28), "AB")
+
+    def test_strip_formula(self):
+        self.assertEqual(strip_formula("'''=VS*K5'''"), "VS*K5")
+        self.assertEqual(strip_formula("=VS*K5"), "VS*K5")
+
+    def test_parse_follows_excel_precedence(self):
+        self.assertEqual(parse_formula("=-2^2"),
+                         ("binary", "^", ("unary", "-", ("number", 2)), ("number", 2)))
+        self.assertEqual(parse_formula("=1+2*3%"),
+                         ("binary", "+", ("number", 1),
+                          ("binary", "*", ("number", 2), ("percent", ("number", 3)))))
+        self.assertEqual(parse_formula("=SUM(Tafeln!$B$4:B10)"),
+                         ("call", "SUM", [("range", "Tafeln", "$B$4", "B10")]))
+        with self.assertRaises(SyntaxError):
+            parse_formula("=IF(A1,2")
@@ -8,7 +8,9 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 
 import unittest
 
-from xl_macro.xl_macro_parser import  extract_code_chunks
+from xl_macro.xl_macro_parser import  extract_code_chunks, iter_tokens_vba, iter_code_chunks, tokenize_vba, \
+    SourceBuffer, iter_chunk_records, CallIndex
+from xl_macro.xl_formula_parser import formula_identifiers
 
 
 class TestExcelMacro(unittest.TestCase):
@@ -49,4 +51,49 @@ Dim a As Integer
 
 
 
-        self.assertEqual(chunks, expected)
\ No newline at end of file
+        self.assertEqual(chunks, expected)
+
+    def test_chunks_are_yielded_as_they_complete(self):
+        code = "Attribute VB_Name = \"Modul1\"\nFunction F(a)\n    F = a\nEnd Function\n" + "x = 1\n" * 1000
+        tokens = iter_tokens_vba(code)
+        chunks = iter_code_chunks(tokens, {})
+        self.assertEqual(next(chunks)[0], "++Attribute++")
+        meaning, params, text, line_start, line_end, _ = next(chunks)
+        self.assertEqual((meaning, params, line_start, line_end), ("F", ["a"], 2, 4))
+        self.assertEqual(text, "Function F(a)\n    F = a\nEnd Function")
+        # Der Rest des Moduls ist noch nicht gelesen.
+        self.assertEqual(next(tokens), ("NEWLINE", "\n"))
+
+    def test_tokenizer_rejects_unknown_characters(self):
+        self.assertEqual(tokenize_vba("a = 1"), [("IDENTIFIER", "a"), ("SPACE", " "), ("OTHER", "="),
+                                                 ("SPACE", " "), ("NUMBER", "1")])
+        with self.assertRaises(SyntaxError):
+            tokenize_vba("a = `")
+
+    def test_chunk_records_point_into_the_buffer(self):
+        code = "Dim a As Integer\na = Zins\nSub Test(n As Integer)\n    x = zw\nEnd Sub\n"
+        names = {"Zins": "Kalkulation!$E$4", "zw": "Kalkulation!$B$9"}
+        buffer = SourceBuffer()
+        buffer.add("Modul0.bas", "")
+        module_id = buffer.add("Modul1.bas", code)
+        used = {}
+        records = list(iter_chunk_records(buffer, module_id, names, used))
+        self.assertEqual([record.as_tuple() for record in records], extract_code_chunks(code, names)[0])
+        self.assertEqual(used, names)
+        test = records[1]
+        self.assertEqual((test.module_id, test.start, test.end), (1, 26, 67))
+        self.assertEqual(test.code, code[26:67])
+        self.assertFalse(hasattr(test, "__dict__"))
+
+    def test_call_index_matches_whole_identifiers(self):
+        procedures = {
+            "Act_Dx": "Function Act_Dx(x)\n    Act_Dx = v_Dx(x) ' nicht Act_Dx2\nEnd Function",
+            "Act_Dx2": "Function Act_Dx2(x)\n    Act_Dx2 = ACT_DX(x) ^ 2 & \"v_Dx\"\nEnd Function",
+            "v_Dx": "Function v_Dx(x)\n    v_Dx = x\nEnd Function",
+        }
+        index = CallIndex(procedures)
+        self.assertEqual(index.callees("Act_Dx"), ["v_Dx"])
+        self.assertEqual(index.callees("Act_Dx2"), ["Act_Dx"])
+        self.assertEqual(index.callees("v_Dx"), [])
+        self.assertEqual(index.lookup(formula_identifiers("'''=act_Dx2(x)+Act_dx2(x+1)*Act_Dx_Sum'''")),
+                         ["Act_Dx2"])
@@ -0,0 +1,73 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import unittest
+
+import numpy as np
+
+from xl_macro.xl_formula_compiler import compile_formula, udf_names_from_signatures
+from xl_macro.xl_formula_parser import formula_to_r1c1
+from xl_macro.xl_row_vector import RowVectorCompiler, row_blocks, rows_function_name
+
+NAMES = {"n": 3, "t": 2, "VS": 1000, "x": 40}
+UDF_NAMES = udf_names_from_signatures({"act_dx": "```python\ndef act_dx(alter: int, zins: float) -> float:\n```"})
+COORDS = [f"Kalkulation!L{row}" for row in range(16, 21)]
+COLUMNS = {"A": [0, 1, 2, 3, 4], "G": [2.0, 0.0, 4.0, 1.0, 1.0], "H": [1.0, 5.0, 2.0, 3.0, 3.0]}
+
+
+def scope():
+    cells = {f"Kalkulation!{letter}{16 + i}": value for letter, values in COLUMNS.items()
+             for i, value in enumerate(values)}
+    return {"np": np, "get_excel_global": NAMES.__getitem__, "get_cell_value": cells.__getitem__,
+            "act_dx": lambda alter, zins: alter * 10 + zins}
+
+
+def run_rows(formula: str, coords: list[str] = COORDS):
+    code, params = RowVectorCompiler(NAMES.keys(), UDF_NAMES).compile_rows(formula, coords, "rows_test")
+    rows_scope = scope()
+    exec(code, rows_scope)
+    args = [np.array([rows_scope["get_cell_value"](coord) for coord in coords_of]) for coords_of in params]
+    vector = rows_scope["rows_test"](*args)
+
+    scalar = []
+    for coord in coords:
+        row = int(coord.split("!")[1][1:])
+        cell_scope = scope()
+        exec(compile_formula(formula.replace("16", str(row)), coord, "fkt_test", NAMES.keys(), UDF_NAMES), cell_scope)
+        scalar.append(cell_scope["fkt_test"]())
+    return code, list(vector), scalar
+
+
+class TestXlRowVector(unittest.TestCase):
+
+    def test_row_blocks_need_consecutive_rows(self):
+        formulas = {f"Kalkulation!B{row}": formula_to_r1c1(f"=A{row}*2", row, 2) for row in range(16, 22)}
+        formulas["Kalkulation!B30"] = formula_to_r1c1("=A30*2", 30, 2)
+        formulas["Kalkulation!C16"] = formula_to_r1c1("=A16*2", 16, 3)
+        self.assertEqual(row_blocks(formulas), [[f"Kalkulation!B{row}" for row in range(16, 22)]])
+        self.assertEqual(rows_function_name(COORDS), "rows_kalkulation_l16_l20")
+
+    def test_iferror_with_nested_if(self):
+        code, vector, scalar = run_rows("'''=IFERROR(IF(A16>n,0,IF(A16<t,H16/G16,VS)),0)'''")
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        print(code)
+        self.assertIn("def rows_test(col_a, col_h, col_g):", code)
+        self.assertIn("np.where(col_a > n, 0, np.where(col_a < t, col_h / col_g, VS))", code)
+        self.assertEqual(vector, scalar)
+        self.assertEqual(vector, [0.5, 0.0, 1000.0, 1000.0, 0.0])
+
+    def test_max_min_and_or(self):
+        code, vector, scalar = run_rows("=IF(OR(A16>n,AND(G16>1,H16<2)),0,MIN(150,MAX(50,act_Dx(x+$A16,H16))))")
+        self.assertIn("np.minimum(150, np.maximum(50, act_dx(x + col_a, col_h)))", code)
+        self.assertEqual(vector, scalar)
+
+    def test_other_rows_stay_scalar(self):
+        with self.assertRaises(ValueError):
+            RowVectorCompiler(NAMES.keys(), UDF_NAMES).compile_rows("=H15+A16", COORDS, "rows_test")
+        with self.assertRaises(ValueError):
+            RowVectorCompiler(NAMES.keys(), UDF_NAMES).compile_rows("=VS*2", COORDS, "rows_test")
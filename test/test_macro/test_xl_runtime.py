@@ -0,0 +1,182 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from openpyxl import Workbook
+
+from xl_macro.py_code_utils import runtime_source, cell_dispatch_code, cell_order_code, cell_precedents_code
+
+# Eine Kette wie L66 -> H66/G66 -> ...: jede Zeile liest die Vorgängerzeile zweimal.
+FKT_CODE = """
+def fkt_kalkulation_b1():
+    return get_excel_global('x') + 1
+
+def fkt_kalkulation_b2():
+    return get_cell_value("Kalkulation!B1") + get_cell_value("Kalkulation!B1")
+
+def fkt_kalkulation_b3():
+    return get_cell_value("Kalkulation!B2") + get_cell_value("Kalkulation!B2")
+
+def fkt_kalkulation_b4():
+    return get_cell_value("Kalkulation!B3") + get_cell_value("Kalkulation!B3") + get_cell_value("Kalkulation!A1")
+"""
+
+
+CELL_FUNCTIONS = {f"Kalkulation!B{row}": f"fkt_kalkulation_b{row}" for row in range(1, 5)}
+
+CELL_PRECEDENTS = {"Kalkulation!B1": {"Kalkulation!E6"}, "Kalkulation!B2": {"Kalkulation!B1"},
+                   "Kalkulation!B3": {"Kalkulation!B2"}, "Kalkulation!B4": {"Kalkulation!B3", "Kalkulation!A1"}}
+
+
+def build_calculator(fkt_code: str = FKT_CODE, cell_functions: dict = CELL_FUNCTIONS,
+                     tafel: str = "Kalkulation!$E$1:$E$3"):
+    """
+    Baut einen Rechner so zusammen wie Step05: Laufzeit, fkt_*-Funktionen, CELL_DISPATCH.
+    """
+    module = types.ModuleType("xl_code_test")
+    exec(runtime_source() + "\n\n" + fkt_code + "\n\n" + cell_dispatch_code(cell_functions) + "\n\n"
+         + cell_order_code(list(cell_functions)), module.__dict__)
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Kalkulation"
+    sheet["A1"] = 10
+    sheet["E6"] = 2
+    module.init_workbook(workbook, {"x": "Kalkulation!$E$6", "b_eins": "'Kalkulation'!$B$1",
+                                    "Tafel": tafel})
+    return module
+
+
+class TestXlRuntime(unittest.TestCase):
+
+    def test_each_cell_is_evaluated_once(self):
+        calc = build_calculator()
+        self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 34)
+        stats = calc.recalc_stats()
+        self.assertEqual(stats["evaluations"], 4)
+        self.assertEqual(stats["saved"], 3)
+        self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 34)
+        self.assertEqual(calc.recalc_stats()["evaluations"], 4)
+
+    def test_writing_an_input_invalidates(self):
+        calc = build_calculator()
+        self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 34)
+        calc.set_excel_global("x", 3)
+        self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 42)
+        calc.set_cell_value("Kalkulation!A1", 0)
+        self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 32)
+        self.assertEqual(calc.recalc_stats()["evaluations"], 12)
+
+    def test_invalid_reference(self):
+        calc = build_calculator()
+        with self.assertRaises(ValueError):
+            calc.get_cell_value("B4")
+
+    def test_dispatch_table_and_reference_spelling(self):
+        calc = build_calculator(cell_functions={"Kalkulation!B1": "fkt_kalkulation_b1"})
+        self.assertIs(calc.CELL_DISPATCH["Kalkulation!B1"], calc.fkt_kalkulation_b1)
+        self.assertEqual(calc.get_cell_value("Kalkulation!$B$1"), 3)
+        self.assertEqual(calc.get_cell_value2("Kalkulation", "b1"), 3)
+        self.assertEqual(calc.get_cell_value("kalkulation!b1"), 3)
+        self.assertEqual(calc.get_cell_value("'KALKULATION'!$E$6"), 2)
+        calc.set_cell_value("kalkulation!e6", 4)
+        self.assertEqual(calc.get_cell_value("Kalkulation!B1"), 5)
+        self.assertEqual(calc.recalc_stats()["evaluations"], 2)
+        # ohne Eintrag in CELL_DISPATCH gilt der Wert der Arbeitsmappe
+        self.assertIsNone(calc.get_cell_value("Kalkulation!B2"))
+
+    def test_names_are_resolved_once(self):
+        calc = build_calculator()
+        self.assertEqual(calc.current_context().name_refs, {"x": "Kalkulation!E6", "b_eins": "Kalkulation!B1"})
+        self.assertEqual(calc.get_excel_global("x"), 2)
+        # ein Name auf einer Formelzelle liefert den berechneten Wert
+        self.assertEqual(calc.get_excel_global("b_eins"), 3)
+        calc.set_excel_global("x", 5)
+        self.assertEqual(calc.get_excel_global("b_eins"), 6)
+        with self.assertRaises(KeyError):
+            calc.get_excel_global("y")
+        with self.assertRaises(ValueError):
+            calc.get_excel_global("Tafel")
+
+    def test_contexts_do_not_share_inputs(self):
+        calc = build_calculator()
+        base = calc.current_context()
+        with calc.calc_context(base.fork()) as request:
+            calc.set_excel_global("x", 3)
+            self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 42)
+            self.assertIs(calc.current_context(), request)
+        self.assertIs(calc.current_context(), base)
+        self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 34)
+        # die Arbeitsmappe bleibt unverändert
+        self.assertEqual(base.workbook["Kalkulation"]["E6"].value, 2)
+
+    def test_evaluate_all_follows_cell_order(self):
+        calc = build_calculator()
+        self.assertEqual(calc.evaluate_all(), [3, 6, 12, 34])
+        self.assertEqual(calc.recalc_stats()["evaluations"], 4)
+        self.assertEqual(calc.recalc_stats()["saved"], 6)
+
+    def test_circular_reference_is_rejected(self):
+        calc = build_calculator(fkt_code="def fkt_kalkulation_b1():\n    return get_cell_value('Kalkulation!B1') + 1\n",
+                                cell_functions={"Kalkulation!B1": "fkt_kalkulation_b1"})
+        with self.assertRaises(ValueError):
+            calc.get_cell_value("Kalkulation!B1")
+        self.assertNotIn("Kalkulation!B1", calc.current_context().values)
+
+    def test_update_inputs_recomputes_only_dependents(self):
+        calc = build_calculator()
+        exec(cell_precedents_code(CELL_PRECEDENTS), calc.__dict__)
+        self.assertEqual(calc.evaluate_all(), [3, 6, 12, 34])
+        self.assertEqual(calc.update_inputs({"Kalkulation!A1": 11}), {"Kalkulation!B4": 35})
+        self.assertEqual(calc.recalc_stats()["evaluations"], 5)
+        self.assertEqual(calc.update_inputs({"x": 3}), {"Kalkulation!B1": 4, "Kalkulation!B2": 8,
+                                                         "Kalkulation!B3": 16, "Kalkulation!B4": 43})
+        self.assertEqual(calc.update_inputs({"x": 3}), {})
+        # eine Zelle, die keine Formel liest, verwirft den ganzen Stand
+        self.assertIsNone(calc.dirty_cells(["Kalkulation!Z9"]))
+
+    def test_dependents_are_emitted_and_published_whole(self):
+        calc = build_calculator()
+        calc.CELL_PRECEDENTS = CELL_PRECEDENTS
+        # ohne CELL_DEPENDENTS bauen parallele Anfragen die Tabelle, keine sieht eine halbe
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(calc.dirty_cells, [["Kalkulation!E6"]] * 32))
+        self.assertEqual(results, [{"Kalkulation!B1", "Kalkulation!B2", "Kalkulation!B3", "Kalkulation!B4"}] * 32)
+        exec(cell_precedents_code(CELL_PRECEDENTS), calc.__dict__)
+        self.assertEqual(calc.CELL_DEPENDENTS["Kalkulation!B3"], ("Kalkulation!B4",))
+        self.assertIs(calc.cell_dependents(), calc.CELL_DEPENDENTS)
+
+    def test_writing_a_table_cell_drops_values_from_tables(self):
+        fkt_code = FKT_CODE + """
+def fkt_kalkulation_c1():
+    return context_cache("summe", lambda: sum(row[0] or 0 for row in get_excel_range("Tafel")))
+"""
+        calc = build_calculator(fkt_code, {**CELL_FUNCTIONS, "Kalkulation!C1": "fkt_kalkulation_c1"},
+                                "Kalkulation!$A$1:$A$3")
+        exec(cell_precedents_code(CELL_PRECEDENTS), calc.__dict__)
+        self.assertEqual(calc.get_cell_value("Kalkulation!C1"), 10)
+        # A1 liegt in Tafel und wird von B4 gelesen; C1 hängt nur über die Tabelle an A1
+        calc.set_cell_value("Kalkulation!A1", 11)
+        self.assertEqual(calc.get_cell_value("Kalkulation!C1"), 11)
+        self.assertEqual(calc.update_inputs({"Kalkulation!A1": 12}),
+                         {"Kalkulation!B1": 3, "Kalkulation!B2": 6, "Kalkulation!B3": 12, "Kalkulation!B4": 36,
+                          "Kalkulation!C1": 12})
+
+    def test_frozen_inputs_cannot_be_written(self):
+        calc = build_calculator()
+        calc.FROZEN_REFS["Kalkulation!E6"] = "x"
+        with self.assertRaises(ValueError):
+            calc.set_excel_global("x", 3)
+        with self.assertRaises(ValueError):
+            calc.assume_inputs({"x": 3})
+        for ref in ("Kalkulation!$E$6", "'Kalkulation'!E6", "kalkulation!e6"):
+            with self.assertRaises(ValueError):
+                calc.assume_inputs({ref: 3})
+        self.assertEqual(calc.get_cell_value("Kalkulation!B4"), 34)
@@ -0,0 +1,95 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import types
+import unittest
+
+from openpyxl import Workbook
+
+from xl_macro.py_code_utils import runtime_source, cell_dispatch_code, cell_order_code
+from xl_macro.xl_straight import straight_line_code
+
+CELL_CODES = {
+    "Kalkulation!E12": """def fkt_kalkulation_e12():
+    zw = get_excel_global('zw')
+    return 0.05 if zw == 12 else 0
+""",
+    "Kalkulation!K5": """def fkt_kalkulation_k5():
+    ratzu = get_excel_global('ratzu')
+    faktor = 1 + ratzu
+    return faktor * get_cell_value("Kalkulation!A1")
+""",
+    "Kalkulation!K6": """def fkt_kalkulation_k6():
+    try:
+        return get_cell_value("Kalkulation!$K$5") / get_cell_value("Kalkulation!A2")
+    except Exception:
+        return 0
+""",
+    "Kalkulation!K7": """def fkt_kalkulation_k7():
+    summe = 0
+    for i in range(3):
+        summe += get_cell_value("Kalkulation!K6")
+    return summe
+""",
+}
+CELL_FUNCTIONS = {"Kalkulation!E12": "fkt_kalkulation_e12", "Kalkulation!K5": "fkt_kalkulation_k5",
+                  "Kalkulation!K6": "fkt_kalkulation_k6", "Kalkulation!K7": "fkt_kalkulation_k7"}
+PRECEDENTS = {"Kalkulation!E12": {"Kalkulation!B9"}, "Kalkulation!K5": {"Kalkulation!E12", "Kalkulation!A1"},
+              "Kalkulation!K6": {"Kalkulation!K5", "Kalkulation!A2"}, "Kalkulation!K7": {"Kalkulation!K6"}}
+NAMES = {"zw": "Kalkulation!$B$9", "ratzu": "Kalkulation!$E$12"}
+
+
+def build_calculator(a2, row_blocks=(), row_code="") -> types.ModuleType:
+    order = list(CELL_FUNCTIONS)
+    name_refs = {name.lower(): ref.replace("$", "") for name, ref in NAMES.items()}
+    module = types.ModuleType("xl_code_test")
+    exec(runtime_source() + "\n\n" + "\n\n".join(CELL_CODES.values()) + "\n\n" + cell_dispatch_code(CELL_FUNCTIONS)
+         + "\n\n" + cell_order_code(order) + "\n\n"
+         + row_code + "\n\n" + straight_line_code(CELL_CODES, CELL_FUNCTIONS, order, name_refs, PRECEDENTS, row_blocks),
+         module.__dict__)
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Kalkulation"
+    sheet["A1"] = 100
+    sheet["A2"] = a2
+    sheet["B9"] = 12
+    module.init_workbook(workbook, NAMES)
+    return module
+
+
+class TestXlStraight(unittest.TestCase):
+
+    def test_calculate_all_matches_evaluate_all(self):
+        for a2 in (4, 0):
+            calc = build_calculator(a2)
+            values = calc.calculate_all()
+            calc.invalidate()
+            self.assertEqual(values, calc.evaluate_all())
+        self.assertEqual(values, [0.05, 105.0, 0, 0])
+
+    def test_cells_become_locals(self):
+        source = straight_line_code(CELL_CODES, CELL_FUNCTIONS, list(CELL_FUNCTIONS),
+                                    {"ratzu": "Kalkulation!E12", "zw": "Kalkulation!B9"}, PRECEDENTS)
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        print(source)
+        self.assertIn("g_zw = get_excel_global('zw')", source)
+        self.assertIn("l1_faktor = 1 + c_kalkulation_e12", source)
+        self.assertIn("c_kalkulation_k6 = c_kalkulation_k5 / v_kalkulation_a2", source)
+        self.assertNotIn("fkt_kalkulation_k6()", source)
+        # Die Schleife lässt sich nicht einsetzen: Aufruf, K6 steht dafür im Speicher.
+        self.assertIn("c_kalkulation_k7 = values['Kalkulation!K7'] = fkt_kalkulation_k7()", source)
+        self.assertIn("values['Kalkulation!K6'] = c_kalkulation_k6", source)
+
+    def test_row_block_falls_back_to_single_cells(self):
+        blocks = [("rows_test", ["Kalkulation!K5"], [["Kalkulation!A1"]])]
+        for row_code in ("def rows_test(col_a):\n    return np.asarray(col_a * 1.05)\n",
+                         "def rows_test(col_a):\n    raise IndexError('age beyond the table')\n"):
+            calc = build_calculator(4, blocks, row_code)
+            values = calc.calculate_all()
+            self.assertEqual(values[:3], [0.05, 105.0, 26.25])
+            self.assertEqual(values, calc.evaluate_all())
@@ -0,0 +1,173 @@
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import time
+import unittest
+
+from xl_macro.xl_vba_parser import parse_vba_module, parse_vba_project
+
+MODULE = '''Attribute VB_Name = "mTest"
+Option Explicit
+Private cache As Object
+Public Const max_alter As Integer = 123
+
+Private Sub InitializeCache()
+    If cache Is Nothing Then Set cache = CreateObject("Scripting.Dictionary")
+End Sub
+
+Public Function Act_Dx(ByVal Alter As Integer, Optional Zins As Double = 0.0175, _
+                       Optional Tafel As String = "DAV1994_T") As Double
+    Dim sKey As String, vek() As Variant
+    Call InitializeCache
+    sKey = CreateCacheKey("Dx", Alter, Zins) & "|"  ' Act_Dx2 im Kommentar
+    If cache.Exists(sKey) Then
+        Act_Dx = cache(sKey)
+    ElseIf Alter > max_alter Then
+        Act_Dx = 0#
+    Else
+        vek = v_Dx(Zins, Tafel)
+        Act_Dx = vek(Alter)
+        cache.Add sKey, Act_Dx
+    End If
+End Function
+
+Public Function Act_Dx2(Alter As Integer) As Double
+    Dim i As Integer
+    Select Case Alter
+        Case Is < 0, 200 To 300
+            Error (1)
+        Case Else
+            For i = Alter To 0 Step -1
+                Act_Dx2 = Act_Dx2 + Act_Dx(i) ^ 2
+            Next i
+    End Select
+End Function
+
+Private Function CreateCacheKey(Art As String, Alter As Integer, Zins As Double) As String
+    CreateCacheKey = Art & "_" & Alter & "_" & Zins & """"
+End Function
+
+Private Function v_Dx(Zins As Double, Tafel As String) As Variant
+    v_Dx = WorksheetFunction.Transpose(Range(Tafel))
+End Function
+'''
+
+
+class TestXlVbaParser(unittest.TestCase):
+
+    def test_symbols_and_calls(self):
+        module = parse_vba_module(MODULE)
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        for procedure in module.procedures:
+            print(procedure, procedure.symbols, procedure.references)
+        self.assertEqual(module.name, "mTest")
+        self.assertEqual(sorted(module.symbols), ["cache", "max_alter"])
+        act_dx = module.procedures[1]
+        self.assertEqual((act_dx.name, act_dx.kind, act_dx.return_type), ("Act_Dx", "FUNCTION", "Double"))
+        self.assertEqual((act_dx.line_start, act_dx.line_end), (10, 24))
+        self.assertEqual([(p.name, p.optional) for p in act_dx.params],
+                         [("Alter", False), ("Zins", True), ("Tafel", True)])
+        self.assertEqual({name: s.kind for name, s in act_dx.symbols.items() if s.kind == "local"},
+                         {"skey": "local", "vek": "local"})
+        # vek(Alter) und cache(sKey) sind Index, kein Aufruf.
+        self.assertEqual([name for name, _ in act_dx.references], ["InitializeCache", "CreateCacheKey", "v_Dx"])
+        self.assertEqual(act_dx.body[2], ("assign", 14, ("name", "sKey"), (
+            "binary", "&", ("apply", ("name", "CreateCacheKey"), [("string", "Dx"), ("name", "Alter"),
+                                                                  ("name", "Zins")]), ("string", "|"))))
+        self.assertEqual(act_dx.body[3][0], "if")
+        self.assertEqual(len(act_dx.body[3][2]), 2)
+        self.assertEqual(act_dx.body[3][3][-1], ("call", 22, ("apply", ("member", ("name", "cache"), "Add"),
+                                                             [("name", "sKey"), ("name", "Act_Dx")])))
+
+        key = module.procedures[3]
+        self.assertEqual(key.body[0][3][3], ("string", '"'))
+
+    def test_call_graph(self):
+        project = parse_vba_project({"mTest.bas": MODULE})
+        self.assertEqual(project.call_graph(), {
+            "InitializeCache": [],
+            "Act_Dx": ["InitializeCache", "CreateCacheKey", "v_Dx"],
+            "Act_Dx2": ["Act_Dx"],
+            "CreateCacheKey": [],
+            "v_Dx": []})
+        self.assertEqual(project.callers("act_dx"), ["Act_Dx2"])
+        self.assertEqual(project.unreachable(["Act_Dx"]), ["Act_Dx2"])
+        self.assertEqual(project.names_used(project.procedures["v_dx"], {"Tafel": "Kalkulation!$B$7"}), {})
+        other = parse_vba_project({"mTest.bas": MODULE, "mOther.bas": "Sub Lauf()\n  x = v_Dx(1, 2)\nEnd Sub\n"})
+        # v_Dx ist Private in mTest.
+        self.assertEqual(other.call_graph()["Lauf"], [])
+
+    def test_array_bounds(self):
+        module = parse_vba_module("""Public v(0 To 123) As Double
+Private w(1 To 5, 3)
+Dim z(max_alter)
+Sub A(n As Long)
+    Dim a(1 To 10) As Double
+    ReDim Preserve a(1 To n)
+    ReDim v(0 To n + 1)
+End Sub
+""", "mBounds")
+        self.assertEqual(module.symbols["v"].bounds, [(("number", 0), ("number", 123))])
+        self.assertEqual(module.symbols["w"].bounds, [(("number", 1), ("number", 5)), (None, ("number", 3))])
+        self.assertEqual(module.symbols["z"].bounds, [(None, ("name", "max_alter"))])
+        procedure = module.procedures[0]
+        self.assertEqual(procedure.symbols["a"].bounds, [(("number", 1), ("number", 10))])
+        self.assertEqual(procedure.body[1], ("redim", 6, [(("name", "a"), [(("number", 1), ("name", "n"))])]))
+        # v bleibt die Variable des Moduls
+        self.assertNotIn("v", procedure.symbols)
+        self.assertEqual(procedure.body[2][2][0][1][0][1], ("binary", "+", ("name", "n"), ("number", 1)))
+
+    def test_number_literals_and_type_suffixes(self):
+        module = parse_vba_module('Sub A()\n    Dim b&\n    b& = 2& + &HFF& + &O17 + 1#\n'
+                                  '    s = Left$(t, 2)&"x"&b\nEnd Sub\n', "mLiterals")
+        body = module.procedures[0].body
+        self.assertEqual(body[1], ("assign", 3, ("name", "b"), (
+            "binary", "+", ("binary", "+", ("binary", "+", ("number", 2), ("number", 255)), ("number", 15)),
+            ("number", 1))))
+        self.assertEqual(body[2][3], ("binary", "&", ("binary", "&", (
+            "apply", ("name", "Left$"), [("name", "t"), ("number", 2)]), ("string", "x")), ("name", "b")))
+
+    def test_file_statements(self):
+        module = parse_vba_module("""Sub Export(path As String)
+    Dim f As Integer, s As String
+    f = FreeFile
+    Open path For Output Access Write As #f Len = 128
+    Print #f, s; 1, "x"
+    Write #1, s
+    Line Input #f, s
+    Close #f, #2
+    Close
+    Debug.Print s; f
+End Sub
+""", "mFile")
+        body = module.procedures[0].body
+        self.assertEqual(body[2], ("open", 4, ("name", "path"), ["FOR", "OUTPUT", "ACCESS", "WRITE"], ("name", "f"),
+                                   ("number", 128)))
+        self.assertEqual(body[3], ("file", 5, "PRINT", ("name", "f"), [("name", "s"), ("number", 1), ("string", "x")]))
+        self.assertEqual(body[4], ("file", 6, "WRITE", ("number", 1), [("name", "s")]))
+        self.assertEqual(body[5], ("file", 7, "LINE INPUT", ("name", "f"), [("name", "s")]))
+        self.assertEqual(body[6], ("file", 8, "CLOSE", None, [("name", "f"), ("number", 2)]))
+        self.assertEqual(body[7], ("file", 9, "CLOSE", None, []))
+        self.assertEqual(body[8][2], ("apply", ("member", ("name", "Debug"), "Print"), [("name", "s"), ("name", "f")]))
+        self.assertEqual([name for name, _ in module.procedures[0].references], ["FreeFile", "Debug"])
+
+    def test_syntax_error_has_line(self):
+        with self.assertRaises(SyntaxError) as context:
+            parse_vba_module("Sub A()\n  If x Then\n    y = 1\nEnd Sub\n", "mBroken")
+        self.assertIn("mBroken line 4", str(context.exception))
+
+    def test_large_module_is_fast(self):
+        module_code = MODULE.replace("Attribute VB_Name = \"mTest\"\n", "")
+        procedures = module_code.split("\n\n", 1)[1]
+        code = "\n".join(procedures.replace("Act_Dx2", f"Act_Dx2_{i}") for i in range(200))
+        start = time.perf_counter()
+        module = parse_vba_module(code, "mLarge")
+        elapsed = time.perf_counter() - start
+        print(f"{len(code.splitlines())} lines in {elapsed:.3f}s")
+        self.assertEqual(len(module.procedures), 1000)
+        self.assertLess(elapsed, 1.0)
@@ -11,6 +11,8 @@ from langchain_ollama import ChatOllama
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from langchain_core.prompts import PromptTemplate
 
+from xl_macro.llm_cache import LlmResponseCache
+
 CELL_NAME_VALUE = """from openpyxl import Workbook
 from openpyxl.utils import range_boundaries
 
@@ -413,9 +415,24 @@ def prompt_doc_var(code: str, full_code: str, names: str) -> list:
     ]
     return messages
 
+# Optionaler Antwort-Cache, wird von den Steps über set_response_cache gesetzt.
+response_cache: LlmResponseCache | None = None
+
+def set_response_cache(cache: LlmResponseCache | None):
+    global response_cache
+    response_cache = cache
+
 def get_response(messages: list, model: str) -> str:
+    cache = response_cache
+    if cache is not None:
+        key = cache.make_key(model, messages)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
     llm = ChatOllama(model=model, base_url=BASE_URL)
     response = llm.invoke(messages)
+    if cache is not None:
+        cache.put(key, model, response.content)
     return response.content
 
 def request_doc(label: str, code: str, full_code: str, names: str) -> str:
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Relativ zum Arbeitsverzeichnis der Steps (labor/), wie assets/output.
+DEFAULT_CACHE_PATH = "assets/cache/llm_responses.sqlite3"
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class LlmResponseCache:
+    """
+    Persistenter Cache für LLM-Antworten in einer SQLite-Datei.
+
+    Der Schlüssel ist ein SHA-256 über Modellname und die serialisierten Nachrichten
+    (Typ und Inhalt), d.h. nur byte-identische Anfragen treffen denselben Eintrag.
+    Überschreitet die Summe der Antworten max_bytes, werden die am längsten nicht
+    gelesenen Einträge entfernt. Die Instanz darf von mehreren Threads benutzt werden.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int | None = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL
+            )""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_access ON responses(last_access)")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(model: str, messages: list) -> str:
+        """
+        Bildet den Schlüssel aus Modellname und Nachrichtenverlauf.
+        """
+        payload = json.dumps([model, [(msg.type, msg.content) for msg in messages]],
+                             ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._db.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._db.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+            return row[0]
+
+    def put(self, key: str, model: str, response: str):
+        size = len(response.encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model, response, size, now, now))
+            self._evict()
+            self._db.commit()
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute(
+                "SELECT key, size FROM responses ORDER BY last_access").fetchall():
+            if total <= self.max_bytes:
+                break
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        requests = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / requests if requests else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """
+    Ergänzt --cache PATH und --no-cache für den Antwort-Cache.
+    """
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH,
+                        help="SQLite-Datei für gecachte LLM-Antworten (Default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Jede Anfrage an das Modell schicken")
+    return parser
+
+
+def open_cache_from_args(argv=None) -> LlmResponseCache | None:
+    """
+    Öffnet den Antwort-Cache gemäß Kommandozeile, für die __main__-Blöcke der Steps.
+    """
+    parser = add_cache_arguments(argparse.ArgumentParser())
+    args, _ = parser.parse_known_args(argv)
+    if args.no_cache:
+        return None
+    return LlmResponseCache(args.cache)
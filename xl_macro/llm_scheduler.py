@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Anzahl paralleler LLM-Anfragen, wenn nichts anderes angegeben ist.
+# Ollama bedient parallele Anfragen nur, wenn OLLAMA_NUM_PARALLEL > 1 gesetzt ist.
+DEFAULT_JOBS = 1
+
+
+class LlmScheduler:
+    """
+    Verteilt unabhängige LLM-Anfragen (Chunks, Zellen) auf einen begrenzten Worker-Pool.
+
+    Die Ergebnisse werden immer in der Reihenfolge der Eingabe zurückgegeben,
+    damit sie direkt in die Zeilen des DataFrames zurückgeschrieben werden können.
+    Mit jobs=1 läuft alles sequentiell im aufrufenden Thread.
+    """
+
+    def __init__(self, jobs: int = DEFAULT_JOBS):
+        if jobs < 1:
+            raise ValueError(f"jobs must be >= 1, got {jobs}")
+        self.jobs = jobs
+
+    def map(self, fkt: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """
+        Wendet fkt auf alle items an, mit höchstens self.jobs gleichzeitigen Aufrufen.
+
+        :param fkt: Funktion, die eine Anfrage ausführt (z.B. request_doc mit festen Parametern)
+        :param items: Eingaben, je Eingabe ein Aufruf
+        :return: Ergebnisse in der Reihenfolge der items
+        """
+        items = list(items)
+        if self.jobs == 1 or len(items) < 2:
+            return [fkt(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(items))) as pool:
+            return list(pool.map(fkt, items))
+
+
+def request_timed(request: Callable[..., R], **kwargs) -> tuple[R, int]:
+    """
+    Führt eine LLM-Anfrage aus und misst die Dauer im Worker selbst,
+    damit Wartezeiten im Pool nicht mitgezählt werden.
+
+    :return: (response, duration in ms)
+    """
+    start = time.time()
+    response = request(**kwargs)
+    end = time.time()
+    return response, int((end - start) * 1000)
+
+
+def add_jobs_argument(parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
+    """
+    Ergänzt den Parameter --jobs N für die Anzahl paralleler LLM-Anfragen.
+    """
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS,
+                        help="Anzahl paralleler LLM-Anfragen (Default: %(default)s)")
+    return parser
+
+
+def parse_jobs(argv=None) -> int:
+    """
+    Liest --jobs N aus der Kommandozeile, für die __main__-Blöcke der Steps.
+    """
+    parser = add_jobs_argument(argparse.ArgumentParser())
+    args, _ = parser.parse_known_args(argv)
+    return args.jobs
@@ -8,20 +8,30 @@ https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
 """
 
 
+import ast
+import inspect
 import re
 import os
 import openpyxl
 from openpyxl.worksheet.formula import ArrayFormula
 
+from xl_macro import xl_runtime
+from xl_macro.xl_formula_parser import formula_to_r1c1, split_cell_ref, shift_cell_ref, formula_cell_refs, \
+    formula_identifiers
+
 
 def extract_cell_formulas(xlsm_path: str, named_keys, sign_keys_lower) -> dict:
     """
     Läuft über alle Blätter und Zellen einer Excel-Datei (.xlsm)
     und sammelt alle Formeln in einem Dict.
     Key = Zellenkoordinate (z.B. 'A1'), Value = Formelstring.
+    Zusätzlich wird die Formel in R1C1-Form abgelegt, siehe group_formula_classes.
+    Benutzte Namen und Funktionen sind ganze Bezeichner der Formel, nachgeschlagen in einem Durchlauf.
     """
     wb = openpyxl.load_workbook(xlsm_path, data_only=False)  # data_only=False => Formeln statt Werte
     formulas = {}
+    name_index = identifier_index(named_keys)
+    meaning_index = identifier_index(sign_keys_lower)
 
     for sheet in wb.worksheets:
         for row in sheet.iter_rows():
@@ -38,24 +48,116 @@ def extract_cell_formulas(xlsm_path: str, named_keys, sign_keys_lower) -> dict:
                 if fkt_code is None:
                     continue
 
-                used_names = []
-                used_meanings = []
-                for nr in named_keys:
-                    if nr in str(fkt_code):  # robust: str() falls None
-                        used_names.append(nr)
-                for mean in sign_keys_lower:
-                    if mean in str(fkt_code.lower()):
-                        used_meanings.append(mean)
+                # Ein Durchlauf je Formel, die Bezeichner werden in den Indizes nachgeschlagen.
+                identifiers = formula_identifiers(fkt_code)
+                used_names = lookup_identifiers(identifiers, name_index)
+                used_meanings = lookup_identifiers(identifiers, meaning_index)
 
                 sheet_title = sheet.title
                 coord = f"{sheet.title}!{cell.coordinate}"
                 fkt_name = f"fkt_{sheet.title}_{cell.coordinate}".lower()
+                fkt_r1c1 = formula_to_r1c1(fkt_code, cell.row, cell.column)
 
-
-                formulas[coord] = (sheet_title, coord, value_type, fkt_name, "'''"+fkt_code+"'''", used_names, used_meanings)
+                formulas[coord] = (sheet_title, coord, value_type, fkt_name, "'''"+fkt_code+"'''", used_names, used_meanings,
+                                   fkt_r1c1)
 
     return formulas
 
+def identifier_index(keys) -> dict[str, tuple[int, str]]:
+    """
+    Bezeichner in Kleinbuchstaben -> (Position, Schreibweise in keys), für lookup_identifiers.
+    """
+    index = {}
+    for key in keys:
+        index.setdefault(key.lower(), (len(index), key))
+    return index
+
+
+def lookup_identifiers(identifiers: set[str], index: dict[str, tuple[int, str]]) -> list[str]:
+    """
+    Die Schlüssel des Index, die als ganze Bezeichner vorkommen, in der Reihenfolge der Schlüssel.
+    """
+    return [key for _, key in sorted(index[identifier] for identifier in identifiers if identifier in index)]
+
+
+def group_formula_classes(formulas: dict) -> dict[str, list[str]]:
+    """
+    Fasst Zellen zu Äquivalenzklassen zusammen: gleiches Blatt und gleiche R1C1-Formel.
+    Solche Zellen unterscheiden sich nur um eine Zeilen-/Spaltenverschiebung (z.B. B16 ... B66).
+
+    :param formulas: Ergebnis von extract_cell_formulas
+    :return: Koordinate des Repräsentanten (erste Zelle der Klasse) -> alle Koordinaten der Klasse
+    """
+    classes = {}
+    representative = {}
+    for coord, values in formulas.items():
+        sheet_title = values[0]
+        fkt_r1c1 = values[7]
+        rep = representative.setdefault((sheet_title, fkt_r1c1), coord)
+        classes.setdefault(rep, []).append(coord)
+    return classes
+
+
+# Bezüge und Bezeichner wie "Tafeln!B16", A16, $A$16 oder h16_value in der Antwort des Modells.
+IDENTIFIER_REF_REGEX = re.compile(r"(?:('(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_.]*)!)?"
+                                  r"(?<![A-Za-z0-9_$])(\$?)([A-Za-z]{1,3})(\$?)([0-9]+)(?![0-9A-Za-z])")
+
+
+def instantiate_translation(text: str, formula: str, rep_coord: str, target_coord: str) -> str:
+    """
+    Überträgt die Übersetzung des Repräsentanten auf eine andere Zelle derselben Formelklasse.
+
+    Verschoben werden der Funktionsname fkt_<sheet>_<cell> sowie alle Bezüge und Bezeichner,
+    die einem relativen Bezug der Excel-Formel entsprechen (z.B. "Kalkulation!A16", A16, h16_value).
+    Absolute Teile ($A16) bleiben wie in Excel stehen. Bezüge sind nach Blatt und Zelle getrennt:
+    Tafeln!B16 ist ein anderer Bezug als B16. Schreibt die Antwort einen Bezug mit '$' wie die
+    Formel, gelten dessen '$'; ohne '$' muss jede Schreibweise der Formel dieselbe Verschiebung ergeben.
+
+    :param text: Antwort des Modells für rep_coord
+    :param formula: Excel-Formel des Repräsentanten
+    :param rep_coord: z.B. 'Kalkulation!B16'
+    :param target_coord: z.B. 'Kalkulation!B17'
+    :return: Übersetzung für target_coord
+    :raises ValueError: wenn ein Bezug der Antwort mehrdeutig verschoben würde, z.B. A16 bei =A16+A$16
+    """
+    rep_sheet, rep_cell = rep_coord.split("!", 1)
+    target_sheet, target_cell = target_coord.split("!", 1)
+    _, rep_col, _, rep_row = split_cell_ref(rep_cell)
+    _, target_col, _, target_row = split_cell_ref(target_cell)
+    d_row = target_row - rep_row
+    d_col = target_col - rep_col
+
+    # (Blatt, Spalte, Zeile) -> alle Schreibweisen (Spalte absolut, Zeile absolut) in der Formel
+    variants = {}
+    for sheet, ref in formula_cell_refs(formula):
+        col_abs, col, row_abs, row = split_cell_ref(ref)
+        variants.setdefault(((sheet or rep_sheet).lower(), col, row), set()).add((col_abs, row_abs))
+
+    def shift(match):
+        sheet, col_abs, letters, row_abs, digits = match.groups()
+        sheet = sheet.strip("'").replace("''", "'") if sheet else rep_sheet
+        ref = match.group(0)[match.start(2) - match.start(0):]
+        _, col, _, row = split_cell_ref(ref)
+        flags = variants.get((sheet.lower(), col, row))
+        if flags is None:
+            return match.group(0)
+        if (bool(col_abs), bool(row_abs)) in flags:
+            flags = {(bool(col_abs), bool(row_abs))}
+        shifted = {shift_cell_ref(ref, 0 if formula_row_abs else d_row, 0 if formula_col_abs else d_col)
+                   for formula_col_abs, formula_row_abs in flags}
+        if len(shifted) > 1:
+            raise ValueError(f"Reference '{match.group(0)}' in the translation of {rep_coord} is ambiguous "
+                             f"for {target_coord}: {sorted(shifted)}")
+        shifted = shifted.pop()
+        shifted = shifted.lower() if letters.islower() else shifted
+        return match.group(0)[:match.start(2) - match.start(0)] + shifted
+
+    rep_fkt = f"fkt_{rep_sheet}_{rep_cell}".lower()
+    target_fkt = f"fkt_{target_sheet}_{target_cell}".lower()
+    text = re.sub(re.escape(rep_fkt) + r"(?![0-9A-Za-z_])", target_fkt, text, flags=re.IGNORECASE)
+    return IDENTIFIER_REF_REGEX.sub(shift, text)
+
+
 def code_extract(text: str) -> str:
     """
     Extrahiert den Python-Code aus einem String, der mit ```python beginnt
@@ -97,3 +199,66 @@ def clean_import(source: str) -> tuple[str, str]:
     imports_str = "\n".join(import_lines).strip()
     code_str = "\n".join(code_lines).strip()
     return imports_str, code_str
+
+
+def runtime_source() -> str:
+    """
+    Quelltext von xl_macro/xl_runtime.py ohne Kopf-Docstring, wie ihn Step05 in den Rechner übernimmt.
+    """
+    source = inspect.getsource(xl_runtime)
+    header = ast.parse(source).body[0]
+    return "\n".join(source.splitlines()[header.end_lineno:]).strip() + "\n"
+
+
+def cell_dispatch_code(cell_functions: dict[str, str]) -> str:
+    """
+    Erzeugt die Zuweisung von CELL_DISPATCH für den Rechner: 'Sheet!Cell' -> fkt_*-Funktion.
+    """
+    lines = ["CELL_DISPATCH = {"]
+    lines += [f"    {coord!r}: {fkt_name}," for coord, fkt_name in cell_functions.items()]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def cell_order_code(order: list[str]) -> str:
+    """
+    Erzeugt CELL_ORDER für den Rechner: die Formelzellen in topologischer Reihenfolge, siehe evaluate_all.
+    """
+    lines = ["CELL_ORDER = ("]
+    lines += [f"    {coord!r}," for coord in order]
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def cell_precedents_code(precedents: dict[str, set[str]]) -> str:
+    """
+    Erzeugt CELL_PRECEDENTS für den Rechner: Formelzelle -> gelesene Zellen, siehe update_inputs,
+    und die Umkehrung CELL_DEPENDENTS: Zelle -> Formelzellen, die sie direkt lesen, siehe dirty_cells.
+    """
+    dependents = {}
+    for coord, refs in precedents.items():
+        for ref in sorted(refs):
+            dependents.setdefault(ref, []).append(coord)
+    lines = ["CELL_PRECEDENTS = {"]
+    lines += [f"    {coord!r}: {tuple(sorted(refs))!r}," for coord, refs in precedents.items()]
+    lines.append("}")
+    lines.append("")
+    lines.append("CELL_DEPENDENTS = {")
+    lines += [f"    {ref!r}: {tuple(cells)!r}," for ref, cells in sorted(dependents.items())]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def read_overrides(directory: str) -> dict[str, str]:
+    """
+    Liest handgeschriebene Übersetzungen aus directory: Datei <meaning>.py ersetzt den py_block
+    der VBA-Prozedur meaning in Step05. Fehlt das Verzeichnis, gibt es keine.
+    """
+    overrides = {}
+    if not os.path.isdir(directory):
+        return overrides
+    for file_name in sorted(os.listdir(directory)):
+        if file_name.endswith(".py"):
+            with open(os.path.join(directory, file_name), encoding="utf-8") as f:
+                overrides[file_name[:-3]] = f.read()
+    return overrides
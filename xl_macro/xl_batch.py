@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import importlib
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CALCULATOR = "labor.preprod.xl_code"
+DEFAULT_SHARD_SIZE = 5000
+
+DEFAULT_BATCH_CELLS = ("Kalkulation!K5", "Kalkulation!K6", "Kalkulation!K7")
+
+# Eingaben, von denen Verzweigungen, Schleifen oder die Wahl der Kommutationswerte abhängen.
+# Verträge mit gleichen Werten rechnet eine Gruppe, die übrigen Spalten laufen als NumPy-Arrays.
+DEFAULT_GROUP_NAMES = ("Sex", "Tafel", "Zins", "zw", "k")
+
+# Eingaben, die die Kommutationsvektoren bestimmen, siehe export_commutation_tables.
+TABLE_NAMES = ("Sex", "Tafel", "Zins")
+
+
+def price_batch(calculator, contracts, cells=DEFAULT_BATCH_CELLS, group_names=DEFAULT_GROUP_NAMES) -> pd.DataFrame:
+    """
+    Rechnet die Zellen cells für viele Verträge auf einmal.
+
+    Parameters:
+    - calculator: Der erzeugte Rechner (preprod/xl_code.py) nach init_workbook.
+    - contracts: DataFrame oder dict Name -> Werte, eine Zeile je Vertrag. Spalten sind Namen
+      wie x, n, t, VS; fehlende Namen kommen aus der Arbeitsmappe.
+    - cells: Bezüge 'Sheet!Cell' der Ergebnisse.
+    - group_names: Spalten, deren Werte je Gruppe konstant sein müssen.
+
+    Returns:
+    - DataFrame mit einer Spalte je Zelle und dem Index von contracts.
+
+    Innerhalb einer Gruppe teilen sich alle Verträge dieselben Kommutationsvektoren, die Formeln
+    rechnen elementweise auf den Arrays. Verzweigt eine Formel doch je Vertrag (z.B. MAX oder IF
+    auf einer Array-Spalte), wird diese Gruppe Vertrag für Vertrag gerechnet.
+    """
+    if not isinstance(contracts, pd.DataFrame):
+        contracts = pd.DataFrame(contracts)
+    result = pd.DataFrame(index=contracts.index, columns=list(cells), dtype=float)
+    keys = [name for name in group_names if name in contracts.columns]
+    columns = [name for name in contracts.columns if name not in keys]
+    if keys:
+        groups = contracts.groupby(keys, sort=False).indices
+    else:
+        groups = {(): np.arange(len(contracts))}
+
+    try:
+        for key, rows in groups.items():
+            key = key if isinstance(key, tuple) else (key,)
+            fixed = dict(zip(keys, key))
+            arrays = {name: contracts[name].to_numpy()[rows] for name in columns}
+            result.iloc[rows] = _price_group(calculator, fixed, arrays, cells, len(rows))
+    finally:
+        calculator.invalidate(tables=False)
+    return result
+
+
+def _price_group(calculator, fixed: dict, arrays: dict, cells, size: int) -> np.ndarray:
+    values = np.empty((size, len(cells)))
+    calculator.assume_inputs({**fixed, **arrays})
+    try:
+        for j, cell in enumerate(cells):
+            values[:, j] = np.broadcast_to(calculator.get_cell_value(cell), size)
+        return values
+    except (TypeError, ValueError):
+        pass  # Formel verzweigt auf einer Array-Spalte
+
+    for i in range(size):
+        calculator.assume_inputs({**fixed, **{name: column[i] for name, column in arrays.items()}})
+        for j, cell in enumerate(cells):
+            values[i, j] = calculator.get_cell_value(cell)
+    return values
+
+
+# Prozess-Pool
+#############################################################################
+
+# Rechner des Worker-Prozesses, von _init_worker einmal geladen und aufgewärmt.
+_worker = {}
+
+
+def read_contracts(path: str) -> pd.DataFrame:
+    """
+    Liest die Vertragsdaten aus CSV oder Parquet (nach Dateiendung), eine Zeile je Vertrag.
+    """
+    if path.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(path)
+    return pd.read_csv(path)
+
+
+class ResultWriter:
+    """
+    Schreibt die Ergebnisse Shard für Shard in CSV oder Parquet (nach Dateiendung),
+    ohne den ganzen Lauf im Speicher zu halten. Parquet braucht pyarrow.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.parquet = path.lower().endswith((".parquet", ".pq"))
+        self.writer = None
+        self.rows = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    def write(self, frame: pd.DataFrame):
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(frame)
+            if self.writer is None:
+                self.writer = pq.ParquetWriter(self.path, table.schema)
+            self.writer.write_table(table)
+        else:
+            frame.to_csv(self.path, mode="w" if self.rows == 0 else "a", header=self.rows == 0)
+        self.rows += len(frame)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+def load_calculator(module_name: str, xlsm_path: str):
+    """
+    Importiert den erzeugten Rechner und setzt Arbeitsmappe und Namen aus xlsm_path.
+    Ein Snapshot (.json von Step06) lädt in Millisekunden und braucht kein openpyxl.
+    """
+    calculator = importlib.import_module(module_name)
+    if xlsm_path.lower().endswith(".json"):
+        calculator.init_workbook(*calculator.load_snapshot(xlsm_path))
+        return calculator
+
+    import openpyxl
+    from xl_macro.xl_macro_reader import read_named_ranges
+
+    calculator.init_workbook(openpyxl.load_workbook(xlsm_path), read_named_ranges(xlsm_path))
+    return calculator
+
+
+def table_combinations(calculator, contracts: pd.DataFrame) -> list[tuple]:
+    """
+    Alle (Sex, Tafel, Zins) der Verträge, fehlende Spalten mit dem Wert der Arbeitsmappe.
+    """
+    columns = {name: contracts[name].to_numpy() if name in contracts.columns
+               else [calculator.get_excel_global(name)] * len(contracts) for name in TABLE_NAMES}
+    return list(pd.DataFrame(columns).drop_duplicates().itertuples(index=False, name=None))
+
+
+def _init_worker(module_name: str, xlsm_path: str, tables_path: str, warmup: pd.DataFrame, cells, group_names,
+                 barrier):
+    try:
+        calculator = load_calculator(module_name, xlsm_path)
+        if tables_path is not None:
+            calculator.attach_commutation_tables(tables_path)
+        # Je Gruppe ein Vertrag: liest die Sterbetafeln und füllt den Vektor-Cache vor dem ersten Shard.
+        price_batch(calculator, warmup, cells, group_names)
+    except BaseException:
+        barrier.abort()  # der aufrufende Prozess wartet sonst ewig
+        raise
+    _worker.update(calculator=calculator, cells=cells, group_names=group_names)
+    barrier.wait()
+
+
+def _price_shard(shard: pd.DataFrame) -> pd.DataFrame:
+    return price_batch(_worker["calculator"], shard, _worker["cells"], _worker["group_names"])
+
+
+def _worker_ready(_) -> bool:
+    return "calculator" in _worker
+
+
+def run_batch(input_path: str, output_path: str, xlsm_path: str, workers: int = 1,
+              cells=DEFAULT_BATCH_CELLS, group_names=DEFAULT_GROUP_NAMES,
+              shard_size: int = DEFAULT_SHARD_SIZE, calculator: str = DEFAULT_CALCULATOR,
+              tables_path: str = None) -> dict:
+    """
+    Rechnet alle Verträge der Datei input_path in einem Pool von workers Prozessen und schreibt
+    die Ergebnisse in der Reihenfolge der Eingabe nach output_path, sobald ein Shard fertig ist.
+    Jeder Worker lädt die Arbeitsmappe (oder ihren Snapshot) einmal und wärmt Sterbetafeln und
+    Kommutationsvektoren für alle Gruppen der Eingabe vor. Mit tables_path rechnet der aufrufende
+    Prozess die Kommutationsvektoren einmal vorab in diese Datei, die Worker lesen sie per mmap
+    gemeinsam statt eigene Kopien zu rechnen.
+
+    Returns:
+    - dict mit contracts, workers, seconds (Rechnen ohne Start der Worker) und per_second.
+    """
+    contracts = read_contracts(input_path)
+    keys = [name for name in group_names if name in contracts.columns]
+    warmup = contracts.drop_duplicates(keys) if keys else contracts.head(1)
+    if tables_path is not None:
+        module = importlib.import_module(calculator)
+        with module.calc_context(module.CalcContext()):  # eigener Kontext, der des Aufrufers bleibt unberührt
+            load_calculator(calculator, xlsm_path)
+            module.export_commutation_tables(tables_path, table_combinations(module, contracts))
+    shards = [contracts.iloc[start:start + shard_size] for start in range(0, len(contracts), shard_size)]
+    writer = ResultWriter(output_path)
+    try:
+        with multiprocessing.Manager() as manager:
+            barrier = manager.Barrier(workers + 1)
+            initargs = (calculator, xlsm_path, tables_path, warmup, tuple(cells), tuple(group_names), barrier)
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+                # Start und Aufwärmen der Worker zählen nicht zum Durchsatz: je Worker eine Aufgabe,
+                # damit alle Prozesse starten, dann warten alle Worker und dieser Prozess an der Schranke.
+                ready = [pool.submit(_worker_ready, i) for i in range(workers)]
+                try:
+                    barrier.wait()
+                except threading.BrokenBarrierError:
+                    pass  # ein Worker ist beim Start gescheitert, ready meldet den Fehler
+                for future in ready:
+                    future.result()
+                start = time.perf_counter()
+                for result in pool.map(_price_shard, shards):
+                    writer.write(result)
+                seconds = time.perf_counter() - start
+    finally:
+        writer.close()
+    return {"contracts": len(contracts), "workers": workers, "seconds": seconds,
+            "per_second": len(contracts) / seconds if seconds > 0 else float("inf")}
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import heapq
+
+from xl_macro.xl_formula_parser import tokenize_formula, strip_formula, split_cell_ref, column_letter
+
+
+class CycleError(ValueError):
+    """
+    Zirkelbezug zwischen Formelzellen, cells nennt die beteiligten Zellen.
+    """
+
+    def __init__(self, cells: list[str]):
+        super().__init__("Circular reference between cells: " + " -> ".join(cells))
+        self.cells = cells
+
+
+def normalize_ref(sheet: str, ref: str) -> str:
+    return sheet.strip("'") + "!" + ref.replace("$", "").upper()
+
+
+def expand_range(sheet: str, ref_from: str, ref_to: str) -> list[str]:
+    """
+    'Tafeln', 'B4', 'C5' -> ['Tafeln!B4', 'Tafeln!C4', 'Tafeln!B5', 'Tafeln!C5']
+    """
+    _, col_from, _, row_from = split_cell_ref(ref_from)
+    _, col_to, _, row_to = split_cell_ref(ref_to)
+    return [f"{sheet}!{column_letter(col)}{row}"
+            for row in range(min(row_from, row_to), max(row_from, row_to) + 1)
+            for col in range(min(col_from, col_to), max(col_from, col_to) + 1)]
+
+
+def name_refs(names: dict[str, str]) -> dict[str, list[str]]:
+    """
+    Namen (lower case) -> Zellen, auf die sie zeigen. Namen ohne Blatt (#NAME? o.ä.) fehlen.
+    """
+    refs = {}
+    for name, ref in names.items():
+        if "!" not in ref:
+            continue
+        sheet, cells = ref.rsplit("!", 1)
+        cells = cells.replace("$", "").upper().split(":")
+        try:
+            refs[name.lower()] = expand_range(sheet.strip("'"), cells[0], cells[-1])
+        except ValueError:
+            continue
+    return refs
+
+
+def formula_precedents(formula: str, coord: str, refs_of_names: dict[str, list[str]]) -> set[str]:
+    """
+    Alle Zellen 'Sheet!Cell', die die Formel der Zelle coord liest, direkt oder über Namen.
+    refs_of_names kommt von name_refs.
+    """
+    sheet = coord.split("!")[0]
+    tokens = [token for token in tokenize_formula(strip_formula(formula)) if token[0] != "SPACE"]
+    precedents = set()
+    pos = 0
+    while pos < len(tokens):
+        kind, value = tokens[pos]
+        ref_sheet = sheet
+        if kind == "SHEET":
+            ref_sheet = value[:-1].strip("'").replace("''", "'")
+            pos += 1
+            kind, value = tokens[pos] if pos < len(tokens) else (None, None)
+        if kind == "CELL":
+            if pos + 2 < len(tokens) and tokens[pos + 1][0] == "COLON" and tokens[pos + 2][0] == "CELL":
+                ref_to = tokens[pos + 2][1].replace("$", "")
+                precedents.update(expand_range(ref_sheet, value.replace("$", ""), ref_to))
+                pos += 3
+                continue
+            precedents.add(normalize_ref(ref_sheet, value))
+        elif kind == "IDENTIFIER" and (pos + 1 >= len(tokens) or tokens[pos + 1][0] != "LPAREN"):
+            precedents.update(refs_of_names.get(value.lower(), ()))
+        pos += 1
+    return precedents
+
+
+def topological_order(graph: dict[str, set[str]]) -> list[str]:
+    """
+    Ordnet die Formelzellen (Schlüssel von graph) so, dass jede Zelle nach ihren Vorgängern kommt.
+    Vorgänger, die keine Formelzellen sind, zählen nicht. Bei gleichem Rang bleibt die Reihenfolge von graph.
+    Ein Zirkelbezug löst CycleError aus.
+    """
+    position = {cell: i for i, cell in enumerate(graph)}
+    dependents = {cell: [] for cell in graph}
+    missing = {}
+    for cell, precedents in graph.items():
+        inner = {ref for ref in precedents if ref in graph}
+        missing[cell] = len(inner)
+        for ref in inner:
+            dependents[ref].append(cell)
+
+    order = []
+    ready = [position[cell] for cell in graph if missing[cell] == 0]
+    cells = list(graph)
+    while ready:
+        cell = cells[heapq.heappop(ready)]
+        order.append(cell)
+        for dependent in dependents[cell]:
+            missing[dependent] -= 1
+            if missing[dependent] == 0:
+                heapq.heappush(ready, position[dependent])
+    if len(order) < len(graph):
+        raise CycleError(find_cycle({cell: graph[cell] for cell in graph if missing[cell] > 0}))
+    return order
+
+
+def find_cycle(graph: dict[str, set[str]]) -> list[str]:
+    """
+    Ein Zyklus im Restgraphen, in dem jede Zelle noch einen Vorgänger im Restgraphen hat.
+    """
+    cell = next(iter(graph))
+    path = []
+    seen = {}
+    while cell not in seen:
+        seen[cell] = len(path)
+        path.append(cell)
+        cell = min(ref for ref in graph[cell] if ref in graph)
+    return path[seen[cell]:] + [cell]
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import math
+import re
+
+import numpy as np
+
+GLOBAL_LOOKUP_REGEX = re.compile(r"""get_excel_global\(\s*(['"])([^'"]+)\1\s*\)""")
+CELL_LOOKUP_REGEX = re.compile(r"""get_cell_value\(\s*(['"])([^'"]+)\1\s*\)""")
+CELL_REGEX = re.compile(r"[A-Z]+[0-9]+")
+
+
+def normalize_ref(ref: str) -> str:
+    sheet_name, cell_ref = ref.split("!", 1)
+    return sheet_name.strip("'") + "!" + cell_ref.replace("$", "").upper()
+
+
+def frozen_ref(key: str, name_refs: dict[str, str], sheetnames) -> tuple[str, str] | None:
+    """
+    Name (ohne Beachtung der Groß-/Kleinschreibung) oder 'Sheet!Cell' einer eingefrorenen Eingabe
+    -> (Name oder Zelle, 'Sheet!Cell') mit dem Blattnamen der Arbeitsmappe.
+    None für unbekannte Namen und Bezüge, die keine einzelne Zelle sind.
+    """
+    names = {name.lower(): name for name in name_refs}
+    name = names.get(key.lower())
+    if name is not None:
+        return name, name_refs[name]
+    if "!" not in key:
+        return None
+    sheet_name, cell_ref = normalize_ref(key).split("!", 1)
+    if not CELL_REGEX.fullmatch(cell_ref):
+        return None
+    sheets = {sheet.lower(): sheet for sheet in sheetnames}
+    return key, sheets.get(sheet_name.lower(), sheet_name) + "!" + cell_ref
+
+
+def literal(value) -> str | None:
+    """
+    Python-Literal für einen Zellwert oder None, wenn der Wert sich nicht als Literal schreiben lässt
+    (NaN, Arrays, Datumswerte ...).
+    """
+    if isinstance(value, np.generic):
+        value = value.item()
+    if value is None or isinstance(value, (bool, int, str)):
+        return repr(value)
+    if isinstance(value, float) and math.isfinite(value):
+        return repr(value)
+    return None
+
+
+def fold_lookups(code: str, literals: dict[str, str], name_refs: dict[str, str]) -> str:
+    """
+    Ersetzt get_excel_global('Name') und get_cell_value("Sheet!Cell") durch das Literal aus literals
+    (Schlüssel 'Sheet!Cell'), wenn die Zelle dort steht. name_refs: Name -> 'Sheet!Cell'.
+    """
+    def fold_global(match):
+        ref = name_refs.get(match.group(2))
+        return literals.get(ref, match.group(0)) if ref is not None else match.group(0)
+
+    def fold_cell(match):
+        ref = match.group(2)
+        return literals.get(normalize_ref(ref), match.group(0)) if "!" in ref else match.group(0)
+
+    return CELL_LOOKUP_REGEX.sub(fold_cell, GLOBAL_LOOKUP_REGEX.sub(fold_global, code))
+
+
+def constant_function(fkt_name: str, value_literal: str) -> str:
+    return f"def {fkt_name}():\n    return {value_literal}\n"
+
+
+def constant_cells(order: list[str], precedents: dict[str, set[str]], frozen_refs) -> list[str]:
+    """
+    Formelzellen in der Reihenfolge order, die nur eingefrorene Zellen oder andere konstante
+    Formelzellen lesen. Diese Zellen können schon beim Erzeugen gerechnet werden.
+    """
+    known = set(frozen_refs)
+    cells = []
+    for cell in order:
+        if precedents.get(cell, set()) <= known:
+            known.add(cell)
+            cells.append(cell)
+    return cells
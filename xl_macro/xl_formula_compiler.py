@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import keyword
+import re
+
+from xl_macro.xl_formula_parser import parse_formula
+
+# Wird in Step04 als model_code eingetragen, wenn eine Formel ohne Modell übersetzt wurde.
+COMPILER_MODEL_CODE = "xl_formula_compiler"
+
+SIGNATURE_DEF_REGEX = re.compile(r"def\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(")
+
+# Rangfolge der erzeugten Python-Ausdrücke, höher bindet stärker.
+PREC_IF, PREC_NOT, PREC_COMPARE, PREC_ADD, PREC_MUL, PREC_UNARY, PREC_POW, PREC_ATOM = 1, 4, 5, 6, 7, 8, 9, 10
+
+BINARY_OPERATORS = {
+    "+": ("+", PREC_ADD),
+    "-": ("-", PREC_ADD),
+    "*": ("*", PREC_MUL),
+    "/": ("/", PREC_MUL),
+    "=": ("==", PREC_COMPARE),
+    "<>": ("!=", PREC_COMPARE),
+    "<": ("<", PREC_COMPARE),
+    ">": (">", PREC_COMPARE),
+    "<=": ("<=", PREC_COMPARE),
+    ">=": (">=", PREC_COMPARE),
+}
+
+RESERVED_LOCALS = {"abs", "all", "any", "max", "min", "get_excel_global", "get_cell_value"}
+
+
+def udf_names_from_signatures(sign_dict_lower: dict) -> dict[str, str]:
+    """
+    Ordnet den VBA-Funktionsnamen (lower case) den Python-Namen aus den Signaturen von Step02 zu.
+    'act_ngrax' -> 'act_ngr_ax'
+    """
+    udf_names = {}
+    for meaning_lower, signatur in sign_dict_lower.items():
+        match = SIGNATURE_DEF_REGEX.search(signatur or "")
+        if match:
+            udf_names[meaning_lower] = match.group(1)
+    return udf_names
+
+
+class FormulaCompiler:
+    """
+    Übersetzt einfache Zellformeln ohne Modell nach Python.
+
+    Unterstützt werden Zahlen, Texte, Wahrheitswerte, Zellbezüge, Namen, die Operatoren
+    + - * / ^ % und Vergleiche sowie IF, AND, OR, NOT, MAX, MIN, ABS, IFERROR (nur außen)
+    und die VBA-Funktionen mit bekannter Signatur. Alles andere (Bereiche, &, unbekannte
+    Funktionen, Fehlerwerte) löst ValueError oder SyntaxError aus, dann bleibt die Formel
+    für das Modell.
+    """
+
+    def __init__(self, named_keys, udf_names: dict[str, str]):
+        self.named_lower = {name.lower(): name for name in named_keys}
+        self.udf_names = udf_names
+
+    def compile(self, formula: str, coord: str, fkt_name: str) -> str:
+        sheet = coord.split("!")[0]
+        tree = parse_formula(formula)
+        names = {}
+        if tree[0] == "call" and tree[1].upper() == "IFERROR":
+            if len(tree[2]) != 2:
+                raise ValueError("IFERROR expects two arguments")
+            value = self.emit(tree[2][0], sheet, names)[0]
+            fallback = self.emit(tree[2][1], sheet, names)[0]
+            body = ["    try:", f"        return {value}", "    except Exception:", f"        return {fallback}"]
+        else:
+            body = [f"    return {self.emit(tree, sheet, names)[0]}"]
+        lines = [f"def {fkt_name}():"]
+        lines += [f"    {local} = get_excel_global({name!r})" for name, local in names.items()]
+        return "\n".join(lines + body) + "\n"
+
+    def local_name(self, name: str) -> str:
+        if (name.isidentifier() and not keyword.iskeyword(name) and name not in RESERVED_LOCALS
+                and name not in self.udf_names.values()):
+            return name
+        return "nr_" + re.sub(r"\W", "_", name)
+
+    def emit(self, node, sheet: str, names: dict) -> tuple[str, int]:
+        kind = node[0]
+        if kind == "number":
+            return repr(node[1]), PREC_ATOM
+        if kind == "string":
+            return repr(node[1]), PREC_ATOM
+        if kind == "bool":
+            return repr(node[1]), PREC_ATOM
+        if kind == "cell":
+            ref = node[2].replace("$", "").upper()
+            return f'get_cell_value("{node[1] or sheet}!{ref}")', PREC_ATOM
+        if kind == "name":
+            name = self.named_lower.get(node[1].lower())
+            if name is None:
+                raise ValueError(f"Unknown name '{node[1]}'")
+            names.setdefault(name, self.local_name(name))
+            return names[name], PREC_ATOM
+        if kind == "percent":
+            if node[1][0] == "number":
+                return repr(node[1][1] / 100), PREC_ATOM
+            return f"{self.operand(node[1], sheet, names, PREC_MUL)} / 100", PREC_MUL
+        if kind == "unary":
+            return node[1] + self.operand(node[2], sheet, names, PREC_UNARY), PREC_UNARY
+        if kind == "binary":
+            return self.emit_binary(node, sheet, names)
+        if kind == "call":
+            return self.emit_call(node[1].upper(), node[1], node[2], sheet, names)
+        raise ValueError(f"Unsupported formula element '{kind}'")
+
+    def operand(self, node, sheet: str, names: dict, min_prec: int) -> str:
+        code, prec = self.emit(node, sheet, names)
+        return code if prec >= min_prec else f"({code})"
+
+    def emit_binary(self, node, sheet: str, names: dict) -> tuple[str, int]:
+        _, op, left, right = node
+        if op == "^":
+            # Excel rechnet 2^3^2 von links und -2^2 als (-2)^2.
+            return (f"{self.operand(left, sheet, names, PREC_ATOM)} ** "
+                    f"{self.operand(right, sheet, names, PREC_UNARY)}"), PREC_POW
+        if op not in BINARY_OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}'")
+        py_op, prec = BINARY_OPERATORS[op]
+        left_prec = prec + 1 if prec == PREC_COMPARE else prec
+        return (f"{self.operand(left, sheet, names, left_prec)} {py_op} "
+                f"{self.operand(right, sheet, names, prec + 1)}"), prec
+
+    def emit_call(self, fname: str, original: str, args: list, sheet: str, names: dict) -> tuple[str, int]:
+        if fname == "IF":
+            if len(args) not in (2, 3):
+                raise ValueError("IF expects two or three arguments")
+            condition = self.operand(args[0], sheet, names, PREC_IF + 1)
+            then = self.operand(args[1], sheet, names, PREC_IF + 1)
+            other = self.operand(args[2], sheet, names, PREC_IF) if len(args) == 3 else "False"
+            return f"{then} if {condition} else {other}", PREC_IF
+        if fname == "NOT" and len(args) == 1:
+            return f"not {self.operand(args[0], sheet, names, PREC_NOT)}", PREC_NOT
+        if fname == "ABS" and len(args) == 1:
+            return f"abs({self.emit(args[0], sheet, names)[0]})", PREC_ATOM
+        if fname in ("AND", "OR") and args:
+            joined = ", ".join(self.emit(arg, sheet, names)[0] for arg in args) + ("," if len(args) == 1 else "")
+            return f"{'all' if fname == 'AND' else 'any'}(({joined}))", PREC_ATOM
+        if fname in ("MAX", "MIN") and len(args) >= 2:
+            joined = ", ".join(self.emit(arg, sheet, names)[0] for arg in args)
+            return f"{fname.lower()}({joined})", PREC_ATOM
+        if original.lower() in self.udf_names:
+            joined = ", ".join(self.emit(arg, sheet, names)[0] for arg in args)
+            return f"{self.udf_names[original.lower()]}({joined})", PREC_ATOM
+        raise ValueError(f"Unsupported function '{original}'")
+
+
+def compile_formula(formula: str, coord: str, fkt_name: str, named_keys, udf_names: dict[str, str]) -> str:
+    """
+    Übersetzt die Formel der Zelle coord in die Funktion fkt_name, siehe FormulaCompiler.
+    """
+    return FormulaCompiler(named_keys, udf_names).compile(formula, coord, fkt_name)
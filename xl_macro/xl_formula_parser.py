@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import re
+
+# Zellbezüge werden nur erkannt, wenn kein Buchstabe, keine Ziffer, kein '_', '.' oder '(' folgt.
+# Damit bleiben Namen wie beta1 oder Funktionen wie LOG10( Bezeichner.
+FORMULA_TOKEN_REGEX = re.compile(
+    r"""
+    (?P<STRING>"(?:[^"]|"")*")                                              |
+    (?P<SHEET>(?:'(?:[^']|'')+'|[A-Za-z_][A-Za-z0-9_.]*)!)                  |
+    (?P<CELL>\$?[A-Za-z]{1,3}\$?[0-9]+(?![A-Za-z0-9_.(]))                   |
+    (?P<NUMBER>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)                    |
+    (?P<IDENTIFIER>[A-Za-z_\\][A-Za-z0-9_.]*)                               |
+    (?P<OPERATOR><=|>=|<>|[-+*/^&=<>%])                                     |
+    (?P<LPAREN>\()                                                          |
+    (?P<RPAREN>\))                                                          |
+    (?P<COMMA>[,;])                                                         |
+    (?P<COLON>:)                                                            |
+    (?P<LBRACE>\{)                                                          |
+    (?P<RBRACE>\})                                                          |
+    (?P<SPACE>\s+)
+    """,
+    re.VERBOSE
+)
+
+CELL_REF_REGEX = re.compile(r"(\$?)([A-Za-z]{1,3})(\$?)([0-9]+)")
+
+
+def strip_formula(formula: str) -> str:
+    """
+    Entfernt die Hülle, mit der Step04 Formeln speichert ('''=...''') und das führende '='.
+    """
+    text = formula.strip()
+    if text.startswith("'''") and text.endswith("'''") and len(text) >= 6:
+        text = text[3:-3]
+    if text.startswith("="):
+        text = text[1:]
+    return text
+
+
+def tokenize_formula(formula: str):
+    """
+    Zerlegt eine Excel-Formel (ohne führendes '=') in (kind, value)-Tupel.
+    """
+    pos = 0
+    tokens = []
+    while pos < len(formula):
+        match = FORMULA_TOKEN_REGEX.match(formula, pos)
+        if not match:
+            raise SyntaxError(f"Unrecognized character at position {pos}: {formula[pos]}")
+        tokens.append((match.lastgroup, match.group()))
+        pos = match.end()
+    return tokens
+
+
+def formula_identifiers(formula: str) -> set[str]:
+    """
+    Alle Bezeichner (Namen und Funktionen) einer Formel in Kleinbuchstaben, z.B. {'act_dx', 'x', 'zins'}.
+    Anders als tokenize_formula überspringt sie unbekannte Zeichen (#REF!, @), damit jede Formel durchgeht.
+    """
+    return {match.group().lower() for match in FORMULA_TOKEN_REGEX.finditer(strip_formula(formula))
+            if match.lastgroup == "IDENTIFIER"}
+
+
+def column_index(letters: str) -> int:
+    """
+    'A' -> 1, 'Z' -> 26, 'AA' -> 27
+    """
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + (ord(char) - 64)
+    return index
+
+
+def column_letter(index: int) -> str:
+    """
+    1 -> 'A', 27 -> 'AA'
+    """
+    letters = ""
+    while index > 0:
+        index, rest = divmod(index - 1, 26)
+        letters = chr(65 + rest) + letters
+    return letters
+
+
+def split_cell_ref(ref: str) -> tuple[bool, int, bool, int]:
+    """
+    Zerlegt einen A1-Bezug wie '$A16' in (col_absolute, col, row_absolute, row).
+    """
+    match = CELL_REF_REGEX.fullmatch(ref)
+    if not match:
+        raise ValueError(f"Invalid cell reference: '{ref}'")
+    col_abs, letters, row_abs, digits = match.groups()
+    return bool(col_abs), column_index(letters), bool(row_abs), int(digits)
+
+
+def shift_cell_ref(ref: str, d_row: int, d_col: int) -> str:
+    """
+    Verschiebt die relativen Teile eines A1-Bezugs, absolute Teile ($) bleiben stehen.
+    """
+    col_abs, col, row_abs, row = split_cell_ref(ref)
+    if not col_abs:
+        col += d_col
+    if not row_abs:
+        row += d_row
+    if col < 1 or row < 1:
+        raise ValueError(f"Reference '{ref}' shifted out of the sheet")
+    return ("$" if col_abs else "") + column_letter(col) + ("$" if row_abs else "") + str(row)
+
+
+def cell_to_r1c1(ref: str, row: int, col: int) -> str:
+    """
+    Schreibt einen A1-Bezug relativ zur Zelle (row, col) in R1C1-Schreibweise.
+    'B16' in C16 -> 'R[0]C[-1]', '$A16' in C17 -> 'R[-1]C1'
+    """
+    col_abs, ref_col, row_abs, ref_row = split_cell_ref(ref)
+    r = f"R{ref_row}" if row_abs else f"R[{ref_row - row}]"
+    c = f"C{ref_col}" if col_abs else f"C[{ref_col - col}]"
+    return r + c
+
+
+def formula_to_r1c1(formula: str, row: int, col: int) -> str:
+    """
+    Normalisiert eine Formel der Zelle (row, col) auf R1C1-Form.
+    Zwei Zellen mit gleicher R1C1-Form berechnen dasselbe, nur um Zeilen/Spalten verschoben.
+    Leerzeichen gehören nicht zum Ergebnis.
+    """
+    parts = []
+    for kind, value in tokenize_formula(strip_formula(formula)):
+        if kind == "SPACE":
+            continue
+        if kind == "CELL":
+            parts.append(cell_to_r1c1(value, row, col))
+        else:
+            parts.append(value)
+    return "".join(parts)
+
+
+def formula_cell_refs(formula: str) -> list[tuple[str | None, str]]:
+    """
+    Liefert alle A1-Bezüge einer Formel als (Blatt oder None, Bezug in der Schreibweise der Formel inkl. '$').
+    Das Ende eines Bereichs wie Tafeln!A1:B2 gehört zum Blatt des Anfangs.
+    """
+    refs = []
+    sheet = None
+    previous = None
+    for kind, value in tokenize_formula(strip_formula(formula)):
+        if kind == "SPACE":
+            continue
+        if kind == "CELL":
+            if previous == "SHEET":
+                refs.append((sheet, value))
+            elif previous == "COLON" and refs:
+                refs.append((refs[-1][0], value))
+            else:
+                refs.append((None, value))
+        elif kind == "SHEET":
+            sheet = value[:-1].strip("'").replace("''", "'")
+        previous = kind
+    return refs
+
+
+# Parser
+#############################################################################
+# Knoten des Syntaxbaums sind Tupel, das erste Element ist die Art:
+#   ("number", float|int)            ("string", str)          ("bool", bool)
+#   ("cell", sheet|None, ref)        ("range", sheet|None, ref_from, ref_to)
+#   ("name", name)                   ("call", name, [args])
+#   ("unary", op, operand)           ("percent", operand)     ("binary", op, left, right)
+
+COMPARISON_OPERATORS = ("=", "<>", "<", ">", "<=", ">=")
+
+
+class FormulaParser:
+    """
+    Rekursiver Abstieg über die Tokens einer Excel-Formel, mit der Operator-Rangfolge von Excel:
+    Vergleich < & < +,- < *,/ < ^ < % < Vorzeichen.
+    """
+
+    def __init__(self, formula: str):
+        self.tokens = [(kind, value) for kind, value in tokenize_formula(strip_formula(formula))
+                       if kind != "SPACE"]
+        self.pos = 0
+
+    def parse(self):
+        node = self.comparison()
+        if self.pos < len(self.tokens):
+            raise SyntaxError(f"Unexpected token '{self.tokens[self.pos][1]}' at position {self.pos}")
+        return node
+
+    def peek(self, offset: int = 0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def take(self, kind: str, value: str = None) -> str:
+        token_kind, token_value = self.peek()
+        if token_kind != kind or (value is not None and token_value != value):
+            raise SyntaxError(f"Expected {value or kind}, got '{token_value}'")
+        self.pos += 1
+        return token_value
+
+    def binary(self, operand, operators):
+        node = operand()
+        while self.peek()[0] == "OPERATOR" and self.peek()[1] in operators:
+            op = self.take("OPERATOR")
+            node = ("binary", op, node, operand())
+        return node
+
+    def comparison(self):
+        return self.binary(self.concat, COMPARISON_OPERATORS)
+
+    def concat(self):
+        return self.binary(self.additive, ("&",))
+
+    def additive(self):
+        return self.binary(self.term, ("+", "-"))
+
+    def term(self):
+        return self.binary(self.power, ("*", "/"))
+
+    def power(self):
+        return self.binary(self.postfix, ("^",))
+
+    def postfix(self):
+        node = self.unary()
+        while self.peek() == ("OPERATOR", "%"):
+            self.take("OPERATOR")
+            node = ("percent", node)
+        return node
+
+    def unary(self):
+        if self.peek()[0] == "OPERATOR" and self.peek()[1] in ("+", "-"):
+            op = self.take("OPERATOR")
+            return ("unary", op, self.unary())
+        return self.primary()
+
+    def primary(self):
+        kind, value = self.peek()
+        if kind == "NUMBER":
+            self.pos += 1
+            number = float(value)
+            return ("number", int(number) if number.is_integer() and "." not in value and "e" not in value.lower()
+                    else number)
+        if kind == "STRING":
+            self.pos += 1
+            return ("string", value[1:-1].replace('""', '"'))
+        if kind == "SHEET":
+            self.pos += 1
+            sheet = value[:-1]
+            if sheet.startswith("'"):
+                sheet = sheet[1:-1].replace("''", "'")
+            return self.reference(sheet)
+        if kind == "CELL":
+            return self.reference(None)
+        if kind == "LPAREN":
+            self.take("LPAREN")
+            node = self.comparison()
+            self.take("RPAREN")
+            return node
+        if kind == "IDENTIFIER":
+            self.pos += 1
+            if self.peek()[0] == "LPAREN":
+                return ("call", value, self.arguments())
+            if value.upper() in ("TRUE", "FALSE"):
+                return ("bool", value.upper() == "TRUE")
+            return ("name", value)
+        raise SyntaxError(f"Unexpected token '{value}'")
+
+    def reference(self, sheet):
+        ref = self.take("CELL")
+        if self.peek()[0] == "COLON":
+            self.take("COLON")
+            return ("range", sheet, ref, self.take("CELL"))
+        return ("cell", sheet, ref)
+
+    def arguments(self) -> list:
+        self.take("LPAREN")
+        args = []
+        if self.peek()[0] == "RPAREN":
+            self.take("RPAREN")
+            return args
+        while True:
+            args.append(self.comparison())
+            if self.peek()[0] == "COMMA":
+                self.take("COMMA")
+                continue
+            self.take("RPAREN")
+            return args
+
+
+def parse_formula(formula: str):
+    """
+    Parst eine Excel-Formel in einen Syntaxbaum aus Tupeln, siehe FormulaParser.
+    """
+    return FormulaParser(formula).parse()
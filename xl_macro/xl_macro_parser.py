@@ -21,34 +21,143 @@ TOKEN_REGEX = re.compile(
     (?P<RBRACKET>\])                     |
     (?P<SPACE>[ \t]+)                    |
     (?P<NEWLINE>\r?\n)                   |
-    (?P<OTHER>[<>=.,!§$%&/\\?\{\}:+\-*^|~#@])
+    (?P<OTHER>[<>=.,;!§$%&/\\?\{\}:+\-*^|~#@])
     """,
     re.VERBOSE
 )
 
 
-def tokenize_vba(code: str):
+def iter_tokens_vba(code: str):
+    """
+    Liefert die Tokens (kind, value) einzeln in einem Durchlauf über code, ohne die ganze Liste anzulegen.
+    """
+    scanner = TOKEN_REGEX.scanner(code)
     pos = 0
-    tokens = []
-    while pos < len(code):
-        match = TOKEN_REGEX.match(code, pos)
-        if not match:
-            raise SyntaxError(f"Unrecognized character at position {pos}: {code[pos]}")
-        kind = match.lastgroup
-        value = match.group()
-        tokens.append((kind, value))
+    for match in iter(scanner.match, None):
+        yield match.lastgroup, match.group()
         pos = match.end()
-    return tokens
+    if pos < len(code):
+        raise SyntaxError(f"Unrecognized character at position {pos}: {code[pos]}")
+
+
+def tokenize_vba(code: str):
+    return list(iter_tokens_vba(code))
+
 
 def extract_code_chunks(code: str, named_ranges: dict[str, str] = {}):
-    tokens = tokenize_vba(code)
-    return reconstruct_code(tokens, named_ranges)
+    return reconstruct_code(iter_tokens_vba(code), named_ranges)
 
 
 def reconstruct_code(tokens, named_ranges: dict[str, str] = {}):
-    chunks = []
-    row = ""
-    code = ""
+    used = {}
+    chunks = list(iter_code_chunks(tokens, named_ranges, used))
+    return chunks, used
+
+
+class SourceBuffer:
+    """
+    Hält die Quelltexte aller Module einer Arbeitsmappe. Chunks verweisen mit Offsets hinein,
+    statt den Text zu kopieren, siehe CodeChunk.
+    """
+
+    def __init__(self):
+        self.modules = []
+        self.module_names = []
+
+    def add(self, name: str, code: str) -> int:
+        self.modules.append(code)
+        self.module_names.append(name)
+        return len(self.modules) - 1
+
+    def text(self, module_id: int, start: int = 0, end: int = None) -> str:
+        return self.modules[module_id][start:end]
+
+
+class CodeChunk:
+    """
+    Ein Chunk eines Moduls als Verweis (module_id, start, end) in einen SourceBuffer.
+    Der Text entsteht erst beim Zugriff auf code.
+    """
+    __slots__ = ("buffer", "module_id", "start", "end", "line_start", "line_end", "meaning", "params", "local_used")
+
+    def __init__(self, buffer: SourceBuffer, module_id: int, start: int, end: int, line_start: int, line_end: int,
+                 meaning: str, params: list, local_used: dict):
+        self.buffer = buffer
+        self.module_id = module_id
+        self.start = start
+        self.end = end
+        self.line_start = line_start
+        self.line_end = line_end
+        self.meaning = meaning
+        self.params = params
+        self.local_used = local_used
+
+    @property
+    def code(self) -> str:
+        return self.buffer.text(self.module_id, self.start, self.end)
+
+    def as_tuple(self) -> tuple:
+        """
+        (meaning, params, code, line_start, line_end, local_used) wie bei reconstruct_code.
+        """
+        return self.meaning, self.params, self.code, self.line_start, self.line_end, self.local_used
+
+    def __repr__(self):
+        return f"CodeChunk({self.meaning!r}, module={self.module_id}, {self.start}:{self.end}, " \
+               f"lines={self.line_start}-{self.line_end})"
+
+
+def iter_chunk_records(buffer: SourceBuffer, module_id: int, named_ranges: dict[str, str] = {}, used: dict = None):
+    """
+    Zerlegt ein Modul des Buffers in CodeChunk-Verweise, in einem Durchlauf und ohne Textkopien.
+    """
+    tokens = iter_tokens_vba(buffer.modules[module_id])
+    for meaning, params, start, end, line_start, line_end, local_used in iter_chunk_spans(tokens, named_ranges, used):
+        yield CodeChunk(buffer, module_id, start, end, line_start, line_end, meaning, params, local_used)
+
+
+def iter_code_chunks(tokens, named_ranges: dict[str, str] = {}, used: dict = None):
+    """
+    Zerlegt den Token-Strom in Chunks (meaning, params, code, line_start, line_end, local_used) und liefert
+    jeden Chunk, sobald er fertig ist. Nur der Text seit dem letzten Chunk wird gehalten und
+    einmal je Chunk zusammengesetzt, damit auch Module mit zehntausenden Zeilen linear bleiben.
+
+    used: sammelt die benutzten Namen aller Chunks, wie bei reconstruct_code.
+    """
+    parts = []
+    base = 0
+
+    def collect():
+        for token in tokens:
+            parts.append(token[1])
+            yield token
+
+    spans = iter_chunk_spans(collect(), named_ranges, used)
+    for meaning, params, start, end, line_start, line_end, local_used in spans:
+        text = "".join(parts)  # Zeichen ab Offset base
+        yield meaning, params, text[start - base:end - base], line_start, line_end, local_used
+        parts[:] = [text[end - base:]]
+        base = end
+
+
+BLANK_KINDS = ("SPACE", "NEWLINE")
+
+
+def iter_chunk_spans(tokens, named_ranges: dict[str, str] = {}, used: dict = None):
+    """
+    Zustandsautomat über den Token-Strom: erkennt Sub/Function/Property, Deklarationen und Attribute
+    und liefert je Chunk (meaning, params, start, end, line_start, line_end, local_used),
+    start und end als Zeichen-Offsets im Quelltext.
+
+    used: sammelt die benutzten Namen aller Chunks.
+    """
+    if used is None:
+        used = {}
+    pos = 0
+    row_start = 0
+    row_blank = True
+    code_start = 0
+    code_blank = True
     meaning = "++Start++"
     reading_param = False
     waiting_for_param = False
@@ -57,96 +166,121 @@ def reconstruct_code(tokens, named_ranges: dict[str, str] = {}):
     procedure_type = ""
     line_number = 1
     line_start = line_number
-    used={}
-    local_used={}
+    local_used = {}
     params = []
     for kind, value in tokens:
+        pos += len(value)
         if kind == "NEWLINE":
             line_number += 1
-            code += row + value
-            row = ""
+            code_blank = code_blank and row_blank
+            row_start = pos
+            row_blank = True
             continue
-        elif kind == "LPAREN":
-            row += value
+        row_was_blank = row_blank
+        row_blank = row_blank and kind in BLANK_KINDS
+        if kind == "LPAREN":
             reading_param = waiting_for_param
             waiting_for_param = False
             continue
-        elif kind  == "RPAREN":
-            row += value
+        elif kind == "RPAREN":
             reading_param = waiting_for_param = False
             continue
 
         if reading_param:
             if kind != "SPACE": params.append(value)
-            row += value
             continue
 
-        if kind == "IDENTIFIER":
-            upper = value.upper()
-            if waiting_for_name:
-                row += value
-                meaning = value
-                waiting_for_name = False
-                waiting_for_param = True
-                params = []
-            elif waiting_end_for and procedure_type == upper:
-                code += row + value
-                row = ""
-                chunks.append((meaning, params, code, line_start, line_number, local_used))
-                code = ""
+        if kind != "IDENTIFIER":
+            continue
+        upper = value.upper()
+        if waiting_for_name:
+            meaning = value
+            waiting_for_name = False
+            waiting_for_param = True
+            params = []
+        elif waiting_end_for and procedure_type == upper:
+            yield meaning, params, code_start, pos, line_start, line_number, local_used
+            code_start = row_start = pos
+            code_blank = row_blank = True
+            local_used = {}
+            meaning = "++Next++"
+            procedure_type = ""
+            line_start = line_number + 1
+            reading_param = waiting_for_param = False
+            params = []
+        elif upper == "END":
+            waiting_end_for = True
+            reading_param = waiting_for_param = False
+        elif upper in ("FUNCTION", "PROPERTY", "SUB"):
+            if not code_blank:
+                yield meaning, params, code_start, row_start, line_start, line_number - 1, local_used
+            code_start = row_start
+            code_blank = True
+            local_used = {}
+            meaning = f"++Unknown_{value}++"
+            waiting_for_name = True
+            procedure_type = upper
+            waiting_for_param = False
+            params = []
+            line_start = line_number
+        elif upper in ("DIM", "CONST", "DECLARE", "LET") and not procedure_type:
+            if meaning != "++Declaration++":
+                if not code_blank:
+                    yield meaning, params, code_start, row_start, line_start, line_number - 1, local_used
+                code_start = row_start
+                code_blank = True
                 local_used = {}
-                meaning = "++Next++"
-                procedure_type = ""
-                line_start = line_number + 1
-                reading_param = waiting_for_param = False
-                params = []
-            elif upper == "END":
-                row += value
-                waiting_end_for = True
-                reading_param = waiting_for_param = False
-            elif upper in ("FUNCTION", "PROPERTY", "SUB"):
-                if code.strip():
-                    chunks.append((meaning, params, code, line_start, line_number-1, local_used))
-                code = ""
+            meaning = "++Declaration++"
+            line_start = line_number
+        elif upper == 'ATTRIBUTE' and row_was_blank:
+            if meaning != "++Attribute++":
+                if not code_blank:
+                    yield meaning, params, code_start, row_start, line_start, line_number - 1, local_used
+                code_start = row_start
+                code_blank = True
                 local_used = {}
-                row += value
-                meaning = f"++Unknown_{value}++"
-                waiting_for_name = True
-                procedure_type = upper
-                waiting_for_param = False
-                params = []
-                line_start = line_number
-            elif upper in ("DIM", "CONST", "DECLARE", "LET") and not procedure_type:
-                if meaning != "++Declaration++":
-                    if code.strip():
-                        chunks.append((meaning, params, code, line_start, line_number-1, local_used))
-                    code = ""
-                    local_used = {}
-                row += value
-                meaning = "++Declaration++"
-                line_start = line_number
-            elif (upper == 'ATTRIBUTE') and not row.strip():
-                if meaning != "++Attribute++":
-                    if code.strip():
-                        chunks.append((meaning, params, code, line_start, line_number-1, local_used))
-                    code = ""
-                    local_used = {}
-                row += value
-                meaning = "++Attribute++"
-                line_start = line_number
-            else:
-                if (value in named_ranges.keys()) and not (value in params):
-                    local_used[value] = named_ranges[value]
-                    used[value] = named_ranges[value]
-                row += value
-        else:
-            row += value
-    if row.strip():
-        code += row
-    if code.strip():
-        chunks.append((meaning, params, code, line_start, line_number, local_used))
+            meaning = "++Attribute++"
+            line_start = line_number
+        elif (value in named_ranges.keys()) and not (value in params):
+            local_used[value] = named_ranges[value]
+            used[value] = named_ranges[value]
+    if not row_blank:
+        code_blank = False
+    if not code_blank:
+        yield meaning, params, code_start, pos if not row_blank else row_start, line_start, line_number, local_used
 
-    return chunks, used
 
+def vba_identifiers(code: str) -> set[str]:
+    """
+    Alle Bezeichner des Codes in Kleinbuchstaben. Texte und Kommentare sind eigene Tokens und zählen nicht.
+    """
+    return {value.lower() for kind, value in iter_tokens_vba(code) if kind == "IDENTIFIER"}
+
+
+class CallIndex:
+    """
+    Einmal aufgebauter Index über die Bezeichner aller Prozeduren: welche Prozedur ruft welche auf.
+    Gesucht wird nach ganzen Bezeichnern, Act_Dx trifft also nicht Act_Dx2.
+    """
+
+    def __init__(self, procedures: dict[str, str]):
+        """
+        :param procedures: meaning -> VBA-Code der Prozedur, wie in den Chunks von Step01
+        """
+        self.position = {}
+        self.names = {}
+        for meaning in procedures:
+            self.names.setdefault(meaning.lower(), meaning)
+            self.position.setdefault(meaning, len(self.position))
+        self.calls = {meaning: [callee for callee in self.lookup(vba_identifiers(code)) if callee != meaning]
+                      for meaning, code in procedures.items()}
 
+    def lookup(self, identifiers) -> list[str]:
+        """
+        Die Prozeduren unter den Bezeichnern (in Kleinbuchstaben), in der Reihenfolge des Index.
+        """
+        found = {self.names[identifier] for identifier in identifiers if identifier in self.names}
+        return sorted(found, key=self.position.__getitem__)
 
+    def callees(self, meaning: str) -> list[str]:
+        return self.calls.get(meaning, [])
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+from xl_macro.xl_formula_compiler import FormulaCompiler, PREC_ATOM
+from xl_macro.xl_formula_parser import parse_formula, split_cell_ref, column_letter
+
+# Kürzere Läufe gleicher Formeln lohnen kein Array.
+MIN_BLOCK_ROWS = 4
+
+
+def row_blocks(r1c1_formulas: dict[str, str], min_rows: int = MIN_BLOCK_ROWS) -> list[list[str]]:
+    """
+    Sucht Zeilenblöcke: Zellen einer Spalte mit gleicher R1C1-Formel in aufeinanderfolgenden Zeilen,
+    z.B. Kalkulation!B16 ... Kalkulation!B66.
+
+    :param r1c1_formulas: 'Sheet!Cell' -> R1C1-Formel (fkt_r1c1 aus Step04)
+    :return: Blöcke als Listen von Koordinaten, nach Zeilen sortiert
+    """
+    columns = {}
+    for coord, r1c1 in r1c1_formulas.items():
+        sheet, ref = coord.split("!", 1)
+        _, col, _, row = split_cell_ref(ref)
+        columns.setdefault((sheet, col, r1c1), []).append(row)
+
+    blocks = []
+    for (sheet, col, _), rows in columns.items():
+        rows.sort()
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                if i - start >= min_rows:
+                    blocks.append([f"{sheet}!{column_letter(col)}{row}" for row in rows[start:i]])
+                start = i
+    return blocks
+
+
+def rows_function_name(coords: list[str]) -> str:
+    """
+    ['Kalkulation!B16', ..., 'Kalkulation!B66'] -> 'rows_kalkulation_b16_b66'
+    """
+    sheet, first = coords[0].split("!", 1)
+    last = coords[-1].split("!", 1)[1]
+    return f"rows_{sheet.lower()}_{first.lower()}_{last.lower()}"
+
+
+class RowVectorCompiler(FormulaCompiler):
+    """
+    Übersetzt die Formel eines Zeilenblocks in eine NumPy-Funktion, die den ganzen Block auf einmal
+    rechnet. Bezüge in die eigene Zeile ($A16, H16) werden zu Spaltenarrays, die als Parameter
+    hereinkommen; alles andere bleibt skalar wie in FormulaCompiler.
+    IF wird zu np.where, MAX/MIN zu np.maximum/np.minimum, AND/OR/NOT zu np.logical_*.
+    Bezüge in andere Zeilen (z.B. H15 in Zeile 16) lösen ValueError aus, dann bleibt der Block skalar.
+    """
+
+    def compile_rows(self, formula: str, coords: list[str], fkt_name: str) -> tuple[str, list[list[str]]]:
+        """
+        :return: (Quelltext der Funktion fkt_name, je Parameter die Koordinaten der Spalte im Block)
+        """
+        self.sheet, first = coords[0].split("!", 1)
+        self.row = split_cell_ref(first)[3]
+        self.columns = {}
+        tree = parse_formula(formula)
+        names = {}
+        if tree[0] == "call" and tree[1].upper() == "IFERROR":
+            if len(tree[2]) != 2:
+                raise ValueError("IFERROR expects two arguments")
+            value = self.emit(tree[2][0], self.sheet, names)[0]
+            fallback = self.emit(tree[2][1], self.sheet, names)[0]
+            # Fehlerwerte in Excel sind hier inf/nan.
+            body = ["    with np.errstate(divide='ignore', invalid='ignore'):",
+                    f"        result = np.asarray({value}, dtype=float)",
+                    f"    return np.where(np.isfinite(result), result, {fallback})"]
+        else:
+            # Auch nicht gewählte Zweige von np.where werden gerechnet: ein Fehler dort bricht ab,
+            # dann rechnet der Aufrufer die Zeilen einzeln.
+            body = ["    with np.errstate(divide='raise', invalid='raise'):",
+                    f"        return np.asarray({self.emit(tree, self.sheet, names)[0]})"]
+        if not self.columns:
+            raise ValueError("Formula does not read its own row")
+
+        rows = [split_cell_ref(coord.split("!", 1)[1])[3] for coord in coords]
+        col_of_block = split_cell_ref(first)[1]
+        params = []
+        for letter in self.columns:
+            if letter == column_letter(col_of_block):
+                raise ValueError("Formula reads its own cell")
+            params.append([f"{self.sheet}!{letter}{row}" for row in rows])
+        lines = [f"def {fkt_name}({', '.join(self.columns.values())}):",
+                 '    """',
+                 f"    {coords[0]} ... {coords[-1]} als Array, siehe xl_macro.xl_row_vector.",
+                 '    """']
+        lines += [f"    {local} = get_excel_global({name!r})" for name, local in names.items()]
+        return "\n".join(lines + body) + "\n", params
+
+    def emit(self, node, sheet: str, names: dict) -> tuple[str, int]:
+        if node[0] == "cell":
+            _, col, row_absolute, row = split_cell_ref(node[2])
+            if not row_absolute:
+                if (node[1] or sheet) != self.sheet or row != self.row:
+                    raise ValueError(f"Reference '{node[2]}' leaves the row of the block")
+                letter = column_letter(col)
+                return self.columns.setdefault(letter, "col_" + letter.lower()), PREC_ATOM
+        return super().emit(node, sheet, names)
+
+    def emit_call(self, fname: str, original: str, args: list, sheet: str, names: dict) -> tuple[str, int]:
+        codes = lambda: [self.emit(arg, sheet, names)[0] for arg in args]
+        if fname == "IF":
+            if len(args) not in (2, 3):
+                raise ValueError("IF expects two or three arguments")
+            condition, then, *other = codes()
+            return f"np.where({condition}, {then}, {other[0] if other else 'False'})", PREC_ATOM
+        if fname == "NOT" and len(args) == 1:
+            return f"np.logical_not({codes()[0]})", PREC_ATOM
+        if fname == "ABS" and len(args) == 1:
+            return f"np.abs({codes()[0]})", PREC_ATOM
+        if fname in ("AND", "OR", "MAX", "MIN") and args:
+            function = {"AND": "np.logical_and", "OR": "np.logical_or", "MAX": "np.maximum", "MIN": "np.minimum"}
+            code, *rest = codes()
+            if not rest:
+                if fname in ("MAX", "MIN"):
+                    raise ValueError(f"{fname} expects two or more arguments")
+                return f"np.asarray({code}, dtype=bool)", PREC_ATOM
+            for other in rest:
+                code = f"{function[fname]}({code}, {other})"
+            return code, PREC_ATOM
+        if fname == "IFERROR":
+            raise ValueError("IFERROR only as the outer function")
+        return super().emit_call(fname, original, args, sheet, names)
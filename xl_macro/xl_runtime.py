@@ -0,0 +1,556 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+# Laufzeit des erzeugten Rechners: Step05 kopiert den Quelltext ab hier in xl_recombined.py.
+# Schnittstelle wie in CELL_NAME_VALUE und CELL_VALUE, die das Modell in den Prompts sieht.
+
+import json
+import os
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+
+try:
+    from openpyxl import Workbook
+except ImportError:  # mit einem Snapshot rechnet der Rechner ohne openpyxl
+    Workbook = object
+
+CELL_POSITION_REGEX = re.compile(r"([A-Z]+)([0-9]+)")
+
+
+class WorkbookSnapshot:
+    """
+    Wertzellen und benannte Bereiche einer Arbeitsmappe, geschrieben von xl_macro.xl_snapshot.
+    Einzelzellen stehen im JSON-Index, Zahlenbereiche in einer .npy-Datei, die per mmap gelesen wird.
+    Zugriffe auf Zellen außerhalb des Snapshots lösen KeyError aus.
+    """
+
+    def __init__(self, sheetnames: list[str], cells: dict, ranges: dict, data: np.ndarray):
+        self.sheetnames = sheetnames
+        self.cells = cells
+        self.ranges = ranges
+        self.data = data
+
+    def cell_value(self, sheet_name: str, cell_ref: str):
+        ref = sheet_name + "!" + cell_ref.replace("$", "").upper()
+        try:
+            return self.cells[ref]
+        except KeyError:
+            raise KeyError(f"Cell '{ref}' is not part of the workbook snapshot.") from None
+
+    def range_values(self, sheet_name: str, range_ref: str):
+        """
+        Zahlenbereiche als schreibgeschütztes 2D-Array, andere Bereiche als Liste von Zeilen.
+        """
+        ref = sheet_name + "!" + range_ref.replace("$", "").upper()
+        entry = self.ranges.get(ref)
+        if entry is None:
+            raise KeyError(f"Range '{ref}' is not part of the workbook snapshot.")
+        if "values" in entry:
+            return entry["values"]
+        rows, cols = entry["shape"]
+        return self.data[entry["offset"]:entry["offset"] + rows * cols].reshape(rows, cols)
+
+
+def load_snapshot(path: str) -> tuple[WorkbookSnapshot, dict[str, str]]:
+    """
+    Lädt einen Snapshot (JSON-Index von write_snapshot), für init_workbook(*load_snapshot(path)).
+    """
+    with open(path, encoding="utf-8") as file:
+        index = json.load(file)
+    data = np.load(os.path.join(os.path.dirname(path), index["data"]), mmap_mode="r")
+    return WorkbookSnapshot(index["sheetnames"], index["cells"], index["ranges"], data), index["names"]
+
+
+def read_cell(workbook, sheet_name: str, cell_ref: str):
+    if isinstance(workbook, WorkbookSnapshot):
+        return workbook.cell_value(sheet_name, cell_ref)
+    return workbook[sheet_name][cell_ref].value
+
+
+def cell_position(cell_ref: str) -> tuple[int, int]:
+    """
+    'B4' -> (4, 2)
+    """
+    letters, digits = CELL_POSITION_REGEX.fullmatch(cell_ref).groups()
+    col = 0
+    for char in letters:
+        col = col * 26 + ord(char) - 64
+    return int(digits), col
+
+
+class CalcContext:
+    """
+    Alles, was eine Rechnung braucht: Arbeitsmappe, Namen, geschriebene Eingaben, gemerkte Zellwerte
+    und die aus der Arbeitsmappe abgeleiteten Tabellen (Sterbetafeln, Kommutationsvektoren).
+    Die Arbeitsmappe wird nur gelesen, so können mehrere Kontexte gleichzeitig auf ihr rechnen.
+    """
+
+    def __init__(self, workbook: Workbook = None, names: dict[str, str] = None):
+        self.workbook = workbook
+        self.names = names if names is not None else {}
+        self.name_refs = {}  # Name -> 'Sheet!Cell', einmal aufgelöst, siehe resolve_name
+        self.inputs = {}  # geschriebene Eingaben 'Sheet!Cell' -> Wert
+        self.values = {}  # gemerkte Zellwerte einer Auswertung
+        self.caches = {}  # abgeleitete Tabellen, siehe context_cache
+        self.shared = {}  # Tabellen des Elternkontexts, nur gelesen, siehe fork
+        self.table_inputs = False  # eine Eingabe liegt in einem benannten Bereich, siehe set_cell_value
+        self.evaluations = 0
+        self.hits = 0
+
+    def invalidate(self, tables: bool = True):
+        """
+        Verwirft die gemerkten Zellwerte und mit tables auch die abgeleiteten Tabellen.
+        """
+        self.values.clear()
+        if tables:
+            self.caches.clear()
+            self.shared = {}
+
+    def stats(self) -> dict:
+        return {"cells": len(self.values), "evaluations": self.evaluations, "saved": self.hits}
+
+    def fork(self) -> "CalcContext":
+        """
+        Neuer Kontext auf derselben Arbeitsmappe mit den aufgelösten Namen, aber eigenen
+        Eingaben und Zellwerten. Für eine Anfrage in einem Thread oder Task.
+        Die schon gebauten Tabellen liest der neue Kontext mit, solange sie nur aus der Arbeitsmappe
+        stammen, d.h. dieser Kontext keine Zelle eines benannten Bereichs geschrieben hat.
+        """
+        context = CalcContext(self.workbook, self.names)
+        context.name_refs = dict(self.name_refs)
+        if not self.table_inputs:
+            context.shared = {**self.shared, **self.caches}
+        return context
+
+
+_MISSING = object()
+_EVALUATING = object()  # steht im Speicher, während die Zelle gerechnet wird
+
+# Der Kontext der laufenden Anfrage. Ohne calc_context rechnen alle im Standardkontext.
+CURRENT_CONTEXT: ContextVar = ContextVar("xl_calc_context", default=CalcContext())
+
+# 'Sheet!Cell' -> fkt_*-Funktion, wird von Step05 am Ende des Rechners gefüllt.
+CELL_DISPATCH: dict = {}
+
+# Formelzellen in topologischer Reihenfolge, von Step05 aus den Formeln bestimmt, siehe evaluate_all.
+CELL_ORDER: tuple = ()
+
+# Formelzelle -> gelesene Zellen (auch über Namen), von Step05 emittiert, siehe update_inputs.
+CELL_PRECEDENTS: dict = {}
+
+# Eingaben, die Step05 als Literale in den Rechner geschrieben hat: 'Sheet!Cell' -> Name.
+FROZEN_REFS: dict = {}
+
+# Zelle -> Formelzellen, die sie direkt lesen, von Step05 neben CELL_PRECEDENTS emittiert.
+CELL_DEPENDENTS: dict = {}
+
+# Aus CELL_PRECEDENTS gebildet, wenn der Rechner kein CELL_DEPENDENTS hat.
+_DEPENDENTS: dict | None = None
+
+
+def current_context() -> CalcContext:
+    return CURRENT_CONTEXT.get()
+
+
+@contextmanager
+def calc_context(context: CalcContext):
+    """
+    Rechnet im with-Block im Kontext context, z.B. je Anfrage: with calc_context(base.fork()): ...
+    """
+    token = CURRENT_CONTEXT.set(context)
+    try:
+        yield context
+    finally:
+        CURRENT_CONTEXT.reset(token)
+
+
+def new_context(workbook: Workbook, names: dict[str, str]) -> CalcContext:
+    """
+    Erzeugt einen Kontext für Arbeitsmappe und Namen, siehe init_workbook.
+    """
+    context = CalcContext()
+    with calc_context(context):
+        init_workbook(workbook, names)
+    return context
+
+
+def init_workbook(workbook: Workbook, names: dict[str, str]):
+    """
+    Setzt Arbeitsmappe und Namen des aktuellen Kontexts, löst die Namen auf und verwirft
+    Eingaben, gemerkte Werte und abgeleitete Tabellen.
+    """
+    context = current_context()
+    context.workbook = workbook
+    context.names = names
+    context.name_refs = {}
+    context.inputs.clear()
+    context.table_inputs = False
+    context.invalidate()
+    for key in names:
+        try:
+            resolve_name(key)
+        except ValueError:
+            pass  # Bereiche und externe Bezüge fallen erst beim Lesen auf
+
+
+def context_cache(key: str, factory):
+    """
+    Aus der Arbeitsmappe abgeleitete Tabelle key des aktuellen Kontexts, beim ersten Zugriff von factory() erzeugt.
+    Eine Tabelle des Elternkontexts wird übernommen statt neu gebaut; hat sie fork(), bekommt der Kontext
+    davon eine eigene Schicht, die die Tabelle des Elternkontexts nur liest.
+    """
+    context = current_context()
+    value = context.caches.get(key)
+    if value is None:
+        shared = context.shared.get(key)
+        if shared is None:
+            value = factory()
+        elif hasattr(shared, "fork"):
+            value = shared.fork()
+        else:
+            value = shared
+        context.caches[key] = value
+    return value
+
+
+def invalidate_names():
+    """
+    Verwirft die aufgelösten Namen, nötig wenn die Namen oder die Blätter geändert wurden.
+    """
+    current_context().name_refs.clear()
+
+
+def invalidate(tables: bool = True):
+    """
+    Verwirft alle gemerkten Zellwerte, nötig nach direktem Schreiben in die Arbeitsmappe.
+    Mit tables=False bleiben die abgeleiteten Tabellen (Sterbetafeln, Kommutationsvektoren) erhalten,
+    z.B. nach assume_inputs, das keine Zelle der Arbeitsmappe überdeckt.
+    """
+    current_context().invalidate(tables)
+
+
+def resolve_name(key: str) -> str:
+    """
+    Löst einen Namen in den Bezug 'Sheet!Cell' auf, so wie ihn CELL_DISPATCH verwendet.
+    """
+    context = current_context()
+    if key not in context.names:
+        raise KeyError(f"Key '{key}' not found in xl_names.")
+
+    ref = context.names[key]  # e.g., 'Kalkulation!$E$6'
+    if '!' not in ref:
+        raise ValueError(f"Invalid reference format: '{ref}'")
+
+    sheet_name, cell_ref = ref.split('!')
+    sheet_name = sheet_name_of(sheet_name.strip("'"))  # remove quotes if present
+    cell_ref = cell_ref.replace('$', '').upper()  # remove dollar signs
+    if ':' in cell_ref:
+        raise ValueError(f"Named range '{key}' is not a single cell: '{ref}'")
+
+    if sheet_name not in context.workbook.sheetnames:
+        raise ValueError(f"Worksheet '{sheet_name}' not found in workbook.")
+
+    context.name_refs[key] = sheet_name + "!" + cell_ref
+    return context.name_refs[key]
+
+
+def sheet_name_of(sheet_name: str) -> str:
+    """
+    Blattname in der Schreibweise der Arbeitsmappe (oder von CELL_DISPATCH), z.B. 'kalkulation' -> 'Kalkulation'.
+    """
+    workbook = current_context().workbook
+    sheetnames = workbook.sheetnames if workbook is not None else ()
+    if sheet_name in sheetnames:
+        return sheet_name
+    lower = sheet_name.lower()
+    for name in sheetnames:
+        if name.lower() == lower:
+            return name
+    for ref in CELL_DISPATCH:
+        name = ref.split("!", 1)[0]
+        if name.lower() == lower:
+            return name
+    return sheet_name
+
+
+def normalize_ref(ref: str) -> str:
+    """
+    Bezug in der Form von CELL_DISPATCH: "'kalkulation'!$k$6" -> 'Kalkulation!K6'.
+    """
+    try:
+        sheet_name, cell_ref = ref.split("!", 1)
+    except ValueError:
+        raise ValueError(f"Ungültiges Format: {ref}. Erwartet 'Sheet!Cell'.")
+    return sheet_name_of(sheet_name.strip("'")) + "!" + cell_ref.replace("$", "").upper()
+
+
+def get_excel_global(key: str):
+    """
+    Retrieves the value from the Excel workbook based on a named range key.
+
+    Parameters:
+    - key (str): The name of the range to look up.
+
+    Returns:
+    - The value of the cell referenced by the named range. Zeigt der Name auf eine Formelzelle,
+      wird deren fkt_*-Funktion ausgewertet.
+    """
+    ref = current_context().name_refs.get(key)
+    if ref is None:
+        ref = resolve_name(key)
+    return get_cell_value(ref)
+
+
+def get_excel_range(key: str) -> list[list]:
+    """
+    Liefert die Werte eines benannten Bereichs wie 'Tafeln!$B$4:$E$127' zeilenweise,
+    aus einem Snapshot als 2D-Array. Geschriebene Eingaben des Kontexts überdecken die Werte der Arbeitsmappe.
+    """
+    context = current_context()
+    if key not in context.names:
+        raise KeyError(f"Key '{key}' not found in xl_names.")
+    sheet_name, range_ref = context.names[key].split('!')
+    sheet_name = sheet_name.strip("'")
+    range_ref = range_ref.replace('$', '').upper()
+    workbook = context.workbook
+    if isinstance(workbook, WorkbookSnapshot):
+        values = workbook.range_values(sheet_name, range_ref)
+        origin = cell_position(range_ref.split(":")[0])
+        overlay = {}
+        for ref, value in context.inputs.items():
+            if ref.startswith(sheet_name + "!"):
+                row, col = cell_position(ref.split("!", 1)[1])
+                row, col = row - origin[0], col - origin[1]
+                if 0 <= row < len(values) and 0 <= col < len(values[0]):
+                    overlay[(row, col)] = value
+        if not overlay:
+            return values
+        values = [list(row) for row in values]
+        for (row, col), value in overlay.items():
+            values[row][col] = value
+        return values
+
+    cells = workbook[sheet_name][range_ref]
+    if not isinstance(cells, tuple):
+        cells = ((cells,),)
+    elif not isinstance(cells[0], tuple):
+        cells = (cells,)
+    inputs = context.inputs
+    return [[inputs.get(sheet_name + "!" + cell.coordinate, cell.value) if inputs else cell.value
+             for cell in row] for row in cells]
+
+
+def set_excel_global(key: str, value):
+    """
+    Schreibt eine Eingabe über ihren Namen, siehe set_cell_value.
+    """
+    ref = current_context().name_refs.get(key)
+    set_cell_value(ref if ref is not None else resolve_name(key), value)
+
+
+def set_cell_value(ref: str, value):
+    """
+    Schreibt eine Eingabezelle 'Sheet!Cell' in den aktuellen Kontext und verwirft die gemerkten Werte
+    der Zellen, die von ihr abhängen. Liegt die Zelle in einem benannten Bereich, werden alle Werte
+    und die abgeleiteten Tabellen verworfen. Die Arbeitsmappe selbst bleibt unverändert.
+    """
+    ref = normalize_ref(ref)
+    if ref in FROZEN_REFS:
+        raise ValueError(f"Input '{FROZEN_REFS[ref]}' is frozen in this calculator.")
+    context = current_context()
+    context.inputs[ref] = value
+    if in_named_range(ref):
+        # Auch Werte aus VBA-Funktionen wie act_qx hängen an den Tabellen, nicht nur die Formelzellen.
+        context.table_inputs = True
+        context.invalidate()
+        return
+    dirty = dirty_cells([ref])
+    if dirty is None:
+        context.invalidate()
+        return
+    context.values.pop(ref, None)
+    for dirty_ref in dirty:
+        context.values.pop(dirty_ref, None)
+
+
+def in_named_range(ref: str) -> bool:
+    """
+    Liegt die Zelle 'Sheet!Cell' in einem benannten Bereich wie m_Tafeln, aus dem get_excel_range liest?
+    """
+    sheet_name, cell_ref = ref.split("!", 1)
+    row, col = cell_position(cell_ref)
+    for range_ref in current_context().names.values():
+        if ":" not in range_ref or "!" not in range_ref:
+            continue
+        range_sheet, cells = range_ref.split("!", 1)
+        if range_sheet.strip("'").lower() != sheet_name.lower():
+            continue
+        first, last = cells.replace("$", "").upper().split(":", 1)
+        if not (CELL_POSITION_REGEX.fullmatch(first) and CELL_POSITION_REGEX.fullmatch(last)):
+            continue  # ganze Spalten oder Zeilen liest get_excel_range nicht
+        (row1, col1), (row2, col2) = cell_position(first), cell_position(last)
+        if row1 <= row <= row2 and col1 <= col <= col2:
+            return True
+    return False
+
+
+def cell_dependents() -> dict:
+    """
+    Zelle -> Formelzellen, die sie direkt lesen. Leer, wenn der Rechner kein CELL_PRECEDENTS hat.
+    Ohne CELL_DEPENDENTS wird die Tabelle lokal gebaut und erst fertig veröffentlicht,
+    damit parallele Anfragen nie eine halbe Tabelle sehen.
+    """
+    global _DEPENDENTS
+    if CELL_DEPENDENTS:
+        return CELL_DEPENDENTS
+    if _DEPENDENTS is None:
+        dependents = {}
+        for cell, precedents in CELL_PRECEDENTS.items():
+            for ref in precedents:
+                dependents.setdefault(ref, []).append(cell)
+        _DEPENDENTS = dependents
+    return _DEPENDENTS
+
+
+def dirty_cells(refs) -> set | None:
+    """
+    Alle Formelzellen, die direkt oder über andere Zellen von refs abhängen.
+    None, wenn eine Zelle in keiner Formel vorkommt (z.B. Tafeln, die VBA-Funktionen lesen):
+    dann ist der ganze Stand zu verwerfen.
+    """
+    dependents = cell_dependents()
+    dirty = set()
+    todo = []
+    for ref in refs:
+        if ref not in dependents:
+            return None
+        todo.append(ref)
+    while todo:
+        for cell in dependents.get(todo.pop(), ()):
+            if cell not in dirty:
+                dirty.add(cell)
+                todo.append(cell)
+    return dirty
+
+
+def update_inputs(values: dict) -> dict:
+    """
+    Schreibt Eingaben (Namen oder 'Sheet!Cell') und rechnet nur die abhängigen Formelzellen neu,
+    in der Reihenfolge CELL_ORDER. Alle anderen gemerkten Werte bleiben.
+    Liefert 'Sheet!Cell' -> neuer Wert für jede neu gerechnete Zelle, deren Wert sich geändert hat
+    oder vorher noch nicht gerechnet war.
+    """
+    context = current_context()
+    refs = {}
+    for key, value in values.items():
+        ref = context.name_refs.get(key)
+        if ref is None:
+            ref = resolve_name(key) if key in context.names else key
+        refs[normalize_ref(ref)] = value
+    dirty = dirty_cells(refs)
+    if dirty is None or any(in_named_range(ref) for ref in refs):
+        dirty = set(CELL_ORDER)
+    before = {ref: context.values.get(ref, _MISSING) for ref in dirty}
+    for ref, value in refs.items():
+        set_cell_value(ref, value)
+
+    changed = {}
+    for ref in CELL_ORDER:
+        if ref in dirty:
+            value = get_cell_value(ref)
+            if not _same_value(before[ref], value):
+                changed[ref] = value
+    return changed
+
+
+def _same_value(before, after) -> bool:
+    try:
+        return bool(before == after)
+    except (TypeError, ValueError):  # z.B. Arrays aus assume_inputs
+        return False
+
+
+def assume_inputs(values: dict):
+    """
+    Verwirft die gemerkten Zellwerte und setzt Eingaben nur bis zum nächsten invalidate().
+    Schlüssel sind Namen oder Bezüge 'Sheet!Cell'. Ein NumPy-Array als Wert rechnet die Formeln für
+    viele Verträge auf einmal, siehe xl_macro.xl_batch.
+    """
+    context = current_context()
+    context.invalidate(tables=False)
+    for key, value in values.items():
+        ref = context.name_refs.get(key)
+        if ref is None:
+            ref = resolve_name(key) if key in context.names else key
+        ref = normalize_ref(ref)
+        if ref in FROZEN_REFS:
+            raise ValueError(f"Input '{FROZEN_REFS[ref]}' is frozen in this calculator.")
+        context.values[ref] = value
+
+
+def get_cell_value(ref: str):
+    context = CURRENT_CONTEXT.get()
+    value = context.values.get(ref, _MISSING)
+    if value is not _MISSING:
+        if value is _EVALUATING:
+            raise ValueError(f"Circular reference: cell '{ref}' depends on itself.")
+        context.hits += 1
+        return value
+
+    fkt = CELL_DISPATCH.get(ref)
+    if fkt is not None:
+        context.evaluations += 1
+        context.values[ref] = _EVALUATING
+        try:
+            value = fkt()
+        except BaseException:
+            context.values.pop(ref, None)
+            raise
+    else:
+        key = normalize_ref(ref)
+        if key != ref:
+            return get_cell_value(key)
+        sheet_name, cell_ref = ref.split("!", 1)
+        value = context.inputs.get(ref, _MISSING)
+        if value is _MISSING:
+            # Wert direkt aus Excel (oder dem Snapshot) lesen
+            value = read_cell(context.workbook, sheet_name, cell_ref)
+    context.values[ref] = value
+    return value
+
+
+def evaluate_all() -> list:
+    """
+    Rechnet jede Formelzelle genau einmal in der Reihenfolge CELL_ORDER. Jede Zelle findet ihre
+    Vorgänger schon im Speicher, es gibt keine tiefe Rekursion über get_cell_value.
+    Liefert die Werte als flache Liste in der Reihenfolge von CELL_ORDER.
+    """
+    context = current_context()
+    values = context.values
+    result = []
+    for ref in CELL_ORDER:
+        value = values.get(ref, _MISSING)
+        if value is _MISSING:
+            context.evaluations += 1
+            value = values[ref] = CELL_DISPATCH[ref]()
+        result.append(value)
+    return result
+
+
+def get_cell_value2(sheet_name: str, cell_ref: str):
+    return get_cell_value(f"{sheet_name}!{cell_ref}")
+
+
+def recalc_stats() -> dict:
+    """
+    Zellen im Speicher, ausgeführte fkt_*-Funktionen und gesparte Auswertungen des aktuellen Kontexts.
+    """
+    return current_context().stats()
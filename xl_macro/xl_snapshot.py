@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import datetime
+import json
+import os
+import re
+
+import numpy as np
+from openpyxl import Workbook
+
+SNAPSHOT_VERSION = 1
+
+CELL_LITERAL_REGEX = re.compile(r"""get_cell_value\(\s*["']([^"']+)["']\s*\)""")
+CELL_LITERAL2_REGEX = re.compile(r"""get_cell_value2\(\s*["']([^"']+)["']\s*,\s*["']([^"']+)["']\s*\)""")
+
+
+def normalize_ref(ref: str) -> str:
+    """
+    "'Tafeln'!$B$4:$E$127" -> 'Tafeln!B4:E127'
+    """
+    sheet_name, cell_ref = ref.split("!", 1)
+    return sheet_name.strip("'") + "!" + cell_ref.replace("$", "").upper()
+
+
+def referenced_cells(source: str) -> set[str]:
+    """
+    Alle Bezüge 'Sheet!Cell', die der Quelltext des Rechners als Literal liest.
+    """
+    refs = {normalize_ref(ref) for ref in CELL_LITERAL_REGEX.findall(source) if "!" in ref}
+    refs |= {normalize_ref(sheet + "!" + cell) for sheet, cell in CELL_LITERAL2_REGEX.findall(source)}
+    return refs
+
+
+def snapshot_value(value):
+    """
+    Zellwert so, wie ihn der JSON-Index speichert. Datumswerte werden zu ISO-Texten.
+    """
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def is_formula(cell) -> bool:
+    return cell.data_type == "f" or (isinstance(cell.value, str) and cell.value.startswith("="))
+
+
+def build_snapshot(workbook: Workbook, names: dict[str, str], source: str) -> tuple[dict, np.ndarray]:
+    """
+    Zieht aus der Arbeitsmappe alles, was der Rechner mit dem Quelltext source liest:
+    Wertzellen der Namen und der Literale im Quelltext sowie die benannten Bereiche.
+    Formelzellen fehlen, die rechnet der Rechner selbst.
+
+    Returns:
+    - (index, data): index ist JSON-fähig, data enthält die Zahlenbereiche hintereinander als float64.
+    """
+    refs = referenced_cells(source)
+    ranges = {}
+    for ref in names.values():
+        if "!" not in ref:
+            continue
+        ref = normalize_ref(ref)
+        if ":" in ref:
+            ranges[ref] = None
+        else:
+            refs.add(ref)
+
+    cells = {}
+    for ref in sorted(refs):
+        sheet_name, cell_ref = ref.split("!", 1)
+        if sheet_name not in workbook.sheetnames:
+            continue
+        cell = workbook[sheet_name][cell_ref]
+        if not is_formula(cell):
+            cells[ref] = snapshot_value(cell.value)
+
+    blocks = []
+    offset = 0
+    for ref in sorted(ranges):
+        sheet_name, range_ref = ref.split("!", 1)
+        if sheet_name not in workbook.sheetnames:
+            continue
+        rows = workbook[sheet_name][range_ref]
+        if not isinstance(rows, tuple):
+            rows = ((rows,),)
+        elif not isinstance(rows[0], tuple):
+            rows = (rows,)
+        values = [[snapshot_value(cell.value) for cell in row] for row in rows]
+        first = rows[0][0]
+        entry = {"origin": [first.row, first.column], "shape": [len(values), len(values[0])]}
+        if all(isinstance(value, (int, float)) and not isinstance(value, bool) or value is None
+               for row in values for value in row):
+            block = np.array([[np.nan if value is None else value for value in row] for row in values],
+                             dtype=np.float64)
+            entry["offset"] = offset
+            blocks.append(block.ravel())
+            offset += block.size
+        else:
+            entry["values"] = values
+        ranges[ref] = entry
+
+    index = {
+        "version": SNAPSHOT_VERSION,
+        "sheetnames": list(workbook.sheetnames),
+        "names": dict(names),
+        "cells": cells,
+        "ranges": {ref: entry for ref, entry in ranges.items() if entry is not None},
+    }
+    data = np.concatenate(blocks) if blocks else np.zeros(0, dtype=np.float64)
+    return index, data
+
+
+def write_snapshot(path: str, workbook: Workbook, names: dict[str, str], source: str) -> dict:
+    """
+    Schreibt den Snapshot nach path (JSON-Index) und path ohne Endung + '.npy' (Zahlenbereiche).
+    Geladen wird er vom Rechner mit load_snapshot(path).
+    """
+    index, data = build_snapshot(workbook, names, source)
+    data_path = os.path.splitext(path)[0] + ".npy"
+    index["data"] = os.path.basename(data_path)
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(data_path, data)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(index, file, ensure_ascii=False, indent=1)
+    return index
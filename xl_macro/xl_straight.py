@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+import ast
+import re
+
+from xl_macro.xl_cell_graph import topological_order, CycleError
+
+STRAIGHT_FUNCTION_NAME = "calculate_all"
+
+
+def local_for(prefix: str, key: str) -> str:
+    """
+    'c', 'Kalkulation!K5' -> 'c_kalkulation_k5'
+    """
+    return prefix + "_" + re.sub(r"\W", "_", key).lower()
+
+
+def normalize_ref(ref: str) -> str:
+    sheet_name, cell_ref = ref.split("!", 1)
+    return sheet_name.strip("'") + "!" + cell_ref.replace("$", "").upper()
+
+
+class LookupInliner(ast.NodeTransformer):
+    """
+    Ersetzt get_excel_global('Name') und get_cell_value("Sheet!Cell") durch lokale Variablen:
+    Formelzellen durch c_*, alle anderen Zellen und Namen durch einmal am Anfang gelesene g_* und v_*.
+    """
+
+    def __init__(self, cell_locals: dict[str, str], name_refs: dict[str, str], hoisted: dict[str, ast.expr]):
+        self.cell_locals = cell_locals
+        self.name_refs = name_refs
+        self.hoisted = hoisted
+
+    def visit_Call(self, node: ast.Call):
+        self.generic_visit(node)
+        if not (isinstance(node.func, ast.Name) and len(node.args) == 1 and not node.keywords
+                and isinstance(node.args[0], ast.Constant) and isinstance(node.args[0].value, str)):
+            return node
+        key = node.args[0].value
+        if node.func.id == "get_excel_global":
+            ref = self.name_refs.get(key.lower())
+            if ref in self.cell_locals:
+                return ast.Name(self.cell_locals[ref], ast.Load())
+            name = local_for("g", key)
+        elif node.func.id == "get_cell_value" and "!" in key:
+            ref = normalize_ref(key)
+            if ref in self.cell_locals:
+                return ast.Name(self.cell_locals[ref], ast.Load())
+            name = local_for("v", ref)
+        else:
+            return node
+        self.hoisted.setdefault(name, node)
+        return ast.Name(name, ast.Load())
+
+
+class LocalRenamer(ast.NodeTransformer):
+
+    def __init__(self, renames: dict[str, str]):
+        self.renames = renames
+
+    def visit_Name(self, node: ast.Name):
+        if node.id in self.renames:
+            return ast.Name(self.renames[node.id], node.ctx)
+        return node
+
+
+def inline_block(statements: list, target: str, prefix: str, renames: dict[str, str]) -> list | None:
+    """
+    Schreibt einen Funktionsrumpf so um, dass er sein Ergebnis target zuweist statt es zurückzugeben.
+    Erlaubt sind Zuweisungen an einfache Namen, ein return am Ende und ein try/except am Ende,
+    dessen Zweige jeweils mit return enden (IFERROR). Sonst None.
+    """
+    result = []
+    for i, statement in enumerate(statements):
+        last = i == len(statements) - 1
+        if isinstance(statement, ast.Assign) and not last and len(statement.targets) == 1 \
+                and isinstance(statement.targets[0], ast.Name):
+            value = LocalRenamer(renames).visit(statement.value)
+            name = statement.targets[0].id
+            if isinstance(value, ast.Name):
+                renames[name] = value.id  # x = g_x: nur ein anderer Name
+                continue
+            renames[name] = prefix + name
+            result.append(ast.Assign(targets=[ast.Name(renames[name], ast.Store())], value=value))
+        elif isinstance(statement, ast.Return) and last and statement.value is not None:
+            value = LocalRenamer(renames).visit(statement.value)
+            result.append(ast.Assign(targets=[ast.Name(target, ast.Store())], value=value))
+        elif isinstance(statement, ast.Try) and last and not statement.orelse and not statement.finalbody:
+            body = inline_block(statement.body, target, prefix, dict(renames))
+            handlers = []
+            for handler in statement.handlers:
+                handler_body = None if handler.name else inline_block(handler.body, target, prefix, dict(renames))
+                if handler_body is None:
+                    return None
+                handlers.append(ast.ExceptHandler(type=handler.type, name=None, body=handler_body))
+            if body is None:
+                return None
+            result.append(ast.Try(body=body, handlers=handlers, orelse=[], finalbody=[]))
+        else:
+            return None
+    return result
+
+
+def block_order(order: list[str], precedents: dict[str, set[str]], row_blocks) -> list:
+    """
+    Reihenfolge der Knoten für calculate_all: einzelne Zellen und Zeilenblöcke (fkt_name, coords, params)
+    als ein Knoten, der nach allen Vorgängern seiner Zellen kommt. Ergibt sich dabei ein Zirkel
+    über einen Block, bleibt es bei den einzelnen Zellen in der Reihenfolge order.
+    """
+    node_of = {}
+    blocks = {}
+    for block in row_blocks:
+        blocks[block[0]] = block
+        node_of.update({coord: block[0] for coord in block[1]})
+    graph = {}
+    for coord in order:
+        node = node_of.get(coord, coord)
+        refs = graph.setdefault(node, set())
+        refs.update(node_of.get(ref, ref) for ref in precedents.get(coord, set()))
+        refs.update(node_of.get(ref, ref) for params in (blocks[node][2] if node in blocks else ()) for ref in params)
+        refs.discard(node)
+    try:
+        return [blocks.get(node, node) for node in topological_order(graph)]
+    except CycleError:
+        return list(order)
+
+
+def straight_line_code(cell_codes: dict[str, str], cell_functions: dict[str, str], order: list[str],
+                       name_refs: dict[str, str], precedents: dict[str, set[str]], row_blocks=()) -> str:
+    """
+    Erzeugt die Funktion calculate_all(), die alle Formelzellen in der Reihenfolge order in einem Rumpf
+    rechnet: die Rümpfe der fkt_*-Funktionen werden eingesetzt, Zellen sind lokale Variablen.
+    Eingaben und Namen werden einmal am Anfang gelesen. Rümpfe, die sich nicht einsetzen lassen,
+    werden als fkt_*() aufgerufen; ihre Vorgänger stehen dafür im Speicher des Kontexts.
+
+    row_blocks: Zeilenblöcke (fkt_name, coords, params) aus xl_macro.xl_row_vector. Ein Block wird mit
+    einem Aufruf von fkt_name als Array gerechnet; scheitert der, Zeile für Zeile wie oben.
+
+    cell_codes: 'Sheet!Cell' -> Quelltext der fkt_*-Funktion, name_refs: Name (lower case) -> 'Sheet!Cell'.
+    """
+    cell_locals = {coord: local_for("c", coord) for coord in order}
+    hoisted = {}
+    inliner = LookupInliner(cell_locals, name_refs, hoisted)
+    blocks = {}
+    for number, coord in enumerate(order):
+        fkt_name = cell_functions[coord]
+        functions = [node for node in ast.parse(cell_codes[coord]).body
+                     if isinstance(node, ast.FunctionDef) and node.name == fkt_name]
+        block = None
+        if len(functions) == 1 and not functions[0].args.args:
+            body = [inliner.visit(statement) for statement in functions[0].body]
+            if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+                body = body[1:]  # Docstring
+            block = inline_block(body, cell_locals[coord], f"l{number}_", {})
+        blocks[coord] = block
+
+    called = [coord for coord in order if blocks[coord] is None]
+    stored = set().union(*(precedents.get(coord, set()) for coord in called)) if called else set()
+    # Die Funktionen der Zeilenblöcke lesen Namen über get_excel_global, auch Namen von Formelzellen.
+    row_blocks = [block for block in row_blocks if all(coord in cell_locals for coord in block[1])]
+    for _, coords, params in row_blocks:
+        columns = {coord for coords_of in params for coord in coords_of}
+        stored |= {ref for coord in coords for ref in precedents.get(coord, set())
+                   if ref in cell_locals and ref not in columns}
+
+    def cell_statements(coord: str) -> list:
+        local = cell_locals[coord]
+        if blocks[coord] is None:
+            return [ast.parse(f"{local} = values[{coord!r}] = {cell_functions[coord]}()").body[0]]
+        if coord in stored:
+            return blocks[coord] + [ast.parse(f"values[{coord!r}] = {local}").body[0]]
+        return blocks[coord]
+
+    def column(coords: list[str]) -> str:
+        for coord in coords:
+            if coord not in cell_locals:
+                inliner.visit(ast.parse(f"get_cell_value({coord!r})", mode="eval"))
+        return "np.array([" + ", ".join(cell_locals.get(coord) or local_for("v", coord) for coord in coords) + "])"
+
+    row_statements = []
+    block_locals = {}
+    for node in block_order(order, precedents, row_blocks):
+        if isinstance(node, str):
+            row_statements += cell_statements(node)
+            continue
+        fkt_name, coords, params = node
+        local = "col_" + fkt_name.removeprefix("rows_")
+        args = [block_locals.get(tuple(coords_of), None) or column(coords_of) for coords_of in params]
+        targets = ", ".join(cell_locals[coord] for coord in coords)
+        vector = ast.parse(f"{local} = {fkt_name}({', '.join(args)})\n{targets}, = {local}").body
+        vector += [ast.parse(f"values[{coord!r}] = {cell_locals[coord]}").body[0] for coord in coords if coord in stored]
+        scalar = [statement for coord in coords for statement in cell_statements(coord)]
+        scalar += ast.parse(f"{local} = {column(coords)}").body
+        row_statements.append(ast.Try(body=vector, handlers=[ast.ExceptHandler(
+            type=ast.parse("(ArithmeticError, IndexError, TypeError, ValueError)", mode="eval").body,
+            name=None, body=scalar)], orelse=[], finalbody=[]))
+        block_locals[tuple(coords)] = local
+
+    statements = [ast.Expr(ast.Constant(
+        "Rechnet alle Formelzellen in einem Rumpf, in der Reihenfolge CELL_ORDER, und liefert ihre Werte "
+        "in dieser Reihenfolge. Erzeugt von Step05 aus den fkt_*-Funktionen."))]
+    if stored:
+        statements.append(ast.parse("values = current_context().values").body[0])
+    statements += [ast.Assign(targets=[ast.Name(name, ast.Store())], value=call) for name, call in hoisted.items()]
+    statements += row_statements
+    statements.append(ast.Return(ast.List([ast.Name(cell_locals[coord], ast.Load()) for coord in order],
+                                          ast.Load())))
+
+    function = ast.FunctionDef(name=STRAIGHT_FUNCTION_NAME, args=ast.arguments(
+        posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=statements, decorator_list=[], returns=ast.Name("list", ast.Load()))
+    module = ast.fix_missing_locations(ast.Module(body=[function], type_ignores=[]))
+    source = ast.unparse(module) + "\n"
+    compile(source, "<calculate_all>", "exec")  # Fehler hier statt beim Import des Rechners
+    return source
@@ -0,0 +1,816 @@
+# -*- coding: utf-8 -*-
+"""
+<copyright>
+Copyright (c) 2025, Janusch Rentenatus. This program and the accompanying materials are made available under the
+terms of the Apache License v2.0 which accompanies this distribution, and is available at
+https://github.com/Rentenatus/py_yahtzee?tab=Apache-2.0-1-ov-file#readme
+</copyright>
+"""
+
+from xl_macro.xl_macro_parser import iter_tokens_vba
+
+# Syntaxbaum
+#############################################################################
+# Ausdrücke sind Tupel wie in xl_formula_parser, das erste Element ist die Art:
+#   ("number", int|float)     ("string", str)          ("bool", bool)          ("date", str)
+#   ("literal", "NOTHING"|"EMPTY"|"NULL"|"ME")
+#   ("name", name)            ("member", obj, name)    ("bang", obj, name)     ("with",)
+#   ("apply", target, [args]) ("named", name, value)   ("new", type)           ("bracket", text)
+#   ("unary", op, operand)    ("binary", op, left, right)
+# apply steht für Aufruf und Index, VBA unterscheidet vek(i) und Act_qx(i) erst über die Symbole.
+#
+# Anweisungen haben die Zeile an zweiter Stelle:
+#   ("dim", line, [symbol])              ("const", line, [(symbol, value)])     ("redim", line, [(target, bounds)])
+#   ("assign", line, target, value)      ("set", line, target, value)           ("call", line, target)
+#   ("if", line, [(cond, body)], else)   ("select", line, expr, [(tests, body)], else)
+#   ("for", line, var, start, end, step, body)                     ("for_each", line, var, expr, body)
+#   ("do", line, (kind, cond) | None, body, (kind, cond) | None)  ("with", line, expr, body)
+#   ("exit", line, kind)                 ("end", line)              ("jump", line, [words])  (On Error, GoTo, Resume)
+#   ("open", line, path, [mode], number, length)  ("file", line, keyword, number, [args])  (Print #1, Close, ...)
+# Grenzen von Arrays (Symbol.bounds, ReDim) sind Listen [(lower | None, upper)].
+
+BINARY_LEVELS = [
+    ("IMP",), ("EQV",), ("XOR",), ("OR",), ("AND",), None,  # None: Not
+    ("=", "<>", "<", ">", "<=", ">=", "LIKE", "IS"), ("&",), ("+", "-"), ("MOD",), ("\\",), ("*", "/"),
+]
+KEYWORD_OPERATORS = {"IMP", "EQV", "XOR", "OR", "AND", "LIKE", "IS", "MOD"}
+JOINED_OPERATORS = {"<>", "<=", ">=", ":="}
+TYPE_SUFFIXES = ("#", "!", "%", "@", "&", "$")
+RADIX = {"H": 16, "O": 8}
+FILE_STATEMENTS = ("PRINT", "WRITE", "INPUT", "GET", "PUT", "SEEK", "LOCK", "UNLOCK", "WIDTH")
+MODIFIERS = ("PUBLIC", "PRIVATE", "FRIEND", "GLOBAL", "STATIC")
+PROCEDURE_KINDS = ("SUB", "FUNCTION", "PROPERTY")
+
+
+def logical_tokens(code: str) -> list[tuple[str, str, int]]:
+    """
+    Tokens (kind, value, line) ohne Leerraum und Kommentare. Zeilenfortsetzungen ' _' sind aufgelöst,
+    ':' zwischen Anweisungen wird zu SEP, '""' in Texten und <> <= >= := sind zusammengefasst.
+    Typ-Suffixe (1#, 2&, n&) fallen weg, nur Left$ behält sein '$'. &HFF und &O17 werden zu Zahlen.
+    """
+    raw = list(iter_tokens_vba(code))
+    tokens = []
+    line = 1
+    i = 0
+    while i < len(raw):
+        kind, value = raw[i]
+        if kind == "NEWLINE":
+            tokens.append(("NEWLINE", value, line))
+            line += 1
+        elif kind == "IDENTIFIER" and value == "_" and i + 1 < len(raw) and raw[i + 1][0] == "NEWLINE":
+            line += 1  # Fortsetzung
+            i += 1
+        elif kind in ("SPACE", "COMMENT"):
+            pass
+        elif kind == "STRING" and tokens and tokens[-1][0] == "STRING" and raw[i - 1][0] == "STRING":
+            tokens[-1] = ("STRING", tokens[-1][1][:-1] + '"' + value[1:], tokens[-1][2])
+        elif kind == "OTHER" and value == "&" and i + 1 < len(raw) and raw[i + 1][0] == "IDENTIFIER" and \
+                raw[i - 1][0] not in ("IDENTIFIER", "NUMBER", "STRING", "RPAREN") and radix_literal(raw[i + 1][1]):
+            tokens.append(("NUMBER", str(radix_literal(raw[i + 1][1])[0]), line))
+            i += 1
+            if type_suffix(raw, i + 1):
+                i += 1
+        elif kind == "OTHER" and value in TYPE_SUFFIXES and tokens and type_suffix(raw, i):
+            if value == "$" and raw[i - 1][0] == "IDENTIFIER":
+                tokens[-1] = ("IDENTIFIER", tokens[-1][1] + "$", tokens[-1][2])
+        elif kind == "OTHER" and tokens and tokens[-1][0] == "OTHER" and raw[i - 1][0] == "OTHER" and \
+                tokens[-1][1] + value in JOINED_OPERATORS:
+            tokens[-1] = ("OTHER", tokens[-1][1] + value, line)
+        elif kind == "OTHER" and value == ":" and not (i + 1 < len(raw) and raw[i + 1] == ("OTHER", "=")):
+            tokens.append(("SEP", value, line))
+        else:
+            tokens.append((kind, value, line))
+        i += 1
+    return tokens
+
+
+def type_suffix(raw: list, i: int) -> bool:
+    """
+    Ist raw[i] ein Typ-Suffix direkt hinter Zahl oder Bezeichner (1#, n&, Left$)? '&' gilt nur als Suffix,
+    wenn kein Operand folgt, sonst ist es die Verkettung (a&"x"). '!' vor einem Bezeichner ist der Bang-Operator.
+    """
+    if i >= len(raw) or raw[i][0] != "OTHER" or raw[i][1] not in TYPE_SUFFIXES or \
+            raw[i - 1][0] not in ("NUMBER", "IDENTIFIER"):
+        return False
+    following = raw[i + 1][0] if i + 1 < len(raw) else None
+    if raw[i][1] == "&":
+        return following not in ("IDENTIFIER", "NUMBER", "STRING", "LPAREN")
+    return following != "IDENTIFIER"
+
+
+def radix_literal(word: str) -> tuple[int] | None:
+    """
+    'HFF' -> (255,), 'O17' -> (15,) für &HFF und &O17, sonst None.
+    """
+    base = RADIX.get(word[:1].upper())
+    try:
+        return (int(word[1:], base),) if base and word[1:] else None
+    except ValueError:
+        return None
+
+
+class Symbol:
+    """
+    Eintrag der Symboltabelle. kind: 'param', 'local', 'const', 'result' (Rückgabewert einer Function),
+    'module' (Variable oder Konstante des Moduls).
+    """
+    __slots__ = ("name", "kind", "type", "line", "is_array", "optional", "bounds")
+
+    def __init__(self, name: str, kind: str, type: str = None, line: int = 0, is_array: bool = False,
+                 optional: bool = False, bounds: list = None):
+        self.name = name
+        self.kind = kind
+        self.type = type
+        self.line = line
+        self.is_array = is_array
+        self.optional = optional
+        self.bounds = bounds  # [(lower | None, upper)] aus Dim a(1 To 10, 5)
+
+    def __repr__(self):
+        return f"Symbol({self.name!r}, {self.kind!r}, {self.type!r})"
+
+
+class VbaProcedure:
+    """
+    Sub, Function oder Property mit Parametern, Rumpf und Symboltabelle (lower case -> Symbol).
+    references: alle Bezeichner (name, line), die weder lokal noch im Modul deklariert sind,
+    also Aufrufe anderer Prozeduren, Namen der Arbeitsmappe und Objekte von Excel.
+    """
+
+    def __init__(self, name: str, kind: str, module: str, scope: str, line_start: int):
+        self.name = name
+        self.kind = kind
+        self.module = module
+        self.scope = scope
+        self.line_start = line_start
+        self.line_end = line_start
+        self.params = []
+        self.return_type = None
+        self.body = []
+        self.symbols = {}
+        self.references = []
+
+    def __repr__(self):
+        return f"VbaProcedure({self.kind} {self.name}, lines {self.line_start}-{self.line_end})"
+
+
+class VbaModule:
+
+    def __init__(self, name: str):
+        self.name = name
+        self.attributes = {}
+        self.declarations = []
+        self.symbols = {}
+        self.procedures = []
+
+
+class VbaParser:
+    """
+    Rekursiver Abstieg über die logischen Tokens eines VBA-Moduls.
+    Unbekannte Konstrukte lösen SyntaxError mit der Zeilennummer aus.
+    """
+
+    def __init__(self, code: str, module_name: str = ""):
+        self.tokens = logical_tokens(code)
+        self.pos = 0
+        self.module = VbaModule(module_name)
+        self.procedure = None
+        self.uses = []
+
+    # Tokens
+
+    def peek(self, offset: int = 0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None, self.line())
+
+    def line(self) -> int:
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos][2]
+        return self.tokens[-1][2] if self.tokens else 1
+
+    def error(self, message: str):
+        return SyntaxError(f"{self.module.name} line {self.line()}: {message}")
+
+    def at(self, *words, offset: int = 0) -> bool:
+        kind, value, _ = self.peek(offset)
+        return kind == "IDENTIFIER" and value.upper() in words
+
+    def at_other(self, *values, offset: int = 0) -> bool:
+        kind, value, _ = self.peek(offset)
+        return kind == "OTHER" and value in values
+
+    def take(self, kind: str = None, value: str = None) -> str:
+        token_kind, token_value, _ = self.peek()
+        if token_kind is None or (kind and token_kind != kind) or \
+                (value is not None and token_value.upper() != value):
+            raise self.error(f"Expected {value or kind}, got '{token_value}'")
+        self.pos += 1
+        return token_value
+
+    def accept(self, *words) -> str | None:
+        if self.at(*words):
+            return self.take().upper()
+        return None
+
+    def end_of_statement(self) -> bool:
+        return self.peek()[0] in (None, "NEWLINE", "SEP")
+
+    def skip_separators(self):
+        while self.peek()[0] in ("NEWLINE", "SEP"):
+            self.pos += 1
+
+    def rest_of_statement(self) -> list[str]:
+        words = []
+        while not self.end_of_statement():
+            words.append(self.take())
+        return words
+
+    # Modul
+
+    def parse_module(self) -> VbaModule:
+        while True:
+            self.skip_separators()
+            if self.peek()[0] is None:
+                return self.module
+            if self.accept("ATTRIBUTE"):
+                name = self.take("IDENTIFIER")
+                self.take("OTHER", "=")
+                self.module.attributes[name] = self.expression()
+                if name.upper() == "VB_NAME" and self.module.attributes[name][0] == "string":
+                    self.module.name = self.module.name or self.module.attributes[name][1]
+                continue
+            if self.at("OPTION", "DEFINT", "DEFLNG", "DEFDBL", "DEFSTR", "DEFBOOL", "DEFVAR", "IMPLEMENTS"):
+                self.module.declarations.append(("option", self.line(), self.rest_of_statement()))
+                continue
+            modifiers = []
+            while self.at(*MODIFIERS):
+                modifiers.append(self.take().upper())
+            if self.at(*PROCEDURE_KINDS):
+                self.module.procedures.append(self.parse_procedure(modifiers))
+            elif self.at("DECLARE"):
+                self.module.declarations.append(("declare", self.line(), self.rest_of_statement()))
+            elif self.at("TYPE", "ENUM"):
+                self.module.declarations.append(self.skip_type())
+            elif self.at("DIM", "CONST") or modifiers:
+                statement = self.declaration("module")
+                self.module.declarations.append(statement)
+            else:
+                raise self.error(f"Unexpected '{self.peek()[1]}' at module level")
+
+    def skip_type(self):
+        line = self.line()
+        kind = self.take().upper()
+        name = self.take("IDENTIFIER")
+        while not (self.at("END") and self.at(kind, offset=1)):
+            if self.peek()[0] is None:
+                raise self.error(f"Missing End {kind}")
+            self.pos += 1
+        self.pos += 2
+        self.module.symbols[name.lower()] = Symbol(name, "module", kind.lower(), line)
+        return (kind.lower(), line, name)
+
+    # Prozeduren
+
+    def parse_procedure(self, modifiers: list[str]) -> VbaProcedure:
+        line = self.line()
+        kind = self.take().upper()
+        if kind == "PROPERTY":
+            kind += " " + self.take("IDENTIFIER").upper()
+        name = self.take("IDENTIFIER")
+        scope = "private" if "PRIVATE" in modifiers else "public"
+        procedure = VbaProcedure(name, kind, self.module.name, scope, line)
+        self.procedure = procedure
+        self.uses = []
+        if self.peek()[0] == "LPAREN":
+            self.take("LPAREN")
+            while self.peek()[0] != "RPAREN":
+                procedure.params.append(self.parameter())
+                if self.at_other(","):
+                    self.take()
+            self.take("RPAREN")
+        for symbol in procedure.params:
+            procedure.symbols[symbol.name.lower()] = symbol
+        if self.at("AS"):
+            procedure.return_type = self.as_type()
+        if kind in ("FUNCTION", "PROPERTY GET"):
+            procedure.symbols.setdefault(name.lower(), Symbol(name, "result", procedure.return_type, line))
+
+        end_kind = kind.split()[0]
+        procedure.body = self.block(lambda: self.at("END") and self.at(end_kind, offset=1))
+        procedure.line_end = self.line()
+        self.pos += 2
+        procedure.references = [(used, used_line) for used, used_line in self.uses
+                                if used.lower() not in procedure.symbols and used.lower() not in self.module.symbols]
+        self.procedure = None
+        return procedure
+
+    def parameter(self) -> Symbol:
+        line = self.line()
+        optional = False
+        while self.at("OPTIONAL", "BYVAL", "BYREF", "PARAMARRAY"):
+            optional = self.take().upper() in ("OPTIONAL", "PARAMARRAY") or optional
+        name = self.take("IDENTIFIER")
+        is_array = False
+        if self.peek()[0] == "LPAREN":
+            self.take("LPAREN")
+            self.take("RPAREN")
+            is_array = True
+        type_name = self.as_type() if self.at("AS") else None
+        if self.at_other("="):
+            self.take()
+            self.expression()
+        return Symbol(name, "param", type_name, line, is_array, optional)
+
+    def as_type(self) -> str:
+        self.take("IDENTIFIER", "AS")
+        self.accept("NEW")
+        parts = [self.take("IDENTIFIER")]
+        while self.at_other("."):
+            self.take()
+            parts.append(self.take("IDENTIFIER"))
+        if self.at_other("*"):
+            self.take()
+            self.take()
+        return ".".join(parts)
+
+    # Anweisungen
+
+    def block(self, stop) -> list:
+        statements = []
+        while True:
+            self.skip_separators()
+            if self.peek()[0] is None:
+                raise self.error("Unexpected end of module, block not closed")
+            if stop():
+                return statements
+            statements.append(self.statement())
+
+    def statement(self):
+        line = self.line()
+        if self.at("DIM", "STATIC", "CONST", "PUBLIC", "PRIVATE"):
+            return self.declaration("local")
+        if self.accept("REDIM"):
+            self.accept("PRESERVE")
+            targets = []
+            while True:
+                name = self.take("IDENTIFIER")
+                if name.lower() not in self.module.symbols:
+                    self.declare(name, "local", None, line, True, only_new=True)
+                dims = self.bounds() if self.peek()[0] == "LPAREN" else []
+                if self.at("AS"):
+                    self.as_type()
+                targets.append((("name", name), dims))
+                if not self.at_other(","):
+                    return ("redim", line, targets)
+                self.take()
+        if self.accept("SET"):
+            target = self.postfix()
+            self.take("OTHER", "=")
+            return ("set", line, target, self.expression())
+        if self.accept("LET"):
+            target = self.postfix()
+            self.take("OTHER", "=")
+            return ("assign", line, target, self.expression())
+        if self.at("IF"):
+            return self.if_statement()
+        if self.at("SELECT"):
+            return self.select_statement()
+        if self.at("FOR"):
+            return self.for_statement()
+        if self.at("DO", "WHILE"):
+            return self.do_statement()
+        if self.accept("WITH"):
+            expr = self.expression()
+            return ("with", line, expr, self.closed_block("WITH"))
+        if self.accept("EXIT"):
+            return ("exit", line, self.take("IDENTIFIER").upper())
+        if self.at("END"):
+            if self.at("IF", "SUB", "FUNCTION", "PROPERTY", "SELECT", "WITH", "TYPE", "ENUM", offset=1):
+                raise self.error(f"Unexpected End {self.peek(1)[1]}")
+            self.take()
+            return ("end", line)
+        if self.accept("CALL"):
+            return ("call", line, self.postfix())
+        if self.at("ON", "GOTO", "GOSUB", "RESUME", "RETURN", "STOP"):
+            return ("jump", line, self.rest_of_statement())
+        if self.at("OPEN", "CLOSE", "RESET") or (self.at(*FILE_STATEMENTS) and self.at_other("#", offset=1)) or \
+                (self.at("LINE") and self.at("INPUT", offset=1)):
+            return self.file_statement()
+
+        target = self.postfix()
+        if self.at_other("="):
+            self.take()
+            return ("assign", line, target, self.expression())
+        if self.end_of_statement() or self.at("ELSE"):
+            return ("call", line, target)
+        # Aufruf ohne Klammern: cache.Add sKey, Act_Dx (Debug.Print trennt auch mit ';')
+        args = [self.argument()]
+        while self.at_other(",", ";"):
+            self.take()
+            args.append(self.argument())
+        return ("call", line, ("apply", target, args))
+
+    def file_statement(self):
+        """
+        Open path For mode As #n [Len = x], Close [#n, ...], Print #n, ..., Line Input #n, s und Verwandte.
+        """
+        line = self.line()
+        keyword = self.take().upper()
+        if keyword == "LINE":
+            keyword += " " + self.take().upper()
+        if keyword == "OPEN":
+            path = self.expression()
+            mode = []
+            while not self.at("AS"):
+                if self.end_of_statement():
+                    raise self.error("Expected As in Open")
+                mode.append(self.take().upper())
+            self.take()
+            number = self.file_number()
+            length = None
+            if self.accept("LEN"):
+                self.take("OTHER", "=")
+                length = self.expression()
+            return ("open", line, path, mode, number, length)
+        if keyword in ("CLOSE", "RESET"):
+            numbers = []
+            while not self.end_of_statement():
+                numbers.append(self.file_number())
+                if self.at_other(","):
+                    self.take()
+            return ("file", line, keyword, None, numbers)
+        number = self.file_number()
+        args = []
+        while self.at_other(",", ";"):
+            self.take()
+            args.append(self.argument())
+        return ("file", line, keyword, number, args)
+
+    def file_number(self):
+        if self.at_other("#"):
+            self.take()
+        return self.unary()
+
+    def declaration(self, scope: str):
+        line = self.line()
+        kind = "local" if scope == "local" else "module"
+        while self.at(*MODIFIERS, "DIM"):
+            self.take()
+        if self.accept("CONST"):
+            constants = []
+            while True:
+                name = self.take("IDENTIFIER")
+                type_name = self.as_type() if self.at("AS") else None
+                self.take("OTHER", "=")
+                symbol = self.declare(name, kind if kind == "module" else "const", type_name, line)
+                constants.append((symbol, self.expression()))
+                if not self.at_other(","):
+                    return ("const", line, constants)
+                self.take()
+        symbols = []
+        while True:
+            self.accept("WITHEVENTS")
+            name = self.take("IDENTIFIER")
+            bounds = self.bounds() if self.peek()[0] == "LPAREN" else None
+            type_name = self.as_type() if self.at("AS") else None
+            symbol = self.declare(name, kind, type_name, line, bounds is not None)
+            symbol.bounds = bounds
+            symbols.append(symbol)
+            if not self.at_other(","):
+                return ("dim", line, symbols)
+            self.take()
+
+    def declare(self, name: str, kind: str, type_name: str, line: int, is_array: bool = False,
+                only_new: bool = False) -> Symbol:
+        table = self.module.symbols if kind == "module" else self.procedure.symbols
+        if only_new and name.lower() in table:
+            return table[name.lower()]
+        symbol = Symbol(name, kind, type_name, line, is_array)
+        table[name.lower()] = symbol
+        return symbol
+
+    def closed_block(self, kind: str) -> list:
+        body = self.block(lambda: self.at("END") and self.at(kind, offset=1))
+        self.pos += 2
+        return body
+
+    def if_statement(self):
+        line = self.line()
+        self.take("IDENTIFIER", "IF")
+        condition = self.expression()
+        self.take("IDENTIFIER", "THEN")
+        if not self.end_of_statement():
+            # Einzeilig: If x Then a = 1: b = 2 Else c = 3
+            then_body = self.line_statements()
+            else_body = []
+            if self.accept("ELSE"):
+                else_body = self.line_statements()
+            return ("if", line, [(condition, then_body)], else_body)
+
+        branches = []
+        else_body = []
+        stop = lambda: self.at("ELSEIF", "ELSE") or (self.at("END") and self.at("IF", offset=1))
+        body = self.block(stop)
+        branches.append((condition, body))
+        while True:
+            if self.accept("ELSEIF"):
+                condition = self.expression()
+                self.take("IDENTIFIER", "THEN")
+                branches.append((condition, self.block(stop)))
+            elif self.accept("ELSE"):
+                else_body = self.block(lambda: self.at("END") and self.at("IF", offset=1))
+            else:
+                self.pos += 2
+                return ("if", line, branches, else_body)
+
+    def line_statements(self) -> list:
+        statements = []
+        while self.peek()[0] not in (None, "NEWLINE") and not self.at("ELSE"):
+            if self.peek()[0] == "SEP":
+                self.take()
+                continue
+            statements.append(self.statement())
+        return statements
+
+    def select_statement(self):
+        line = self.line()
+        self.take("IDENTIFIER", "SELECT")
+        self.take("IDENTIFIER", "CASE")
+        expr = self.expression()
+        cases = []
+        else_body = []
+        stop = lambda: self.at("CASE") or (self.at("END") and self.at("SELECT", offset=1))
+        self.skip_separators()
+        while self.accept("CASE"):
+            if self.accept("ELSE"):
+                else_body = self.block(stop)
+                continue
+            tests = []
+            while True:
+                if self.accept("IS"):
+                    op = self.take("OTHER")
+                    tests.append(("is", op, self.expression()))
+                else:
+                    value = self.expression()
+                    if self.accept("TO"):
+                        tests.append(("to", value, self.expression()))
+                    else:
+                        tests.append(value)
+                if not self.at_other(","):
+                    break
+                self.take()
+            cases.append((tests, self.block(stop)))
+        if not (self.at("END") and self.at("SELECT", offset=1)):
+            raise self.error("Expected Case or End Select")
+        self.pos += 2
+        return ("select", line, expr, cases, else_body)
+
+    def for_statement(self):
+        line = self.line()
+        self.take("IDENTIFIER", "FOR")
+        if self.accept("EACH"):
+            var = self.take("IDENTIFIER")
+            self.declare(var, "local", None, line, only_new=True)
+            self.take("IDENTIFIER", "IN")
+            expr = self.expression()
+            body = self.next_block()
+            return ("for_each", line, var, expr, body)
+        var = self.take("IDENTIFIER")
+        self.declare(var, "local", None, line, only_new=True)
+        self.take("OTHER", "=")
+        start = self.expression()
+        self.take("IDENTIFIER", "TO")
+        end = self.expression()
+        step = self.expression() if self.accept("STEP") else None
+        return ("for", line, var, start, end, step, self.next_block())
+
+    def next_block(self) -> list:
+        body = self.block(lambda: self.at("NEXT"))
+        self.take()
+        if self.peek()[0] == "IDENTIFIER":
+            self.take()
+        return body
+
+    def do_statement(self):
+        line = self.line()
+        if self.accept("WHILE"):
+            condition = ("WHILE", self.expression())
+            body = self.block(lambda: self.at("WEND"))
+            self.take()
+            return ("do", line, condition, body, None)
+        self.take("IDENTIFIER", "DO")
+        head = None
+        if self.at("WHILE", "UNTIL"):
+            head = (self.take().upper(), self.expression())
+        body = self.block(lambda: self.at("LOOP"))
+        self.take()
+        tail = None
+        if self.at("WHILE", "UNTIL"):
+            tail = (self.take().upper(), self.expression())
+        return ("do", line, head, body, tail)
+
+    # Ausdrücke
+
+    def expression(self, level: int = 0):
+        if level == len(BINARY_LEVELS):
+            return self.unary()
+        operators = BINARY_LEVELS[level]
+        if operators is None:
+            if self.accept("NOT"):
+                return ("unary", "Not", self.expression(level))
+            return self.expression(level + 1)
+        node = self.expression(level + 1)
+        while True:
+            kind, value, _ = self.peek()
+            op = value.upper() if kind == "IDENTIFIER" and value.upper() in KEYWORD_OPERATORS else \
+                value if kind == "OTHER" else None
+            if op not in operators:
+                return node
+            self.take()
+            node = ("binary", op, node, self.expression(level + 1))
+
+    def unary(self):
+        if self.at_other("-", "+"):
+            op = self.take()
+            return ("unary", op, self.unary())
+        node = self.postfix()
+        if self.at_other("^"):
+            self.take()
+            return ("binary", "^", node, self.unary())
+        return node
+
+    def postfix(self):
+        node = self.primary()
+        while True:
+            kind, value, _ = self.peek()
+            if kind == "LPAREN":
+                node = ("apply", node, self.arguments())
+            elif kind == "OTHER" and value in (".", "!") and self.peek(1)[0] == "IDENTIFIER":
+                self.take()
+                node = ("member" if value == "." else "bang", node, self.take("IDENTIFIER"))
+            else:
+                return node
+
+    def primary(self):
+        kind, value, line = self.peek()
+        if kind == "NUMBER":
+            self.take()
+            return ("number", float(value) if "." in value else int(value))
+        if kind == "STRING":
+            self.take()
+            return ("string", value[1:-1])
+        if kind == "LPAREN":
+            self.take()
+            node = self.expression()
+            self.take("RPAREN")
+            return node
+        if kind == "LBRACKET":
+            self.take()
+            words = []
+            while self.peek()[0] not in (None, "RBRACKET"):
+                words.append(self.take())
+            self.take("RBRACKET")
+            return ("bracket", "".join(words))
+        if kind == "OTHER" and value == "." and self.peek(1)[0] == "IDENTIFIER":
+            self.take()
+            return ("member", ("with",), self.take("IDENTIFIER"))
+        if kind == "OTHER" and value == "#":
+            self.take()
+            words = []
+            while not self.at_other("#"):
+                if self.end_of_statement():
+                    raise self.error("Unterminated date literal")
+                words.append(self.take())
+            self.take()
+            return ("date", " ".join(words))
+        if kind == "IDENTIFIER":
+            upper = value.upper()
+            if upper in ("TRUE", "FALSE"):
+                self.take()
+                return ("bool", upper == "TRUE")
+            if upper in ("NOTHING", "EMPTY", "NULL", "ME"):
+                self.take()
+                return ("literal", upper)
+            if upper == "NEW":
+                self.take()
+                return ("new", self.postfix())
+            if upper in KEYWORD_OPERATORS or upper in ("THEN", "TO", "ELSE", "STEP"):
+                raise self.error(f"Unexpected keyword '{value}'")
+            self.take()
+            self.uses.append((value, line))
+            return ("name", value)
+        raise self.error(f"Unexpected '{value}'")
+
+    def bounds(self) -> list[tuple]:
+        """
+        Grenzen eines Arrays in Dim und ReDim: (1 To n, 5) -> [(("number", 1), ("name", "n")), (None, ("number", 5))].
+        """
+        self.take("LPAREN")
+        bounds = []
+        while self.peek()[0] != "RPAREN":
+            value = self.expression()
+            bounds.append((value, self.expression()) if self.accept("TO") else (None, value))
+            if not self.at_other(","):
+                break
+            self.take()
+        self.take("RPAREN")
+        return bounds
+
+    def arguments(self) -> list:
+        self.take("LPAREN")
+        args = []
+        if self.peek()[0] == "RPAREN":
+            self.take()
+            return args
+        while True:
+            args.append(None if self.at_other(",") or self.peek()[0] == "RPAREN" else self.argument())
+            if self.at_other(","):
+                self.take()
+                continue
+            self.take("RPAREN")
+            return args
+
+    def argument(self):
+        if self.at("BYVAL", "BYREF"):
+            self.take()
+        if self.peek()[0] == "IDENTIFIER" and self.at_other(":=", offset=1):
+            name = self.take()
+            self.take()
+            return ("named", name, self.expression())
+        if self.at_other(",") or self.end_of_statement():
+            return None
+        return self.expression()
+
+
+def parse_vba_module(code: str, module_name: str = "") -> VbaModule:
+    """
+    Parst den Quelltext eines VBA-Moduls (.bas/.cls) in einen VbaModule mit Prozeduren und Symbolen.
+    """
+    return VbaParser(code, module_name).parse_module()
+
+
+class VbaProject:
+    """
+    Alle Module einer Arbeitsmappe. Aufrufe, benutzte Namen und tote Prozeduren sind Nachschläge
+    in den references der Prozeduren, keine Textsuche.
+    """
+
+    def __init__(self, modules: list[VbaModule]):
+        self.modules = modules
+        self.procedures = {}
+        for module in modules:
+            for procedure in module.procedures:
+                self.procedures.setdefault(procedure.name.lower(), procedure)
+
+    def call_sites(self, procedure: VbaProcedure) -> list[tuple[VbaProcedure, int]]:
+        """
+        (aufgerufene Prozedur, Zeile) für jeden Aufruf in procedure. Private Prozeduren anderer Module zählen nicht.
+        """
+        sites = []
+        for name, line in procedure.references:
+            callee = self.procedures.get(name.lower())
+            if callee is not None and (callee.scope == "public" or callee.module == procedure.module):
+                sites.append((callee, line))
+        return sites
+
+    def calls(self, procedure: VbaProcedure) -> list[str]:
+        """
+        Namen der Prozeduren, die procedure aufruft, in der Reihenfolge des ersten Aufrufs.
+        """
+        return list(dict.fromkeys(callee.name for callee, _ in self.call_sites(procedure)))
+
+    def call_graph(self) -> dict[str, list[str]]:
+        return {procedure.name: self.calls(procedure) for procedure in self.procedures.values()}
+
+    def callers(self, name: str) -> list[str]:
+        return [caller for caller, callees in self.call_graph().items()
+                if name.lower() in (callee.lower() for callee in callees)]
+
+    def names_used(self, procedure: VbaProcedure, named_ranges: dict[str, str]) -> dict[str, str]:
+        """
+        Namen der Arbeitsmappe, die procedure liest, wie local_used in Step01.
+        """
+        return {name: named_ranges[name] for name, _ in procedure.references if name in named_ranges}
+
+    def unreachable(self, roots) -> list[str]:
+        """
+        Prozeduren, die von keiner Wurzel (z.B. den Funktionen der Zellformeln) aus aufgerufen werden.
+        """
+        graph = self.call_graph()
+        by_lower = {name.lower(): name for name in graph}
+        seen = set()
+        stack = [by_lower[root.lower()] for root in roots if root.lower() in by_lower]
+        while stack:
+            name = stack.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            stack.extend(graph[name])
+        return [name for name in graph if name not in seen]
+
+
+def parse_vba_project(macros: dict[str, str]) -> VbaProject:
+    """
+    Parst alle Module aus read_vba_macros_and_cls (Dateiname -> Quelltext).
+    """
+    return VbaProject([parse_vba_module(code, name.rsplit(".", 1)[0]) for name, code in macros.items()])